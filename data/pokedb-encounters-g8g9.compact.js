@@ -0,0 +1 @@
+window.__POKEDB_ENCOUNTERS_G8G9_COMPACT__ = {"_meta":{"source":"PokeDB Data Export","sourceUrl":"https://pokedb.org/data-export","generatedAt":"2026-01-06T00:48:59Z","regions":["crown-tundra","galar","hisui","isle-of-armor","kanto","paldea","sinnoh"],"versions":["brilliant-diamond","legends-arceus","lets-go-eevee","lets-go-pikachu","scarlet","shield","shining-pearl","sword","violet"],"tables":{"encounters":"https://cdn.pokedb.org/data_export_encounters_json","location_areas":"https://cdn.pokedb.org/data_export_location_areas_json","locations":"https://cdn.pokedb.org/data_export_locations_json"},"note":"Provided for educational/research/non-commercial use per PokeDB guidelines; see sourceUrl for terms."},"format":"pokedb-encounters-columnar/1","strings":{"pokemon":["aipom","murkrow","combee","buizel","floatzel","ambipom","mothim","burmy-trash-cloak","wormadam-trash-cloak","geodude","graveler","drifloon","drifblim","mantyke","zubat","golbat","stunky","skuntank","bronzor","bronzong","croagunk","toxicroak","goomy","sliggoo-hisuian","goodra-hisuian","burmy-sandy-cloak","wormadam-sandy-cloak","magmar","eevee","jolteon","octillery","dusclops","cranidos","rampardos","shieldon","bastiodon","drapion","magmortar","dusknoir","sylveon","rowlet","dartrix","decidueye-hisuian","unown-f","unown-j","machop","machoke","electabuzz","gligar","swinub","piloswine","elekid","duskull","snover","abomasnow","bergmite","machamp","snorunt","glalie","pikachu","raichu","rapidash","scyther","espeon","scizor","sealeo","walrein","tangrowth","electivire","glaceon","oshawott","dewott","samurott-hisuian","pichu","wurmple","bidoof","starly","shinx","lickitung","chansey","misdreavus","blissey","happiny","gible","gabite","lickilicky","froslass","garchomp","mamoswine","gastly","haunter","sneasel-hisuian","bibarel","avalugg-hisuian","rufflet","basculin-white-stripe","zorua-hisuian","zoroark-hisuian","unown-t","psyduck","golduck","togepi","staravia","beautifly","dustox","honchkrow","qwilfish-hisuian","remoraid","golem","cherubi","cherrim-overcast","rhyhorn","togetic","rhydon","buneary","lopunny","tornadus-incarnate","onix","chimecho","hippopotas","hippowdon","steelix","magnezone","magikarp","skorupi","staraptor","sudowoodo","nosepass","bonsly","voltorb-hisuian","rotom","unown-c","darkrai","paras","parasect","tangela","roselia","budew","vespiquen","pachirisu","petilil","carnivine","flareon","porygon","snorlax","cyndaquil","quilava","typhlosion-hisuian","umbreon","heracross","porygon2","luxio","luxray","porygon-z","kricketot","kricketune","roserade","lilligant","glameow","purugly","kadabra","alakazam","magnemite","magneton","mr-mime","vaporeon","rhyperior","chatot","unown-z","stantler","chimchar","monferno","burmy-plant-cloak","munchlax","unown-a","yanma","teddiursa","ursaring","turtwig","grotle","yanmega","barboach","whiscash","clefairy","cleffa","clefable","unown-p","magby","ninetales","unown-b","silcoon","cascoon","wormadam-plant-cloak","shaymin-land","ralts","spheal","unown-d","unown-x","unown-e","kirlia","gardevoir","unown-u","torterra","ponyta","mime-jr","gengar","sneasel","weavile","leafeon","unown-o","riolu","lucario","crobat","unown-y","tentacruel","tentacool","empoleon","piplup","prinplup","abra","chingling","braviary-hisuian","uxie","overqwil","azelf","noctowl","goldeen","seaking","gyarados","wobbuffet","togekiss","unown-i","unown-g","shellos-west-sea","gastrodon-west-sea","infernape","landorus-incarnate","gliscor","probopass","unown-n","thundurus-incarnate","unown-v","enamorus-incarnate","shellos-east-sea","gastrodon-east-sea","lumineon","finneon","phione","manaphy","spiritomb","unown-k","unown-m","ursaluna","unown-exclamation-mark","gallade","regigigas","unown-h","unown-l","unown-q","unown-r","unown-s","unown-w","unown-question-mark","mismagius","mantine","vulpix","growlithe-hisuian","vulpix-alolan","heatran","cresselia","dialga","palkia-origin","palkia","dialga-origin","pidgey","pidgeotto","pidgeot","rattata","oddish","bellsprout","charizard","articuno","zapdos","moltres","dragonite","arceus","caterpie","weedle","spearow","ekans","sandshrew","mankey","charmander","fearow","jigglypuff","growlithe","raticate","arcanine","nidoran-f","nidorina","nidoran-m","nidorino","krabby","dratini","dragonair","drowzee","horsea","seadra","gloom","weepinbell","farfetchd","kingler","venonat","venomoth","pinsir","tauros","doduo","dodrio","staryu","starmie","lapras","vileplume","victreebel","poliwag","poliwhirl","nidoqueen","nidoking","exeggcute","exeggutor","meowth","squirtle","bulbasaur","rattata-alolan","persian","geodude-alolan","diglett-alolan","sandshrew-alolan","raichu-alolan","marowak-alolan","meowth-alolan","grimer-alolan","exeggutor-alolan","pikachu-partner","eevee-partner","metapod","butterfree","kakuna","beedrill","diglett","dugtrio","ditto","poliwrath","mewtwo","cubone","kangaskhan","grimer","muk","voltorb","electrode","koffing","weezing","slowpoke","slowbro","seel","jynx","shellder","cloyster","omanyte","kabuto","aerodactyl","hitmonlee","hitmonchan","meditite","medicham","sandslash","sentret","furret","shuckle","phanpy","larvitar","pupitar","zigzagoon","aron","lairon","numel","camerupt","trapinch","vibrava","cacnea","cacturne","baltoy","beldum","absol","wooper","quagsire","ledian","ariados","pineco","qwilfish","zangoose","seviper","tropius","wingull","pelipper","corphish","crawdaunt","girafarig","natu","snubbull","houndoom","smoochum","poochyena","mightyena","sableye","mawile","volbeat","illumise","lunatone","solrock","banette","bagon","shelgon","slakoth","nincada","mew","jirachi","hoothoot","dewgong","totodile","chinchou","lanturn","corsola","mudkip","lotad","lombre","surskit","carvanha","clamperl","swablu","primeape","chikorita","mareep","flaaffy","hoppip","skiploom","sunkern","tyrogue","miltank","treecko","seedot","nuzleaf","kecleon","delibird","marill","azurill","shroomish","gulpin","mesprit","feebas","loudred","luvdisc","slugma","magcargo","torchic","torkoal","dunsparce","smeargle","sharpedo","swellow","spoink","skitty","wailmer","wailord","makuhita","relicanth","skarmory","spinda","igglybuff","plusle","minun","castform","giratina-altered","electrike","manectric","liepard","munna","unfezant-male","crustle","vanillish","klink","diggersby","charjabug","mudsdale","bewear","steenee","greedent","wishiwashi-solo","claydol","seismitoad","axew","haxorus","cramorant","sliggoo","goodra","noibat","noivern","jangmo-o","hakamo-o","kommo-o","applin","flapple","appletun","dreepy","drakloak","dragapult","flygon","fraxure","turtonator","drampa","cottonee","vanillite","dewpider","skwovet","gossifleur","yamper","hatenna","basculin-red-stripe","basculin-blue-stripe","linoone-galarian","audino","galvantula","cryogonal","tyrunt","araquanid","mimikyu-busted","corvisquire","boltund","carkol","hattrem","indeedee-male","indeedee-female","morpeko-full-belly","anorith","corviknight","hatterene","obstagoon","altaria","whimsicott","eldegoss","vanilluxe","coalossal","tyrantrum","armaldo","keldeo-resolute","wooloo","dubwool","snorlax-gigantamax","woobat","swoobat","corviknight-gigantamax","slowpoke-galarian","trubbish","garbodor","garbodor-gigantamax","aggron","carbink","rolycoly","stonjourner","coalossal-gigantamax","lampent","chandelure","heatmor","sizzlipede","centiskorch","centiskorch-gigantamax","lileep","cradily","ferrothorn","butterfree-gigantamax","joltik","pincurchin","dedenne","toxtricity-amped","toxtricity-low-key","toxtricity-gigantamax","timburr","gurdurr","conkeldurr","golett","golurk","machamp-gigantamax","farfetchd-galarian","hitmontop","sirfetchd","falinks","sinistea-phony","sinistea-antique","polteageist-phony","polteageist-antique","alcremie","alcremie-gigantamax","weezing-galarian","hatterene-gigantamax","omastar","kabutops","milotic","kingler-gigantamax","ponyta-galarian","rapidash-galarian","mr-mime-galarian","gothorita","gothitelle","duosion","reuniclus","mr-rime","metang","metagross","gothita","solosis","phantump","trevenant","gengar-gigantamax","corsola-galarian","cursola","salamence","druddigon","duraludon","duraludon-gigantamax","type-null","whismur","gigalith","darumaka","stunfisk","bisharp","perrserker","pawniard","klefki","meowth-galarian","klinklang","palpitoad","karrablast","ferroseed","elgyem","litwick","cubchoo","shelmet","vullaby","inkay","binacle","wimpod","thievul","milcery","drednaw","zigzagoon-galarian","throh","sawk","maractus","scraggy","frillish-male","cutiefly","stufful","toxel","cufant","tranquill","linoone","ribombee","golisopod","beheeyem","pangoro","jellicent-male","beartic","musharna","drilbur","excadrill","mudbray","yamask-galarian","stunfisk-galarian","runerigus","xatu","sigilyph","oranguru","blipbug","dottler","orbeetle","spritzee","aromatisse","swirlix","slurpuff","impidimp","morgrem","grimmsnarl","ludicolo","shiftry","morelull","shiinotic","dhelmise","braviary","pidove","bunnelby","tyranitar","purrloin","mandibuzz","deino","zweilous","hydreigon","nickit","scrafty","chewtle","arrokuda","barraskewda","mareanie","toxapex","pyukumuku","ninjask","durant","grubbin","vikavolt","dwebble","escavalier","accelgor","orbeetle-gigantamax","shedinja","fomantis","morpeko-hangry","azumarill","comfey","wigglytuff","volcarona","malamar","tympole","larvesta","fletchling","fletchinder","talonflame","salandit","salazzle","marowak","sandile","krokorok","krookodile","sandaconda","sandygast","palossand","gourgeist-small","gourgeist-average","gourgeist-large","gourgeist-super","rabsca","meowstic-male","meowstic-female","barbaracle","mienfoo","mienshao","passimian","clobbopus","grapploct","roggenrola","silicobra","rockruff","lycanroc-midday","lycanroc-midnight","zoroark","rockruff-owntempo","lycanroc-dusk","emolga","zorua","bounsweet","bellossom","tsareena","pumpkaboo-average","pumpkaboo-small","pumpkaboo-large","pumpkaboo-super","flapple-gigantamax","appletun-gigantamax","politoed","exploud","bouffalant","cinccino","calyrex-ice-rider","glastrier","calyrex-shadow-rider","spectrier","klang","pancham","hawlucha","grimmsnarl-gigantamax","sandaconda-gigantamax","copperajah","honedge","avalugg","darumaka-galarian","darmanitan-galarian","eiscue-ice-face","boldore","minccino","rookidee","helioptile","heliolisk","lillipup","herdier","stoutland","whirlipede","scolipede","foongus","amoonguss","lurantis","venipede","venusaur","venusaur-gigantamax","calyrex","cosmog","tirtouga","cobalion","carracosta","lapras-gigantamax","copperajah-gigantamax","amaura","aurorus","frosmoth","snom","espurr","dracozolt","arctozolt","dracovish","arctovish","togedemaru","virizion","doublade","aegislash-blade","drednaw-gigantamax","wynaut","charmeleon","rotom-heat","rotom-wash","rotom-frost","rotom-fan","rotom-mow","archen","skrelp","dragalge","clauncher","clawitzer","kingdra","regice","registeel","charizard-gigantamax","terrakion","kubfu","poipole","ivysaur","wartortle","sandslash-alolan","dugtrio-alolan","persian-alolan","slowking","grovyle","sceptile","combusken","blaziken","marshtomp","swampert","cofagrigus","raikou","entei","suicune","lugia","ho-oh","latias","latios","kyogre","groudon","rayquaza","reshiram","zekrom","kyurem","xerneas-neutral","yveltal","zygarde-50p","tapu-koko","tapu-lele","tapu-bulu","tapu-fini","solgaleo","lunala","nihilego","buzzwole","pheromosa","xurkitree","celesteela","kartana","guzzlord","necrozma","stakataka","blacephalon","eevee-gigantamax","grookey","scorbunny","sobble","regirock","zacian-hero","zamazenta-hero","regieleki","regidrago","blastoise","blastoise-gigantamax","eternatus","eternatus-eternamax","zacian-sword","zamazenta-shield","pikachu-gigantamax","veluza","houndstone","cetitan","swalot","flamigo","dondozo","tatsugiri-curly","tatsugiri-droopy","tatsugiri-stretchy","bellibolt","kilowattrel","gogoat","lokix","naclstack","wugtrio","mabosstiff","forretress","gimmighoul-chest","hariyama","gumshoos","glimmet","jumpluff","floette-white","pawmo","farigiraf","scream-tail","slither-wing","iron-bundle","iron-hands","iron-moth","donphan","garganacl","sandy-shocks","iron-thorns","brute-bonnet","masquerain","flutter-mane","iron-jugulis","roaring-moon","iron-valiant","espathra","glimmora","dudunsparce-two","great-tusk","iron-treads","koraidon-apex","miraidon-ultimate","terapagos","toedscool","bramblin","capsakid","rellor","flittle","orthworm","tadbulb","skiddo","yungoos","nacli","charcadet","flabebe-red","flabebe-yellow","flabebe-orange","flabebe-blue","flabebe-white","floette-red","floette-yellow","floette-orange","floette-blue","tinkatuff","tinkatink","cyclizar","sprigatito","fuecoco","quaxly","squawkabilly-green","vigoroth","grumpig","deerling-winter","sawsbuck-winter","pyroar-male","pyroar-female","scovillain","greavard","cetoddle","frigibax","deerling-autumn","sawsbuck-autumn","oinkologne-male","oinkologne-female","dachsbun","bombirdier","wattrel","bruxish","finizen","crabrawler","wiglett","sunflora","vivillon-fancy","dolliv","tauros-paldean-combat-breed","deerling-summer","litleo","lechonk","komala","spidops","shroodle","shuppet","oricorio-baile","tandemaus","squawkabilly-blue","squawkabilly-yellow","squawkabilly-white","varoom","clodsire","salazzle-totem","tauros-paldean-blaze-breed","tauros-paldean-aqua-breed","ampharos","revavroom","hypno","sawsbuck-spring","arctibax","houndour","alomomola","tynamo","eelektrik","eelektross","brambleghast","slaking","florges-red","florges-yellow","florges-orange","florges-blue","florges-white","deerling-spring","tarountula","wooper-paldean","spewpa","scatterbug","pawmi","fidough","toedscruel","grafaiai","maschiff","oricorio-pompom","nymble","klawf","smoliv","breloom","chi-yu","wo-chien","ting-lu","chien-pao","giratina-origin","crabominable","maushold-family-of-three","pawmot","arboliva","armarouge","ceruledge","tinkaton","palafin-zero","annihilape","kingambit","baxcalibur","maushold-family-of-four"],"versions":["legends-arceus","brilliant-diamond","shining-pearl","lets-go-pikachu","lets-go-eevee","sword","shield","scarlet","violet"],"methods":["symbol-encounter","flying","shaking-trees","shaking-ore-deposits","swarm","contact-space-time-distortion","contact-unown-reasearch-notes","special-encounter","boxes","walking-tall-grass","surfing","fishing-old-rod","fishing-good-rod","fishing-super-rod","poke-radar","walking-around","npc-gift","midair","sea-skim","npc-buy","npc-trade","revive","egg","mr-backlot","berry-tree","fishing","wanderer","max-raid-battle","walking-beach","curry","walking-dirt","walking-sand","fixed-encounter","fixed-tera-encounter","static-encounter","mass-outbreak","tera-raid-battle"],"conditions":["Time Morning","Time Day","Time Evening","Time Night","Weather Clear","Weather Cloudy","Weather Harsh Sunlight","Weather Blizzard","Terrain Land","Terrain Water Surface","Terrain Underwater","Terrain Overland","Terrain Sky"],"areas":["aipom-hill-complete","ancient-quarry-complete","arenas-approach-complete","aspiration-hill-complete","avalanche-slopes-complete","avaluggs-lagacy-complete","bathers-lagoon-complete","bolderoll-ravine-complete","bolderoll-slope-complete","bonechill-wastes-complete","celestica-trail-complete","castaway-shore-complete","celestica-ruins-complete","clamberclaw-cliffs-complete","cottonsedge-prairie-complete","cloudcap-pass-complete","cloudpool-ridge-complete","brava-arena-complete","crevasse-passage-complete","crossing-slope-complete","deadwood-haunt-complete","deertrack-heights-complete","deertrack-path-complete","diamond-heath-complete","diamond-settlement-complete","droning-meadow-complete","fabled-spring-complete","firespit-island-complete","floaro-gardens-complete","gapejaw-bog-complete","ginkgo-landing-complete","glacier-terrace-complete","golden-lowlands-complete","grandtree-arena-complete","grueling-grove-complete","hearts-crag-complete","holm-of-trials-complete","heavenward-lookout-complete","hideaway-bay-complete","horseshoe-plains-complete","ice-column-chamber-complete","icebound-falls-complete","lunkers-lair-complete","icepeak-cavern-complete","islespy-shore-complete","lake-acuity-hisui-complete","lake-valor-hisui-complete","natures-pantry-complete","lake-valor-sinnoh-complete","lake-verity-hisui-complete","lonely-spring-complete","obsidian-falls-complete","ramanas-island-complete","oreburrow-tunnel-complete","pearl-settlement-complete","primeval-grotto-complete","sacred-plaza-complete","sands-reach-complete","sandgem-flats-complete","scarlet-bog-complete","seagrass-haven-complete","seaside-hollow-complete","secret-hollow-complete","shrouded-ruins-complete","sludge-mound-complete","snowfall-hot-spring-complete","the-heartwood-complete","snowpoint-temple-complete","snowpoint-temple-1f","snowpoint-temple-b1f","snowpoint-temple-b2f","snowpoint-temple-b3f","snowpoint-temple-b4f","snowpoint-temple-b5f","solaceon-ruins-hisui-complete","sonorous-path-complete","spring-path-hisui-complete","stonetooth-rows-complete","tidewater-dam-complete","tombolo-walk-complete","tranquility-cove-complete","ursas-ring-complete","veilstone-cape-complete","wayward-cave-complete","wayward-cave-1f","wayward-cave-b1f","wayward-wood-complete","whiteout-valley-complete","windbreak-stand-complete","windswept-run-complete","worn-bridge-complete","jubilife-village-complete","lava-dome-sanctum-complete","moonview-arena-complete","temple-of-sinnoh-complete","route-01-kanto-complete","hall-of-origin-complete","route-02-kanto-southern-section","route-02-kanto-northern-section","route-03-kanto-complete","route-04-kanto-complete","route-05-kanto-complete","route-06-kanto-complete","route-07-kanto-complete","route-08-kanto-complete","route-09-kanto-complete","route-10-kanto-complete","route-11-kanto-complete","route-12-kanto-complete","route-13-kanto-complete","route-14-kanto-complete","route-15-kanto-complete","route-16-kanto-complete","route-17-kanto-complete","route-18-kanto-complete","route-19-kanto-complete","route-20-kanto-complete","route-21-kanto-complete","route-22-kanto-complete","route-23-kanto-complete","route-24-kanto-complete","route-25-kanto-complete","cerulean-city-complete","vermilion-city-complete","lavender-town-complete","celadon-city-complete","saffron-city-complete","fuchsia-city-complete","cinnabar-island-complete","indigo-plateau-complete","professor-oaks-laboratory-complete","viridian-forest-complete","digletts-cave-complete","mt-moon-1f","mt-moon-b1f","mt-moon-b2f","cerulean-cave-1f","cerulean-cave-2f","cerulean-cave-b1f","rock-tunnel-1f","rock-tunnel-b1f","power-plant-complete","silph-co-complete","pokemon-tower-3f","pokemon-tower-4f","pokemon-tower-5f","pokemon-tower-6f","seafoam-islands-1f","seafoam-islands-b1f","seafoam-islands-b2f","seafoam-islands-b3f","seafoam-islands-b4f","pokemon-mansion-kanto-1f","pokemon-mansion-kanto-2f","pokemon-mansion-kanto-3f","pokemon-mansion-kanto-b1f","cinnabar-lab-complete","victory-road-kanto-1f","victory-road-kanto-2f","victory-road-kanto-3f","acuity-lakefront-complete","big-bluff-cavern-complete","bogsunk-cavern-complete","canalave-city-complete","celestic-town-complete","dazzling-cave-complete","eterna-city-complete","eterna-condominiums-complete","eterna-forest-complete","floaroma-town-complete","fountainspring-cave-complete","grassland-cave-complete","fuego-ironworks-complete","glacial-cavern-complete","great-marsh-area-1","great-marsh-complete","great-marsh-area-2","great-marsh-area-3","great-marsh-area-4","great-marsh-area-5","great-marsh-area-6","hearthome-city-complete","icy-cave-complete","iron-island-outside","iron-island-1f","iron-island-b1f","iron-island-b2f-right","iron-island-b2f-left","iron-island-b3f","lake-acuity-sinnoh-complete","lake-verity-sinnoh-complete","lost-tower-1f","lost-tower-2f","lost-tower-3f","lost-tower-4f","lost-tower-5f","maniac-tunnel-complete","mount-coronet-southern-1f-oreburgh-city-hearthome-city-side","mount-coronet-northern-1f-room-1-eterna-city-celestic-town-side","mount-coronet-b1f","mount-coronet-northern-1f-room-2","mount-coronet-2f","mount-coronet-3f","mount-coronet-4f","mount-coronet-4f-room-2","mount-coronet-4f-room-3","mount-coronet-5f","mount-coronet-6f","mount-coronet-tunnel-room","mount-coronet-mountainside","old-chateau-complete","old-chateau-2f","oreburgh-city-complete","oreburgh-gate-1f","oreburgh-gate-b1f","oreburgh-mine-b1f","oreburgh-mine-b2f","pastoria-city-complete","pokemon-league-sinnoh-complete","ravaged-path-complete","resort-area-complete","riverbank-cave-complete","rocky-cave-complete","sandsear-cave-complete","sendoff-spring-complete","route-201-sinnoh-complete","route-202-sinnoh-complete","route-203-sinnoh-complete","route-204-sinnoh-south","route-204-sinnoh-north","route-205-sinnoh-southern-part","route-205-sinnoh-northern-part","route-206-sinnoh-complete","route-207-sinnoh-complete","route-208-sinnoh-complete","route-209-sinnoh-complete","route-210-sinnoh-southern-part","route-210-sinnoh-northern-foggy-part","route-211-sinnoh-western-part","route-211-sinnoh-eastern-part","route-212-sinnoh-northern-area","route-212-sinnoh-southern-area","route-213-sinnoh-complete","route-214-sinnoh-complete","route-215-sinnoh-complete","route-216-sinnoh-complete","route-217-sinnoh-complete","route-218-sinnoh-complete","route-219-sinnoh-complete","route-220-sinnoh-complete","route-221-sinnoh-complete","route-222-sinnoh-complete","route-223-sinnoh-complete","route-224-sinnoh-complete","route-225-sinnoh-complete","route-226-sinnoh-complete","route-227-sinnoh-complete","route-228-sinnoh-complete","route-229-sinnoh-complete","route-230-sinnoh-complete","snowpoint-city-complete","solaceon-ruins-sinnoh-second-big-room","solaceon-ruins-sinnoh-third-big-room","solaceon-ruins-sinnoh-fourth-big-room","solaceon-ruins-sinnoh-fifth-big-room","solaceon-ruins-sinnoh-sixth-big-room","solaceon-ruins-sinnoh-seventh-big-room","solaceon-ruins-sinnoh-dead-end-rooms","solaceon-ruins-sinnoh-room-through-maniac-tunnel","spacious-cave-complete","stargleam-cavern-complete","stark-mountain-outside","stark-mountain-inside-1","stark-mountain-inside-2","stark-mountain-complete","still-water-cavern-complete","sunlit-cavern-complete","swampy-cave-complete","sunyshore-city-complete","trophy-garden-complete","turnback-cave-before-encountering-pillar","turnback-cave-between-first-and-second-pillar","turnback-cave-between-second-and-third-pillar","turnback-cave-complete","twinleaf-town-complete","typhlo-cavern-complete","valley-windworks-complete","valor-lakefront-complete","victory-road-sinnoh-1f","victory-road-sinnoh-2f","victory-road-sinnoh-b1f","victory-road-sinnoh-1f-back-1","victory-road-sinnoh-1f-back-2","volcanic-cave-complete","whiteout-cave-complete","axews-eye-complete","axews-eye-southeast-of-big-tree","axews-eye-northeast-of-big-tree","axews-eye-den-common","axews-eye-den-rare","ballimere-lake-complete","ballimere-lake-in-front-of-tombstone-on-east-side","ballimere-lake-west-of-lake","ballimere-lake-southwest-of-lake","ballimere-lake-southeast-island","ballimere-lake-den-northernmost-point-of-ridge-common","ballimere-lake-den-northernmost-point-of-ridge-rare","ballimere-lake-den-northeast-near-ruins-on-ridge-common","ballimere-lake-den-northeast-near-ruins-on-ridge-rare","ballimere-lake-den-at-high-point-between-cliffs-northwest-common","ballimere-lake-den-at-high-point-between-cliffs-northwest-rare","ballimere-lake-den-western-side-near-lakeside-cave-common","ballimere-lake-den-western-side-near-lakeside-cave-rare","ballimere-lake-den-near-central-ruins-north-of-lake-common","ballimere-lake-den-near-central-ruins-north-of-lake-rare","ballimere-lake-den-far-west-ridge-overlooking-lakeside-cave-common","ballimere-lake-den-far-west-ridge-overlooking-lakeside-cave-rare","ballimere-lake-den-eastern-ruins-near-path-common","ballimere-lake-den-eastern-ruins-near-path-rare","ballimere-lake-den-along-path-southeast-of-ruins-common","ballimere-lake-den-along-path-southeast-of-ruins-rare","ballimere-lake-den-near-central-ruins-on-small-island-common","ballimere-lake-den-near-central-ruins-on-small-island-rare","ballimere-lake-den-western-shore-of-lake-close-to-cliff-common","ballimere-lake-den-western-shore-of-lake-close-to-cliff-rare","ballimere-lake-den-eastern-shore-of-lake-near-cliffs-common","ballimere-lake-den-eastern-shore-of-lake-near-cliffs-rare","ballimere-lake-den-southern-shore-west-of-central-path-common","ballimere-lake-den-southern-shore-west-of-central-path-rare","ballimere-lake-den-southeast-lake-shore-near-path-common","ballimere-lake-den-southeast-lake-shore-near-path-rare","ballimere-lake-den-southwest-near-lakeside-cave-common","ballimere-lake-den-southwest-near-lakeside-cave-rare","ballimere-lake-den-southwest-along-path-above-lakeside-cave-common","ballimere-lake-den-southwest-along-path-above-lakeside-cave-rare","ballimere-lake-den-southeast-edge-above-path-near-ruins-common","ballimere-lake-den-southeast-edge-above-path-near-ruins-rare","ballimere-lake-den-easternmost-edge-near-giants-bed-common","ballimere-lake-den-easternmost-edge-near-giants-bed-rare","battle-tower-galar","brawlers-cave-complete","brawlers-cave-on-soothing-wetlands-near-entrance","brawlers-cave-on-soothing-wetlands-near-stream","brawlers-cave-on-soothing-wetlands-near-stream-exit","brawlers-cave-at-dead-end-of-stream","brawlers-cave-at-bottom-of-path-between-water-and-top","brawlers-cave-near-bottom-of-path-between-water-and-top","brawlers-cave-by-first-pillar-up-path-near-water-and-top","brawlers-cave-along-path-between-water-and-top","brawlers-cave-in-front-of-den-near-midpoint","brawlers-cave-by-pillar-near-top-of-path","brawlers-cave-near-challenge-road-exit","brawlers-cave-den-rare","brawlers-cave-den-common","bridge-field-complete","bridge-field-under-east-end-of-south-bridge","bridge-field-under-west-end-of-south-bridge","bridge-field-under-middle-of-large-patch-west-of-pond","bridge-field-west-cliff-opposite-of-pond","bridge-field-nook-south-of-northwest-corner","bridge-field-large-patch-northwest-of-pond","bridge-field-on-west-shore-of-pond","bridge-field-on-north-side-of-pond","bridge-field-northeast-of-den","bridge-field-between-north-bridge-supports","bridge-field-under-north-bridge-south-of-berry-trees","bridge-field-southwest-of-island","bridge-field-north-of-island","bridge-field-on-island","bridge-field-den-center-of-bridge-field-rare","bridge-field-den-south-end-of-bridge-field-near-cliff-common","bridge-field-den-south-end-of-bridge-field-near-cliff-rare","bridge-field-den-southwest-of-bridge-field-near-bridge-common","bridge-field-den-southwest-of-bridge-field-near-bridge-rare","bridge-field-den-west-of-bridge-field-near-bridge-common","bridge-field-den-west-of-bridge-field-near-bridge-rare","bridge-field-den-west-end-of-bridge-field-near-cliff-common","bridge-field-den-west-end-of-bridge-field-near-cliff-rare","bridge-field-den-north-of-bridge-field-near-trees-common","bridge-field-den-north-of-bridge-field-near-trees-rare","bridge-field-den-center-of-bridge-field-common","bridge-field-den-southeast-of-bridge-field-near-lake-common","bridge-field-den-southeast-of-bridge-field-near-lake-rare","bridge-field-den-east-end-of-bridge-field-near-path-common","bridge-field-den-east-end-of-bridge-field-near-path-rare","bridge-field-den-northeast-end-of-bridge-field-near-pokemon-nursery-common","bridge-field-den-northeast-end-of-bridge-field-near-pokemon-nursery-rare","challenge-beach-complete","challenge-beach-southwest-near-river-from-courageous-cavern-to-patch-of-grass","challenge-beach-near-river-west-of-berry-tree","challenge-beach-south-part-west-of-berry-tree","challenge-beach-south-part-west-of-berry-tree-near-river","challenge-beach-west-near-beach-edge","challenge-beach-in-front-of-beach-near-berry-tree","challenge-beach-near-beach-north-of-berry-tree","challenge-beach-west-end-of-beach-above-water","challenge-beach-near-den-west-beach","challenge-beach-west-beach-west-of-den","challenge-beach-on-beach-north-of-berry-tree-east-of-den","challenge-beach-near-beach-north-of-berry-tree-next-to-den","challenge-beach-on-beach-between-two-dens","challenge-beach-on-beach-north-of-den","challenge-beach-near-beach-east-of-den","challenge-beach-open-field-southwest-of-path-to-tower-of-waters","challenge-beach-near-beach-southwest-of-path-to-tower-of-waters","challenge-beach-south-of-tower-of-waters-west-of-grass-around-den","challenge-beach-west-of-forest-of-focus-border","challenge-beach-south-of-path-to-tower-of-waters-near-forest-of-focus-border","challenge-beach-on-beach-south-of-path-to-tower-of-waters-near-forest-of-focus","challenge-beach-on-cliff-east-of-beach","challenge-beach-south-of-tower-of-waters-near-path-start","challenge-beach-south-of-tower-of-waters-at-path-start","challenge-beach-on-path-to-tower-of-waters-near-south-end","challenge-beach-on-path-to-tower-of-waters-southern-part","challenge-beach-on-path-to-tower-of-waters-above-halfway-near-water","challenge-beach-on-path-to-tower-of-waters-near-tower-near-water","challenge-beach-north-end-of-path-to-tower-of-waters","challenge-beach-in-water-northwest-of-west-end-of-beach","challenge-beach-in-water-north-of-west-beach-near-stepping-stone-sea","challenge-beach-in-water-west-of-path-to-tower-of-waters","challenge-beach-in-water-northwest-of-tower-of-waters","challenge-beach-in-water-northeast-of-tower-of-waters","challenge-beach-in-water-east-of-path-to-tower-of-waters","challenge-beach-in-water-northeast-of-beach-near-honeycalm-sea","challenge-beach-in-water-east-of-beach-near-coast","challenge-beach-in-river-west-part","challenge-beach-in-river-near-courageous-cavern","challenge-beach-den-straight-ahead-from-forest-of-focus-entrance-surrounded-by-tall-grass-common","challenge-beach-den-straight-ahead-from-forest-of-focus-entrance-surrounded-by-tall-grass-rare","challenge-beach-den-right-from-forest-of-focus-at-end-of-raised-path-near-tree-common","challenge-beach-den-right-from-forest-of-focus-at-end-of-raised-path-near-tree-rare","challenge-beach-den-along-shoreline-past-sandbar-to-tower-of-waters-from-forest-of-focus-common","challenge-beach-den-along-shoreline-past-sandbar-to-tower-of-waters-from-forest-of-focus-rare","challenge-beach-den-in-water-near-den-c-common","challenge-beach-den-in-water-near-den-c-rare","challenge-beach-den-halfway-across-zone-where-shore-meets-grassy-part-common","challenge-beach-den-halfway-across-zone-where-shore-meets-grassy-part-rare","challenge-beach-den-just-before-berry-tree-at-end-of-shore-common","challenge-beach-den-just-before-berry-tree-at-end-of-shore-rare","challenge-beach-den-behind-tower-of-waters-common","challenge-beach-den-behind-tower-of-waters-rare","challenge-beach-den-right-of-courageous-cavern-entrance-past-tall-grass-common","challenge-beach-den-right-of-courageous-cavern-entrance-past-tall-grass-rare","challenge-road-complete","challenge-road-top-of-first-staircase","challenge-road-top-of-second-staircase","challenge-road-far-east-towards-den","challenge-road-bottom-of-third-staircase","challenge-road-near-brawlers-cave-entrance","challenge-road-den-behind-tower-of-darkness-rare","challenge-road-den-right-from-brawlers-cave-entrance-at-end-of-path-past-tall-grass-common","challenge-road-den-right-from-brawlers-cave-entrance-at-end-of-path-past-tall-grass-rare","challenge-road-den-end-of-path-right-at-first-crossroad-facing-tower-of-darkness-through-tall-grass-behind-boulder-common","challenge-road-den-end-of-path-right-at-first-crossroad-facing-tower-of-darkness-through-tall-grass-behind-boulder-rare","challenge-road-den-edge-of-plateau-overlooking-ocean-right-at-second-crossroad-facing-tower-of-darkness-common","challenge-road-den-edge-of-plateau-overlooking-ocean-right-at-second-crossroad-facing-tower-of-darkness-rare","challenge-road-den-behind-tower-of-darkness-common","circhester-complete","dappled-grove-complete","dappled-grove-by-lakeshore-west-of-southeast-field-of-grass","dappled-grove-south-near-western-cliff-wall","dappled-grove-north-of-den-northeast-of-pair-of-berry-trees","dappled-grove-between-two-berry-trees-in-north","dappled-grove-den-encircled-by-field-of-grass-in-southern-end-of-dappled-grove-west-of-pair-of-berry-trees-common","dappled-grove-den-encircled-by-field-of-grass-in-southern-end-of-dappled-grove-west-of-pair-of-berry-trees-rare","dappled-grove-den-near-middle-of-dappled-grove-northeast-of-pair-of-berry-trees-on-western-cliff-wall-common","dappled-grove-den-southern-of-pair-of-dens-in-northwest-against-cliff-wall-rare","dappled-grove-den-near-middle-of-dappled-grove-northeast-of-pair-of-berry-trees-on-western-cliff-wall-rare","dappled-grove-den-along-eastern-border-with-lake-axewell-just-south-of-berry-tree-common","dappled-grove-den-along-eastern-border-with-lake-axewell-just-south-of-berry-tree-rare","dappled-grove-den-southern-of-pair-of-dens-in-northwest-against-cliff-wall-common","dappled-grove-den-northern-of-pair-of-dens-in-northwest-against-cliff-wall-common","dappled-grove-den-northern-of-pair-of-dens-in-northwest-against-cliff-wall-rare","courageous-cavern-complete","courageuos-cavern-east-of-den-near-challenge-beach-entrance","courageuos-cavern-between-challenge-beach-and-loop-lagoon","courageuos-cavern-intersection-near-den","courageuos-cavern-intersection-near-path-up","courageuos-cavern-beside-long-path-to-from-loop-lagoon","courageuos-cavern-along-long-path-to-from-loop-lagoon","courageuos-cavern-near-loop-lagoon-entrance","courageuos-cavern-in-stream-from-loop-lagoon","courageuos-cavern-midpoint-of-stream","courageuos-cavern-end-of-stream","courageuos-cavern-down-descending-path-from-intersection","courageuos-cavern-on-top-level","courageuos-cavern-dead-end-of-stream-on-top-level","courageous-cavern-den-directly-ahead-from-challenge-beach-entrance-in-alcove-along-right-side-common","courageous-cavern-den-directly-ahead-from-challenge-beach-entrance-in-alcove-along-right-side-rare","courageous-cavern-den-down-slope-left-side-from-challenge-beach-left-of-middle-rock-common","courageous-cavern-den-down-slope-left-side-from-challenge-beach-behind-middle-rock-rare","courageous-cavern-den-down-slope-left-side-from-challenge-beach-left-of-middle-rock-rare","courageous-cavern-den-down-slope-left-side-from-challenge-beach-behind-middle-rock-common","courageous-cavern-den-down-slope-left-side-from-challenge-beach-right-of-middle-rock-common","courageous-cavern-den-down-slope-left-side-from-challenge-beach-right-of-middle-rock-rare","courageous-cavern-den-on-land-left-after-heading-down-underground-stream-up-slope-from-split-path-from-challenge-beach-common","courageous-cavern-den-on-land-left-after-heading-down-underground-stream-up-slope-from-split-path-from-challenge-beach-rare","courageous-cavern-den-along-path-right-of-split-from-challenge-beach-turn-left-before-exit-common","courageous-cavern-den-along-path-right-of-split-from-challenge-beach-turn-left-before-exit-rare","crown-shrine-complete","crown-shrine-den-common","crown-shrine-den-rare","dusty-bowl-complete","dusty-bowl-southwest-side-large-spine-of-rock-stony-wilderness-northeast","dusty-bowl-west-giants-mirror-pond-near-border","dusty-bowl-south-giant-bridge-rock","dusty-bowl-east-end-giant-bridge-rock","dusty-bowl-northwest-giant-bridge-rock","dusty-bowl-east-den-lying-along-west-wall","dusty-bowl-south-northern-field-grass-along-west-wall","dusty-bowl-east-northern-field-grass-along-west-wall","dusty-bowl-small-pond-northwest","dusty-bowl-large-pond-northwest","dusty-bowl-den-south-end-of-dusty-bowl-common","dusty-bowl-den-south-end-of-dusty-bowl-rare","dusty-bowl-den-southwest-end-of-dusty-bowl-common","dusty-bowl-den-southwest-end-of-dusty-bowl-rare","dusty-bowl-den-southeast-of-dusty-bowl-common","dusty-bowl-den-southeast-of-dusty-bowl-rare","dusty-bowl-den-northwest-of-dusty-bowl-common","dusty-bowl-den-northwest-of-dusty-bowl-rare","dusty-bowl-den-west-end-of-dusty-bowl-near-lake-common","dusty-bowl-den-west-end-of-dusty-bowl-near-lake-rare","dusty-bowl-den-center-of-dusty-bowl-near-large-rock-formation-common","dusty-bowl-den-center-of-dusty-bowl-near-large-rock-formation-rare","dusty-bowl-den-east-of-dusty-bowl-near-large-rock-formation-common","dusty-bowl-den-east-of-dusty-bowl-near-large-rock-formation-rare","dusty-bowl-den-northeast-end-of-dusty-bowl-near-rock-common","dusty-bowl-den-northeast-end-of-dusty-bowl-near-rock-rare","dusty-bowl-den-northeast-end-of-dusty-bowl-common","dusty-bowl-den-northeast-end-of-dusty-bowl-rare","dyna-tree-hill-complete","dyna-tree-hill-den-common","dyna-tree-hill-den-rare","east-lake-axewell-complete","east-lake-axewell-flying-north-of-rolling-fields-border","east-lake-axewell-south-of-motostoke-entrance-near-den","east-lake-axewell-west-of-north-lake-miloch-border","east-lake-axewell-by-bridge-in-west","east-lake-axewell-west-northwest-of-axews-eye","east-lake-axewell-northwest-of-axews-eye","east-lake-axewell-north-of-axews-eye","east-lake-axewell-northeast-of-axews-eye","east-lake-axewell-by-east-shore","east-lake-axewell-southeast-of-axews-eye","east-lake-axewell-in-southeast-corner","east-lake-axewell-south-of-axews-eye","east-lake-axewell-southwest-of-axews-eye","east-lake-axewell-den-southeast-coast-of-east-lake-axewell-common","east-lake-axewell-den-southeast-coast-of-east-lake-axewell-rare","east-lake-axewell-den-northeast-coast-of-east-lake-axewell-common","east-lake-axewell-den-northeast-coast-of-east-lake-axewell-rare","east-lake-axewell-den-northwest-of-east-lake-axewell-near-cliff-common","east-lake-axewell-den-northwest-of-east-lake-axewell-near-cliff-rare","east-lake-axewell-den-north-of-east-lake-axewell-near-entrance-to-motostoke-common","east-lake-axewell-den-north-of-east-lake-axewell-near-entrance-to-motostoke-rare","east-lake-axewell-den-south-of-east-lake-axewell-common","east-lake-axewell-den-south-of-east-lake-axewell-rare","fields-of-honor-complete","fields-of-honor-near-eastern-cliff-north-of-bridge","fields-of-honor-near-beach-south-of-bridge","fields-of-honor-at-beach-south-of-bridge","fields-of-honor-center-of-beach-south-of-den","fields-of-honor-east-of-armor-station-near-berry-tree","fields-of-honor-at-beach-east-of-armor-station-south-of-berry-tree","fields-of-honor-at-beach-near-armor-station","fields-of-honor-den-northeast-of-soothing-wetlands-near-path-common","fields-of-honor-den-northeast-of-soothing-wetlands-near-path-rare","fields-of-honor-den-northeast-end-of-soothing-wetlands-common","fields-of-honor-den-northeast-end-of-soothing-wetlands-rare","fields-of-honor-den-east-end-of-soothing-wetlands-common","fields-of-honor-den-east-end-of-soothing-wetlands-rare","fields-of-honor-den-southeast-of-soothing-wetlands-near-bridge-common","fields-of-honor-den-southeast-of-soothing-wetlands-near-bridge-rare","fields-of-honor-den-northwest-of-soothing-wetlands-near-path-common","fields-of-honor-den-northwest-of-soothing-wetlands-near-path-rare","fields-of-honor-den-west-of-soothing-wetlands-near-bridge-common","fields-of-honor-den-west-of-soothing-wetlands-near-bridge-rare","fields-of-honor-den-southwest-end-of-soothing-wetlands-common","fields-of-honor-den-southwest-end-of-soothing-wetlands-rare","fields-of-honor-den-southeast-end-of-soothing-wetlands-near-lake-common","fields-of-honor-den-southeast-end-of-soothing-wetlands-near-lake-rare","fields-of-honor-den-east-end-of-soothing-wetlands-near-lake-common","fields-of-honor-den-east-end-of-soothing-wetlands-near-lake-rare","fields-of-honor-den-south-of-soothing-wetlands-near-path-common","fields-of-honor-den-south-of-soothing-wetlands-near-path-rare","forest-of-focus-complete","forest-of-focus-slightly-north-of-soothing-wetlands-border","forest-of-focus-east-of-bridge-near-soothing-wetlands-border","forest-of-focus-southeast-of-berry-tree-near-soothing-wetlands-border","forest-of-focus-northwest-of-pool-in-forest-south-of-berry-tree-dead-end","forest-of-focus-east-of-pool-in-forest","forest-of-focus-northeastern-end-of-forest-near-berry-tree-dead-end","forest-of-focus-north-of-pool-in-forest-west-of-second-bridge","forest-of-focus-northeast-of-pool-in-forest-east-of-second-bridge","forest-of-focus-by-entrance-to-river-across-first-bridge-east-of-berry-tree-and-den","forest-of-focus-slightly-north-of-challenge-beach-border","forest-of-focus-north-of-berry-tree-across-first-bridge","forest-of-focus-across-second-bridge-west-near-berry-tree-dead-end","forest-of-focus-across-second-bridge-north","forest-of-focus-across-second-bridge-northwest","forest-of-focus-flying-between-trees","forest-of-focus-den-east-side-of-forest-before-bridges-at-end-of-water-common","forest-of-focus-den-east-side-of-forest-before-bridges-at-end-of-water-rare","forest-of-focus-den-right-of-second-bridge-on-soothing-wetlands-side-common","forest-of-focus-den-right-of-second-bridge-on-soothing-wetlands-side-rare","forest-of-focus-den-right-after-second-bridge-from-soothing-wetlands-near-lands-edge-common","forest-of-focus-den-right-after-second-bridge-from-soothing-wetlands-near-lands-edge-rare","forest-of-focus-den-right-of-second-bridge-from-soothing-wetlands-in-river-common","forest-of-focus-den-right-of-second-bridge-from-soothing-wetlands-in-river-rare","forest-of-focus-den-down-river-opposite-of-den-d-halfway-to-first-bridge-common","forest-of-focus-den-down-river-opposite-of-den-d-halfway-to-first-bridge-rare","forest-of-focus-den-down-river-from-den-e-on-riverbank-near-first-bridge-surrounded-by-tall-grass-common","forest-of-focus-den-down-river-from-den-e-on-riverbank-near-first-bridge-surrounded-by-tall-grass-rare","freezington-complete","frigid-sea-complete","frigid-sea-den-at-northern-tip-on-ice-sheets-common","frigid-sea-den-at-northern-tip-on-ice-sheets-rare","frigid-sea-den-on-northeast-ice-sheet-near-ocean-common","frigid-sea-den-on-northeast-ice-sheet-near-ocean-rare","frigid-sea-den-central-north-ice-sheet-near-split-common","frigid-sea-den-central-north-ice-sheet-near-split-rare","frigid-sea-den-on-easternmost-ice-sheet-edge-common","frigid-sea-den-on-easternmost-ice-sheet-edge-rare","frigid-sea-den-on-island-center-of-large-mountainous-area-common","frigid-sea-den-on-island-center-of-large-mountainous-area-rare","frigid-sea-den-near-western-ice-sheet-close-to-ocean-common","frigid-sea-den-near-western-ice-sheet-close-to-ocean-rare","frigid-sea-den-near-southwest-edge-on-ice-sheet-common","frigid-sea-den-near-southwest-edge-on-ice-sheet-rare","frigid-sea-den-central-southern-ice-sheet-near-inland-common","frigid-sea-den-central-southern-ice-sheet-near-inland-rare","frigid-sea-den-on-eastern-coastline-above-ice-sheet-common","frigid-sea-den-on-eastern-coastline-above-ice-sheet-rare","frigid-sea-den-southeast-ice-sheet-edge-close-to-land-common","frigid-sea-den-southeast-ice-sheet-edge-close-to-land-rare","frigid-sea-den-central-south-inland-area-common","frigid-sea-den-central-south-inland-area-rare","frigid-sea-den-southeastern-ice-sheet-southern-edge-common","frigid-sea-den-southeastern-ice-sheet-southern-edge-rare","frigid-sea-den-near-three-point-pass-close-to-roaring-sea-caves-common","frigid-sea-den-near-three-point-pass-close-to-roaring-sea-caves-rare","frigid-sea-den-southern-tip-on-ocean-near-three-point-pass-common","frigid-sea-den-southern-tip-on-ocean-near-three-point-pass-rare","frostpoint-field-complete","frostpoint-field-den-west-common","frostpoint-field-den-west-rare","frostpoint-field-den-west-of-rocks-common","frostpoint-field-den-west-of-rocks-rare","frostpoint-field-den-northeast-of-rocks-common","frostpoint-field-den-northeast-of-rocks-rare","frostpoint-field-den-southeast-of-rocks-common","frostpoint-field-den-southeast-of-rocks-rare","frostpoint-field-den-east-common","frostpoint-field-den-east-rare","galar-mine-complete","galar-mine-no-2-complete","galar-mine-no-2-next-to-northwest-edge-of-second-pool","galar-mine-no-2-southeast-of-southeast-corner-of-second-pool","galar-mine-no-2-next-to-south-edge-of-second-pool","galar-mine-no-2-where-path-turns-from-south-to-southwest","galar-mine-no-2-short-passageway-south-of-large-open-area-near-mine-cart","galar-mine-no-2-southeast-of-southeastern-most-pool","galar-mine-no-2-south-of-southeastern-most-pool","galar-mine-no-2-large-open-area-near-mine-cart","galar-mine-no-2-pool-in-northeast-of-cave","galar-route-01-complete","galar-route-10-near-station","galar-route-10-north","galar-route-10-south-of-trainer-tips-sign","galar-route-10-east-of-pokemon-camp","galar-route-02-wedgehurst-side","galar-route-02-middle-of-route-open-path-before-trainer-tips-sign","galar-route-02-middle-of-route-open-path-after-trainer-tips-sign","galar-route-02-across-lake","galar-route-02-in-water-north-section-lake","galar-route-02-on-island-in-lake","galar-route-02-northwest-corner-of-lake","galar-route-03-complete","galar-route-03-eastern-patch","galar-route-03-western-patch","galar-route-03-perched-on-rock-next-to-fenced-path-to-factory","galar-route-04-complete","galar-route-04-northwest-paddock","galar-route-05-complete","galar-route-05-east-end-of-bridge","galar-route-06-complete","galar-route-07-complete","galar-route-08-complete","galar-route-08-northwest-blocking-narrow-path-leading-to-tm43","galar-route-08-various-holes-around-ruins","galar-route-08-steamdrift-way","galar-route-09-complete","galar-route-09-end-of-stream-west-of-bridge-by-circhester","galar-route-09-circhester-bay","galar-route-09-circhester-bay-east-of-northern-entrance-to-circhester-bay","galar-route-09-circhester-bay-around-icebergs-northwest-of-pokemon-camp","galar-route-09-circhester-bay-in-canal-southwest-of-pokemon-camp","galar-route-09-circhester-bay-around-iceberg-between-trainer-tips-signpost-and-circhester-bay-signpost","galar-route-09-circhester-bay-around-rock-west-of-berry-tree","galar-route-09-outer-spikemuth","giants-bed-complete","giants-bed-den-on-slope-northernmost-tip-snowslide-slope-common","giants-bed-den-on-slope-northernmost-tip-snowslide-slope-rare","giants-bed-den-on-slope-eastern-ridge-snowslide-slope-common","giants-bed-den-on-slope-eastern-ridge-snowslide-slope-rare","giants-bed-den-on-slope-near-pond-east-of-snowslide-slope-common","giants-bed-den-on-slope-near-pond-east-of-snowslide-slope-rare","giants-bed-den-on-slope-midpoint-snowslide-slope-above-pond-common","giants-bed-den-on-slope-midpoint-snowslide-slope-above-pond-rare","giants-bed-den-on-ruins-western-side-near-buildings-common","giants-bed-den-on-ruins-western-side-near-buildings-rare","giants-bed-den-on-edge-eastern-cliff-overlooking-pond-common","giants-bed-den-on-edge-eastern-cliff-overlooking-pond-rare","giants-bed-den-on-ruins-north-of-central-monument-common","giants-bed-den-on-ruins-north-of-central-monument-rare","giants-bed-den-on-path-eastern-route-to-giants-foot-common","giants-bed-den-on-path-eastern-route-to-giants-foot-rare","giants-bed-den-on-ruins-southern-side-near-monuments-common","giants-bed-den-on-ruins-southern-side-near-monuments-rare","giants-bed-den-on-ridge-western-cliff-near-frostpoint-field-common","giants-bed-den-on-ridge-western-cliff-near-frostpoint-field-rare","giants-bed-den-on-ridge-southwest-of-frostpoint-field-common","giants-bed-den-on-ridge-southwest-of-frostpoint-field-rare","giants-bed-den-on-ruins-north-of-old-cemetery-common","giants-bed-den-on-ruins-north-of-old-cemetery-rare","giants-bed-den-on-ruins-southeast-of-central-monument-common","giants-bed-den-on-ruins-southeast-of-central-monument-rare","giants-bed-den-on-edge-western-cliff-overlooking-cemetery-common","giants-bed-den-on-edge-western-cliff-overlooking-cemetery-rare","giants-bed-den-on-path-leading-into-giants-foot-common","giants-bed-den-on-path-leading-into-giants-foot-rare","giants-bed-den-on-curve-near-river-to-ballimere-lake-common","giants-bed-den-on-curve-near-river-to-ballimere-lake-rare","giants-bed-den-on-shore-west-side-of-ballimere-lake-common","giants-bed-den-on-shore-west-side-of-ballimere-lake-rare","giants-bed-den-on-shore-eastern-cliffside-above-ballimere-lake-common","giants-bed-den-on-shore-eastern-cliffside-above-ballimere-lake-rare","giants-bed-den-on-ridge-southern-side-of-ballimere-lake-common","giants-bed-den-on-ridge-southern-side-of-ballimere-lake-rare","giants-bed-den-on-edge-southernmost-tip-of-peninsula-common","giants-bed-den-on-edge-southernmost-tip-of-peninsula-rare","giants-bed-den-on-tip-end-of-southern-peninsula-common","giants-bed-den-on-tip-end-of-southern-peninsula-rare","giants-bed-den-special-den","giants-cap-complete","giants-cap-most-patches","giants-cap-northwestern-patch","giants-cap-clifftop-patch","giants-cap-south-near-border-to-stony-wilderness","giants-cap-north-between-dusty-bowl-cliff-and-large-brown-rock","giants-cap-southwest-corner-near-stony-wilderness-border","giants-cap-first-field-north-along-west-wall","giants-cap-south-end-of-v-shaped-field-along-east","giants-cap-mouth-of-western-branch-up-slope","giants-cap-near-lakeshore-on-top-of-cliff-in-west","giants-cap-top-of-middle-branch-up-slope","giants-cap-north-near-hammerlocke-hills-border","giants-cap-den-south-end-of-giants-cap-common","giants-cap-den-south-end-of-giants-cap-rare","giants-cap-den-southeast-of-giants-cap-common","giants-cap-den-southeast-of-giants-cap-rare","giants-cap-den-center-of-giants-cap-common","giants-cap-den-center-of-giants-cap-rare","giants-cap-den-northwest-of-giants-cap-near-path-common","giants-cap-den-northwest-of-giants-cap-near-path-rare","giants-cap-den-northeast-end-of-giants-cap-common","giants-cap-den-northeast-end-of-giants-cap-rare","giants-mirror-complete","giants-mirror-south-of-pond","giants-mirror-northwest-of-pond","giants-mirror-northeast-of-pond-near-large-rocks","giants-mirror-northeast-field-of-grass","giants-mirror-northeast-corner-near-den","giants-mirror-in-pond","giants-mirror-den-southwest-end-of-giants-mirror-common","giants-mirror-den-southwest-end-of-giants-mirror-rare","giants-mirror-den-south-of-giants-mirror-near-lake-common","giants-mirror-den-south-of-giants-mirror-near-lake-rare","giants-mirror-den-central-area-of-giants-mirror-common","giants-mirror-den-central-area-of-giants-mirror-rare","giants-mirror-den-northeast-of-giants-mirror-common","giants-mirror-den-northeast-of-giants-mirror-rare","giants-mirror-den-northeast-end-of-giants-mirror-near-cliff-common","giants-mirror-den-northeast-end-of-giants-mirror-near-cliff-rare","giants-mirror-den-southeast-end-of-hammerlocke-hills-common","giants-mirror-den-southeast-end-of-hammerlocke-hills-rare","giants-mirror-den-northeast-end-of-hammerlocke-hills-near-bridge-common","giants-mirror-den-northeast-end-of-hammerlocke-hills-near-bridge-rare","giants-mirror-den-central-area-of-hammerlocke-hills-common","giants-mirror-den-central-area-of-hammerlocke-hills-rare","giants-mirror-den-south-end-of-hammerlocke-hills-common","giants-mirror-den-south-end-of-hammerlocke-hills-rare","giants-mirror-den-northwest-of-hammerlocke-hills-near-path-common","giants-mirror-den-northwest-of-hammerlocke-hills-near-path-rare","giants-mirror-den-north-of-hammerlocke-hills-near-entrance-to-hammerlocke-common","giants-mirror-den-north-of-hammerlocke-hills-near-entrance-to-hammerlocke-rare","giants-mirror-den-west-end-of-hammerlocke-hills-common","giants-mirror-den-west-end-of-hammerlocke-hills-rare","giants-foot-complete","giants-foot-den-near-giants-bed-entrance-common","giants-foot-den-near-giants-bed-entrance-rare","giants-foot-den-southwest-of-western-ruin-common","giants-foot-den-southwest-of-western-ruin-rare","giants-foot-den-west-of-roaring-sea-caves-entrance-common","giants-foot-den-west-of-roaring-sea-caves-entrance-rare","giants-foot-den-by-pedestal-common","giants-foot-den-by-pedestal-rare","giants-foot-den-in-eastern-ruin-common","giants-foot-den-in-eastern-ruin-rare","giants-seat-complete","giants-seat-west-of-rock-spire","giants-seat-southwest-of-rock-spire","giants-seat-north-of-rock-spire","giants-seat-by-den-in-northeast-corner","giants-seat-den-northeast-of-giants-seat-rare","giants-seat-den-west-of-giants-seat-near-cliff-rare","giants-seat-den-southwest-of-giants-seat-near-lake-common","giants-seat-den-southwest-of-giants-seat-near-lake-rare","giants-seat-den-southeast-of-giants-seat-near-cliff-common","giants-seat-den-southeast-of-giants-seat-near-cliff-rare","giants-seat-den-west-of-giants-seat-near-cliff-common","giants-seat-den-east-of-giants-seat-near-cliff-wall-common","giants-seat-den-east-of-giants-seat-near-cliff-wall-rare","giants-seat-den-northeast-of-giants-seat-common","glimwood-tangle-complete","glimwood-tangle-near-entrance-luminescent-mushroom","glimwood-tangle-east-dead-end-luminescent-mushroom","glimwood-tangle-left-of-madame-judy-large-tree","hammerlocke-complete","hammerlocke-hills-complete","hammerlocke-hills-east-end-dusty-bowl-wall","hammerlocke-hills-west-of-easternmost-grass-field","hammerlocke-hills-corner-wall-east-hammerlocke","hammerlocke-hills-south-hammerlocke-entrance","hammerlocke-hills-west-southwest-den-west-hammerlocke","hammerlocke-hills-northwest-corner","honeycalm-island-complete","honeycalm-island-northern-outcrop","honeycalm-island-northeastern-outcrop","honeycalm-island-southeastern-outcrop","honeycalm-island-southern-outcrop","honeycalm-island-southwestern-outcrop","honeycalm-island-northwestern-outcrop","honeycalm-island-big-tree-in-middle","honeycalm-island-south-petal","honeycalm-island-den-on-petal-closest-tower-of-waters-common","honeycalm-island-den-on-petal-closest-tower-of-waters-rare","honeycalm-island-den-right-facing-center-island-common","honeycalm-island-den-right-facing-center-island-rare","honeycalm-island-den-far-right-facing-center-island-common","honeycalm-island-den-far-right-facing-center-island-rare","honeycalm-island-den-extreme-right-facing-center-island-common","honeycalm-island-den-extreme-right-facing-center-island-rare","honeycalm-island-den-left-facing-center-island-common","honeycalm-island-den-left-facing-center-island-rare","honeycalm-island-den-extreme-left-facing-center-island-common","honeycalm-island-den-extreme-left-facing-center-island-rare","honeycalm-sea-complete","honeycalm-sea-northeast-of-honeycalm-island-in-rock-triangle","honeycalm-sea-den-on-sea-to-right-of-honeycalm-island-rare","honeycalm-sea-den-on-start-of-narrow-land-opposite-honeycalm-island-mainland-side-common","honeycalm-sea-den-on-start-of-narrow-land-opposite-honeycalm-island-mainland-side-rare","honeycalm-sea-den-on-sea-to-right-of-honeycalm-island-common","honeycalm-sea-den-on-middle-of-sea-straight-ahead-honeycalm-island-on-left-common","honeycalm-sea-den-on-middle-of-sea-straight-ahead-honeycalm-island-on-left-rare","honeycalm-sea-den-on-near-trio-of-rocky-islands-opposite-training-lowlands-common","honeycalm-sea-den-on-near-trio-of-rocky-islands-opposite-training-lowlands-rare","honeycalm-sea-den-on-middle-of-three-rocky-islands-common","honeycalm-sea-den-on-middle-of-three-rocky-islands-rare","hulbury-complete","iceberg-ruins-galar","insular-sea-complete","insular-sea-big-island","insular-sea-den-near-rocky-island-towards-island-with-single-tree-behind-tower-of-waters-common","insular-sea-den-near-rocky-island-towards-island-with-single-tree-behind-tower-of-waters-rare","insular-sea-den-directly-ahead-after-slight-left-from-islet-facing-island-with-tree-common","insular-sea-den-directly-ahead-after-slight-left-from-islet-facing-island-with-tree-rare","insular-sea-den-on-island-with-single-tree-next-to-tall-grass-facing-mainland-common","insular-sea-den-on-island-with-single-tree-next-to-tall-grass-facing-mainland-rare","insular-sea-den-in-sea-moderate-distance-left-of-tower-of-waters-common","insular-sea-den-in-sea-moderate-distance-left-of-tower-of-waters-rare","insular-sea-den-on-circle-shaped-islet-opposite-direction-of-island-with-single-tree-common","insular-sea-den-on-circle-shaped-islet-opposite-direction-of-island-with-single-tree-rare","iron-ruins-galar-complete","lake-of-outrage-complete","lake-of-outrage-in-west-end-by-island","lake-of-outrage-in-south-end-by-shore-with-giants-cap","lake-of-outrage-east-of-den-by-shore-with-giants-cap","lake-of-outrage-in-north-end-by-shelf-of-land","lake-of-outrage-on-island-on-slope-up-from-lake","lake-of-outrage-on-island-south-of-stone-ring","lake-of-outrage-on-island-east-of-stone-ring","lake-of-outrage-on-island-on-east-end","lake-of-outrage-den-south-end-of-lake-of-outrage-common","lake-of-outrage-den-south-end-of-lake-of-outrage-rare","lake-of-outrage-den-northeast-end-of-lake-of-outrage-common","lake-of-outrage-den-northeast-end-of-lake-of-outrage-rare","lake-of-outrage-den-west-end-of-lake-of-outrage-common","lake-of-outrage-den-west-end-of-lake-of-outrage-rare","lake-of-outrage-den-northwest-of-lake-of-outrage-common","lake-of-outrage-den-northwest-of-lake-of-outrage-rare","rolling-fields-complete","rolling-fields-most-patches","rolling-fields-western-patch","rolling-fields-west-half-of-rolling-fields-in-dirt-patch-just-northwest-of-meetup-spot","rolling-fields-west-half-of-rolling-fields","rolling-fields-west-just-west-of-end-of-path-from-meetup-spot","rolling-fields-west-in-clearing-west-of-den-nearest-meetup-spot","rolling-fields-south-of-west-lake-axewell-border","rolling-fields-west-half-of-rolling-fields-near-den-by-west-lake-axewell-border","rolling-fields-west-half-of-rolling-fields-in-cove-of-cliffs-in-south-containing-den","rolling-fields-west-half-of-rolling-fields-on-path-near-dappled-grove-border","rolling-fields-east-half-of-rolling-fields-west-of-field-of-grass-encircling-den","rolling-fields-east-half-of-rolling-fields-southeast-of-field-of-grass-encircling-den","rolling-fields-east-half-of-rolling-fields-north-of-field-of-grass-encircling-den","rolling-fields-den-west-of-meetup-spot-between-grass-fields-near-southern-cliff-wall-common","rolling-fields-den-west-of-path-running-north-from-meetup-spot-common","rolling-fields-den-west-of-path-running-north-from-meetup-spot-rare","rolling-fields-den-west-of-meetup-spot-between-grass-fields-near-southern-cliff-wall-rare","rolling-fields-den-northwest-of-meetup-spot-close-to-border-with-west-lake-axewell-common","rolling-fields-den-northwest-of-meetup-spot-close-to-border-with-west-lake-axewell-rare","rolling-fields-den-in-nook-in-southern-cliff-wall-west-of-meetup-spot-common","rolling-fields-den-in-nook-in-southern-cliff-wall-west-of-meetup-spot-rare","rolling-fields-den-in-half-circle-field-of-grass-in-west-end-of-rolling-fields-common","rolling-fields-den-in-half-circle-field-of-grass-in-west-end-of-rolling-fields-rare","rolling-fields-den-in-circular-field-of-grass-northeast-of-meetup-spot-common","rolling-fields-den-in-circular-field-of-grass-northeast-of-meetup-spot-rare","rolling-fields-den-north-of-circular-field-of-grass-northeast-of-meetup-spot-common","rolling-fields-den-north-of-circular-field-of-grass-northeast-of-meetup-spot-rare","rolling-fields-den-along-cliff-wall-south-of-circular-field-of-grass-northeast-of-meetup-spot-common","rolling-fields-den-along-cliff-wall-south-of-circular-field-of-grass-northeast-of-meetup-spot-rare","rolling-fields-den-on-promontory-overlooking-lake-miloch-in-southeast-end-of-rolling-fields-common","rolling-fields-den-on-promontory-overlooking-lake-miloch-in-southeast-end-of-rolling-fields-rare","lakeside-cave-complete","lakeside-cave-depth-of-cave-next-to-left-rock","lakeside-cave-next-to-lower-entrance-to-ballimere-lake","lakeside-cave-left-of-cave","lakeside-cave-between-two-rocks","lakeside-cave-above-junction-of-two-entrances","lakeside-cave-next-to-right-rock","loop-lagoon-complete","loop-lagoon-western-coast-of-central-island","loop-lagoon-south-of-arch-on-central-island","loop-lagoon-east-of-arch-on-central-island-south-of-den","loop-lagoon-northern-beach-east-of-fallen-tree-trunks","loop-lagoon-northern-beach-west-of-fallen-tree-trunks","loop-lagoon-northern-beach-northwest-of-fallen-tree-trunks","loop-lagoon-in-clearing-south-of-entrance-to-courageous-cavern","loop-lagoon-northern-part-of-beach-south-of-entrance-to-courageous-cavern","loop-lagoon-eastern-part-of-beach-south-of-entrance-to-courageous-cavern","loop-lagoon-southeastern-part-of-beach-south-of-entrance-to-courageous-cavern","loop-lagoon-den-before-gap-in-cliffs-to-ocean-straight-from-shoreline-opposite-courageous-cavern-common","loop-lagoon-den-before-gap-in-cliffs-to-ocean-straight-from-shoreline-opposite-courageous-cavern-rare","loop-lagoon-den-halfway-along-rocky-island-left-after-heading-right-at-gap-common","loop-lagoon-den-halfway-along-rocky-island-left-after-heading-right-at-gap-rare","loop-lagoon-den-far-right-of-shoreline-on-island-in-centre-of-lagoon-common","loop-lagoon-den-far-right-of-shoreline-on-island-in-centre-of-lagoon-rare","loop-lagoon-den-inner-grassy-part-of-central-island-facing-isolated-shore-common","loop-lagoon-den-inner-grassy-part-of-central-island-facing-isolated-shore-rare","master-dojo-complete","max-lair-complete","meetup-spot-complete","motostoke-complete","motostoke-outskirts-complete","motostoke-riverbank-complete","motostoke-riverbank-by-west-end-of-riverbank","motostoke-riverbank-in-front-of-bridge-over-river","motostoke-riverbank-by-east-end-of-riverbank","motostoke-riverbank-east-of-pond","motostoke-riverbank-west-of-pond","motostoke-riverbank-west-of-pond-near-top-of-hill","motostoke-riverbank-in-pond","motostoke-riverbank-den-southeast-of-motostoke-riverbank-near-cliff-common","motostoke-riverbank-den-southeast-of-motostoke-riverbank-near-cliff-rare","motostoke-riverbank-den-south-of-motostoke-riverbank-near-path-common","motostoke-riverbank-den-south-of-motostoke-riverbank-near-path-rare","motostoke-riverbank-den-northeast-of-motostoke-riverbank-near-bridge-common","motostoke-riverbank-den-northeast-of-motostoke-riverbank-near-bridge-rare","motostoke-riverbank-den-northwest-of-motostoke-riverbank-near-cliff-common","motostoke-riverbank-den-northwest-of-motostoke-riverbank-near-cliff-rare","north-lake-miloch-complete","north-lake-miloch-by-border-with-giants-seat","north-lake-miloch-just-north-of-top-of-slope-up-from-giants-seat","north-lake-miloch-on-promontory-overlooking-giants-seat","north-lake-miloch-near-den-in-northeast-corner","north-lake-miloch-just-southeast-of-motostoke-river-bridge","north-lake-miloch-in-east-end-of-lake","north-lake-miloch-in-lake-by-shore-south-of-motostoke-river-bridge","north-lake-miloch-in-lake-north-of-south-den","north-lake-miloch-near-west-end-of-lake","north-lake-miloch-den-southeast-coast-of-north-lake-miloch-common","north-lake-miloch-den-southeast-coast-of-north-lake-miloch-rare","north-lake-miloch-den-east-coast-of-north-lake-miloch-common","north-lake-miloch-den-east-coast-of-north-lake-miloch-rare","north-lake-miloch-den-northeast-coast-of-north-lake-miloch-common","north-lake-miloch-den-northeast-coast-of-north-lake-miloch-rare","north-lake-miloch-den-north-coast-of-north-lake-miloch-common","north-lake-miloch-den-north-coast-of-north-lake-miloch-rare","north-lake-miloch-den-southwest-coast-of-north-lake-miloch-common","north-lake-miloch-den-southwest-coast-of-north-lake-miloch-rare","north-lake-miloch-den-west-coast-of-north-lake-miloch-common","north-lake-miloch-den-west-coast-of-north-lake-miloch-rare","old-cemetery-complete","old-cemetery-den-east-common","old-cemetery-den-east-rare","old-cemetery-den-west-common","old-cemetery-den-west-rare","path-to-the-peak-complete","path-to-the-peak-den-uppermost-point-near-tunnel-entrance-common","path-to-the-peak-den-uppermost-point-near-tunnel-entrance-rare","path-to-the-peak-den-midway-up-slope-towards-peak-common","path-to-the-peak-den-midway-up-slope-towards-peak-rare","path-to-the-peak-den-lower-path-close-to-crown-shrine-common","path-to-the-peak-den-lower-path-close-to-crown-shrine-rare","postwick-complete","potbottom-desert-complete","potbottom-desert-north-of-entrance-east-of-small-tree","potbottom-desert-on-east-side-of-hill-northeast-of-entrance","potbottom-desert-northeast-of-den-northeast-of-entrance","potbottom-desert-north-of-entrance-past-small-tree","potbottom-desert-west-of-den-northeast-of-entrance","potbottom-desert-east-of-entrance-past-pair-of-rocks","potbottom-desert-near-top-of-tallest-hill-northeast-of-entrance","potbottom-desert-north-of-tallest-hill","potbottom-desert-west-of-east-den","potbottom-desert-north-of-east-den","potbottom-desert-den-left-of-entrance-from-warm-up-tunnel-common","potbottom-desert-den-left-of-entrance-from-warm-up-tunnel-rare","potbottom-desert-den-northwest-near-medium-sized-sand-dune-common","potbottom-desert-den-northwest-near-medium-sized-sand-dune-rare","potbottom-desert-den-far-northeast-between-boulder-and-tree-common","potbottom-desert-den-far-northeast-between-boulder-and-tree-rare","roaring-sea-caves-complete","rock-peak-ruins-galar-complete","slippery-slope-complete","slippery-slope-den-furthest-east-common","slippery-slope-den-furthest-east-rare","slippery-slope-den-southwest-of-station-common","slippery-slope-den-southwest-of-station-rare","slippery-slope-den-southeast-of-station-common","slippery-slope-den-southeast-of-station-rare","slippery-slope-den-center-area-east-of-lake-common","slippery-slope-den-center-area-east-of-lake-rare","slippery-slope-den-southeast-of-center-lake-common","slippery-slope-den-southeast-of-center-lake-rare","slippery-slope-den-south-between-rocks-common","slippery-slope-den-south-between-rocks-rare","slumbering-weald-south-area","slumbering-weald-north-area","slumbering-weald-complete","slumbering-weald-near-deepest-part-of-forest-just-south-of-smoke-ball","snowslide-slope-complete","snowslide-slope-den-uppermost-slope-near-peak-common","snowslide-slope-den-uppermost-slope-near-peak-rare","snowslide-slope-den-along-eastern-path-towards-tunnel-common","snowslide-slope-den-along-eastern-path-towards-tunnel-rare","snowslide-slope-den-by-tunnel-entrance-near-east-side-common","snowslide-slope-den-midway-up-slope-on-eastern-side-rare","snowslide-slope-den-by-tunnel-entrance-near-east-side-rare","snowslide-slope-den-midway-up-slope-on-eastern-side-common","snowslide-slope-den-near-western-fork-of-slope-close-to-lake-common","snowslide-slope-den-near-western-fork-of-slope-close-to-lake-rare","snowslide-slope-den-west-slope-near-split-common","snowslide-slope-den-west-slope-near-split-rare","snowslide-slope-den-near-lower-western-path-close-to-fork-common","snowslide-slope-den-near-lower-western-path-close-to-fork-rare","snowslide-slope-den-at-slope-entrance-leading-from-giants-bed-common","snowslide-slope-den-southern-exit-near-giants-bed-common","snowslide-slope-den-at-slope-entrance-leading-from-giants-bed-rare","snowslide-slope-den-southern-exit-near-giants-bed-rare","soothing-wetlands-complete","soothing-wetlands-north-northwest-of-fields-of-honor-border","soothing-wetlands-in-southernmost-puddle-northeast-of-fields-of-honor-border","soothing-wetlands-east-of-fields-of-honor-border-near-den","soothing-wetlands-in-puddle-near-brawlers-cave-entrance","soothing-wetlands-southwest-of-brawlers-cave-entrance-in-open-area-near-den","soothing-wetlands-in-great-puddle-with-trunk-in-it-west-of-trunk","soothing-wetlands-in-great-puddle-with-trunk-in-it-east-of-trunk","soothing-wetlands-in-open-area-south-of-great-puddle-with-trunk-in-it","soothing-wetlands-in-puddle-west-of-great-puddle-with-trunk-in-it-near-berry-tree","soothing-wetlands-near-center-in-patch-of-brown-flowers","soothing-wetlands-in-easternmost-puddle-enclosing-tree-and-patch-of-grass-in-south","soothing-wetlands-in-easternmost-puddle-enclosing-tree-and-patch-of-grass-in-north","soothing-wetlands-in-great-puddle-enclosing-single-tree-in-south","soothing-wetlands-in-great-puddle-enclosing-single-tree-in-northwest","soothing-wetlands-in-great-puddle-enclosing-single-tree-in-east","soothing-wetlands-southwest-of-great-puddle-enclosing-single-tree","soothing-wetlands-northwest-of-great-puddle-enclosing-single-tree","soothing-wetlands-east-of-great-puddle-enclosing-single-tree","soothing-wetlands-in-puddle-with-den-in-it","soothing-wetlands-in-open-area-just-south-of-forest-of-focus-border","soothing-wetlands-in-open-area-just-north-of-forest-of-focus-border","soothing-wetlands-den-directly-ahead-and-slightly-left-when-coming-from-fields-of-honor-common","soothing-wetlands-den-directly-ahead-and-slightly-left-when-coming-from-fields-of-honor-rare","soothing-wetlands-den-straight-ahead-from-fields-of-honor-near-big-shallow-pool-with-tall-vegetation-common","soothing-wetlands-den-straight-ahead-from-fields-of-honor-near-big-shallow-pool-with-tall-vegetation-rare","soothing-wetlands-den-past-circular-shallow-pool-with-sunken-log-in-front-of-brawlers-cave-common","soothing-wetlands-den-past-circular-shallow-pool-with-sunken-log-in-front-of-brawlers-cave-rare","soothing-wetlands-den-past-two-trees-and-tall-grass-after-heading-right-from-fields-of-honor-common","soothing-wetlands-den-past-two-trees-and-tall-grass-after-heading-right-from-fields-of-honor-rare","soothing-wetlands-den-next-to-cliff-wall-opposite-entrance-halfway-along-wetlands-near-pile-of-rocks-and-logs-common","soothing-wetlands-den-next-to-cliff-wall-opposite-entrance-halfway-along-wetlands-near-pile-of-rocks-and-logs-rare","soothing-wetlands-den-near-log-past-arc-shaped-pool-towards-forest-of-focus-and-tower-of-waters-common","soothing-wetlands-den-near-log-past-arc-shaped-pool-towards-forest-of-focus-and-tower-of-waters-rare","soothing-wetlands-den-behind-tall-grass-left-of-den-f-near-cliff-wall-common","soothing-wetlands-den-behind-tall-grass-left-of-den-f-near-cliff-wall-rare","soothing-wetlands-den-opposite-forest-of-focus-entrance-inside-shallow-pool-common","soothing-wetlands-den-opposite-forest-of-focus-entrance-inside-shallow-pool-rare","soothing-wetlands-den-riverside-near-forest-of-focus-next-to-tree-and-tall-gras-common","soothing-wetlands-den-riverside-near-forest-of-focus-next-to-tree-and-tall-gras-rare","training-lowlands-complete","training-lowlands-on-beach-shore","training-lowlands-in-big-clearing-near-beach-and-pond","training-lowlands-up-small-river-connected-to-pond","training-lowlands-in-clearing-near-den","training-lowlands-south-of-warm-up-tunnel-entrance","training-lowlands-up-ramp-towards-challenge-road","training-lowlands-den-inside-tall-grass-left-after-turning-right-from-forest-of-focus-entrance-common","training-lowlands-den-inside-tall-grass-left-after-turning-right-from-forest-of-focus-entrance-rare","training-lowlands-den-far-end-of-path-left-of-stairs-to-challenge-road-common","training-lowlands-den-far-end-of-path-left-of-stairs-to-challenge-road-rare","training-lowlands-den-immediately-right-behind-slope-after-turning-left-from-forest-of-focus-entrance-common","training-lowlands-den-immediately-right-behind-slope-after-turning-left-from-forest-of-focus-entrance-rare","training-lowlands-den-ahead-in-front-of-rocky-terrain-after-slope-turn-right-through-tall-grass-common","training-lowlands-den-near-entrance-to-warm-up-tunnel-rare","training-lowlands-den-ahead-in-front-of-rocky-terrain-after-slope-turn-right-through-tall-grass-rare","training-lowlands-den-near-entrance-to-warm-up-tunnel-common","training-lowlands-den-between-rocky-hill-near-shoreline-and-cliff-wall-common","training-lowlands-den-between-rocky-hill-near-shoreline-and-cliff-wall-rare","training-lowlands-den-on-island-in-middle-of-lake-common","training-lowlands-den-on-island-in-middle-of-lake-rare","south-lake-miloch-complete","south-lake-miloch-central-and-northern-patches","south-lake-miloch-southern-patch","south-lake-miloch-north-of-border-with-rolling-hills","south-lake-miloch-east-of-den-nearest-rolling-hills","south-lake-miloch-south-of-northeast-field-of-grass","south-lake-miloch-near-top-of-slope-down-from-rolling-hills","south-lake-miloch-northwest-of-bridge-to-giants-seat","south-lake-miloch-west-of-bridge-to-giants-seat","south-lake-miloch-at-north-end-of-northwest-leg-of-lake","south-lake-miloch-near-neck-of-northwest-leg-of-lake","south-lake-miloch-south-of-neck-of-northwest-leg-of-lake","south-lake-miloch-on-south-side-of-bridge","south-lake-miloch-south-of-east-end-of-bridge","south-lake-miloch-by-giants-seat-fishing-spot-north-of-bridge","south-lake-miloch-den-northwest-coast-of-south-lake-miloch-common","south-lake-miloch-den-northwest-coast-of-south-lake-miloch-rare","south-lake-miloch-den-northeast-coast-of-south-lake-miloch-common","south-lake-miloch-den-northeast-coast-of-south-lake-miloch-rare","south-lake-miloch-den-west-coast-of-south-lake-miloch-common","south-lake-miloch-den-west-coast-of-south-lake-miloch-rare","south-lake-miloch-den-southwest-coast-of-south-lake-miloch-common","south-lake-miloch-den-southwest-coast-of-south-lake-miloch-rare","south-lake-miloch-den-southeast-coast-of-south-lake-miloch-common","south-lake-miloch-den-southeast-coast-of-south-lake-miloch-rare","spikemuth-complete","split-decision-ruins-complete","stepping-stone-sea-complete","stepping-stone-sea-den-halfway-between-tower-of-waters-and-elongated-pair-of-islands-common","stepping-stone-sea-den-halfway-between-tower-of-waters-and-elongated-pair-of-islands-rare","stepping-stone-sea-den-near-tree-through-tall-grass-on-island-with-two-trees-before-elongated-islands-common","stepping-stone-sea-den-near-tree-through-tall-grass-on-island-with-two-trees-before-elongated-islands-rare","stepping-stone-sea-den-on-smaller-shore-right-of-main-shore-of-island-with-archway-common","stepping-stone-sea-den-on-smaller-shore-right-of-main-shore-of-island-with-archway-rare","stepping-stone-sea-den-opposite-far-end-of-challenge-beach-on-courageous-cavern-side-past-circular-islet-common","stepping-stone-sea-den-opposite-far-end-of-challenge-beach-on-courageous-cavern-side-past-circular-islet-rare","stepping-stone-sea-den-between-two-islands-of-exclamation-mark-shaped-island-common","stepping-stone-sea-den-between-two-islands-of-exclamation-mark-shaped-island-rare","stepping-stone-sea-den-first-in-string-of-three-dens-closest-to-tower-of-waters-towards-loop-lagoon-common","stepping-stone-sea-den-first-in-string-of-three-dens-closest-to-tower-of-waters-towards-loop-lagoon-rare","stepping-stone-sea-den-middle-den-in-string-of-three-dens-straight-past-islet-common","stepping-stone-sea-den-middle-den-in-string-of-three-dens-straight-past-islet-rare","stepping-stone-sea-den-last-den-in-string-of-three-dens-straight-past-islet-common","stepping-stone-sea-den-last-den-in-string-of-three-dens-straight-past-islet-rare","stepping-stone-sea-den-tip-nearest-to-tower-of-waters-on-long-sandy-island-right-of-islet-common","stepping-stone-sea-den-tip-nearest-to-tower-of-waters-on-long-sandy-island-right-of-islet-rare","stony-wilderness-complete","stony-wilderness-two-northwestern-patches","stony-wilderness-most-patches","stony-wilderness-brown-patch","stony-wilderness-in-southeast-east-of-group-of-large-rocks","stony-wilderness-in-southeast-on-north-side-of-group-of-large-rocks","stony-wilderness-in-south-north-of-bridge-near-its-center","stony-wilderness-in-southwest-just-north-of-bridge","stony-wilderness-in-northwest-west-of-den","stony-wilderness-in-northwest-south-of-hall-of-leaning-rocks-in-dusty-bowl","stony-wilderness-near-east-wall-north-of-group-of-large-rocks-in-southeast","stony-wilderness-in-northeast-southwest-of-field-of-brown-grass","stony-wilderness-den-east-end-of-stony-wilderness-rare","stony-wilderness-den-southeast-end-of-stony-wilderness-near-cliff-common","stony-wilderness-den-southeast-end-of-stony-wilderness-near-cliff-rare","stony-wilderness-den-southeast-of-stony-wilderness-near-path-common","stony-wilderness-den-southeast-of-stony-wilderness-near-path-rare","stony-wilderness-den-east-of-stony-wilderness-near-cliff-common","stony-wilderness-den-east-of-stony-wilderness-near-cliff-rare","stony-wilderness-den-east-end-of-stony-wilderness-common","stony-wilderness-den-northeast-end-of-stony-wilderness-near-cliff-common","stony-wilderness-den-northeast-end-of-stony-wilderness-near-cliff-rare","stony-wilderness-den-northeast-end-of-stony-wilderness-common","stony-wilderness-den-northeast-end-of-stony-wilderness-rare","stony-wilderness-den-north-end-of-stony-wilderness-near-cliff-common","stony-wilderness-den-north-end-of-stony-wilderness-near-cliff-rare","stony-wilderness-den-south-of-stony-wilderness-near-bridge-common","stony-wilderness-den-south-of-stony-wilderness-near-bridge-rare","stony-wilderness-den-central-area-of-stony-wilderness-common","stony-wilderness-den-central-area-of-stony-wilderness-rare","stony-wilderness-den-north-of-stony-wilderness-near-tree-common","stony-wilderness-den-north-of-stony-wilderness-near-tree-rare","stony-wilderness-den-northwest-end-of-stony-wilderness-common","stony-wilderness-den-northwest-end-of-stony-wilderness-rare","stony-wilderness-den-west-end-of-stony-wilderness-near-bridge-common","stony-wilderness-den-west-end-of-stony-wilderness-near-bridge-rare","stow-on-side-complete","three-point-pass-complete","three-point-pass-between-frigid-sea-and-pillars-of-rock","three-point-pass-in-middle-of-pillars-of-rock","three-point-pass-den-near-frigid-sea-common","three-point-pass-den-near-frigid-sea-rare","three-point-pass-den-near-roaring-sea-caves-common","three-point-pass-den-near-roaring-sea-caves-rare","tower-summit-first-visit","tower-summit-second-visit","tunnel-to-the-top-complete","turffield-complete","warm-up-tunnel-complete","watchtower-ruins-complete","watchtower-ruins-northwest-of-southern-den","watchtower-ruins-west-of-tower","watchtower-ruins-east-of-tower-on-west-lake-axewell-border","watchtower-ruins-den-in-southeast-of-watchtower-ruins-along-cliff-with-lake-axewell-common","watchtower-ruins-den-in-southeast-of-watchtower-ruins-along-cliff-with-lake-axewell-rare","watchtower-ruins-den-in-north-of-watchtower-ruins-on-north-side-of-tower-common","watchtower-ruins-den-in-north-of-watchtower-ruins-on-north-side-of-tower-rare","watchtower-ruins-den-inside-ruined-tower-of-watchtower-ruins-activated-by-dynamax-crystal-and458","watchtower-ruins-den-inside-ruined-tower-of-watchtower-ruins-activated-by-dynamax-crystal-and15","watchtower-ruins-den-inside-ruined-tower-of-watchtower-ruins-activated-by-dynamax-crystal-and337","watchtower-ruins-den-inside-ruined-tower-of-watchtower-ruins-activated-by-dynamax-crystal-and603","watchtower-ruins-den-inside-ruined-tower-of-watchtower-ruins-activated-by-dynamax-crystal-and390","watchtower-ruins-den-inside-ruined-tower-of-watchtower-ruins-activated-by-dynamax-crystal-sgr6879","watchtower-ruins-den-inside-ruined-tower-of-watchtower-ruins-activated-by-dynamax-crystal-sgr6859","watchtower-ruins-den-inside-ruined-tower-of-watchtower-ruins-activated-by-dynamax-crystal-sgr6913","watchtower-ruins-den-inside-ruined-tower-of-watchtower-ruins-activated-by-dynamax-crystal-sgr7348","watchtower-ruins-den-inside-ruined-tower-of-watchtower-ruins-activated-by-dynamax-crystal-sgr7121","watchtower-ruins-den-inside-ruined-tower-of-watchtower-ruins-activated-by-dynamax-crystal-sgr6746","watchtower-ruins-den-inside-ruined-tower-of-watchtower-ruins-activated-by-dynamax-crystal-sgr7194","casseroya-lake-complete","casseroya-lake-snowfield","casseroya-lake-lake","casseroya-lake-riverside","casseroya-lake-ocean","casseroya-lake-rocky-area","casseroya-lake-rocky-beach","casseroya-lake-rocky-ruins","wedgehurst-complete","west-lake-axewell-complete","west-lake-axewell-south-of-bridge","west-lake-axewell-northeast-of-north-end-of-bridge","west-lake-axewell-in-northwest-slightly-down-hill-from-watchtower-ruins","west-lake-axewell-by-bridge","west-lake-axewell-by-northeast-shoreline","west-lake-axewell-east-of-den-on-west-shore","west-lake-axewell-near-southwest-shore","west-lake-axewell-by-southeast-shore","west-lake-axewell-in-center","west-lake-axewell-den-east-of-west-lake-axewell-near-bridge-common","west-lake-axewell-den-east-of-west-lake-axewell-near-bridge-rare","west-lake-axewell-den-west-of-bridge-at-west-lake-axewell-common","west-lake-axewell-den-west-of-bridge-at-west-lake-axewell-rare","west-lake-axewell-den-northeast-of-west-lake-axewell-near-cliff-common","west-lake-axewell-den-northeast-of-west-lake-axewell-near-cliff-rare","west-lake-axewell-den-north-of-west-lake-axewell-near-cliff-wall-common","west-lake-axewell-den-north-of-west-lake-axewell-near-cliff-wall-rare","west-lake-axewell-den-southeast-coast-of-west-lake-axewell-common","west-lake-axewell-den-southeast-coast-of-west-lake-axewell-rare","west-lake-axewell-den-southwest-coast-of-west-lake-axewell-common","west-lake-axewell-den-southwest-coast-of-west-lake-axewell-rare","workout-sea-complete","workout-sea-on-major-island-in-northeast-near-southern-coastline-near-berry-tree","workout-sea-on-major-island-in-northeast-near-western-coastline","workout-sea-on-major-island-in-northeast-near-eastern-coastline-near-den","workout-sea-on-major-island-in-northeast-near-southeastern-coastline","workout-sea-on-island-near-stepping-stone-sea-border-behind-woman","workout-sea-in-ocean-south-of-fields-of-honor-coastline","workout-sea-den-top-half-of-islet-reached-by-swimming-left-from-armor-station-common","workout-sea-den-top-half-of-islet-reached-by-swimming-left-from-armor-station-rare","workout-sea-den-left-of-island-with-three-trees-reached-via-small-circle-shaped-islet-common","workout-sea-den-left-of-island-with-three-trees-reached-via-small-circle-shaped-islet-rare","workout-sea-den-near-centre-of-island-with-three-trees-past-tall-grass-common","workout-sea-den-near-centre-of-island-with-three-trees-past-tall-grass-rare","workout-sea-den-near-islet-with-boulder-straight-ahead-from-armor-station-common","workout-sea-den-near-islet-with-boulder-straight-ahead-from-armor-station-rare","workout-sea-den-near-two-rocky-islands-between-islet-with-boulder-common","workout-sea-den-near-two-rocky-islands-between-islet-with-boulder-rare","workout-sea-den-behind-rocky-island-on-mainland-side-near-closest-rocky-island-common","workout-sea-den-behind-rocky-island-on-mainland-side-near-closest-rocky-island-rare","workout-sea-den-near-centre-of-island-with-archway-common","workout-sea-den-near-centre-of-island-with-archway-rare","wyndon-complete","alfornada-cavern-complete","area-zero-upper-field-prairie","area-zero-upper-field-riverside","area-zero-upper-field-rocky-area","area-zero-lower-field-prairie","area-zero-lower-field-riverside","area-zero-lower-field-rocky-area","area-zero-small-cave-prairie","area-zero-small-cave-cave","area-zero-station-no-3-cave-prairie","area-zero-station-no-3-cave-riverside","area-zero-station-no-3-cave-cave","area-zero-waterfall-cave-prairie","area-zero-waterfall-cave-cave","area-zero-grassy-cave-prairie","area-zero-grassy-cave-riverside","area-zero-grassy-cave-cave","area-zero-ruins","area-zero-depths","area-zero-outside-research-station-no-1","area-zero-outside-research-station-no-2","area-zero-outside-research-station-no-3","area-zero-outside-zero-lab","area-zero-underdepths-complete","asado-desert-prairie","asado-desert-desert","asado-desert-riverside","asado-desert-rocky-area","asado-desert-flower","asado-desert-ruins","asado-desert-complete","cabo-poco-complete","cascarrafa-complete","colonnade-hollow-complete","cortondo-complete","dalizapa-passage-northern-passage-rocky-area","dalizapa-passage-northern-passage-mountain","dalizapa-passage-northern-passage-cave","dalizapa-passage-western-passage-prairie","dalizapa-passage-western-passage-town","dalizapa-passage-complete","east-paldean-sea-beach","east-paldean-sea-ocean","east-paldean-sea-flower","east-province-area-one-prairie","east-province-area-one-forest","east-province-area-one-town","east-province-area-one-mountain","east-province-area-one-riverside","east-province-area-one-ocean","east-province-area-one-rocky-area","east-province-area-one-beach","east-province-area-one-complete","east-province-area-three-prairie","east-province-area-three-town","east-province-area-three-lake","east-province-area-three-riverside","east-province-area-three-ocean","east-province-area-three-cave","east-province-area-three-mine","east-province-area-three-complete","east-province-area-two-prairie","east-province-area-two-forest","east-province-area-two-town","east-province-area-two-riverside","east-province-area-two-ocean","east-province-area-two-rocky-area","east-province-area-two-beach","east-province-area-two-ruins","east-province-area-two-complete","glaseado-mountain-southern-mountain-mountain","glaseado-mountain-southern-mountain-snowfield","glaseado-mountain-southern-mountain-rocky-area","glaseado-mountain-southern-mountain-ruins","glaseado-mountain-northern-mountain-town","glaseado-mountain-northern-mountain-mountain","glaseado-mountain-northern-mountain-snowfield","glaseado-mountain-northern-mountain-lake","glaseado-mountain-northern-mountain-riverside","glaseado-mountain-northern-mountain-ocean","glaseado-mountain-northern-mountain-rocky-area","glaseado-mountain-northern-mountain-cave","glaseado-mountain-northern-mountain-flower","glaseado-mountain-northern-mountain-ruins","glaseado-mountain-complete","inlet-grotto-cave","levincia-complete","naranja-academy-complete","north-paldean-sea-ocean","north-paldean-sea-complete","north-province-area-one-mountain","north-province-area-one-snowfield","north-province-area-one-lake","north-province-area-one-riverside","north-province-area-one-ocean","north-province-area-one-rocky-area","north-province-area-one-cave","north-province-area-one-beach","north-province-area-one-flower","north-province-area-one-ruins","north-province-area-one-complete","north-province-area-one-bamboo-forest","north-province-area-three-prairie","north-province-area-three-snowfield","north-province-area-three-riverside","north-province-area-three-ocean","north-province-area-three-rocky-area","north-province-area-three-cave","north-province-area-three-beach","north-province-area-three-flower","north-province-area-three-complete","north-province-area-two-lake","north-province-area-two-rocky-area","north-province-area-two-cave","north-province-area-two-flower","north-province-area-two-complete","south-province-area-five-lake","south-province-area-five-prairie","south-province-area-five-mountain","south-province-area-five-swamp","south-province-area-five-riverside","south-province-area-five-ocean","south-province-area-five-rocky-area","south-province-area-five-beach","south-province-area-five-flower","south-province-area-five-ruins","south-province-area-five-complete","poco-path-prairie","poco-path-ocean","poco-path-beach","poco-path-complete","pokemon-league-paldea-town","pokemon-league-paldea-flower","pokemon-league-paldea-complete","socarrat-trail-forest","socarrat-trail-complete","south-paldean-sea-ocean","south-province-area-four-prairie","south-province-area-four-forest","south-province-area-four-mountain","south-province-area-four-lake","south-province-area-four-riverside","south-province-area-four-ocean","south-province-area-four-rocky-area","south-province-area-four-flower","south-province-area-four-ruins","south-province-area-four-complete","south-province-area-one-prairie","south-province-area-one-forest","south-province-area-one-town","south-province-area-one-lake","south-province-area-one-riverside","south-province-area-one-ocean","south-province-area-one-beach","south-province-area-one-flower","south-province-area-one-ruins","south-province-area-one-complete","south-province-area-six-town","south-province-area-six-mountain","south-province-area-six-lake","south-province-area-six-riverside","south-province-area-six-ocean","south-province-area-six-rocky-area","south-province-area-six-cave","south-province-area-six-flower","south-province-area-six-ruins","south-province-area-six-complete","south-province-area-three-prairie","south-province-area-three-town","south-province-area-three-rocky-area","south-province-area-three-ruins","south-province-area-three-complete","south-province-area-two-prairie","south-province-area-two-forest","south-province-area-two-town","south-province-area-two-mountain","south-province-area-two-riverside","south-province-area-two-rocky-area","south-province-area-two-flower","south-province-area-two-olive-orchard","south-province-area-two-ruins","south-province-area-two-complete","tagtree-thicket-forest","tagtree-thicket-lake","tagtree-thicket-riverside","tagtree-thicket-rocky-area","tagtree-thicket-flower","tagtree-thicket-complete","uva-academy-complete","west-paldean-sea-ocean","west-province-area-one-mountain","west-province-area-one-riverside","west-province-area-one-ocean","west-province-area-one-rocky-area","west-province-area-one-cave","west-province-area-one-beach","west-province-area-one-flower","west-province-area-one-ruins","west-province-area-one-complete","west-province-area-three-prairie","west-province-area-three-forest","west-province-area-three-town","west-province-area-three-lake","west-province-area-three-riverside","west-province-area-three-rocky-area","west-province-area-three-ruins","west-province-area-three-complete","west-province-area-two-prairie","west-province-area-two-town","west-province-area-two-riverside","west-province-area-two-ocean","west-province-area-two-rocky-area","west-province-area-two-beach","west-province-area-two-cave","west-province-area-two-complete","zero-lab-complete","fighting-dojo-complete","oreburgh-mining-museum-complete","firescourge-shrine-complete","flower-paradise-complete","grasswither-shrine-complete","great-crater-of-paldea-complete","groundblight-shrine-complete","icerend-shrine-complete","newmoon-island-complete","ramanas-park-kanto-room","ramanas-park-johto-room","ramanas-park-genome-room","ramanas-park-squall-room","ramanas-park-rainbow-room","ramanas-park-discovery-room","ramanas-park-soul-room","ramanas-park-oceanic-room","ramanas-park-tectonic-room","ramanas-park-stratospheric-room","ramanas-park-distortion-room","spear-pillar-complete","random-around-paldea-complete"],"regions":["hisui","sinnoh","kanto","galar","paldea"]},"locations":["aipom-hill","ancient-quarry","arenas-approach","aspiration-hill","avalanche-slopes","avaluggs-lagacy","bathers-lagoon","bolderoll-ravine","bolderoll-slope","bonechill-wastes","celestica-trail","castaway-shore","celestica-ruins","clamberclaw-cliffs","cottonsedge-prairie","cloudcap-pass","cloudpool-ridge","brava-arena","crevasse-passage","crossing-slope","deadwood-haunt","deertrack-heights","deertrack-path","diamond-heath","diamond-settlement","droning-meadow","fabled-spring","firespit-island","floaro-gardens","gapejaw-bog","ginkgo-landing","glacier-terrace","golden-lowlands","grandtree-arena","grueling-grove","hearts-crag","holm-of-trials","heavenward-lookout","hideaway-bay","horseshoe-plains","ice-column-chamber","icebound-falls","lunkers-lair","icepeak-cavern","islespy-shore","lake-acuity-hisui","lake-valor-hisui","natures-pantry","lake-valor-sinnoh","lake-verity-hisui","lonely-spring","obsidian-falls","ramanas-island","oreburrow-tunnel","pearl-settlement","primeval-grotto","sacred-plaza","sands-reach","sandgem-flats","scarlet-bog","seagrass-haven","seaside-hollow","secret-hollow","shrouded-ruins","sludge-mound","snowfall-hot-spring","the-heartwood","snowpoint-temple","solaceon-ruins-hisui","sonorous-path","spring-path-hisui","stonetooth-rows","tidewater-dam","tombolo-walk","tranquility-cove","ursas-ring","veilstone-cape","wayward-cave","wayward-wood","whiteout-valley","windbreak-stand","windswept-run","worn-bridge","jubilife-village","lava-dome-sanctum","moonview-arena","temple-of-sinnoh","route-01-kanto","hall-of-origin","route-02-kanto","route-03-kanto","route-04-kanto","route-05-kanto","route-06-kanto","route-07-kanto","route-08-kanto","route-09-kanto","route-10-kanto","route-11-kanto","route-12-kanto","route-13-kanto","route-14-kanto","route-15-kanto","route-16-kanto","route-17-kanto","route-18-kanto","route-19-kanto","route-20-kanto","route-21-kanto","route-22-kanto","route-23-kanto","route-24-kanto","route-25-kanto","cerulean-city","vermilion-city","lavender-town","celadon-city","saffron-city","fuchsia-city","cinnabar-island","indigo-plateau","professor-oaks-laboratory","viridian-forest","digletts-cave","mt-moon","cerulean-cave","rock-tunnel","power-plant","silph-co","pokemon-tower","seafoam-islands","pokemon-mansion-kanto","cinnabar-lab","victory-road-kanto","acuity-lakefront","big-bluff-cavern","bogsunk-cavern","canalave-city","celestic-town","dazzling-cave","eterna-city","eterna-condominiums","eterna-forest","floaroma-town","fountainspring-cave","grassland-cave","fuego-ironworks","glacial-cavern","great-marsh","hearthome-city","icy-cave","iron-island","lake-acuity-sinnoh","lake-verity-sinnoh","lost-tower","maniac-tunnel","mount-coronet","old-chateau","oreburgh-city","oreburgh-gate","oreburgh-mine","pastoria-city","pokemon-league-sinnoh","ravaged-path","resort-area","riverbank-cave","rocky-cave","sandsear-cave","sendoff-spring","route-201-sinnoh","route-202-sinnoh","route-203-sinnoh","route-204-sinnoh","route-205-sinnoh","route-206-sinnoh","route-207-sinnoh","route-208-sinnoh","route-209-sinnoh","route-210-sinnoh","route-211-sinnoh","route-212-sinnoh","route-213-sinnoh","route-214-sinnoh","route-215-sinnoh","route-216-sinnoh","route-217-sinnoh","route-218-sinnoh","route-219-sinnoh","route-220-sinnoh","route-221-sinnoh","route-222-sinnoh","route-223-sinnoh","route-224-sinnoh","route-225-sinnoh","route-226-sinnoh","route-227-sinnoh","route-228-sinnoh","route-229-sinnoh","route-230-sinnoh","snowpoint-city","solaceon-ruins-sinnoh","spacious-cave","stargleam-cavern","stark-mountain","still-water-cavern","sunlit-cavern","swampy-cave","sunyshore-city","trophy-garden","turnback-cave","twinleaf-town","typhlo-cavern","valley-windworks","valor-lakefront","victory-road-sinnoh","volcanic-cave","whiteout-cave","axews-eye","ballimere-lake","battle-tower-galar","brawlers-cave","bridge-field","challenge-beach","challenge-road","circhester","dappled-grove","courageous-cavern","crown-shrine","dusty-bowl","dyna-tree-hill","east-lake-axewell","fields-of-honor","forest-of-focus","freezington","frigid-sea","frostpoint-field","galar-mine","galar-mine-no-2","galar-route-01","galar-route-10","galar-route-02","galar-route-03","galar-route-04","galar-route-05","galar-route-06","galar-route-07","galar-route-08","galar-route-09","giants-bed","giants-cap","giants-mirror","giants-foot","giants-seat","glimwood-tangle","hammerlocke","hammerlocke-hills","honeycalm-island","honeycalm-sea","hulbury","iceberg-ruins-galar","insular-sea","iron-ruins-galar","lake-of-outrage","rolling-fields","lakeside-cave","loop-lagoon","master-dojo","max-lair","meetup-spot","motostoke","motostoke-outskirts","motostoke-riverbank","north-lake-miloch","old-cemetery","path-to-the-peak","postwick","potbottom-desert","roaring-sea-caves","rock-peak-ruins-galar","slippery-slope","slumbering-weald","snowslide-slope","soothing-wetlands","training-lowlands","south-lake-miloch","spikemuth","split-decision-ruins","stepping-stone-sea","stony-wilderness","stow-on-side","three-point-pass","tower-summit","tunnel-to-the-top","turffield","warm-up-tunnel","watchtower-ruins","casseroya-lake","wedgehurst","west-lake-axewell","workout-sea","wyndon","alfornada-cavern","area-zero","area-zero-underdepths","asado-desert","cabo-poco","cascarrafa","colonnade-hollow","cortondo","dalizapa-passage","east-paldean-sea","east-province-area-one","east-province-area-three","east-province-area-two","glaseado-mountain","inlet-grotto","levincia","naranja-academy","north-paldean-sea","north-province-area-one","north-province-area-three","north-province-area-two","south-province-area-five","poco-path","pokemon-league-paldea","socarrat-trail","south-paldean-sea","south-province-area-four","south-province-area-one","south-province-area-six","south-province-area-three","south-province-area-two","tagtree-thicket","uva-academy","west-paldean-sea","west-province-area-one","west-province-area-three","west-province-area-two","zero-lab","fighting-dojo","oreburgh-mining-museum","firescourge-shrine","flower-paradise","grasswither-shrine","great-crater-of-paldea","groundblight-shrine","icerend-shrine","newmoon-island","ramanas-park","spear-pillar","random-around-paldea"],"locationRegions":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,2,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,2,1,4,1,4,4,4,4,1,1,1,4],"offsets":[0,18,60,101,112,162,198,226,255,268,312,353,377,415,434,476,490,514,516,518,547,580,598,607,618,629,669,684,700,713,768,799,841,867,872,883,913,947,965,983,1017,1022,1043,1053,1060,1083,1107,1122,1153,1169,1183,1192,1209,1230,1242,1256,1274,1316,1332,1365,1386,1403,1407,1408,1427,1437,1450,1472,1512,1540,1551,1577,1602,1623,1635,1661,1680,1698,1713,1727,1734,1757,1787,1796,1799,1800,1801,1805,1817,1819,1847,1862,1882,1893,1913,1933,1953,1969,1991,2011,2034,2057,2077,2097,2113,2132,2152,2166,2174,2199,2213,2234,2255,2275,2277,2281,2282,2284,2286,2287,2289,2290,2294,2307,2311,2330,2371,2391,2403,2405,2427,2478,2514,2520,2550,2559,2592,2636,2646,2655,2710,2717,2718,2731,2733,2783,2867,2888,2923,3015,3017,3050,3084,3100,3117,3162,3168,3292,3294,3295,3309,3315,3324,3332,3352,3358,3440,3473,3499,3511,3518,3525,3541,3563,3592,3603,3611,3628,3650,3681,3701,3730,3746,3765,3776,3787,3797,3814,3824,3835,3859,3881,3891,3911,3931,3955,3976,3995,4019,4043,4044,4072,4143,4198,4230,4312,4396,4440,4449,4472,4485,4492,4516,4533,4546,4589,4611,4651,4734,5354,5355,5408,5759,6057,6247,6249,6444,6620,6659,7013,7038,7267,7571,7846,7850,8292,8480,8498,8528,8542,8589,8637,8661,8691,8723,8759,8796,8846,8916,9702,9963,10376,10580,10792,10829,10830,10890,11006,11176,11183,11184,11348,11349,11603,11979,11995,12169,12173,12447,12449,12453,12473,12677,12942,13036,13135,13139,13268,13294,13295,13556,13595,13970,14311,14604,14862,14863,14865,15119,15593,15595,15683,15689,15716,15717,15723,15837,15931,15932,16165,16382,16383,16403,16579,16585,16649,16653,16654,16670,16671,16767,16807,16910,17019,17115,17351,17354,17355,17356,17380,17513,17585,17633,17775,17788,17795,17820,17832,17938,17982,18102,18147,18201,18270,18271,18296,18383,18497,18597,18599,18601,18608,18609,18610,18611,18614,18615,18616,18617,18635,18637,19083],"rows":{"pokemon":[0,1,2,3,4,5,6,0,7,8,2,9,10,11,12,13,0,5,14,15,9,10,16,17,18,19,20,21,22,23,24,6,15,25,26,10,18,20,21,22,23,27,28,29,30,31,32,33,34,35,5,36,37,38,39,40,41,42,43,44,45,46,47,0,48,49,50,51,52,31,5,53,54,55,56,50,7,8,57,58,55,45,46,55,59,60,61,62,47,28,63,64,65,66,67,68,69,70,71,72,58,73,74,75,76,77,11,76,11,73,74,77,78,79,28,0,80,49,50,81,52,31,57,58,5,82,83,84,85,86,55,87,7,8,57,58,83,55,78,79,80,5,82,83,84,88,59,60,61,62,47,28,63,64,65,66,67,68,69,70,71,72,89,90,28,0,0,91,49,50,50,58,75,92,5,11,12,53,54,86,55,93,91,88,94,7,8,55,95,28,0,75,92,95,96,97,93,98,99,100,101,1,76,102,3,4,11,12,100,103,104,102,12,105,7,8,9,10,106,107,11,12,13,101,3,4,45,46,9,10,89,90,108,109,110,10,9,10,27,28,29,30,31,32,33,34,35,5,36,37,38,39,40,41,42,14,15,9,10,111,112,25,9,10,9,10,111,113,89,90,0,49,50,57,58,11,12,114,115,53,54,86,55,49,58,54,7,8,57,58,55,89,90,49,50,59,60,61,62,47,28,63,64,65,66,67,68,69,70,71,72,116,111,117,111,113,91,118,16,17,119,120,121,122,25,26,10,123,117,113,123,91,16,17,119,120,27,28,29,30,31,32,33,34,35,5,36,37,38,39,40,41,42,45,46,1,124,30,1,76,102,11,12,125,7,8,9,10,107,11,12,13,45,46,30,124,36,9,10,89,90,126,80,48,127,18,19,48,25,26,128,129,130,126,18,19,128,27,28,29,30,31,32,33,34,35,5,36,37,38,39,40,41,42,131,9,10,89,90,48,18,19,83,19,84,122,25,26,18,83,48,83,84,132,15,133,134,89,90,135,101,136,137,2,138,139,140,138,141,141,112,25,2,138,139,9,10,79,101,82,28,142,143,144,145,146,147,148,149,150,151,152,4,12,115,153,45,46,47,48,51,151,152,68,25,26,10,127,47,51,14,15,133,134,126,1,136,154,155,2,128,156,105,141,25,9,10,126,1,136,154,155,2,128,157,157,55,55,135,28,1,158,159,76,102,6,11,12,7,8,9,10,135,67,160,161,162,163,113,164,28,165,142,17,141,122,166,52,31,38,76,102,125,11,12,167,7,8,9,10,107,107,52,31,102,167,160,161,162,163,113,164,28,165,142,17,141,122,166,168,14,15,9,169,170,171,76,102,77,169,14,15,76,102,172,9,169,155,14,154,173,76,11,172,9,76,154,14,15,133,134,111,111,141,25,9,10,128,14,15,78,154,155,117,141,25,78,154,174,133,134,89,90,175,176,177,178,179,75,92,2,138,180,25,2,138,139,9,10,181,182,178,179,28,142,143,144,145,146,147,148,149,150,151,152,4,12,115,153,183,184,136,137,185,122,25,26,10,95,183,184,136,137,186,10,27,187,188,6,7,8,10,106,11,12,95,27,187,95,189,73,74,190,191,77,11,151,103,104,192,190,191,193,99,9,10,89,90,135,194,136,75,92,137,119,20,177,139,120,67,89,90,175,141,25,26,139,109,110,9,10,181,182,135,175,181,182,139,119,20,67,180,28,142,143,144,145,146,147,148,149,150,151,152,4,12,115,153,45,46,1,195,3,4,11,124,46,66,36,7,8,9,10,11,12,13,160,161,162,163,113,164,28,165,142,17,141,122,166,0,80,48,91,169,75,92,11,12,158,159,53,54,96,97,55,7,8,57,58,48,169,11,12,53,54,59,60,61,62,47,28,63,64,65,66,67,68,69,70,71,72,59,133,134,99,89,90,73,154,155,137,60,141,25,26,139,9,10,133,134,99,100,176,177,137,141,196,62,62,2,62,197,2,149,103,104,6,172,192,103,104,198,138,0,194,199,11,12,5,200,94,7,8,57,58,95,59,60,61,62,47,28,63,64,65,66,67,68,69,70,71,72,201,21,99,100,89,90,20,140,22,202,21,23,141,25,139,9,10,21,140,28,142,143,144,145,146,147,148,149,150,151,152,4,12,115,153,14,15,133,134,151,152,14,15,175,180,25,26,10,14,15,175,180,152,79,0,1,195,65,82,5,7,8,10,106,107,11,12,106,195,65,66,203,28,74,190,191,76,75,3,11,204,61,76,11,203,61,79,28,3,4,82,90,205,117,78,28,121,206,177,21,207,85,208,39,203,80,55,86,55,209,45,46,47,0,51,52,31,5,210,211,47,211,212,7,8,57,58,52,31,210,213,214,214,7,8,215,214,106,11,12,215,89,90,80,96,97,55,55,1,30,65,66,106,216,7,8,10,215,214,106,30,11,12,95,217,218,11,12,162,163,122,219,160,118,220,18,19,118,94,221,7,8,18,95,194,199,200,118,220,18,19,94,221,97,222,15,10,89,90,117,2,138,182,141,25,10,181,182,223,224,59,14,15,133,73,154,155,134,14,15,76,102,125,172,9,59,133,134,90,205,117,78,28,121,206,177,21,207,85,208,39,224,99,225,102,102,92,220,99,100,123,226,123,227,228,78,229,151,152,12,228,125,12,230,192,123,228,228,125,152,231,99,100,141,141,109,110,18,79,82,14,45,46,9,79,82,10,81,14,15,76,102,228,172,123,14,232,0,170,171,233,234,11,12,235,76,102,11,12,2,10,106,106,170,171,233,234,236,14,15,45,77,151,2,82,15,123,2,9,10,0,91,57,58,86,94,7,8,57,58,95,91,57,58,62,48,91,127,18,19,237,238,109,110,127,18,228,62,228,127,118,220,9,10,89,90,129,111,113,80,118,77,151,152,220,130,152,166,25,26,10,127,129,130,129,80,130,27,28,29,30,31,32,33,34,35,5,36,37,38,39,40,41,42,228,76,102,11,12,7,8,9,10,228,106,107,11,12,239,240,219,160,164,151,152,233,234,12,204,161,144,102,12,192,10,160,164,102,151,204,90,205,117,78,28,121,206,177,21,207,85,208,39,9,10,89,90,117,16,17,119,120,20,17,25,139,9,10,182,16,17,120,241,242,243,244,244,245,7,8,215,214,106,11,12,246,245,243,244,246,245,30,247,248,247,55,89,90,78,111,194,199,249,249,85,141,25,9,10,89,90,78,85,250,249,9,10,89,90,119,20,9,10,251,252,45,46,78,144,0,114,115,173,210,211,55,173,253,104,14,15,99,62,74,190,191,2,114,115,103,2,109,110,9,15,99,100,2,109,114,10,194,199,58,18,19,86,254,14,15,255,15,10,117,121,206,15,10,117,121,206,15,10,117,121,206,15,10,117,121,206,15,10,121,206,15,10,121,206,255,174,189,131,196,198,43,232,256,231,44,250,257,251,239,209,186,258,259,260,98,201,241,261,197,213,168,262,253,176,177,77,151,152,149,18,176,177,77,151,100,217,218,92,21,6,1,125,6,7,8,10,160,161,162,163,113,164,28,165,142,17,141,122,166,258,80,18,19,130,263,25,26,10,27,28,29,30,31,32,33,34,35,5,36,37,38,39,40,41,42,14,15,76,102,75,92,154,155,92,155,14,15,76,102,172,9,75,92,206,207,260,79,82,79,7,8,10,106,107,11,12,79,82,101,112,102,125,243,11,12,264,76,102,11,12,7,8,9,10,106,107,264,11,12,13,95,264,125,13,133,134,9,10,89,90,176,75,92,177,175,25,139,9,10,181,182,22,23,265,266,1,158,159,103,104,6,1,7,8,9,10,265,266,158,159,259,181,182,83,212,14,15,83,257,14,9,18,14,9,18,83,14,15,133,134,99,100,149,169,6,6,15,149,18,149,0,57,55,7,8,55,267,59,133,134,266,1,169,7,8,9,10,160,161,162,163,113,164,28,165,142,17,141,122,166,14,15,219,154,155,3,11,102,14,15,76,102,172,9,219,155,90,205,117,78,28,121,206,177,21,207,85,208,39,170,14,9,3,4,76,11,172,9,123,256,261,262,268,269,270,271,272,273,274,275,276,274,277,278,279,280,281,282,283,284,285,285,286,287,274,277,278,279,274,275,276,280,281,282,283,284,286,287,274,277,278,279,274,275,276,280,281,282,283,284,277,277,288,288,289,290,291,292,288,293,280,281,282,283,284,277,277,288,288,289,290,99,291,292,215,214,123,288,293,280,281,282,283,284,123,274,275,277,265,294,295,219,79,274,275,276,274,275,277,265,294,99,295,219,79,226,227,123,274,275,276,280,281,282,283,284,274,275,277,296,265,188,294,295,297,219,160,143,274,275,276,280,281,282,283,284,274,275,277,296,265,188,294,295,297,219,160,79,274,275,276,280,281,282,283,284,277,296,288,293,298,299,300,301,79,288,293,280,281,282,283,284,277,296,288,293,298,299,300,301,302,79,215,214,123,303,304,288,293,280,281,282,283,284,274,275,277,296,305,164,79,215,214,306,307,123,274,275,276,280,281,282,283,284,274,275,278,308,279,309,310,302,311,79,215,214,306,307,123,274,275,276,280,281,282,283,284,274,275,278,308,279,309,310,302,311,79,215,214,306,307,123,274,275,276,280,281,282,283,284,274,275,278,308,312,313,279,309,62,314,315,79,274,275,276,280,281,282,283,284,274,275,278,308,312,313,279,309,62,314,315,79,274,275,276,280,281,282,283,284,274,275,277,296,316,317,79,274,275,276,280,281,282,283,284,144,274,275,277,296,99,203,61,316,317,28,79,274,275,276,280,281,282,283,284,274,275,277,296,316,317,79,215,214,318,319,123,274,275,276,280,281,282,283,284,215,214,318,319,123,320,274,275,276,280,281,282,283,284,215,214,123,228,320,274,275,276,274,275,277,296,278,308,321,279,309,322,135,79,215,214,318,319,123,274,275,276,280,281,282,283,284,277,288,298,300,323,324,123,288,293,280,281,282,283,284,288,293,298,299,325,300,301,326,327,328,79,323,324,123,288,293,280,281,282,283,284,274,274,278,312,312,329,99,279,330,215,214,123,274,275,276,280,281,282,283,284,292,274,274,278,312,312,329,99,279,330,323,324,123,274,275,276,280,281,282,283,284,331,332,330,333,297,334,335,336,267,143,337,338,339,340,341,342,343,342,343,286,286,344,345,287,287,346,347,274,59,278,279,331,14,348,349,79,183,14,133,9,117,79,183,14,133,9,117,79,183,185,14,133,9,117,79,14,15,99,100,9,10,78,111,113,350,144,323,324,351,123,14,15,9,10,78,111,113,79,350,144,14,15,99,100,9,10,78,111,113,350,144,323,324,351,123,352,14,15,45,9,10,117,353,111,354,292,14,15,45,9,10,117,353,111,354,292,162,163,355,356,357,358,359,360,47,79,282,358,320,320,14,15,89,90,353,14,15,89,90,353,14,15,89,90,353,79,14,15,89,90,353,79,14,15,361,362,363,71,364,330,14,15,361,362,363,71,364,330,14,15,361,362,363,71,364,330,14,15,361,362,363,71,364,330,215,214,365,366,123,14,15,361,362,363,71,364,330,215,214,365,366,123,281,277,296,355,356,359,360,27,350,277,296,355,356,359,360,27,350,277,296,355,356,359,360,27,350,277,296,355,356,359,360,27,350,79,79,79,79,367,368,369,367,368,369,14,15,45,46,9,10,117,111,113,79,14,15,45,46,9,10,117,111,113,370,14,15,45,46,9,10,117,111,113,371,14,46,46,225,206,372,373,53,57,9,117,124,18,10,119,290,374,353,111,113,315,375,376,48,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,62,314,392,14,136,124,20,15,181,393,394,215,214,182,331,286,287,289,299,299,299,301,278,308,133,312,313,279,309,355,360,135,395,396,397,398,388,389,399,400,401,67,78,78,48,49,49,215,214,402,403,123,123,246,318,228,245,99,100,123,123,181,228,182,404,405,89,80,372,220,18,160,406,164,299,299,299,301,361,355,305,302,357,353,350,101,407,229,408,409,410,51,411,412,194,199,413,414,415,416,399,400,417,418,390,419,52,31,392,420,421,101,409,409,410,51,194,194,52,52,392,99,100,123,123,181,228,182,167,1,80,74,74,190,103,191,104,137,137,114,422,423,424,425,99,75,3,243,244,426,181,92,393,394,402,215,214,403,83,30,182,84,13,330,323,324,361,310,363,427,365,306,318,315,303,428,395,429,430,398,431,432,433,434,435,436,404,405,437,217,78,101,194,438,190,14,45,1,74,191,136,75,154,77,137,2,109,114,15,426,92,16,17,46,159,173,151,158,331,286,287,277,296,289,299,299,299,301,278,308,133,312,313,291,439,323,324,279,309,361,310,316,62,314,315,440,395,396,441,442,443,444,445,397,377,176,446,447,448,433,434,449,450,423,415,416,387,388,389,399,400,451,401,392,178,62,314,392,402,77,151,139,4,233,234,215,214,402,403,123,123,246,365,228,245,162,443,444,382,114,18,164,206,53,162,363,427,318,315,429,430,176,49,452,410,411,412,382,383,438,57,58,195,65,66,391,162,176,49,410,51,438,57,58,76,99,453,393,394,123,123,228,181,228,436,182,99,426,225,453,393,394,454,75,92,137,99,426,225,453,393,394,454,76,75,92,137,99,426,453,393,394,454,76,75,92,137,99,426,453,393,394,454,76,75,92,137,426,453,393,394,454,76,75,92,137,99,426,453,393,394,454,76,75,92,137,100,136,102,124,20,141,453,393,394,454,75,92,133,327,354,175,455,456,36,21,28,82,114,18,164,206,53,162,363,427,318,315,429,430,176,49,452,410,411,412,382,383,438,57,58,195,65,66,391,162,49,410,438,57,58,215,214,402,403,123,123,246,228,398,245,14,15,9,10,117,15,9,10,117,15,9,10,117,15,9,10,117,121,210,15,9,10,117,121,99,99,225,206,92,220,99,100,123,226,123,227,228,410,229,222,76,75,99,100,123,226,123,227,228,435,178,170,217,229,76,24,457,14,14,14,89,89,89,1,80,14,14,14,89,89,89,1,80,14,14,14,15,89,89,89,1,80,14,14,14,15,15,89,89,89,1,80,14,14,15,15,15,89,89,89,1,80,9,119,9,119,9,119,14,14,45,9,9,184,372,220,14,15,123,123,181,228,182,14,14,45,9,9,184,372,220,183,15,46,10,372,220,14,15,123,123,181,228,182,458,458,458,183,15,46,10,372,220,183,15,46,10,373,220,18,19,183,15,46,10,373,220,18,19,183,15,46,10,373,220,19,14,15,123,123,181,228,303,304,183,15,46,10,373,220,19,183,15,46,10,373,118,220,19,183,15,46,10,373,118,19,183,15,46,10,373,118,19,183,15,46,10,373,220,19,183,15,46,46,225,373,373,220,19,53,54,459,89,130,219,14,9,14,99,9,14,15,99,100,123,123,181,228,182,14,9,117,14,9,117,215,214,402,403,123,123,107,228,30,214,403,123,123,107,228,30,460,14,14,14,99,9,14,15,99,100,123,123,123,123,123,181,181,228,228,182,182,100,123,226,123,227,228,99,1,74,190,191,75,154,137,3,114,20,426,181,92,16,17,402,159,173,215,214,403,158,83,30,182,84,13,331,330,286,287,277,296,289,299,299,299,301,278,308,312,313,323,324,279,309,361,365,353,306,318,62,314,315,440,428,395,398,377,431,446,448,432,433,434,449,450,435,423,436,417,418,404,405,451,437,178,217,78,62,314,9,117,124,18,10,119,290,374,353,111,113,315,375,376,48,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,111,48,176,117,124,203,119,292,290,374,265,295,111,113,145,461,462,409,187,463,384,385,464,170,111,111,409,409,187,100,225,118,102,102,92,100,123,226,123,227,228,76,75,316,299,299,299,299,76,75,154,154,77,381,375,14,219,76,75,154,77,99,100,123,226,123,227,228,353,194,199,14,76,75,154,77,137,99,100,123,226,123,227,228,194,199,14,76,75,154,77,137,445,75,139,3,233,215,214,402,403,123,123,246,365,228,245,443,75,139,3,233,99,100,123,123,181,228,182,361,443,444,14,9,9,203,154,155,155,16,18,127,390,14,45,45,9,154,378,169,379,14,99,45,45,372,372,75,92,99,100,123,123,181,228,182,465,446,14,89,79,76,102,102,92,128,204,99,100,123,226,123,227,228,408,315,315,447,447,249,9,203,79,155,155,128,128,204,204,315,315,447,447,99,45,45,46,426,225,372,372,92,99,100,123,123,181,228,182,451,420,14,9,203,426,372,372,75,75,220,446,14,46,46,10,203,203,225,372,220,438,136,76,102,102,155,137,99,100,123,226,123,227,228,466,393,136,136,92,92,155,155,393,394,123,123,181,228,182,355,402,3,4,243,215,214,402,403,123,123,107,228,30,467,392,468,9,10,10,203,126,406,155,155,16,99,100,123,226,123,227,228,469,409,412,219,160,9,9,203,203,155,155,305,409,412,14,46,46,10,225,206,372,372,53,452,57,14,46,46,225,206,372,373,53,49,57,164,402,4,233,234,158,215,214,402,403,123,123,246,228,245,357,350,215,214,402,403,123,123,246,228,437,245,215,214,402,403,123,123,246,228,429,430,245,126,402,136,4,233,234,234,16,17,215,214,402,403,123,123,246,228,437,245,310,299,299,301,301,164,402,4,4,244,244,244,158,159,167,215,214,402,403,123,123,107,228,30,467,470,442,214,403,13,123,123,107,228,30,471,472,308,309,103,136,3,4,243,244,167,214,403,123,123,107,228,30,460,407,52,31,277,296,288,293,293,46,136,136,419,17,100,324,123,323,123,324,228,473,291,439,277,296,288,293,293,100,46,419,214,363,427,403,195,65,123,306,123,307,228,474,302,291,439,123,293,293,15,10,10,360,111,113,475,384,385,419,323,324,123,123,181,228,182,476,464,348,349,113,113,388,389,389,120,120,323,324,123,123,181,228,182,391,386,387,278,308,308,279,309,309,62,314,395,396,415,415,416,416,136,159,402,403,123,123,228,274,312,313,278,308,100,279,309,103,104,4,244,214,363,427,403,195,65,123,123,107,228,30,471,472,431,101,90,43,259,231,198,239,196,174,189,131,232,256,44,250,257,251,209,186,258,260,98,201,241,261,197,213,168,262,253,14,99,45,9,1,75,154,77,137,139,114,15,426,92,220,16,17,46,10,0,402,159,173,403,151,158,13,286,287,277,296,290,374,265,278,308,312,313,291,439,295,361,310,316,302,357,78,111,315,375,376,407,176,409,446,447,411,412,381,470,404,405,392,420,421,162,78,111,409,438,392,89,80,372,220,18,160,406,164,299,299,299,301,361,355,305,302,357,353,350,101,407,229,408,409,410,51,411,412,194,199,413,414,415,416,399,400,417,418,390,419,52,31,392,420,421,101,409,409,410,51,194,194,52,52,392,293,293,15,10,10,360,111,113,475,384,385,419,464,15,46,9,10,117,360,461,462,385,15,46,9,10,117,360,461,462,385,268,99,1,74,190,191,75,154,137,3,114,20,426,181,92,16,17,402,159,173,215,214,403,158,83,30,182,84,13,331,330,286,287,277,296,289,299,299,299,301,278,308,312,313,323,324,279,309,361,365,353,306,318,62,314,315,440,428,395,398,377,431,446,448,432,433,434,449,450,435,423,436,417,418,404,405,451,437,178,217,78,62,314,14,45,1,74,190,191,136,75,154,77,137,2,109,114,15,426,92,16,17,46,159,173,151,158,331,286,287,277,296,289,299,299,299,301,278,308,133,312,313,291,439,323,324,279,309,361,310,316,62,314,315,440,395,396,441,442,443,444,445,397,377,176,446,447,448,433,434,449,450,423,415,416,387,388,389,399,400,451,401,392,178,111,48,176,14,136,124,20,15,181,393,394,215,214,182,331,286,287,289,299,299,299,301,278,308,133,312,313,279,309,355,360,135,395,396,397,398,388,389,399,400,401,67,78,78,48,49,49,214,403,13,123,123,107,318,228,30,59,73,136,102,102,155,155,183,294,329,79,28,143,184,477,453,454,478,479,480,128,204,82,15,90,18,19,15,90,18,19,15,90,18,19,481,99,100,123,226,123,227,228,9,117,124,203,10,292,265,295,145,375,376,461,462,187,463,384,385,464,170,111,111,409,409,187,75,139,3,233,215,214,402,403,123,123,246,365,228,245,482,441,11,9,10,10,406,102,102,92,155,155,299,299,301,301,15,46,10,117,121,373,15,160,10,117,121,373,15,46,121,373,4,15,123,123,228,15,46,10,117,121,373,15,46,10,117,121,373,15,46,121,373,4,15,320,123,123,228,9,117,124,203,10,292,265,295,145,375,376,461,462,187,463,384,385,464,170,409,409,187,45,77,139,114,372,46,173,164,206,151,53,162,363,427,315,375,376,441,442,176,49,452,446,51,382,383,438,57,58,195,65,66,391,162,176,49,51,438,57,58,265,308,295,452,403,483,136,405,390,53,484,485,486,487,488,489,490,491,492,493,494,109,495,123,228,30,496,265,295,46,311,452,405,497,12,19,53,498,487,488,499,492,493,498,54,500,501,22,502,503,504,504,505,506,507,508,509,509,510,511,512,513,514,386,386,387,515,499,499,516,500,22,502,503,517,518,506,507,508,509,512,513,514,51,187,204,173,519,520,521,522,523,524,525,173,522,495,123,228,303,181,182,458,526,527,47,27,28,377,528,438,529,519,488,530,531,532,505,533,534,522,535,523,536,537,538,539,540,541,123,303,181,542,474,526,527,488,249,68,37,505,543,544,545,546,547,531,534,548,536,532,377,495,539,540,547,549,530,495,548,536,541,47,27,546,547,531,536,68,505,533,543,550,544,27,546,530,495,536,539,540,284,551,377,495,541,68,37,547,505,543,544,551,47,27,549,533,534,536,545,546,531,532,548,539,540,541,495,47,27,546,547,549,534,284,551,377,552,495,505,550,551,546,529,547,530,531,548,505,543,536,550,544,27,549,530,495,543,536,545,382,542,474,542,474,303,542,474,304,542,529,553,144,438,438,546,173,529,495,554,555,555,144,556,452,438,438,546,522,495,495,555,555,14,15,15,15,212,438,546,529,504,505,535,543,14,15,369,212,452,546,557,558,505,543,559,298,298,298,299,299,325,325,300,300,300,301,301,326,326,14,15,529,299,325,325,301,326,326,14,15,560,212,452,561,562,563,413,414,382,382,383,383,564,529,565,566,537,537,550,567,567,567,377,452,413,413,413,414,414,414,382,383,383,564,564,550,568,27,27,187,187,37,529,569,570,571,571,572,573,188,297,27,27,187,452,37,570,571,573,574,27,27,187,187,37,529,569,570,571,571,572,573,188,297,27,27,187,452,37,570,571,573,574,575,575,575,575,576,576,542,542,542,542,552,552,529,577,533,523,548,548,345,578,452,575,575,575,575,576,576,542,542,542,542,552,552,533,548,298,298,298,299,299,325,325,300,300,300,301,301,326,326,14,15,529,299,325,325,301,326,326,14,15,560,212,452,561,562,563,47,47,51,51,68,529,579,530,534,536,580,580,47,452,51,68,530,581,536,582,583,584,584,580,529,585,586,587,588,588,589,589,537,550,56,590,591,370,371,452,446,592,586,586,587,587,589,593,594,594,28,28,28,165,29,142,63,148,208,69,529,39,28,28,28,165,29,142,63,148,452,208,69,39,529,595,595,595,595,596,452,595,595,595,595,596,597,598,599,600,183,185,184,184,529,547,565,565,525,538,544,183,185,601,452,519,547,565,565,565,544,602,228,367,367,603,368,368,604,182,458,458,605,474,529,526,526,311,606,228,367,603,368,604,452,458,458,605,474,474,526,607,608,609,390,497,497,18,19,204,529,610,611,612,613,614,539,540,560,609,452,615,616,617,611,618,613,614,539,540,539,540,539,540,413,414,57,58,86,529,619,620,534,534,534,512,513,90,205,621,622,452,413,413,414,414,620,620,623,512,512,514,303,420,420,421,421,624,83,83,84,84,87,529,625,625,532,551,284,452,420,421,624,83,84,87,532,551,517,518,626,626,627,628,99,323,78,79,81,629,454,557,323,181,459,558,351,182,100,459,625,558,630,459,329,203,310,341,338,360,164,431,381,631,632,633,634,162,163,163,79,475,475,122,635,633,636,636,637,162,163,475,81,18,19,211,638,111,101,126,229,206,414,243,484,639,520,520,640,641,642,643,644,644,645,94,646,490,647,648,504,649,650,537,651,109,495,123,228,430,398,652,229,206,653,390,18,128,20,485,654,655,656,657,658,642,644,504,659,660,501,661,662,663,557,520,504,226,398,520,647,664,665,493,562,113,36,549,666,534,497,19,667,225,505,668,493,664,498,549,493,545,577,495,228,227,430,403,549,669,207,254,670,671,528,348,349,117,121,423,181,182,672,673,490,674,492,393,181,675,588,639,394,676,589,244,498,677,166,607,608,407,407,678,204,679,679,680,681,682,683,525,525,538,538,544,539,540,101,112,194,200,230,684,685,686,687,602,688,689,690,651,136,137,109,110,519,547,547,641,577,523,548,548,509,510,511,433,434,691,449,450,692,109,110,519,547,693,694,695,523,548,183,185,608,194,199,200,414,204,688,689,690,651,599,607,608,101,112,194,200,414,230,693,694,688,689,690,600,144,653,528,173,696,490,680,522,495,495,554,555,539,540,28,28,144,697,663,486,696,698,680,522,554,555,539,540,699,653,528,700,646,701,702,703,704,705,650,688,689,690,545,206,699,653,207,484,657,706,646,701,704,668,705,650,545,471,472,243,244,526,527,496,521,533,707,652,708,709,123,228,320,398,458,605,526,527,710,711,712,707,708,286,344,344,345,423,713,579,530,714,714,714,715,491,716,717,640,640,718,645,645,719,521,533,649,666,681,682,683,720,286,344,345,2,138,579,530,659,665,681,682,683,721,717,640,640,718,645,645,719,521,533,649,666,681,682,683,294,77,114,82,647,722,681,522,509,123,496,695,99,162,79,81,77,647,581,722,723,318,404,501,708,215,214,402,403,11,100,724,405,581,666,652,501,405,36,581,725,723,36,726,453,36,403,403,711,403,403,163,122,723,403,319,12,558,727,728,36,163,115,723,728,12,163,36,501,319,403,711,403,403,403,669,228,669,214,30,669,669,214,669,669,405,709,405,709,329,203,310,341,338,360,164,431,381,631,632,99,100,100,79,181,182,707,652,501,708,709,99,100,100,228,81,182,729,639,498,526,527,708,709,79,464,730,727,731,732,733,734,735,280,188,297,81,464,643,570,730,727,733,734,735,290,290,374,374,353,736,79,354,737,738,739,740,290,374,353,736,354,81,386,515,738,739,589,353,736,79,11,12,12,658,669,669,741,742,81,11,12,658,669,743,744,745,746,741,741,742,623,162,163,79,77,151,152,122,581,581,581,580,723,59,747,73,81,483,77,151,152,122,581,536,580,219,160,160,161,327,328,79,319,194,199,200,680,219,160,161,560,560,81,671,642,642,667,748,749,680,539,540,215,214,214,366,302,311,79,107,30,264,496,214,365,366,107,30,264,81,648,750,710,711,712,79,20,21,21,657,706,706,751,751,752,753,754,755,755,81,20,21,654,654,655,655,657,706,751,752,752,752,753,755,593,594,594,77,82,756,751,635,731,681,757,79,79,475,475,81,81,77,77,756,756,657,751,751,635,635,731,731,758,758,734,734,506,757,757,475,696,701,163,12,475,696,701,163,12,759,760,706,21,314,149,64,254,475,696,701,163,12,475,696,701,163,12,475,696,701,163,12,758,752,633,706,21,735,506,487,254,329,203,310,341,338,360,164,431,381,631,632,761,647,728,79,20,21,21,657,706,706,751,751,752,753,754,755,755,81,20,21,654,654,655,655,657,706,751,752,752,752,753,755,593,594,594,79,758,650,758,758,762,759,759,760,760,763,81,758,758,758,762,759,759,759,759,760,760,760,760,763,79,557,558,764,764,94,696,646,701,731,732,733,426,225,81,697,663,486,558,764,94,696,646,701,733,79,436,436,467,467,36,765,761,635,633,728,728,81,436,467,484,738,739,765,765,654,655,265,295,433,449,194,390,57,137,16,53,700,729,520,579,489,588,698,715,674,660,766,109,522,265,278,295,426,452,446,434,450,194,482,390,700,729,520,698,683,321,497,498,488,493,691,692,668,278,308,321,767,433,434,691,449,450,692,136,137,766,494,768,433,434,691,449,450,692,109,110,519,547,693,694,695,523,548,286,344,344,345,423,713,579,530,449,714,714,714,715,491,716,717,640,640,718,645,645,719,521,533,649,666,681,682,683,720,278,308,321,767,433,434,691,449,450,692,136,137,766,494,768,433,434,691,449,450,692,109,110,519,547,693,694,695,523,548,278,308,321,767,433,434,691,449,450,692,136,137,766,494,768,433,434,691,450,692,136,137,156,641,577,523,548,509,510,511,136,656,619,620,769,770,771,772,744,693,694,695,433,434,691,449,450,692,136,137,156,641,577,523,548,509,773,774,365,366,123,79,81,557,717,649,707,580,215,754,487,558,558,558,558,652,666,214,214,214,625,666,182,329,203,310,341,338,360,164,431,381,631,632,290,290,374,374,353,736,79,354,737,738,739,740,290,374,353,736,354,81,386,515,738,739,589,162,163,163,79,475,475,122,635,633,527,636,636,637,162,163,475,81,18,19,211,638,633,634,99,100,100,79,181,182,707,652,501,708,709,99,100,100,228,81,182,729,639,498,526,708,709,353,736,79,11,12,12,658,669,669,741,742,81,11,12,658,669,743,744,745,746,741,741,742,623,323,324,324,351,79,226,227,775,393,394,405,405,324,351,226,227,775,394,81,404,405,405,521,533,78,78,79,315,447,447,629,459,459,776,85,777,78,315,315,447,447,81,629,776,85,778,777,779,780,781,782,575,575,575,575,576,576,542,542,542,542,552,552,529,577,533,523,548,548,345,578,452,575,575,575,575,576,576,542,542,542,542,552,552,533,548,349,113,126,50,403,200,136,17,19,54,586,577,783,676,748,749,750,491,492,543,548,555,652,536,550,509,538,228,430,398,709,265,295,370,371,359,229,377,206,49,452,413,414,482,52,119,20,53,672,639,657,610,612,488,644,705,230,696,701,243,243,520,520,658,658,647,50,31,17,498,492,630,589,740,515,679,377,113,126,497,19,699,750,508,244,228,754,591,446,654,655,784,668,668,785,785,660,660,493,493,493,755,593,594,45,46,56,210,211,20,21,254,657,706,785,660,493,753,594,699,653,528,700,646,701,702,703,704,705,650,688,689,690,545,699,653,528,484,657,706,646,701,704,668,705,650,688,689,786,49,49,50,386,386,387,387,515,515,119,120,120,675,676,676,757,740,677,393,394,181,244,166,639,498,675,676,588,589,787,637,18,19,641,489,783,638,635,633,634,662,788,637,18,19,641,577,676,635,633,789,634,788,626,365,365,366,393,394,404,405,729,639,498,712,707,652,302,311,123,228,393,394,398,181,182,496,521,533,366,366,320,320,49,50,50,452,53,54,54,520,488,549,549,55,790,790,609,320,452,57,58,791,792,520,549,644,55,790,614,793,265,188,295,297,297,464,464,791,792,643,734,735,735,537,537,550,572,573,265,188,295,297,464,643,569,569,570,571,571,734,735,517,537,550,572,49,49,50,386,386,387,387,515,515,119,120,120,675,676,676,757,740,677,393,181,675,588,639,394,676,589,244,498,166,787,117,117,166,756,756,794,630,630,717,717,487,648,750,566,537,550,550,393,394,181,244,166,639,498,675,676,588,589,787,495,495,14,15,15,15,212,438,546,529,504,505,535,543,14,15,369,212,452,546,557,558,505,543,559,265,278,295,117,402,482,390,57,137,53,700,485,697,717,795,520,579,698,715,674,660,365,226,123,496,265,278,295,402,482,390,57,53,485,784,715,674,660,766,345,697,365,226,429,402,520,658,678,403,601,50,19,562,492,228,227,403,549,669,227,430,403,549,669,227,403,549,669,227,430,403,549,669,228,227,403,549,669,227,430,549,669,366,227,430,403,549,669,227,430,403,549,669,426,225,407,678,697,663,486,557,558,679,94,696,646,701,345,426,225,407,678,452,402,403,785,796,535,543,426,225,407,678,697,663,486,557,558,679,94,696,646,701,345,426,225,407,678,452,402,403,785,796,535,543,426,225,697,486,795,778,698,490,797,798,660,493,28,28,144,697,663,486,696,698,680,522,554,555,539,540,278,278,321,398,136,16,17,17,124,36,561,562,710,710,711,711,359,601,16,17,124,36,561,563,710,711,734,735,661,582,123,228,429,429,430,107,107,30,264,471,472,13,526,527,496,123,228,320,398,458,605,526,527,710,711,712,707,708,294,302,194,114,82,647,722,681,522,509,123,107,30,294,219,302,79,81,194,114,647,636,722,560,215,214,402,403,11,13,115,728,151,726,725,728,151,732,160,319,311,652,711,311,711,319,758,765,453,59,711,311,319,311,319,711,329,203,310,341,338,360,164,431,381,631,632,294,726,79,477,465,114,115,799,800,801,294,726,465,81,114,115,799,801,660,493,555,111,113,113,79,166,756,794,630,487,487,758,759,760,111,113,126,377,81,128,166,630,487,758,759,760,294,726,79,477,453,724,200,454,636,725,183,185,184,453,724,81,199,200,636,693,694,725,79,62,314,314,64,149,149,717,487,682,683,62,314,64,377,149,81,802,803,487,718,719,162,163,79,77,151,152,122,581,581,581,580,723,59,747,73,81,483,77,151,152,122,581,536,580,79,135,67,140,157,804,805,805,722,806,806,135,81,54,67,157,157,656,804,805,722,806,806,323,324,324,351,79,226,227,775,393,394,405,405,324,351,226,227,775,394,81,404,405,405,521,533,79,20,21,21,657,706,706,751,751,752,753,754,755,755,81,20,21,654,654,655,655,657,706,751,752,752,752,753,755,593,594,594,79,464,730,727,731,732,733,734,735,280,188,297,81,464,643,570,730,727,733,734,735,215,214,214,366,302,311,79,107,30,264,496,214,365,366,107,30,264,81,648,750,710,711,712,404,82,807,765,640,804,635,722,757,764,522,509,226,123,708,59,79,135,81,404,404,20,807,765,804,635,635,22,722,680,753,757,404,501,708,805,405,73,806,353,725,805,501,73,725,353,59,805,645,22,60,314,149,374,765,753,680,805,405,60,314,149,374,726,67,803,719,152,718,726,59,645,22,730,353,725,805,405,73,806,353,725,805,645,22,725,374,501,805,405,803,100,60,806,67,374,724,726,805,59,73,806,353,725,501,805,405,59,73,806,353,725,501,405,100,314,149,374,724,805,73,353,725,59,73,314,149,374,200,764,329,203,310,341,338,360,164,431,381,631,632,808,327,327,328,79,135,67,804,805,722,806,806,808,809,327,328,135,135,81,136,136,156,67,804,162,163,79,77,151,152,122,581,581,581,580,723,59,747,73,81,483,77,151,152,122,581,536,580,215,214,79,124,36,807,802,803,601,398,398,81,36,802,803,805,710,711,294,726,79,477,453,724,200,454,636,725,183,185,184,453,724,81,199,200,636,693,694,725,99,100,100,79,181,182,707,652,501,708,709,99,100,100,228,81,182,729,639,498,526,527,708,709,79,62,314,314,64,149,149,717,487,682,683,62,314,64,377,149,81,802,803,487,718,719,810,780,782,811,51,195,204,520,55,521,525,123,228,471,526,527,695,47,206,438,392,195,195,529,812,488,670,790,790,533,534,538,580,793,320,471,471,812,488,531,790,790,580,793,813,195,812,195,812,195,546,195,68,37,670,790,544,195,812,580,65,580,195,812,580,65,66,814,546,66,68,37,790,544,66,812,814,580,546,68,37,814,670,790,544,790,793,320,195,195,65,66,529,549,644,670,531,55,790,793,793,320,320,320,815,452,195,65,66,549,531,790,303,420,420,421,421,624,83,83,84,84,87,529,625,625,532,551,284,452,420,421,624,83,84,87,532,551,517,518,626,626,627,228,367,367,603,368,368,604,182,458,458,605,474,529,526,526,311,606,228,367,603,368,604,452,458,458,605,474,474,526,529,585,586,587,588,588,589,589,537,550,56,590,591,370,371,452,446,592,586,586,587,587,589,593,594,594,382,382,383,564,391,615,529,714,714,543,788,637,452,382,383,564,616,714,634,788,816,320,195,195,65,66,529,549,644,670,531,55,790,793,793,320,320,320,815,452,195,65,66,549,531,790,298,298,298,299,299,325,325,300,300,300,301,301,326,326,14,15,529,299,325,325,301,326,326,14,15,560,212,452,561,562,563,413,414,57,58,86,529,619,620,534,534,534,512,513,90,205,621,622,452,413,413,414,414,620,620,623,512,512,514,206,206,528,392,207,529,688,688,689,690,545,206,452,392,392,207,484,650,688,690,786,183,185,184,184,529,547,565,565,525,538,544,183,185,601,452,519,547,565,565,565,544,602,364,49,50,410,410,58,54,529,791,792,817,818,819,819,364,452,410,57,57,58,54,88,791,792,817,818,819,819,47,47,51,51,68,529,579,530,534,536,580,580,47,452,51,68,530,581,536,582,583,584,584,580,14,15,15,15,212,438,546,529,504,505,535,543,14,15,369,212,452,546,557,558,505,543,559,320,195,195,65,66,529,549,644,670,531,55,790,793,793,320,320,320,815,452,195,65,66,549,531,790,410,187,438,204,53,617,618,520,554,525,522,495,364,27,206,438,54,529,610,612,488,531,817,534,555,538,299,299,534,364,144,207,549,817,27,438,531,817,534,555,144,54,817,555,544,144,392,54,611,613,549,207,531,817,555,544,364,28,438,817,555,544,529,299,299,534,529,529,299,299,534,529,183,185,184,184,529,547,565,565,525,538,544,183,185,601,452,519,547,565,565,565,544,602,14,15,15,15,212,438,546,529,504,505,535,543,14,15,369,212,452,546,557,558,505,543,559,206,206,528,392,207,529,688,688,689,690,545,206,452,392,392,207,484,650,688,690,786,529,585,586,587,588,588,589,589,537,550,56,590,591,370,371,452,446,592,586,586,587,587,589,593,594,594,47,47,51,51,68,529,579,530,534,536,580,580,47,452,51,68,530,581,536,582,583,584,584,580,348,756,756,557,672,585,585,566,566,585,756,348,672,557,585,756,537,557,377,243,20,657,648,504,649,707,181,404,707,649,504,657,20,648,707,377,243,707,676,676,676,676,676,676,676,676,244,652,286,426,715,522,681,522,796,705,554,426,715,286,681,522,113,113,791,488,488,783,783,820,820,609,58,53,549,644,783,783,488,488,113,113,820,820,791,488,54,791,488,488,670,820,567,793,609,206,53,644,626,488,54,670,820,488,791,567,793,54,670,426,433,449,700,796,681,123,707,708,653,522,796,705,707,524,681,796,433,449,700,426,707,524,433,449,700,681,523,707,123,458,707,653,681,705,524,228,708,709,523,700,433,449,681,707,320,652,545,45,489,784,674,796,572,109,522,265,295,446,653,16,561,523,561,566,796,45,784,674,489,572,535,637,137,579,641,659,554,651,522,226,123,707,59,59,637,28,28,482,769,770,771,772,524,637,554,651,579,659,137,641,348,434,450,423,821,684,686,521,682,509,522,226,123,707,591,229,11,795,795,684,686,660,682,821,434,450,684,686,509,521,423,548,661,464,52,119,124,571,571,714,714,785,757,495,226,123,652,349,386,386,656,675,499,499,797,757,714,571,52,124,119,571,714,464,785,822,823,824,825,484,484,498,498,640,640,640,640,645,645,645,645,748,748,749,749,543,543,661,661,495,484,530,647,650,634,723,661,645,640,543,484,748,749,498,645,640,90,111,31,19,120,36,740,594,417,418,794,794,586,586,588,635,94,646,826,740,111,31,90,19,120,36,594,487,594,206,452,452,53,791,820,206,57,654,655,488,820,820,820,206,53,206,452,791,53,452,311,30,501,580,30,496,712,403,244,669,669,710,710,712,398,403,13,669,501,30,311,580,58,244,647,501,580,495,320,264,471,472,13,30,750,750,55,55,711,711,695,754,107,264,471,13,501,244,647,580,755,755,755,755,755,484,650,634,723,495,669,55,710,711,695,754,634,650,484,723,299,299,51,187,438,204,520,645,521,554,525,522,495,123,228,181,182,575,526,527,299,299,299,299,183,47,27,28,528,438,392,57,19,19,529,586,488,530,569,531,571,714,533,534,555,538,689,567,123,181,458,526,527,488,827,19,299,301,325,326,47,27,392,690,299,301,299,301,530,531,571,299,301,185,549,714,533,555,545,301,27,28,63,148,58,530,299,58,69,587,530,570,533,534,144,567,299,438,19,571,533,714,495,325,47,27,58,208,86,690,545,299,142,587,530,570,531,533,299,301,185,19,86,530,299,301,570,326,438,69,549,714,533,555,544,325,326,165,58,68,37,545,326,29,144,546,392,39,533,567,299,301,27,570,531,533,299,549,530,714,533,534,555,545,299,47,148,58,19,208,531,571,325,326,68,37,185,546,392,58,19,530,714,555,47,27,19,549,533,299,301,571,144,567,325,47,27,58,570,533,534,185,29,19,69,587,531,714,545,144,567,299,301,165,392,714,533,544,325,326,68,37,182,228,605,228,182,228,605,369,369,369,299,299,326,529,529,529,325,326,690,382,382,383,564,391,615,529,714,714,543,788,637,452,382,383,564,616,714,634,788,816,27,27,187,187,37,529,569,570,571,571,572,573,188,297,27,27,187,452,37,570,571,573,574,298,298,298,299,299,325,325,300,300,300,301,301,326,326,14,15,529,299,325,325,301,326,326,14,15,560,212,452,561,562,563,529,595,595,595,595,596,452,595,595,595,595,596,597,598,599,600,144,438,438,546,173,529,495,554,555,555,144,556,452,438,438,546,522,495,495,555,555,228,367,367,603,368,368,604,182,458,458,605,474,529,526,526,311,606,228,367,603,368,604,452,458,458,605,474,474,526,303,420,420,421,421,624,83,83,84,84,87,529,625,625,532,551,284,452,420,421,624,83,84,87,532,551,517,518,626,626,627,529,585,586,587,588,588,589,589,537,550,56,590,591,370,371,452,446,592,586,586,587,587,589,593,594,594,364,49,50,410,410,58,54,529,791,792,817,818,819,819,364,452,410,57,57,58,54,88,791,792,817,818,819,819,413,414,382,382,383,383,564,529,565,566,537,537,550,567,567,567,377,452,413,413,413,414,414,414,382,383,383,564,564,550,568,298,298,298,299,299,325,325,300,300,300,301,301,326,326,14,15,529,299,325,325,301,326,326,14,15,560,212,452,561,562,563,206,206,528,392,207,529,688,688,689,690,545,206,452,392,392,207,484,650,688,690,786,183,185,184,184,529,547,565,565,525,538,544,183,185,601,452,519,547,565,565,565,544,602,413,414,382,382,383,383,564,529,565,566,537,537,550,567,567,567,377,452,413,413,413,414,414,414,382,383,383,564,564,550,568,320,195,195,65,66,529,549,644,670,531,55,790,793,793,320,320,320,815,452,195,65,66,549,531,790,228,367,367,603,368,368,604,182,458,458,605,474,529,526,526,311,606,228,367,603,368,604,452,458,458,605,474,474,526,320,195,195,65,66,529,549,644,670,531,55,790,793,793,320,320,320,815,452,195,65,66,549,531,790,607,608,609,390,497,497,18,19,204,529,610,611,612,613,614,539,540,560,609,452,615,616,617,611,618,613,614,539,540,539,540,539,540,47,47,51,51,68,529,579,530,534,536,580,580,47,452,51,68,530,581,536,582,583,584,584,580,27,27,187,187,37,529,569,570,571,571,572,573,188,297,27,27,187,452,37,570,571,573,574,14,15,15,15,212,438,546,529,504,505,535,543,14,15,369,212,452,546,557,558,505,543,559,255,349,452,434,450,390,52,57,243,16,53,485,485,672,639,640,579,645,588,635,674,682,682,548,548,661,109,495,302,226,228,404,183,308,225,394,377,206,528,483,464,210,20,484,657,795,617,618,520,490,652,537,183,183,308,393,377,206,653,653,653,464,210,20,657,610,618,520,698,681,707,707,707,566,183,308,426,393,377,206,464,210,20,657,617,618,520,698,681,682,707,566,111,111,794,794,566,566,417,418,205,666,670,550,543,58,673,498,778,530,683,652,828,829,278,308,321,89,90,359,601,398,136,124,661,582,359,601,16,17,124,36,561,562,710,711,734,735,661,582,265,188,295,297,297,464,791,792,643,569,569,571,571,571,734,735,735,572,573,573,265,188,188,295,297,297,142,464,643,569,569,570,571,571,537,572,609,609,206,206,452,57,58,58,53,53,54,86,86,791,792,614,820,819,819,793,609,320,452,57,58,791,792,520,549,644,55,790,614,793,59,747,747,429,430,73,482,483,483,579,530,530,491,716,716,302,311,123,228,398,244,526,527,496,712,707,830,708,407,678,402,403,11,12,785,504,796,535,543,501,345,426,225,407,678,402,403,679,785,796,535,559,658,348,45,45,359,359,49,136,464,137,243,120,124,124,53,579,644,490,534,682,682,509,688,651,109,495,228,429,710,652,345,308,591,111,407,622,452,663,557,672,639,654,655,520,579,644,635,571,571,714,714,684,686,797,769,770,771,772,659,693,649,705,707,524,349,349,794,794,673,673,663,535,243,243,520,520,658,647,121,634,56,54,498,678,486,321,767,244,136,656,619,620,769,770,771,772,744,693,694,695,89,90,205,622,413,52,31,38,675,769,744,596,598,623,677,677,302,311,404,405,243,244,669,648,750,712,707,652,320,165,264,404,405,13,526,527,710,711,712,707,708,59,429,430,797,798,798,826,826,524,536,661,582,580,723,59,59,29,429,430,797,798,716,524,536,661,582,699,653,528,700,646,701,702,703,704,705,650,688,689,690,545,148,653,528,484,635,633,668,647,728,705,650,545,136,137,109,110,519,547,547,641,577,523,548,548,509,510,511,109,110,208,519,547,641,577,766,494,768,523,548,609,407,678,229,390,497,831,18,204,679,614,539,540,609,63,18,19,557,558,647,728,525,538,544,614,121,121,414,18,18,19,641,577,489,489,635,633,826,117,121,18,19,210,211,489,783,783,638,635,633,714,714,407,678,402,403,11,12,785,504,796,535,543,501,345,426,225,407,678,452,402,403,785,796,535,543,265,188,295,297,297,464,464,643,569,569,570,734,735,735,735,735,517,292,832,280,265,188,188,295,297,464,643,571,571,735,735,572,573,183,185,184,101,112,230,684,685,686,687,659,665,693,694,608,101,112,194,200,414,230,693,694,534,688,689,690,278,308,321,89,90,359,601,398,136,124,661,582,59,59,73,482,833,834,835,836,837,579,797,661,609,609,206,206,452,57,58,58,53,53,54,86,86,791,792,614,820,819,819,793,609,57,69,86,520,488,549,55,790,614,820,819,51,187,18,204,520,619,521,572,525,662,522,495,123,228,181,182,575,526,527,47,27,438,497,392,57,19,19,529,586,838,488,530,531,619,533,534,573,538,689,567,788,788,123,367,368,181,458,526,527,488,573,788,497,19,47,27,546,392,587,531,533,534,838,838,497,531,573,367,368,529,144,438,438,546,173,529,495,554,555,555,144,556,452,438,438,546,522,495,495,555,555,228,367,367,603,368,368,604,182,458,458,605,474,529,526,526,311,606,228,367,603,368,604,452,458,458,605,474,474,526,206,206,528,392,207,529,688,688,689,690,545,206,452,392,392,207,484,650,688,690,786,575,575,575,575,576,576,542,542,542,542,552,552,529,577,533,523,548,548,345,578,452,575,575,575,575,576,576,542,542,542,542,552,552,533,548,413,414,57,58,86,529,619,620,534,534,534,512,513,90,205,621,622,452,413,413,414,414,620,620,623,512,512,514,46,90,117,678,394,49,452,434,450,483,405,18,18,484,663,717,490,492,493,493,109,495,365,366,228,712,265,295,45,45,46,89,407,393,452,446,434,450,482,52,57,18,53,485,639,588,674,660,121,113,31,19,54,589,492,626,633,58,671,530,716,117,121,783,783,638,117,117,166,756,756,794,630,630,717,717,487,648,750,566,537,550,550,117,609,815,126,121,452,57,58,128,717,487,520,549,644,648,750,55,790,566,537,568,614,567,793,117,117,166,756,756,794,630,630,717,717,487,648,750,566,537,550,550,117,126,121,379,380,699,128,756,717,487,648,750,566,537,550,567,121,121,414,18,18,19,641,577,489,489,635,633,826,117,121,18,19,210,211,489,635,633,714,714,637,18,19,641,489,783,638,635,633,634,662,788,637,18,19,641,577,676,635,633,789,634,788,626,637,18,19,641,489,783,638,635,633,634,662,788,18,19,210,489,783,783,638,635,633,714,714,627,607,607,684,686,619,694,694,680,753,595,596,538,538,689,539,540,689,694,689,694,538,619,595,684,538,680,540,619,686,595,753,596,539,596,688,688,689,101,265,349,295,46,49,452,403,390,57,672,717,520,640,640,489,645,645,821,789,647,785,491,535,650,555,661,525,688,109,495,46,89,126,229,206,386,57,639,656,499,644,789,769,770,771,772,693,660,649,486,535,785,543,321,156,54,788,783,638,744,2,82,140,681,123,496,79,81,2,140,215,214,228,429,430,402,403,471,11,13,669,732,839,840,841,842,157,2,725,157,2,725,157,2,725,157,2,725,157,2,725,157,2,725,138,329,203,310,341,338,360,164,431,381,631,632,79,2,2,2,138,81,2,2,138,138,79,2,2,2,138,81,2,2,138,138,79,2,2,2,138,81,2,2,138,138,79,2,2,2,138,81,2,2,138,138,79,2,2,2,138,81,2,2,138,138,79,2,2,2,138,81,2,2,138,138,123,496,215,214,228,429,430,402,403,471,11,13,669,732,839,840,841,842,467,307,843,329,203,310,341,338,360,164,431,381,631,632,654,654,79,306,307,228,843,625,625,22,502,503,506,507,508,509,510,511,306,307,843,81,625,22,502,503,505,517,518,506,507,508,79,20,21,21,657,706,706,751,751,752,753,754,755,755,81,20,21,655,655,657,706,751,752,752,752,753,755,593,594,594,162,163,79,77,151,152,122,581,581,581,580,723,59,747,73,81,483,77,151,152,122,581,536,580,79,436,436,467,467,36,765,761,635,633,728,728,81,436,467,484,738,739,765,765,761,647,728,650,79,318,319,429,430,467,471,472,839,839,840,841,841,842,496,307,318,319,430,430,81,403,467,471,839,840,841,842,429,526,527,496,707,708,519,844,327,402,82,681,522,509,123,496,327,79,81,402,215,214,306,228,429,430,402,403,11,13,669,732,839,840,841,842,467,328,761,403,122,727,161,725,329,203,310,341,338,360,164,431,381,631,632,294,726,79,477,453,724,200,454,636,725,183,185,184,453,724,81,199,200,636,693,694,725,294,726,79,477,465,114,115,799,800,801,294,726,465,81,114,115,799,801,660,493,555,79,135,67,140,157,804,805,805,722,806,806,135,81,54,67,157,157,656,804,805,722,806,806,79,318,319,429,430,467,471,472,839,839,840,841,841,842,496,307,318,319,430,430,81,403,467,471,839,840,841,842,215,214,214,366,302,311,79,107,30,264,496,215,214,366,302,311,606,107,30,81,670,648,790,845,349,113,113,609,350,394,50,379,380,403,200,497,17,17,19,120,669,676,702,703,668,668,828,750,22,502,493,517,826,518,506,507,543,543,683,652,652,536,536,550,740,740,501,690,545,545,634,594,820,567,793,539,540,626,512,109,495,228,430,398,709,188,297,601,350,229,592,380,515,515,58,36,54,130,794,673,498,679,562,611,613,549,530,530,638,667,569,569,500,500,589,633,696,701,571,571,714,714,703,55,505,505,533,666,544,723,788,513,264,13,520,709,227,403,549,669,228,605,227,430,549,669,228,320,755,165,29,142,63,148,208,69,39,544,113,200,570,790,694,471,472,243,244,526,527,496,521,533,707,652,708,709,123,228,320,398,458,605,526,527,710,711,712,707,708,59,429,430,797,798,798,826,826,524,536,661,582,580,723,59,429,430,579,530,826,524,536,661,582,580,723,265,188,295,297,297,464,791,792,643,569,569,571,571,571,734,735,735,572,573,573,292,832,846,265,188,188,295,297,464,643,571,571,735,735,572,573,183,185,608,194,199,200,414,204,688,689,690,651,599,101,112,194,200,230,684,685,686,687,39,688,689,690,651,520,344,344,265,278,278,295,407,407,49,49,452,452,433,450,402,402,482,482,390,390,57,57,137,137,485,485,717,717,795,795,520,579,579,588,588,698,698,674,674,766,766,109,522,344,265,295,452,446,402,194,482,390,2,520,698,344,265,295,446,402,194,482,390,2,520,784,348,756,345,697,117,403,199,483,138,490,403,199,483,138,490,403,199,483,138,490,403,199,483,138,490,713,59,136,204,50,200,487,668,490,555,90,50,492,672,426,225,697,486,795,778,698,490,797,798,660,493,28,28,144,697,663,486,696,698,680,522,554,555,539,540,348,349,117,121,423,181,182,673,490,674,492,393,394,181,244,166,639,498,675,676,588,589,677,45,46,46,56,370,370,371,371,446,592,592,20,21,585,586,586,587,587,657,706,45,46,56,210,211,20,21,254,657,706,785,660,493,753,594,386,386,387,515,515,499,499,516,516,500,500,22,502,503,504,517,518,506,507,508,386,386,387,515,499,499,516,500,22,502,503,517,518,506,507,508,509,512,513,514,426,225,407,678,697,663,486,557,558,679,94,696,646,701,578,717,640,640,718,645,645,719,521,533,649,666,681,682,683,286,344,344,345,423,713,579,530,714,714,714,715,491,716,721,717,640,640,718,645,645,719,521,533,649,666,681,682,683,426,225,407,678,697,663,486,557,558,679,94,696,646,701,578,717,640,640,718,645,645,719,521,533,649,666,681,682,683,111,113,126,377,128,756,756,794,630,630,717,487,487,648,648,750,117,126,121,379,380,699,128,756,717,487,648,750,566,537,550,567,183,185,184,101,112,230,684,685,686,687,659,665,693,694,608,101,112,194,200,414,230,693,694,534,688,689,690,14,413,414,382,529,641,565,505,537,847,564,577,550,383,505,383,302,402,11,82,731,647,681,754,522,509,365,366,123,302,79,81,402,11,717,731,647,710,754,580,741,215,214,402,403,11,732,754,580,755,711,758,728,403,152,733,726,161,761,122,730,755,742,580,755,742,711,580,755,742,711,580,652,728,151,726,755,580,580,711,755,755,711,580,329,203,310,341,338,360,164,431,381,631,632,215,214,214,366,302,311,79,107,30,264,496,214,365,366,107,30,264,81,648,750,710,711,712,79,557,558,764,764,94,696,646,701,731,732,733,426,225,81,697,663,486,558,764,94,696,646,701,733,79,464,730,727,731,732,733,734,735,280,188,297,81,464,643,570,730,727,733,734,735,79,306,307,228,843,625,625,22,502,503,506,507,508,509,510,511,81,109,494,768,495,509,510,773,511,774,331,330,848,143,849,850,832,851,578,747,337,374,852,325,326,183,185,294,726,308,321,349,853,333,854,100,351,160,46,214,362,163,90,606,328,736,338,370,371,78,360,601,113,79,135,354,307,227,319,164,609,62,364,47,27,315,350,165,29,142,143,304,225,430,112,678,767,724,126,775,394,855,465,398,206,50,30,264,475,592,447,856,857,858,859,860,861,664,528,403,713,776,383,483,136,467,471,464,515,546,182,405,497,576,552,31,392,58,65,474,615,152,138,110,244,12,115,17,19,173,36,54,86,130,801,484,671,486,794,558,529,586,639,498,803,547,157,526,527,739,656,487,679,862,563,778,488,764,718,805,669,530,783,638,667,569,516,670,531,719,632,676,752,625,589,633,777,571,714,490,733,668,828,728,750,798,551,818,785,581,636,620,744,491,716,665,759,760,492,533,806,694,735,493,768,725,680,753,742,712,826,534,495,720,650,548,555,652,536,537,568,787,501,709,584,574,755,598,602,786,545,634,600,594,580,819,539,541,788,627,513,281,282,283,352,863,864,865,866,867,868,869,870,871,872,222,457,224,270,272,268,481,269,116,240,873,874,236,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,59,895,123,181,707,522,20,756,657,635,707,688,359,225,225,126,654,655,734,525,657,20,756,635,707,688,117,111,225,206,243,124,679,520,640,640,641,642,643,645,645,635,821,648,649,535,548,555,536,109,522,495,526,527,710,708,709,183,183,359,359,111,111,126,126,229,229,206,206,464,464,52,52,173,173,124,124,700,700,654,655,520,520,635,635,659,659,710,521,521,734,649,649,796,796,523,523,554,554,707,707,524,524,566,566,661,661,13,526,527,520,708,679,185,144,36,665,113,587,633,679,543,548,471,144,653,528,173,696,490,680,522,495,495,554,555,539,540,28,28,144,697,663,486,696,698,680,522,554,555,539,540,59,747,747,429,430,73,482,483,483,579,530,530,491,716,716,59,429,430,579,530,826,524,536,661,582,580,723,609,407,678,229,390,497,831,18,204,679,614,539,540,609,194,199,200,557,558,647,728,525,538,544,614,278,308,321,89,90,359,601,398,136,124,661,582,359,601,16,17,124,36,561,562,710,711,734,735,661,582,45,89,407,452,452,194,390,57,57,57,16,16,16,53,53,53,697,729,717,579,490,715,674,660,109,522,123,181,526,527,265,308,295,452,194,57,11,16,700,639,717,520,489,588,698,226,402,181,11,520,658,543,536,12,17,211,498,488,678,403,484,228,320,227,403,549,669,227,182,12,549,403,182,12,549,591,446,654,655,784,668,668,785,785,660,660,493,493,493,754,755,593,594,45,46,56,210,211,20,21,254,657,706,785,660,493,753,594,591,446,654,655,784,668,668,785,785,660,660,493,493,493,754,755,593,594,45,46,56,210,211,20,21,254,657,706,785,660,493,753,594,278,278,321,398,136,16,17,17,124,36,561,562,710,710,711,711,359,601,16,17,124,36,561,562,710,711,734,735,661,582,278,278,321,398,136,16,17,17,124,36,561,562,710,710,711,711,359,601,16,17,124,36,561,562,710,711,734,735,661,582,365,366,366,429,430,430,729,639,639,498,498,496,496,710,710,711,711,708,709,302,311,398,107,30,264,471,472,13,526,527,648,712,365,366,366,429,430,430,729,639,639,498,498,496,496,710,710,711,711,708,709,302,311,398,107,30,264,471,472,13,526,527,648,712,299,299,51,187,204,520,640,619,521,595,596,525,299,299,299,299,607,47,27,392,529,488,530,569,531,571,714,619,533,534,595,596,538,513,608,86,620,534,598,514,86,598,514,598,514,86,620,534,598,514,413,414,57,58,86,529,619,620,534,534,534,512,513,90,205,621,622,452,413,413,414,414,620,620,623,512,512,514,529,595,595,595,595,596,452,595,595,595,595,596,597,598,599,600,438,392,529,625,820,819,819,819,546,392,624,87,625,819,382,382,383,564,391,615,529,714,714,543,788,637,452,382,383,564,616,714,634,788,816,303,420,420,421,421,624,83,83,84,84,87,529,625,625,532,551,284,452,420,421,624,83,84,87,532,551,517,518,626,626,627,607,608,609,390,497,497,18,19,204,529,610,611,612,613,614,539,540,560,609,452,615,616,617,611,618,613,614,539,540,539,540,539,540,896,897,898,292,111,111,79,79,81,81,464,464,77,77,737,737,657,635,635,94,646,731,731,506,757,757,696,701,696,701,696,701,374,736,464,738,113,166,739,374,738,740,696,701,727,166,739,113,464,738,374,736,738,329,203,310,341,338,360,164,431,381,631,632,111,113,113,79,166,756,794,630,487,487,758,759,760,111,113,126,377,81,128,166,630,487,758,759,760,79,464,730,727,731,732,733,734,735,280,188,297,81,464,643,570,730,727,733,734,735,290,290,374,374,353,736,79,354,737,738,739,740,290,374,353,736,354,81,386,515,738,739,589,14,50,379,210,529,702,565,123,367,368,181,458,526,527,488,14,211,15,704,699,14,603,604,15,704,699,899,49,410,187,438,204,617,618,554,525,820,522,495,364,27,206,50,438,529,610,612,531,817,619,534,555,525,688,820,144,438,88,817,534,364,531,620,555,538,820,364,438,531,534,555,207,531,817,555,538,820,27,88,531,555,690,364,144,58,54,207,88,531,27,54,88,611,613,817,620,438,86,817,534,555,37,86,817,538,820,438,58,37,88,817,820,529,364,27,438,555,575,575,575,575,576,576,542,542,542,542,552,552,529,577,533,523,548,548,345,578,452,575,575,575,575,576,576,542,542,542,542,552,552,533,548,413,414,382,382,383,383,564,529,565,566,537,537,550,567,567,567,377,452,413,413,413,414,414,414,382,383,383,564,564,550,568,364,49,50,410,410,58,54,529,791,792,817,818,819,819,364,452,410,57,57,58,54,88,791,792,817,818,819,819,144,438,438,546,173,529,495,554,555,555,144,556,452,438,438,546,522,495,495,555,555,413,414,57,58,86,529,619,620,534,534,534,512,513,90,205,621,622,452,413,413,414,414,620,620,623,512,512,514,364,49,50,410,410,58,54,529,791,792,817,818,819,819,364,452,410,57,57,58,54,88,791,792,817,818,819,819,426,715,522,796,681,345,601,485,676,543,683,123,181,182,715,522,796,681,601,485,543,683,522,796,426,681,715,601,485,543,683,345,676,676,522,522,796,900,901,187,391,204,520,619,554,820,123,228,526,527,183,27,206,452,392,57,391,391,529,791,488,670,531,625,817,619,534,555,689,820,820,531,817,555,820,185,27,58,549,817,820,392,207,531,625,534,27,58,615,670,620,820,615,555,392,615,207,549,690,37,86,818,534,185,27,670,625,620,615,207,86,534,615,555,58,58,616,207,792,625,27,392,615,549,820,615,207,620,534,185,207,670,531,620,555,615,37,670,818,690,616,818,27,58,615,670,625,620,185,615,531,615,670,620,555,616,37,531,620,534,555,531,625,620,534,555,413,414,382,382,383,383,564,529,565,566,537,537,550,567,567,567,377,452,413,413,413,414,414,414,382,383,383,564,564,550,568,529,585,586,587,588,588,589,589,537,550,56,590,591,370,371,452,446,592,586,586,587,587,589,593,594,594,382,382,383,564,391,615,529,714,539,714,543,788,637,452,382,383,564,616,714,634,788,816,607,608,609,390,497,497,18,19,204,529,610,611,612,613,614,539,540,560,609,452,615,616,617,611,618,613,614,540,539,540,539,540,206,206,528,392,207,529,688,688,689,690,545,206,452,392,392,207,484,650,688,690,786,364,49,50,410,410,58,54,529,791,792,817,818,819,819,364,452,410,57,57,58,54,88,791,792,817,818,819,819,183,185,184,184,529,547,565,565,525,538,544,183,185,601,452,519,547,565,565,565,544,602,27,27,817,187,187,37,529,569,570,571,571,572,573,188,297,27,27,187,452,37,570,571,573,574,367,603,368,604,369,575,576,576,576,542,552,552,552,529,532,532,551,551,817,818,818,367,603,368,604,369,369,452,822,822,822,822,823,823,823,824,824,824,824,825,825,825,465,404,82,124,645,635,722,522,509,123,181,182,78,79,393,465,81,404,404,124,20,635,635,777,22,722,393,707,777,160,394,324,652,724,36,728,151,732,726,394,324,652,85,36,152,733,726,652,324,394,724,394,652,775,324,724,725,657,20,324,151,732,394,324,652,115,728,151,157,726,394,324,652,724,652,324,394,724,394,324,724,652,775,394,724,394,324,652,724,725,657,20,394,151,157,725,85,36,728,151,732,726,777,36,394,152,732,81,652,324,394,724,758,765,453,59,725,115,36,85,60,157,726,329,203,310,341,338,360,164,431,381,631,632,560,99,100,100,79,181,182,707,652,501,708,709,99,100,100,228,81,182,729,639,498,526,527,708,709,294,726,79,477,453,724,200,454,636,725,183,185,184,453,724,81,199,200,636,693,694,725,79,436,436,467,467,36,765,761,635,633,728,728,81,436,467,484,738,739,765,765,761,647,728,650,79,135,67,140,157,804,805,805,722,806,806,135,81,54,67,157,157,656,804,805,722,806,806,78,78,79,315,447,447,629,459,459,776,85,777,78,315,315,447,447,81,629,776,85,778,777,219,160,160,161,327,328,79,319,194,199,200,680,219,160,161,560,560,81,671,642,642,667,748,749,680,539,540,294,726,79,477,465,114,115,799,800,801,294,726,465,81,114,115,799,801,660,493,555,215,214,79,124,36,807,802,803,601,398,398,81,36,802,803,805,710,711,323,324,324,351,79,226,227,775,393,394,405,405,324,351,226,227,775,394,81,404,405,405,521,533,62,62,77,82,799,647,722,681,757,522,509,123,436,467,79,79,314,315,315,149,447,447,81,81,77,77,799,799,647,647,722,722,757,757,318,404,501,708,311,724,311,315,62,728,558,403,163,151,152,732,733,311,314,149,475,487,724,12,726,200,709,405,314,149,62,354,640,558,403,645,728,719,163,151,733,718,475,487,12,800,726,354,62,801,558,36,633,403,311,151,163,152,732,157,64,475,487,726,725,12,447,62,315,800,558,633,728,403,706,21,152,163,732,36,475,506,726,12,725,329,203,310,341,338,360,164,431,381,631,632,215,214,79,124,36,807,802,803,601,398,398,81,36,802,803,805,710,711,808,327,327,328,79,135,67,804,805,722,806,806,808,809,327,328,135,135,81,136,136,156,67,804,79,62,314,314,64,149,149,717,487,682,683,314,149,81,713,579,530,659,665,681,682,683,720,78,81,78,79,315,447,447,629,459,459,776,85,777,78,315,315,447,447,81,629,776,85,778,777,79,135,67,140,157,804,805,805,722,806,806,135,54,67,157,157,656,804,805,722,806,806,111,113,113,79,166,756,794,630,487,487,758,759,760,111,113,126,377,81,128,166,630,487,758,759,760,219,160,160,161,327,328,79,319,194,199,200,680,219,160,161,560,560,81,671,642,642,667,748,749,680,539,540,265,295,45,407,393,446,402,194,423,482,136,404,390,57,53,729,520,579,489,123,107,181,712,265,295,45,446,16,18,53,717,265,295,45,45,45,302,302,302,123,452,434,434,450,194,404,404,404,11,16,16,16,18,53,729,717,520,579,489,674,712,402,11,226,402,181,11,520,530,46,650,17,639,487,46,311,12,639,46,405,12,639,403,182,12,549,227,182,12,549,227,430,403,549,669,228,605,30,403,12,549,227,182,12,549,286,344,345,2,138,579,530,659,665,681,682,683,721,717,640,640,718,645,645,719,521,533,649,666,681,682,683,45,46,46,56,370,370,371,371,446,592,592,20,21,585,586,586,587,587,657,706,89,90,205,622,413,52,31,38,675,769,744,596,598,623,677,677,471,472,243,244,526,527,496,521,533,707,652,708,709,302,606,228,320,404,405,526,527,710,711,712,707,708,365,366,366,429,430,430,729,639,639,498,498,496,496,710,710,711,711,708,709,302,311,398,107,30,264,471,472,13,526,527,648,712,365,366,366,429,430,430,729,639,639,498,498,496,496,710,710,711,711,708,709,302,311,398,107,30,264,471,472,13,526,527,648,712,164,902,903,327,82,522,681,522,509,510,511,123,496,327,79,81,522,215,214,228,429,430,402,403,11,13,658,669,732,839,840,841,842,467,329,203,310,341,338,360,164,431,381,631,632,162,163,163,79,475,475,122,635,633,636,636,637,162,163,475,81,18,19,211,638,633,634,215,214,79,124,36,807,802,803,601,398,398,81,36,802,803,805,710,711,904,215,214,214,365,366,79,318,319,123,228,228,905,215,214,214,318,319,123,228,228,81,648,750,294,726,79,477,465,114,115,799,800,801,294,726,465,81,114,115,799,801,660,493,555,219,160,160,161,327,328,79,319,194,199,200,680,219,160,161,560,560,81,671,642,642,667,748,749,680,539,540,79,557,558,764,764,94,696,646,701,731,732,733,426,225,81,697,663,486,558,764,94,696,646,701,733,79,318,319,429,430,467,471,472,839,839,840,841,841,842,496,307,318,319,430,430,81,403,467,471,839,840,841,842,353,736,79,11,12,12,658,669,669,741,742,81,11,12,658,669,743,744,745,746,741,741,742,623,290,290,374,374,353,736,79,354,737,738,739,740,290,374,353,736,354,81,386,515,738,739,589,59,111,111,112,377,206,181,243,794,794,794,672,586,586,519,644,635,684,686,665,682,650,548,537,509,661,688,688,59,59,45,206,446,128,20,485,656,717,657,641,644,521,521,734,734,766,766,705,501,661,525,59,46,206,446,653,713,390,390,18,128,20,485,656,717,657,641,644,588,521,734,705,524,501,661,525,59,46,206,446,713,128,21,485,756,756,656,717,657,641,644,94,646,521,734,705,524,661,525,663,679,589,690,38,497,19,533,768,113,486,679,487,533,791,144,653,528,173,696,490,680,522,495,495,554,555,539,540,350,350,350,350,609,407,678,229,390,497,831,18,204,679,614,539,540,609,194,199,200,557,558,647,728,525,538,544,614,265,188,295,297,297,464,791,792,643,569,569,571,571,571,734,735,735,572,573,573,265,188,295,297,464,643,569,569,570,571,571,734,735,517,537,550,572,366,609,206,49,50,207,207,88,88,644,670,670,614,820,819,819,609,320,452,57,58,792,520,549,644,55,790,614,793,45,46,46,56,370,370,371,371,446,592,592,20,21,585,586,586,587,587,657,706,45,46,590,591,89,90,621,622,413,210,211,254,675,789,828,785,660,493,596,598,623,593,677,594,89,90,90,52,31,31,11,12,12,658,669,619,620,620,769,744,89,90,205,622,413,52,31,38,675,769,744,596,598,623,677,677,265,188,295,297,297,464,464,643,569,569,570,734,735,735,735,735,517,265,188,295,297,464,643,569,570,571,734,537,550,572,574,121,121,414,18,18,19,641,577,489,489,635,633,826,637,18,19,641,577,676,635,633,789,634,816,626,206,692,413,405,16,17,207,700,484,635,633,647,728,206,699,653,528,207,484,657,706,646,701,704,668,705,650,545,136,137,109,110,519,547,547,641,577,523,548,548,509,510,511,433,434,691,449,450,692,109,110,519,547,693,694,695,523,548,194,199,200,417,418,485,671,617,610,611,618,612,613,642,821,748,749,609,194,199,200,557,558,647,728,525,538,544,614,111,113,126,377,128,756,756,794,630,630,717,487,487,648,648,750,117,126,121,379,380,699,128,756,717,487,648,750,566,537,550,567,525,688,51,187,18,204,520,619,55,521,554,525,47,27,438,497,392,19,529,488,530,531,625,589,571,714,619,790,533,534,555,538,589,68,514,303,420,420,421,421,624,83,83,84,84,87,529,625,625,532,551,284,452,420,421,624,83,84,87,532,551,517,518,626,626,627,47,47,51,51,68,529,579,530,534,536,580,580,47,452,51,68,530,581,536,582,583,584,584,580,906,907,900,908,901,909,14,183,14,57,420,83,529,565,14,14,14,14,420,83,86,624,87,565,565,15,14,15,15,565,185,625,15,405,290,353,79,354,81,464,265,295,45,45,89,89,402,482,52,57,11,53,700,697,729,717,588,715,766,109,522,265,278,295,89,377,452,402,194,52,11,700,588,557,504,543,90,12,31,58,589,194,199,200,417,418,485,671,617,610,611,618,612,613,642,821,748,749,609,194,199,200,557,558,647,728,525,538,544,614,89,90,90,52,31,31,11,12,12,658,669,619,620,620,769,744,622,413,11,12,675,789,828,829,769,744,744,596,598,623,677,506,379,559,793,567,816,574,773,774,787,627,910,895,361,911,362,58,19,69,86,670,819,912,913,100,361,362,62,228,165,303,304,724,914,546,401,125,263,17,21,502,55,790,652,513,915,911,916,917,918,919,100,361,362,165,724,4,21,513,920,366,228,4,839,840,842,921,911,105,922,785,788,923,924,361,362,4,234,742,580,924,921,925,19,926,912,284,546,304,125,313,927,911,228,438,228,790,249,401,928,228,362,724,920,865,870,884,560,265,295,302,407,393,452,446,402,194,423,482,390,57,729,520,579,489,698,784,674,766,226,123,107,496,265,295,302,407,393,433,449,402,482,57,137,700,729,717,520,489,698,365,226,123,429,107,520,658,311,403,639,490,394,490,652,227,403,549,669,228,755,366,227,430,403,549,669,228,228,320,227,430,403,549,669,365,365,366,393,394,404,405,729,639,498,712,707,652,302,311,123,228,393,394,398,181,182,496,521,533,365,365,366,393,394,404,405,729,639,498,712,707,652,302,606,228,320,404,405,526,527,710,711,712,707,708,365,365,366,393,394,404,405,729,639,498,712,707,652,302,311,123,228,393,394,398,181,182,496,521,533,206,692,413,405,16,17,207,700,484,635,633,647,728,206,699,653,528,207,484,657,706,646,701,704,668,705,650,545,302,311,404,405,243,244,669,648,750,712,707,652,123,228,320,398,458,605,526,527,710,711,712,707,708,123,228,429,429,430,107,107,30,264,471,472,13,526,527,496,123,228,320,398,458,605,526,527,710,711,712,707,708,327,350,82,681,522,509,123,107,30,327,79,350,81,215,214,228,429,430,402,403,11,13,669,732,839,840,841,842,467,328,350,328,350,350,350,837,836,835,834,833,130,472,329,203,310,341,338,360,164,431,381,631,632,79,318,319,429,430,467,471,472,839,839,840,841,841,842,496,307,318,319,430,430,81,403,467,471,839,840,841,842,79,436,436,467,467,36,765,761,635,633,728,728,81,436,467,484,738,739,765,765,761,647,728,650,79,350,350,350,350,350,81,350,350,350,350,79,557,558,764,764,94,696,646,701,731,732,733,426,225,81,697,663,486,558,764,94,696,646,701,733,79,62,314,314,64,149,149,717,487,682,683,62,314,64,377,149,81,802,803,487,718,719,79,306,307,228,843,625,625,22,502,503,506,507,508,509,510,511,306,307,843,81,625,22,502,503,505,517,518,506,507,508,904,215,214,214,365,366,79,318,319,123,228,228,905,215,214,214,318,319,123,228,228,81,648,750,626,349,148,465,379,380,929,413,372,373,420,421,84,702,930,734,735,582,583,931,871,60,313,79,932,63,406,373,696,933,543,819,934,935,936,937,938,939,940,100,165,546,4,513,915,941,105,696,733,922,785,759,788,923,924,942,943,944,60,313,79,63,406,696,727,933,543,934,935,936,945,938,939,100,165,946,546,4,633,633,513,920,915,941,385,105,696,733,922,785,759,923,924,942,943,944,79,63,934,349,148,206,413,84,207,702,703,760,735,931,947,948,79,63,934,100,165,4,513,349,148,206,413,84,207,703,760,931,947,948,79,63,934,349,148,206,413,84,207,703,760,931,947,948,79,63,934,100,165,4,513,349,148,206,413,84,207,703,760,931,947,948,949,950,912,349,465,84,703,513,942,951,952,953,954,936,945,947,955,938,939,948,949,950,931,936,938,954,955,954,955,945,939,947,948,956,957,952,505,944,942,87,958,1,465,934,959,378,941,388,119,737,94,730,757,567,960,961,962,963,964,99,453,3,707,652,512,965,473,966,967,930,923,968,969,2,970,971,972,973,974,975,976,977,978,933,89,18,594,567,979,954,955,120,378,740,389,119,951,941,980,696,981,928,741,981,283,982,983,984,985,393,348,349,465,379,473,929,413,372,420,83,504,967,930,734,969,931,820,105,163,90,79,142,80,206,177,986,987,57,12,105,254,988,989,499,644,94,990,990,991,922,759,760,674,492,495,820,923,934,992,963,951,993,994,929,987,990,990,991,922,930,923,924,349,148,465,379,929,413,57,420,84,702,930,734,735,931,995,329,333,79,62,350,932,63,1,465,986,401,102,765,996,997,732,998,999,934,926,959,329,333,358,350,1,11,12,581,1000,1001,177,206,211,951,875,1002,365,366,123,228,398,460,3,4,839,841,710,1003,708,709,1004,1002,921,3,1005,710,580,1006,925,968,79,1007,2,1008,970,971,972,973,974,975,976,977,978,933,1009,1010,444,1,465,456,1011,1012,494,796,535,1013,998,999,934,959,59,312,1,397,465,176,766,494,1014,509,1013,998,999,1015,1016,969,959,1,1017,456,11,1018,796,535,1019,985,1020,1021,1022,89,80,438,11,94,1012,966,758,762,674,796,535,963,934,969,99,361,123,453,3,526,527,707,652,708,512,965,365,123,228,398,460,3,841,710,708,1004,1002,473,1012,966,967,930,796,535,968,969,361,365,3,243,1005,710,741,580,1006,1002,968,873,975,711,734,329,162,1,465,796,535,934,959,329,162,357,1,1017,11,12,617,796,535,595,1019,1000,985,1020,1021,1022,1023,99,123,80,181,526,527,22,707,652,512,915,1024,99,123,3,4,526,527,635,707,652,708,709,512,965,915,365,123,228,398,460,3,841,708,709,1004,1002,348,349,148,465,379,473,929,413,420,84,702,967,930,734,1025,566,969,931,348,349,329,295,89,357,379,473,929,464,420,94,566,537,757,662,960,1023,964,964,199,990,594,63,864,162,79,1010,1026,1027,453,444,1,465,1011,796,535,998,999,981,934,1002,959,312,1,397,465,1014,509,998,999,1015,981,1016,969,959,162,355,1,199,1017,11,130,796,535,1019,985,1020,1021,1022,99,361,123,453,3,526,527,707,652,708,512,965,981,365,123,228,398,460,3,841,710,708,1004,1002,473,966,967,930,796,535,923,968,969,361,365,453,3,1005,710,741,580,1006,1002,968,89,18,534,980,979,295,315,163,90,79,142,1028,80,206,177,986,987,546,57,12,105,254,988,989,499,516,644,94,990,990,991,922,759,760,674,492,495,820,923,934,992,963,951,979,993,912,994,163,90,206,452,57,58,19,69,86,989,644,670,55,790,1005,820,819,993,912,994,995,929,987,105,990,990,991,922,930,788,923,924,1029,90,1030,19,534,979,1,452,199,419,12,53,636,163,79,142,80,206,546,57,12,105,254,988,989,644,94,922,759,760,674,492,495,923,934,992,963,951,993,994,163,206,452,200,57,19,53,54,69,86,989,644,670,531,55,790,1005,993,994,995,99,100,123,165,80,182,526,527,652,538,512,915,1024,99,100,123,165,4,526,527,652,709,512,965,920,915,365,366,123,228,398,4,839,841,842,55,790,709,921,1004,929,105,922,930,788,923,924,349,148,465,379,929,413,57,420,84,702,930,734,735,931,995,79,932,1007,138,1008,975,976,977,978,933,1009,1030,19,979,206,1031,207,819,55,670,86,913,993,912,69,995,644,200,163,452,1032,249,928,439,995,911,1029,580,790,281,780,782,348,1033,967,90,637,365,366,123,228,398,403,4,245,1034,1035,1036,839,840,841,842,55,790,709,793,1004,921,747,1037,866,726,90,79,142,1028,177,987,546,12,105,211,254,989,516,94,922,785,759,760,760,492,539,540,923,934,1038,992,951,979,912,90,58,19,207,69,86,989,670,819,912,913,100,165,303,546,182,263,513,915,1024,100,165,4,516,513,920,366,228,4,1034,839,840,842,793,921,439,987,105,211,922,785,504,505,788,923,924,1029,349,148,413,84,702,703,504,505,735,931,4,580,793,924,921,925,79,932,1007,81,138,1008,975,976,977,978,933,806,90,19,912,69,925,313,297,62,149,177,155,152,804,805,633,633,680,753,594,1015,923,19,594,912,543,534,284,1039,79,932,63,934,58,19,69,86,670,819,912,913,100,165,4,709,513,920,915,366,228,4,1034,839,840,842,709,793,921,929,105,922,785,788,923,924,349,148,929,413,84,702,703,735,931,4,580,793,925,921,924,79,932,1007,81,138,157,1008,975,976,977,978,933,1040,1041,1042,1043,1044,581,806,39,934,100,62,165,303,546,263,513,297,409,385,987,152,105,211,633,633,922,785,504,505,788,923,924,349,148,409,413,84,702,703,504,505,735,931,79,932,81,138,1008,975,976,977,978,933,806,813,869,848,16,291,444,1,465,169,455,422,986,399,400,151,139,16,1045,732,1012,796,535,1013,998,999,1046,934,959,291,89,80,379,986,438,420,11,499,94,1012,966,758,762,674,796,535,934,969,963,99,1047,20,22,674,707,652,512,965,915,1024,99,123,453,1047,80,465,435,399,400,181,20,526,527,22,707,512,99,361,123,453,435,946,3,20,526,527,499,635,707,652,708,512,965,365,123,228,398,460,3,841,708,1002,1004,169,473,635,1012,966,967,930,796,535,968,969,361,365,3,243,1005,741,580,1006,968,1002,444,2,1048,970,971,972,973,974,975,976,977,978,933,722,89,18,980,77,912,915,142,874,443,731,1049,1013,1046,1050,123,402,3,708,402,3,1013,477,1019,1051,445,2,82,883,60,29,126,927,149,1039,105,17,208,761,997,805,806,1015,926,1038,959,1052,1053,722,806,979,928,768,892,365,123,228,398,402,460,3,841,1003,708,1002,1004,1,465,76,102,139,210,1045,732,661,1013,1046,934,1054,959,59,1,397,465,139,1014,509,1013,1046,969,1016,959,89,80,378,372,438,11,210,94,966,758,762,674,661,934,969,963,99,62,123,453,1047,80,465,378,181,526,527,22,707,525,512,99,123,453,3,526,527,707,708,512,965,365,123,228,398,460,3,708,1002,1004,1033,473,966,967,930,968,969,2,140,1048,970,971,972,973,974,975,976,977,978,933,89,18,1054,980,62,100,208,502,867,868,443,82,731,1049,1013,1046,1050,139,73,128,766,522,1013,1046,1016,477,194,1051,99,123,1047,435,454,707,99,123,435,454,3,708,123,402,3,708,402,3,445,2,82,1048,1055,89,305,282,1,419,12,610,611,39,636,595,596,1000,1001,79,142,442,1028,80,941,372,373,546,12,105,254,94,922,759,760,492,495,582,583,923,912,963,951,992,934,1001,99,100,123,165,80,182,263,526,527,652,512,1024,99,100,123,165,303,4,526,527,1035,1036,652,709,512,920,915,365,366,123,228,398,4,1035,1036,839,841,842,709,921,1001,1004,929,105,922,930,788,923,924,349,148,465,380,929,413,373,421,84,702,734,735,582,583,931,79,932,1007,138,157,1008,975,976,977,978,933,1009,1030,19,595,979,785,304,1,465,456,82,796,1056,1050,1,456,1017,11,1018,796,1019,985,1020,1021,1022,295,473,469,77,966,967,796,1050,968,969,1057,89,305,18,980,1057,733,929,125,969,295,1057,968,928,294,465,422,441,443,76,82,731,1054,59,73,128,766,522,509,1016,294,477,1051,89,80,758,762,99,123,454,3,707,708,965,473,967,968,445,2,82,970,971,972,973,974,348,28,441,76,154,2,522,1058,89,305,18,1054,980,348,329,731,312,313,1,397,465,765,804,680,753,1014,534,495,509,688,689,998,999,1015,969,1016,1053,959,99,123,80,181,182,526,527,652,512,1024,99,123,3,4,526,527,635,707,652,708,709,512,965,915,473,929,635,966,922,930,923,968,924,969,79,1007,138,1008,975,976,977,978,933,722,1009,1053,827,637,365,366,123,228,398,402,403,460,3,4,246,245,1035,1036,839,841,842,1003,708,709,911,1004,1002,921,1001,291,89,80,378,384,438,11,966,758,762,674,1056,934,969,961,963,1001,99,123,3,526,527,707,708,965,365,123,228,398,402,460,3,708,1002,1001,1004,473,966,967,930,968,969,348,465,379,473,413,420,83,967,930,734,969,402,3,1005,1006,1002,968,2,82,140,970,971,972,973,974,975,976,977,978,933,89,18,594,980,1001,3,464,923,979,758,499,546,29,863,847,329,333,79,62,350,932,63,1,465,455,986,401,102,139,765,996,997,732,998,999,934,1054,926,959,59,439,62,29,126,1,397,465,455,1059,401,139,105,208,765,997,804,1014,495,509,998,999,1015,969,926,1016,959,294,329,333,357,358,350,28,1,11,12,581,1019,1000,1001,99,62,123,724,80,465,181,182,401,526,527,22,652,525,512,915,1024,99,100,123,165,724,4,526,527,652,709,512,965,920,915,439,929,105,966,922,930,923,968,924,969,1030,19,926,979,993,546,758,1059,329,79,1010,1026,1027,350,442,1,406,465,941,102,16,996,998,999,934,1054,959,981,329,355,350,1,199,11,12,130,1019,1023,99,361,123,453,724,3,4,20,526,527,707,652,708,709,512,965,981,915,365,123,228,398,402,3,4,841,708,709,1002,921,1004,473,929,966,967,930,923,968,969,361,402,3,4,233,1005,741,580,1002,921,968,1006,925,348,349,465,379,473,929,413,372,420,83,504,967,930,734,969,931,924,87,956,957,370,371,542,367,368,369,575,32,34,1060,193,1061,872,87,122,1062,1063,132,281,282,283,863,864,865,352,866,867,899,844,845,868,869,870,871,872,1064,270,272,842,312,365,305,73,477,443,445,1047,465,402,194,435,455,473,454,438,181,76,154,2,128,246,140,1045,1035,1012,970,966,967,1005,758,722,766,522,796,707,509,757,661,525,820,1013,1046,1056,1050,1051,1058,968,969,965,1002,1054,1016,959,962,963,1006,993,59,294,348,329,99,291,295,361,162,355,365,89,357,123,441,1,80,397,176,1033,378,422,372,456,469,388,1017,57,460,77,3,243,11,16,20,246,737,617,804,635,731,839,841,674,734,741,566,708,595,688,662,1019,960,961,980,1023,59,313,90,79,123,350,28,303,442,453,126,444,1007,406,465,398,206,169,379,403,199,473,413,384,399,400,420,102,155,151,139,18,83,210,119,53,526,765,610,499,644,94,702,730,732,581,22,55,504,930,710,494,680,753,1003,495,535,537,538,689,580,539,512,998,1015,923,934,1009,924,969,979,1004,931,994,995,747,726,349,333,100,439,163,356,366,1030,358,62,1010,350,304,1028,724,927,149,177,941,380,946,986,373,914,464,987,389,399,400,182,419,401,421,138,4,244,12,17,84,21,245,130,157,738,1031,1034,1036,516,670,531,633,703,990,922,785,581,502,1065,1018,760,759,806,1014,652,740,709,597,594,819,567,793,513,1066,1000,985,920,921,1053,1052,992,747,951,925,981,912,915,911,1024,935,953,747,297,362,366,205,62,1026,1027,228,350,28,284,855,64,452,409,81,699,200,1059,1039,929,413,385,546,58,624,125,152,12,263,105,19,87,120,54,207,122,254,86,130,739,761,611,805,1037,500,696,704,727,733,1040,840,842,503,790,505,492,768,680,753,534,495,543,550,510,511,582,597,544,690,594,580,539,788,514,1067,1068,942,1069,1070,926,1038,1071,1001,1072,1029,964,952,913,916,917,1073,1074,1075,205,1026,1027,1010,228,350,165,29,142,284,63,148,855,64,149,81,699,403,200,1059,464,624,125,87,120,122,208,69,254,805,500,704,727,733,840,39,503,790,763,711,534,543,580,819,514,1067,1076,1000,942,1069,1070,921,926,1053,1052,1057,1071,1001,1029,981,964,952,913,916,1073,1024,935,1074,1075],"versions":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,6,6,6,6,6,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,24,24,24,24,24,8,16,24,24,24,24,24,1,6,24,24,24,24,8,16,24,24,24,24,24,24,24,24,24,24,24,24,8,16,24,24,24,24,24,24,24,24,8,16,8,16,16,24,24,24,24,24,24,24,24,24,24,8,16,8,16,16,8,24,8,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,16,24,8,24,24,24,24,24,24,24,24,16,24,24,8,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,16,16,24,8,8,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,16,16,24,8,8,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,8,8,16,16,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,8,8,16,16,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,8,8,24,24,16,16,8,16,24,24,24,24,24,24,24,24,24,24,24,24,8,8,24,24,16,16,8,16,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,8,8,8,16,16,16,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,8,16,8,8,16,16,24,16,24,24,24,24,24,24,24,24,24,24,24,24,24,8,16,8,8,16,16,24,16,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,16,24,24,24,16,24,24,24,16,24,24,24,16,8,16,24,16,24,24,24,16,24,16,24,24,24,16,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,16,16,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,16,16,24,24,24,24,24,24,16,16,24,24,24,24,24,24,16,16,24,24,24,24,24,24,16,16,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,4,4,6,6,6,6,6,6,6,6,6,2,2,6,6,6,6,6,6,6,6,6,6,6,2,4,6,6,6,6,6,6,6,6,6,6,6,6,6,2,4,2,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,4,6,6,2,4,2,2,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,4,6,6,6,6,6,6,6,6,6,6,4,6,6,6,6,6,6,6,6,6,6,6,6,2,6,6,6,6,4,2,6,6,2,4,4,2,6,6,6,6,6,4,4,6,2,4,6,2,2,4,2,4,6,6,6,6,6,6,6,6,6,2,4,6,6,2,2,4,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,4,6,2,2,6,6,6,6,6,6,6,6,6,6,6,6,4,4,6,6,6,6,6,6,6,6,6,6,2,6,6,2,6,4,6,6,6,6,6,6,6,6,6,6,6,2,2,6,4,6,6,4,6,2,4,6,6,2,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,4,6,6,2,4,6,6,6,6,6,6,6,6,6,6,6,4,6,6,6,4,4,2,2,6,6,6,6,6,6,2,4,2,6,6,6,2,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,4,4,2,6,6,6,6,6,6,2,2,6,6,6,6,4,6,6,6,6,6,6,6,6,6,6,4,4,6,6,6,4,6,6,2,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,2,6,6,6,6,4,6,6,6,6,6,6,6,6,6,6,4,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,1,1,6,6,6,6,6,6,2,4,6,6,6,6,6,6,2,4,6,6,6,6,6,6,6,2,4,6,6,6,6,6,6,6,6,2,4,6,6,6,6,6,6,6,6,2,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,6,2,4,6,6,6,6,6,6,6,6,6,2,2,6,4,6,6,6,6,4,6,6,6,6,6,6,6,2,4,6,6,2,6,6,6,6,6,6,6,6,6,6,6,6,4,6,6,6,6,2,4,6,6,6,6,6,6,6,6,6,6,4,4,2,2,6,6,6,4,2,6,6,2,6,6,6,6,2,4,6,6,6,6,6,6,4,4,6,6,6,6,6,6,2,6,6,2,2,6,6,6,6,6,6,6,6,6,6,6,6,2,4,6,6,6,6,6,4,4,4,2,6,6,6,6,6,6,4,6,6,6,6,6,2,4,2,4,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,4,2,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,4,2,2,6,2,4,6,6,6,6,2,6,6,6,6,6,6,6,6,6,4,2,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,4,2,6,6,6,6,6,6,6,6,2,4,2,4,6,6,6,6,6,6,4,4,2,2,2,4,2,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,4,6,6,6,2,6,6,6,6,6,6,6,6,4,2,6,6,6,6,6,6,6,6,6,4,2,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,6,6,6,6,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,4,6,6,6,6,2,4,2,2,6,6,6,6,6,6,6,6,6,6,6,2,4,2,4,2,6,6,6,2,4,4,4,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,4,6,2,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,2,6,4,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,4,6,6,2,4,2,4,2,4,6,6,6,6,6,6,6,6,6,6,6,6,6,2,4,6,6,6,2,2,6,4,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,6,6,6,6,6,6,6,6,6,6,2,2,6,6,6,6,4,6,6,6,4,6,2,4,6,6,4,4,4,6,6,6,6,6,6,2,4,6,6,6,6,6,6,6,6,6,6,4,6,6,6,6,6,6,6,6,6,6,4,4,6,6,6,6,6,6,6,4,6,6,6,6,6,6,6,6,6,6,4,6,6,6,6,6,6,6,6,6,6,6,6,2,6,6,6,6,4,2,6,6,2,4,4,2,6,6,6,6,6,4,4,6,2,4,6,2,2,4,2,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,6,2,4,6,6,6,6,6,6,6,6,6,2,2,6,4,6,6,6,6,4,6,6,6,6,6,6,6,2,4,6,6,2,6,6,6,6,6,6,6,6,6,6,6,6,4,6,6,6,6,2,4,6,6,6,6,6,6,6,6,6,6,4,4,2,2,6,6,6,4,2,6,6,2,6,6,6,6,2,4,6,6,2,6,2,4,6,6,6,6,6,6,6,6,6,6,6,2,2,6,4,6,6,4,6,2,4,6,6,2,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,4,6,6,2,4,6,6,6,6,6,6,6,6,6,6,6,4,6,6,6,4,4,2,2,6,6,6,6,6,6,2,4,2,6,6,6,6,2,4,6,6,6,6,6,6,6,6,6,6,6,6,2,4,2,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,4,6,6,2,4,2,2,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,4,2,6,6,6,6,6,4,6,6,6,6,6,2,4,2,4,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,2,4,2,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,4,2,6,6,6,6,6,4,6,6,6,6,6,2,4,4,6,6,6,6,6,6,6,6,6,6,6,6,2,2,6,6,6,6,6,4,6,6,6,2,6,6,6,6,6,4,4,6,6,6,4,6,2,6,6,6,32,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,64,96,96,96,32,32,32,96,96,32,64,96,96,96,64,32,64,64,64,32,32,32,64,64,64,32,64,32,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,32,64,32,64,64,32,64,32,64,32,64,96,96,96,32,32,64,64,32,64,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,64,64,64,64,32,32,32,96,96,64,64,64,32,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,64,32,64,64,32,64,32,32,64,32,32,64,96,96,96,96,96,96,96,96,96,64,32,64,32,96,64,32,64,32,64,96,32,96,96,32,32,64,32,64,32,64,64,32,64,32,64,32,64,96,96,96,32,32,64,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,64,32,32,32,64,96,96,96,32,64,32,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,32,64,64,64,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,64,64,96,32,96,32,96,96,96,96,32,32,64,64,96,32,64,96,96,96,96,96,32,32,64,64,96,32,64,32,64,32,64,64,32,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,64,64,32,32,96,32,64,96,96,96,96,32,32,32,32,32,64,64,64,64,64,96,96,96,96,96,96,96,32,32,32,64,64,64,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,96,32,64,96,96,96,96,32,64,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,64,32,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,32,64,96,96,96,32,64,96,32,32,32,64,32,64,96,32,64,96,96,96,96,96,64,64,32,32,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,64,32,96,32,64,64,64,64,32,32,32,96,96,96,96,96,96,96,96,96,96,96,64,96,96,96,32,96,96,96,96,96,96,64,64,96,96,96,96,32,96,32,96,96,96,96,96,96,96,96,96,32,96,64,96,96,96,96,96,32,64,96,96,96,96,96,96,32,96,64,96,96,96,32,64,64,96,96,96,64,64,32,32,32,96,96,96,96,96,96,96,64,96,96,96,32,32,64,64,32,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,64,32,96,96,96,96,96,64,32,96,96,96,96,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,96,96,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,32,64,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,64,32,32,32,96,96,96,32,96,64,96,96,64,64,64,64,32,32,32,32,96,96,64,96,32,96,32,96,64,96,96,96,96,96,96,96,96,64,32,64,32,64,32,64,32,64,32,32,64,32,64,32,64,32,64,32,64,32,32,64,32,96,32,64,96,96,96,32,64,96,96,96,96,32,64,32,64,96,96,96,32,64,96,96,96,32,64,96,96,96,32,64,96,96,96,96,96,32,64,96,32,96,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,64,64,64,32,32,32,96,96,96,32,96,64,96,96,64,64,64,64,32,32,32,32,96,96,64,96,32,96,32,96,64,96,96,96,96,96,96,32,64,32,64,96,96,96,96,96,96,32,64,32,64,32,64,32,64,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,64,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,64,64,64,32,32,32,96,96,96,96,96,64,64,64,32,32,32,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,32,64,32,96,96,96,96,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,64,64,64,32,32,32,96,96,96,96,96,64,64,64,32,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,64,32,32,32,96,96,96,96,96,64,64,64,32,32,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,64,64,64,32,32,32,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,64,64,32,64,32,32,64,32,32,64,96,96,96,96,96,96,96,96,96,64,32,64,32,96,64,32,64,32,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,32,64,96,96,96,96,64,96,64,32,96,32,96,64,96,96,96,32,32,64,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,32,96,96,96,32,96,64,32,96,64,32,64,32,96,64,64,32,64,96,32,96,96,96,96,96,96,64,64,96,32,32,64,96,96,32,96,64,96,96,96,64,64,32,32,32,96,96,96,96,96,96,64,96,96,96,32,32,64,64,32,96,96,96,96,96,96,64,32,96,64,32,32,64,64,32,96,64,32,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,64,32,96,64,32,96,96,64,32,96,96,64,32,96,64,32,96,96,96,96,96,32,32,96,96,64,96,96,96,64,32,32,64,64,64,64,96,32,32,96,96,32,64,64,32,96,96,96,32,32,64,64,96,96,32,64,96,64,32,96,64,32,96,96,96,64,32,96,64,32,32,64,64,32,96,64,32,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,64,32,96,64,32,64,32,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,64,96,96,96,32,64,64,32,96,96,96,96,64,32,96,96,96,96,64,32,64,32,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,32,64,96,32,64,96,96,96,96,96,32,64,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,96,64,64,96,96,96,96,96,32,96,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,64,32,32,32,96,96,96,32,96,64,96,96,64,64,64,64,32,32,32,32,96,96,64,96,32,96,32,96,64,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,64,96,96,96,32,64,64,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,32,64,96,96,32,64,96,96,96,32,64,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,32,64,96,96,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,32,32,96,64,64,96,96,96,96,96,32,96,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,32,64,96,96,96,96,32,64,96,96,96,96,64,96,32,64,96,96,96,32,64,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,32,96,96,32,96,64,64,96,32,64,64,96,96,96,96,96,96,96,96,32,32,32,32,32,64,64,64,64,64,96,96,96,96,96,96,96,32,32,32,64,64,64,96,96,32,64,96,96,96,96,32,32,32,64,64,64,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,32,32,64,96,96,96,32,64,32,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,32,96,64,64,96,32,64,64,96,96,96,96,96,96,96,32,32,64,32,64,32,64,64,32,64,32,64,32,64,96,96,96,32,32,64,64,32,64,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,64,64,32,32,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,96,96,96,96,96,32,32,96,96,32,64,96,96,96,32,64,96,96,96,32,32,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,32,96,64,64,96,32,64,64,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,32,32,64,96,96,96,32,64,32,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,96,96,32,64,96,96,32,64,96,96,32,64,96,96,96,64,32,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,32,64,32,64,32,64,96,96,96,96,96,32,64,32,64,32,64,32,64,32,64,96,32,32,64,96,96,32,64,96,96,96,96,96,96,96,96,96,64,32,32,64,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,64,32,96,96,96,96,96,96,96,32,96,96,32,64,64,32,96,96,96,64,32,64,32,96,96,96,96,96,96,96,96,96,32,64,32,64,96,96,96,96,96,96,96,32,64,96,96,32,64,96,96,32,64,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,32,64,32,64,32,64,32,64,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,32,64,96,32,64,96,96,96,96,96,96,96,96,64,32,32,64,32,64,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,32,96,96,96,64,32,96,96,32,64,32,32,64,32,32,64,64,96,96,96,96,96,96,96,96,96,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,96,96,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,32,32,64,32,64,32,64,64,32,64,32,64,32,64,96,96,96,32,32,64,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,32,64,64,64,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,32,32,32,32,32,64,64,64,64,64,96,96,96,96,96,96,96,32,32,32,64,64,64,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,32,32,64,96,96,96,32,64,32,64,96,32,96,96,96,64,96,96,96,96,96,96,32,32,96,96,32,64,96,96,96,32,64,96,96,96,32,32,96,96,32,64,64,32,96,96,96,96,96,96,96,64,64,64,64,32,32,32,96,96,64,64,64,32,32,32,96,96,96,96,96,96,96,32,32,64,32,64,32,64,64,32,64,32,64,32,64,96,96,96,32,32,64,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,64,64,64,64,32,32,32,96,96,64,64,64,32,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,32,96,64,64,96,32,64,64,96,96,96,96,96,96,96,96,32,32,32,64,64,64,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,32,96,64,64,96,32,64,64,96,96,96,96,96,96,96,64,64,96,32,96,32,96,96,96,96,32,32,64,64,96,32,64,96,96,96,96,96,32,32,64,64,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,32,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,32,96,32,64,96,96,96,96,64,32,96,96,96,96,64,32,64,96,96,64,32,32,64,96,96,96,64,32,64,96,96,96,96,96,96,96,96,96,64,32,32,64,96,96,96,96,96,96,32,64,32,64,32,64,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,32,32,64,64,64,96,32,32,96,64,32,64,64,32,96,32,64,96,64,32,32,64,32,64,64,32,96,96,96,32,64,96,64,32,96,96,64,32,64,32,64,96,64,32,64,32,96,64,32,32,32,96,96,64,32,64,96,96,96,96,96,32,32,96,96,64,96,96,96,64,96,64,32,96,96,96,96,64,32,96,64,32,96,64,32,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,64,96,96,96,96,96,64,32,96,96,96,96,32,64,32,64,64,32,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,96,96,96,96,32,32,96,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,64,32,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,96,96,64,64,32,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,64,32,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,64,32,64,96,64,32,96,96,32,64,64,32,32,96,96,96,32,32,32,64,64,96,96,64,96,64,32,96,96,96,96,96,96,96,96,64,64,32,32,96,96,96,96,64,96,96,96,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,64,32,64,96,64,32,64,32,96,64,32,32,32,96,96,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,96,32,64,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,32,64,64,64,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,64,64,32,64,32,32,64,32,32,64,96,96,96,96,96,96,96,96,96,64,32,64,32,96,64,32,64,32,64,96,32,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,64,64,32,32,96,32,64,96,96,96,96,96,96,96,96,96,96,64,32,96,96,32,64,96,96,96,96,96,32,64,96,96,96,96,96,96,32,64,32,64,32,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,32,64,96,64,32,96,64,32,64,32,96,96,96,96,96,64,32,32,64,64,32,32,64,64,64,32,32,32,64,64,64,32,32,64,64,32,32,32,64,32,64,32,64,96,64,32,96,64,32,64,32,96,96,96,96,96,64,32,96,32,96,64,64,64,96,64,96,96,32,32,96,96,96,32,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,32,64,96,64,64,64,32,96,32,64,64,32,96,96,32,64,96,32,64,64,64,32,32,64,64,64,64,32,64,64,32,32,32,32,64,32,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,32,64,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,96,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,32,32,96,96,96,96,64,32,96,96,96,96,64,96,32,96,64,64,96,96,96,96,96,96,96,64,64,64,32,32,32,96,32,64,96,96,96,96,96,64,64,64,96,32,64,32,32,32,96,64,64,64,32,32,32,96,96,96,32,96,64,96,96,64,64,32,32,32,32,96,96,64,96,32,96,32,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,64,32,32,32,96,96,96,96,96,96,96,96,96,96,64,64,32,32,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,32,32,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,64,32,32,32,96,96,96,96,96,96,96,96,96,96,64,64,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,64,64,96,96,96,32,64,96,96,96,96,32,32,32,64,96,96,64,64,96,32,96,64,32,32,32,64,96,32,64,32,64,96,32,64,96,96,32,64,96,96,96,32,64,32,64,96,96,96,96,96,96,96,96,32,64,96,96,96,96,64,32,64,96,96,96,96,96,96,96,96,96,32,64,96,32,64,96,96,32,64,32,64,96,96,32,64,32,64,32,64,32,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,64,32,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,64,96,32,32,96,64,32,64,64,32,96,32,64,96,64,32,96,96,96,32,32,32,64,64,96,96,64,96,64,32,96,96,96,96,64,96,96,96,32,96,96,96,96,96,96,96,96,96,96,96,64,64,32,32,96,96,96,96,96,64,32,64,32,32,64,64,32,64,32,64,32,64,64,32,32,64,32,64,32,64,32,64,32,64,32,64,32,64,32,64,32,32,64,32,64,32,64,32,64,32,64,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,64,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,32,64,64,32,96,64,32,64,64,96,64,32,64,32,32,32,96,96,96,96,96,64,64,96,32,32,64,96,96,32,96,64,32,96,64,32,64,32,64,32,32,64,64,64,64,96,32,64,32,32,32,64,32,64,64,64,32,32,32,64,64,64,32,64,32,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,64,32,96,96,96,96,96,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,64,32,96,64,32,64,32,96,96,32,96,64,64,64,96,64,96,96,32,32,96,96,96,32,96,96,96,96,96,96,64,64,32,32,96,96,96,96,64,96,96,96,96,32,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,64,32,32,32,96,32,64,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,64,32,64,32,96,96,96,96,64,32,96,96,96,32,64,32,64,96,96,32,64,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,32,96,96,96,96,32,64,96,64,32,64,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,32,64,32,64,32,64,32,64,32,64,32,64,32,64,32,64,32,64,32,64,32,64,64,32,32,64,32,64,32,64,32,32,64,64,32,64,32,64,32,64,32,64,32,64,32,64,32,64,32,64,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,64,96,96,96,96,96,32,64,96,96,96,96,96,96,32,96,64,96,96,96,32,64,96,64,32,96,96,96,96,64,32,96,64,32,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,32,64,96,96,32,32,64,32,32,64,32,32,64,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,64,32,96,64,32,64,32,96,64,64,32,64,96,96,32,96,96,96,96,96,96,64,64,96,32,32,64,96,96,32,96,32,96,64,32,96,64,32,64,32,96,64,64,32,64,96,96,32,96,96,96,96,96,96,64,64,96,32,32,64,96,96,32,96,64,32,96,96,96,96,64,32,96,96,96,96,64,32,64,32,96,96,96,96,96,96,96,96,32,32,64,64,96,96,64,32,96,96,96,96,64,32,96,96,96,96,64,32,64,32,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,32,64,96,64,32,96,64,32,64,32,32,64,32,64,64,32,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,32,64,96,64,32,96,64,32,64,32,32,64,32,64,64,32,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,96,32,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,64,64,32,32,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,96,64,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,32,32,32,64,64,64,64,64,96,96,96,96,96,96,96,32,32,32,64,64,64,96,96,32,64,96,96,96,64,64,96,32,96,32,96,96,96,96,32,32,64,64,96,32,64,96,96,96,96,96,32,32,64,64,96,32,64,32,64,32,64,96,96,96,96,64,32,64,32,64,32,64,32,64,32,64,32,32,64,32,32,64,64,32,32,64,32,32,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,96,32,96,96,32,64,96,96,32,64,96,96,96,96,32,64,96,32,64,96,32,64,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,64,64,32,64,32,32,64,32,32,64,96,96,96,96,96,96,96,96,96,64,32,64,32,96,64,32,64,32,64,96,32,96,96,64,32,96,96,96,96,96,96,96,64,64,64,64,32,32,32,96,96,64,64,64,32,32,32,96,96,96,96,96,96,96,96,64,96,96,96,96,96,96,32,32,96,96,32,64,96,96,96,32,64,96,96,96,32,32,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,64,64,32,32,96,32,64,96,96,96,96,64,96,96,96,96,96,96,32,32,96,96,32,64,96,96,96,32,64,96,96,96,32,32,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,32,64,96,32,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,64,64,64,64,32,32,32,96,96,64,64,64,32,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,32,32,64,96,96,96,32,64,32,64,96,32,96,96,96,96,96,96,96,96,96,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,96,32,96,32,96,96,96,96,32,32,64,64,96,32,64,96,96,96,96,96,32,32,64,64,96,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,96,96,96,96,96,32,32,96,96,32,64,96,96,96,32,64,96,96,96,32,32,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,32,32,64,64,96,64,32,64,64,32,32,64,32,96,32,64,32,64,64,32,64,32,32,64,64,96,96,96,32,64,32,64,32,32,64,32,64,32,64,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,64,32,64,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,96,96,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,32,64,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,64,32,32,64,32,64,64,32,64,32,64,32,64,32,64,32,64,32,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,32,96,96,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,96,64,64,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,32,64,96,96,32,96,96,96,96,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,32,64,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,32,64,64,32,64,64,32,64,96,96,64,64,32,96,64,32,64,96,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,64,32,96,32,64,64,32,96,64,32,64,64,96,64,32,64,32,32,32,96,96,96,64,64,96,96,96,96,32,32,96,32,64,32,64,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,32,64,96,64,32,96,64,32,64,32,32,64,32,64,64,32,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,32,64,96,64,32,96,64,32,64,32,32,64,32,64,64,32,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,32,32,96,96,64,32,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,96,96,96,96,96,96,64,96,32,96,96,96,96,96,96,96,96,32,64,64,32,64,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,64,64,64,32,32,32,96,96,96,96,96,96,96,96,96,96,64,64,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,32,64,64,96,32,32,96,96,96,64,32,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,64,96,96,96,32,96,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,32,64,64,96,64,96,96,96,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,96,32,64,96,96,32,96,96,32,64,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,96,96,96,32,96,64,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,64,96,32,32,96,64,32,64,64,32,96,32,64,96,64,32,32,32,64,64,96,96,32,64,96,64,32,96,64,32,96,96,96,96,96,96,96,96,64,32,64,32,96,64,32,96,96,64,32,96,96,96,96,96,32,96,96,64,96,96,96,64,96,64,32,96,32,64,64,32,96,64,32,64,64,96,64,32,64,32,32,32,32,32,32,32,64,64,64,64,64,32,32,32,64,64,64,32,32,32,64,64,64,32,64,32,96,64,32,96,64,32,96,64,32,96,96,96,64,32,96,96,96,96,96,64,64,96,96,96,96,32,32,96,32,64,32,64,32,32,64,64,64,32,64,96,64,32,96,96,32,64,64,32,32,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,64,96,96,96,96,32,32,64,64,32,96,96,96,96,96,96,96,96,96,64,32,96,96,96,64,32,96,32,64,64,64,64,32,32,32,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,32,32,32,64,64,64,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,64,32,96,64,32,64,32,96,96,32,96,64,64,64,96,64,96,96,32,32,96,96,96,32,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,32,32,32,64,64,64,64,64,96,96,96,96,96,96,96,32,32,32,64,64,64,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,96,96,96,64,32,32,64,96,96,96,96,32,64,96,96,96,96,96,96,32,64,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,32,64,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,32,32,32,64,64,64,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,64,32,96,64,32,96,96,96,64,32,96,96,64,64,96,96,96,96,96,96,32,32,32,96,96,64,96,96,96,96,32,64,96,96,32,64,96,96,96,96,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,256,128,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,128,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,64,96,96,96,96,32,32,64,64,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,32,64,96,32,64,96,96,96,96,96,32,64,96,96,96,96,96,96,96,32,64,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,64,32,96,96,96,96,64,96,96,96,96,96,96,96,96,96,96,96,64,64,64,32,32,32,96,96,96,96,96,96,96,96,96,96,64,64,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,96,96,96,96,96,96,96,96,32,32,64,64,96,96,96,32,32,96,64,64,96,96,96,96,96,32,96,96,64,96,96,96,96,96,96,96,96,96,96,96,96,96,64,64,64,32,32,32,96,32,64,96,96,96,96,96,64,64,64,96,32,64,32,32,32,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,384,384,384,128,128,384,384,384,384,256,256,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,128,256,256,256,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,128,256,384,384,384,384,384,384,384,384,384,384,384,128,128,256,256,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,128,256,384,384,384,384,384,384,384,384,384,128,128,384,384,384,128,256,384,384,384,384,384,384,256,384,384,384,384,384,384,128,384,384,128,256,384,384,384,384,384,384,384,384,384,128,384,384,128,256,384,384,384,384,384,384,256,384,384,384,384,384,384,128,384,384,128,256,128,256,384,384,384,384,128,256,384,384,384,384,128,128,128,128,256,256,256,256,128,256,384,128,256,128,256,128,256,128,256,128,256,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,256,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,128,384,384,384,384,384,384,384,384,384,256,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,128,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,128,384,384,384,256,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,256,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,128,256,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,256,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,128,128,256,256,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,256,384,384,384,384,384,384,256,384,384,384,384,384,128,128,256,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,128,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,128,128,256,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,128,128,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,256,128,384,384,256,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,256,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,128,256,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,256,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,256,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,256,256,384,384,384,384,384,384,384,384,384,384,256,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,128,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,256,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,128,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,256,384,384,384,384,384,384,384,384,384,128,256,24,24,6,6,6,6,6,6,6,384,6,384,384,384,384,384,384,6,4,4,4,2,2,2,6,4,2,6,6,6,6,6,6,6,6,6,2,4,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,128,256,384,384,384,384,384,384,384,384,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,256,384,384,384,384,384,384,384,384,256,384,384,384,128,128,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,256,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,256,384,384,384,384,384,384,384,384,384,128,384,384,384,384,384,384,384,384,256,384,384,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,128,256,384,384,384,384,384,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,256,384,384,384,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,128,384,384,384,384,256,384,384,384,384,384,384,384,384,384,128,384,384,128,384,384,384,384,384,384,384,384,384,256,384,384,384,384,128,256,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384],"method":[0,0,0,0,0,0,1,2,2,2,2,3,3,0,0,0,4,4,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,2,2,3,3,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,3,3,3,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,7,0,0,0,0,0,0,1,1,4,4,4,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,3,3,3,3,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,2,2,3,0,4,4,4,4,4,4,4,4,6,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,2,2,3,3,0,0,0,0,0,4,4,4,0,0,0,0,0,0,0,2,2,3,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,1,2,3,3,4,4,4,4,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,3,3,3,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,7,4,0,0,0,0,0,0,0,0,0,0,1,2,2,3,0,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,1,1,1,1,1,1,2,2,3,3,0,0,0,0,4,4,4,4,4,0,0,0,0,0,0,0,0,0,0,0,2,2,3,8,8,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,0,0,0,0,0,0,0,0,0,0,1,2,2,3,3,4,4,4,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,2,2,2,2,3,3,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,0,0,0,2,2,3,3,4,4,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,2,3,3,4,4,4,4,4,4,7,7,0,0,0,0,0,0,0,1,1,1,1,1,2,2,3,3,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,1,1,1,1,1,1,2,2,3,3,0,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,6,0,0,0,0,0,0,0,0,0,0,1,1,1,1,2,3,4,7,0,0,0,1,1,2,3,4,4,0,0,0,0,0,0,1,2,3,3,3,0,0,0,0,0,0,1,2,4,4,6,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,3,3,0,0,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,1,2,2,3,0,4,4,4,4,6,0,0,0,0,1,2,2,3,0,0,0,0,4,4,4,6,0,0,0,0,0,0,0,1,1,2,4,4,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,2,2,2,2,2,3,3,0,0,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,0,0,0,0,0,0,2,2,3,3,0,0,0,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,3,3,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,0,0,0,0,0,0,1,2,2,2,3,3,4,4,4,4,4,4,4,4,6,0,0,2,4,6,0,0,1,1,1,2,2,4,4,6,7,0,0,0,0,0,0,0,1,2,2,3,3,0,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,0,0,0,0,0,0,0,0,0,0,0,1,2,2,3,3,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,0,1,1,1,1,2,2,3,4,4,4,4,4,0,0,0,0,0,0,0,2,2,3,0,0,0,4,4,4,4,4,0,0,0,0,0,0,0,0,0,0,0,1,1,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,7,0,0,0,3,6,0,0,0,0,0,0,0,0,0,0,0,0,1,2,2,3,3,4,4,4,6,4,0,2,2,0,0,0,0,0,4,0,0,0,0,0,0,3,0,0,0,0,0,0,2,2,3,0,0,0,0,0,0,0,4,4,4,4,5,5,5,0,0,0,0,0,0,0,1,1,2,2,3,0,4,4,4,4,4,4,4,4,4,7,7,0,0,0,0,0,0,0,0,1,2,3,0,0,7,7,0,0,0,0,0,0,0,0,1,1,1,1,1,2,3,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,7,9,9,9,9,9,9,10,10,11,12,12,13,13,4,14,0,0,0,0,1,1,1,2,0,0,4,4,4,6,0,0,0,0,2,2,3,4,4,0,0,0,0,0,0,0,0,1,1,1,1,1,2,0,4,6,0,0,0,0,0,0,0,0,1,1,1,1,2,3,0,4,4,4,4,4,7,0,0,0,0,0,0,0,0,0,2,3,3,0,0,0,0,0,1,2,2,3,3,0,4,4,4,0,0,0,0,0,0,0,0,2,2,3,3,0,4,4,4,4,4,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,3,3,8,8,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,0,1,1,1,1,2,2,3,3,0,0,0,0,0,6,7,0,0,0,0,0,0,0,0,0,0,0,1,1,2,3,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,0,0,0,0,0,0,2,2,3,3,4,4,4,4,6,7,0,0,0,0,2,2,0,0,0,0,0,0,0,4,4,4,4,0,0,7,7,3,0,0,0,0,0,0,0,0,0,1,2,3,3,4,4,4,4,6,7,0,0,0,0,0,0,3,3,6,7,0,0,0,0,0,0,0,0,0,0,3,4,6,1,0,0,0,0,0,0,0,0,0,0,1,2,2,2,3,4,4,4,4,4,4,0,0,0,0,0,0,0,0,1,1,7,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,3,4,4,4,4,0,0,0,0,0,0,1,1,1,2,2,3,5,5,5,5,5,5,5,5,5,5,5,5,5,6,0,0,0,0,0,2,2,3,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,0,0,0,0,0,1,1,1,1,2,3,4,4,5,5,6,0,0,0,2,2,3,0,0,0,0,4,4,0,0,0,0,0,0,0,0,1,1,1,1,2,2,0,0,0,0,0,0,0,0,0,4,4,4,0,0,0,0,0,0,0,0,0,0,1,2,2,3,3,0,0,4,4,0,0,0,0,0,1,1,1,1,2,2,3,3,4,4,4,4,6,0,0,0,0,1,1,3,6,15,15,15,15,15,15,15,0,0,0,0,0,0,0,0,0,1,1,2,3,4,0,0,0,2,2,3,16,0,0,0,0,0,0,2,2,3,3,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,0,0,0,1,1,1,1,2,3,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,7,0,0,0,0,1,1,2,3,4,6,6,6,7,7,7,7,7,7,17,17,17,9,9,9,9,17,17,17,17,17,7,7,9,9,9,9,9,9,17,17,17,17,17,17,17,17,9,9,9,9,9,9,17,17,17,17,17,17,17,17,9,9,9,9,9,9,9,9,17,17,17,17,17,17,17,9,9,9,9,9,9,9,9,9,18,18,18,17,17,17,17,17,17,17,19,9,9,9,9,9,9,9,9,17,17,17,9,9,9,9,9,9,9,9,9,18,18,18,17,17,17,17,17,17,17,17,9,9,9,9,9,9,9,9,9,9,9,9,17,17,17,17,17,17,17,17,9,9,9,9,9,9,9,9,9,9,9,9,17,17,17,17,17,17,17,17,9,9,9,9,9,9,9,9,9,17,17,17,17,17,17,17,9,9,9,9,9,9,9,9,9,9,18,18,18,18,18,17,17,17,17,17,17,17,9,9,9,9,9,9,9,18,18,18,18,18,17,17,17,17,17,17,17,17,9,9,9,9,9,9,9,9,9,9,18,18,18,18,18,17,17,17,17,17,17,17,17,9,9,9,9,9,9,9,9,9,9,18,18,18,18,18,17,17,17,17,17,17,17,17,9,9,9,9,9,9,9,9,9,9,9,9,17,17,17,17,17,17,17,17,9,9,9,9,9,9,9,9,9,9,9,9,17,17,17,17,17,17,17,17,9,9,9,9,9,9,9,17,17,17,17,17,17,17,17,7,9,9,9,9,9,9,9,9,9,9,9,17,17,17,17,17,17,17,17,9,9,9,9,9,9,9,18,18,18,18,18,17,17,17,17,17,17,17,17,18,18,18,18,18,18,17,17,17,17,17,17,17,17,18,18,18,18,18,17,17,17,9,9,9,9,9,9,9,9,9,9,9,9,18,18,18,18,18,17,17,17,17,17,17,17,17,9,9,9,9,18,18,18,17,17,17,17,17,17,17,9,9,9,9,9,9,9,9,9,9,9,18,18,18,17,17,17,17,17,17,17,9,9,9,9,9,9,9,9,9,18,18,18,17,17,17,17,17,17,17,17,16,9,9,9,9,9,9,9,9,9,18,18,18,17,17,17,17,17,17,17,17,16,20,16,16,16,20,20,20,20,16,20,20,20,20,20,16,16,16,16,9,9,9,9,9,9,9,9,9,9,9,9,9,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,18,18,18,18,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,18,18,18,18,7,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,7,7,16,16,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,18,18,18,18,18,15,15,15,15,15,15,15,15,18,18,18,18,18,7,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,21,21,21,21,21,21,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,9,9,9,9,9,9,9,9,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,10,10,10,10,11,12,12,13,13,13,10,10,11,12,12,13,13,13,13,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,10,10,11,12,12,13,13,20,9,9,9,9,9,9,9,9,9,9,9,4,14,16,16,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,9,9,9,9,9,9,9,10,10,10,10,11,12,12,13,13,13,4,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,9,10,10,10,10,11,12,12,12,13,13,13,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,16,22,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,10,10,10,10,11,12,12,13,13,13,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,22,15,15,15,15,15,9,9,9,9,9,9,10,10,11,12,12,13,13,4,14,7,9,9,10,10,11,12,12,13,13,4,16,16,16,14,7,7,7,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,10,10,11,12,12,13,13,15,15,15,15,15,15,15,15,15,15,15,15,15,15,10,10,11,12,12,13,13,11,12,13,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,10,10,11,12,12,13,13,13,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,9,9,9,9,9,9,9,9,9,9,9,14,15,7,20,15,15,15,15,15,10,10,10,10,11,12,12,13,13,15,15,15,15,15,15,10,10,10,10,11,12,12,13,13,10,10,11,12,12,13,13,13,15,15,15,15,15,10,10,10,10,11,11,11,12,12,12,12,13,13,13,13,10,11,12,12,13,13,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,9,9,9,9,9,9,10,11,12,12,13,13,9,9,4,14,14,14,14,9,9,9,9,9,4,14,9,9,9,9,9,9,10,10,11,12,12,13,13,4,14,14,9,9,9,9,9,9,10,10,11,12,12,13,13,14,14,9,9,9,9,9,9,14,9,9,9,9,10,10,10,10,11,12,12,13,13,13,14,9,9,9,9,10,10,11,12,12,13,13,14,14,14,9,9,9,9,9,9,9,9,9,4,14,9,9,9,9,9,4,14,14,9,9,9,9,9,9,9,9,10,10,11,12,12,13,13,4,14,9,9,9,9,9,9,9,9,9,10,10,11,12,12,13,13,4,14,14,14,14,7,9,9,9,9,9,9,9,9,9,14,14,14,14,9,9,9,9,9,9,9,9,9,10,10,11,12,12,13,13,14,14,9,9,9,9,9,9,9,9,9,14,9,9,9,9,9,9,9,9,9,14,9,9,9,9,9,9,10,10,11,12,12,13,13,14,9,9,9,9,9,9,9,10,10,11,12,12,13,13,14,9,9,9,9,10,10,10,10,11,12,12,13,13,13,4,14,9,9,9,9,9,9,9,9,9,10,10,11,12,12,13,13,4,14,14,9,9,9,9,9,9,9,9,4,14,14,9,9,9,9,9,9,9,9,9,4,14,9,9,9,9,9,9,9,9,4,14,9,9,9,9,9,9,10,10,10,10,11,12,12,13,13,4,14,10,10,10,10,11,12,12,13,13,13,10,10,10,10,11,12,12,13,13,13,13,9,9,9,9,9,9,9,9,9,10,10,10,10,11,12,12,13,13,13,4,14,14,14,14,9,9,9,9,9,9,9,9,9,9,10,10,10,10,11,12,12,13,13,13,4,14,10,10,10,11,12,12,13,13,13,13,9,9,9,9,9,9,9,9,9,10,10,11,12,12,13,13,13,4,14,14,9,9,9,9,9,9,9,9,9,9,10,10,11,12,12,13,13,4,14,14,9,9,9,9,9,9,9,9,10,10,10,10,10,10,11,12,12,13,13,13,4,14,14,20,9,9,9,9,9,9,9,9,9,9,9,9,10,10,11,12,12,13,13,4,14,9,9,9,9,9,9,9,9,9,10,10,11,12,12,13,13,4,14,14,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,11,12,13,4,14,14,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,11,12,12,13,13,13,13,4,14,20,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,9,9,9,9,9,9,9,9,9,9,9,9,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,7,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,10,10,10,11,12,12,13,13,13,9,9,9,9,9,9,9,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,15,15,15,15,15,15,15,15,15,15,15,15,7,10,10,11,12,12,13,13,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,9,9,9,9,10,10,10,10,11,12,12,13,13,13,4,14,7,9,9,9,9,9,9,9,9,9,14,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,10,11,12,13,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,10,10,11,12,13,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,24,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,24,24,24,25,25,25,25,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,16,15,15,15,15,15,15,15,15,10,10,26,26,26,26,26,26,26,26,26,26,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,24,25,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,1,1,1,1,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,24,24,25,25,25,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,20,20,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,24,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,25,25,25,15,15,15,15,15,15,15,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,7,7,7,7,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,1,1,1,10,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,26,24,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,1,1,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,24,24,25,25,25,9,9,9,9,9,9,9,9,9,9,28,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,24,24,24,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,7,7,7,16,9,9,9,9,9,9,9,25,25,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,24,24,9,9,9,9,9,9,9,9,9,9,9,9,9,9,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,15,15,15,15,15,15,15,15,29,29,29,29,29,29,29,29,26,26,15,15,15,15,15,15,15,15,25,25,25,29,29,29,29,29,29,29,29,29,29,26,26,26,26,26,26,26,26,26,9,9,9,9,9,9,9,9,9,29,29,29,29,29,9,9,9,9,9,9,9,9,9,9,9,9,9,9,29,29,29,29,29,29,29,29,29,29,9,9,9,9,9,9,9,9,9,9,9,9,9,29,29,29,29,29,29,29,29,26,26,9,9,9,9,9,9,25,25,25,9,9,9,9,9,9,29,29,29,29,29,29,26,26,9,9,9,9,9,9,25,25,25,9,9,9,9,10,10,10,29,29,29,29,29,29,26,26,26,9,9,9,9,9,9,24,24,9,9,9,9,9,9,9,9,9,29,29,29,29,29,29,26,9,9,9,9,9,9,9,24,25,25,25,9,9,9,9,9,9,9,9,9,9,9,29,29,29,29,29,29,29,26,9,9,9,9,9,9,9,9,9,24,25,25,25,9,9,9,9,9,9,9,9,29,29,29,29,29,29,29,29,29,26,16,9,9,9,9,9,9,9,9,9,9,24,25,25,25,9,9,9,9,9,9,9,9,29,29,29,29,29,29,29,29,29,29,21,21,21,21,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,9,9,9,9,9,9,29,29,29,29,29,29,29,29,29,29,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,29,29,29,29,29,29,29,29,26,26,9,9,9,9,9,9,9,9,9,9,9,9,29,29,29,29,29,29,29,29,29,9,9,9,9,25,25,25,9,9,9,9,9,9,9,10,10,10,10,29,29,29,29,26,9,9,9,9,24,25,25,25,25,25,9,9,9,9,9,9,9,9,9,10,10,10,10,29,29,29,29,26,26,26,26,26,9,9,9,9,24,9,9,9,9,9,9,29,29,29,29,9,9,9,9,9,9,9,9,9,9,9,24,24,25,25,25,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,24,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,30,30,30,30,30,30,30,30,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,10,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,24,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,30,30,30,30,30,30,1,1,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,24,24,25,25,25,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,24,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,29,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,26,26,26,20,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,24,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,1,1,26,26,26,26,26,26,26,26,26,9,9,9,9,25,25,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,25,25,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,26,26,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,25,25,25,25,25,25,20,7,9,9,9,9,24,24,25,25,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,26,26,26,26,26,26,26,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,7,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,24,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,24,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,30,30,1,1,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,26,26,26,26,26,26,26,9,9,9,9,9,9,9,9,24,24,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,16,16,16,16,16,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,16,16,25,25,25,20,9,9,9,9,9,9,9,9,9,9,9,9,9,9,29,29,29,29,29,29,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,24,24,25,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,24,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,16,16,16,16,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,7,9,9,9,9,9,9,9,9,9,9,24,24,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,25,25,25,9,9,9,9,9,9,9,9,29,29,29,29,29,29,29,29,29,29,29,26,7,7,7,7,7,9,9,9,9,9,9,9,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,24,24,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,0,0,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,20,20,20,20,20,20,20,20,20,20,20,7,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,24,24,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,1,1,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,20,7,7,9,9,9,9,24,24,24,24,25,25,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,1,1,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,20,20,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,7,7,7,7,7,7,26,9,9,9,9,9,9,9,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,15,15,15,15,15,15,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,24,24,9,9,9,9,9,9,9,9,9,9,9,9,1,1,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,32,32,32,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,32,32,32,32,32,32,32,32,32,32,32,32,32,32,33,33,33,33,7,7,7,7,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,25,25,25,25,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,9,9,9,9,24,24,25,25,25,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,20,20,20,20,20,20,20,20,20,20,20,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,20,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,32,32,32,32,32,32,32,32,32,32,32,33,33,7,16,16,16,0,20,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,20,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,34,34,34,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,34,34,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,34,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,33,33,33,33,33,33,7,7,7,0,0,0,20,16,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,34,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,34,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,34,34,34,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,33,33,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,7,7,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,34,34,34,7,0,0,0,0,0,0,0,0,0,0,0,0,32,0,0,0,0,0,0,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,32,32,32,32,32,33,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,34,34,34,7,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,34,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,7,32,32,32,32,32,32,32,32,33,33,35,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,32,32,32,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,7,16,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,7,34,34,34,34,34,34,34,34,7,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,34,34,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,34,16,16,16,16,21,21,21,21,21,21,21,7,7,7,7,32,32,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36],"chance":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,20.0,null,null,5.0,45.0,10.0,90.0,10.0,100.0,45.0,55.0,45.0,55.0,40.0,22.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,35.0,10.0,15.0,5.0,35.0,35.0,10.0,5.0,15.0,35.0,35.0,10.0,5.0,15.0,35.0,35.0,10.0,5.0,15.0,35.0,35.0,10.0,20.0,35.0,35.0,10.0,20.0,35.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,45.0,15.0,40.0,35.0,10.0,40.0,15.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,60.0,35.0,5.0,40.0,30.0,30.0,30.0,null,null,null,null,null,null,null,15.0,15.0,30.0,20.0,20.0,20.0,60.0,35.0,5.0,null,null,null,null,null,15.0,15.0,30.0,20.0,20.0,20.0,60.0,35.0,5.0,null,null,null,null,null,30.0,40.0,30.0,40.0,20.0,20.0,20.0,null,60.0,40.0,null,null,null,null,null,25.0,35.0,30.0,40.0,20.0,20.0,5.0,20.0,null,45.0,10.0,45.0,60.0,40.0,null,null,null,null,null,null,20.0,10.0,30.0,20.0,15.0,20.0,5.0,null,60.0,35.0,5.0,20.0,10.0,20.0,20.0,15.0,10.0,20.0,5.0,null,45.0,10.0,45.0,60.0,35.0,5.0,null,null,null,null,null,15.0,15.0,15.0,15.0,19.0,100.0,15.0,19.0,100.0,4.0,100.0,null,60.0,35.0,5.0,null,null,null,null,null,15.0,15.0,15.0,15.0,19.0,100.0,15.0,19.0,100.0,4.0,100.0,null,60.0,35.0,5.0,null,null,null,null,null,20.0,10.0,20.0,10.0,15.0,5.0,15.0,5.0,null,60.0,40.0,null,null,null,null,null,15.0,10.0,15.0,10.0,15.0,5.0,15.0,5.0,10.0,null,45.0,5.0,45.0,4.0,100.0,60.0,40.0,null,null,null,null,null,25.0,10.0,25.0,10.0,25.0,5.0,null,30.0,5.0,30.0,5.0,30.0,60.0,35.0,5.0,null,null,null,null,null,20.0,20.0,15.0,15.0,15.0,15.0,10.0,15.0,5.0,null,30.0,5.0,30.0,5.0,30.0,60.0,35.0,5.0,null,null,null,null,null,20.0,20.0,15.0,15.0,15.0,15.0,10.0,15.0,5.0,null,30.0,5.0,30.0,5.0,30.0,60.0,35.0,5.0,null,null,null,null,null,20.0,20.0,15.0,15.0,15.0,9.0,15.0,15.0,100.0,100.0,5.0,null,60.0,35.0,5.0,null,null,null,null,null,20.0,20.0,15.0,15.0,15.0,9.0,15.0,15.0,100.0,100.0,5.0,null,60.0,35.0,5.0,null,null,null,null,null,20.0,20.0,15.0,15.0,25.0,5.0,null,60.0,35.0,5.0,null,null,null,null,null,null,10.0,10.0,5.0,5.0,15.0,20.0,5.0,20.0,5.0,5.0,null,60.0,35.0,5.0,null,null,null,null,null,20.0,20.0,15.0,15.0,20.0,10.0,null,30.0,9.0,30.0,100.0,30.0,60.0,35.0,5.0,null,null,null,null,null,30.0,9.0,30.0,100.0,30.0,null,60.0,35.0,5.0,null,null,null,null,null,45.0,5.0,45.0,5.0,null,60.0,35.0,5.0,10.0,20.0,10.0,20.0,10.0,14.0,100.0,10.0,14.0,100.0,15.0,null,30.0,9.0,30.0,100.0,30.0,60.0,35.0,5.0,null,null,null,null,null,30.0,30.0,20.0,20.0,45.0,10.0,45.0,60.0,40.0,null,null,null,null,null,10.0,15.0,10.0,19.0,100.0,10.0,19.0,100.0,14.0,100.0,null,45.0,10.0,45.0,60.0,40.0,null,null,null,null,null,30.0,20.0,20.0,30.0,20.0,20.0,20.0,20.0,null,45.0,10.0,45.0,60.0,35.0,5.0,null,null,null,null,null,null,30.0,20.0,20.0,30.0,20.0,20.0,20.0,20.0,null,45.0,10.0,45.0,60.0,35.0,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,25.0,24.0,10.0,100.0,24.0,25.0,10.0,100.0,15.0,5.0,10.0,10.0,null,10.0,85.0,5.0,null,4.0,40.0,15.0,40.0,100.0,null,4.0,40.0,15.0,40.0,100.0,null,9.0,100.0,40.0,15.0,34.0,100.0,null,10.0,15.0,5.0,15.0,10.0,15.0,10.0,10.0,5.0,5.0,null,45.0,9.0,100.0,45.0,5.0,20.0,5.0,20.0,15.0,10.0,10.0,10.0,5.0,null,10.0,15.0,5.0,15.0,10.0,15.0,10.0,10.0,5.0,5.0,null,45.0,9.0,100.0,45.0,null,10.0,20.0,10.0,10.0,20.0,10.0,9.0,10.0,100.0,null,20.0,10.0,10.0,20.0,10.0,10.0,9.0,10.0,100.0,null,23.0,5.0,25.0,5.0,23.0,5.0,25.0,5.0,14.0,null,null,null,null,null,5.0,5.0,75.0,5.0,10.0,5.0,5.0,75.0,5.0,10.0,5.0,5.0,70.0,10.0,10.0,null,5.0,5.0,70.0,10.0,10.0,null,16.0,20.0,15.0,10.0,15.0,10.0,14.0,null,16.0,20.0,15.0,10.0,15.0,10.0,14.0,null,16.0,20.0,15.0,10.0,15.0,10.0,14.0,null,16.0,20.0,15.0,10.0,15.0,10.0,14.0,null,30.0,9.0,30.0,100.0,30.0,16.0,20.0,15.0,10.0,15.0,10.0,14.0,null,30.0,9.0,30.0,100.0,30.0,null,20.0,20.0,40.0,5.0,40.0,5.0,14.0,100.0,20.0,20.0,40.0,5.0,40.0,5.0,14.0,100.0,20.0,20.0,40.0,5.0,40.0,5.0,14.0,100.0,20.0,20.0,30.0,10.0,30.0,10.0,10.0,10.0,null,null,null,null,null,null,null,null,null,null,10.0,15.0,10.0,15.0,10.0,15.0,10.0,10.0,5.0,null,10.0,15.0,10.0,15.0,10.0,15.0,10.0,10.0,5.0,null,10.0,15.0,10.0,15.0,10.0,15.0,10.0,10.0,5.0,null,null,null,null,null,25.0,null,20.0,25.0,12.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,80.0,80.0,20.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,40.0,50.0,20.0,40.0,50.0,60.0,5.0,30.0,5.0,100.0,55.0,45.0,15.0,40.0,45.0,90.0,10.0,100.0,55.0,45.0,40.0,15.0,40.0,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,20.0,25.0,15.0,15.0,20.0,25.0,20.0,25.0,5.0,90.0,10.0,100.0,55.0,45.0,55.0,45.0,null,null,null,20.0,null,20.0,2.0,20.0,2.0,null,19.0,19.0,40.0,22.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30.0,10.0,30.0,30.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,5.0,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,5.0,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,5.0,80.0,80.0,20.0,10.0,10.0,10.0,10.0,25.0,20.0,15.0,60.0,5.0,30.0,5.0,100.0,55.0,45.0,15.0,40.0,45.0,40.0,20.0,2.0,22.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,20.0,10.0,20.0,10.0,10.0,20.0,10.0,10.0,null,5.0,30.0,60.0,5.0,100.0,55.0,5.0,40.0,15.0,45.0,40.0,8.0,null,null,15.0,20.0,15.0,100.0,100.0,20.0,null,8.0,null,null,15.0,20.0,15.0,100.0,null,100.0,20.0,null,8.0,null,15.0,20.0,15.0,100.0,null,100.0,20.0,null,8.0,null,15.0,20.0,15.0,100.0,null,100.0,20.0,null,null,15.0,20.0,15.0,5.0,null,5.0,20.0,null,8.0,null,15.0,20.0,15.0,100.0,null,100.0,20.0,null,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,19.0,19.0,14.3,19.0,14.3,14.3,60.0,5.0,30.0,5.0,100.0,55.0,45.0,40.0,15.0,45.0,10.0,10.0,35.0,35.0,10.0,20.0,100.0,69.0,10.0,20.0,100.0,49.0,30.0,20.0,100.0,39.0,30.0,10.0,null,20.0,100.0,39.0,30.0,10.0,20.0,null,null,25.0,null,10.0,90.0,10.0,100.0,45.0,55.0,45.0,55.0,40.0,22.0,null,null,null,90.0,10.0,100.0,45.0,55.0,45.0,55.0,40.0,null,null,null,22.0,null,null,null,20.0,null,10.0,20.0,null,10.0,null,null,20.0,null,10.0,20.0,null,10.0,null,null,20.0,null,9.0,100.0,20.0,null,10.0,null,null,20.0,null,5.0,4.0,100.0,20.0,null,10.0,null,null,20.0,null,5.0,4.0,100.0,20.0,null,10.0,null,null,95.0,5.0,90.0,10.0,80.0,20.0,null,10.0,25.0,null,20.0,null,10.0,10.0,90.0,10.0,100.0,55.0,45.0,55.0,45.0,null,10.0,10.0,null,20.0,null,25.0,10.0,15.0,20.0,10.0,20.0,25.0,10.0,90.0,10.0,100.0,55.0,45.0,55.0,45.0,50.0,50.0,50.0,15.0,20.0,10.0,20.0,25.0,10.0,15.0,10.0,10.0,20.0,10.0,10.0,5.0,20.0,15.0,10.0,10.0,20.0,10.0,10.0,5.0,20.0,15.0,10.0,10.0,20.0,10.0,10.0,25.0,90.0,10.0,100.0,55.0,45.0,55.0,40.0,5.0,15.0,10.0,10.0,20.0,10.0,10.0,25.0,15.0,10.0,10.0,20.0,10.0,5.0,5.0,25.0,15.0,10.0,10.0,20.0,10.0,10.0,25.0,15.0,10.0,10.0,20.0,10.0,10.0,25.0,15.0,10.0,10.0,40.0,10.0,10.0,5.0,5.0,null,null,10.0,null,null,10.0,10.0,5.0,20.0,20.0,22.0,100.0,null,null,20.0,80.0,60.0,30.0,10.0,60.0,5.0,30.0,5.0,100.0,55.0,45.0,55.0,45.0,20.0,70.0,10.0,20.0,70.0,10.0,60.0,5.0,30.0,5.0,100.0,55.0,45.0,55.0,45.0,65.0,35.0,100.0,55.0,45.0,40.0,45.0,15.0,40.0,20.0,18.0,2.0,20.0,60.0,5.0,30.0,5.0,60.0,30.0,10.0,40.0,15.0,40.0,5.0,40.0,15.0,40.0,5.0,100.0,100.0,45.0,55.0,45.0,55.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,70.0,30.0,30.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,70.0,30.0,30.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,50.0,40.0,50.0,40.0,20.0,20.0,null,10.0,5.0,null,45.0,100.0,100.0,45.0,55.0,45.0,55.0,null,null,40.0,20.0,2.0,2.0,20.0,null,30.0,null,null,30.0,40.0,22.0,null,15.0,null,15.0,null,25.0,90.0,10.0,100.0,45.0,55.0,45.0,55.0,40.0,21.0,100.0,null,null,25.0,null,15.0,null,90.0,10.0,100.0,45.0,55.0,45.0,55.0,21.0,100.0,null,null,25.0,null,15.0,null,22.0,10.0,10.0,35.0,45.0,60.0,5.0,30.0,5.0,100.0,55.0,45.0,15.0,40.0,45.0,22.0,45.0,10.0,35.0,10.0,90.0,10.0,100.0,55.0,45.0,55.0,45.0,22.0,20.0,2.0,null,10.0,35.0,null,null,null,10.0,25.0,10.0,40.0,22.0,null,25.0,null,55.0,null,40.0,22.0,22.0,null,30.0,null,10.0,null,10.0,20.0,10.0,90.0,10.0,100.0,55.0,45.0,55.0,45.0,40.0,22.0,null,null,5.0,20.0,null,15.0,null,null,null,90.0,10.0,100.0,45.0,55.0,45.0,55.0,40.0,20.0,2.0,2.0,20.0,null,30.0,null,5.0,null,10.0,null,5.0,null,5.0,20.0,2.0,2.0,20.0,20.0,null,10.0,10.0,null,null,null,20.0,20.0,90.0,10.0,100.0,55.0,45.0,55.0,45.0,22.0,22.0,null,10.0,10.0,null,null,25.0,25.0,null,10.0,22.0,null,10.0,null,20.0,null,5.0,null,35.0,10.0,22.0,15.0,20.0,null,5.0,null,30.0,90.0,10.0,100.0,45.0,55.0,45.0,55.0,22.0,30.0,15.0,null,25.0,null,10.0,null,90.0,10.0,100.0,55.0,45.0,55.0,45.0,22.0,null,30.0,10.0,null,60.0,5.0,30.0,5.0,100.0,55.0,45.0,40.0,45.0,15.0,40.0,22.0,20.0,null,5.0,null,15.0,10.0,null,5.0,15.0,90.0,10.0,100.0,45.0,55.0,45.0,55.0,40.0,22.0,22.0,10.0,15.0,25.0,null,null,null,10.0,null,40.0,22.0,22.0,null,null,10.0,10.0,null,25.0,null,10.0,25.0,40.0,22.0,null,null,10.0,null,25.0,null,20.0,25.0,40.0,22.0,15.0,10.0,35.0,20.0,20.0,15.0,60.0,5.0,30.0,5.0,100.0,55.0,45.0,55.0,45.0,40.0,22.0,60.0,5.0,30.0,5.0,100.0,55.0,45.0,40.0,15.0,45.0,60.0,5.0,30.0,5.0,100.0,55.0,45.0,40.0,40.0,5.0,15.0,15.0,10.0,10.0,25.0,10.0,10.0,30.0,20.0,15.0,60.0,5.0,30.0,5.0,100.0,55.0,45.0,40.0,15.0,45.0,40.0,20.0,2.0,2.0,20.0,15.0,10.0,25.0,null,null,null,10.0,20.0,15.0,null,60.0,5.0,30.0,5.0,100.0,55.0,45.0,40.0,45.0,15.0,40.0,22.0,60.0,30.0,10.0,100.0,55.0,45.0,40.0,15.0,40.0,5.0,5.0,5.0,5.0,20.0,4.0,null,100.0,null,null,35.0,65.0,100.0,55.0,45.0,40.0,45.0,15.0,40.0,2.0,20.0,5.0,30.0,5.0,null,20.0,5.0,5.0,15.0,null,10.0,70.0,30.0,100.0,45.0,55.0,45.0,55.0,40.0,2.0,20.0,5.0,30.0,5.0,null,20.0,10.0,10.0,null,5.0,30.0,5.0,60.0,30.0,5.0,100.0,45.0,55.0,45.0,40.0,15.0,40.0,2.0,20.0,null,null,10.0,null,null,5.0,10.0,5.0,20.0,5.0,5.0,20.0,null,30.0,70.0,100.0,55.0,45.0,55.0,45.0,40.0,22.0,5.0,30.0,null,10.0,5.0,null,20.0,null,10.0,30.0,70.0,100.0,55.0,45.0,55.0,45.0,40.0,2.0,20.0,5.0,null,20.0,5.0,null,20.0,5.0,5.0,null,null,5.0,10.0,10.0,5.0,10.0,10.0,70.0,30.0,100.0,100.0,100.0,40.0,2.0,20.0,11.0,20.0,10.0,11.0,20.0,10.0,10.0,13.0,5.0,5.0,30.0,5.0,60.0,30.0,5.0,100.0,55.0,45.0,40.0,15.0,40.0,5.0,40.0,22.0,null,100.0,100.0,100.0,100.0,100.0,100.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,50.0,50.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,19.0,19.0,19.0,19.0,19.0,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,20.0,25.0,15.0,15.0,20.0,25.0,20.0,25.0,5.0,null,10.0,null,null,5.0,10.0,5.0,20.0,5.0,5.0,20.0,null,22.0,10.0,10.0,5.0,20.0,5.0,10.0,5.0,30.0,5.0,10.0,10.0,5.0,20.0,5.0,10.0,5.0,30.0,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,70.0,30.0,30.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,70.0,30.0,30.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,40.0,50.0,20.0,40.0,50.0,60.0,30.0,10.0,100.0,55.0,45.0,15.0,40.0,45.0,10.0,null,30.0,null,20.0,null,10.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,5.0,30.0,30.0,5.0,35.0,30.0,30.0,5.0,35.0,30.0,30.0,5.0,35.0,null,90.0,10.0,100.0,45.0,55.0,45.0,55.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,50.0,40.0,50.0,40.0,20.0,10.0,25.0,35.0,30.0,60.0,5.0,30.0,5.0,100.0,55.0,45.0,15.0,40.0,45.0,40.0,22.0,null,20.0,null,5.0,30.0,null,5.0,15.0,null,5.0,20.0,2.0,2.0,20.0,20.0,25.0,20.0,10.0,10.0,15.0,20.0,25.0,20.0,10.0,10.0,15.0,20.0,25.0,10.0,15.0,30.0,100.0,100.0,100.0,100.0,20.0,25.0,20.0,10.0,10.0,15.0,20.0,25.0,20.0,10.0,10.0,15.0,20.0,25.0,10.0,15.0,30.0,90.0,10.0,100.0,100.0,100.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,100.0,70.0,30.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,19.0,14.3,19.0,14.3,19.0,14.3,14.3,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,25.0,75.0,50.0,5.0,25.0,20.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,10.0,60.0,30.0,20.0,15.0,5.0,20.0,15.0,5.0,20.0,20.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,null,null,56.0,5.0,16.0,50.0,50.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,25.0,75.0,30.0,5.0,25.0,10.0,30.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,15.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30.0,10.0,null,null,30.0,70.0,30.0,50.0,40.0,10.0,32.0,null,null,null,null,null,5.0,null,5.0,100.0,45.0,10.0,45.0,null,null,50.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,10.0,30.0,null,null,null,30.0,null,null,null,5.0,5.0,null,null,null,null,null,null,null,16.0,16.0,null,null,null,null,5.0,5.0,16.0,16.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30.0,70.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,40.0,10.0,50.0,null,null,16.0,5.0,16.0,56.0,5.0,60.0,40.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,35.0,10.0,50.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,20.0,25.0,50.0,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30.0,70.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30.0,10.0,null,null,30.0,70.0,30.0,50.0,40.0,10.0,32.0,5.0,null,null,null,null,null,null,5.0,null,100.0,null,null,35.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,10.0,30.0,null,30.0,null,null,null,null,10.0,60.0,30.0,40.0,40.0,20.0,5.0,null,16.0,null,null,null,null,null,null,16.0,null,null,null,null,5.0,5.0,null,45.0,10.0,45.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30.0,15.0,20.0,30.0,30.0,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,70.0,30.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,10.0,5.0,25.0,15.0,10.0,25.0,5.0,35.0,11.48,11.48,11.48,17.22,19.14,19.14,21.53,21.53,null,null,5.0,25.0,15.0,15.0,15.0,10.0,25.0,5.0,55.0,15.0,30.0,10.49,10.49,11.8,11.8,13.11,13.11,13.11,13.11,13.11,14.75,null,null,null,null,null,null,null,null,null,15.0,5.0,10.0,40.0,30.0,50.0,30.0,5.0,15.0,27.61,24.54,22.09,14.72,11.04,25.0,25.0,5.0,30.0,35.0,30.0,30.0,10.0,10.0,30.0,10.0,20.0,10.0,30.0,14.91,14.91,14.91,14.91,17.39,17.39,24.84,24.84,27.95,27.95,28.0,5.0,30.0,35.0,25.0,10.0,2.0,2.0,null,14.0,30.0,null,100.0,11.4,12.11,13.3,19.0,21.38,21.38,22.8,22.8,null,null,5.0,20.0,20.0,10.0,25.0,40.0,80.0,15.0,5.0,2.0,38.0,30.0,15.0,10.0,5.0,11.04,17.18,19.63,19.63,24.54,27.61,null,null,20.0,20.0,30.0,10.0,35.0,5.0,59.0,100.0,40.0,50.0,30.0,15.0,5.0,2.0,70.0,28.0,12.96,14.81,19.75,19.75,24.69,27.78,null,null,null,20.0,9.0,20.0,15.0,35.0,100.0,20.0,80.0,15.0,15.0,2.0,38.0,10.0,5.0,30.0,100.0,99.0,9.95,15.17,15.17,17.06,19.43,23.22,null,35.0,4.0,10.0,100.0,5.0,25.0,20.0,100.0,10.0,70.0,20.0,5.0,100.0,23.0,100.0,5.0,30.0,10.0,5.0,5.0,100.0,20.0,8.05,10.73,12.26,15.33,17.24,17.62,18.77,null,20.0,20.0,5.0,20.0,14.0,14.0,5.0,26.0,10.0,100.0,10.0,70.0,20.0,5.0,10.0,5.0,15.0,20.0,30.0,30.0,35.0,10.49,12.43,12.43,12.43,14.17,14.17,15.53,17.48,17.48,null,null,5.0,18.0,10.0,10.0,5.0,20.0,20.0,5.0,2.0,30.0,100.0,10.0,70.0,20.0,20.0,100.0,5.0,10.0,35.0,5.0,100.0,29.0,7.8,10.41,10.41,10.89,13.01,14.63,14.63,14.63,14.63,15.61,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,100.0,15.0,20.0,10.0,20.0,30.0,5.0,10.85,10.85,10.85,12.4,15.5,15.5,15.5,17.44,17.44,17.44,10.0,20.0,15.0,10.0,8.0,5.0,30.0,2.0,5.0,5.0,10.0,25.0,25.0,10.0,25.0,20.0,10.0,10.0,5.0,7.82,10.42,11.73,13.03,13.03,13.68,14.66,15.64,null,null,25.0,10.0,15.0,20.0,5.0,40.0,20.0,25.0,5.0,5.0,10.0,40.0,11.04,15.79,17.18,19.63,24.56,24.54,27.61,28.07,31.58,25.0,30.0,40.0,5.0,60.0,30.0,10.0,40.0,15.0,5.0,35.0,35.0,5.0,5.0,30.0,40.0,25.0,5.0,15.65,20.87,24.35,39.13,null,30.0,25.0,40.0,5.0,100.0,100.0,10.0,34.0,5.0,50.0,24.0,10.0,20.0,15.0,20.0,20.0,5.0,100.0,30.0,15.0,10.0,40.0,35.0,15.65,20.87,24.35,39.13,null,null,null,null,null,25.0,30.0,40.0,5.0,100.0,null,40.0,24.0,null,100.0,30.0,15.65,20.87,24.35,39.13,null,null,null,null,null,null,null,null,null,null,null,80.0,20.0,20.0,15.0,20.0,15.0,10.0,20.0,20.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,25.0,75.0,35.0,50.0,5.0,10.0,null,null,null,null,null,null,null,null,null,null,null,null,null,10.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,10.0,30.0,null,null,100.0,100.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,25.0,75.0,5.0,10.0,35.0,50.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,10.0,30.0,null,null,60.0,40.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,80.0,20.0,20.0,15.0,20.0,15.0,10.0,20.0,20.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30.0,70.0,60.0,5.0,10.0,25.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,9.93,10.0,10.0,10.0,10.0,20.0,15.0,9.0,9.0,10.0,100.0,15.0,10.0,20.0,5.0,5.0,7.94,8.93,9.01,9.01,9.93,9.93,9.93,9.93,10.14,10.17,11.17,11.27,11.27,11.27,11.55,12.16,12.68,13.8,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,10.0,null,null,null,null,null,null,null,null,null,null,null,null,null,25.0,75.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,100.0,null,null,null,60.0,40.0,null,null,null,null,null,null,null,null,null,30.0,10.0,30.0,30.0,60.0,40.0,null,null,82.0,16.0,null,null,100.0,null,null,30.0,null,null,null,null,null,null,5.0,100.0,5.0,100.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,60.0,40.0,null,null,100.0,null,null,30.0,null,null,null,null,null,null,5.0,100.0,5.0,100.0,100.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,20.0,10.0,10.0,5.0,15.0,50.0,null,null,30.0,30.0,10.0,30.0,70.0,30.0,60.0,40.0,16.0,null,null,82.0,null,null,null,100.0,null,null,30.0,null,null,null,null,null,5.0,100.0,5.0,100.0,100.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,95.0,5.0,35.0,10.0,50.0,null,null,null,10.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,20.0,80.0,10.0,null,null,null,null,null,null,null,null,null,null,null,10.0,null,null,null,null,null,null,null,null,null,60.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,20.0,10.0,10.0,20.0,100.0,10.0,15.0,9.0,15.0,null,null,null,null,null,null,null,null,null,null,10.0,null,null,30.0,30.0,70.0,30.0,40.0,10.0,50.0,null,null,null,16.0,null,5.0,null,null,16.0,null,5.0,100.0,null,null,30.0,null,null,null,25.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,50.0,10.0,40.0,null,35.0,30.0,35.0,20.0,10.0,5.0,15.0,40.0,35.0,30.0,5.0,5.0,5.0,10.0,12.96,12.96,14.81,19.75,24.69,27.78,null,null,null,null,null,null,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,15.0,35.0,50.0,35.0,35.0,5.0,50.0,10.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,20.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,50.0,50.0,58.0,40.0,2.0,2.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,32.0,32.0,null,null,null,null,5.0,5.0,null,null,null,null,null,null,null,5.0,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,40.0,20.0,10.0,5.0,100.0,10.0,24.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,70.0,30.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,15.0,5.0,50.0,20.0,10.0,5.0,30.0,25.0,5.0,20.0,15.0,20.0,20.0,60.0,10.0,40.0,30.0,20.0,50.0,30.0,5.0,15.0,7.55,19.34,21.75,24.17,27.19,11.43,13.33,15.24,17.14,21.43,21.43,null,null,null,null,null,null,null,null,null,null,null,null,null,45.0,15.0,40.0,40.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,10.0,30.0,30.0,null,null,70.0,30.0,50.0,40.0,10.0,5.0,null,16.0,16.0,null,null,null,null,null,null,null,5.0,null,null,50.0,50.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,5.0,null,10.0,null,null,null,30.0,null,70.0,30.0,50.0,40.0,10.0,null,null,5.0,16.0,16.0,5.0,16.0,16.0,null,null,null,null,null,null,null,null,null,null,null,null,100.0,45.0,10.0,45.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,50.0,40.0,9.0,100.0,null,null,null,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,85.0,15.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30.0,10.0,30.0,30.0,60.0,30.0,10.0,10.0,60.0,40.0,16.0,null,null,82.0,null,null,100.0,null,null,30.0,null,null,null,null,null,null,5.0,100.0,5.0,100.0,100.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,10.0,null,null,null,null,null,null,null,null,null,null,10.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5.0,40.0,20.0,10.0,10.0,100.0,24.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,56.0,32.0,null,5.0,null,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,50.0,50.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,20.0,20.0,100.0,2.0,20.0,10.0,10.0,10.0,20.0,60.0,15.0,30.0,150.0,100.0,40.0,10.0,30.0,30.0,20.0,30.0,null,null,30.0,30.0,50.0,150.0,100.0,20.0,25.0,60.0,30.0,30.0,20.0,20.0,20.0,20.0,30.0,15.0,100.0,30.0,10.0,20.0,5.0,5.0,10.0,5.0,40.0,60.0,20.0,20.0,30.0,20.0,null,30.0,60.0,20.0,30.0,60.0,30.0,25.0,10.0,20.0,20.0,10.0,20.0,30.0,20.0,20.0,30.0,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,35.0,50.0,10.0,5.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30.0,30.0,10.0,30.0,70.0,30.0,50.0,40.0,10.0,16.0,null,82.0,null,null,null,100.0,null,null,30.0,null,null,null,null,null,5.0,100.0,5.0,100.0,100.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,20.0,null,5.0,10.0,10.0,10.0,20.0,60.0,20.0,10.0,10.0,10.0,30.0,30.0,60.0,5.0,15.0,15.0,100.0,null,10.0,30.0,100.0,30.0,null,30.0,20.0,15.0,15.0,20.0,5.0,10.0,10.0,20.0,15.0,20.0,20.0,15.0,20.0,100.0,30.0,10.0,5.0,20.0,30.0,null,15.0,30.0,30.0,60.0,20.0,20.0,30.0,60.0,10.0,15.0,15.0,10.0,30.0,100.0,null,30.0,15.0,100.0,15.0,20.0,10.0,10.0,20.0,20.0,20.0,20.0,20.0,100.0,30.0,30.0,10.0,10.0,20.0,5.0,30.0,20.0,30.0,20.0,null,15.0,30.0,30.0,60.0,20.0,30.0,60.0,10.0,15.0,15.0,100.0,null,10.0,20.0,null,50.0,20.0,10.0,3.0,30.0,10.0,20.0,5.0,100.0,15.0,15.0,100.0,null,10.0,20.0,100.0,10.0,5.0,20.0,null,50.0,20.0,10.0,3.0,10.0,20.0,100.0,15.0,15.0,100.0,null,10.0,20.0,null,50.0,20.0,10.0,3.0,10.0,20.0,100.0,15.0,15.0,100.0,null,10.0,20.0,100.0,10.0,5.0,20.0,null,50.0,20.0,10.0,3.0,10.0,20.0,100.0,15.0,15.0,5.0,5.0,5.0,15.0,20.0,30.0,20.0,20.0,20.0,5.0,40.0,2.0,10.0,20.0,10.0,3.0,10.0,20.0,10.0,3.0,100.0,100.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2.0,10.0,2.0,20.0,20.0,90.0,60.0,100.0,60.0,5.0,30.0,5.0,30.0,30.0,80.0,40.0,20.0,60.0,60.0,20.0,10.0,10.0,5.0,50.0,30.0,50.0,20.0,30.0,30.0,60.0,100.0,40.0,60.0,60.0,60.0,60.0,6.0,55.0,55.0,55.0,55.0,3.0,15.0,60.0,40.0,15.0,15.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,20.0,20.0,5.0,10.0,20.0,10.0,20.0,60.0,10.0,15.0,70.0,60.0,30.0,60.0,100.0,100.0,null,null,20.0,null,100.0,100.0,null,60.0,20.0,20.0,20.0,10.0,null,null,null,90.0,60.0,60.0,10.0,25.0,30.0,30.0,30.0,40.0,null,null,60.0,12.0,20.0,30.0,20.0,15.0,10.0,60.0,20.0,30.0,50.0,15.0,20.0,30.0,30.0,30.0,30.0,30.0,30.0,60.0,20.0,null,5.0,10.0,10.0,20.0,70.0,10.0,10.0,30.0,30.0,60.0,5.0,100.0,2.0,30.0,30.0,100.0,3.0,10.0,30.0,null,null,2.0,20.0,10.0,null,15.0,70.0,10.0,30.0,20.0,20.0,10.0,20.0,2.0,60.0,30.0,10.0,30.0,null,null,null,20.0,30.0,5.0,null,null,null,null,null,60.0,60.0,10.0,60.0,5.0,30.0,60.0,20.0,40.0,60.0,60.0,60.0,30.0,60.0,20.0,30.0,60.0,30.0,20.0,30.0,80.0,10.0,60.0,20.0,15.0,100.0,null,40.0,30.0,60.0,60.0,60.0,60.0,6.0,55.0,55.0,55.0,55.0,3.0,10.0,40.0,40.0,null,2.0,20.0,70.0,60.0,10.0,30.0,20.0,80.0,20.0,20.0,10.0,2.0,10.0,40.0,null,60.0,4.0,60.0,60.0,30.0,30.0,10.0,60.0,20.0,20.0,30.0,20.0,100.0,10.0,null,null,60.0,null,40.0,30.0,30.0,10.0,20.0,15.0,10.0,5.0,null,null,70.0,null,25.0,30.0,30.0,40.0,2.0,60.0,30.0,30.0,60.0,15.0,100.0,60.0,30.0,20.0,60.0,20.0,60.0,60.0,10.0,10.0,40.0,5.0,50.0,60.0,60.0,5.0,30.0,60.0,20.0,60.0,60.0,60.0,30.0,60.0,30.0,50.0,50.0,20.0,30.0,30.0,30.0,60.0,100.0,30.0,60.0,20.0,60.0,30.0,80.0,60.0,10.0,60.0,60.0,15.0,null,null,null,null,30.0,50.0,null,2.0,30.0,20.0,10.0,2.0,60.0,20.0,30.0,null,null,null,null,30.0,30.0,30.0,30.0,10.0,30.0,20.0,15.0,10.0,5.0,10.0,60.0,60.0,null,60.0,60.0,60.0,40.0,10.0,10.0,15.0,10.0,30.0,60.0,20.0,20.0,10.0,60.0,60.0,60.0,10.0,10.0,40.0,20.0,5.0,50.0,12.0,60.0,60.0,5.0,30.0,60.0,20.0,60.0,60.0,20.0,30.0,60.0,20.0,20.0,null,5.0,10.0,20.0,10.0,20.0,10.0,10.0,30.0,60.0,30.0,60.0,5.0,20.0,100.0,100.0,40.0,40.0,15.0,10.0,null,30.0,3.0,10.0,40.0,10.0,3.0,20.0,60.0,60.0,10.0,60.0,60.0,15.0,30.0,null,null,null,null,null,null,50.0,100.0,40.0,3.0,3.0,80.0,40.0,null,2.0,70.0,30.0,20.0,20.0,20.0,15.0,10.0,110.0,2.0,40.0,null,60.0,4.0,30.0,10.0,20.0,20.0,30.0,15.0,20.0,100.0,10.0,20.0,80.0,null,null,null,null,10.0,30.0,30.0,10.0,20.0,15.0,10.0,5.0,60.0,30.0,20.0,60.0,20.0,60.0,60.0,10.0,10.0,40.0,5.0,50.0,15.0,60.0,60.0,5.0,30.0,60.0,20.0,60.0,60.0,60.0,30.0,60.0,30.0,50.0,20.0,30.0,30.0,30.0,30.0,60.0,100.0,30.0,60.0,30.0,20.0,30.0,80.0,60.0,10.0,60.0,60.0,15.0,15.0,60.0,10.0,15.0,15.0,null,null,20.0,null,100.0,100.0,10.0,null,60.0,20.0,20.0,20.0,20.0,10.0,null,null,null,90.0,60.0,60.0,20.0,10.0,25.0,30.0,30.0,30.0,40.0,null,null,60.0,12.0,20.0,30.0,20.0,15.0,10.0,60.0,20.0,10.0,30.0,15.0,50.0,3.0,null,60.0,10.0,20.0,20.0,20.0,100.0,2.0,30.0,60.0,20.0,60.0,20.0,2.0,60.0,10.0,25.0,10.0,60.0,100.0,15.0,20.0,null,30.0,30.0,30.0,30.0,30.0,20.0,30.0,60.0,20.0,null,20.0,20.0,10.0,15.0,null,30.0,null,null,null,50.0,20.0,20.0,100.0,100.0,null,60.0,20.0,10.0,null,null,null,90.0,60.0,10.0,25.0,40.0,null,null,60.0,12.0,20.0,20.0,15.0,10.0,60.0,20.0,30.0,50.0,3.0,60.0,10.0,null,20.0,20.0,60.0,20.0,100.0,2.0,30.0,60.0,20.0,100.0,60.0,20.0,2.0,25.0,60.0,100.0,60.0,20.0,60.0,100.0,null,10.0,60.0,60.0,10.0,30.0,15.0,10.0,30.0,60.0,20.0,20.0,100.0,10.0,60.0,60.0,10.0,20.0,5.0,50.0,5.0,12.0,60.0,10.0,60.0,5.0,30.0,40.0,60.0,60.0,20.0,60.0,20.0,20.0,30.0,30.0,15.0,null,30.0,30.0,20.0,30.0,60.0,20.0,null,5.0,10.0,10.0,20.0,70.0,10.0,10.0,30.0,30.0,60.0,5.0,100.0,2.0,100.0,20.0,null,20.0,30.0,55.0,55.0,55.0,55.0,3.0,10.0,20.0,20.0,15.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,20.0,60.0,60.0,null,null,60.0,10.0,60.0,5.0,30.0,40.0,40.0,30.0,20.0,60.0,30.0,60.0,20.0,60.0,20.0,60.0,20.0,20.0,50.0,30.0,30.0,null,null,null,5.0,null,100.0,100.0,10.0,20.0,20.0,20.0,null,null,3.0,null,60.0,20.0,25.0,40.0,60.0,null,null,null,12.0,30.0,30.0,20.0,15.0,100.0,10.0,20.0,10.0,15.0,null,20.0,20.0,15.0,100.0,2.0,30.0,20.0,10.0,10.0,10.0,20.0,100.0,15.0,20.0,10.0,null,25.0,10.0,30.0,20.0,100.0,10.0,5.0,5.0,5.0,10.0,5.0,40.0,20.0,60.0,20.0,20.0,50.0,30.0,10.0,20.0,null,3.0,30.0,60.0,10.0,20.0,20.0,30.0,60.0,20.0,20.0,null,20.0,10.0,30.0,10.0,60.0,30.0,5.0,100.0,10.0,10.0,40.0,20.0,30.0,20.0,100.0,20.0,null,100.0,20.0,30.0,55.0,55.0,55.0,55.0,3.0,30.0,null,20.0,5.0,null,null,null,2.0,50.0,10.0,20.0,30.0,40.0,15.0,15.0,15.0,20.0,15.0,15.0,20.0,20.0,60.0,20.0,40.0,5.0,null,null,null,null,100.0,30.0,null,10.0,20.0,20.0,100.0,2.0,20.0,10.0,10.0,10.0,20.0,100.0,10.0,20.0,5.0,5.0,12.0,10.0,5.0,40.0,20.0,60.0,20.0,20.0,20.0,50.0,30.0,15.0,null,30.0,60.0,20.0,30.0,60.0,20.0,null,10.0,20.0,10.0,30.0,10.0,5.0,100.0,10.0,10.0,40.0,20.0,30.0,20.0,100.0,20.0,null,100.0,20.0,5.0,30.0,55.0,55.0,55.0,55.0,3.0,100.0,100.0,100.0,100.0,100.0,10.0,30.0,null,null,20.0,30.0,100.0,15.0,20.0,null,25.0,2.0,20.0,20.0,20.0,10.0,null,3.0,10.0,20.0,30.0,60.0,10.0,20.0,20.0,30.0,60.0,20.0,null,20.0,20.0,10.0,30.0,10.0,60.0,30.0,5.0,100.0,100.0,20.0,100.0,20.0,30.0,55.0,55.0,55.0,55.0,3.0,30.0,null,null,null,30.0,60.0,40.0,null,2.0,20.0,30.0,10.0,20.0,5.0,15.0,20.0,10.0,30.0,40.0,30.0,60.0,30.0,20.0,80.0,20.0,20.0,50.0,10.0,2.0,20.0,null,null,50.0,20.0,70.0,50.0,null,60.0,25.0,30.0,30.0,40.0,2.0,60.0,30.0,30.0,15.0,100.0,60.0,30.0,80.0,60.0,60.0,15.0,60.0,10.0,20.0,70.0,60.0,40.0,60.0,60.0,60.0,60.0,null,5.0,60.0,40.0,15.0,60.0,30.0,60.0,60.0,40.0,10.0,15.0,60.0,30.0,20.0,60.0,60.0,20.0,20.0,20.0,60.0,60.0,20.0,60.0,10.0,10.0,40.0,5.0,50.0,60.0,60.0,5.0,30.0,60.0,20.0,60.0,60.0,60.0,30.0,60.0,30.0,30.0,50.0,50.0,20.0,30.0,30.0,30.0,60.0,100.0,30.0,60.0,20.0,60.0,30.0,60.0,10.0,60.0,15.0,60.0,20.0,40.0,30.0,60.0,60.0,60.0,60.0,6.0,55.0,55.0,55.0,55.0,3.0,60.0,15.0,60.0,15.0,null,null,null,null,null,60.0,60.0,60.0,80.0,50.0,5.0,60.0,80.0,20.0,60.0,60.0,20.0,null,60.0,70.0,50.0,null,40.0,100.0,null,5.0,100.0,60.0,20.0,30.0,5.0,null,20.0,100.0,10.0,50.0,30.0,30.0,30.0,20.0,100.0,150.0,40.0,null,null,null,null,null,null,null,60.0,60.0,5.0,30.0,80.0,60.0,20.0,60.0,30.0,60.0,60.0,30.0,null,10.0,null,null,10.0,5.0,40.0,30.0,60.0,80.0,50.0,10.0,30.0,2.0,10.0,null,60.0,4.0,40.0,30.0,10.0,60.0,60.0,100.0,20.0,10.0,null,null,20.0,60.0,70.0,null,20.0,25.0,30.0,40.0,2.0,60.0,40.0,15.0,100.0,60.0,60.0,30.0,60.0,60.0,60.0,null,5.0,40.0,60.0,60.0,60.0,40.0,10.0,40.0,15.0,60.0,20.0,60.0,20.0,60.0,60.0,10.0,40.0,5.0,50.0,60.0,60.0,5.0,30.0,60.0,20.0,60.0,60.0,30.0,60.0,30.0,50.0,20.0,30.0,60.0,100.0,40.0,40.0,30.0,60.0,60.0,60.0,60.0,6.0,55.0,55.0,55.0,55.0,3.0,15.0,60.0,50.0,15.0,null,null,null,null,null,null,60.0,100.0,60.0,60.0,80.0,50.0,5.0,10.0,10.0,30.0,60.0,50.0,60.0,60.0,20.0,60.0,null,50.0,60.0,60.0,60.0,60.0,60.0,10.0,60.0,20.0,60.0,60.0,20.0,40.0,60.0,80.0,20.0,60.0,60.0,20.0,null,40.0,2.0,30.0,20.0,15.0,40.0,null,null,null,null,30.0,100.0,100.0,20.0,30.0,100.0,30.0,5.0,100.0,100.0,20.0,10.0,null,10.0,60.0,20.0,20.0,null,null,null,25.0,40.0,null,null,12.0,20.0,15.0,15.0,20.0,15.0,60.0,20.0,10.0,15.0,10.0,60.0,20.0,60.0,100.0,null,10.0,null,60.0,60.0,10.0,15.0,30.0,60.0,20.0,20.0,100.0,20.0,10.0,60.0,60.0,60.0,30.0,10.0,20.0,5.0,5.0,12.0,60.0,10.0,60.0,5.0,30.0,40.0,60.0,30.0,60.0,60.0,20.0,20.0,30.0,40.0,30.0,15.0,null,30.0,30.0,20.0,30.0,60.0,20.0,null,5.0,10.0,10.0,20.0,20.0,10.0,10.0,30.0,60.0,5.0,15.0,15.0,100.0,100.0,20.0,null,20.0,5.0,30.0,55.0,55.0,55.0,55.0,3.0,10.0,20.0,20.0,60.0,15.0,null,null,null,2.0,20.0,100.0,30.0,60.0,5.0,null,60.0,null,null,40.0,30.0,10.0,20.0,15.0,10.0,5.0,20.0,30.0,20.0,60.0,50.0,20.0,30.0,5.0,60.0,100.0,30.0,15.0,40.0,60.0,15.0,null,null,null,null,null,null,null,null,null,null,null,null,60.0,60.0,null,100.0,60.0,30.0,10.0,10.0,30.0,60.0,50.0,10.0,20.0,60.0,60.0,50.0,null,null,40.0,2.0,60.0,20.0,60.0,20.0,10.0,40.0,50.0,30.0,20.0,60.0,null,40.0,100.0,60.0,60.0,60.0,60.0,6.0,50.0,5.0,30.0,null,30.0,30.0,30.0,100.0,15.0,40.0,60.0,50.0,15.0,null,null,null,40.0,null,null,60.0,4.0,30.0,60.0,15.0,15.0,30.0,30.0,30.0,10.0,40.0,20.0,20.0,20.0,30.0,100.0,80.0,70.0,10.0,60.0,60.0,null,60.0,10.0,60.0,60.0,10.0,15.0,30.0,60.0,20.0,20.0,10.0,60.0,60.0,60.0,10.0,10.0,40.0,20.0,5.0,50.0,12.0,30.0,15.0,30.0,50.0,30.0,30.0,30.0,60.0,60.0,100.0,100.0,null,20.0,30.0,55.0,55.0,55.0,55.0,3.0,60.0,10.0,null,null,null,60.0,10.0,60.0,5.0,30.0,80.0,40.0,60.0,20.0,40.0,60.0,30.0,60.0,30.0,60.0,60.0,20.0,30.0,60.0,20.0,20.0,30.0,60.0,30.0,40.0,20.0,null,null,20.0,60.0,70.0,null,30.0,40.0,2.0,60.0,30.0,15.0,100.0,30.0,60.0,10.0,60.0,20.0,20.0,60.0,60.0,10.0,40.0,50.0,60.0,60.0,5.0,30.0,80.0,60.0,20.0,60.0,60.0,40.0,30.0,30.0,50.0,20.0,30.0,60.0,100.0,20.0,5.0,10.0,20.0,20.0,10.0,15.0,60.0,30.0,60.0,100.0,60.0,20.0,30.0,60.0,60.0,15.0,40.0,100.0,40.0,60.0,60.0,60.0,60.0,6.0,55.0,55.0,55.0,55.0,3.0,15.0,60.0,40.0,15.0,null,null,null,null,null,null,null,null,null,null,null,30.0,30.0,100.0,3.0,10.0,30.0,null,null,2.0,30.0,20.0,10.0,null,10.0,15.0,70.0,10.0,30.0,20.0,20.0,10.0,30.0,20.0,2.0,10.0,20.0,5.0,100.0,60.0,null,60.0,4.0,60.0,30.0,30.0,40.0,null,100.0,30.0,50.0,60.0,30.0,30.0,10.0,20.0,20.0,30.0,100.0,20.0,20.0,10.0,60.0,60.0,30.0,30.0,10.0,30.0,10.0,null,null,null,20.0,10.0,30.0,5.0,60.0,30.0,60.0,30.0,null,5.0,60.0,10.0,30.0,60.0,60.0,40.0,10.0,40.0,15.0,10.0,30.0,60.0,20.0,20.0,100.0,30.0,10.0,60.0,60.0,10.0,20.0,5.0,50.0,5.0,12.0,10.0,15.0,null,50.0,30.0,30.0,30.0,60.0,60.0,100.0,20.0,20.0,30.0,15.0,40.0,null,null,null,30.0,100.0,40.0,3.0,3.0,10.0,30.0,null,50.0,2.0,30.0,null,30.0,70.0,20.0,20.0,10.0,30.0,2.0,15.0,60.0,80.0,30.0,null,null,null,null,10.0,10.0,10.0,60.0,30.0,20.0,60.0,30.0,20.0,10.0,20.0,60.0,60.0,10.0,10.0,40.0,20.0,5.0,50.0,15.0,12.0,60.0,60.0,5.0,30.0,80.0,20.0,40.0,60.0,60.0,20.0,60.0,30.0,30.0,30.0,15.0,50.0,20.0,30.0,30.0,60.0,100.0,30.0,60.0,20.0,10.0,60.0,30.0,60.0,10.0,60.0,30.0,15.0,60.0,20.0,20.0,20.0,5.0,10.0,20.0,10.0,20.0,60.0,10.0,15.0,70.0,60.0,30.0,60.0,100.0,100.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"minLevel":[29,33,17,22,29,37,29,30,16,33,17,21,29,24,31,31,32,47,18,43,21,43,30,43,29,37,36,43,36,43,null,43,43,16,43,43,29,34,62,37,47,35,35,40,35,37,50,55,50,55,40,40,40,45,40,50,55,60,25,25,24,47,47,47,47,29,47,26,33,47,47,36,49,33,null,null,16,47,38,47,33,25,50,34,45,50,50,45,45,45,50,60,45,50,50,50,50,55,60,65,null,3,3,2,2,2,2,2,2,8,4,12,59,59,59,50,59,29,59,59,33,47,38,59,50,59,20,44,59,59,33,null,16,59,38,47,20,33,52,54,52,52,51,21,45,52,45,50,50,45,45,45,50,60,45,50,50,50,50,55,60,65,21,45,45,43,45,49,29,45,49,45,11,45,45,24,49,36,49,45,33,33,null,null,49,16,49,33,49,52,22,12,52,63,27,52,51,25,29,33,29,33,10,29,22,29,24,29,null,29,29,29,29,31,16,28,21,29,24,21,24,31,31,33,23,31,24,43,21,43,21,43,null,21,43,43,22,46,35,35,40,35,37,50,55,50,55,40,40,40,45,40,50,55,60,18,23,18,25,23,22,16,21,25,22,25,26,42,21,43,43,29,43,38,53,24,49,43,43,36,49,53,33,null,null,null,16,43,38,43,33,22,63,30,48,45,50,50,45,45,45,50,60,45,50,50,50,50,55,60,65,70,39,43,38,43,43,43,30,43,30,43,null,46,16,43,43,16,50,50,17,50,31,51,31,50,35,35,40,35,37,50,55,50,55,40,40,40,45,40,50,55,60,24,31,24,31,null,31,10,27,24,28,31,16,31,21,31,21,24,31,31,25,37,45,30,42,21,39,21,39,39,39,39,39,29,39,null,16,39,39,39,39,47,30,42,44,35,35,40,35,37,50,55,50,55,40,40,40,45,40,50,55,60,25,21,39,21,39,39,29,37,20,null,null,38,16,39,29,20,46,21,45,70,25,20,33,21,33,25,33,33,33,17,33,33,33,null,null,25,32,16,17,33,33,21,33,26,38,23,20,25,20,30,52,52,68,25,20,25,20,30,26,28,25,30,24,53,53,53,53,26,53,null,16,39,53,39,62,59,17,25,20,25,25,23,25,6,25,17,25,null,null,25,16,21,25,27,27,21,7,20,17,24,30,70,33,33,27,27,27,27,38,10,27,27,24,28,16,27,21,27,27,30,30,30,30,30,42,30,30,30,30,34,30,35,42,29,37,null,10,29,34,24,29,29,16,28,21,29,21,22,33,37,31,33,30,30,30,30,42,30,30,30,30,34,30,35,42,25,7,22,7,9,10,14,10,14,9,null,11,22,10,14,9,7,12,null,7,6,7,7,7,7,7,11,7,18,23,20,24,23,null,23,16,21,25,20,18,23,23,6,23,null,17,16,27,7,25,20,33,21,33,22,26,33,14,28,11,33,17,33,null,16,17,33,33,21,33,26,33,11,18,20,25,20,30,52,52,68,25,20,25,20,30,26,28,25,30,43,43,43,43,null,46,16,43,43,43,51,48,51,48,25,31,31,26,null,33,16,31,31,41,24,41,41,35,38,36,25,3,2,5,3,3,4,null,18,18,20,7,7,null,19,21,25,19,25,19,19,19,11,19,19,21,19,null,null,null,null,21,25,21,17,16,41,19,20,25,21,25,19,33,21,22,21,38,24,22,21,32,30,20,25,20,30,52,52,68,25,20,25,20,30,26,28,25,30,24,31,24,27,22,29,24,27,null,null,null,16,27,21,27,24,31,31,30,30,30,30,42,30,30,30,30,34,30,35,42,49,49,49,49,49,11,49,24,49,34,34,36,49,26,49,33,16,49,38,49,54,55,25,54,37,54,45,50,50,45,45,45,50,60,45,50,50,50,50,55,60,65,17,17,24,17,17,41,17,6,17,17,null,17,16,41,19,21,25,20,24,22,33,27,30,18,20,25,13,null,13,23,25,6,null,15,15,20,15,20,22,22,25,null,43,16,26,16,49,53,null,50,16,53,38,53,49,45,50,50,45,45,45,50,60,45,50,50,50,50,55,60,65,25,37,29,33,21,33,33,33,30,null,null,null,33,16,33,21,33,38,38,20,25,20,30,52,52,68,25,20,25,20,30,26,28,25,30,18,35,20,35,26,35,18,35,35,35,16,35,35,19,41,28,40,43,41,41,41,28,40,41,null,16,41,41,24,21,24,33,35,29,34,46,3,2,2,null,7,2,2,2,2,3,null,2,2,15,40,20,15,13,38,15,25,25,25,20,20,25,20,30,37,25,25,25,25,15,59,33,null,33,25,33,47,47,47,26,33,47,47,47,47,null,null,49,16,47,39,55,34,54,54,25,42,null,16,31,24,31,31,24,31,27,21,45,45,26,45,33,33,41,41,34,46,null,null,16,41,41,24,41,41,41,24,41,41,11,16,26,33,30,30,35,12,49,49,49,29,49,null,49,49,16,49,29,53,17,27,64,67,64,30,55,51,55,null,70,25,25,17,33,25,17,33,null,25,16,25,26,53,null,70,9,9,22,9,9,6,10,null,9,22,9,14,34,9,9,11,11,24,25,25,25,20,20,25,20,30,37,25,25,25,25,50,35,34,34,35,34,35,20,20,3,10,10,20,30,34,35,15,41,28,null,41,41,42,20,16,53,62,34,30,25,29,37,37,null,21,37,29,48,45,13,13,41,13,41,13,null,null,13,22,10,14,24,11,16,12,25,24,10,32,26,33,24,33,null,10,30,24,33,17,33,53,58,11,15,27,38,70,13,22,13,11,15,13,13,null,null,13,13,25,49,49,38,49,49,49,16,49,38,49,49,54,39,63,53,53,53,53,29,53,null,null,21,53,53,29,53,63,62,47,61,50,21,53,21,39,39,38,53,39,53,11,26,35,53,39,null,null,16,39,53,39,39,39,48,59,48,35,35,40,35,37,50,55,50,55,40,40,40,45,40,50,55,60,null,10,29,24,29,16,28,21,29,31,31,21,24,31,25,70,12,16,15,15,30,15,30,28,15,null,null,15,28,20,25,28,28,14,27,23,25,25,25,20,20,25,20,30,37,25,25,25,25,21,25,21,25,21,21,34,21,34,21,null,16,21,21,34,38,24,38,38,25,70,26,30,null,null,16,31,24,31,31,24,31,27,41,27,42,28,37,33,33,50,33,33,21,25,25,25,16,23,60,null,null,25,16,21,25,22,25,27,35,25,60,21,25,21,25,21,21,21,27,25,26,24,47,47,47,47,47,47,47,47,47,33,56,25,13,13,22,13,13,3,7,7,15,13,null,13,13,15,25,13,22,15,33,18,22,15,59,16,26,53,29,49,53,null,19,18,70,50,52,50,52,50,52,54,52,53,52,52,54,52,53,52,52,54,52,53,52,54,56,54,54,54,56,54,54,70,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,26,37,11,26,37,37,29,27,62,12,27,41,12,25,41,41,null,41,41,41,16,41,41,30,30,30,30,42,30,30,30,30,34,30,35,42,25,43,29,43,43,null,16,43,43,35,35,40,35,37,50,55,50,55,40,40,40,45,40,50,55,60,9,22,10,14,11,15,6,10,null,null,13,22,9,14,9,13,12,15,20,25,25,37,34,null,16,33,33,24,21,24,33,37,34,31,31,33,33,31,24,31,null,10,29,24,31,16,31,21,31,31,21,31,24,31,31,31,36,36,33,20,27,21,27,21,27,20,11,27,null,27,16,27,21,27,26,33,37,40,29,29,29,29,null,29,29,29,29,16,28,21,29,37,33,30,38,25,26,35,20,null,40,40,20,25,14,15,14,15,16,15,15,18,35,20,35,29,35,35,35,null,35,35,35,29,42,43,38,33,16,43,33,40,29,20,29,41,29,29,16,28,21,29,30,30,30,30,42,30,30,30,30,34,30,35,42,9,22,9,6,11,9,9,null,9,22,9,14,9,9,13,27,25,25,25,20,20,25,20,30,37,25,25,25,25,12,7,9,7,null,7,7,9,9,13,25,25,25,70,70,65,65,65,65,3,3,3,3,3,3,3,3,3,3,3,3,75,80,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,7,7,7,7,7,7,7,7,7,7,7,7,3,3,3,3,3,3,3,5,11,11,11,11,11,11,11,11,3,3,3,11,11,11,11,11,11,11,11,11,11,11,11,3,3,3,3,3,3,3,3,22,22,22,22,22,22,22,22,22,22,22,22,3,3,3,3,3,3,3,3,22,22,22,22,22,22,22,22,22,22,22,22,3,3,3,3,3,3,3,3,17,17,17,17,17,17,17,17,17,3,3,3,3,3,3,3,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,3,3,3,3,3,3,3,13,13,13,13,13,13,13,13,13,13,13,13,3,3,3,3,3,3,3,3,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,3,3,3,3,3,3,3,3,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,3,3,3,3,3,3,3,3,33,33,33,33,33,33,33,33,33,33,33,33,3,3,3,3,3,3,3,3,33,33,33,33,33,33,33,33,33,33,33,33,3,3,3,3,3,3,3,3,31,31,31,31,31,31,31,3,3,3,3,3,3,3,3,34,33,33,33,33,33,33,33,33,33,33,33,3,3,3,3,3,3,3,3,33,33,33,33,33,33,33,33,33,33,33,33,3,3,3,3,3,3,3,3,37,37,37,37,37,37,3,3,3,3,3,3,3,3,37,37,37,37,37,3,3,3,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,41,41,41,41,41,41,41,41,41,41,41,41,41,41,3,3,3,3,3,3,3,7,7,7,7,7,7,7,7,7,7,7,7,3,3,3,3,3,3,3,3,14,9,9,9,9,9,9,9,9,9,9,9,9,3,3,3,3,3,3,3,3,12,12,16,16,16,16,25,27,27,34,30,38,44,44,46,5,5,5,5,3,3,3,3,3,3,3,3,3,3,3,3,3,13,13,13,13,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,70,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,37,37,37,37,37,37,37,37,37,37,50,42,34,34,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,50,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,44,44,44,44,44,44,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,35,35,36,35,34,35,35,34,35,16,16,16,25,25,25,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,25,25,25,25,42,42,50,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,20,20,20,20,3,10,10,20,30,20,20,20,3,10,10,30,40,30,35,16,16,25,25,25,25,25,42,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,20,20,3,10,10,30,20,15,10,10,10,11,10,12,10,12,10,11,10,10,10,1,5,16,16,16,16,16,25,25,25,25,25,25,42,42,42,42,50,50,50,50,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,25,25,25,25,25,25,25,25,42,42,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,29,28,29,29,29,28,29,20,20,20,20,3,10,10,20,30,20,28,29,30,29,16,25,25,42,42,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,26,20,20,20,20,3,10,15,15,40,15,30,24,24,26,25,24,25,24,26,25,24,24,24,26,25,24,25,24,26,26,25,24,22,22,23,22,23,22,24,24,23,22,22,22,23,22,23,22,24,24,23,22,20,21,20,21,20,22,22,21,20,20,20,21,20,21,20,22,22,21,20,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,5,1,16,25,42,42,42,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,20,20,20,20,3,10,10,30,20,20,30,31,29,31,32,30,31,29,32,30,31,29,31,31,32,30,32,33,1,31,32,30,32,33,34,36,34,35,34,34,20,20,3,10,10,20,30,35,34,50,2,2,20,20,3,10,10,20,30,2,5,5,5,3,2,null,70,16,17,18,16,17,18,17,17,17,18,19,17,18,19,18,18,18,19,20,19,18,19,20,19,19,19,20,21,20,21,19,20,21,20,20,20,21,21,22,23,20,21,22,21,21,22,22,23,22,24,22,14,15,15,14,15,14,15,15,20,20,3,10,10,30,20,12,13,13,12,13,12,13,13,30,31,31,31,31,30,20,20,3,10,10,30,20,10,10,10,30,31,31,31,31,30,36,37,37,36,37,37,36,38,36,37,37,36,37,37,36,38,38,39,39,38,39,39,38,20,20,3,10,10,30,15,15,38,39,39,38,39,39,38,38,39,39,38,39,40,40,38,40,41,41,40,41,41,40,40,41,41,40,41,41,40,38,39,40,39,40,38,39,38,39,39,40,39,39,40,39,39,38,40,39,12,15,9,6,4,8,8,9,20,20,20,20,3,10,10,30,20,7,5,8,8,6,9,20,20,20,20,3,10,10,30,20,35,35,3,10,10,30,20,20,4,5,6,5,5,20,20,20,20,4,3,5,15,10,15,10,30,40,30,20,40,3,10,10,20,30,16,16,16,16,16,16,16,16,16,16,16,25,25,25,25,25,25,25,25,42,42,42,42,42,50,50,50,50,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,25,25,25,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,25,25,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,53,53,52,52,53,52,40,3,10,10,20,30,2,2,2,3,2,2,3,2,2,3,3,3,3,2,5,4,4,4,4,4,20,20,3,10,10,20,30,4,4,6,4,4,4,4,4,4,20,20,3,10,10,20,30,4,6,6,6,6,6,6,6,6,9,8,8,8,20,20,20,20,3,10,10,20,30,20,9,10,11,10,11,20,20,3,10,10,30,20,11,11,12,15,14,14,14,14,14,15,14,15,14,14,6,5,6,5,6,5,6,6,16,16,16,17,16,17,16,17,20,20,3,10,10,30,20,16,17,16,16,16,16,16,17,16,16,16,20,20,3,10,10,20,30,16,17,16,16,17,25,19,18,18,18,19,18,20,18,20,19,20,20,19,25,25,26,26,24,25,24,25,24,20,20,3,10,10,30,20,25,25,12,13,13,14,12,13,12,14,13,12,26,27,28,27,26,27,28,27,27,27,16,16,17,18,17,16,20,20,3,10,10,20,30,16,18,18,19,18,19,18,19,20,20,3,10,10,30,20,18,20,20,22,20,20,20,20,20,3,10,10,30,20,40,20,20,22,23,24,23,23,24,23,24,23,20,20,3,10,10,20,30,22,23,23,20,20,20,21,21,22,20,21,20,20,20,33,33,34,33,33,32,33,34,32,32,33,35,35,36,35,34,35,35,34,34,35,29,29,28,28,28,29,20,20,20,20,3,10,10,30,20,28,29,20,20,20,20,3,10,10,30,20,20,20,20,20,20,3,10,10,30,15,20,30,29,29,29,28,28,29,28,28,29,20,20,20,20,3,10,10,30,20,20,28,29,30,30,29,41,41,40,41,40,40,41,40,41,40,20,20,20,20,3,10,10,30,20,40,40,41,35,35,30,3,10,10,30,40,30,35,53,53,23,52,23,53,23,52,52,40,40,3,10,10,30,20,20,53,23,52,20,50,20,50,51,51,51,51,50,51,40,40,3,10,10,30,30,50,22,51,20,51,20,51,52,51,53,51,40,35,40,40,35,40,3,10,10,30,30,40,52,22,51,45,54,55,54,54,56,55,22,55,56,22,55,54,20,40,3,10,10,30,20,55,24,23,52,52,53,23,52,53,52,54,20,40,3,10,10,30,20,53,25,53,20,52,51,20,52,51,52,52,52,52,50,50,50,50,50,50,40,45,3,10,20,51,22,50,18,50,52,18,50,51,51,50,51,40,35,40,40,35,40,3,10,10,30,40,30,35,50,18,33,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,16,16,16,16,16,16,16,16,16,16,16,25,25,25,25,25,25,25,25,25,25,25,25,42,42,42,50,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,25,25,25,25,25,42,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,54,55,54,54,56,55,22,55,56,22,55,54,24,54,56,25,55,54,56,25,55,56,56,58,27,57,56,58,27,57,58,70,16,16,16,16,16,16,16,16,16,16,16,25,25,25,25,25,25,25,25,42,42,42,42,42,50,50,50,50,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,25,25,25,25,25,25,25,25,42,42,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,25,25,25,25,42,42,50,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,35,35,30,3,10,10,20,30,20,18,16,16,16,17,16,17,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,45,44,44,45,55,54,54,55,65,64,64,65,70,20,20,3,10,10,20,30,16,16,16,25,25,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,8,7,7,7,20,20,20,20,3,10,10,20,30,30,7,7,22,20,21,22,21,21,22,21,21,22,21,22,22,21,44,44,45,44,46,44,45,45,46,45,47,45,44,44,46,44,44,35,3,10,20,50,50,51,50,52,50,50,50,51,50,52,50,50,50,52,50,50,40,40,3,10,20,16,16,16,25,25,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,25,25,25,42,42,42,42,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,60,60,60,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,72,68,68,67,68,67,68,65,65,65,65,65,67,63,65,68,65,65,65,67,67,68,65,67,65,65,65,65,65,65,67,68,67,67,68,68,67,65,65,67,68,67,65,65,70,69,65,68,65,68,68,65,67,68,67,69,65,65,67,67,65,67,68,65,65,63,65,65,65,65,68,65,65,65,65,67,65,70,69,65,67,68,67,68,69,65,65,65,67,65,65,67,68,67,68,67,65,67,67,68,68,67,68,63,63,65,63,65,63,63,65,65,63,62,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,50,13,13,13,13,13,13,13,13,40,40,26,26,36,42,26,26,36,26,42,26,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,40,40,40,40,40,40,40,40,50,50,50,50,50,42,42,42,50,50,42,42,40,46,47,46,65,40,42,56,46,46,46,47,46,60,60,60,60,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,13,13,13,13,13,13,13,13,13,13,13,13,10,10,10,10,10,10,10,10,10,10,40,40,40,40,40,40,40,40,27,27,27,25,36,26,24,27,27,25,25,25,27,29,15,27,26,26,26,26,26,26,36,25,26,26,26,27,42,29,27,26,27,25,29,26,26,27,24,26,26,26,26,26,26,42,50,42,42,45,42,42,42,42,42,42,42,42,42,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,19,19,19,19,19,19,19,19,10,16,10,16,10,16,10,16,10,16,16,10,16,10,16,10,16,10,16,10,16,16,10,16,26,26,26,26,26,26,26,26,26,26,32,32,26,26,26,26,40,32,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,22,28,36,26,26,28,22,26,32,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,37,37,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,65,36,36,36,36,34,34,34,32,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,16,16,16,13,13,13,13,13,13,13,40,40,28,28,28,28,28,28,32,42,42,42,42,32,42,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,80,75,80,75,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,54,54,54,41,41,41,41,41,41,41,41,41,41,41,41,51,51,65,51,51,34,41,41,41,41,60,60,60,56,56,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,68,90,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,10,10,10,10,10,10,10,10,10,10,10,10,10,10,12,12,40,40,40,40,40,40,26,26,65,36,36,36,36,56,46,46,47,46,46,46,46,47,46,46,46,47,46,46,46,46,47,46,56,46,46,47,46,46,46,47,46,46,46,46,46,47,46,46,46,46,47,46,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,13,13,13,13,13,13,13,13,13,13,13,13,13,10,10,10,10,10,10,10,10,10,10,10,40,40,40,40,40,40,22,26,20,27,15,26,20,20,20,20,20,20,20,20,20,20,15,15,15,15,20,20,20,20,20,20,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,40,40,40,26,26,20,27,20,22,26,20,20,22,20,22,26,20,20,26,26,26,26,22,26,26,26,26,26,26,26,26,26,36,32,32,32,32,26,22,20,20,15,20,22,26,26,20,27,20,22,26,20,20,22,26,20,26,26,32,26,26,27,36,26,21,26,26,22,20,27,20,22,20,26,26,22,20,27,20,22,20,26,26,26,26,26,21,26,20,20,22,22,20,26,26,26,36,20,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,80,75,75,5,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,70,63,63,63,63,63,65,63,68,68,67,65,67,63,63,65,65,65,63,63,65,65,68,67,65,68,68,68,65,67,68,63,67,65,65,68,68,67,67,65,67,65,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,62,62,65,63,65,60,62,60,62,60,62,63,65,65,60,63,65,65,62,65,65,65,65,63,62,60,63,65,62,60,60,60,63,65,62,60,60,62,62,62,60,60,62,62,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,18,16,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,25,25,25,25,25,25,25,50,24,2,2,2,2,2,3,3,3,3,2,2,2,2,2,43,44,43,43,44,43,44,43,44,45,45,45,45,45,43,44,43,44,43,44,43,44,43,44,44,44,44,44,44,44,44,44,45,45,45,45,45,44,44,44,44,44,44,44,44,55,55,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,4,4,4,4,4,4,8,8,37,37,37,37,37,37,37,37,37,40,40,40,40,38,38,38,37,37,37,37,37,37,55,50,50,8,8,8,8,8,8,8,8,10,10,10,10,10,10,10,10,10,8,8,8,8,8,8,18,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,13,13,13,13,13,13,13,17,16,16,16,16,16,16,16,16,16,16,16,16,16,19,19,19,19,19,19,19,19,16,16,16,16,16,16,16,16,16,22,1,28,28,28,28,28,28,28,28,28,28,28,28,28,28,29,29,29,29,29,29,29,29,28,28,28,28,28,28,28,28,28,28,10,10,10,10,28,36,28,36,28,28,36,36,28,28,36,36,28,36,28,36,28,36,28,36,36,37,37,37,37,37,37,36,36,36,36,36,36,36,28,36,36,38,38,38,38,38,38,38,38,39,39,39,39,39,39,39,39,39,39,39,38,38,38,38,38,38,38,38,40,40,38,38,38,38,38,38,39,39,39,39,39,39,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,41,41,41,41,41,41,41,39,39,39,39,38,38,38,38,55,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,50,50,50,50,50,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,70,63,63,63,65,65,63,62,65,65,63,63,63,63,63,62,63,63,63,63,65,63,65,63,65,63,62,60,63,63,65,63,63,65,63,65,63,65,65,62,65,63,63,60,63,63,65,63,65,65,63,62,65,63,65,65,65,63,63,65,63,65,62,65,63,63,63,63,65,63,63,63,65,65,60,63,65,63,65,63,65,65,65,63,65,65,63,65,65,63,65,65,65,63,65,63,63,63,62,65,62,65,63,65,63,63,65,62,63,65,63,63,63,65,63,63,62,63,65,65,65,63,63,65,65,65,63,63,63,63,63,62,63,65,65,63,63,63,65,63,65,63,62,65,65,65,62,63,63,63,63,65,62,63,65,65,63,63,63,63,65,63,65,65,65,65,65,63,65,67,67,67,65,67,67,65,65,65,60,60,65,62,62,62,65,65,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,26,26,27,27,26,26,26,26,27,26,26,27,26,26,27,26,27,26,26,26,26,27,26,27,26,26,26,26,26,26,26,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,29,29,29,29,29,28,29,29,29,29,29,29,29,28,29,29,29,28,29,29,29,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,31,31,31,31,31,31,41,41,60,60,60,65,39,46,46,46,46,46,41,36,56,58,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,41,26,26,27,26,27,26,27,26,27,26,26,26,27,26,26,26,26,26,26,27,26,26,26,26,26,26,26,26,26,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,31,31,31,31,31,31,28,28,41,41,41,41,41,41,50,65,60,60,60,41,41,41,41,56,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,67,67,65,65,65,65,65,67,67,65,67,65,63,63,65,65,67,63,63,62,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,50,46,46,46,46,46,46,65,52,46,46,46,46,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,31,31,38,25,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,36,36,36,38,41,41,41,65,46,49,41,43,43,43,43,43,43,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,45,40,50,45,40,50,45,40,50,45,40,50,45,40,50,45,40,50,80,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,43,43,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,45,60,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,20,20,20,20,20,20,23,70,43,43,43,43,43,43,43,43,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,50,50,45,50,50,50,50,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,70,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,40,40,40,40,46,46,47,46,60,60,46,46,47,46,56,56,56,56,56,56,56,56,56,56,56,65,60,60,60,60,60,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,7,7,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,15,15,15,15,33,32,34,32,15,65,31,33,31,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,60,60,60,60,60,60,60,60,60,70,68,67,68,63,67,63,19,19,19,19,19,19,19,19,19,19,19,19,19,16,16,16,16,16,16,16,16,16,16,16,16,40,40,40,40,40,40,40,22,32,26,40,32,42,50,50,32,50,50,50,40,32,32,22,32,32,26,22,32,32,26,22,30,32,30,32,32,22,22,26,32,32,26,22,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5,5,10,25,20,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,10,10,7,7,7,10,21,21,21,21,21,21,22,22,22,22,22,22,22,22,21,21,21,21,21,21,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,28,26,28,26,28,26,28,26,28,26,28,26,28,26,28,26,28,26,28,26,28,28,26,26,28,26,28,26,28,26,26,28,28,26,28,26,28,26,28,26,28,26,28,26,28,26,28,26,28,40,40,40,40,40,36,36,36,40,40,55,55,52,40,40,65,56,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,42,42,42,42,42,42,50,65,36,36,36,36,36,26,26,28,56,56,46,46,47,46,46,46,46,47,46,46,46,47,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,67,65,63,62,63,65,65,63,65,63,65,65,63,62,63,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,60,60,60,60,60,60,65,65,65,67,68,68,65,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5,5,5,5,10,19,10,19,10,19,10,19,10,19,10,19,19,10,19,19,10,10,19,19,10,19,42,42,42,42,42,42,42,42,42,42,42,50,50,42,42,42,42,42,50,50,50,42,42,42,42,42,42,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,63,67,65,68,68,63,68,68,65,68,68,70,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,65,60,65,60,62,62,62,63,63,62,60,62,60,62,62,63,63,62,60,63,62,60,62,65,62,63,65,62,65,63,65,63,65,62,62,65,65,65,65,60,65,60,63,60,62,63,65,63,60,62,60,60,63,65,65,60,60,62,62,62,60,63,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,2,2,2,2,45,45,45,45,45,45,45,45,45,2,2,2,2,45,45,45,45,2,2,2,2,2,45,45,45,45,45,45,48,2,3,2,null,null,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,65,62,65,62,65,65,67,67,62,62,67,65,65,65,65,65,67,63,67,65,62,63,65,67,63,65,67,67,67,65,65,65,65,65,67,65,65,63,65,65,65,63,65,67,67,68,65,67,65,65,67,63,67,62,63,65,65,65,65,65,67,65,65,65,63,67,67,65,67,68,65,65,67,63,67,65,65,65,63,65,63,67,65,65,68,67,65,65,65,65,65,65,65,65,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,13,13,13,13,13,13,13,13,13,13,13,13,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,20,20,20,20,20,21,22,26,20,20,27,20,20,20,27,22,32,32,27,20,20,20,21,20,20,32,20,21,15,20,20,20,20,20,20,20,20,22,26,20,22,27,20,20,20,21,20,20,20,21,20,20,21,20,32,20,21,20,20,20,21,15,20,20,20,20,22,15,27,22,26,20,20,27,20,22,20,32,20,22,20,20,20,21,15,15,15,15,15,22,22,27,26,22,27,15,15,15,15,15,15,15,15,15,15,15,17,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,10,13,16,16,16,16,16,16,16,16,16,16,16,16,10,13,13,10,13,10,10,13,10,13,10,13,10,13,10,13,10,13,10,13,13,40,40,40,28,26,28,28,28,28,28,28,28,28,36,28,36,28,28,28,26,26,26,28,30,36,42,42,28,28,28,32,26,28,28,26,28,36,28,28,36,36,26,26,28,28,30,32,28,42,28,28,36,28,28,28,28,36,28,28,42,26,26,30,28,28,28,28,28,28,28,36,28,28,26,26,36,28,28,28,26,22,30,28,28,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,41,41,41,41,41,46,26,65,34,34,34,31,31,31,34,31,31,31,34,46,46,46,47,46,46,46,47,46,46,46,47,46,60,60,46,46,46,47,46,46,46,47,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,40,70,70,43,43,43,43,43,43,43,43,43,43,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,26,26,26,26,26,26,26,26,26,26,27,26,26,27,27,26,26,27,27,27,26,26,27,26,26,26,26,27,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,43,65,60,42,42,34,36,41,40,40,34,34,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30,30,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,65,68,68,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,60,60,70,70,70,70,63,60,60,60,60,60,60,60,63,63,63,63,65,65,65,68,68,65,65,65,63,65,65,65,65,65,65,50,16,16,16,16,16,16,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,26,26,26,26,26,26,26,26,26,26,26,26,26,26,65,34,34,40,40,40,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,52,52,52,52,52,52,52,52,49,49,49,49,49,49,49,50,49,49,49,49,49,49,49,49,49,50,50,49,50,49,49,49,49,49,49,49,49,49,49,49,49,49,50,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,70,70,70,12,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,38,38,38,38,38,38,38,28,28,28,28,15,15,65,46,46,47,46,56,56,46,46,46,46,47,46,56,56,56,46,46,46,47,46,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,43,43,43,43,43,43,43,43,43,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,50,50,50,50,50,50,50,50,50,50,50,50,80,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,50,37,37,37,37,42,37,37,37,40,37,42,37,37,37,37,37,37,37,37,70,52,52,52,52,52,52,52,54,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,54,52,52,52,52,52,52,52,52,52,52,55,55,55,55,55,55,59,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,62,62,62,62,62,64,64,64,64,64,64,72,72,78,78,79,80,80,85,20,20,20,20,19,25,20,23,23,21,24,22,20,25,19,26,19,22,20,20,20,20,22,20,20,24,24,24,24,24,24,24,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,24,45,45,null,null,null,null,null,null,null,null,null,null,null,null,null,70,5,5,5,2,18,23,26,23,23,23,27,23,23,23,23,23,23,23,23,23,23,10,35,34,34,34,35,34,34,34,34,34,34,34,35,35,34,34,34,34,34,35,35,35,34,34,34,34,34,34,34,34,34,34,34,35,34,34,34,34,35,35,35,34,34,34,34,34,35,34,34,34,34,34,34,34,36,34,34,34,34,34,31,31,31,31,31,33,35,31,31,31,31,31,31,31,34,31,31,31,31,33,31,31,31,32,31,31,31,31,31,31,31,null,null,null,null,70,18,15,35,14,20,15,15,14,28,34,23,16,20,14,26,15,14,28,18,18,18,20,18,26,18,25,25,20,25,20,20,20,20,20,20,20,20,20,20,25,22,18,17,17,17,17,18,21,17,18,17,18,18,18,18,17,17,17,17,17,17,17,21,20,17,17,18,18,20,17,17,18,17,17,17,17,17,17,18,17,17,17,17,17,16,16,18,16,21,18,16,16,16,16,16,18,17,18,16,18,23,18,19,18,18,18,18,22,18,20,18,18,18,20,18,18,18,23,18,18,18,18,16,18,16,16,20,16,18,16,16,23,20,20,20,20,20,20,20,20,20,20,70,null,null,null,23,23,23,23,23,23,23,23,24,24,26,24,24,24,28,24,24,24,28,24,26,24,24,24,24,27,24,24,24,24,24,24,24,24,24,24,24,24,23,23,23,28,23,23,23,23,23,23,26,23,23,24,22,22,22,22,22,22,23,22,26,22,22,17,26,36,17,17,17,27,17,17,36,36,17,20,17,36,17,17,23,22,26,22,22,22,26,22,22,27,28,22,22,22,25,22,22,25,27,22,29,null,null,null,null,70,19,25,22,25,25,19,19,19,19,19,19,19,19,19,20,19,19,19,19,19,19,19,20,19,19,19,20,20,19,19,19,19,19,19,20,19,19,20,19,19,19,19,19,19,19,19,23,19,19,19,19,19,19,22,19,20,19,20,19,19,20,19,19,19,23,19,19,19,19,19,19,19,20,19,19,24,19,19,23,17,19,17,17,17,17,20,17,17,17,20,20,20,20,24,null,null,34,34,34,35,42,34,34,34,34,34,40,34,34,35,35,34,34,34,38,34,34,35,35,35,34,34,34,34,34,34,34,34,34,34,34,35,34,34,42,34,35,35,35,35,35,42,35,35,39,35,35,40,35,37,35,35,42,35,42,35,35,34,34,35,35,35,35,34,34,40,34,34,40,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,40,36,36,36,36,34,34,34,34,34,34,34,34,34,34,34,34,34,34,35,34,34,34,34,34,36,34,34,34,40,35,39,34,34,40,35,34,37,34,34,34,34,36,36,36,36,36,36,36,36,36,36,36,36,36,34,34,34,35,34,34,34,34,34,34,34,35,34,38,38,38,38,38,38,38,38,38,38,38,38,38,38,34,35,34,34,40,34,34,34,35,34,34,34,34,34,34,34,36,34,34,34,34,34,38,38,38,38,38,38,38,38,38,38,38,38,38,38,36,35,45,40,30,43,45,40,33,40,51,25,41,35,34,35,49,49,35,50,40,49,55,55,45,70,70,70,3,3,3,25,5,38,38,38,38,38,38,38,38,38,38,39,38,48,38,38,38,38,38,38,38,38,null,null,70,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,50,46,46,46,46,49,49,49,49,49,49,49,49,49,49,49,47,47,48,47,48,47,50,47,47,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,46,46,46,46,46,46,46,48,46,46,46,46,46,46,46,46,46,50,46,48,46,46,50,50,50,50,50,50,46,46,46,46,46,46,46,46,46,46,46,46,48,48,48,null,null,49,49,49,49,49,49,49,49,51,52,52,49,49,49,49,49,49,49,49,null,null,null,null,43,43,43,43,43,43,43,43,43,43,43,45,43,43,43,43,50,43,43,43,43,43,43,43,48,43,43,43,43,43,43,43,45,43,43,43,43,43,43,43,43,43,50,43,43,43,43,43,43,43,43,43,43,43,45,43,43,43,43,43,43,43,43,46,46,46,46,46,43,43,50,55,49,49,49,49,49,49,50,49,49,49,49,49,49,49,52,52,49,49,49,49,49,49,49,49,49,49,49,49,49,50,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,70,70,70,20,16,18,16,16,16,16,16,22,20,20,20,18,20,16,17,18,16,18,16,18,18,16,18,18,16,16,16,16,22,18,16,16,16,21,18,16,16,16,16,16,18,18,16,17,18,18,18,18,18,18,22,20,18,18,22,17,17,19,17,17,17,17,20,20,17,17,17,17,17,17,20,16,23,16,19,16,23,16,16,16,16,16,22,16,22,16,20,16,19,19,20,19,19,19,23,19,19,19,16,16,22,18,16,16,20,16,18,16,16,23,21,21,21,21,21,21,21,21,21,18,16,16,16,16,16,16,16,19,19,19,19,19,16,20,20,20,null,null,null,null,70,2,2,4,2,2,5,2,2,2,2,2,2,3,7,7,7,7,7,7,70,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,40,53,40,40,50,65,70,15,8,20,15,8,15,8,23,20,8,14,15,16,16,16,22,18,16,16,17,16,16,16,18,16,18,18,18,18,18,18,20,18,18,18,18,18,18,16,16,16,20,18,16,16,21,16,16,16,16,16,18,16,17,16,16,16,19,16,16,16,16,16,16,16,16,16,16,20,16,16,19,16,16,16,16,16,20,16,16,16,20,16,16,16,16,16,16,2,10,14,2,20,10,13,16,16,16,16,16,16,16,16,19,19,19,19,19,20,20,20,20,null,null,null,null,70,70,2,5,2,4,2,2,2,5,5,5,5,5,5,5,5,5,5,5,6,6,6,8,6,6,5,2,8,5,2,2,3,3,3,3,3,3,5,5,5,8,5,4,4,70,38,38,38,38,41,38,38,38,38,38,38,37,37,37,42,37,37,37,40,40,37,37,37,37,37,37,37,37,37,37,37,37,42,37,37,37,37,37,37,37,37,37,37,37,40,37,37,37,37,37,37,37,37,37,37,37,37,37,37,39,37,37,37,37,37,38,38,38,38,38,38,38,39,38,38,38,38,38,38,38,37,37,37,37,40,37,37,40,40,40,42,40,40,40,42,40,40,40,40,40,40,40,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,null,null,15,15,12,7,7,14,7,15,14,16,14,14,14,14,14,14,14,14,17,10,10,7,14,7,7,7,10,13,15,9,9,9,10,16,35,25,35,13,11,12,13,10,14,16,null,9,7,7,7,7,10,10,7,7,7,7,10,7,10,7,7,7,10,7,7,7,7,7,7,10,7,12,10,7,10,7,7,7,10,10,10,10,10,7,11,9,7,7,7,7,7,7,7,9,10,10,17,15,15,25,31,25,25,25,25,25,25,25,25,31,25,25,25,32,25,25,25,25,25,29,25,29,29,29,29,30,29,29,29,29,29,26,26,26,28,26,26,26,26,26,26,26,26,26,26,25,27,25,25,32,25,25,25,31,25,28,28,30,28,28,28,28,28,28,28,28,null,70,5,18,35,18,20,18,18,32,18,18,28,18,31,25,39,34,23,37,20,18,26,25,18,18,28,19,15,13,13,13,18,18,14,14,13,13,16,14,18,13,15,17,19,13,13,13,15,15,13,13,13,15,13,20,15,13,15,13,13,14,19,15,13,14,13,20,13,13,13,15,16,13,15,16,13,13,20,13,13,13,13,13,13,14,13,14,14,14,14,14,14,14,14,19,19,19,19,19,14,14,14,14,20,null,null,null,null,null,null,null,null,70,70,28,28,28,28,28,33,35,28,28,28,28,28,28,28,28,28,34,28,28,28,28,28,33,28,28,28,28,35,28,28,28,28,28,32,28,28,35,35,28,34,28,28,28,28,28,28,28,28,33,28,28,28,28,28,28,32,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,30,28,28,28,28,28,28,28,28,28,32,33,32,35,32,32,32,32,32,32,32,32,35,32,28,28,35,28,32,28,28,28,31,28,31,33,33,31,31,null,null,null,22,25,22,25,25,28,22,22,22,22,25,22,22,22,22,22,22,22,22,22,26,26,28,26,26,26,28,26,26,27,22,23,22,22,28,22,28,26,22,22,22,22,22,26,22,22,26,26,26,26,26,26,26,26,28,26,26,26,26,28,26,24,27,24,24,24,24,24,24,26,26,26,28,26,26,26,26,26,28,26,26,26,23,26,23,23,23,27,23,23,23,23,23,23,23,23,23,23,null,null,68,68,30,30,1,1,1,1,1,1,1,60,30,60,70,57,57,60,60,50,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,100,47,47,90,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90],"maxLevel":[36,36,20,25,32,40,32,32,19,36,20,24,36,27,36,34,34,49,21,46,24,46,33,46,32,40,39,46,39,46,null,46,46,19,46,46,32,36,64,39,49,53,53,58,53,55,53,58,53,58,58,58,58,63,58,53,58,63,25,25,27,50,50,50,50,32,50,29,36,50,50,39,52,36,null,null,19,50,41,50,36,27,52,36,58,63,63,58,58,58,63,63,58,63,63,63,63,58,63,68,null,6,6,4,4,6,4,4,4,10,6,14,62,62,62,62,62,32,62,62,52,62,41,62,62,62,23,47,62,62,36,null,19,62,41,62,23,36,54,56,54,54,53,23,47,54,58,63,63,58,58,58,63,63,58,63,63,63,63,58,63,68,24,48,48,46,48,52,32,48,52,48,14,48,48,27,52,39,52,48,36,36,null,null,52,19,52,36,52,54,24,14,54,65,29,54,53,25,32,36,34,36,13,32,25,32,27,32,null,32,32,32,32,34,19,32,24,32,36,24,27,36,34,35,25,33,27,46,24,46,24,46,null,24,46,46,24,48,53,53,58,53,55,53,58,53,58,58,58,58,63,58,53,58,63,21,26,21,28,26,25,19,24,28,24,27,28,44,24,56,46,32,46,41,56,27,52,46,46,39,52,56,36,null,null,null,19,46,41,48,36,24,65,32,49,58,63,63,58,58,58,63,63,58,63,63,63,63,58,63,68,70,41,46,41,46,46,46,33,46,33,46,null,49,19,46,46,19,52,52,19,52,33,53,33,52,53,53,58,53,55,53,58,53,58,58,58,58,63,58,53,58,63,27,34,34,34,null,34,13,30,27,31,34,19,34,24,34,24,27,36,34,27,39,47,32,44,24,42,24,42,42,42,42,42,32,42,null,19,42,42,42,42,49,32,44,46,53,53,58,53,55,53,58,53,58,58,58,58,63,58,53,58,63,25,24,42,24,42,42,32,40,23,null,null,41,19,42,32,23,48,23,47,70,28,23,36,24,36,28,36,36,36,20,36,36,36,null,null,36,35,19,20,36,36,24,36,28,40,25,55,60,55,65,55,55,71,60,55,60,55,65,61,63,60,65,27,56,56,56,56,29,56,null,19,42,56,42,64,61,21,28,23,28,28,25,28,9,28,20,28,null,null,28,19,24,28,29,29,23,9,22,20,26,30,70,36,36,30,30,30,30,41,13,30,30,27,31,19,30,24,30,29,32,58,58,58,58,70,58,58,58,58,62,58,63,70,32,40,null,13,32,37,27,32,32,19,32,24,32,24,24,35,39,33,35,58,58,58,58,70,58,58,58,58,62,58,63,70,25,14,25,12,14,13,17,13,17,12,null,14,25,13,17,14,14,14,null,10,9,10,10,10,10,10,13,9,21,26,23,27,26,null,26,19,24,28,22,21,26,26,9,26,null,20,19,29,9,25,23,36,24,36,24,29,36,17,31,14,36,20,36,null,19,20,36,36,24,36,29,36,13,20,55,60,55,65,55,55,71,60,55,60,55,65,61,63,60,65,46,46,46,46,null,49,19,46,46,46,53,50,53,50,25,34,34,29,null,36,19,34,34,44,27,44,44,37,40,38,25,6,6,7,5,6,8,null,22,22,23,9,9,null,22,24,28,24,28,24,22,24,14,22,24,23,24,null,null,null,null,24,28,24,22,19,44,44,22,28,24,28,29,36,23,24,23,40,26,24,23,32,32,55,60,55,65,55,55,71,60,55,60,55,65,61,63,60,65,27,34,30,30,25,32,27,34,null,null,null,19,30,24,30,27,36,34,58,58,58,58,70,58,58,58,58,62,58,63,70,52,52,52,52,52,14,52,27,52,37,52,39,52,29,52,36,19,52,41,52,56,57,27,56,39,56,58,63,63,58,58,58,63,63,58,63,63,63,63,58,63,68,44,23,44,20,24,44,44,9,20,20,null,20,19,44,44,24,28,22,26,24,35,29,32,20,22,25,16,null,16,25,25,9,null,18,18,23,18,23,24,24,25,null,56,19,29,19,56,56,null,53,19,56,41,56,52,58,63,63,58,58,58,63,63,58,63,63,63,63,58,63,68,25,40,32,36,24,36,36,36,32,null,null,null,36,19,36,24,36,40,40,55,60,55,65,55,55,71,60,55,60,55,65,61,63,60,65,21,38,23,38,29,38,21,38,38,38,19,38,38,21,43,30,42,45,44,44,44,31,43,44,null,19,44,44,36,24,27,36,37,31,36,48,6,6,6,null,9,4,6,4,6,6,null,4,4,17,42,22,17,15,40,17,60,60,55,55,55,60,55,65,72,60,60,60,60,15,62,36,null,36,25,36,50,50,50,29,36,50,50,50,50,null,null,52,19,50,41,58,36,56,56,25,44,null,19,34,29,34,34,27,34,29,24,48,52,29,52,36,36,44,44,36,48,null,null,19,44,44,29,44,44,44,27,44,44,13,18,28,35,58,58,63,15,52,52,52,32,52,null,58,52,19,52,32,56,19,29,66,69,66,32,57,53,57,null,70,28,28,24,36,28,20,36,null,28,19,28,29,56,null,70,12,12,25,12,12,9,13,null,13,25,13,17,37,12,12,13,13,26,60,60,55,55,55,60,55,65,72,60,60,60,60,50,36,36,36,35,36,36,40,40,10,25,25,50,55,36,36,18,44,44,null,44,44,45,23,19,56,64,36,32,25,32,40,40,null,24,40,32,50,47,16,27,44,16,44,44,null,null,16,25,13,17,27,14,19,14,25,27,13,35,29,36,26,36,null,13,33,27,36,20,36,56,60,13,17,29,40,70,16,25,16,14,18,16,16,null,null,16,16,28,52,52,41,52,52,52,19,52,41,52,52,56,41,65,56,56,56,56,32,56,null,null,24,56,56,32,56,65,64,49,63,52,24,56,24,56,58,41,56,42,56,14,29,38,56,42,null,null,19,56,56,42,42,42,50,61,50,53,53,58,53,55,53,58,53,58,58,58,58,63,58,53,58,63,null,13,32,27,32,19,34,24,32,34,34,24,27,34,25,70,15,19,18,18,33,18,33,31,18,null,null,18,31,23,28,30,30,16,29,25,60,60,55,55,55,60,55,65,72,60,60,60,60,24,28,24,28,24,24,37,24,37,24,null,19,24,24,37,40,26,40,40,25,70,29,33,null,null,19,40,29,34,34,27,34,30,44,29,44,30,39,36,36,50,36,36,24,28,28,28,19,28,60,null,null,28,19,24,28,24,27,29,37,25,60,24,28,24,28,23,24,24,30,25,26,27,50,50,50,50,50,50,50,50,50,36,58,25,16,18,25,16,16,6,9,9,18,18,null,16,16,18,28,16,24,17,35,20,24,17,62,19,29,56,32,52,56,null,21,54,70,52,52,52,52,52,54,54,53,54,54,54,54,53,54,54,54,54,53,54,54,56,56,56,56,56,56,56,56,70,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,29,40,14,29,40,40,32,29,64,14,29,44,15,32,44,44,null,44,44,44,19,44,44,58,58,58,58,70,58,58,58,58,62,58,63,70,25,46,32,46,46,null,19,46,56,53,53,58,53,55,53,58,53,58,58,58,58,63,58,53,58,63,16,25,13,17,14,18,9,13,null,null,16,25,13,17,12,16,14,17,55,60,25,39,36,null,19,36,36,36,24,27,36,39,36,34,34,33,37,34,27,34,null,13,32,27,34,19,34,24,34,34,24,34,27,34,34,34,38,38,35,23,30,24,30,24,30,29,14,30,null,30,19,30,24,30,29,36,39,42,32,32,32,32,null,32,32,32,32,19,32,24,32,39,35,32,40,25,29,38,23,null,42,42,23,25,16,16,16,17,16,17,17,21,38,23,38,32,38,38,38,null,38,38,38,32,44,46,41,36,19,46,36,40,32,23,44,44,32,44,19,44,24,44,58,58,58,58,70,58,58,58,58,62,58,63,70,14,25,12,9,14,12,12,null,12,25,12,17,12,12,15,29,60,60,55,55,55,60,55,65,72,60,60,60,60,12,12,12,10,null,10,10,12,12,15,25,25,25,70,70,65,65,65,65,56,56,56,4,4,4,4,56,56,56,56,56,75,80,4,4,4,4,4,4,56,56,56,56,56,56,56,56,8,8,8,8,8,8,56,56,56,56,56,56,56,56,8,8,8,8,8,8,8,8,56,56,56,56,56,56,56,12,12,12,12,12,12,12,12,12,12,12,12,56,56,56,56,56,56,56,5,16,16,16,16,16,16,16,16,56,56,56,16,16,16,16,16,16,16,16,16,16,16,16,56,56,56,56,56,56,56,56,27,27,27,27,27,27,27,27,27,27,27,27,56,56,56,56,56,56,56,56,27,27,27,27,27,27,27,27,27,27,27,27,56,56,56,56,56,56,56,56,22,22,22,22,22,22,22,22,22,56,56,56,56,56,56,56,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,56,56,56,56,56,56,56,18,18,18,18,18,18,18,18,18,18,18,18,56,56,56,56,56,56,56,56,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,56,56,56,56,56,56,56,56,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,56,56,56,56,56,56,56,56,38,38,38,38,38,38,38,38,38,38,38,38,56,56,56,56,56,56,56,56,38,38,38,38,38,38,38,38,38,38,38,38,56,56,56,56,56,56,56,56,36,36,36,36,36,36,36,56,56,56,56,56,56,56,56,34,38,38,38,38,38,38,38,38,38,38,38,56,56,56,56,56,56,56,56,38,38,38,38,38,38,38,38,38,38,38,38,56,56,56,56,56,56,56,56,42,42,42,42,42,42,56,56,56,56,56,56,56,56,42,42,42,42,42,56,56,56,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,56,56,56,56,56,56,56,56,4,4,4,4,4,4,4,56,56,56,56,56,56,56,46,46,46,46,46,46,46,46,46,46,46,46,46,46,56,56,56,56,56,56,56,12,12,12,12,12,12,12,12,12,12,12,12,56,56,56,56,56,56,56,56,14,14,14,14,14,14,14,14,14,14,14,14,14,56,56,56,56,56,56,56,56,12,12,16,16,16,16,25,27,27,34,30,38,44,44,46,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,18,18,18,18,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,70,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,42,42,42,42,42,42,42,42,42,42,50,42,34,34,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,50,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,35,35,36,35,35,35,36,35,36,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,30,40,30,40,10,25,25,40,40,50,40,40,10,25,25,40,55,40,55,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,40,40,10,25,25,55,50,15,11,11,10,11,10,12,10,12,10,12,12,10,12,1,5,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,29,28,29,29,30,28,30,30,40,30,40,10,25,25,40,40,50,29,29,30,30,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,26,40,30,30,40,10,25,30,20,55,30,55,26,24,26,26,24,26,24,26,25,24,26,24,26,26,24,26,24,26,26,25,24,24,24,24,22,24,22,24,24,23,22,24,24,24,22,24,22,24,24,23,22,22,22,20,22,20,22,22,21,20,22,22,22,20,22,20,22,22,21,20,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,5,1,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,30,40,30,40,10,25,25,40,40,50,30,31,31,33,33,31,31,33,33,31,31,33,33,32,32,34,33,34,1,32,32,34,33,34,35,36,36,36,35,36,40,40,10,25,25,50,55,35,36,50,4,4,40,40,10,25,25,50,55,2,5,5,5,4,2,null,70,16,17,18,16,17,18,17,17,17,18,19,17,18,19,18,18,18,19,20,19,18,19,20,19,19,19,20,21,20,21,19,20,21,20,20,20,21,21,22,23,20,21,22,21,21,22,23,23,24,24,25,14,15,16,14,15,14,15,15,40,40,10,25,25,55,50,12,13,13,12,13,12,14,13,32,32,31,31,32,30,40,40,10,25,25,55,50,20,20,20,32,32,31,31,32,30,38,37,37,36,37,38,36,38,38,37,37,36,37,38,36,38,40,39,39,38,39,40,40,40,40,10,25,25,55,20,40,40,39,39,38,39,40,40,40,39,39,38,39,40,40,40,42,41,41,40,41,42,42,42,41,41,40,41,42,42,40,39,40,40,40,40,40,39,39,39,40,39,39,40,40,40,38,40,40,16,15,9,6,8,10,10,9,30,40,30,40,10,25,25,55,50,7,10,9,8,10,9,30,40,30,40,10,25,25,55,50,45,45,10,25,25,40,50,30,4,5,6,5,5,30,40,30,40,6,7,10,20,25,20,25,40,55,40,50,55,10,25,25,50,55,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,54,54,54,52,54,54,55,10,25,25,50,55,3,3,2,3,2,2,3,4,4,3,4,4,3,4,5,5,6,6,4,5,40,40,10,25,25,50,55,4,6,6,4,6,6,4,5,5,40,40,10,25,25,50,55,6,6,6,8,8,6,7,7,8,9,9,10,10,30,40,30,40,10,25,25,40,40,50,10,12,11,12,11,40,40,10,25,25,55,50,12,11,12,15,14,16,16,14,14,15,16,15,14,16,6,7,6,7,6,5,7,7,16,18,16,17,16,17,16,18,40,40,10,25,25,55,50,16,18,16,16,16,16,16,18,18,16,16,40,40,10,25,25,50,55,16,17,16,16,17,25,19,20,20,18,19,18,20,18,20,19,20,20,19,25,25,26,26,24,25,24,26,24,40,40,10,25,25,55,50,26,26,12,13,13,14,12,14,13,14,13,14,26,27,28,27,26,28,28,28,28,28,17,16,17,18,19,16,40,40,10,25,25,55,55,18,18,20,19,20,19,18,19,40,40,10,25,25,55,50,20,20,21,22,22,30,40,30,40,10,25,25,40,50,55,20,22,22,23,24,24,24,24,23,24,24,40,40,10,25,25,50,55,23,24,24,20,22,22,21,21,22,20,22,21,22,22,33,33,34,34,33,33,33,34,33,32,34,35,35,36,35,35,35,36,35,34,36,30,29,30,28,30,30,30,40,30,40,10,25,25,55,50,28,30,30,40,30,40,10,25,25,40,30,50,30,40,30,40,10,25,25,40,25,45,40,30,29,29,30,28,30,30,28,30,30,40,30,40,10,25,25,40,30,50,28,29,30,30,29,42,41,42,41,42,40,42,40,42,41,30,40,30,40,10,25,25,40,50,55,40,42,45,45,45,10,25,25,40,55,40,55,53,53,23,54,23,54,23,53,54,55,55,10,25,25,40,50,30,53,23,54,22,52,22,52,51,51,51,51,52,51,55,50,10,25,25,55,55,51,22,52,22,52,22,53,52,53,53,53,55,45,55,55,45,55,10,25,25,55,40,50,52,22,53,45,54,55,54,54,56,55,24,55,56,24,55,54,30,55,10,25,25,55,50,55,55,25,54,52,53,25,52,53,52,54,30,55,10,25,25,55,50,53,25,54,22,52,51,22,52,51,52,52,52,52,50,50,50,50,50,50,55,55,10,25,55,51,22,50,23,50,52,23,50,51,51,52,51,55,45,55,55,45,55,10,25,25,40,55,40,55,50,23,33,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,54,55,54,54,56,55,24,55,56,24,55,54,55,54,56,27,55,54,56,27,56,56,56,58,29,57,56,58,29,58,58,70,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,45,45,45,10,25,25,40,40,50,18,16,17,16,17,16,17,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,46,46,44,46,56,56,54,56,66,66,64,66,70,40,40,10,25,25,50,55,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,8,8,9,9,30,40,30,40,10,25,25,40,40,50,7,9,22,20,21,22,22,21,22,22,21,22,22,22,22,22,46,46,45,44,46,46,47,47,46,45,47,47,46,46,46,46,45,50,10,25,55,52,52,51,50,52,52,52,52,51,50,52,52,52,52,52,52,51,55,60,10,25,55,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,60,60,60,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,72,68,68,67,68,67,68,65,65,65,65,65,67,63,65,68,65,65,65,67,67,68,65,67,65,65,65,65,65,65,67,68,67,67,68,68,67,65,65,67,68,67,65,65,70,69,65,68,65,68,68,65,67,68,67,69,65,65,67,67,65,67,68,65,65,63,65,65,65,65,68,65,65,65,65,67,65,70,69,65,67,68,67,68,69,65,65,65,67,65,65,67,68,67,68,67,65,67,67,68,68,67,68,63,63,65,63,65,63,63,65,65,63,62,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,50,18,18,18,18,18,18,18,18,45,45,26,26,36,42,26,26,36,26,42,26,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,43,43,43,43,40,40,40,40,50,50,50,50,50,42,42,42,50,50,42,42,40,46,47,46,65,40,42,56,46,46,46,47,46,60,60,60,60,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,18,18,18,18,18,18,18,18,18,18,18,18,15,15,15,15,15,15,15,15,15,15,45,45,45,45,45,45,45,45,27,27,27,25,36,26,24,27,27,25,25,25,27,29,15,27,26,26,26,26,26,26,36,25,26,26,26,27,42,29,27,26,27,25,29,26,26,27,24,26,26,26,26,26,26,42,50,42,42,45,42,42,42,42,42,42,42,42,42,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,24,24,24,24,24,24,24,24,15,21,15,21,15,21,15,21,15,21,21,15,21,15,21,15,21,15,21,15,21,21,15,21,26,26,26,26,26,26,26,26,26,26,32,32,26,26,26,26,40,32,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,22,28,36,26,26,28,22,26,32,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,37,37,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,65,36,36,36,36,34,34,34,32,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,21,21,21,18,18,18,18,18,18,18,45,45,28,28,28,28,28,28,32,42,42,42,42,32,42,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,80,75,80,75,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,54,54,54,42,45,42,45,42,45,45,41,41,41,41,41,51,51,65,51,51,34,41,41,41,41,60,60,60,56,56,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,68,90,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,43,43,43,43,43,43,26,26,65,36,36,36,36,56,46,46,47,46,46,46,46,47,46,46,46,47,46,46,46,46,47,46,56,46,46,47,46,46,46,47,46,46,46,46,46,47,46,46,46,46,47,46,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,18,18,18,18,18,18,18,18,18,18,18,18,18,15,15,15,15,15,15,15,15,15,15,15,45,45,45,45,45,45,22,26,20,27,15,26,20,20,20,20,20,20,20,20,20,20,15,15,15,15,20,20,20,20,20,20,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,45,45,45,26,26,20,27,20,22,26,20,20,22,20,22,26,20,20,26,26,26,26,22,26,26,26,26,26,26,26,26,26,36,32,32,32,32,26,22,20,20,15,20,22,26,26,20,27,20,22,26,20,20,22,26,20,26,26,32,26,26,27,36,26,21,26,26,22,20,27,20,22,20,26,26,22,20,27,20,22,20,26,26,26,26,26,21,26,20,20,22,22,20,26,26,26,36,20,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,80,75,75,5,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,70,63,63,63,63,63,65,63,68,68,67,65,67,63,63,65,65,65,63,63,65,65,68,67,65,68,68,68,65,67,68,63,67,65,65,68,68,67,67,65,67,65,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,60,60,62,62,65,63,65,60,62,60,62,60,62,63,65,65,60,63,65,65,62,65,65,65,65,63,62,60,63,65,62,60,60,60,63,65,62,60,60,62,62,62,60,60,62,62,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,14,14,14,14,14,14,14,14,15,15,15,15,15,15,15,15,18,16,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,25,25,25,25,25,25,25,50,24,5,5,5,5,5,6,6,6,6,5,5,5,5,5,46,49,46,46,49,46,49,46,49,48,48,48,48,48,46,49,46,49,46,49,46,49,46,49,46,46,46,46,46,46,46,46,48,48,48,48,48,46,46,46,46,46,46,46,46,55,55,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,6,6,6,6,6,6,8,8,40,40,40,40,40,40,40,40,40,43,43,43,43,40,40,40,40,40,40,40,40,40,55,50,50,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,13,13,13,13,13,13,13,13,18,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,15,15,15,15,15,15,15,17,18,18,18,18,18,18,18,18,18,18,18,18,18,21,21,21,21,21,21,21,21,18,18,18,18,18,18,18,18,18,22,1,30,30,30,30,30,30,30,30,30,30,30,30,30,30,33,33,33,33,33,33,33,33,30,30,30,30,30,30,30,30,30,30,10,10,10,10,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,41,41,41,41,41,41,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,41,41,41,41,41,41,41,41,41,41,41,40,40,40,40,40,40,40,40,40,40,41,41,41,41,41,41,43,43,43,43,43,43,41,41,41,41,41,41,41,41,41,42,42,42,42,42,42,42,44,44,44,44,44,44,44,43,43,43,43,42,42,42,42,55,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,50,50,50,50,50,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,70,63,63,63,65,65,63,62,65,65,63,63,63,63,63,62,63,63,63,63,65,63,65,63,65,63,62,60,63,63,65,63,63,65,63,65,63,65,65,62,65,63,63,60,63,63,65,63,65,65,63,62,65,63,65,65,65,63,63,65,63,65,62,65,63,63,63,63,65,63,63,63,65,65,60,63,65,63,65,63,65,65,65,63,65,65,63,65,65,63,65,65,65,63,65,63,63,63,62,65,62,65,63,65,63,63,65,62,63,65,63,63,63,65,63,63,62,63,65,65,65,63,63,65,65,65,63,63,63,63,63,62,63,65,65,63,63,63,65,63,65,63,62,65,65,65,62,63,63,63,63,65,62,63,65,65,63,63,63,63,65,63,65,65,65,65,65,63,65,67,67,67,65,67,67,65,65,65,60,60,65,62,62,62,65,65,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,28,28,29,29,28,28,28,28,29,28,28,29,28,28,29,28,29,28,28,28,28,29,28,29,28,28,28,28,28,28,28,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,34,34,34,34,34,34,44,44,60,60,60,65,39,46,46,46,46,46,41,36,56,58,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,42,28,28,29,28,29,28,29,28,29,28,28,28,29,28,28,28,28,28,28,29,28,28,28,28,28,28,28,28,28,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,34,34,34,34,34,34,30,30,42,45,42,45,45,45,50,65,60,60,60,41,41,41,41,56,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,67,67,65,65,65,65,65,67,67,65,67,65,63,63,65,65,67,63,63,62,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,50,46,46,46,46,46,46,65,52,46,46,46,46,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,31,31,38,25,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,39,39,36,38,41,41,41,65,46,49,41,48,48,48,48,48,48,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,40,50,45,40,50,45,40,50,45,40,50,45,40,50,45,40,50,80,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,48,48,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,60,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,24,24,24,24,24,24,23,70,48,48,48,48,48,48,48,48,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,50,50,45,50,50,50,50,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,70,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,43,43,43,43,46,46,47,46,60,60,46,46,47,46,56,56,56,56,56,56,56,56,56,56,56,65,60,60,60,60,60,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,10,9,10,9,9,10,10,9,10,9,10,9,10,10,9,9,10,9,10,9,10,9,10,9,10,9,10,9,10,9,10,9,9,10,9,10,9,10,9,10,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,15,15,15,15,33,32,34,32,15,65,31,33,31,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,65,65,65,65,65,65,65,65,65,70,68,67,68,63,67,63,24,24,24,24,24,24,24,24,24,24,24,24,24,21,21,21,21,21,21,21,21,21,21,21,21,45,45,45,45,45,45,45,22,32,26,40,32,42,50,50,32,50,50,50,40,32,32,22,32,32,26,22,32,32,26,22,30,32,30,32,32,22,22,26,32,32,26,22,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5,5,10,25,20,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,10,10,11,11,11,10,24,24,24,24,24,24,26,26,26,26,26,26,26,26,24,24,24,24,24,24,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,30,28,30,28,30,28,30,28,30,28,30,28,30,28,30,28,30,28,30,28,30,30,28,28,30,28,30,28,30,28,28,30,30,28,30,28,30,28,30,28,30,28,30,28,30,28,30,28,30,43,43,43,43,43,36,36,36,40,40,55,55,52,40,40,65,56,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,16,16,16,15,16,16,16,15,16,16,15,16,16,15,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,45,45,45,45,45,45,50,65,36,36,36,36,36,26,26,28,56,56,46,46,47,46,46,46,46,47,46,46,46,47,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,67,65,63,62,63,65,65,63,65,63,65,65,63,62,63,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,65,65,65,65,65,65,65,65,65,67,68,68,65,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,5,5,5,5,15,24,15,24,15,24,15,24,15,24,15,24,24,15,24,24,15,15,24,24,15,24,42,42,42,42,42,42,42,42,42,42,42,50,50,42,42,42,42,42,50,50,50,42,42,42,42,42,42,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,63,67,65,68,68,63,68,68,65,68,68,70,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,60,65,60,62,62,62,63,63,62,60,62,60,62,62,63,63,62,60,63,62,60,62,65,62,63,65,62,65,63,65,63,65,62,62,65,65,65,65,60,65,60,63,60,62,63,65,63,60,62,60,60,63,65,65,60,60,62,62,62,60,63,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,3,3,3,3,3,47,47,47,47,47,47,47,47,47,3,3,3,3,47,47,47,47,3,3,3,3,3,47,47,47,47,47,47,48,2,3,2,null,null,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,62,65,62,65,65,67,67,62,62,67,65,65,65,65,65,67,63,67,65,62,63,65,67,63,65,67,67,67,65,65,65,65,65,67,65,65,63,65,65,65,63,65,67,67,68,65,67,65,65,67,63,67,62,63,65,65,65,65,65,67,65,65,65,63,67,67,65,67,68,65,65,67,63,67,65,65,65,63,65,63,67,65,65,68,67,65,65,65,65,65,65,65,65,65,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,18,18,18,18,18,18,18,18,18,18,18,18,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,20,20,20,20,20,21,22,26,20,20,27,20,20,20,27,22,32,32,27,20,20,20,21,20,20,32,20,21,15,20,20,20,20,20,20,20,20,22,26,20,22,27,20,20,20,21,20,20,20,21,20,20,21,20,32,20,21,20,20,20,21,15,20,20,20,20,22,15,27,22,26,20,20,27,20,22,20,32,20,22,20,20,20,21,15,15,15,15,15,22,22,27,26,22,27,15,15,15,15,15,15,15,15,15,15,15,60,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,15,18,21,21,21,21,21,21,21,21,21,21,21,21,15,18,18,15,18,15,15,18,15,18,15,18,15,18,15,18,15,18,15,18,18,45,45,45,28,26,28,28,28,28,28,28,28,28,36,28,36,28,28,28,26,26,26,28,30,36,42,42,28,28,28,32,26,28,28,26,28,36,28,28,36,36,26,26,28,28,30,32,28,42,28,28,36,28,28,28,28,36,28,28,42,26,26,30,28,28,28,28,28,28,28,36,28,28,26,26,36,28,28,28,26,22,30,28,28,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,16,16,16,16,16,16,16,16,16,16,15,16,16,15,16,16,16,16,15,16,16,16,15,16,16,16,15,16,16,16,16,16,16,16,16,16,16,16,16,16,44,44,44,44,44,46,26,65,34,34,34,31,31,31,34,31,31,31,34,46,46,46,47,46,46,46,47,46,46,46,47,46,60,60,46,46,46,47,46,46,46,47,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,40,70,70,48,48,48,48,48,48,48,48,48,48,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,28,28,28,28,28,28,28,28,28,28,29,28,28,29,29,28,28,29,29,29,28,28,29,28,28,28,28,29,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,43,65,60,42,42,34,36,41,40,40,34,34,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30,30,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,68,68,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,60,60,70,70,70,70,63,65,65,65,65,65,65,65,63,63,63,63,65,65,65,68,68,65,65,65,63,65,65,65,65,65,65,50,21,21,21,21,21,21,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,29,29,29,29,29,29,29,29,29,29,29,29,29,29,65,34,34,40,40,40,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,56,52,56,56,56,56,56,56,55,55,55,55,53,55,52,54,50,55,55,50,53,55,53,55,50,54,54,55,55,50,55,55,55,55,55,53,53,53,53,50,53,53,53,51,56,56,56,52,56,56,51,56,55,55,55,53,55,55,51,51,51,51,51,50,51,51,51,52,56,56,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,70,70,70,12,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,40,40,40,40,40,40,40,28,28,28,28,15,15,65,46,46,47,46,56,56,46,46,46,46,47,46,56,56,56,46,46,46,47,46,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,48,48,48,48,48,48,48,48,48,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,50,50,50,50,50,50,50,50,50,50,50,50,80,15,15,15,15,15,15,15,15,15,15,15,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,50,44,44,40,38,44,43,44,39,44,38,44,44,44,39,40,44,44,44,44,70,56,56,55,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,62,60,60,60,60,56,56,56,56,56,56,56,53,55,56,56,56,56,59,59,55,59,59,59,59,59,59,58,59,59,59,59,59,56,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,55,59,59,59,59,55,56,56,56,56,56,55,56,56,54,56,56,52,55,56,56,55,59,58,56,59,59,59,59,59,59,55,59,59,59,59,55,59,59,55,59,58,59,59,59,55,59,59,59,59,55,59,59,55,59,58,56,59,59,59,59,59,59,55,59,59,59,59,55,59,59,59,59,56,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,62,62,62,62,62,64,64,64,64,64,64,72,72,78,78,79,80,80,85,23,23,23,23,22,26,24,26,26,26,26,26,26,26,26,26,26,26,22,22,22,22,22,22,22,25,26,24,26,26,26,26,24,23,23,23,23,23,24,24,24,24,24,24,25,26,26,26,45,45,null,null,null,null,null,null,null,null,null,null,null,null,null,70,5,5,5,2,18,24,29,29,29,25,29,29,29,29,29,29,24,29,29,29,29,10,36,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,34,37,37,37,37,37,37,37,37,37,37,36,36,36,36,36,36,36,36,36,40,40,40,38,40,40,39,38,40,40,39,40,40,40,39,32,35,35,35,35,35,35,35,35,35,35,35,31,35,35,35,35,35,35,35,34,32,34,34,34,34,32,34,34,34,34,null,null,null,null,70,26,36,36,36,36,36,25,30,36,36,36,36,36,30,36,36,29,36,26,26,26,26,26,26,26,28,28,25,28,23,23,23,23,23,28,28,28,28,28,28,23,23,23,23,17,23,23,23,23,23,18,23,23,23,23,23,23,23,23,23,23,17,23,23,23,18,23,23,23,23,23,23,22,22,17,22,22,22,22,22,22,22,22,22,23,23,23,23,23,23,23,17,17,23,23,23,23,23,23,23,23,23,22,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,70,null,null,null,24,24,24,24,24,24,24,24,28,28,28,28,28,28,28,28,28,28,28,28,28,25,25,25,25,28,28,28,28,28,28,28,28,26,28,28,28,28,29,29,29,29,29,29,29,26,29,29,29,29,29,29,26,26,26,26,25,26,26,26,26,26,26,24,36,36,36,36,25,36,36,36,36,36,24,36,36,36,23,28,36,24,29,29,23,24,29,29,25,29,29,29,29,23,29,29,28,29,29,29,29,null,null,null,null,70,26,26,26,26,26,24,26,26,26,26,26,26,26,26,26,26,26,26,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,22,23,23,23,23,23,23,23,23,23,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,25,25,24,25,25,25,25,25,25,25,25,24,24,24,20,24,null,null,42,42,42,42,42,40,40,42,42,42,42,39,42,42,42,40,42,42,42,40,42,42,42,42,42,42,42,34,42,42,40,42,42,42,38,42,42,40,42,41,42,42,40,40,39,42,42,42,42,42,40,42,42,42,40,40,42,40,42,41,39,42,42,42,42,42,42,42,39,42,42,42,42,39,39,39,39,39,39,39,39,39,39,39,39,41,41,41,40,40,41,39,41,41,41,40,41,40,41,41,41,41,34,41,41,41,41,41,38,41,40,41,41,40,40,41,39,41,39,41,41,41,41,40,41,37,41,41,40,40,41,39,39,39,39,39,39,39,39,39,39,39,39,39,39,37,40,39,40,40,40,40,40,40,40,35,40,40,40,41,39,41,40,41,41,41,41,41,41,41,41,41,41,41,41,39,41,41,41,41,41,40,38,41,41,39,38,41,41,39,40,41,41,39,41,41,41,41,41,41,41,41,41,41,39,41,41,41,36,35,45,40,30,43,45,40,35,40,51,36,41,35,34,35,49,49,35,50,40,49,55,55,45,70,70,70,5,5,5,25,5,40,50,39,50,40,44,50,50,50,43,50,50,50,41,50,50,50,45,50,42,50,null,null,70,53,53,53,53,53,53,51,53,47,53,53,53,53,50,53,53,53,53,53,53,49,50,50,53,53,53,53,53,53,53,53,53,52,53,53,53,53,53,53,53,53,53,53,52,53,48,53,53,48,47,53,53,53,50,53,51,53,53,53,50,52,53,53,50,51,47,51,53,53,53,53,52,53,53,53,53,53,53,53,53,53,53,53,52,53,52,53,53,50,50,53,51,53,53,50,47,53,50,50,53,53,53,53,53,53,50,50,50,null,null,50,52,52,52,52,52,52,49,52,52,52,50,50,52,52,52,51,51,51,null,null,null,null,50,50,50,50,45,45,45,45,45,45,45,45,50,50,50,45,50,50,48,50,50,50,50,50,50,50,45,50,50,43,47,47,47,47,47,47,50,50,43,50,50,50,50,50,50,50,50,50,50,50,50,50,50,47,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,55,52,52,52,52,52,52,52,52,52,52,51,52,52,52,52,52,52,52,52,52,52,52,52,56,56,56,55,56,54,56,52,56,52,55,51,50,51,50,50,51,51,51,51,51,51,70,70,70,21,19,23,23,23,23,23,22,23,23,23,23,23,23,23,23,23,23,23,18,23,23,18,23,23,19,23,23,23,23,23,23,23,23,23,23,23,17,17,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,23,23,23,22,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,20,23,23,23,23,23,23,23,23,23,23,23,23,23,20,null,null,null,null,70,4,4,4,4,4,5,4,4,4,4,4,4,3,9,9,9,9,9,9,70,56,56,56,56,56,56,56,53,56,56,55,56,56,55,56,56,56,56,40,53,40,40,50,65,70,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,18,18,23,23,23,22,22,22,22,22,22,22,18,18,22,22,22,23,23,22,23,23,23,23,23,23,17,17,23,23,23,23,23,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,25,29,24,39,28,32,20,20,20,20,20,20,20,20,20,20,20,20,20,23,23,23,20,null,null,null,null,70,70,8,8,8,6,8,8,8,5,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,7,7,7,7,6,6,8,8,8,8,8,7,7,70,40,43,43,41,43,43,43,43,43,43,43,43,43,40,43,40,43,39,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,38,43,43,43,43,37,40,39,40,40,40,40,40,40,40,40,40,37,40,39,40,40,40,40,40,40,40,40,40,40,40,40,40,44,39,44,40,44,43,44,44,41,44,44,44,44,42,42,42,42,39,42,42,42,44,44,40,44,43,44,44,44,44,44,40,44,44,44,44,43,43,43,43,43,43,43,43,43,43,43,39,41,41,41,41,null,null,17,17,17,15,17,17,12,17,17,17,17,17,17,17,17,17,17,17,17,17,17,12,17,17,29,12,17,17,17,14,14,14,14,16,35,25,35,15,16,15,14,10,14,16,null,14,8,14,14,14,14,10,10,10,10,10,10,10,10,9,10,12,12,12,12,13,13,8,13,13,13,13,12,12,12,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,10,10,10,10,10,17,15,15,25,32,32,32,32,31,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,30,32,32,32,32,26,32,30,32,32,32,32,25,32,32,29,32,32,32,28,32,32,31,31,31,31,31,31,31,31,31,31,31,null,70,5,40,42,39,42,40,29,42,25,30,42,35,42,42,42,42,41,42,42,30,42,42,42,29,42,42,19,20,20,20,20,20,20,20,17,17,20,20,20,20,20,20,20,17,17,17,17,17,17,17,17,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,16,16,16,16,16,16,20,15,20,20,20,20,20,20,20,20,20,20,20,18,18,18,18,20,null,null,null,null,null,null,null,null,70,70,32,35,35,35,35,35,35,35,35,29,35,35,35,28,31,35,35,35,35,35,35,29,35,34,30,35,35,35,35,35,35,35,29,35,35,28,35,35,31,35,35,35,35,35,35,35,35,32,35,32,34,29,32,32,29,32,32,30,32,32,32,32,29,32,32,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,29,35,35,35,28,35,32,34,34,34,34,34,null,null,null,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,22,29,29,29,29,29,29,26,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,25,28,28,24,28,28,28,28,29,29,29,29,29,29,29,29,29,29,28,29,29,24,29,29,29,25,29,29,29,29,29,29,24,29,29,29,29,null,null,68,68,30,30,1,1,1,1,1,1,1,60,30,60,70,58,58,60,60,50,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,100,47,47,90,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90],"conditions":[0,8,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,7,0,8,7,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,7,0,0,7,0,0,0,0,7,8,8,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,7,8,7,7,0,0,8,8,0,7,8,7,8,8,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,8,8,0,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,8,7,7,8,8,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,8,8,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,7,7,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,8,0,0,0,0,0,7,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,7,7,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,8,7,7,7,8,8,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,7,7,0,0,8,8,7,7,0,0,0,0,8,0,0,7,8,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,7,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,7,8,0,8,0,7,8,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,0,8,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,7,0,0,7,7,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,7,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,8,8,7,7,0,0,0,0,0,0,0,0,0,0,8,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,112,0,0,0,0,7,0,0,8,0,112,7,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,128,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,7,0,0,0,8,8,7,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,7,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,0,0,0,0,0,8,8,7,7,0,0,0,0,0,0,0,0,0,0,8,8,0,7,7,8,8,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,8,0,0,0,0,0,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,7,7,8,8,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,8,0,0,0,7,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,4,0,0,8,8,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,8,0,0,0,7,8,0,0,0,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,7,7,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,7,7,0,0,0,0,0,0,8,8,7,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,7,7,7,7,0,8,8,0,7,7,8,8,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,7,8,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,7,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,0,0,0,0,8,0,8,8,7,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,0,7,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2048,2048,256,2048,256,2048,256,256,768,768,768,256,1536,768,1024,1024,768,256,256,256,256,2048,256,256,256,768,768,768,2048,256,1024,512,768,768,768,768,768,768,768,768,768,256,2048,256,1024,1536,768,1024,1024,1024,6400,1024,256,256,256,256,256,256,768,768,768,256,256,256,256,6400,256,2048,256,256,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,0,256,2048,256,256,256,256,256,4096,2048,256,2048,256,256,256,256,256,256,2048,768,768,256,768,2048,256,256,256,4096,256,256,256,256,256,256,256,256,256,256,256,2048,256,256,256,4096,2048,2048,256,256,256,256,256,256,256,768,768,2048,256,768,256,256,2048,256,256,256,256,256,4096,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,2048,2048,256,256,256,768,768,768,2048,256,256,256,256,256,256,256,256,2048,2048,2048,256,256,256,256,256,256,256,256,256,256,256,2048,2048,2048,256,256,256,768,768,768,2048,256,256,256,256,256,256,256,256,2048,2048,2048,256,256,256,256,256,256,256,2048,256,256,2048,256,256,256,256,2048,256,256,256,2048,256,256,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,256,256,256,256,256,256,256,256,256,2304,256,256,256,256,256,256,2048,256,768,768,768,768,768,2048,2048,256,256,256,256,256,256,256,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,256,256,256,256,256,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,256,256,256,256,256,256,256,256,256,256,2048,256,256,256,256,2048,0,256,2048,2048,256,256,2048,256,256,256,256,256,2048,256,256,256,256,256,256,2304,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,2048,256,256,6400,6400,256,256,256,0,6400,1024,1024,1536,1536,1024,1024,768,768,1024,1024,1280,1024,1024,1024,512,6400,6400,768,256,1280,256,256,256,256,256,256,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,256,2048,256,256,256,256,256,256,256,256,2048,2048,2304,2048,2304,256,256,256,256,256,256,256,2048,256,256,768,768,1536,768,768,1024,1024,768,768,1024,2048,2048,1024,1536,1536,1024,1024,768,1024,1280,1024,512,6400,256,256,256,256,256,256,256,256,256,768,1024,768,256,256,1280,256,256,256,6400,256,0,0,0,0,256,2048,256,256,256,256,256,256,256,2048,256,256,2048,2048,2048,256,256,256,2048,256,256,256,256,256,256,2048,768,1536,2048,1024,1024,1024,256,768,768,2048,256,768,768,1536,768,768,1024,1024,256,768,768,1024,1024,2048,2048,256,1024,1536,1536,1024,1024,768,1024,1024,1024,512,6400,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,256,256,256,256,2048,256,256,256,256,256,256,2304,256,256,256,256,256,2048,256,256,0,0,0,0,0,2048,256,256,256,256,768,256,256,256,256,256,256,256,256,256,256,6400,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,256,256,256,2048,2048,2048,256,256,256,256,256,256,256,768,768,1536,768,768,1024,1024,768,768,1024,2048,2048,256,1024,1536,1536,1024,1024,768,1024,1280,1024,512,6400,256,256,256,256,256,256,256,256,256,768,1024,768,768,256,1280,256,256,256,6400,256,2048,2048,256,256,256,0,0,2048,2048,256,256,256,2048,256,256,256,256,256,256,2048,256,256,256,256,256,256,256,2304,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,256,256,256,256,256,2048,2048,256,256,256,2048,2048,256,2048,256,256,256,768,768,256,256,2048,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,2048,256,2048,256,256,256,256,256,256,2048,256,2048,2048,256,256,2048,256,256,256,2048,256,256,256,256,256,2304,256,256,256,256,256,256,256,256,256,2048,256,256,256,2048,256,256,256,256,2048,256,256,256,2048,256,256,256,2048,768,768,256,256,256,256,768,768,1536,768,2048,1024,1024,1024,768,256,2048,256,768,768,768,1536,768,768,1024,1024,768,1024,2048,2048,256,256,1024,1024,1536,1536,1024,768,1024,1024,1024,768,768,1024,6400,512,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,256,256,256,256,2048,2048,2048,2048,2048,2048,2048,256,256,2048,256,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,256,256,256,0,0,1024,1024,1536,1536,1024,6400,768,1024,1024,1024,1024,1024,1024,1024,1024,768,768,1024,768,512,6400,0,0,0,256,2048,256,256,256,256,256,256,2048,256,256,256,256,256,2304,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,2048,2048,256,256,2048,256,256,2048,256,256,768,768,1536,256,1024,2048,2048,256,768,768,768,768,256,2048,256,1024,1536,768,1024,1024,1024,1024,768,6400,256,256,256,256,256,256,2048,2048,256,256,256,2048,256,256,256,256,256,256,2048,2048,256,2048,768,256,768,256,6400,256,256,256,256,256,2048,2048,2048,2048,2048,2048,2048,256,2048,2048,256,0,0,2048,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,256,256,0,0,0,0,256,256,256,256,2048,2048,256,2048,256,2048,256,256,768,768,768,1024,2048,256,256,1024,1536,768,1024,1024,1024,1024,1024,768,6400,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,768,256,768,256,6400,256,256,256,256,256,2048,256,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,256,256,0,0,768,256,768,1536,256,2048,2048,256,256,256,256,256,256,256,256,256,256,256,2048,2048,256,256,256,256,256,256,256,256,256,256,2048,2048,256,2048,256,256,256,2048,2048,2048,2048,2048,2048,2048,256,0,0,0,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,2048,256,256,2304,256,2048,256,2304,256,256,256,256,256,256,256,256,256,2048,768,768,256,256,256,768,768,2048,2048,256,768,768,1536,768,768,2048,256,512,256,256,1024,256,1024,1024,256,768,2048,768,768,1536,768,512,2048,768,256,1024,1024,256,256,768,768,1024,2048,2048,1024,1536,1536,1024,1024,768,1024,1024,6400,512,256,256,256,256,256,256,256,256,256,256,256,768,1024,768,256,256,256,256,256,256,6400,256,2048,256,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,256,2048,2048,256,0,0,0,0,0,256,256,256,256,256,256,1536,6400,768,1024,6400,768,0,256,256,256,256,2048,256,0,256,256,256,2048,256,256,256,256,256,256,256,256,256,256,256,256,256,256,0,0,0,0,0,0,0,1024,1536,1536,1024,6400,1024,768,1024,1024,1024,6400,512,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,2048,256,256,2304,2048,256,2304,256,256,256,256,256,256,256,2048,768,256,1536,768,768,2048,256,256,1024,1024,1024,256,768,256,2048,768,1536,768,768,1024,1024,768,1024,2048,2048,1024,1536,1536,1024,1024,768,1024,6400,512,256,256,256,256,256,256,256,2048,256,256,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,256,256,0,0,0,0,0,0,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,768,1536,768,512,768,768,768,1536,512,768,768,1024,1536,6400,768,1024,6400,768,256,2048,256,256,256,2048,256,0,256,256,2048,256,256,256,2048,2048,2048,256,6400,256,256,256,256,2048,256,256,256,256,2048,256,256,2304,256,256,256,256,256,256,256,256,256,2048,256,256,256,6400,768,768,1536,768,2048,1024,2048,1024,1024,768,2048,768,768,768,1536,768,1024,768,1024,1024,1024,1024,768,1024,2048,256,256,1024,1024,1536,1536,1024,768,1024,1024,1024,1024,1024,1024,6400,6400,512,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,256,256,256,2048,256,2048,2048,2048,2048,2048,2048,256,256,2048,2048,256,0,0,256,256,256,256,256,256,256,256,256,2048,2048,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,256,2048,256,256,0,0,0,0,0,0,0,0,0,0,0,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,2048,256,256,768,1536,768,768,768,1024,2048,256,256,256,256,2048,256,2048,2048,2048,2048,2048,256,256,256,256,256,2048,256,256,2048,256,2048,256,256,0,0,0,256,2048,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,768,1536,2048,1024,1024,1024,1024,768,2048,768,768,1536,768,768,1024,1024,256,768,768,1024,1024,2048,2048,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,2048,2048,2048,2048,2048,2048,256,256,0,0,0,1024,1024,1536,1536,1024,6400,6400,1024,768,768,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,512,6400,6400,6400,256,2048,2048,256,256,2304,2048,256,256,256,256,256,256,256,256,2048,6400,768,1536,768,1024,1024,768,1024,2048,1024,1536,1536,1024,6400,1024,768,1024,6400,6400,512,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,6400,768,256,256,6400,256,2048,256,256,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,256,256,256,0,0,0,0,0,0,0,0,0,0,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,2048,256,256,256,6400,768,256,1536,768,2048,256,1024,1024,256,1024,1024,256,768,256,2048,256,768,768,768,1536,768,768,768,1024,1024,768,1024,2048,2048,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,256,256,256,0,0,0,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,2048,2048,256,2048,768,768,1536,768,768,768,768,256,1024,1024,768,768,1024,1024,2048,2048,256,256,1024,1536,1536,1024,6400,768,768,1024,1024,1024,6400,6400,512,256,256,256,256,256,256,256,256,768,6400,768,768,256,256,256,256,6400,6400,256,256,256,256,256,256,256,256,256,256,256,256,256,2048,256,256,256,256,2048,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"area":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,17,17,18,18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,22,22,22,23,23,23,23,23,23,23,23,23,23,23,24,24,24,24,24,24,24,24,24,24,24,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,28,28,28,28,28,28,28,28,28,28,28,28,28,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,33,33,33,33,33,34,34,34,34,34,34,34,34,34,34,34,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,40,40,40,40,40,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,42,42,42,42,42,42,42,42,42,42,43,43,43,43,43,43,43,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,49,49,49,49,49,49,49,49,49,49,49,49,49,49,50,50,50,50,50,50,50,50,50,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,53,53,53,53,53,53,53,53,53,53,53,53,54,54,54,54,54,54,54,54,54,54,54,54,54,54,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,61,61,61,61,62,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,64,64,64,64,64,64,64,64,64,64,65,65,65,65,65,65,65,65,65,65,65,65,65,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,67,67,67,67,67,67,67,67,67,67,67,68,68,68,68,68,69,69,69,69,69,70,70,70,70,70,71,71,71,71,71,72,72,72,72,73,73,73,73,73,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,75,75,75,75,75,75,75,75,75,75,75,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,79,79,79,79,79,79,79,79,79,79,79,79,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,83,83,83,83,83,83,83,83,84,84,84,85,85,85,85,86,86,86,86,86,86,86,86,86,86,86,86,86,86,87,87,87,87,87,87,87,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,90,90,90,90,90,90,90,90,90,91,91,91,92,93,94,94,94,94,95,95,95,95,95,95,95,95,95,95,95,95,96,96,97,97,97,97,97,97,97,97,97,97,97,97,97,97,98,98,98,98,98,98,98,98,98,98,98,98,98,98,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,101,101,101,101,101,101,101,101,101,101,101,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,115,115,115,115,115,115,115,115,115,115,115,115,115,115,116,116,116,116,116,116,116,116,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,118,118,118,118,118,118,118,118,118,118,118,118,118,118,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,122,122,123,123,123,123,124,125,125,126,126,127,128,128,129,130,130,130,130,131,131,131,131,131,131,131,131,131,131,131,131,131,132,132,132,132,133,133,133,133,133,133,134,134,134,134,134,134,135,135,135,135,135,135,135,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,137,137,137,137,137,137,137,137,137,137,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,139,139,139,139,139,139,139,139,139,139,140,140,140,140,140,140,140,140,140,140,141,141,141,141,141,141,141,141,141,141,141,141,142,142,143,143,143,143,143,144,144,144,144,144,145,145,145,145,145,145,146,146,146,146,146,146,147,147,147,147,147,147,147,147,148,148,148,148,148,148,148,148,149,149,149,149,149,149,149,149,150,150,150,150,150,150,150,150,150,150,150,150,150,151,151,151,151,151,151,151,151,151,151,151,151,151,151,152,152,152,152,152,152,152,152,153,153,153,153,153,153,153,153,154,154,154,154,154,154,154,154,155,155,155,155,155,155,155,155,152,153,154,155,156,156,156,156,156,156,157,157,157,157,157,157,157,157,157,157,158,158,158,158,158,158,158,158,158,158,159,159,159,159,159,159,159,159,159,159,160,160,160,160,160,160,160,160,160,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,163,163,163,163,163,163,163,163,163,163,164,164,164,164,164,164,164,164,164,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,166,166,166,166,166,166,166,167,168,168,168,168,168,168,168,168,168,168,168,168,168,169,169,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,174,175,175,175,175,175,175,175,175,175,175,175,174,174,174,174,174,174,174,174,174,174,176,176,176,176,176,176,176,176,176,176,176,177,177,177,177,177,177,177,177,177,177,178,178,178,178,178,178,178,178,178,178,179,179,179,179,179,179,179,179,179,180,180,180,180,180,180,180,180,180,180,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,181,181,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,183,183,183,183,183,183,183,183,183,183,184,184,184,184,184,185,185,185,185,186,186,186,186,187,187,187,187,187,187,188,188,188,188,188,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,191,191,191,191,191,191,191,191,192,192,192,192,192,192,192,192,193,193,193,193,193,193,193,193,193,194,194,194,194,194,194,194,194,194,194,195,195,195,195,195,195,195,195,195,195,196,196,196,196,196,196,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,198,198,198,198,198,198,198,198,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,200,200,200,200,200,200,201,201,201,201,201,201,201,201,202,202,202,202,202,202,202,202,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,204,204,204,204,204,204,204,205,205,205,205,205,205,205,205,206,206,206,206,206,206,206,207,207,207,207,207,207,207,208,208,208,208,208,208,208,209,209,209,209,209,209,209,209,209,209,209,209,210,211,212,213,213,214,214,214,214,214,214,214,214,214,214,214,214,215,215,215,216,216,216,217,217,217,217,217,217,217,217,217,218,218,218,218,218,218,218,218,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,220,220,220,220,220,220,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,224,224,224,224,224,224,224,224,224,224,224,224,225,225,225,225,225,225,225,226,226,226,226,226,226,226,227,227,227,227,227,227,227,227,227,227,227,227,227,227,227,227,228,228,228,228,228,228,228,228,228,228,228,228,228,228,228,229,229,229,229,229,229,229,230,230,230,230,230,230,230,230,230,230,230,230,230,230,230,231,231,231,231,231,231,231,231,231,231,231,231,231,231,232,232,232,232,232,232,232,232,232,232,232,233,233,233,233,233,233,233,233,234,234,234,234,234,234,234,234,234,234,234,234,234,234,234,234,234,235,235,235,235,235,235,235,235,235,235,235,235,235,235,235,235,235,235,235,235,235,235,236,236,236,236,236,236,236,236,236,236,236,236,236,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,238,238,238,238,238,238,238,238,238,238,239,239,239,239,239,239,239,239,239,239,240,240,240,240,240,240,240,240,240,240,240,240,240,240,241,241,241,241,241,241,241,241,241,241,241,241,241,241,241,242,242,242,242,242,242,242,242,242,242,242,242,242,242,242,242,243,243,243,243,243,243,243,243,243,243,243,243,243,243,243,243,243,243,243,244,244,244,244,244,244,244,244,244,244,244,245,245,245,245,245,245,245,245,245,245,245,246,246,246,246,246,246,246,246,246,246,247,247,247,247,247,247,247,247,247,247,247,247,247,247,247,247,247,248,248,248,248,248,248,248,248,248,248,249,249,249,249,249,249,249,249,249,249,249,250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,251,251,251,251,251,251,251,251,251,251,251,251,251,251,251,251,251,251,251,251,251,251,252,252,252,252,252,252,252,252,252,252,253,253,253,253,253,253,253,253,253,253,253,253,253,253,253,253,253,253,253,253,254,254,254,254,254,254,254,254,254,254,254,254,254,254,254,254,254,254,254,254,255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,256,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,258,258,258,258,258,258,258,258,258,258,258,258,258,258,258,258,258,258,258,258,258,258,258,258,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,260,261,262,263,264,265,266,267,267,267,267,267,267,267,267,267,267,267,267,267,267,267,267,267,267,267,267,268,268,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,269,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,270,271,271,271,271,271,271,271,271,271,271,271,271,271,272,272,272,272,272,272,272,272,272,273,273,273,273,273,273,273,273,273,274,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,275,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,278,278,278,278,278,278,278,278,278,279,279,279,279,279,279,279,279,279,279,279,279,279,279,279,279,279,279,279,279,279,279,279,280,280,280,280,281,281,281,281,282,282,282,282,283,284,284,284,284,284,284,284,285,285,285,285,285,285,285,285,285,285,285,285,285,285,285,285,285,285,285,285,285,285,285,285,286,286,286,286,286,286,286,286,286,286,286,286,286,286,286,286,286,287,287,287,287,287,287,287,287,287,287,287,287,287,288,288,288,288,288,288,289,289,289,289,289,289,290,290,290,290,290,290,290,290,290,291,291,291,291,291,291,292,292,292,292,292,292,292,292,292,292,292,292,292,292,292,292,293,293,293,293,293,293,293,293,293,293,293,293,293,293,293,293,293,293,293,293,293,293,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,295,296,296,296,297,298,298,298,298,298,298,298,298,298,298,298,298,298,298,298,298,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,301,302,302,302,302,302,302,303,303,303,303,303,303,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,304,305,305,305,305,305,305,305,305,305,305,305,306,306,306,306,306,306,306,306,306,306,307,307,307,307,307,307,307,307,307,307,307,307,308,308,308,308,308,308,308,308,308,308,308,309,309,309,309,309,309,309,309,309,309,309,309,309,309,309,309,309,310,310,310,310,310,310,310,310,310,310,310,310,310,310,311,311,311,311,311,311,311,311,311,311,311,311,311,311,311,311,312,312,312,312,312,312,312,312,312,312,312,312,312,312,312,313,313,313,313,313,313,313,313,313,313,313,313,314,314,314,314,314,314,314,314,314,314,314,315,315,315,315,315,315,315,315,315,315,315,315,316,316,316,316,316,316,316,316,316,316,316,317,317,317,317,317,317,317,317,317,317,317,317,317,317,317,317,317,317,318,318,318,318,318,318,318,318,318,318,318,318,318,318,318,318,318,319,319,319,319,319,319,319,319,319,319,319,319,319,319,319,319,319,320,320,320,320,320,320,320,320,320,320,320,320,320,320,321,321,321,321,321,321,321,321,321,321,321,321,322,322,322,322,322,322,322,322,322,322,322,322,323,323,323,323,323,323,323,323,323,323,324,324,324,324,324,324,324,324,324,324,324,324,324,324,324,324,325,325,325,325,325,325,325,325,325,325,325,325,326,326,326,326,326,326,326,326,326,326,326,326,327,327,327,327,327,327,328,328,328,328,328,328,328,328,328,328,329,329,329,329,329,329,329,329,329,329,329,330,330,330,330,330,330,330,330,330,330,330,331,331,331,331,331,331,331,331,331,331,331,331,331,331,331,332,332,332,332,332,332,332,332,332,332,332,332,332,332,333,333,333,333,333,333,333,333,333,333,333,333,333,333,333,333,333,334,334,334,334,334,334,334,334,334,334,334,334,334,334,334,334,335,335,335,335,335,335,335,335,335,335,335,335,335,336,336,336,336,336,336,336,336,336,336,336,336,336,336,336,337,337,337,337,337,337,337,337,337,337,337,337,337,337,337,337,338,338,338,338,338,338,338,338,338,338,338,338,338,338,338,339,340,340,340,340,340,340,340,340,340,340,341,342,343,344,345,346,347,348,349,350,351,351,351,351,351,351,351,351,351,351,351,352,352,353,353,353,353,353,353,353,353,353,353,353,352,352,352,352,352,352,352,352,352,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,354,355,355,355,356,357,357,357,357,357,358,358,358,359,359,360,360,361,362,362,362,363,364,365,366,367,367,367,367,367,368,368,368,368,369,370,370,370,370,370,370,370,370,370,370,370,370,371,371,371,371,371,371,371,371,371,371,371,371,372,372,372,372,372,372,372,372,372,372,372,372,372,372,372,372,372,372,372,373,373,373,373,373,373,373,373,373,373,373,373,373,373,374,374,374,374,374,374,374,374,374,374,374,374,374,374,374,375,375,375,375,375,375,375,375,375,375,375,375,375,375,375,376,376,376,376,376,376,376,376,376,376,376,376,376,377,377,377,377,377,377,377,377,377,377,377,377,377,377,378,378,378,378,378,378,378,378,378,378,378,378,378,378,379,379,379,379,379,379,379,379,379,379,379,379,379,379,380,380,380,380,380,380,380,380,380,380,380,380,380,380,380,369,369,369,369,369,369,369,369,369,369,369,369,369,369,381,381,381,381,381,381,381,381,381,381,381,381,381,382,382,382,382,382,382,382,382,382,382,382,382,382,383,383,383,383,383,383,383,383,383,383,383,383,383,383,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,385,385,385,385,385,385,385,385,385,385,385,385,386,386,386,386,386,386,386,386,386,386,386,386,386,386,386,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,388,388,388,388,388,388,388,389,390,391,391,392,393,393,393,393,394,395,396,397,398,399,399,399,400,401,402,403,403,404,405,406,406,406,407,408,409,409,410,411,412,413,414,415,416,417,418,418,419,420,420,421,422,423,424,425,425,426,426,387,387,387,387,387,387,387,387,387,387,387,427,427,427,427,427,427,427,427,427,427,427,428,428,428,428,428,428,428,428,428,428,428,428,428,429,429,429,429,429,429,429,429,429,430,430,430,430,430,430,430,430,430,430,430,430,431,431,431,431,431,431,431,431,431,431,431,431,432,432,432,432,432,432,432,432,432,432,432,433,433,433,433,433,433,433,433,433,433,433,434,434,434,434,434,434,434,434,434,434,434,434,434,435,435,435,435,435,435,435,435,435,435,435,435,436,436,436,436,436,436,436,436,436,436,436,436,437,437,437,437,437,437,437,437,437,437,437,437,438,438,438,438,438,438,438,438,438,438,438,438,438,438,438,439,439,439,439,439,439,439,439,439,439,439,440,440,440,440,440,440,440,440,440,440,440,440,441,441,441,441,441,441,441,441,441,441,441,441,441,441,442,442,442,442,442,442,442,442,442,442,442,442,442,442,442,442,442,442,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,443,444,444,444,444,444,445,445,445,445,445,445,445,445,445,445,445,445,445,446,446,446,446,446,447,447,447,447,447,448,448,448,448,448,448,448,448,448,448,448,448,448,448,443,443,443,443,443,443,443,443,443,443,443,449,449,449,450,450,450,450,450,450,450,450,450,450,450,450,450,450,451,451,451,451,451,451,451,451,451,451,451,451,451,451,451,451,451,451,452,452,449,452,452,452,452,452,452,452,452,453,453,453,453,453,453,453,453,453,453,453,453,453,453,454,454,454,454,454,454,454,454,454,454,454,454,455,455,455,455,455,455,455,455,455,455,455,455,455,456,456,456,456,456,456,456,456,456,456,456,456,449,449,449,449,449,449,449,449,457,457,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,459,460,460,460,460,461,462,462,462,463,463,463,463,463,463,463,463,463,463,463,463,463,463,463,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,465,465,465,465,465,465,465,465,466,465,465,465,465,465,465,467,467,467,467,467,467,467,467,467,467,467,467,467,467,467,468,468,468,468,468,468,468,468,468,468,468,468,468,468,468,469,469,469,469,469,469,469,469,469,469,469,469,469,469,469,470,470,470,470,470,470,470,470,470,470,470,470,470,470,470,466,466,466,466,466,466,466,466,466,466,466,466,466,466,466,471,471,471,471,471,471,471,471,471,471,471,471,472,472,472,472,472,472,472,472,472,472,472,472,472,472,472,472,473,473,473,473,473,473,473,473,473,473,473,473,474,475,476,477,478,479,480,481,482,483,484,485,486,473,473,473,473,473,473,473,473,473,473,473,487,487,487,487,487,487,487,487,487,487,487,487,488,488,488,488,488,488,488,488,488,488,488,489,489,489,489,489,489,489,489,489,490,489,489,491,491,491,491,491,491,491,491,491,491,491,492,492,492,492,492,492,492,492,492,492,492,490,490,490,490,490,490,490,490,490,490,490,490,493,493,493,493,493,493,493,493,493,493,493,494,494,494,494,494,494,494,494,494,494,494,494,494,495,495,495,495,495,495,495,495,495,495,495,495,496,496,496,496,496,496,496,496,496,496,496,496,497,497,497,497,497,497,497,497,497,497,497,497,498,498,498,498,498,498,498,498,498,498,498,499,499,499,499,500,500,500,500,500,500,500,500,500,500,500,500,500,500,500,500,500,500,501,501,501,501,501,501,501,501,501,501,501,501,501,501,501,501,501,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,502,503,503,503,503,503,504,504,505,506,506,507,508,508,509,509,510,510,510,511,512,513,513,513,513,513,513,513,513,513,513,513,513,513,513,513,513,513,513,514,514,514,514,514,514,514,514,514,514,514,514,514,514,514,515,515,515,515,515,515,515,515,515,515,515,515,515,515,515,516,516,516,516,516,516,516,516,516,516,516,516,516,516,516,517,517,517,517,517,517,517,517,517,517,517,517,517,517,517,517,517,517,518,518,518,518,518,518,518,518,518,518,518,518,519,519,519,519,519,519,519,519,519,519,519,519,520,520,520,520,520,520,520,520,520,520,520,520,521,521,521,521,521,521,521,521,521,521,521,521,521,522,522,522,522,522,522,522,522,522,522,522,522,523,523,523,523,523,523,523,523,523,523,523,523,523,523,523,523,523,523,524,524,524,524,524,524,524,524,524,524,524,524,524,524,525,525,525,525,525,525,525,525,525,525,525,525,525,525,525,525,525,525,526,526,526,526,526,526,526,526,526,526,526,526,526,526,526,526,526,527,527,527,527,527,527,527,527,527,527,527,527,527,527,527,527,527,527,528,528,528,528,528,528,528,528,528,528,528,528,529,529,529,529,529,529,529,529,529,529,529,529,529,529,529,529,529,530,530,530,530,530,530,530,530,530,530,530,530,531,531,532,532,532,532,532,532,532,532,532,532,532,532,533,533,533,533,533,533,533,533,533,533,533,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,534,535,535,536,537,537,537,537,538,539,539,539,539,540,540,540,540,540,541,541,541,541,542,542,542,542,542,543,544,544,544,544,545,545,545,545,546,546,546,546,546,546,547,547,547,547,547,548,548,548,548,548,548,548,548,548,548,548,548,548,548,549,549,549,549,549,549,549,549,549,549,549,549,550,550,550,550,550,550,550,550,550,550,550,550,550,550,551,551,551,551,551,551,551,551,551,551,551,551,552,552,552,552,552,552,552,552,552,552,552,552,553,553,553,553,553,553,553,553,553,553,553,553,553,553,554,554,554,554,554,554,554,554,554,554,554,554,554,554,554,554,555,555,555,555,555,555,555,555,555,555,555,555,555,555,556,556,556,556,556,556,556,556,556,556,556,556,556,556,556,557,557,557,557,557,557,557,557,557,557,557,557,557,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,558,559,559,559,559,560,560,560,560,560,561,561,561,561,562,562,562,563,563,563,563,564,564,564,565,565,565,558,558,558,558,558,558,558,558,558,558,558,566,566,566,566,566,566,566,566,566,566,567,567,567,567,567,567,567,567,567,567,567,568,568,568,568,568,568,568,568,568,568,568,568,568,569,569,569,569,569,569,569,569,569,569,569,569,570,570,570,570,570,570,570,570,570,570,571,571,571,571,571,571,571,571,571,571,571,571,572,572,572,572,572,572,572,572,572,572,572,573,573,573,573,573,573,573,573,573,573,573,574,574,574,574,574,574,574,574,574,574,574,574,575,575,575,575,575,575,575,575,575,575,575,575,576,576,576,576,576,576,576,576,576,576,576,577,577,577,577,577,577,577,577,577,577,577,577,578,578,578,578,578,578,578,578,578,578,578,578,579,579,579,579,579,579,579,579,579,579,579,579,580,580,580,580,580,580,580,580,580,580,580,580,580,580,581,581,581,581,581,581,581,581,581,581,581,581,581,581,581,581,581,581,582,582,582,582,582,582,582,582,582,583,583,583,583,583,583,583,583,583,583,583,583,584,584,584,584,584,584,584,584,584,584,584,585,585,585,585,585,585,585,585,585,585,585,585,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,586,587,587,587,587,587,587,588,588,588,588,588,589,589,589,589,589,589,589,589,589,590,590,590,590,590,590,590,590,590,591,591,591,591,591,591,592,592,592,592,592,592,593,593,593,593,593,593,594,594,594,594,594,595,595,595,595,595,595,595,595,595,595,595,596,596,596,596,596,596,597,597,597,597,597,597,597,597,598,598,598,598,598,598,598,599,599,599,599,600,600,600,600,600,600,601,586,586,586,586,586,586,586,586,586,586,586,602,602,602,602,602,602,602,602,602,602,602,602,603,603,603,603,603,603,603,603,603,603,603,603,604,604,604,604,604,604,604,604,604,604,604,604,605,605,605,605,605,605,605,605,605,605,605,605,606,606,606,606,606,606,606,606,607,607,607,607,607,607,607,607,607,607,608,608,608,608,608,608,608,608,608,608,609,609,609,609,609,609,609,609,609,609,609,609,610,610,610,610,610,610,610,610,610,610,610,611,611,611,611,611,611,611,611,611,611,611,611,611,612,612,612,612,612,612,612,612,612,612,612,613,613,613,613,613,613,613,613,613,613,613,614,614,614,614,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,615,616,616,616,616,616,616,616,616,616,616,616,616,616,616,617,617,617,617,617,617,617,617,617,617,617,618,618,618,618,618,618,618,618,618,618,618,618,618,618,618,618,619,619,619,619,619,619,619,619,619,619,619,619,619,619,619,620,620,620,620,620,620,620,620,620,620,620,620,620,620,620,621,621,621,621,621,621,621,621,621,621,621,621,621,621,622,622,622,622,622,622,622,622,622,622,623,623,623,623,623,623,623,623,623,623,623,623,623,623,623,623,624,624,624,624,624,624,624,624,624,624,624,625,625,625,625,625,625,625,625,625,625,626,626,626,626,626,626,626,626,626,626,626,626,626,626,627,627,627,627,627,627,627,627,627,627,627,628,628,628,628,628,628,628,628,628,628,628,628,628,628,628,628,628,629,629,629,629,629,629,629,629,629,629,629,629,629,629,630,630,630,630,630,630,630,630,630,630,630,630,630,631,631,631,631,631,631,631,631,631,631,631,631,631,631,631,632,632,632,632,632,632,632,632,632,632,632,633,633,633,633,633,633,633,633,633,633,634,634,634,634,634,634,634,634,634,634,634,635,635,635,635,635,635,635,635,635,635,635,636,636,636,636,636,636,636,636,636,636,636,636,636,636,637,637,637,637,637,637,637,637,637,637,637,637,637,637,638,638,638,638,638,638,638,638,638,638,638,638,639,639,639,639,639,639,639,639,639,639,639,639,640,640,640,640,640,640,640,640,640,640,640,640,641,641,641,641,641,641,641,641,641,641,641,642,642,642,642,642,642,642,642,642,642,642,642,642,642,643,643,643,643,643,643,643,643,643,643,643,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,644,645,645,645,645,645,645,645,645,645,645,645,646,646,646,646,646,646,646,646,646,646,646,647,647,647,647,647,647,647,647,647,647,647,647,648,648,648,648,648,648,648,648,648,648,648,649,649,649,649,649,649,649,649,649,649,649,650,650,650,650,650,650,650,650,650,650,651,651,651,651,651,651,651,651,651,651,652,652,652,652,652,652,652,652,652,652,652,652,652,652,652,652,653,653,653,653,653,653,653,653,653,653,653,653,654,654,654,654,654,654,654,654,654,654,654,654,655,655,655,655,655,655,655,655,655,655,655,655,655,655,655,655,655,655,656,656,656,656,656,656,656,656,656,656,656,656,656,656,656,656,656,656,656,656,656,657,658,659,660,661,662,663,664,665,666,666,666,666,666,666,666,666,666,666,666,666,666,666,667,667,667,667,667,667,667,667,667,667,667,667,667,667,667,667,667,667,667,667,667,667,667,667,668,668,668,668,668,668,668,668,668,668,668,668,668,668,668,668,668,668,668,668,668,669,670,671,671,671,671,671,671,671,671,671,671,671,671,671,671,671,671,671,671,671,671,671,672,673,674,674,674,674,674,674,674,674,674,674,674,674,674,674,674,674,674,674,674,674,674,674,675,676,677,678,678,678,678,678,678,678,678,679,679,679,679,679,679,679,680,680,678,678,678,678,678,678,681,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,682,683,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,684,685,684,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,686,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,687,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,688,689,690,691,691,691,691,691,691,691,691,691,691,691,691,691,691,691,691,691,691,691,691,691,692,692,692,692,692,692,692,692,692,692,692,692,692,692,692,692,692,692,692,692,692,692,693,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,694,695,696,697,698,699,700,700,700,700,700,700,700,700,700,700,700,700,700,700,700,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,701,702,702,702,702,702,702,702,702,702,702,702,703,703,703,703,703,703,703,703,703,703,704,704,704,704,704,704,704,704,704,704,704,704,705,705,705,705,705,705,705,705,705,705,705,706,706,706,706,706,706,706,706,706,706,706,706,706,706,706,706,706,707,707,707,707,707,707,707,707,707,707,707,707,707,707,708,708,708,708,708,708,709,709,709,709,709,709,709,709,709,709,710,710,710,710,710,710,710,710,710,710,711,711,711,711,711,711,711,711,711,711,711,712,712,712,712,712,712,712,712,712,712,712,712,712,712,712,713,713,713,713,713,713,713,713,713,713,713,713,713,713,714,714,714,714,714,714,714,714,714,714,714,714,714,714,714,714,715,715,715,715,715,715,715,715,715,715,715,715,715,715,715,716,716,716,716,716,716,716,716,716,716,717,717,717,717,717,717,717,717,717,717,717,717,717,717,717,717,718,718,718,718,718,718,718,718,718,718,718,718,718,718,719,719,719,719,719,719,719,719,719,719,719,719,719,719,720,720,720,720,720,720,720,720,720,720,720,720,720,720,720,720,721,721,721,721,721,721,721,721,721,721,721,721,721,721,721,722,722,722,722,722,722,722,722,722,722,722,722,722,722,722,722,722,723,723,723,723,723,723,723,723,723,723,723,723,723,723,724,724,724,724,724,724,724,724,724,724,724,725,725,725,725,725,725,725,725,725,725,726,726,726,726,726,726,726,726,726,726,726,727,727,727,727,727,727,727,727,727,727,727,728,728,728,728,728,728,728,728,728,728,728,728,728,728,728,728,729,729,729,729,729,729,729,729,729,729,729,729,729,729,729,730,730,730,730,730,730,730,730,730,730,730,730,730,730,731,731,731,731,731,731,731,731,731,731,731,732,732,732,732,732,732,732,732,732,732,732,732,732,732,732,733,733,733,733,733,733,733,733,733,733,733,733,733,733,734,734,734,734,734,734,734,734,734,734,734,734,734,734,735,735,735,735,735,735,735,735,735,735,735,736,736,736,736,736,736,736,736,736,736,736,736,736,736,736,736,736,737,737,737,737,737,737,737,737,737,737,737,737,737,737,737,737,738,738,738,738,738,738,738,738,738,738,738,738,739,739,739,739,739,739,739,739,739,739,739,739,740,740,740,740,740,740,740,740,740,740,740,740,741,741,741,741,741,741,741,741,741,741,741,742,742,742,742,742,742,742,742,742,742,742,742,743,743,743,743,743,743,743,743,743,743,743,744,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,745,746,746,746,746,746,746,746,746,746,746,746,746,746,746,746,746,746,746,746,746,747,747,747,747,747,747,747,747,747,747,747,747,747,747,747,747,747,747,747,747,747,747,748,748,748,748,748,748,748,748,748,748,748,748,748,748,748,748,748,748,749,749,749,749,749,749,750,750,751,751,751,752,753,754,754,754,754,754,755,756,757,757,758,758,758,758,758,758,758,758,758,758,758,758,759,759,759,759,759,759,759,759,759,759,759,759,759,759,760,760,760,760,760,760,760,760,760,760,760,760,760,760,760,760,760,760,760,760,761,761,761,761,761,761,761,761,761,761,761,761,761,761,761,761,762,762,762,762,762,762,762,762,762,762,762,762,762,762,762,762,762,762,762,762,763,763,763,763,763,763,763,763,763,763,763,763,763,763,764,764,764,764,764,764,764,764,764,764,764,764,764,764,764,765,765,765,765,765,765,765,765,765,765,765,765,765,766,766,766,766,766,766,766,766,766,766,766,766,767,767,767,767,767,767,767,767,767,767,767,767,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,768,769,770,771,771,771,772,772,773,773,774,775,775,775,775,775,775,775,775,775,775,775,775,776,776,776,776,776,776,776,776,776,776,776,776,776,776,776,776,777,777,777,777,777,777,777,777,777,777,777,777,778,778,778,778,778,778,778,778,778,778,778,778,778,779,779,779,779,779,779,779,779,779,779,779,779,779,779,780,780,780,780,780,780,780,780,780,780,780,780,781,781,781,781,781,781,781,781,781,781,781,781,781,781,781,782,782,782,782,782,782,782,782,782,782,782,782,783,783,783,783,783,783,783,783,783,783,783,783,783,783,783,784,784,784,784,784,784,784,784,784,784,784,784,785,785,785,785,785,785,785,785,785,785,785,785,785,786,786,786,786,786,786,786,786,786,786,786,786,787,787,787,787,787,787,787,787,787,787,787,787,787,788,788,788,788,788,788,788,788,788,788,788,788,788,788,789,789,789,789,789,789,789,789,789,789,789,789,790,790,790,790,790,790,790,790,790,790,790,790,791,791,791,791,791,791,791,791,791,791,791,791,791,791,791,791,791,792,792,792,792,792,792,792,792,792,792,792,792,792,792,792,792,793,793,793,793,793,793,793,793,793,793,793,793,793,793,794,794,794,794,794,794,794,794,794,794,794,794,794,795,795,795,795,795,795,795,795,795,795,795,795,796,796,796,796,796,796,796,796,796,796,796,796,797,797,797,797,797,797,797,797,797,797,797,797,797,797,797,797,797,797,797,797,798,798,798,798,798,798,798,798,798,798,798,798,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,799,800,800,800,800,800,800,800,800,800,800,801,801,801,801,801,801,801,801,801,801,801,802,802,802,802,802,802,802,802,802,802,802,802,802,802,802,803,803,803,803,803,803,803,803,803,803,803,803,803,803,804,804,804,804,804,804,804,804,804,804,804,805,805,805,805,805,805,805,805,805,805,806,806,806,806,806,806,806,806,806,806,806,806,806,806,806,806,806,806,807,807,807,807,807,807,807,807,807,807,807,807,807,807,807,807,807,808,808,808,808,808,808,808,808,808,808,808,808,808,809,809,809,809,809,809,809,809,809,809,809,809,809,809,809,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,810,811,812,812,812,812,812,812,812,813,814,814,814,814,815,815,816,816,816,817,817,817,817,817,817,817,817,817,817,817,817,817,817,817,817,817,818,818,818,818,818,818,818,818,818,818,818,818,818,818,818,818,818,818,818,818,818,818,818,818,819,819,819,819,819,819,819,819,819,819,819,819,819,819,819,819,819,820,820,820,820,820,820,820,820,820,820,820,820,820,820,820,820,821,821,821,821,821,821,821,821,821,821,821,821,821,816,816,816,816,816,816,816,816,816,816,816,822,822,822,822,822,822,822,822,822,822,822,822,823,823,823,823,823,823,823,823,823,823,823,823,824,824,824,824,824,824,824,824,824,824,824,824,815,815,815,815,815,815,815,815,815,815,815,815,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,825,826,827,828,829,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,830,831,832,833,833,833,834,835,835,836,837,837,837,837,837,837,837,837,837,837,837,837,837,837,837,837,837,837,837,837,837,837,837,837,837,837,838,838,838,839,839,839,840,840,840,841,841,841,842,842,842,843,843,843,844,845,845,845,845,845,845,845,845,845,845,845,846,846,846,846,846,847,847,847,847,847,848,848,848,848,848,849,849,849,849,849,850,850,850,850,850,851,851,851,851,851,852,852,852,852,852,853,853,853,853,853,854,854,854,854,854,855,855,855,855,855,856,856,856,856,856,857,857,857,857,857,858,858,858,858,858,858,858,858,858,858,858,858,858,858,858,858,858,858,858,859,859,858,858,858,858,858,858,858,858,858,858,858,860,860,861,861,861,861,861,861,861,861,861,861,861,861,861,861,861,861,862,862,862,862,862,862,862,862,862,862,862,862,862,862,863,863,863,863,863,863,863,863,863,863,863,863,863,863,860,860,860,860,860,860,860,860,860,860,860,860,860,860,860,860,864,864,864,864,864,864,864,864,864,864,864,864,865,865,865,865,865,865,865,865,865,865,865,865,866,866,866,866,866,866,866,866,866,866,866,866,867,867,867,867,867,867,867,867,867,867,867,867,868,868,868,868,868,868,868,868,868,868,868,868,868,868,868,869,869,869,869,869,869,869,869,869,869,869,869,869,870,870,870,870,870,870,870,871,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,873,873,873,873,873,873,873,872,872,872,872,872,872,872,872,872,872,872,874,874,874,874,874,874,874,874,874,874,875,875,875,875,875,875,875,875,875,875,875,875,876,876,876,876,876,876,876,876,876,876,877,877,877,877,877,877,877,877,877,877,877,878,878,878,878,878,878,878,878,878,878,878,879,879,879,879,879,879,879,879,879,879,879,879,880,880,880,880,880,880,880,880,880,880,880,880,880,880,880,881,881,881,881,881,881,881,881,881,881,881,881,881,882,882,882,882,882,882,882,882,882,882,882,883,883,883,883,883,883,883,883,883,883,883,883,884,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,885,886,886,886,886,887,887,888,888,888,888,889,889,890,891,891,891,891,891,891,891,891,892,893,893,893,893,893,894,894,894,894,894,894,894,894,894,894,894,894,894,895,895,895,895,895,895,895,895,895,895,895,895,895,896,896,896,896,896,896,896,896,896,896,896,896,896,896,897,897,897,897,897,897,897,897,897,897,897,897,898,898,898,898,898,898,898,898,898,898,898,898,898,898,898,898,898,898,898,898,899,899,899,899,899,899,899,899,899,899,899,899,899,899,899,899,900,900,900,900,900,900,900,900,900,900,900,900,900,901,901,901,901,901,901,901,901,901,901,901,901,901,901,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,902,903,903,903,903,903,903,903,903,903,903,903,903,904,904,904,904,904,904,904,904,904,904,904,902,902,902,902,905,906,906,906,906,906,907,907,907,907,907,908,908,908,908,908,909,909,909,909,909,910,911,911,911,912,912,912,912,913,914,915,915,915,916,917,917,917,917,917,917,917,917,917,917,917,917,918,918,918,918,918,918,918,918,918,918,918,918,918,918,916,916,916,916,916,916,916,916,916,916,916,919,919,919,919,919,919,919,919,919,919,919,919,920,920,920,920,920,920,920,920,920,920,920,920,920,920,920,920,920,920,920,920,921,921,921,921,921,921,921,921,921,921,921,921,921,921,921,922,922,922,922,922,922,922,922,922,922,922,922,922,922,922,922,922,922,922,922,923,923,923,923,923,923,923,923,923,923,923,923,923,923,923,923,923,923,923,923,924,924,924,924,924,924,924,924,924,924,924,924,924,924,925,925,925,925,925,925,925,925,925,925,925,925,925,925,925,926,926,926,926,926,926,926,926,926,926,926,926,926,926,927,927,927,927,927,927,927,927,927,927,927,927,927,927,927,928,928,928,928,928,928,928,928,928,928,928,928,928,928,929,929,929,929,929,929,929,929,929,929,929,929,929,929,929,930,930,930,930,930,930,930,930,930,930,930,930,930,930,930,930,931,931,931,931,931,931,931,931,931,931,931,931,931,931,931,931,932,932,932,932,932,932,932,932,932,932,932,932,932,932,933,933,933,933,933,933,933,933,933,933,933,933,933,934,934,934,934,934,934,934,934,934,934,935,936,937,938,939,940,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,941,942,942,942,943,943,943,943,943,943,944,944,944,944,945,945,945,946,946,946,946,947,947,947,947,948,948,948,948,949,949,950,950,950,951,951,951,941,941,941,941,941,941,941,941,941,941,941,952,952,952,952,952,952,952,952,952,952,952,953,953,953,953,953,953,953,953,953,953,953,953,954,954,954,954,954,954,954,954,954,954,954,954,955,955,955,955,955,955,955,955,955,955,955,955,955,956,956,956,956,956,956,956,956,956,957,957,957,957,957,957,957,957,957,957,957,957,958,958,958,958,958,958,958,958,958,958,958,958,958,958,958,958,959,959,959,959,959,959,959,959,959,959,960,960,960,960,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,961,962,962,963,963,963,963,964,964,964,964,964,964,964,964,964,964,964,964,964,964,964,964,964,964,964,964,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,965,966,967,967,968,968,969,969,969,970,970,971,972,973,973,973,973,973,973,973,973,973,973,973,973,973,973,974,974,974,974,974,974,974,974,974,974,974,974,974,974,975,975,975,975,975,975,975,975,975,975,975,975,975,975,975,976,976,976,976,976,976,976,976,976,976,976,976,977,977,977,977,977,977,977,977,977,977,977,977,977,978,978,978,978,978,978,978,978,978,978,978,978,979,979,979,979,979,979,979,979,979,979,979,979,980,980,980,980,980,980,980,980,980,980,980,980,980,980,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,981,982,983,984,984,984,984,984,985,985,986,987,987,988,988,988,988,989,989,989,989,990,990,990,990,991,991,991,991,991,991,991,991,991,991,991,991,991,991,991,991,991,991,992,992,992,992,992,992,992,992,992,992,992,992,992,992,992,993,993,993,993,993,993,993,993,993,993,993,993,993,993,993,993,993,993,994,994,994,994,994,994,994,994,994,994,994,994,994,994,994,995,995,995,995,995,995,995,995,995,995,995,995,995,995,995,995,996,996,996,996,996,996,996,996,996,996,996,996,996,996,997,997,997,997,997,997,997,997,997,997,997,997,997,997,997,997,998,998,998,998,998,998,998,998,998,998,998,998,998,998,999,999,999,999,999,999,999,999,999,999,999,999,999,999,999,999,999,999,999,1000,1000,1000,1000,1000,1000,1000,1000,1000,1000,1000,1000,1000,1001,1001,1001,1001,1001,1001,1001,1001,1001,1001,1001,1001,1001,1001,1001,1001,1001,1001,1001,1002,1002,1002,1002,1002,1002,1002,1002,1002,1002,1002,1002,1002,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1003,1004,1004,1004,1004,1004,1004,1004,1004,1004,1004,1004,1004,1004,1005,1005,1005,1005,1005,1005,1005,1005,1005,1005,1005,1005,1005,1005,1005,1006,1006,1006,1006,1006,1006,1007,1007,1007,1007,1007,1007,1007,1007,1007,1007,1008,1008,1008,1008,1008,1008,1008,1008,1008,1008,1008,1008,1008,1008,1009,1009,1009,1009,1009,1009,1009,1009,1009,1009,1009,1010,1010,1010,1010,1010,1010,1010,1010,1010,1010,1011,1011,1011,1011,1011,1011,1011,1011,1011,1011,1011,1011,1011,1011,1011,1011,1012,1012,1012,1012,1012,1012,1012,1012,1012,1012,1012,1012,1012,1012,1012,1013,1013,1013,1013,1013,1013,1013,1013,1013,1013,1013,1013,1013,1013,1013,1013,1013,1014,1014,1014,1014,1014,1014,1014,1014,1014,1014,1014,1014,1014,1014,1014,1014,1015,1015,1015,1015,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1017,1017,1018,1018,1019,1019,1020,1020,1020,1020,1021,1021,1021,1022,1022,1022,1023,1023,1023,1024,1024,1025,1025,1025,1026,1026,1026,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1016,1027,1027,1027,1027,1027,1027,1027,1027,1027,1027,1027,1027,1027,1028,1028,1028,1028,1028,1028,1028,1028,1028,1028,1028,1028,1029,1029,1029,1029,1029,1029,1029,1029,1029,1030,1030,1030,1030,1030,1030,1030,1030,1030,1030,1030,1030,1031,1031,1031,1031,1031,1031,1031,1031,1031,1031,1031,1031,1032,1032,1032,1032,1032,1032,1032,1032,1032,1032,1032,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1033,1034,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1036,1036,1036,1036,1036,1036,1036,1036,1036,1036,1036,1036,1036,1036,1036,1036,1036,1036,1037,1037,1037,1037,1037,1037,1037,1037,1037,1037,1037,1037,1037,1037,1037,1037,1037,1038,1038,1038,1038,1038,1038,1038,1038,1038,1038,1038,1038,1038,1038,1038,1038,1039,1039,1039,1039,1039,1039,1039,1039,1039,1039,1039,1039,1039,1039,1039,1040,1040,1040,1040,1040,1040,1040,1040,1040,1040,1040,1040,1040,1040,1041,1041,1041,1041,1041,1041,1041,1041,1041,1041,1041,1041,1041,1041,1042,1042,1042,1042,1042,1042,1042,1042,1042,1042,1043,1043,1043,1043,1043,1043,1043,1043,1043,1043,1043,1044,1044,1044,1044,1044,1044,1044,1044,1044,1044,1044,1044,1044,1045,1045,1045,1045,1045,1045,1045,1045,1045,1045,1045,1045,1045,1045,1045,1046,1046,1046,1046,1046,1046,1046,1046,1046,1046,1046,1046,1046,1046,1047,1047,1047,1047,1047,1047,1047,1047,1047,1047,1047,1047,1047,1047,1048,1048,1048,1048,1048,1049,1049,1049,1049,1049,1049,1050,1050,1050,1048,1048,1048,1048,1049,1049,1049,1049,1048,1048,1048,1048,1048,1049,1049,1049,1049,1049,1049,1051,1048,1048,1048,1048,1048,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1052,1053,1053,1053,1053,1053,1053,1053,1053,1053,1053,1053,1053,1053,1053,1053,1053,1054,1054,1054,1054,1054,1054,1054,1054,1054,1054,1054,1054,1054,1054,1054,1055,1055,1055,1055,1055,1055,1055,1055,1055,1055,1056,1056,1056,1056,1056,1056,1056,1056,1056,1056,1056,1056,1056,1056,1056,1056,1057,1057,1057,1057,1057,1057,1057,1057,1058,1057,1057,1057,1059,1059,1059,1059,1059,1059,1059,1059,1059,1059,1060,1060,1060,1060,1060,1060,1060,1060,1060,1060,1060,1060,1060,1060,1060,1060,1060,1058,1058,1058,1058,1058,1058,1058,1058,1058,1058,1058,1058,1058,1058,1058,1061,1061,1061,1061,1061,1061,1061,1061,1061,1061,1061,1062,1062,1062,1062,1062,1062,1062,1062,1062,1062,1063,1063,1063,1063,1063,1063,1063,1063,1063,1063,1063,1063,1063,1063,1063,1064,1064,1064,1064,1064,1064,1064,1064,1064,1064,1064,1064,1064,1065,1065,1065,1065,1065,1065,1065,1065,1065,1065,1065,1066,1066,1066,1066,1066,1066,1066,1066,1066,1066,1066,1067,1067,1068,1067,1067,1067,1067,1067,1067,1067,1067,1067,1067,1069,1069,1069,1069,1069,1069,1069,1069,1069,1069,1069,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1070,1070,1070,1070,1070,1070,1070,1070,1070,1070,1070,1070,1070,1070,1070,1070,1070,1070,1070,1070,1070,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1072,1072,1073,1073,1073,1073,1074,1074,1074,1074,1074,1075,1075,1075,1076,1076,1076,1076,1076,1077,1077,1077,1077,1078,1078,1078,1078,1078,1079,1079,1079,1079,1079,1079,1080,1080,1080,1081,1081,1081,1081,1081,1082,1082,1082,1082,1083,1083,1083,1083,1084,1084,1084,1085,1085,1085,1085,1086,1086,1086,1086,1087,1087,1087,1087,1087,1087,1087,1088,1088,1088,1088,1088,1088,1089,1089,1089,1089,1089,1089,1090,1090,1090,1090,1091,1091,1091,1091,1091,1092,1092,1092,1092,1092,1092,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1071,1093,1093,1093,1093,1093,1093,1093,1093,1093,1093,1093,1094,1094,1094,1094,1094,1094,1094,1094,1094,1094,1094,1094,1094,1095,1095,1095,1095,1095,1095,1095,1095,1095,1095,1096,1096,1096,1096,1096,1096,1096,1096,1096,1096,1096,1096,1097,1097,1097,1097,1097,1097,1097,1097,1097,1097,1097,1097,1098,1098,1098,1098,1098,1098,1098,1098,1098,1098,1098,1098,1099,1099,1099,1099,1099,1099,1099,1099,1099,1099,1099,1100,1100,1100,1100,1100,1100,1100,1100,1100,1100,1100,1100,1101,1101,1101,1101,1101,1101,1101,1101,1101,1101,1101,1101,1102,1102,1102,1102,1102,1102,1102,1102,1102,1102,1102,1103,1103,1103,1103,1103,1103,1103,1103,1103,1103,1103,1103,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1105,1105,1105,1105,1105,1105,1105,1105,1105,1105,1106,1106,1106,1106,1106,1106,1106,1106,1106,1106,1106,1107,1107,1107,1107,1107,1107,1107,1107,1108,1108,1108,1108,1108,1108,1108,1108,1108,1108,1109,1109,1109,1109,1109,1109,1109,1109,1109,1109,1109,1109,1110,1110,1110,1110,1110,1110,1110,1110,1110,1110,1110,1110,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1112,1112,1113,1113,1113,1113,1113,1113,1113,1113,1113,1113,1113,1113,1113,1113,1113,1113,1113,1113,1113,1113,1114,1114,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1111,1118,1118,1118,1118,1118,1118,1118,1118,1119,1119,1119,1119,1119,1119,1119,1119,1119,1119,1120,1120,1120,1120,1120,1120,1120,1120,1120,1120,1120,1120,1121,1121,1121,1121,1121,1121,1121,1121,1121,1121,1121,1121,1122,1122,1122,1122,1122,1122,1122,1122,1122,1122,1122,1123,1123,1123,1123,1123,1123,1123,1123,1123,1123,1123,1123,1124,1125,1124,1124,1124,1124,1124,1124,1124,1124,1124,1124,1124,1126,1126,1126,1126,1126,1126,1126,1126,1126,1126,1126,1127,1127,1127,1127,1127,1127,1127,1127,1127,1127,1127,1125,1125,1125,1125,1125,1125,1125,1125,1125,1125,1125,1128,1128,1128,1128,1128,1128,1128,1128,1128,1128,1128,1128,1128,1129,1129,1129,1129,1129,1129,1129,1129,1129,1129,1129,1129,1130,1130,1130,1130,1130,1130,1130,1130,1130,1130,1130,1130,1131,1131,1131,1131,1131,1131,1131,1131,1131,1131,1131,1131,1131,1131,1131,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1132,1133,1133,1133,1133,1133,1133,1133,1133,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1134,1132,1132,1132,1132,1132,1132,1132,1135,1136,1137,1138,1138,1138,1139,1139,1139,1139,1140,1140,1140,1140,1141,1141,1141,1141,1142,1142,1142,1142,1143,1143,1143,1143,1143,1144,1144,1145,1145,1145,1145,1146,1146,1146,1146,1147,1147,1147,1147,1147,1147,1147,1147,1147,1147,1147,1147,1148,1148,1148,1148,1148,1148,1148,1148,1148,1148,1148,1148,1148,1148,1148,1149,1149,1149,1149,1149,1149,1149,1149,1149,1149,1149,1149,1149,1149,1149,1149,1149,1149,1149,1149,1150,1150,1150,1150,1150,1150,1150,1150,1150,1150,1150,1150,1150,1150,1150,1150,1151,1151,1151,1151,1151,1151,1151,1151,1151,1151,1151,1151,1151,1152,1152,1152,1152,1152,1152,1152,1152,1152,1152,1152,1152,1152,1153,1153,1153,1153,1153,1153,1153,1153,1153,1153,1153,1153,1153,1153,1153,1153,1153,1153,1153,1154,1154,1154,1154,1154,1154,1154,1154,1154,1154,1154,1154,1154,1155,1155,1155,1155,1155,1155,1155,1155,1155,1155,1155,1155,1155,1155,1155,1155,1155,1155,1155,1156,1156,1156,1156,1156,1156,1156,1156,1156,1156,1156,1156,1156,1157,1158,1158,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1159,1160,1160,1160,1160,1160,1160,1160,1160,1160,1160,1160,1161,1161,1161,1161,1161,1161,1161,1161,1161,1161,1161,1162,1162,1162,1162,1162,1162,1162,1162,1163,1163,1163,1163,1163,1163,1163,1163,1163,1163,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1165,1165,1165,1165,1165,1165,1165,1165,1165,1165,1165,1165,1166,1166,1166,1166,1166,1166,1166,1166,1166,1166,1167,1167,1167,1167,1167,1167,1167,1167,1167,1167,1167,1168,1168,1168,1168,1168,1168,1168,1168,1168,1168,1168,1168,1169,1169,1169,1169,1169,1169,1169,1169,1169,1169,1169,1169,1169,1169,1169,1170,1170,1170,1170,1170,1170,1170,1170,1170,1170,1170,1170,1171,1171,1171,1171,1171,1171,1171,1171,1171,1171,1171,1171,1171,1172,1172,1172,1172,1172,1172,1172,1172,1172,1172,1172,1172,1172,1172,1172,1173,1173,1173,1173,1173,1173,1173,1173,1173,1173,1173,1173,1173,1174,1174,1174,1174,1174,1174,1174,1174,1174,1174,1174,1175,1175,1175,1175,1175,1175,1175,1175,1175,1175,1175,1175,1175,1176,1176,1176,1176,1176,1176,1176,1176,1176,1176,1176,1176,1177,1177,1177,1177,1177,1177,1177,1177,1177,1177,1177,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1178,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1179,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1180,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1181,1178,1178,1182,1183,1184,1185,1185,1186,1186,1187,1188,1188,1189,1189,1190,1191,1191,1191,1191,1191,1191,1191,1191,1191,1191,1191,1191,1191,1191,1192,1192,1192,1192,1193,1193,1193,1193,1193,1193,1193,1193,1193,1193,1193,1193,1193,1194,1194,1194,1194,1194,1194,1194,1194,1194,1194,1194,1194,1195,1195,1195,1195,1195,1195,1195,1195,1195,1195,1195,1195,1195,1195,1195,1195,1195,1195,1195,1195,1196,1196,1196,1196,1196,1196,1196,1196,1196,1196,1196,1196,1196,1196,1196,1196,1196,1197,1197,1197,1197,1197,1197,1197,1197,1197,1197,1197,1197,1197,1197,1197,1197,1190,1190,1190,1190,1190,1190,1190,1190,1190,1190,1190,1190,1190,1198,1198,1198,1198,1198,1198,1198,1198,1198,1198,1198,1198,1198,1198,1198,1198,1198,1198,1198,1198,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1199,1200,1200,1200,1200,1200,1200,1200,1200,1200,1200,1200,1200,1200,1200,1200,1200,1201,1201,1201,1201,1201,1201,1201,1201,1201,1201,1201,1201,1201,1201,1201,1201,1202,1202,1202,1202,1202,1202,1202,1202,1202,1202,1202,1202,1202,1202,1202,1202,1202,1203,1203,1203,1203,1203,1203,1203,1203,1203,1203,1203,1203,1203,1203,1204,1204,1204,1204,1204,1204,1204,1204,1204,1204,1204,1204,1204,1205,1205,1205,1205,1205,1205,1205,1205,1205,1205,1205,1205,1206,1206,1206,1206,1206,1206,1206,1206,1206,1206,1206,1206,1206,1207,1207,1207,1207,1207,1207,1207,1207,1207,1207,1207,1207,1207,1207,1207,1208,1208,1208,1208,1208,1208,1208,1208,1208,1208,1208,1208,1208,1208,1208,1209,1209,1209,1209,1209,1209,1209,1209,1209,1209,1209,1209,1209,1209,1209,1210,1210,1210,1210,1210,1210,1210,1210,1210,1210,1210,1210,1210,1210,1210,1210,1210,1211,1211,1211,1211,1211,1211,1211,1211,1211,1211,1211,1211,1212,1212,1212,1212,1212,1212,1212,1212,1212,1212,1212,1212,1212,1212,1212,1212,1213,1213,1213,1213,1213,1213,1213,1213,1213,1213,1213,1213,1213,1213,1213,1213,1214,1214,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1216,1217,1217,1218,1218,1218,1218,1218,1218,1218,1218,1218,1218,1218,1218,1218,1218,1218,1218,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1220,1220,1220,1220,1220,1220,1220,1220,1220,1220,1220,1220,1221,1221,1221,1221,1221,1221,1221,1221,1221,1221,1221,1221,1222,1222,1223,1223,1223,1223,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1224,1225,1226,1226,1226,1226,1226,1226,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1227,1228,1229,1229,1230,1230,1230,1231,1231,1231,1231,1231,1231,1231,1231,1231,1231,1231,1231,1231,1231,1231,1231,1231,1232,1232,1232,1232,1232,1232,1232,1232,1232,1232,1232,1232,1233,1233,1233,1233,1233,1233,1233,1233,1233,1233,1233,1233,1233,1233,1233,1233,1234,1234,1234,1234,1234,1234,1234,1234,1234,1234,1234,1234,1234,1234,1234,1235,1236,1237,1238,1239,1240,1241,1242,1242,1243,1244,1245,1246,1247,1247,1247,1248,1248,1248,1248,1248,1248,1248,1248,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1249,1250,1250,1250,1250,1250,1250,1250,1250,1250,1251,1251,1251,1251,1251,1251,1251,1251,1252,1252,1252,1252,1252,1252,1253,1253,1253,1253,1253,1253,1253,1253,1253,1254,1254,1254,1247,1247,1247,1247,1247,1247,1247,1247,1247,1247,1247,1247,1247,1247,1247,1247,1247,1247,1247,1247,1247,1255,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1256,1257,1257,1257,1257,1258,1258,1259,1260,1260,1260,1260,1261,1261,1262,1262,1262,1262,1262,1262,1263,1264,1264,1265,1265,1265,1265,1265,1266,1266,1266,1266,1266,1266,1266,1266,1266,1266,1266,1266,1266,1267,1267,1267,1267,1267,1267,1267,1267,1267,1267,1267,1267,1268,1268,1268,1268,1268,1268,1268,1268,1268,1268,1268,1268,1268,1269,1269,1269,1269,1269,1269,1269,1269,1269,1269,1269,1269,1269,1270,1270,1270,1270,1270,1270,1270,1270,1270,1270,1270,1270,1270,1271,1271,1271,1271,1271,1271,1271,1271,1271,1271,1271,1271,1272,1272,1272,1272,1272,1272,1272,1272,1272,1272,1272,1272,1272,1273,1273,1273,1273,1273,1273,1273,1273,1273,1273,1273,1273,1273,1273,1273,1274,1274,1274,1274,1274,1274,1274,1274,1274,1274,1274,1274,1275,1275,1275,1275,1275,1275,1275,1275,1275,1275,1275,1275,1275,1276,1276,1276,1276,1276,1276,1276,1276,1276,1276,1276,1276,1276,1276,1276,1277,1277,1277,1277,1277,1277,1277,1277,1277,1277,1277,1277,1277,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1279,1279,1280,1280,1281,1282,1283,1283,1283,1283,1283,1283,1284,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1278,1285,1285,1285,1285,1285,1285,1285,1285,1285,1285,1285,1285,1285,1285,1285,1286,1286,1286,1286,1286,1286,1286,1286,1286,1286,1286,1286,1286,1287,1287,1287,1287,1287,1287,1287,1287,1287,1287,1287,1287,1288,1288,1288,1288,1288,1288,1288,1288,1288,1288,1288,1288,1289,1289,1289,1289,1289,1289,1290,1290,1290,1290,1290,1291,1291,1291,1291,1291,1291,1291,1291,1291,1291,1291,1291,1292,1292,1292,1292,1292,1292,1292,1292,1292,1292,1292,1292,1292,1293,1293,1293,1293,1293,1293,1293,1293,1293,1293,1293,1294,1294,1294,1294,1294,1294,1294,1294,1294,1294,1294,1295,1295,1295,1295,1295,1295,1295,1295,1295,1295,1295,1295,1295,1295,1295,1295,1296,1296,1296,1296,1296,1296,1296,1296,1296,1296,1296,1296,1296,1296,1297,1297,1297,1297,1297,1297,1297,1297,1297,1297,1297,1297,1298,1298,1298,1298,1298,1298,1298,1298,1298,1298,1298,1298,1299,1300,1300,1300,1300,1300,1300,1300,1300,1300,1300,1300,1300,1300,1300,1300,1300,1300,1300,1300,1300,1301,1301,1301,1301,1301,1301,1301,1301,1301,1301,1301,1301,1301,1301,1301,1301,1301,1301,1302,1302,1302,1302,1302,1302,1303,1303,1303,1303,1303,1303,1303,1303,1303,1303,1303,1303,1303,1304,1304,1304,1304,1304,1304,1304,1304,1304,1304,1304,1304,1304,1304,1304,1305,1305,1305,1305,1305,1305,1305,1305,1305,1305,1306,1306,1306,1306,1306,1306,1306,1306,1306,1306,1306,1306,1306,1307,1307,1307,1308,1308,1308,1308,1308,1308,1308,1308,1308,1308,1308,1308,1308,1309,1309,1309,1310,1310,1310,1310,1311,1311,1311,1311,1311,1311,1311,1311,1311,1311,1311,1312,1312,1312,1313,1313,1313,1313,1313,1313,1313,1313,1313,1313,1313,1314,1314,1314,1315,1315,1315,1315,1316,1316,1316,1316,1316,1316,1316,1316,1316,1316,1316,1316,1316,1317,1318,1318,1318,1318,1318,1318,1318,1318,1318,1318,1318,1318,1318,1318,1318,1318,1318,1318,1318,1319,1320,1320,1321,1321,1322,1322,1322,1322,1322,1322,1318,1318,1323,1323,1323,1323,1323,1323,1324,1324,1324,1324,1325,1325,1325,1325,1325,1325,1325,1325,1325,1325,1325,1325,1325,1325,1326,1326,1326,1326,1326,1326,1326,1327,1327,1327,1327,1327,1327,1327,1328,1328,1328,1328,1328,1328,1328,1328,1328,1328,1328,1329,1329,1329,1329,1329,1330,1330,1330,1330,1330,1330,1330,1330,1330,1330,1330,1330,1330,1330,1330,1330,1331,1331,1331,1331,1332,1333,1333,1333,1333,1333,1333,1333,1333,1333,1333,1333,1333,1333,1333,1333,1333,1334,1335,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1336,1335,1335,1335,1335,1335,1335,1335,1335,1335,1337,1337,1337,1337,1337,1337,1337,1337,1337,1337,1337,1337,1337,1337,1337,1338,1338,1338,1338,1338,1338,1338,1338,1338,1338,1338,1338,1338,1338,1338,1338,1338,1338,1338,1338,1338,1339,1339,1339,1339,1339,1339,1339,1339,1339,1339,1340,1340,1340,1340,1340,1341,1342,1342,1342,1342,1342,1342,1342,1342,1342,1342,1342,1342,1342,1342,1342,1342,1342,1341,1341,1341,1341,1341,1341,1341,1343,1343,1343,1343,1343,1343,1343,1343,1343,1343,1343,1343,1343,1343,1343,1344,1344,1344,1344,1344,1344,1344,1344,1344,1344,1344,1344,1344,1344,1344,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,1346,1346,1346,1346,1346,1346,1346,1346,1346,1346,1346,1346,1347,1347,1347,1347,1347,1347,1347,1347,1347,1347,1347,1347,1347,1347,1347,1348,1348,1348,1348,1348,1348,1348,1348,1348,1348,1348,1348,1349,1349,1349,1349,1349,1349,1349,1349,1349,1349,1349,1350,1350,1350,1350,1350,1350,1350,1350,1350,1351,1351,1351,1351,1351,1351,1351,1351,1351,1351,1351,1352,1353,1353,1353,1353,1353,1353,1353,1353,1353,1353,1353,1354,1354,1354,1354,1354,1354,1354,1354,1354,1354,1354,1354,1354,1354,1354,1354,1354,1354,1355,1355,1355,1355,1355,1355,1355,1355,1355,1355,1355,1355,1356,1356,1356,1356,1356,1356,1356,1356,1356,1356,1356,1356,1356,1356,1357,1357,1357,1357,1357,1357,1357,1357,1357,1357,1357,1358,1358,1358,1358,1358,1358,1358,1358,1358,1358,1358,1358,1358,1358,1358,1358,1358,1358,1359,1359,1359,1359,1359,1359,1359,1359,1359,1359,1359,1359,1359,1359,1359,1359,1359,1359,1359,1360,1360,1360,1360,1360,1360,1361,1361,1361,1361,1361,1361,1361,1361,1361,1361,1361,1361,1361,1361,1361,1361,1361,1361,1362,1362,1362,1362,1362,1362,1362,1362,1362,1362,1362,1362,1362,1363,1363,1363,1363,1363,1363,1363,1363,1363,1363,1363,1363,1363,1363,1364,1364,1364,1364,1364,1364,1364,1364,1364,1364,1364,1364,1364,1365,1365,1365,1365,1365,1365,1365,1365,1365,1365,1365,1366,1366,1366,1366,1366,1366,1366,1366,1366,1367,1367,1367,1367,1367,1367,1367,1367,1367,1367,1367,1368,1368,1368,1368,1368,1369,1369,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1370,1371,1371,1371,1371,1371,1371,1371,1371,1371,1371,1371,1371,1371,1371,1371,1371,1371,1371,1371,1371,1371,1372,1372,1372,1372,1372,1372,1372,1372,1372,1372,1372,1372,1373,1373,1373,1373,1373,1374,1374,1374,1374,1374,1374,1374,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1376,1376,1376,1376,1376,1376,1376,1376,1376,1376,1376,1376,1376,1376,1376,1376,1376,1376,1376,1376,1377,1377,1377,1377,1377,1377,1377,1377,1377,1377,1377,1377,1377,1378,1378,1378,1378,1378,1378,1378,1378,1378,1378,1378,1378,1378,1379,1379,1379,1379,1379,1379,1379,1379,1379,1379,1379,1379,1379,1379,1380,1380,1380,1380,1380,1380,1380,1381,1381,1381,1381,1381,1381,1381,1381,1381,1381,1381,1381,1381,1381,1381,1382,1382,1382,1382,1382,1382,1382,1382,1382,1382,1382,1383,1383,1383,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1384,1385,1385,1385,1386,1387,1388,1388,1388,1388,1388,1388,1388,1388,1388,1388,1388,1388,1388,1388,1388,1388,1388,1388,1388,1388,1388,1389,1389,1389,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1390,1391,1391,1391,1391,1391,1391,1391,1391,1391,1391,1391,1392,1392,1392,1392,1392,1392,1392,1392,1392,1393,1393,1393,1393,1393,1393,1394,1394,1394,1394,1394,1394,1394,1394,1394,1395,1395,1395,1395,1395,1395,1395,1395,1395,1395,1395,1395,1396,1396,1396,1396,1396,1396,1396,1396,1396,1396,1397,1397,1397,1397,1397,1397,1398,1398,1398,1398,1398,1398,1398,1398,1398,1398,1398,1398,1399,1399,1399,1400,1400,1401,1401,1401,1401,1401,1401,1401,1401,1401,1401,1401,1401,1401,1401,1401,1401,1399,1399,1399,1400,1400,1400,1400,1402,1402,1402,1402,1403,1403,1403,1403,1403,1403,1403,1403,1404,1404,1404,1404,1404,1404,1404,1405,1405,1405,1405,1405,1405,1405,1405,1405,1405,1406,1406,1406,1406,1406,1406,1406,1407,1407,1407,1407,1407,1407,1407,1407,1407,1408,1408,1408,1408,1408,1408,1409,1409,1409,1409,1409,1409,1409,1409,1409,1409,1409,1409,1409,1409,1409,1409,1409,1409,1409,1410,1410,1411,1411,1411,1411,1411,1411,1411,1412,1412,1412,1412,1412,1412,1412,1412,1412,1412,1412,1412,1412,1412,1412,1412,1413,1413,1413,1413,1413,1413,1413,1413,1413,1413,1413,1414,1414,1414,1414,1414,1414,1414,1414,1414,1414,1414,1415,1415,1415,1416,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1417,1418,1418,1418,1418,1418,1418,1418,1418,1418,1418,1418,1418,1418,1418,1418,1418,1418,1418,1418,1418,1419,1419,1419,1419,1419,1419,1419,1419,1419,1419,1419,1416,1416,1416,1416,1416,1416,1416,1416,1416,1416,1416,1416,1416,1416,1416,1416,1420,1420,1420,1420,1420,1420,1420,1420,1420,1420,1420,1420,1420,1420,1420,1420,1420,1421,1421,1421,1421,1421,1421,1421,1421,1421,1421,1422,1422,1422,1422,1422,1422,1422,1422,1422,1422,1422,1423,1423,1423,1423,1423,1423,1423,1423,1423,1423,1424,1424,1424,1424,1424,1424,1424,1424,1424,1424,1424,1424,1424,1424,1425,1425,1425,1426,1426,1426,1426,1426,1427,1427,1427,1427,1427,1427,1428,1428,1428,1428,1429,1429,1430,1431,1431,1431,1432,1432,1432,1433,1434,1434,1434,1434,1434,1434,1434,1434,1434,1434,1434,1434,1434,1434,1434,1434,1434,1434,1435,1435,1435,1435,1435,1435,1435,1436,1436,1436,1436,1436,1436,1436,1436,1436,1436,1436,1436,1437,1437,1437,1437,1437,1437,1437,1437,1437,1437,1437,1437,1437,1437,1438,1438,1438,1438,1438,1438,1438,1438,1438,1438,1438,1438,1439,1439,1439,1439,1439,1439,1439,1439,1439,1439,1439,1439,1439,1439,1439,1439,1440,1440,1440,1440,1440,1440,1440,1440,1440,1440,1440,1440,1440,1440,1440,1441,1441,1441,1441,1441,1441,1441,1441,1441,1441,1442,1442,1442,1442,1442,1442,1442,1442,1442,1443,1443,1443,1443,1443,1443,1443,1444,1444,1444,1444,1444,1444,1444,1444,1444,1444,1444,1444,1444,1445,1445,1445,1445,1446,1446,1446,1446,1446,1446,1447,1447,1447,1447,1447,1447,1447,1447,1448,1448,1448,1448,1448,1448,1448,1449,1449,1449,1450,1450,1450,1450,1450,1450,1451,1451,1451,1451,1451,1451,1452,1452,1452,1452,1453,1453,1454,1454,1454,1454,1454,1455,1455,1456,1457,1457,1457,1457,1457,1457,1457,1457,1457,1457,1457,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1458,1459,1459,1459,1459,1459,1459,1459,1459,1459,1459,1459,1459,1460,1460,1460,1460,1460,1460,1460,1460,1460,1460,1460,1460,1460,1460,1460,1461,1461,1461,1461,1461,1461,1461,1461,1461,1461,1461,1461,1461,1461,1461,1462,1462,1462,1462,1462,1462,1462,1463,1463,1463,1463,1463,1463,1463,1463,1463,1463,1463,1463,1463,1463,1463,1464,1464,1464,1464,1464,1464,1464,1464,1464,1464,1464,1464,1465,1465,1465,1465,1466,1466,1467,1467,1467,1467,1467,1467,1467,1468,1468,1468,1468,1468,1468,1468,1468,1468,1468,1468,1469,1469,1469,1469,1469,1469,1469,1469,1469,1469,1469,1470,1470,1470,1470,1471,1471,1471,1471,1471,1471,1471,1471,1471,1471,1471,1471,1472,1472,1472,1472,1472,1472,1473,1473,1473,1473,1473,1473,1473,1474,1474,1474,1475,1475,1475,1475,1476,1476,1476,1476,1476,1476,1476,1477,1477,1477,1478,1478,1478,1478,1478,1478,1478,1478,1479,1479,1479,1479,1479,1479,1479,1479,1480,1480,1480,1480,1480,1481,1481,1481,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1482,1483,1483,1483,1483,1483,1483,1483,1483,1483,1483,1484,1484,1484,1484,1484,1484,1484,1484,1484,1484,1484,1484,1484,1484,1485,1485,1485,1485,1485,1485,1485,1485,1485,1485,1486,1486,1486,1486,1486,1486,1486,1486,1486,1486,1486,1487,1487,1488,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1489,1490,1490,1490,1490,1490,1490,1490,1490,1490,1490,1490,1490,1490,1490,1490,1490,1490,1491,1491,1491,1491,1491,1491,1491,1491,1492,1492,1492,1492,1492,1492,1492,1492,1492,1492,1492,1493,1493,1493,1493,1493,1493,1494,1494,1494,1494,1494,1494,1494,1494,1494,1494,1494,1495,1495,1495,1495,1495,1495,1496,1496,1496,1496,1496,1496,1496,1496,1496,1496,1496,1496,1496,1497,1497,1497,1497,1498,1498,1498,1498,1498,1498,1498,1498,1498,1498,1498,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1499,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1502,1502,1502,1502,1502,1502,1502,1502,1502,1502,1502,1502,1502,1502,1502,1502,1502,1503,1503,1503,1503,1503,1503,1503,1503,1503,1503,1503,1503,1503,1503,1504,1504,1504,1504,1504,1504,1504,1504,1504,1504,1505,1505,1505,1505,1505,1506,1506,1506,1507,1507,1507,1507,1507,1507,1507,1507,1507,1507,1507,1507,1507,1507,1507,1507,1507,1507,1507,1507,1508,1508,1508,1508,1508,1508,1508,1508,1508,1508,1509,1509,1509,1509,1509,1509,1509,1509,1509,1509,1509,1509,1509,1509,1509,1509,1509,1509,1510,1510,1510,1510,1510,1510,1510,1510,1510,1510,1510,1510,1510,1511,1511,1511,1511,1511,1511,1511,1511,1512,1512,1512,1512,1512,1512,1512,1512,1512,1512,1512,1512,1512,1513,1513,1513,1513,1513,1513,1513,1513,1513,1513,1513,1513,1513,1513,1513,1513,1514,1514,1515,1515,1516,1516,1517,1517,1517,1517,1517,1517,1517,1518,1519,1520,1521,1521,1521,1522,1523,1524,1525,1525,1525,1526,1526,1526,1527,1528,1529,1530,1530,1530,1531,1531,1532,1533,1534,1535,1536,1536,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537,1537]}};
@@ -0,0 +1,197 @@
+// PokeDB encounter index queries, off the main thread.
+//
+// Started by getPokeDbWorker() in script.part1.js. The page posts {op: 'init', args: {urls}} once,
+// then {id, op, args} queries; every reply is {id, result} or {id, unavailable: true} when
+// the index can't be loaded here (the page then falls back to its own main-thread path).
+// Results are plain arrays so they structured-clone cheaply:
+//
+// - pokemonLocations {pokemon}  -> {versions: [[version, [location, ...]], ...],
+//                                   locationRegions: [[location, region], ...]}
+// - locationRows {location}     -> {region, resolved, rows: [[pokemonName, pokemonId, version,
+//                                   method, chance, minLevel, maxLevel, conditions], ...]}
+//
+// The index stays in whatever shape it arrived in. The compact file is queried through its
+// integer columns; rows are only decoded for the locations and Pokémon actually asked for.
+
+'use strict';
+
+const COMPACT_FORMAT = 'pokedb-encounters-columnar/1';
+
+let urls = null;
+let indexPromise = null;
+
+// Same mapping as pokedbMethodToAppMethod in script.part1.js.
+function toAppMethod(method) {
+    const m = String(method || '').toLowerCase();
+    if (m === 'symbol-encounter' || m === 'random-encounter') return 'walk';
+    return m || 'special';
+}
+
+function fetchJsonOrNull(url) {
+    if (!url) return Promise.resolve(null);
+    return fetch(url)
+        .then(r => (r.ok ? r.json() : null))
+        .catch(() => null);
+}
+
+// Compact layout: rows live in parallel integer columns, offsets[i]..offsets[i + 1] belong to
+// locations[i]. Mirrors decode_compact() in tools/build_pokedb_encounters.py, one row at a time.
+function tableFromCompact(compact) {
+    const strings = compact.strings || {};
+    const cols = compact.rows || {};
+    const unmask = (table, mask) => {
+        const out = [];
+        for (let i = 0; i < table.length; i++) {
+            if (mask & (1 << i)) out.push(table[i]);
+        }
+        return out;
+    };
+    const locations = Array.isArray(compact.locations) ? compact.locations : [];
+    let pokemonIds = null;
+    if (Array.isArray(compact.pokemonIds)) {
+        pokemonIds = new Map();
+        compact.pokemonIds.forEach((ids, i) => {
+            if (ids) pokemonIds.set(strings.pokemon[i], ids);
+        });
+    }
+    return {
+        locations,
+        regions: locations.map((_, i) => strings.regions[compact.locationRegions[i]]),
+        offsets: compact.offsets || [],
+        pokemonIds,
+        pokemonOf: j => String(strings.pokemon[cols.pokemon[j]] || '').toLowerCase(),
+        row: j => ({
+            pokemon: strings.pokemon[cols.pokemon[j]],
+            versions: unmask(strings.versions, cols.versions[j]),
+            method: strings.methods[cols.method[j]],
+            chance: cols.chance[j],
+            minLevel: cols.minLevel[j],
+            maxLevel: cols.maxLevel[j],
+            conditions: unmask(strings.conditions, cols.conditions[j])
+        })
+    };
+}
+
+// Full layout ({locations: {slug: [row, ...]}}): flattened into the same offsets shape.
+function tableFromFull(idx) {
+    const locations = Object.keys(idx.locations || {});
+    const list = [];
+    const offsets = [0];
+    for (const loc of locations) {
+        const rows = idx.locations[loc];
+        if (Array.isArray(rows)) list.push(...rows);
+        offsets.push(list.length);
+    }
+    const pokemonIds = idx.pokemonIds && typeof idx.pokemonIds === 'object'
+        ? new Map(Object.entries(idx.pokemonIds))
+        : null;
+    return {
+        locations,
+        regions: locations.map(loc => idx.locationRegions?.[loc] || null),
+        offsets,
+        pokemonIds,
+        pokemonOf: j => String(list[j]?.pokemon || '').toLowerCase(),
+        row: j => list[j]
+    };
+}
+
+// One pass over the rows to index them by location slug and by Pokémon.
+function indexTable(table) {
+    const byLocation = new Map(); // slug -> position in table.locations
+    const byPokemon = new Map(); // pokemon -> [row, ...]
+    const rowLocation = new Int32Array(table.offsets[table.locations.length] || 0);
+    table.locations.forEach((loc, i) => {
+        byLocation.set(loc, i);
+        for (let j = table.offsets[i]; j < table.offsets[i + 1]; j++) {
+            rowLocation[j] = i;
+            const name = table.pokemonOf(j);
+            if (!name) continue;
+            if (!byPokemon.has(name)) byPokemon.set(name, []);
+            byPokemon.get(name).push(j);
+        }
+    });
+    return { ...table, byLocation, byPokemon, rowLocation };
+}
+
+function loadIndex() {
+    if (!indexPromise) {
+        indexPromise = fetchJsonOrNull(urls?.compact)
+            .then(compact => {
+                if (compact?.format === COMPACT_FORMAT) return tableFromCompact(compact);
+                return fetchJsonOrNull(urls?.full).then(full => (full?.locations ? tableFromFull(full) : null));
+            })
+            .then(table => (table ? indexTable(table) : null))
+            .catch(() => null);
+    }
+    return indexPromise;
+}
+
+function queryPokemonLocations(index, args) {
+    const wanted = String(args?.pokemon || '').trim().toLowerCase();
+    const versions = new Map(); // version -> Set of location slugs
+    const regions = new Map();
+    for (const j of index.byPokemon.get(wanted) || []) {
+        const i = index.rowLocation[j];
+        const loc = index.locations[i];
+        const e = index.row(j);
+        for (const v of (Array.isArray(e?.versions) ? e.versions : [])) {
+            if (!v) continue;
+            if (!versions.has(v)) versions.set(v, new Set());
+            versions.get(v).add(loc);
+        }
+        if (index.regions[i]) regions.set(loc, index.regions[i]);
+    }
+    return {
+        versions: Array.from(versions, ([v, locs]) => [v, Array.from(locs)]),
+        locationRegions: Array.from(regions)
+    };
+}
+
+function queryLocationRows(index, args) {
+    const i = index.byLocation.get(args?.location);
+    if (i === undefined) return { region: null, resolved: true, rows: [] };
+
+    const rows = [];
+    for (let j = index.offsets[i]; j < index.offsets[i + 1]; j++) {
+        const e = index.row(j);
+        const pokemonName = String(e?.pokemon || '').toLowerCase();
+        const ids = index.pokemonIds?.get(pokemonName);
+        const pokemonId = Number.isFinite(ids?.[0]) ? ids[0] : null;
+        // With resolved ids in the index, names it couldn't resolve are dropped here.
+        if (index.pokemonIds && pokemonId === null) continue;
+
+        const method = toAppMethod(e?.method);
+        const chance = Number.isFinite(e?.chance) ? Math.round(e.chance) : null;
+        const minLevel = Number.isFinite(e?.minLevel) ? e.minLevel : null;
+        const maxLevel = Number.isFinite(e?.maxLevel) ? e.maxLevel : null;
+        const conditions = Array.isArray(e?.conditions) ? e.conditions : [];
+        for (const version of (Array.isArray(e?.versions) ? e.versions : [])) {
+            if (!version) continue;
+            rows.push([pokemonName, pokemonId, version, method, chance, minLevel, maxLevel, conditions]);
+        }
+    }
+    return { region: index.regions[i] || null, resolved: !!index.pokemonIds, rows };
+}
+
+const QUERIES = {
+    pokemonLocations: queryPokemonLocations,
+    locationRows: queryLocationRows
+};
+
+self.onmessage = (event) => {
+    const { id, op, args } = event.data || {};
+    if (op === 'init') {
+        urls = args?.urls || null;
+        return;
+    }
+    const query = QUERIES[op];
+    loadIndex()
+        .then(index => {
+            if (!index || !query) {
+                self.postMessage({ id, unavailable: true });
+                return;
+            }
+            self.postMessage({ id, result: query(index, args) });
+        })
+        .catch(() => self.postMessage({ id, unavailable: true }));
+};
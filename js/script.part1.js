@@ -1,4 +1,12 @@
-const API = 'https://pokeapi.co/api/v2';
+// PokéAPI base URL. Point it at a local mirror (see tools/pokeapi_snapshot.py) with
+// localStorage.setItem('pokeapiBase', 'http://localhost:8001/api/v2').
+const API = (() => {
+    try {
+        return localStorage.getItem('pokeapiBase');
+    } catch {
+        return null;
+    }
+})() || 'https://pokeapi.co/api/v2';
 
 // Boot markers so HTML can detect when JS didn't load / init didn't run.
 window.__APP_BOOTSTRAPPED__ = true;
@@ -134,23 +142,412 @@ function decorateNativePokedexBadges() {
     }
 }
 
-async function fetchJsonWithTimeout(url, timeoutMs = 15000) {
-    const controller = new AbortController();
-    const timer = window.setTimeout(() => controller.abort(), timeoutMs);
+// Request scheduler: every network request from the app goes through scheduleFetch().
+// - At most REQUEST_MAX_PER_ORIGIN requests run per origin. The rest wait in priority lanes:
+//   'high' (content on screen), 'normal', 'low' (prefetch, background refreshes).
+// - Identical GETs that are queued or running share one request.
+// - A 429/503 pauses the whole origin with exponential backoff (or Retry-After), then retries.
+// - Requests made with { cancelOnNavigate: true } are aborted by cancelViewRequests(), which
+//   runs when the user switches view in-app (loadPokedex / switchPage).
+// Counters: window.__POKEDB_SCHEDULER__.stats
+const REQUEST_MAX_PER_ORIGIN = 6;
+const REQUEST_PRIORITIES = ['high', 'normal', 'low'];
+const REQUEST_MAX_RETRIES = 4;
+const REQUEST_BACKOFF_BASE_MS = 500;
+const REQUEST_BACKOFF_MAX_MS = 30000;
+
+const requestSchedulerStats = { started: 0, deduped: 0, throttled: 0, retried: 0, cancelled: 0, failed: 0, maxQueued: 0 };
+const requestOrigins = new Map(); // origin -> { active, pausedUntil, timer, lanes: { high: [], normal: [], low: [] } }
+const requestJobsByKey = new Map(); // dedupe key -> job
+const requestJobs = new Set(); // every unsettled job
+let requestViewId = 0; // bumped by cancelViewRequests()
+
+function getRequestOrigin(url) {
+    let origin = 'null';
+    try {
+        origin = new URL(url, window.location.href).origin;
+    } catch {
+        // Relative URL without a usable base: one shared lane.
+    }
+    let state = requestOrigins.get(origin);
+    if (!state) {
+        state = { active: 0, pausedUntil: 0, timer: null, lanes: { high: [], normal: [], low: [] } };
+        requestOrigins.set(origin, state);
+    }
+    return state;
+}
+
+function requestAbortError() {
+    try {
+        return new DOMException('Request cancelled', 'AbortError');
+    } catch {
+        const err = new Error('Request cancelled');
+        err.name = 'AbortError';
+        return err;
+    }
+}
+
+function settleRequestJob(job, ok, value) {
+    if (job.settled) return;
+    job.settled = true;
+    requestJobs.delete(job);
+    if (job.key && requestJobsByKey.get(job.key) === job) requestJobsByKey.delete(job.key);
+    if (!ok) {
+        for (const waiter of job.waiters) waiter.reject(value);
+        return;
+    }
+    // The first caller gets the response itself; callers that joined later get clones, all
+    // taken before anyone reads the body, so no tee'd copy is left unread.
+    const clones = job.waiters.slice(1).map(() => value.clone());
+    job.waiters[0].resolve(value);
+    clones.forEach((clone, i) => job.waiters[i + 1].resolve(clone));
+}
+
+function cancelRequestJob(job) {
+    if (job.settled) return;
+    const lane = job.origin.lanes[job.priority];
+    const idx = lane.indexOf(job);
+    if (idx >= 0) lane.splice(idx, 1);
+    if (job.controller) job.controller.abort();
+    requestSchedulerStats.cancelled++;
+    settleRequestJob(job, false, requestAbortError());
+}
+
+function getRetryDelayMs(res, attempt) {
+    const header = res.headers?.get?.('Retry-After');
+    if (header) {
+        const seconds = Number(header);
+        const ms = Number.isFinite(seconds) ? seconds * 1000 : Date.parse(header) - Date.now();
+        if (Number.isFinite(ms) && ms >= 0) return Math.min(ms, REQUEST_BACKOFF_MAX_MS);
+    }
+    const backoff = REQUEST_BACKOFF_BASE_MS * (2 ** attempt);
+    return Math.min(backoff + Math.random() * backoff * 0.25, REQUEST_BACKOFF_MAX_MS);
+}
+
+function pumpRequestOrigin(state) {
+    const wait = state.pausedUntil - Date.now();
+    if (wait > 0) {
+        if (!state.timer) {
+            state.timer = window.setTimeout(() => {
+                state.timer = null;
+                pumpRequestOrigin(state);
+            }, wait);
+        }
+        return;
+    }
+    while (state.active < REQUEST_MAX_PER_ORIGIN) {
+        const lane = REQUEST_PRIORITIES.map(p => state.lanes[p]).find(l => l.length);
+        if (!lane) return;
+        runRequestJob(lane.shift());
+    }
+}
+
+function runRequestJob(job) {
+    const state = job.origin;
+    state.active++;
+    requestSchedulerStats.started++;
+    job.controller = new AbortController();
+    const timer = job.timeoutMs ? window.setTimeout(() => job.controller.abort(), job.timeoutMs) : null;
+
+    fetch(job.url, { ...job.init, signal: job.controller.signal })
+        .then(res => {
+            if ((res.status === 429 || res.status === 503) && job.attempt < REQUEST_MAX_RETRIES) {
+                // Throttled: hold every request to this origin, then retry this one first.
+                requestSchedulerStats.throttled++;
+                requestSchedulerStats.retried++;
+                state.pausedUntil = Math.max(state.pausedUntil, Date.now() + getRetryDelayMs(res, job.attempt));
+                job.attempt++;
+                state.lanes[job.priority].unshift(job);
+                return;
+            }
+            settleRequestJob(job, true, res);
+        })
+        .catch(err => {
+            if (!job.settled) requestSchedulerStats.failed++;
+            settleRequestJob(job, false, err);
+        })
+        .finally(() => {
+            if (timer) window.clearTimeout(timer);
+            state.active--;
+            pumpRequestOrigin(state);
+        });
+}
+
+// Options: init (fetch init), priority ('high' | 'normal' | 'low'), timeoutMs (per attempt,
+// counted from when the request starts rather than from when it was queued),
+// cancelOnNavigate, key (dedupe key; defaults to the URL for GETs). Resolves to a Response
+// like fetch(); callers that share a request each get their own copy.
+function scheduleFetch(url, options = {}) {
+    const init = options.init || {};
+    const method = String(init.method || 'GET').toUpperCase();
+    const priority = REQUEST_PRIORITIES.includes(options.priority) ? options.priority : 'normal';
+    const key = options.key || (method === 'GET' ? url : null);
+
+    let job = key ? requestJobsByKey.get(key) : null;
+    if (job) {
+        requestSchedulerStats.deduped++;
+        if (!options.cancelOnNavigate) job.cancelOnNavigate = false;
+        // Promote a queued request when a more urgent caller needs it.
+        const lane = job.origin.lanes[job.priority];
+        const idx = lane.indexOf(job);
+        if (idx >= 0 && REQUEST_PRIORITIES.indexOf(priority) < REQUEST_PRIORITIES.indexOf(job.priority)) {
+            lane.splice(idx, 1);
+            job.priority = priority;
+            job.origin.lanes[priority].push(job);
+        }
+    } else {
+        job = {
+            url,
+            init,
+            key,
+            priority,
+            timeoutMs: options.timeoutMs || 0,
+            cancelOnNavigate: !!options.cancelOnNavigate,
+            origin: getRequestOrigin(url),
+            attempt: 0,
+            controller: null,
+            settled: false,
+            waiters: [] // { resolve, reject } per caller
+        };
+        requestJobs.add(job);
+        if (key) requestJobsByKey.set(key, job);
+        job.origin.lanes[priority].push(job);
+        requestSchedulerStats.maxQueued = Math.max(requestSchedulerStats.maxQueued, requestJobs.size);
+    }
+    const response = new Promise((resolve, reject) => job.waiters.push({ resolve, reject }));
+    if (job.waiters.length === 1) pumpRequestOrigin(job.origin);
+    return response;
+}
+
+function cancelViewRequests() {
+    requestViewId++;
+    for (const job of Array.from(requestJobs)) {
+        if (job.cancelOnNavigate) cancelRequestJob(job);
+    }
+}
+
+window.__POKEDB_SCHEDULER__ = {
+    stats: requestSchedulerStats,
+    pending() {
+        return requestJobs.size;
+    },
+    cancelViewRequests
+};
+
+// Persistent JSON response cache shared by every page. Each page is a separate document,
+// so the in-memory caches start empty after every navigation; this layer keeps responses
+// across navigations and visits.
+// - Bodies live in Cache Storage; per-key metadata (bytes, stored/last-used times) lives in
+//   localStorage so LRU eviction doesn't have to open every entry.
+// - Stale-while-revalidate: entries younger than PERSISTENT_CACHE_FRESH_MS are served as-is,
+//   older ones (up to PERSISTENT_CACHE_MAX_AGE_MS) are served and refreshed in the background.
+//   This is the only cache for PokéAPI JSON; sw.js lets those requests through.
+// - Bump PERSISTENT_CACHE_VERSION to drop everything cached by older builds.
+// - Counters: window.__POKEDB_CACHE__.stats / .hitRate() in the console.
+// Without Cache Storage (file://, private modes) requests go straight to the network.
+const PERSISTENT_CACHE_VERSION = 1;
+const PERSISTENT_CACHE_PREFIX = 'pokedb-json-';
+const PERSISTENT_CACHE_NAME = `${PERSISTENT_CACHE_PREFIX}v${PERSISTENT_CACHE_VERSION}`;
+const PERSISTENT_CACHE_META_KEY = `${PERSISTENT_CACHE_NAME}:meta`;
+const PERSISTENT_CACHE_MAX_BYTES = 48 * 1024 * 1024;
+const PERSISTENT_CACHE_FRESH_MS = 24 * 60 * 60 * 1000;
+const PERSISTENT_CACHE_MAX_AGE_MS = 30 * 24 * 60 * 60 * 1000;
+
+const persistentCacheStats = { hits: 0, staleHits: 0, misses: 0, revalidations: 0, evictions: 0, errors: 0 };
+const persistentCacheInFlight = new Map(); // key -> Promise<json>
+let persistentCachePromise = null;
+let persistentCacheMeta = null; // key -> [bytes, storedAt, lastUsed]
+let persistentCacheMetaTimer = null;
+
+function openPersistentCache() {
+    if (persistentCachePromise) return persistentCachePromise;
+    persistentCachePromise = (async () => {
+        try {
+            if (typeof caches === 'undefined' || window.location.protocol === 'file:') return null;
+            const cache = await caches.open(PERSISTENT_CACHE_NAME);
+            // Versioned invalidation: drop caches and metadata written by older versions.
+            caches.keys()
+                .then(keys => keys
+                    .filter(k => k.startsWith(PERSISTENT_CACHE_PREFIX) && k !== PERSISTENT_CACHE_NAME)
+                    .forEach(k => caches.delete(k)))
+                .catch(() => {});
+            try {
+                for (let i = localStorage.length - 1; i >= 0; i--) {
+                    const k = localStorage.key(i);
+                    if (k && k.startsWith(PERSISTENT_CACHE_PREFIX) && k !== PERSISTENT_CACHE_META_KEY) localStorage.removeItem(k);
+                }
+            } catch {
+                // localStorage unavailable; metadata then lives for this page only.
+            }
+            return cache;
+        } catch {
+            return null;
+        }
+    })();
+    return persistentCachePromise;
+}
+
+function getPersistentCacheMeta() {
+    if (persistentCacheMeta) return persistentCacheMeta;
+    persistentCacheMeta = new Map();
+    try {
+        const raw = JSON.parse(localStorage.getItem(PERSISTENT_CACHE_META_KEY) || '{}');
+        for (const [k, v] of Object.entries(raw)) {
+            if (Array.isArray(v) && v.length === 3) persistentCacheMeta.set(k, v);
+        }
+    } catch {
+        // Corrupt or unavailable metadata: start over (bodies without metadata are misses).
+    }
+    return persistentCacheMeta;
+}
+
+function savePersistentCacheMetaSoon() {
+    if (persistentCacheMetaTimer) return;
+    persistentCacheMetaTimer = window.setTimeout(() => {
+        persistentCacheMetaTimer = null;
+        try {
+            localStorage.setItem(PERSISTENT_CACHE_META_KEY, JSON.stringify(Object.fromEntries(getPersistentCacheMeta())));
+        } catch {
+            // Quota exceeded / unavailable: metadata is best-effort.
+        }
+    }, 500);
+}
+
+async function evictPersistentCache(cache) {
+    const meta = getPersistentCacheMeta();
+    let total = 0;
+    for (const [, [bytes]] of meta) total += bytes;
+    if (total <= PERSISTENT_CACHE_MAX_BYTES) return;
+
+    const byLastUse = Array.from(meta.entries()).sort((a, b) => a[1][2] - b[1][2]);
+    for (const [key, [bytes]] of byLastUse) {
+        if (total <= PERSISTENT_CACHE_MAX_BYTES * 0.9) break;
+        meta.delete(key);
+        total -= bytes;
+        persistentCacheStats.evictions++;
+        cache.delete(key).catch(() => {});
+    }
+    savePersistentCacheMetaSoon();
+}
+
+async function fetchJsonFromNetwork(url, { timeoutMs, init, key, priority, cancelOnNavigate } = {}) {
+    const res = await scheduleFetch(url, { timeoutMs, init, key, priority, cancelOnNavigate });
+    if (!res.ok) throw new Error(`HTTP ${res.status} for ${url}`);
+    const text = await res.text();
+    return { text, data: JSON.parse(text) };
+}
+
+async function storePersistentCache(cache, key, text) {
     try {
-        const res = await fetch(url, { signal: controller.signal });
-        if (!res.ok) throw new Error(`HTTP ${res.status} for ${url}`);
-        return await res.json();
-    } finally {
-        window.clearTimeout(timer);
+        await cache.put(key, new Response(text, { headers: { 'Content-Type': 'application/json' } }));
+        const now = Date.now();
+        // UTF-8 bytes, as stored; text.length would count UTF-16 code units.
+        getPersistentCacheMeta().set(key, [new Blob([text]).size, now, now]);
+        savePersistentCacheMetaSoon();
+        await evictPersistentCache(cache);
+    } catch {
+        persistentCacheStats.errors++;
     }
 }
 
+// Stored body for key as { data, age }, or null when missing, expired or unreadable.
+async function matchPersistentCache(cache, key) {
+    const meta = getPersistentCacheMeta().get(key);
+    const age = meta ? Date.now() - meta[1] : Infinity;
+    if (age >= PERSISTENT_CACHE_MAX_AGE_MS) return null;
+    const hit = await cache.match(key).catch(() => null);
+    const data = hit ? await hit.json().catch(() => undefined) : undefined;
+    if (data === undefined) return null;
+    meta[2] = Date.now();
+    savePersistentCacheMetaSoon();
+    return { data, age };
+}
+
+// Options: timeoutMs, init (fetch init), key (cache key when the URL alone doesn't identify
+// the response), cacheable(data) (false skips storing it), and priority / cancelOnNavigate
+// for scheduleFetch().
+async function cachedJson(url, options = {}) {
+    const key = options.key || url;
+    // Requests that die with the current view must not be joined by the next view.
+    const flightKey = options.cancelOnNavigate ? `${key}#view${requestViewId}` : key;
+    if (persistentCacheInFlight.has(flightKey)) return persistentCacheInFlight.get(flightKey);
+
+    const p = (async () => {
+        const cache = await openPersistentCache();
+        const stored = cache ? await matchPersistentCache(cache, key) : null;
+        if (stored) {
+            if (stored.age < PERSISTENT_CACHE_FRESH_MS) {
+                persistentCacheStats.hits++;
+            } else {
+                persistentCacheStats.staleHits++;
+                persistentCacheStats.revalidations++;
+                // no-cache: ask the server, not a copy the HTTP cache still considers fresh.
+                const init = { ...options.init, cache: 'no-cache' };
+                fetchJsonFromNetwork(url, { ...options, init, priority: 'low', cancelOnNavigate: false })
+                    .then(({ text, data: fresh }) => {
+                        if (!options.cacheable || options.cacheable(fresh)) return storePersistentCache(cache, key, text);
+                    })
+                    .catch(() => {});
+            }
+            return stored.data;
+        }
+
+        persistentCacheStats.misses++;
+        const { text, data } = await fetchJsonFromNetwork(url, options);
+        if (cache && (!options.cacheable || options.cacheable(data))) storePersistentCache(cache, key, text);
+        return data;
+    })();
+
+    persistentCacheInFlight.set(flightKey, p);
+    p.finally(() => persistentCacheInFlight.delete(flightKey)).catch(() => {});
+    return p;
+}
+
+window.__POKEDB_CACHE__ = {
+    name: PERSISTENT_CACHE_NAME,
+    stats: persistentCacheStats,
+    hitRate() {
+        const s = persistentCacheStats;
+        const served = s.hits + s.staleHits;
+        const total = served + s.misses;
+        return total ? served / total : 0;
+    },
+    bytes() {
+        let total = 0;
+        for (const [, [bytes]] of getPersistentCacheMeta()) total += bytes;
+        return total;
+    },
+    async clear() {
+        persistentCacheMeta = new Map();
+        try {
+            localStorage.removeItem(PERSISTENT_CACHE_META_KEY);
+        } catch {
+            // ignore
+        }
+        if (typeof caches !== 'undefined') await caches.delete(PERSISTENT_CACHE_NAME);
+        persistentCachePromise = null;
+    }
+};
+
+async function fetchJsonWithTimeout(url, timeoutMs = 15000) {
+    return cachedJson(url, { timeoutMs });
+}
+
 // When opened via file://, relative URLs resolve from the current page folder.
 // We keep `index.html` at repo root and other pages under `pages/`.
 const IS_PAGES_DIR = /\/pages\/|\\pages\\/.test(window.location.pathname);
 const ROOT_PREFIX = IS_PAGES_DIR ? '../' : '';
 const PAGES_PREFIX = IS_PAGES_DIR ? '' : 'pages/';
+
+// Offline support: sw.js precaches the shell and data/ (see tools/build_sw_manifest.py)
+// and caches PokéAPI responses. Service workers need http(s), so file:// skips this.
+if ('serviceWorker' in navigator && /^https?:$/.test(window.location.protocol)) {
+    window.addEventListener('load', () => {
+        navigator.serviceWorker
+            .register(`${ROOT_PREFIX}sw.js`, { updateViaCache: 'none' })
+            .catch(() => {});
+    });
+}
 const TYPES = ['all', 'normal', 'fire', 'water', 'grass', 'electric', 'ice', 'fighting', 'poison', 'ground', 'flying', 'psychic', 'bug', 'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy'];
 const TYPE_COLORS = {
 normal: '#A8A878', fire: '#F08030', water: '#6890F0', grass: '#78C850', electric: '#F8D030',
@@ -358,7 +755,15 @@ const GEN_VERSION_ORDER = {
 
 // GraphQL-Pokemon fallback (favware/graphql-pokemon)
 // Used to fill gaps where PokeAPI lacks newer dex entries / descriptions.
-const GQL_POKEMON_API = 'https://graphqlpokemon.favware.tech/v8';
+// Point it at a stand-in server (see tools/graphql_fallbacks.py) with
+// localStorage.setItem('graphqlPokemonBase', 'http://localhost:8002/').
+const GQL_POKEMON_API = (() => {
+    try {
+        return localStorage.getItem('graphqlPokemonBase');
+    } catch {
+        return null;
+    }
+})() || 'https://graphqlpokemon.favware.tech/v8';
 
 // Map GraphQL-Pokemon flavorTexts.game (display names) -> PokeAPI version keys
 // e.g. "Omega Ruby" -> "omega-ruby".
@@ -372,43 +777,175 @@ const MAINLINE_LABEL_TO_VERSION = (() => {
 
 const gqlRequestCache = new Map();
 
+// Resolves to the raw response ({ data, errors }); only transport failures reject, so a
+// batch can hand each alias its own data or error. Not stored as a whole: sendGraphqlBatch
+// stores each alias under its own key.
 async function fetchGraphqlPokemon(query, variables) {
-    const cacheKey = JSON.stringify({ query, variables: variables || null });
-    if (gqlRequestCache.has(cacheKey)) return gqlRequestCache.get(cacheKey);
+    const body = JSON.stringify({ query, variables: variables || {} });
+    if (gqlRequestCache.has(body)) return gqlRequestCache.get(body);
+
+    const p = fetchJsonFromNetwork(GQL_POKEMON_API, {
+        init: { method: 'POST', headers: { 'Content-Type': 'application/json' }, body }
+    }).then(({ data }) => data).catch(e => {
+        gqlRequestCache.delete(body);
+        throw new Error(`GraphQL-Pokemon ${e?.message || e}`);
+    });
 
-    const p = (async () => {
-        const res = await fetch(GQL_POKEMON_API, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ query, variables: variables || {} })
-        });
+    gqlRequestCache.set(body, p);
+    return p;
+}
+
+// Fallback lookups, one GraphQL field per item. Lookups queued within GQL_BATCH_WINDOW_MS of
+// each other go out as one aliased document (f0: getPokemonByDexNumber(...) f1: ...), up to
+// GQL_BATCH_MAX_FIELDS fields per POST, and each caller gets its own alias back. Results are
+// kept in the persistent cache per field (graphqlFieldStorageKey), so only misses are batched
+// and an alias that errors doesn't keep the others in its batch from being stored.
+const GQL_BATCH_WINDOW_MS = 15;
+const GQL_BATCH_MAX_FIELDS = 20;
+const GQL_FALLBACK_FIELDS = {
+    dex: {
+        field: 'getPokemonByDexNumber',
+        type: 'Int!',
+        args: v => `number: ${v}, takeFlavorTexts: 50, reverseFlavorTexts: false`,
+        selection: 'num species flavorTexts { game flavor }'
+    },
+    moves: {
+        field: 'getFuzzyMove',
+        type: 'String!',
+        args: v => `move: ${v}, take: 1`,
+        selection: 'name shortDesc desc accuracy pp priority basePower type category'
+    }
+};
+const gqlFieldCache = new Map(); // "kind:key" -> Promise<field data | null>
+let gqlBatchQueue = [];
+let gqlBatchTimer = null;
+
+function buildGraphqlBatchDocument(items) {
+    const defs = [];
+    const fields = [];
+    const variables = {};
+    items.forEach((item, i) => {
+        const spec = GQL_FALLBACK_FIELDS[item.kind];
+        defs.push(`$v${i}: ${spec.type}`);
+        fields.push(`f${i}: ${spec.field}(${spec.args(`$v${i}`)}) { ${spec.selection} }`);
+        variables[`v${i}`] = item.value;
+    });
+    return { query: `query(${defs.join(', ')}) { ${fields.join(' ')} }`, variables };
+}
 
-        const json = await res.json().catch(() => null);
-        if (!res.ok) {
-            throw new Error(`GraphQL-Pokemon HTTP ${res.status}`);
+// Cache Storage keys must be GET URLs; one per field, e.g. <endpoint>?gql=dex:906.
+function graphqlFieldStorageKey(kind, key) {
+    return `${GQL_POKEMON_API}?gql=${kind}:${encodeURIComponent(key)}`;
+}
+
+async function sendGraphqlBatch(items) {
+    const { query, variables } = buildGraphqlBatchDocument(items);
+    let json;
+    try {
+        json = await fetchGraphqlPokemon(query, variables);
+    } catch (e) {
+        for (const item of items) item.reject(e);
+        return;
+    }
+    const cache = await openPersistentCache();
+    const errors = Array.isArray(json?.errors) ? json.errors : [];
+    items.forEach((item, i) => {
+        const alias = `f${i}`;
+        const err = errors.find(e => e?.path?.[0] === alias)
+            || (json?.data == null ? errors[0] : null);
+        if (err) {
+            item.reject(new Error(err.message || 'GraphQL error'));
+            return;
         }
-        if (json?.errors?.length) {
-            const msg = json.errors.map(e => e?.message).filter(Boolean).join('; ') || 'GraphQL error';
-            throw new Error(msg);
+        const data = json?.data?.[alias] ?? null;
+        if (cache) storePersistentCache(cache, graphqlFieldStorageKey(item.kind, item.key), JSON.stringify(data));
+        item.resolve(data);
+    });
+}
+
+function flushGraphqlBatch() {
+    gqlBatchTimer = null;
+    const queue = gqlBatchQueue;
+    gqlBatchQueue = [];
+    for (let i = 0; i < queue.length; i += GQL_BATCH_MAX_FIELDS) {
+        sendGraphqlBatch(queue.slice(i, i + GQL_BATCH_MAX_FIELDS));
+    }
+}
+
+function queueGraphqlField(kind, key, value) {
+    return new Promise((resolve, reject) => {
+        gqlBatchQueue.push({ kind, key, value, resolve, reject });
+        if (gqlBatchQueue.length >= GQL_BATCH_MAX_FIELDS) {
+            clearTimeout(gqlBatchTimer);
+            flushGraphqlBatch();
+        } else if (!gqlBatchTimer) {
+            gqlBatchTimer = setTimeout(flushGraphqlBatch, GQL_BATCH_WINDOW_MS);
         }
-        return json;
-    })();
+    });
+}
+
+// Results baked by tools/graphql_fallbacks.py build: data/graphql-fallbacks/{dex,moves}/<key>.json
+// plus a manifest listing the keys, so only baked items cost a (precached) static fetch.
+const GQL_FALLBACKS_URL = `${ROOT_PREFIX}data/graphql-fallbacks`;
+const GQL_FALLBACKS_FORMAT = 'graphql-fallbacks/1';
+let gqlFallbacksManifestPromise = null;
+let gqlFallbackShardLoader = null;
+
+function loadGraphqlFallbacksManifest() {
+    if (!gqlFallbacksManifestPromise) {
+        gqlFallbacksManifestPromise = scheduleFetch(`${GQL_FALLBACKS_URL}/manifest.json`, { priority: 'high' })
+            .then(r => (r.ok ? r.json() : null))
+            .then(manifest => (manifest?.format === GQL_FALLBACKS_FORMAT
+                ? { ...manifest, dex: new Set(manifest.dex || []), moves: new Set(manifest.moves || []) }
+                : null))
+            .catch(() => null);
+    }
+    return gqlFallbacksManifestPromise;
+}
+
+async function loadBakedGraphqlField(kind, key) {
+    const manifest = await loadGraphqlFallbacksManifest();
+    if (!manifest?.[kind]?.has(key)) return null;
+    if (!gqlFallbackShardLoader) gqlFallbackShardLoader = createShardLoader(GQL_FALLBACKS_URL, gqlFallbacksManifestPromise);
+    return (await gqlFallbackShardLoader(kind, String(key))) || null;
+}
+
+// Same fresh / stale-while-revalidate rules as cachedJson; a stale field is served and
+// re-queued with the next batch.
+async function loadStoredGraphqlField(kind, key, value) {
+    const cache = await openPersistentCache();
+    const stored = cache ? await matchPersistentCache(cache, graphqlFieldStorageKey(kind, key)) : null;
+    if (!stored) {
+        persistentCacheStats.misses++;
+        return queueGraphqlField(kind, key, value);
+    }
+    if (stored.age < PERSISTENT_CACHE_FRESH_MS) {
+        persistentCacheStats.hits++;
+    } else {
+        persistentCacheStats.staleHits++;
+        persistentCacheStats.revalidations++;
+        queueGraphqlField(kind, key, value).catch(() => {});
+    }
+    return stored.data;
+}
 
-    gqlRequestCache.set(cacheKey, p);
+function fetchGraphqlField(kind, key, value) {
+    const cacheKey = `${kind}:${key}`;
+    if (gqlFieldCache.has(cacheKey)) return gqlFieldCache.get(cacheKey);
+    const p = loadBakedGraphqlField(kind, key)
+        .then(baked => baked || loadStoredGraphqlField(kind, key, value))
+        .catch(e => {
+            gqlFieldCache.delete(cacheKey);
+            throw e;
+        });
+    gqlFieldCache.set(cacheKey, p);
     return p;
 }
 
 async function fetchGraphqlDexFlavorTextsByDexNumber(dexNumber) {
     if (!Number.isFinite(dexNumber)) return null;
-    const query = `query($n: Int!, $take: Int, $rev: Boolean){
-        getPokemonByDexNumber(number: $n, takeFlavorTexts: $take, reverseFlavorTexts: $rev){
-            num
-            species
-            flavorTexts { game flavor }
-        }
-    }`;
-    const json = await fetchGraphqlPokemon(query, { n: dexNumber, take: 50, rev: false });
-    const flavorTexts = json?.data?.getPokemonByDexNumber?.flavorTexts;
+    const pokemon = await fetchGraphqlField('dex', dexNumber, dexNumber);
+    const flavorTexts = pokemon?.flavorTexts;
     if (!Array.isArray(flavorTexts) || !flavorTexts.length) return null;
 
     const byVersion = {};
@@ -425,21 +962,7 @@ async function fetchGraphqlDexFlavorTextsByDexNumber(dexNumber) {
 
 async function fetchGraphqlMoveFallback(moveQuery) {
     if (!moveQuery) return null;
-    const query = `query($q: String!, $take: Int){
-        getFuzzyMove(move: $q, take: $take){
-            name
-            shortDesc
-            desc
-            accuracy
-            pp
-            priority
-            basePower
-            type
-            category
-        }
-    }`;
-    const json = await fetchGraphqlPokemon(query, { q: String(moveQuery), take: 1 });
-    const result = json?.data?.getFuzzyMove;
+    const result = await fetchGraphqlField('moves', String(moveQuery).toLowerCase(), String(moveQuery));
     if (!Array.isArray(result) || !result.length) return null;
     return result[0] || null;
 }
@@ -712,10 +1235,10 @@ function setupActionDelegation() {
                 loadLocationFromInput();
                 return;
             case 'show-ability-pokemon':
-                showAbilityPokemon(el.dataset.ability);
+                if (typeof showAbilityPokemon === 'function') showAbilityPokemon(el.dataset.ability);
                 return;
             case 'sort-abilities':
-                sortAbilitiesTable(parseInt(el.dataset.sortColumn || '0', 10));
+                if (typeof sortAbilitiesTable === 'function') sortAbilitiesTable(parseInt(el.dataset.sortColumn || '0', 10));
                 return;
             case 'artwork-prev':
                 artworkNavigate(-1, el);
@@ -885,10 +1408,8 @@ function parseIdFromUrl(url) {
     }
 }
 
-async function fetchJson(url) {
-    const res = await fetch(url);
-    if (!res.ok) throw new Error(`HTTP ${res.status} for ${url}`);
-    return res.json();
+async function fetchJson(url, options) {
+    return cachedJson(url, options);
 }
 
 async function promisePool(items, concurrency, worker) {
@@ -1119,13 +1640,23 @@ function formatWhereToFindLocationTitle(locationSlug) {
 // PokeDB encounter fallback (https://pokedb.org/data-export)
 // Used only when PokeAPI returns empty encounter tables for Gen 8/9 regions.
 const POKEDB_ENCOUNTERS_INDEX_URL = `${ROOT_PREFIX}data/pokedb-encounters-g8g9.json`;
+const POKEDB_ENCOUNTERS_INDEX_JS_URL = `${ROOT_PREFIX}data/pokedb-encounters-g8g9.js`;
+// Same index, dictionary-encoded into integer columns (about 6x smaller); decoded on load.
+const POKEDB_ENCOUNTERS_COMPACT_URL = `${ROOT_PREFIX}data/pokedb-encounters-g8g9.compact.json`;
+const POKEDB_ENCOUNTERS_COMPACT_JS_URL = `${ROOT_PREFIX}data/pokedb-encounters-g8g9.compact.js`;
+const POKEDB_ENCOUNTERS_COMPACT_FORMAT = 'pokedb-encounters-columnar/1';
+// Sharded layout written next to the full index: locations/<slug>.json and pokemon/<slug>.json.
+const POKEDB_ENCOUNTERS_SHARDS_URL = `${ROOT_PREFIX}data/pokedb-encounters-g8g9`;
 let pokedbEncountersIndexPromise = null;
+const pokedbLocationRegions = new Map(); // locationSlug -> region, filled from shards
 const pokemonIdByNameCache = new Map();
 
 // Pokemon detail: build a version -> locations map (PokeAPI encounters + PokeDB fallback)
 const whereToFindByPokemonCache = new Map();
 const locationAreaToLocationCache = new Map();
 
+const POKEMON_SPRITE_BASE = 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/';
+
 const WHERE_TO_FIND_GROUPS = [
     { gen: 1, labels: ['Red', 'Blue', 'Yellow'], versions: ['red', 'blue', 'yellow'] },
     { gen: 2, labels: ['Gold', 'Silver', 'Crystal'], versions: ['gold', 'silver', 'crystal'] },
@@ -1152,6 +1683,7 @@ const WHERE_TO_FIND_GROUPS = [
 ];
 
 function getPokeDbLocationRegion(locationSlug) {
+    if (pokedbLocationRegions.has(locationSlug)) return pokedbLocationRegions.get(locationSlug);
     const idx = window.__POKEDB_ENCOUNTERS_G8G9__;
     const map = idx?.locationRegions;
     if (!map) return null;
@@ -1212,13 +1744,33 @@ async function fetchPokeApiLocationsByVersionForPokemon(pokemonId) {
 
 async function fetchPokeDbLocationsByVersionForPokemon(pokemonSlug) {
     const out = new Map();
+    const wanted = String(pokemonSlug || '').trim().toLowerCase();
+    if (!wanted) return out;
+
+    const shard = await fetchPokeDbShard('pokemon', wanted);
+    if (shard !== undefined) {
+        for (const [loc, region] of Object.entries(shard?.locationRegions || {})) {
+            pokedbLocationRegions.set(loc, region);
+        }
+        for (const [v, locs] of Object.entries(shard?.versions || {})) {
+            if (!Array.isArray(locs) || !locs.length) continue;
+            out.set(v, new Set(locs));
+        }
+        return out;
+    }
+
+    // Shards unavailable: scan the full index, in the worker when possible.
+    const found = await queryPokeDbWorker('pokemonLocations', { pokemon: wanted });
+    if (found) {
+        for (const [loc, region] of found.locationRegions) pokedbLocationRegions.set(loc, region);
+        for (const [v, locs] of found.versions) out.set(v, new Set(locs));
+        return out;
+    }
+
     const idx = await loadPokeDbEncountersIndex();
     const locations = idx?.locations;
     if (!locations) return out;
 
-    const wanted = String(pokemonSlug || '').trim().toLowerCase();
-    if (!wanted) return out;
-
     for (const [locationId, list] of Object.entries(locations)) {
         if (!Array.isArray(list) || !list.length) continue;
         for (const e of list) {
@@ -1242,6 +1794,20 @@ async function buildWhereToFindByVersion(pokemonId, pokemonSlug) {
     const p = (async () => {
         const map = new Map();
 
+        // One precomputed file already merges PokéAPI encounters with the PokeDB fallback.
+        const reverse = pokemonSlug
+            ? await fetchReverseIndexShard('pokemon-locations', String(pokemonSlug).toLowerCase())
+            : undefined;
+        if (reverse !== undefined) {
+            for (const [loc, region] of Object.entries(reverse?.locationRegions || {})) {
+                pokedbLocationRegions.set(loc, region);
+            }
+            for (const [version, locs] of Object.entries(reverse?.versions || {})) {
+                if (Array.isArray(locs) && locs.length) map.set(version, new Set(locs));
+            }
+            return map;
+        }
+
         const [pokeApiMap, pokeDbMap] = await Promise.all([
             fetchPokeApiLocationsByVersionForPokemon(pokemonId).catch(() => new Map()),
             fetchPokeDbLocationsByVersionForPokemon(pokemonSlug).catch(() => new Map())
@@ -1317,6 +1883,66 @@ function getEvolutionAncestorsFromChain(chainNode, targetSpeciesName) {
     return Array.isArray(found) ? found : [];
 }
 
+// Evolution graph (tools/evolution_graph.py): every species with its family, parent and
+// precomputed ancestors, plus each evolution's conditions.
+const EVOLUTION_GRAPH_URL = `${ROOT_PREFIX}data/evolution-graph.json`;
+const EVOLUTION_GRAPH_FORMAT = 'pokedb-evolution-graph/1';
+let evolutionGraphPromise = null;
+
+function loadEvolutionGraph() {
+    if (!evolutionGraphPromise) {
+        evolutionGraphPromise = scheduleFetch(EVOLUTION_GRAPH_URL, { priority: 'high' })
+            .then(r => (r.ok ? r.json() : null))
+            .then(raw => {
+                if (raw?.format !== EVOLUTION_GRAPH_FORMAT || !Array.isArray(raw.species)) return null;
+                const index = new Map(raw.species.map((row, i) => [row[0], i]));
+                const children = new Map(); // node -> [[child, conditions], ...]
+                for (const [from, to, conditions] of raw.edges || []) {
+                    if (!children.has(from)) children.set(from, []);
+                    children.get(from).push([to, conditions]);
+                }
+                return { ...raw, index, children };
+            })
+            .catch(() => null);
+    }
+    return evolutionGraphPromise;
+}
+
+// Species the given one evolves from, base first; null when the graph doesn't know it.
+function getEvolutionGraphAncestors(graph, speciesName) {
+    const idx = graph?.index.get(String(speciesName || '').toLowerCase());
+    if (idx === undefined) return null;
+    return graph.ancestors[idx].map(i => graph.species[i][0]);
+}
+
+// The species' family as a PokéAPI /evolution-chain payload, so renderEvolutionChain can
+// draw it without fetching the chain. Null when the graph doesn't know the species.
+function buildEvolutionChainFromGraph(graph, speciesName) {
+    const idx = graph?.index.get(String(speciesName || '').toLowerCase());
+    if (idx === undefined) return null;
+
+    const resourceFields = graph.resourceFields || {};
+    const toDetail = (conditions) => {
+        const detail = {};
+        for (const [key, value] of Object.entries(conditions || {})) {
+            const kind = resourceFields[key];
+            detail[key] = kind ? { name: value, url: `${API}/${kind}/${value}/` } : value;
+        }
+        return detail;
+    };
+    const toNode = (i, conditions) => {
+        const [name, id] = graph.species[i];
+        return {
+            species: { name, url: `${API}/pokemon-species/${id}/` },
+            evolution_details: (conditions || []).map(toDetail),
+            evolves_to: (graph.children.get(i) || []).map(([child, childConditions]) => toNode(child, childConditions))
+        };
+    };
+
+    const root = graph.ancestors[idx].length ? graph.ancestors[idx][0] : idx;
+    return { id: graph.species[idx][2], chain: toNode(root, []) };
+}
+
 function renderWhereToFindRowsHtml(rows, byVersion, species, evoAncestors) {
     const isSpecial = !!(species?.is_mythical || species?.is_legendary);
     const introGen = getSpeciesIntroducedGen(species);
@@ -1438,7 +2064,8 @@ async function setupWhereToFindSection(root, pokemon, species, evo) {
     const byVersion = await buildWhereToFindByVersion(pokemon?.id, pokemon?.name);
 
     const targetSpeciesName = species?.name || pokemon?.species?.name || pokemon?.name;
-    const evoAncestors = getEvolutionAncestorsFromChain(evo?.chain, targetSpeciesName);
+    const evoAncestors = getEvolutionGraphAncestors(await loadEvolutionGraph(), targetSpeciesName)
+        || getEvolutionAncestorsFromChain(evo?.chain, targetSpeciesName);
 
     body.innerHTML = renderWhereToFindRowsHtml(rows, byVersion, species, evoAncestors);
 }
@@ -1450,13 +2077,86 @@ function pokedbMethodToAppMethod(method) {
     return m || 'special';
 }
 
+function loadScriptOnce(src) {
+    return new Promise((resolve, reject) => {
+        const existing = document.querySelector(`script[data-src="${src}"]`);
+        if (existing) {
+            if (existing.dataset.loaded === 'true') resolve();
+            else {
+                existing.addEventListener('load', () => resolve());
+                existing.addEventListener('error', () => reject(new Error(`Failed to load ${src}`)));
+            }
+            return;
+        }
+        const el = document.createElement('script');
+        el.src = src;
+        el.dataset.src = src;
+        el.addEventListener('load', () => { el.dataset.loaded = 'true'; resolve(); });
+        el.addEventListener('error', () => reject(new Error(`Failed to load ${src}`)));
+        document.head.appendChild(el);
+    });
+}
+
+// Mirrors decode_compact() in tools/build_pokedb_encounters.py.
+function decodeCompactPokeDbIndex(compact) {
+    if (!compact || compact.format !== POKEDB_ENCOUNTERS_COMPACT_FORMAT) return null;
+    const strings = compact.strings || {};
+    const rows = compact.rows || {};
+    const offsets = compact.offsets || [];
+
+    const unmask = (table, mask) => {
+        const out = [];
+        for (let i = 0; i < table.length; i++) {
+            if (mask & (1 << i)) out.push(table[i]);
+        }
+        return out;
+    };
+
+    const locations = {};
+    const locationRegions = {};
+    const locationIds = Array.isArray(compact.locations) ? compact.locations : [];
+    for (let i = 0; i < locationIds.length; i++) {
+        const locId = locationIds[i];
+        locationRegions[locId] = strings.regions[compact.locationRegions[i]];
+        const list = new Array(offsets[i + 1] - offsets[i]);
+        for (let j = offsets[i], k = 0; j < offsets[i + 1]; j++, k++) {
+            list[k] = {
+                pokemon: strings.pokemon[rows.pokemon[j]],
+                versions: unmask(strings.versions, rows.versions[j]),
+                method: strings.methods[rows.method[j]],
+                chance: rows.chance[j],
+                minLevel: rows.minLevel[j],
+                maxLevel: rows.maxLevel[j],
+                conditions: unmask(strings.conditions, rows.conditions[j]),
+                area: strings.areas[rows.area[j]]
+            };
+        }
+        locations[locId] = list;
+    }
+
+    const decoded = { _meta: compact._meta, locations, locationRegions };
+    if (Array.isArray(compact.pokemonIds)) {
+        decoded.pokemonIds = {};
+        compact.pokemonIds.forEach((ids, i) => {
+            if (ids) decoded.pokemonIds[strings.pokemon[i]] = ids;
+        });
+    }
+    return decoded;
+}
+
 async function loadPokeDbEncountersIndex() {
     // When opened via file://, browsers often block fetching local JSON.
     // In that case we load the dataset via a plain <script> that sets a global.
     if (window.__POKEDB_ENCOUNTERS_G8G9__) return window.__POKEDB_ENCOUNTERS_G8G9__;
     if (pokedbEncountersIndexPromise) return pokedbEncountersIndexPromise;
-    pokedbEncountersIndexPromise = fetch(POKEDB_ENCOUNTERS_INDEX_URL)
-        .then(r => (r.ok ? r.json() : null))
+    const fromCompactScript = () => loadScriptOnce(POKEDB_ENCOUNTERS_COMPACT_JS_URL)
+        .then(() => decodeCompactPokeDbIndex(window.__POKEDB_ENCOUNTERS_G8G9_COMPACT__))
+        .catch(() => null)
+        .then(idx => idx || loadScriptOnce(POKEDB_ENCOUNTERS_INDEX_JS_URL).then(() => window.__POKEDB_ENCOUNTERS_G8G9__ || null));
+    pokedbEncountersIndexPromise = scheduleFetch(POKEDB_ENCOUNTERS_COMPACT_URL)
+        .then(r => (r.ok ? r.json().then(decodeCompactPokeDbIndex) : null))
+        .then(idx => idx || scheduleFetch(POKEDB_ENCOUNTERS_INDEX_URL).then(r => (r.ok ? r.json() : null)))
+        .catch(fromCompactScript)
         .then(idx => {
             if (idx && !window.__POKEDB_ENCOUNTERS_G8G9__) window.__POKEDB_ENCOUNTERS_G8G9__ = idx;
             return idx;
@@ -1465,6 +2165,174 @@ async function loadPokeDbEncountersIndex() {
     return pokedbEncountersIndexPromise;
 }
 
+// Full-index queries run in js/pokedb-worker.js, so parsing the index and scanning its rows
+// never blocks the page. Under file:// (browsers won't start a worker from a file URL),
+// without Worker support, or once the worker fails, queryPokeDbWorker resolves
+// to undefined and callers use loadPokeDbEncountersIndex() on the main thread instead.
+const POKEDB_WORKER_URL = `${ROOT_PREFIX}js/pokedb-worker.js`;
+let pokedbWorker; // undefined: not started yet; null: unavailable
+const pokedbWorkerCalls = new Map(); // id -> resolve
+let pokedbWorkerSeq = 0;
+
+function getPokeDbWorker() {
+    if (pokedbWorker !== undefined) return pokedbWorker;
+    pokedbWorker = null;
+    if (typeof Worker !== 'function' || window.location.protocol === 'file:') return null;
+    // Already loaded through a <script> global; querying it in place is cheaper than a second copy.
+    if (window.__POKEDB_ENCOUNTERS_G8G9__) return null;
+
+    let worker;
+    try {
+        worker = new Worker(POKEDB_WORKER_URL);
+    } catch {
+        return null;
+    }
+    const failAll = () => {
+        pokedbWorker = null;
+        worker.terminate();
+        for (const resolve of pokedbWorkerCalls.values()) resolve(undefined);
+        pokedbWorkerCalls.clear();
+    };
+    worker.addEventListener('message', (event) => {
+        const { id, result, unavailable } = event.data || {};
+        const resolve = pokedbWorkerCalls.get(id);
+        if (!resolve) return;
+        pokedbWorkerCalls.delete(id);
+        resolve(unavailable ? undefined : result);
+    });
+    worker.addEventListener('error', failAll);
+    const absolute = (url) => new URL(url, window.location.href).href;
+    worker.postMessage({
+        op: 'init',
+        args: { urls: { compact: absolute(POKEDB_ENCOUNTERS_COMPACT_URL), full: absolute(POKEDB_ENCOUNTERS_INDEX_URL) } }
+    });
+    pokedbWorker = worker;
+    return worker;
+}
+
+function queryPokeDbWorker(op, args) {
+    const worker = getPokeDbWorker();
+    if (!worker) return Promise.resolve(undefined);
+    const id = ++pokedbWorkerSeq;
+    return new Promise((resolve) => {
+        pokedbWorkerCalls.set(id, resolve);
+        worker.postMessage({ id, op, args });
+    });
+}
+
+// Loader for a sharded static dataset: <baseUrl>/manifest.json plus <baseUrl>/<kind>/<key>.json.
+// The returned function resolves to the shard object, null when the shard doesn't exist (no data
+// for that key), or undefined when the dataset can't be fetched at all (missing manifest, file://),
+// in which case callers fall back to their unsharded path. Pass manifestReady (a promise for
+// a manifest that vouches for the dataset) to skip fetching <baseUrl>/manifest.json.
+function createShardLoader(baseUrl, manifestReady = null) {
+    let manifestPromise = manifestReady;
+    const cache = new Map(); // "kind/key" -> Promise<shard | null | undefined>
+    return function loadShard(kind, key) {
+        const cacheKey = `${kind}/${key}`;
+        if (cache.has(cacheKey)) return cache.get(cacheKey);
+        if (!manifestPromise) {
+            manifestPromise = scheduleFetch(`${baseUrl}/manifest.json`, { priority: 'high' })
+                .then(r => (r.ok ? r.json() : null))
+                .catch(() => null);
+        }
+        const p = manifestPromise
+            .then(manifest => (manifest ? scheduleFetch(`${baseUrl}/${kind}/${encodeURIComponent(key)}.json`, { priority: 'high' }) : null))
+            .then(r => {
+                if (!r) return undefined;
+                if (r.ok) return r.json();
+                return r.status === 404 ? null : undefined;
+            })
+            .catch(() => undefined);
+        cache.set(cacheKey, p);
+        return p;
+    };
+}
+
+const loadPokeDbShard = createShardLoader(POKEDB_ENCOUNTERS_SHARDS_URL);
+
+// Partitioned multi-generation layout (build_pokedb_encounters.py --config): one sharded index
+// per generation, plus a manifest with a partition bitmask for every location and Pokémon, so
+// a page fetches shards only from the partitions that have its data.
+const POKEDB_PARTITIONS_URL = `${ROOT_PREFIX}data/pokedb-encounters`;
+const POKEDB_PARTITIONS_FORMAT = 'pokedb-encounters-partitions/1';
+const pokedbPartitionShardLoaders = new Map(); // partition id -> shard loader
+let pokedbPartitionsPromise = null;
+
+function loadPokeDbPartitionManifest() {
+    if (!pokedbPartitionsPromise) {
+        pokedbPartitionsPromise = scheduleFetch(`${POKEDB_PARTITIONS_URL}/manifest.json`, { priority: 'high' })
+            .then(r => (r.ok ? r.json() : null))
+            .then(manifest => (manifest?.format === POKEDB_PARTITIONS_FORMAT ? manifest : null))
+            .catch(() => null);
+    }
+    return pokedbPartitionsPromise;
+}
+
+function loadPokeDbPartitionShard(partitionId, kind, key) {
+    if (!pokedbPartitionShardLoaders.has(partitionId)) {
+        const loader = createShardLoader(`${POKEDB_PARTITIONS_URL}/${partitionId}`, loadPokeDbPartitionManifest());
+        pokedbPartitionShardLoaders.set(partitionId, loader);
+    }
+    return pokedbPartitionShardLoaders.get(partitionId)(kind, key);
+}
+
+// Combine one location's (or Pokémon's) shards from several partitions into one shard.
+function mergePokeDbShards(kind, key, shards) {
+    if (shards.length === 1) return shards[0];
+    if (kind === 'locations') {
+        return {
+            location: key,
+            region: shards[0].region,
+            rows: shards.flatMap(s => s.rows || []),
+            pokemonIds: shards.every(s => s.pokemonIds) ? Object.assign({}, ...shards.map(s => s.pokemonIds)) : undefined
+        };
+    }
+    // Each version belongs to one partition, so the per-version lists never overlap.
+    return {
+        pokemon: key,
+        versions: Object.assign({}, ...shards.map(s => s.versions || {})),
+        locationRegions: Object.assign({}, ...shards.map(s => s.locationRegions || {}))
+    };
+}
+
+async function fetchPokeDbShard(kind, key) {
+    if (window.__POKEDB_ENCOUNTERS_G8G9__) return undefined;
+    const manifest = await loadPokeDbPartitionManifest();
+    if (!manifest) return loadPokeDbShard(kind, key);
+
+    const mask = (kind === 'locations' ? manifest.locations : manifest.pokemon)?.[key];
+    if (!mask) return null;
+    const partitions = (manifest.partitions || []).filter((_, i) => mask & (1 << i));
+    const shards = await Promise.all(partitions.map(p => loadPokeDbPartitionShard(p.id, kind, key)));
+    if (shards.some(s => s === undefined)) return undefined;
+    const found = shards.filter(Boolean);
+    return found.length ? mergePokeDbShards(kind, key, found) : null;
+}
+
+// Precomputed reverse indexes (tools/build_reverse_indexes.py):
+// moves/<move>.json, abilities/<ability>.json, pokemon-locations/<pokemon>.json.
+const REVERSE_INDEX_URL = `${ROOT_PREFIX}data/reverse`;
+const fetchReverseIndexShard = createShardLoader(REVERSE_INDEX_URL);
+
+// Per-Pokémon learnset shards (tools/build_learnsets.py): pokemon/<pokemon>.json.
+const LEARNSET_SHARDS_URL = `${ROOT_PREFIX}data/learnsets`;
+const fetchLearnsetShard = createShardLoader(LEARNSET_SHARDS_URL);
+
+// Reverse-index Pokémon records are [id, name, speciesName, speciesId, spriteKey, types, ...].
+// Expand one into the subset of a PokéAPI /pokemon payload that the card renderers read.
+function reverseIndexRecordToPokemonData(rec) {
+    const [id, name, speciesName, speciesId, spriteKey, types] = Array.isArray(rec) ? rec : [];
+    const sprite = /^https?:/.test(String(spriteKey || '')) ? spriteKey : `${POKEMON_SPRITE_BASE}${spriteKey}`;
+    return {
+        id,
+        name,
+        species: { name: speciesName, url: `${API}/pokemon-species/${speciesId}/` },
+        sprites: { other: { home: { front_default: spriteKey ? sprite : null } } },
+        types: (Array.isArray(types) ? types : []).map((t, i) => ({ slot: i + 1, type: { name: t } }))
+    };
+}
+
 async function getPokemonIdByNameCached(pokemonName) {
     const key = String(pokemonName || '').trim().toLowerCase();
     if (!key) return null;
@@ -1476,19 +2344,54 @@ async function getPokemonIdByNameCached(pokemonName) {
     return p;
 }
 
+// name -> Pokémon id for the given names, from the build's resolved ids when present.
+async function resolvePokeDbPokemonIds(names, pokemonIds) {
+    const nameToId = new Map();
+    if (pokemonIds && typeof pokemonIds === 'object') {
+        // Resolved by the build (tools/pokemon_ids.py); names it couldn't resolve are skipped.
+        for (const [name, ids] of Object.entries(pokemonIds)) {
+            if (Number.isFinite(ids?.[0])) nameToId.set(name, ids[0]);
+        }
+    } else {
+        // Older indexes without ids: resolve them with small concurrency.
+        const uniquePokemon = Array.from(new Set(names.filter(Boolean)));
+        const idResults = await promisePool(uniquePokemon, 6, (name) => getPokemonIdByNameCached(name));
+        for (let i = 0; i < uniquePokemon.length; i++) {
+            const id = idResults[i];
+            if (Number.isFinite(id)) nameToId.set(uniquePokemon[i], id);
+        }
+    }
+    return nameToId;
+}
+
 async function fetchPokeDbEncounterRowsForLocation(locationIdentifier) {
-    const idx = await loadPokeDbEncountersIndex();
-    const list = idx?.locations?.[locationIdentifier];
+    const shard = await fetchPokeDbShard('locations', locationIdentifier);
+    let list = shard?.rows;
+    let pokemonIds = shard?.pokemonIds;
+    if (shard === undefined) {
+        // The worker returns the rows already expanded per version.
+        const found = await queryPokeDbWorker('locationRows', { location: locationIdentifier });
+        if (found) {
+            if (found.region) pokedbLocationRegions.set(locationIdentifier, found.region);
+            const nameToId = found.resolved ? null : await resolvePokeDbPokemonIds(found.rows.map(r => r[0]));
+            const rows = [];
+            for (const [pokemonName, id, version, method, chance, minLevel, maxLevel, conditions] of found.rows) {
+                const pokemonId = nameToId ? nameToId.get(pokemonName) : id;
+                if (!Number.isFinite(pokemonId)) continue;
+                rows.push({ pokemonId, pokemonName, version, method, chance, minLevel, maxLevel, conditions });
+            }
+            return rows;
+        }
+        const idx = await loadPokeDbEncountersIndex();
+        list = idx?.locations?.[locationIdentifier];
+        pokemonIds = idx?.pokemonIds;
+    }
     if (!Array.isArray(list) || !list.length) return [];
 
-    const uniquePokemon = Array.from(new Set(list.map(e => String(e?.pokemon || '').toLowerCase()).filter(Boolean)));
-    // Resolve IDs with small concurrency.
-    const idResults = await promisePool(uniquePokemon, 6, (name) => getPokemonIdByNameCached(name));
-    const nameToId = new Map();
-    for (let i = 0; i < uniquePokemon.length; i++) {
-        const id = idResults[i];
-        if (Number.isFinite(id)) nameToId.set(uniquePokemon[i], id);
-    }
+    const nameToId = await resolvePokeDbPokemonIds(
+        list.map(e => String(e?.pokemon || '').toLowerCase()),
+        pokemonIds
+    );
 
     const rows = [];
     for (const e of list) {
@@ -1629,6 +2532,7 @@ async function loadAndRenderLocation(locationNameOrId) {
             if (!r.gen) continue;
             const key = [
                 r.pokemonId,
+                r.pokemonName, // PokeDB forms (unown-a, unown-b, ...) can share one id
                 r.gen,
                 r.method,
                 r.chance,
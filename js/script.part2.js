@@ -4,6 +4,62 @@ const pokemonSpeciesCache = {};
 const pokemonFormCache = {};
 let currentPokemonMoves = {};
 
+// Precomputed grid rows (tools/build_grid_summary.py -> data/grid-summary.json):
+// id -> { id, slug, name, types, sprite, species, speciesId }. When present, grid cards
+// render from it instead of fetching the full /pokemon/{id} payload per card.
+const GRID_SUMMARY_URL = `${ROOT_PREFIX}data/grid-summary.json`;
+const GRID_SUMMARY_FORMAT = 'pokedb-grid-summary/1';
+const NATIONAL_DEX_SIZE = 1025;
+let gridSummary = null;
+let gridSummaryPromise = null;
+
+function decodeGridSummary(raw) {
+    if (!raw || raw.format !== GRID_SUMMARY_FORMAT || !Array.isArray(raw.rows)) return null;
+    const base = raw.spriteBase || POKEMON_SPRITE_BASE;
+    const out = new Map();
+    for (const [id, slug, name, typeIdx, spriteKey, species, speciesId] of raw.rows) {
+        out.set(id, {
+            id,
+            slug,
+            name,
+            types: (typeIdx || []).map(i => raw.types[i]).filter(Boolean),
+            sprite: `${base}${spriteKey || `${id}.png`}`,
+            species: species || slug,
+            speciesId: speciesId || id
+        });
+    }
+    return out;
+}
+
+function loadGridSummary() {
+    if (!gridSummaryPromise) {
+        gridSummaryPromise = scheduleFetch(GRID_SUMMARY_URL, { priority: 'high' })
+            .then(r => (r.ok ? r.json() : null))
+            .then(decodeGridSummary)
+            .catch(() => null)
+            .then(summary => (gridSummary = summary));
+    }
+    return gridSummaryPromise;
+}
+
+function getGridSummaryEntry(id) {
+    return gridSummary ? (gridSummary.get(Number(id)) || null) : null;
+}
+
+// Same list as /pokemon?limit=1025 (ids 1..1025), from the summary when it covers all of them.
+async function fetchNationalPokemonList() {
+    const summary = await loadGridSummary();
+    if (summary) {
+        const list = [];
+        for (let id = 1; id <= NATIONAL_DEX_SIZE && summary.has(id); id++) {
+            list.push({ id, name: summary.get(id).slug });
+        }
+        if (list.length === NATIONAL_DEX_SIZE) return list;
+    }
+    const d = await fetchJsonWithTimeout(`${API}/pokemon?limit=${NATIONAL_DEX_SIZE}`, 15000);
+    return (d?.results || []).map((p, i) => ({ id: i + 1, name: p.name }));
+}
+
 // Tracks the currently selected Pokédex so we can render per-game sprites in the grid.
 let currentPokedexContext = { id: 'all', name: 'All Pokémon' };
 
@@ -274,7 +330,7 @@ function renderLearnsetSectionHtml(pokemonData, learnsetKey) {
     }).join('');
 
     return `
-      <div class="detail-cards-row full learnset-section" data-learnset-key="${learnsetKey}" data-active-gen="${activeGen}" data-pokemon-display="${escapeHtmlAttr(pokemonDisplay)}">
+      <div class="detail-cards-row full learnset-section" data-learnset-key="${learnsetKey}" data-learnset-pokemon="${escapeHtmlAttr(pokemonData?.name || '')}" data-active-gen="${activeGen}" data-pokemon-display="${escapeHtmlAttr(pokemonDisplay)}">
         <div>
           <h3 class="section-header">Moves learned by ${pokemonDisplay}</h3>
           <div class="learnset-genbar">
@@ -417,7 +473,7 @@ function renderLearnsetTableHtml(method, moves, vg) {
             </thead>
             <tbody>
                 ${moves.map(m => `
-                    <tr class="learnset-move-row" data-url="${m.url}" data-method="${method}" data-vg="${vg}">
+                    <tr class="learnset-move-row" data-url="${m.url}" data-move="${m.name}" data-method="${method}" data-vg="${vg}">
                         ${isLevel ? `<td class="learnset-lv">${m.level || 1}</td>` : ''}
                         ${isTM ? `<td class="learnset-tm">-</td>` : ''}
                         <td class="learnset-move">${m.name.replace(/-/g, ' ').replace(/\b\w/g, l => l.toUpperCase())}</td>
@@ -432,22 +488,75 @@ function renderLearnsetTableHtml(method, moves, vg) {
     `;
 }
 
+// "tm05" -> "05", "tr12" -> "12"; other machine items (HMs) keep their uppercased name.
+function formatMachineNumber(itemName) {
+    const match = String(itemName || '').match(/(tm|tr)(\d+)/i);
+    if (!match) return String(itemName || '').toUpperCase();
+    const num = match[2];
+    // Keep leading zeros for display like PokémonDB
+    return num.length >= 2 ? num : num.padStart(2, '0');
+}
+
+function applyLearnsetMoveRow(row, move) {
+    row.querySelector('.type-cell').innerHTML = `<span class="type-tag" style="background:${TYPE_COLORS[move.type]};font-size:10px;padding:2px 6px;">${String(move.type).toUpperCase()}</span>`;
+
+    const catColor = move.damageClass === 'physical' ? '#ff4400' : move.damageClass === 'special' ? '#2266cc' : '#999';
+    const catTitle = move.damageClass.charAt(0).toUpperCase() + move.damageClass.slice(1);
+    row.querySelector('.cat-cell').innerHTML = `<span title="${catTitle}" style="color:${catColor};font-size:18px;line-height:1">●</span>`;
+
+    row.querySelector('.pwr-cell').textContent = move.power || '-';
+    row.querySelector('.acc-cell').textContent = move.accuracy || '-';
+
+    row.style.cursor = 'pointer';
+    row.onclick = () => moveDetail(move.id);
+}
+
+function setLearnsetTmCell(row, itemName) {
+    const tmCell = row.querySelector('.learnset-tm');
+    if (tmCell && itemName) tmCell.textContent = formatMachineNumber(itemName);
+}
+
+// Learnset shard (tools/build_learnsets.py) -> { moves: name -> details, machines: name -> TM item } for one game.
+function getLearnsetShardDetails(shard, vg) {
+    const moves = new Map();
+    for (const [name, id, type, damageClass, power, accuracy] of shard.moves) {
+        if (type && damageClass) moves.set(name, { id, type, damageClass, power, accuracy });
+    }
+    const machineMethod = (shard.methods || []).indexOf('machine');
+    const machines = new Map();
+    for (const [moveIdx, methodIdx, , machine] of (shard.versionGroups?.[vg] || [])) {
+        if (methodIdx === machineMethod && machine) machines.set(shard.moves[moveIdx]?.[0], machine);
+    }
+    return { moves, machines };
+}
+
 async function loadLearnsetMoveDetails(section, vg) {
-    const rows = section.querySelectorAll('.learnset-move-row');
+    // One shard per Pokémon covers every row; rows it doesn't cover fall back to /move and /machine.
+    const shard = await fetchLearnsetShard('pokemon', section.dataset.learnsetPokemon || '');
+    const fromShard = shard && Array.isArray(shard.moves) ? getLearnsetShardDetails(shard, vg) : null;
+
+    // The game tab may have changed while the shard loaded; only touch this game's rows.
+    const rows = Array.from(section.querySelectorAll('.learnset-move-row')).filter(row => row.dataset.vg === vg);
     for (const row of rows) {
         const url = row.dataset.url;
         const id = url.split('/').filter(Boolean).pop();
         const method = row.dataset.method;
 
-        const apply = async (d) => {
-            row.querySelector('.type-cell').innerHTML = `<span class="type-tag" style="background:${TYPE_COLORS[d.type.name]};font-size:10px;padding:2px 6px;">${d.type.name.toUpperCase()}</span>`;
-
-            const catColor = d.damage_class.name === 'physical' ? '#ff4400' : d.damage_class.name === 'special' ? '#2266cc' : '#999';
-            const catTitle = d.damage_class.name.charAt(0).toUpperCase() + d.damage_class.name.slice(1);
-            row.querySelector('.cat-cell').innerHTML = `<span title="${catTitle}" style="color:${catColor};font-size:18px;line-height:1">●</span>`;
+        const known = fromShard?.moves.get(row.dataset.move);
+        if (known) {
+            applyLearnsetMoveRow(row, known);
+            if (method === 'machine') setLearnsetTmCell(row, fromShard.machines.get(row.dataset.move));
+            continue;
+        }
 
-            row.querySelector('.pwr-cell').textContent = d.power || '-';
-            row.querySelector('.acc-cell').textContent = d.accuracy || '-';
+        const apply = async (d) => {
+            applyLearnsetMoveRow(row, {
+                id: d.id,
+                type: d.type.name,
+                damageClass: d.damage_class.name,
+                power: d.power,
+                accuracy: d.accuracy
+            });
 
             // TM number (best-effort via machine endpoint)
             if (method === 'machine') {
@@ -456,32 +565,20 @@ async function loadLearnsetMoveDetails(section, vg) {
                 if (machineUrl) {
                     const machineId = machineUrl.split('/').filter(Boolean).pop();
                     try {
-                        const machine = machineDetailsCache[machineId] || await fetch(machineUrl).then(r => r.json());
+                        const machine = machineDetailsCache[machineId] || await fetchJson(machineUrl);
                         machineDetailsCache[machineId] = machine;
-                        const itemName = machine?.item?.name || '';
-                        const match = itemName.match(/(tm|tr)(\d+)/i);
-                        let tmText = itemName.toUpperCase();
-                        if (match) {
-                            const num = match[2];
-                            // Keep leading zeros for display like PokémonDB
-                            tmText = num.length >= 2 ? num : num.padStart(2, '0');
-                        }
-                        const tmCell = row.querySelector('.learnset-tm');
-                        if (tmCell) tmCell.textContent = tmText;
+                        setLearnsetTmCell(row, machine?.item?.name);
                     } catch (e) {
                         // leave as '-'
                     }
                 }
             }
-
-            row.style.cursor = 'pointer';
-            row.onclick = () => moveDetail(d.id);
         };
 
         if (moveDetailsCache[id]) {
             apply(moveDetailsCache[id]);
         } else {
-            fetch(url).then(r => r.json()).then(d => {
+            fetchJson(url).then(d => {
                 moveDetailsCache[id] = d;
                 apply(d);
             }).catch(() => {});
@@ -504,8 +601,7 @@ async function init() {
     }
 
     try {
-        const d = await fetchJsonWithTimeout(`${API}/pokemon?limit=1025`, 15000);
-        allPokemon = (d?.results || []).map((p, i) => ({ id: i + 1, name: p.name }));
+        allPokemon = await fetchNationalPokemonList();
         pokemon = [...allPokemon];
     } catch (e) {
         console.error(e);
@@ -545,6 +641,7 @@ async function init() {
 }
 
 async function loadPokedex(id, name, triggerEl) {
+  cancelViewRequests();
   currentPokedexContext = { id, name };
 
   // Always keep the Pokédex menu expanded and highlight the selected dex.
@@ -569,11 +666,11 @@ async function loadPokedex(id, name, triggerEl) {
     if (id === 'all') {
       currentPokedexContext = { id: 'all', name: 'All Pokémon' };
       if (allPokemon.length === 0) {
-         allPokemon = await fetch(`${API}/pokemon?limit=1025`).then(r => r.json()).then(d => d.results.map((p, i) => ({ id: i + 1, name: p.name })));
+         allPokemon = await fetchNationalPokemonList();
       }
       pokemon = [...allPokemon];
     } else {
-      const data = await fetch(`${API}/pokedex/${id}`).then(r => r.json());
+      const data = await fetchJson(`${API}/pokedex/${id}`);
       pokemon = data.pokemon_entries.map(e => {
         const urlParts = e.pokemon_species.url.split('/');
         const speciesId = parseInt(urlParts[urlParts.length - 2]);
@@ -633,8 +730,10 @@ function toggleEggGroupMenu(triggerEl) {
 let movesPage = 1;
 const MOVES_PER_PAGE = 50;
 let currentMovesSort = { field: 'name', dir: 'asc' };
+let movesTableView = null;
 
 async function switchPage(page, triggerEl) {
+  if (page !== currentPage) cancelViewRequests();
   currentPage = page;
   document.querySelectorAll('.nav-item').forEach(el => el.classList.remove('active'));
   if (triggerEl) {
@@ -694,7 +793,7 @@ async function switchPage(page, triggerEl) {
     
     if (!allMoves.length) {
       if (movesList) movesList.innerHTML = '<div class="loading">Loading Moves...</div>';
-      const data = await fetch(`${API}/move?limit=1000`).then(r => r.json());
+      const data = await fetchJson(`${API}/move?limit=1000`);
       allMoves = data.results.map(m => ({
         name: m.name,
         id: parseInt(m.url.split('/').filter(Boolean).pop()),
@@ -854,7 +953,7 @@ async function renderMovesTable() {
   const container = document.getElementById('movesTableContainer');
   if (!container) return;
 
-  const html = `
+  container.innerHTML = `
     <table class="main-move-table">
       <thead>
         <tr>
@@ -868,26 +967,28 @@ async function renderMovesTable() {
           <th>Prob. (%)</th>
         </tr>
       </thead>
-      <tbody>
-        ${pageMoves.map(m => {
-          const d = moveDetailsCache[m.id];
-          if (!d) {
-            // Trigger fetch
-            fetchMoveDetails(m.id);
-            return `
-              <tr id="move-row-${m.id}">
-                                                                <td><a class="move-name-link" href="${PAGES_PREFIX}move-detail.html?move=${m.id}">${formatName(m.name)}</a></td>
-                <td colspan="7" style="color:#8b92a5;text-align:center;">Loading...</td>
-              </tr>
-            `;
-          }
-          return renderMoveRow(d);
-        }).join('')}
-      </tbody>
+      <tbody></tbody>
     </table>
   `;
-  
-  container.innerHTML = html;
+
+  // Rows are re-rendered as their details arrive, batched per animation frame.
+  movesTableView = createVirtualList(container.querySelector('tbody'), {
+    keyOf: m => m.id,
+    renderItem: m => (moveDetailsCache[m.id] ? renderMoveRow(moveDetailsCache[m.id]) : renderMoveLoadingRow(m)),
+    onRender: (row, m) => {
+      if (!moveDetailsCache[m.id]) fetchMoveDetails(m.id);
+    }
+  });
+  movesTableView.setItems(pageMoves);
+}
+
+function renderMoveLoadingRow(m) {
+  return `
+    <tr id="move-row-${m.id}">
+                                                    <td><a class="move-name-link" href="${PAGES_PREFIX}move-detail.html?move=${m.id}">${formatName(m.name)}</a></td>
+      <td colspan="7" style="color:#8b92a5;text-align:center;">Loading...</td>
+    </tr>
+  `;
 }
 
 function renderMoveRow(d) {
@@ -912,32 +1013,25 @@ function renderMoveRow(d) {
 async function fetchMoveDetails(id) {
   if (moveDetailsCache[id]) return;
   try {
-    const d = await fetch(`${API}/move/${id}`).then(r => r.json());
+    const d = await fetchJson(`${API}/move/${id}`, { cancelOnNavigate: true });
     moveDetailsCache[id] = d;
-    // Update row if visible
-    const row = document.getElementById(`move-row-${id}`);
-    if (row) {
-      row.outerHTML = renderMoveRow(d);
-    }
+    // Update the row if it is on the current page
+    if (movesTableView) movesTableView.refreshKey(id);
   } catch (e) {
     console.error(e);
   }
 }
 
 async function fetchMoveDetailsBatch(movesList) {
-  const BATCH_SIZE = 20;
-  for (let i = 0; i < movesList.length; i += BATCH_SIZE) {
-    const batch = movesList.slice(i, i + BATCH_SIZE);
-    await Promise.all(batch.map(m => fetchMoveDetails(m.id)));
-    
+  // scheduleFetch() caps concurrency, so queue everything and report progress as each lands.
+  let remaining = movesList.length;
+  await Promise.all(movesList.map(m => fetchMoveDetails(m.id).then(() => {
+    remaining--;
     const container = document.getElementById('movesTableContainer');
-    if (container) {
-        const remaining = movesList.length - Math.min(i + BATCH_SIZE, movesList.length);
-        if (remaining > 0) {
-            container.innerHTML = `<div class="loading">Loading move details... (${remaining} remaining)</div>`;
-        }
+    if (container && remaining > 0 && remaining % 10 === 0) {
+        container.innerHTML = `<div class="loading">Loading move details... (${remaining} remaining)</div>`;
     }
-  }
+  })));
 }
 
 const NAME_OVERRIDES = {
@@ -1099,7 +1193,7 @@ const grid = document.getElementById('grid');
 
 if (c !== 'all' && !damageClassCache[c]) {
     grid.innerHTML = '<div class="loading">Fetching category data...</div>';
-    const data = await fetch(`${API}/move-damage-class/${c}`).then(r => r.json());
+    const data = await fetchJson(`${API}/move-damage-class/${c}`);
     damageClassCache[c] = new Set(data.moves.map(m => m.name));
 }
 
@@ -1113,28 +1207,18 @@ const grid = document.getElementById('grid');
 if (currentPage === 'pokedex') {
     let filtered = pokemon.filter(p => p.name.includes(search) || p.id.toString().includes(search));
     
-    if (!filtered.length) {
-    grid.innerHTML = '';
-    document.getElementById('empty').style.display = 'block';
-    return;
+    document.getElementById('empty').style.display = filtered.length ? 'none' : 'block';
+    // Types for cards the grid summary doesn't cover are fetched as the cards scroll into view.
+    const view = createVirtualList(grid, {
+    keyOf: p => p.id,
+    renderItem: renderPokedexCard,
+    onRender: (card, p) => {
+        if (!getPokedexCardTypes(p) && !pokedexCardErrors.has(p.id)) {
+        loadPokedexCardDetails(p.id).then(() => view.refreshKey(p.id));
+        }
     }
-    
-    document.getElementById('empty').style.display = 'none';
-    grid.innerHTML = filtered.map(p => `
-    <div class="card" id="card-${p.id}" data-action="open-pokemon" data-pokemon-id="${p.id}" data-dex-id="${p.dexId || ''}">
-        <div class="card-header">
-      <div class="card-name">${formatName(getGridBaseSpeciesSlug(p) || p.name)}</div>
-        <div class="card-id">#${String(p.dexId || p.id).padStart(3, '0')}</div>
-        </div>
-        <div class="card-image">
-        <img src="${getPokedexSpriteUrl(p.id, currentPokedexContext)}" alt="${p.name}" onerror="this.onerror=null;this.src='https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/${p.id}.png'">
-        </div>
-        <div class="card-types">${p.types ? p.types.map(t => `<span class="type-tag" style="background: ${TYPE_COLORS[t]}">${t}</span>`).join('') : '<span class="loading-small" style="font-size:10px">...</span>'}</div>
-    </div>
-    `).join('');
-    
-    // Lazy load types for each card
-    fetchPokedexTypes(filtered);
+    });
+    view.setItems(filtered);
 } else if (currentPage === 'moves') {
     let filtered = moves;
     
@@ -1146,42 +1230,71 @@ if (currentPage === 'pokedex') {
     // Apply search
     filtered = filtered.filter(m => m.name.includes(search));
     
-    if (!filtered.length) {
-    grid.innerHTML = '';
-    document.getElementById('empty').style.display = 'block';
-    return;
-    }
-    
-    document.getElementById('empty').style.display = 'none';
-    grid.innerHTML = filtered.map(m => `
+    document.getElementById('empty').style.display = filtered.length ? 'none' : 'block';
+    createVirtualList(grid, { keyOf: m => m.id, renderItem: renderMoveCard, onRender: null }).setItems(filtered);
+}
+}
+
+function renderMoveCard(m) {
+    return `
     <div class="card" data-action="open-move" data-move-id="${m.id}" style="height: auto; min-height: 100px; display: flex; flex-direction: column; justify-content: center;">
         <div class="card-header" style="margin-bottom: 0;">
         <div class="card-name" style="font-size: 14px;">${m.name.replace(/-/g, ' ').replace(/\b\w/g, l => l.toUpperCase())}</div>
         ${m.type ? `<span class="type-tag" style="background: ${TYPE_COLORS[m.type]}">${m.type}</span>` : ''}
         </div>
     </div>
-    `).join('');
+    `;
 }
+
+// Pokédex card from whatever is known about the entry: the grid summary, or the full
+// /pokemon payload once loadPokedexCardDetails() has fetched it.
+const pokedexCardErrors = new Set();
+const pokedexCardRequests = new Map(); // id -> Promise
+
+function getPokedexCardTypes(p) {
+    const details = pokemonDetailsCache[p.id];
+    return p.types || getGridSummaryEntry(p.id)?.types || details?.types?.map(t => t.type.name) || null;
 }
 
-function fetchPokedexTypes(pokemonList) {
-    const observer = new IntersectionObserver((entries, obs) => {
-        entries.forEach(entry => {
-            if (entry.isIntersecting) {
-                const card = entry.target;
-                const id = card.id.replace('card-', '');
-                fetchPokemonTypeForCard(id, card);
-                obs.unobserve(card);
-            }
-        });
-    }, { rootMargin: '200px' }); // Preload 200px before view
+function renderPokedexCard(p) {
+    const summary = getGridSummaryEntry(p.id);
+    const details = pokemonDetailsCache[p.id];
+    const types = getPokedexCardTypes(p);
+    // Species slug / species id once known; regional dex numbers (p.dexId) are never overridden.
+    const name = summary ? summary.name : formatName(details?.species?.name || getGridBaseSpeciesSlug(p) || p.name);
+    const number = p.dexId || summary?.speciesId || getSpeciesIdFromUrl(details?.species?.url) || p.id;
+    let typesHtml = '<span class="loading-small" style="font-size:10px">...</span>';
+    if (types) typesHtml = types.map(t => `<span class="type-tag" style="background: ${TYPE_COLORS[t]}">${t}</span>`).join('');
+    else if (pokedexCardErrors.has(p.id)) typesHtml = '<span class="error">Err</span>';
+    return `
+    <div class="card" id="card-${p.id}" data-action="open-pokemon" data-pokemon-id="${p.id}" data-dex-id="${p.dexId || ''}"${summary || details ? ' data-loaded="true"' : ''}>
+        <div class="card-header">
+      <div class="card-name">${name}</div>
+        <div class="card-id">#${String(number).padStart(3, '0')}</div>
+        </div>
+        <div class="card-image">
+        <img src="${getPokedexSpriteUrl(p.id, currentPokedexContext)}" alt="${p.name}" onerror="this.onerror=null;this.src='${summary ? summary.sprite : `https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/${p.id}.png`}'">
+        </div>
+        <div class="card-types">${typesHtml}</div>
+    </div>
+    `;
+}
 
-    pokemonList.forEach(p => {
-        if (!p.types) {  // Only observe if types aren't already loaded
-            const card = document.getElementById(`card-${p.id}`);
-            if (card) observer.observe(card);
-        }
-    });
+function loadPokedexCardDetails(id) {
+    if (!pokedexCardRequests.has(id)) {
+        const request = fetchJson(`${API}/pokemon/${id}`, { priority: 'high', cancelOnNavigate: true })
+            .then(pData => {
+                pokemonDetailsCache[id] = pData; // Cache full data
+            })
+            .catch(e => {
+                pokedexCardRequests.delete(id);
+                if (e?.name === 'AbortError') return;
+                console.error(`Error fetching details for ${id}`, e);
+                pokedexCardErrors.add(id);
+            });
+        pokedexCardRequests.set(id, request);
+    }
+    return pokedexCardRequests.get(id);
 }
 
 // In the Pokédex grid, show the base species name (PokemonDB-style).
@@ -1223,58 +1336,6 @@ function getGridBaseSpeciesSlug(p) {
   return looksLikeForm ? parts[0] : raw;
 }
 
-function updatePokedexCardHeaderFromPokemonData(card, pData) {
-  if (!card || !pData) return;
-
-  // Update display name to base species.
-  const speciesSlug = pData?.species?.name;
-  if (speciesSlug) {
-    const nameEl = card.querySelector('.card-name');
-    if (nameEl) nameEl.textContent = formatName(speciesSlug);
-  }
-
-  // For lists that come from /pokemon (forms), prefer the species id as the National Dex number.
-  // Do NOT override regional dex entry numbers.
-  const dexIdAttr = String(card.getAttribute('data-dex-id') || '').trim();
-  if (!dexIdAttr) {
-    const speciesUrl = String(pData?.species?.url || '');
-    const m = speciesUrl.match(/\/pokemon-species\/(\d+)\/?$/);
-    if (m) {
-      const dexNum = parseInt(m[1], 10);
-      if (Number.isFinite(dexNum)) {
-        const idEl = card.querySelector('.card-id');
-        if (idEl) idEl.textContent = `#${String(dexNum).padStart(3, '0')}`;
-      }
-    }
-  }
-}
-
-async function fetchPokemonTypeForCard(id, card) {
-    if (card.dataset.loaded) return;
-    card.dataset.loaded = 'true';
-    
-    try {
-        if (pokemonDetailsCache[id]) {
-        const img = card.querySelector('img');
-        if (img) img.src = getPokedexSpriteUrl(id, currentPokedexContext);
-        updatePokedexCardHeaderFromPokemonData(card, pokemonDetailsCache[id]);
-            renderTypes(card, pokemonDetailsCache[id].types);
-            return;
-        }
-
-        const pData = await fetch(`${API}/pokemon/${id}`).then(r => r.json());
-        pokemonDetailsCache[id] = pData; // Cache full data
-        const img = card.querySelector('img');
-        if (img) img.src = getPokedexSpriteUrl(id, currentPokedexContext);
-        updatePokedexCardHeaderFromPokemonData(card, pData);
-        renderTypes(card, pData.types);
-    } catch (e) {
-        console.error(`Error fetching details for ${id}`, e);
-        const typeContainer = card.querySelector('.card-types');
-        if (typeContainer) typeContainer.innerHTML = '<span class="error">Err</span>';
-    }
-}
-
 function moveDetail(id) {
     window.location.href = `${PAGES_PREFIX}move-detail.html?move=${id}`;
 }
@@ -1294,7 +1355,7 @@ if (currentPage === 'pokedex') {
     pokemon = [...allPokemon];
     } else {
     if (!typeCache[filter]) {
-        const data = await fetch(`${API}/type/${filter}`).then(r => r.json());
+        const data = await fetchJson(`${API}/type/${filter}`);
         // Cache both pokemon and moves for this type
         typeCache[filter] = {
         pokemon: data.pokemon.map(p => ({
@@ -1314,7 +1375,7 @@ if (currentPage === 'pokedex') {
     moves = [...allMoves];
     } else {
     if (!typeCache[filter]) {
-        const data = await fetch(`${API}/type/${filter}`).then(r => r.json());
+        const data = await fetchJson(`${API}/type/${filter}`);
         typeCache[filter] = {
         pokemon: data.pokemon.map(p => ({
             id: parseInt(p.pokemon.url.split('/').filter(Boolean).pop()),
@@ -1333,7 +1394,7 @@ render();
 }
 
 async function detail(id) {
-const d = await fetch(`${API}/pokemon/${id}`).then(r => r.json());
+const d = await fetchJson(`${API}/pokemon/${id}`);
 const name = formatName(d.name);
 document.getElementById('modalTitle').textContent = name;
 
@@ -1510,7 +1571,7 @@ for (const row of rows) {
     if (moveDetailsCache[id]) {
     updateRow(row, moveDetailsCache[id]);
     } else {
-    fetch(url).then(r => r.json()).then(d => {
+    fetchJson(url).then(d => {
         moveDetailsCache[id] = d;
         updateRow(row, d);
     }).catch(e => console.error(e));
@@ -1547,7 +1608,7 @@ grid.innerHTML = `<div class="loading">Fetching Pokémon with ability: ${ability
 document.querySelectorAll('.type-btn').forEach(b => b.classList.remove('active'));
 
 try {
-    const data = await fetch(`${API}/ability/${abilityName}`).then(r => r.json());
+    const data = await fetchJson(`${API}/ability/${abilityName}`);
     pokemon = data.pokemon.map(p => {
     const id = parseInt(p.pokemon.url.split('/').filter(Boolean).pop());
     return { id: id, name: p.pokemon.name };
@@ -185,19 +185,22 @@ async function loadPokemonDetails(id) {
         </div>
     `;
 
+    // Loaded alongside the Pokémon; replaces the /evolution-chain request when present.
+    const evolutionGraphReady = loadEvolutionGraph();
+
     try {
-        const pokemonRes = await fetch(`${API}/pokemon/${id}`);
-        if (!pokemonRes.ok) throw new Error(`Pokemon not found: ${id}`);
-        const pokemonData = await pokemonRes.json();
+        const pokemonData = await fetchJson(`${API}/pokemon/${id}`).catch(() => {
+            throw new Error(`Pokemon not found: ${id}`);
+        });
 
         // IMPORTANT: pokemon "id" and species "id" diverge for alternate forms.
         // Always resolve species from the pokemon payload.
         const speciesUrl = pokemonData?.species?.url;
         if (!speciesUrl) throw new Error('Species URL missing');
 
-        const speciesRes = await fetch(speciesUrl);
-        if (!speciesRes.ok) throw new Error('Species not found');
-        const speciesData = await speciesRes.json();
+        const speciesData = await fetchJson(speciesUrl).catch(() => {
+            throw new Error('Species not found');
+        });
 
         // Fill missing Gen 7–9 dex entries using GraphQL-Pokemon.
         // (PokeAPI is missing a lot of Gen 9 flavor texts.)
@@ -217,12 +220,13 @@ async function loadPokemonDetails(id) {
             console.warn('GraphQL-Pokemon dex fallback failed:', e);
         }
 
-        const evolutionData = await fetch(speciesData.evolution_chain.url).then(r => r.json());
+        const evolutionData = buildEvolutionChainFromGraph(await evolutionGraphReady, speciesData.name)
+            || await fetchJson(speciesData.evolution_chain.url);
         
         // Fetch all varieties (forms) for this species
         const varieties = speciesData.varieties || [];
         const formsData = await Promise.all(
-            varieties.map(v => fetch(v.pokemon.url).then(r => r.json()).catch(() => null))
+            varieties.map(v => fetchJson(v.pokemon.url).catch(() => null))
         );
         
         renderPokemonDetail(pokemonData, speciesData, evolutionData, formsData.filter(f => f));
@@ -621,9 +625,8 @@ function renderPokemonDetail(p, species, evo, allForms = []) {
         async function hydrateSpeciesForPokemon(pokemonData) {
             const url = pokemonData?.species?.url;
             if (!url) return null;
-            const res = await fetch(url);
-            if (!res.ok) return null;
-            const speciesData = await res.json();
+            const speciesData = await fetchJson(url).catch(() => null);
+            if (!speciesData) return null;
 
             // Ensure Gen 7-9 entries are filled for this species (same approach as loadPokemonDetails).
             try {
@@ -643,9 +646,11 @@ function renderPokemonDetail(p, species, evo, allForms = []) {
             return speciesData;
         }
 
+        // Hydrate every form up front so their GraphQL fallbacks share one batched request.
+        const formSpeciesList = await Promise.all(relevantForms.map(hydrateSpeciesForPokemon));
         for (let idx = 0; idx < relevantForms.length; idx++) {
             const form = relevantForms[idx];
-            const formSpecies = (await hydrateSpeciesForPokemon(form)) || species;
+            const formSpecies = formSpeciesList[idx] || species;
             const formDerived = buildSpeciesDerived(formSpecies, form);
 
             const formAbilities = form.abilities.map(a => 
@@ -733,8 +738,7 @@ function setupPokemonDetailNavigation(p) {
     
     const fetchName = async (id, elementId) => {
         try {
-            const res = await fetch(`${API}/pokemon/${id}`);
-            const data = await res.json();
+            const data = await fetchJson(`${API}/pokemon/${id}`);
             const el = document.querySelector(`#${elementId} .nav-name`);
             if (el) {
                 el.textContent = formatName(data?.species?.name || data?.name);
@@ -1266,9 +1270,8 @@ function renderEvolutionChain(chain) {
         const key = String(identifier);
         if (pokemonFormCache && pokemonFormCache[key]) return pokemonFormCache[key];
         try {
-            const res = await fetch(`${API}/pokemon-form/${encodeURIComponent(key)}`);
-            if (!res.ok) return null;
-            const data = await res.json();
+            const data = await fetchJson(`${API}/pokemon-form/${encodeURIComponent(key)}`).catch(() => null);
+            if (!data) return null;
             if (pokemonFormCache) pokemonFormCache[key] = data;
             return data;
         } catch {
@@ -1582,8 +1585,7 @@ function renderEvolutionChain(chain) {
         let pokemonData = pokemonDetailsCache[speciesId];
         if (!pokemonData) {
             try {
-                const response = await fetch(`${API}/pokemon/${speciesId}`);
-                pokemonData = await response.json();
+                pokemonData = await fetchJson(`${API}/pokemon/${speciesId}`);
                 pokemonDetailsCache[speciesId] = pokemonData;
             } catch (e) {
                 console.error(`Error fetching pokemon ${speciesId}:`, e);
@@ -1600,8 +1602,7 @@ function renderEvolutionChain(chain) {
         const cached = pokemonDetailsCache[key];
         if (cached) return cached;
         try {
-            const response = await fetch(`${API}/pokemon/${encodeURIComponent(key)}`);
-            const data = await response.json();
+            const data = await fetchJson(`${API}/pokemon/${encodeURIComponent(key)}`);
             pokemonDetailsCache[key] = data;
             return data;
         } catch (e) {
@@ -1617,8 +1618,7 @@ function renderEvolutionChain(chain) {
         if (pokemonSpeciesCache[speciesId]) return pokemonSpeciesCache[speciesId];
 
         try {
-            const res = await fetch(node.species.url);
-            const speciesData = await res.json();
+            const speciesData = await fetchJson(node.species.url);
             const out = {};
             for (const v of (speciesData.varieties || [])) {
                 const name = v?.pokemon?.name;
@@ -1645,12 +1645,11 @@ function renderEvolutionChain(chain) {
         if (pikachuCapsBySpeciesUrl.has(url)) return pikachuCapsBySpeciesUrl.get(url);
 
         try {
-            const res = await fetch(url);
-            if (!res.ok) {
+            const speciesData = await fetchJson(url).catch(() => null);
+            if (!speciesData) {
                 pikachuCapsBySpeciesUrl.set(url, []);
                 return [];
             }
-            const speciesData = await res.json();
             const caps = (speciesData.varieties || [])
                 .map(v => v?.pokemon?.name)
                 .filter(Boolean)
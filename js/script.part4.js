@@ -1,4 +1,4 @@
-// Egg Group Page Logic
+// ========== Egg Group Page ==========
 async function initEggGroupPage() {
     console.log('Initializing egg group page...');
     
@@ -19,7 +19,7 @@ async function loadEggGroupList() {
     const currentGroup = new URLSearchParams(window.location.search).get('group') || 'monster';
 
     try {
-        const data = await fetch(`${API}/egg-group`).then(r => r.json());
+        const data = await fetchJson(`${API}/egg-group`);
         
         // Sort alphabetically by display name
         const sorted = data.results.sort((a, b) => {
@@ -40,8 +40,9 @@ async function loadEggGroupList() {
         // Fetch counts in background (don't block UI)
         sorted.forEach(async (g) => {
             try {
-                const response = await fetch(`${API}/egg-group/${g.name}`, {
-                    headers: { 'Cache-Control': 'no-cache' }
+                const response = await scheduleFetch(`${API}/egg-group/${g.name}`, {
+                    init: { headers: { 'Cache-Control': 'no-cache' } },
+                    priority: 'low'
                 });
                 const groupData = await response.json();
                 const count = groupData.pokemon_species ? groupData.pokemon_species.length : 0;
@@ -91,8 +92,9 @@ async function loadEggGroupDetail(groupName) {
 
     try {
         console.log('Fetching data for:', apiGroupName);
-        const response = await fetch(`${API}/egg-group/${apiGroupName}`, {
-            headers: { 'Cache-Control': 'no-cache' }
+        const response = await scheduleFetch(`${API}/egg-group/${apiGroupName}`, {
+            init: { headers: { 'Cache-Control': 'no-cache' } },
+            priority: 'high'
         });
         const data = await response.json();
         console.log('Received data for:', apiGroupName, 'count:', data.pokemon_species?.length);
@@ -148,7 +150,9 @@ async function loadEggGroupDetail(groupName) {
     }
 }
 
-function fetchEggGroupTypes(speciesList) {
+async function fetchEggGroupTypes(speciesList) {
+    // Cards covered by the grid summary get their types at once; only the rest are fetched lazily.
+    await loadGridSummary();
     const observer = new IntersectionObserver((entries, obs) => {
         entries.forEach(entry => {
             if (entry.isIntersecting) {
@@ -163,7 +167,14 @@ function fetchEggGroupTypes(speciesList) {
     speciesList.forEach(s => {
         const id = parseInt(s.url.split('/').filter(Boolean).pop());
         const card = document.getElementById(`card-${id}`);
-        if (card) observer.observe(card);
+        if (!card) return;
+        const summary = getGridSummaryEntry(id);
+        if (summary) {
+            card.dataset.loaded = 'true';
+            renderTypes(card, summary.types.map(name => ({ type: { name } })));
+        } else {
+            observer.observe(card);
+        }
     });
 }
 
@@ -177,7 +188,7 @@ async function fetchPokemonType(id, card) {
              return;
         }
 
-        const pData = await fetch(`${API}/pokemon/${id}`).then(r => r.json());
+        const pData = await fetchJson(`${API}/pokemon/${id}`, { priority: 'high' });
         pokemonDetailsCache[id] = pData; // Cache full data
         renderTypes(card, pData.types);
     } catch (e) {
@@ -187,16 +198,6 @@ async function fetchPokemonType(id, card) {
     }
 }
 
-function renderTypes(card, types) {
-    const typeContainer = card.querySelector('.card-types');
-    if (!typeContainer) return;
-    
-    const typesHtml = types.map(t => 
-        `<span class="type-tag" style="background: ${TYPE_COLORS[t.type.name]}">${t.type.name}</span>`
-    ).join('');
-    typeContainer.innerHTML = typesHtml;
-}
-
 // ========== Items Page ==========
 let allItems = [];
 let currentItemsView = 'grid';
@@ -204,7 +205,6 @@ let itemCategoryByName = {};
 let allItemCategories = [];
 const itemDetailsCache = {};
 const itemDetailsInFlight = {};
-let itemDescObserver = null;
 
 function getIdFromApiUrl(url) {
     const raw = String(url || '');
@@ -352,9 +352,7 @@ async function fetchItemDetailByName(itemName) {
 
     itemDetailsInFlight[name] = (async () => {
         try {
-            const res = await fetch(`${API}/item/${encodeURIComponent(name)}`);
-            if (!res.ok) throw new Error(`HTTP ${res.status} for item/${name}`);
-            const detail = await res.json();
+            const detail = await fetchJson(`${API}/item/${encodeURIComponent(name)}`);
             itemDetailsCache[name] = detail;
             return detail;
         } catch (e) {
@@ -369,48 +367,10 @@ async function fetchItemDetailByName(itemName) {
     return itemDetailsInFlight[name];
 }
 
-function ensureItemDescObserver() {
-    if (itemDescObserver) return itemDescObserver;
-
-    itemDescObserver = new IntersectionObserver(async (entries, obs) => {
-        for (const entry of entries) {
-            if (!entry.isIntersecting) continue;
-            const row = entry.target;
-            const name = row?.dataset?.itemName;
-            if (!name) {
-                obs.unobserve(row);
-                continue;
-            }
-
-            // Avoid refetching if we already have description.
-            const cached = itemDetailsCache[String(name).toLowerCase()];
-            if (cached && getEnglishItemDescription(cached)) {
-                obs.unobserve(row);
-                continue;
-            }
-
-            const detail = await fetchItemDetailByName(name);
-            const desc = detail ? getEnglishItemDescription(detail) : '';
-
-            // Update all visible rows with this item name (in case of re-renders)
-            document.querySelectorAll(`.item-row[data-item-name="${CSS.escape(String(name).toLowerCase())}"] .item-desc`).forEach(el => {
-                el.textContent = desc || '—';
-                el.classList.remove('loading');
-            });
-
-            obs.unobserve(row);
-        }
-    }, { rootMargin: '400px' });
-
-    return itemDescObserver;
-}
-
 async function loadItemCategoryMap() {
     // Build a name -> category map using item-category endpoints.
     // This avoids N+1 item detail requests just to get categories.
-    const res = await fetch(`${API}/item-category?limit=1000`);
-    if (!res.ok) throw new Error(`HTTP ${res.status} while loading item categories`);
-    const data = await res.json();
+    const data = await fetchJson(`${API}/item-category?limit=1000`);
     const cats = Array.isArray(data?.results) ? data.results : [];
 
     const byName = {};
@@ -428,9 +388,8 @@ async function loadItemCategoryMap() {
             if (!catName || !url) continue;
 
             try {
-                const detailRes = await fetch(url);
-                if (!detailRes.ok) continue;
-                const detail = await detailRes.json();
+                const detail = await fetchJson(url).catch(() => null);
+                if (!detail) continue;
                 catList.push({ name: catName, display: formatItemCategoryDisplayName(catName) });
 
                 const items = Array.isArray(detail?.items) ? detail.items : [];
@@ -486,71 +445,79 @@ function renderItems() {
 
     // Render grid
     if (currentItemsView === 'grid') {
-        grid.innerHTML = items.map(it => {
-            const name = formatItemDisplayName(it.name);
-            const id = it.id != null ? it.id : '';
-            const sprite = getItemSpriteUrl(it.name);
-            const catName = it.categoryDisplay || '';
-            return `
-                <div class="card item-card" data-action="open-item" data-item-name="${String(it.name || '').toLowerCase()}">
-                    <div class="item-card-top">
-                        <div class="item-name">${name}</div>
-                        <div class="item-id">${id ? ('#' + id) : ''}</div>
-                    </div>
-                    <div style="display:flex;justify-content:center;align-items:center;min-height:56px;">
-                        <img class="item-icon" data-item-sprite-name="${String(it.name || '').toLowerCase()}" src="${sprite}" alt="${name}" onerror="handleItemImgError(this)">
-                    </div>
-                    ${catName ? `<div class="item-id">${catName}</div>` : ''}
-                </div>
-            `;
-        }).join('');
+        createVirtualList(grid, { renderItem: renderItemCard }).setItems(items);
     }
 
     // Render list
     if (currentItemsView === 'list') {
-        const header = `
-            <div class="items-list-header">
-                <div class="muted">&nbsp;</div>
-                <div>Name</div>
-                <div>Category</div>
-                <div>Description</div>
-            </div>
-        `;
-
-        const rows = items.map(it => {
-            const rawName = String(it.name || '').toLowerCase();
-            const name = formatItemDisplayName(rawName);
-            const sprite = getItemSpriteUrl(rawName);
-            const category = it.categoryDisplay || '—';
-
-            const cached = itemDetailsCache[rawName];
-            const desc = cached ? (getEnglishItemDescription(cached) || '—') : 'Loading...';
-            const descClass = cached ? 'item-desc' : 'item-desc loading';
-
-            return `
-                <div class="item-row" data-action="open-item" data-item-name="${rawName}">
-                    <img class="item-icon" data-item-sprite-name="${rawName}" src="${sprite}" alt="" onerror="handleItemImgError(this)">
-                    <div class="item-name">${name}</div>
-                    <div class="item-category">${category}</div>
-                    <div class="${descClass}">${desc}</div>
+        let rows = list.querySelector('.items-list-rows');
+        if (!rows) {
+            list.innerHTML = `
+                <div class="items-list-header">
+                    <div class="muted">&nbsp;</div>
+                    <div>Name</div>
+                    <div>Category</div>
+                    <div>Description</div>
                 </div>
+                <div class="items-list-rows"></div>
             `;
-        }).join('');
-
-        list.innerHTML = header + rows;
+            rows = list.querySelector('.items-list-rows');
+        }
 
-        // Lazy-load descriptions for visible rows.
-        const obs = ensureItemDescObserver();
-        list.querySelectorAll('.item-row').forEach(row => {
-            const n = row.dataset.itemName;
-            if (!n) return;
-            const cached = itemDetailsCache[String(n).toLowerCase()];
-            const hasDesc = cached && getEnglishItemDescription(cached);
-            if (!hasDesc) obs.observe(row);
+        // Descriptions are fetched as rows scroll into view.
+        const view = createVirtualList(rows, {
+            keyOf: it => String(it.name || '').toLowerCase(),
+            renderItem: renderItemRow,
+            onRender: (row, it) => {
+                const rawName = String(it.name || '').toLowerCase();
+                if (rawName && !(rawName in itemDetailsCache)) {
+                    fetchItemDetailByName(rawName).then(() => view.refreshKey(rawName));
+                }
+            }
         });
+        view.setItems(items);
     }
 }
 
+function renderItemCard(it) {
+    const name = formatItemDisplayName(it.name);
+    const id = it.id != null ? it.id : '';
+    const sprite = getItemSpriteUrl(it.name);
+    const catName = it.categoryDisplay || '';
+    return `
+        <div class="card item-card" data-action="open-item" data-item-name="${String(it.name || '').toLowerCase()}">
+            <div class="item-card-top">
+                <div class="item-name">${name}</div>
+                <div class="item-id">${id ? ('#' + id) : ''}</div>
+            </div>
+            <div style="display:flex;justify-content:center;align-items:center;min-height:56px;">
+                <img class="item-icon" data-item-sprite-name="${String(it.name || '').toLowerCase()}" src="${sprite}" alt="${name}" onerror="handleItemImgError(this)">
+            </div>
+            ${catName ? `<div class="item-id">${catName}</div>` : ''}
+        </div>
+    `;
+}
+
+function renderItemRow(it) {
+    const rawName = String(it.name || '').toLowerCase();
+    const name = formatItemDisplayName(rawName);
+    const sprite = getItemSpriteUrl(rawName);
+    const category = it.categoryDisplay || '—';
+
+    const loaded = rawName in itemDetailsCache;
+    const desc = loaded ? (getEnglishItemDescription(itemDetailsCache[rawName]) || '—') : 'Loading...';
+    const descClass = loaded ? 'item-desc' : 'item-desc loading';
+
+    return `
+        <div class="item-row" data-action="open-item" data-item-name="${rawName}">
+            <img class="item-icon" data-item-sprite-name="${rawName}" src="${sprite}" alt="" onerror="handleItemImgError(this)">
+            <div class="item-name">${name}</div>
+            <div class="item-category">${category}</div>
+            <div class="${descClass}">${desc}</div>
+        </div>
+    `;
+}
+
 // ========== Item Detail Page ==========
 function getItemParam() {
     const params = new URLSearchParams(window.location.search);
@@ -817,9 +784,7 @@ async function initItemDetailPage() {
     root.innerHTML = '<div class="empty">Loading item...</div>';
 
     try {
-        const res = await fetch(`${API}/item/${encodeURIComponent(key)}`);
-        if (!res.ok) throw new Error(`HTTP ${res.status} while loading item`);
-        const detail = await res.json();
+        const detail = await fetchJson(`${API}/item/${encodeURIComponent(key)}`);
         renderItemDetail(detail);
     } catch (e) {
         console.error(e);
@@ -827,16 +792,6 @@ async function initItemDetailPage() {
     }
 }
 
-// Simple HTML escaper for detail rendering.
-function escapeHtml(s) {
-    return String(s || '')
-        .replace(/&/g, '&amp;')
-        .replace(/</g, '&lt;')
-        .replace(/>/g, '&gt;')
-        .replace(/"/g, '&quot;')
-        .replace(/'/g, '&#39;');
-}
-
 async function initItemsPage() {
     const grid = document.getElementById('itemsGrid');
     const list = document.getElementById('itemsList');
@@ -867,14 +822,11 @@ async function initItemsPage() {
     list.innerHTML = '<div class="empty">Loading items...</div>';
 
     try {
-        const [itemsRes, catMapRes] = await Promise.all([
-            fetch(`${API}/item?limit=5000`),
+        const [data, catMapRes] = await Promise.all([
+            fetchJson(`${API}/item?limit=5000`),
             loadItemCategoryMap()
         ]);
 
-        if (!itemsRes.ok) throw new Error(`HTTP ${itemsRes.status} while loading items`);
-        const data = await itemsRes.json();
-
         itemCategoryByName = catMapRes.byName || {};
         allItemCategories = Array.isArray(catMapRes.categories) ? catMapRes.categories : [];
         populateItemsCategorySelect();
@@ -920,14 +872,10 @@ async function loadAbilitiesPage() {
         tableBody.innerHTML = '<tr><td colspan="4" class="loading-cell">Loading abilities...</td></tr>';
 
         // Fetch all abilities
-        const response = await fetch(`${API}/ability?limit=1000`);
-        const data = await response.json();
+        const data = await fetchJson(`${API}/ability?limit=1000`);
         
         // Fetch details for each ability
-        const abilitiesPromises = data.results.map(async ability => {
-            const detailResponse = await fetch(ability.url);
-            return detailResponse.json();
-        });
+        const abilitiesPromises = data.results.map(ability => fetchJson(ability.url));
 
         const abilitiesData = await Promise.all(abilitiesPromises);
         
@@ -1213,11 +1161,6 @@ function pickPokemonSpriteForAbilityCard(pokeData) {
     return '';
 }
 
-function getSpeciesIdFromUrl(url) {
-    const m = String(url || '').match(/\/(\d+)\/?$/);
-    return m ? parseInt(m[1], 10) : null;
-}
-
 function isTotemFormApiName(name) {
     const n = String(name || '').toLowerCase();
     // PokeAPI uses names like "gumshoos-totem", "mimikyu-totem-disguised", etc.
@@ -1236,8 +1179,7 @@ async function loadAbilityDetail() {
 
     try {
         // Fetch ability data
-        const response = await fetch(`${API}/ability/${abilityParam}`);
-        const ability = await response.json();
+        const ability = await fetchJson(`${API}/ability/${abilityParam}`);
         
         // Update title
         const displayName = ability.name.replace(/-/g, ' ').replace(/\b\w/g, l => l.toUpperCase());
@@ -1347,31 +1289,40 @@ async function loadAbilityDetail() {
         
         const pokemonList = ability.pokemon || [];
         
-        if (pokemonList.length > 0) {
-            // Fetch Pokémon details
-            const pokemonPromises = pokemonList
-                .slice(0, 100)
-                // Don’t show Totem forms in ability listings
-                .filter(p => !isTotemFormApiName(p?.pokemon?.name))
-                .map(async p => {
-                try {
-                    const pokeResponse = await fetch(p.pokemon.url);
-                    const pokeData = await pokeResponse.json();
-
-                    // Safety net: also filter Totem forms based on fetched name
-                    if (isTotemFormApiName(pokeData?.name)) return null;
+        // Precomputed ability -> holders index: one small file instead of one /pokemon fetch per holder.
+        const reverse = await fetchReverseIndexShard('abilities', ability.name);
+        const reverseHolders = Array.isArray(reverse?.pokemon)
+            ? reverse.pokemon
+                .filter(rec => !isTotemFormApiName(rec?.[1]))
+                .map(rec => ({ ...reverseIndexRecordToPokemonData(rec), isHidden: !!rec?.[6] }))
+            : null;
+
+        if (reverseHolders?.length || pokemonList.length > 0) {
+            // Fetch Pokémon details (the index already has them; otherwise one /pokemon fetch per holder)
+            const pokemonPromises = reverseHolders?.length
+                ? reverseHolders
+                : pokemonList
+                    .slice(0, 100)
+                    // Don’t show Totem forms in ability listings
+                    .filter(p => !isTotemFormApiName(p?.pokemon?.name))
+                    .map(async p => {
+                    try {
+                        const pokeData = await fetchJson(p.pokemon.url);
+
+                        // Safety net: also filter Totem forms based on fetched name
+                        if (isTotemFormApiName(pokeData?.name)) return null;
                     
-                    // Check if this ability is hidden for this Pokémon
-                    const abilityInfo = pokeData.abilities.find(a => a.ability.name === ability.name);
-                    return {
-                        ...pokeData,
-                        isHidden: abilityInfo?.is_hidden || false
-                    };
-                } catch (e) {
-                    console.error('Error fetching pokemon:', e);
-                    return null;
-                }
-            });
+                        // Check if this ability is hidden for this Pokémon
+                        const abilityInfo = pokeData.abilities.find(a => a.ability.name === ability.name);
+                        return {
+                            ...pokeData,
+                            isHidden: abilityInfo?.is_hidden || false
+                        };
+                    } catch (e) {
+                        console.error('Error fetching pokemon:', e);
+                        return null;
+                    }
+                });
             
             const pokemonData = (await Promise.all(pokemonPromises)).filter(p => p !== null);
             
@@ -1483,11 +1434,7 @@ async function loadMoveDetail() {
     const learnedByBreedingEl = document.getElementById('learnedByBreeding');
 
     try {
-        const response = await fetch(`${API}/move/${moveParam}`);
-        let move = null;
-        if (response.ok) {
-            move = await response.json();
-        }
+        let move = await fetchJson(`${API}/move/${moveParam}`).catch(() => null);
 
         // If PokeAPI doesn't have this move (or returns unusable data), try GraphQL-Pokemon.
         let gqlMove = null;
@@ -1767,7 +1714,6 @@ async function fetchMoveLearnDataForPokemonList(pokemonRefs, moveName, preferred
         .filter(x => x.id !== null);
 
     const results = [];
-    const BATCH_SIZE = 20;
 
     function buildPokemonDisplayName(species, formApiName) {
         const speciesName = String(species || '').trim();
@@ -1793,47 +1739,72 @@ async function fetchMoveLearnDataForPokemonList(pokemonRefs, moveName, preferred
         return formatName(formName);
     }
 
-    for (let i = 0; i < list.length; i += BATCH_SIZE) {
-        const batch = list.slice(i, i + BATCH_SIZE);
-        if (progressEl) progressEl.textContent = `Loading learnsets… (${Math.min(i + BATCH_SIZE, list.length)}/${list.length})`;
+    function toLearnResult(item, data) {
+        // Exclude Mega forms from learned-by lists.
+        // (PokeAPI uses names like "heracross-mega", "charizard-mega-x", etc.)
+        const apiName = String(item.apiName || data?.name || '').toLowerCase();
+        if (apiName.includes('-mega')) return null;
+
+        const learn = extractLearnForMove(data, moveName, preferredVersionGroup);
+
+        const speciesName = data?.species?.name || item.apiName || data?.name || '';
+        const speciesId = getSpeciesIdFromUrl(data?.species?.url) || data?.id || item.id;
+        const spriteUrl = pickPokemonSpriteForAbilityCard(data);
+
+        const formApiName = item.apiName || data?.name || '';
+        const displayName = buildPokemonDisplayName(speciesName, formApiName);
+        const isDefaultForm = !!speciesName && String(data?.name || '').toLowerCase() === String(speciesName).toLowerCase();
+        return {
+            id: item.id,
+            name: displayName,
+            speciesName,
+            speciesId,
+            spriteUrl,
+            egg: learn.egg,
+            level: learn.level,
+            isDefaultForm
+        };
+    }
 
-        const batchResults = await Promise.all(batch.map(async item => {
+    // Precomputed move -> learners index: one small file instead of one /pokemon fetch per learner.
+    const reverse = await fetchReverseIndexShard('moves', moveName);
+    if (reverse && Array.isArray(reverse.pokemon)) {
+        const detailsByPokemon = reverse.pokemon.map(() => []);
+        for (const [pIdx, vgIdx, methodIdx, level] of (reverse.learns || [])) {
+            detailsByPokemon[pIdx]?.push({
+                level_learned_at: level,
+                move_learn_method: { name: reverse.methods?.[methodIdx] },
+                version_group: { name: reverse.versionGroups?.[vgIdx] }
+            });
+        }
+        reverse.pokemon.forEach((rec, i) => {
+            const data = reverseIndexRecordToPokemonData(rec);
+            data.moves = [{ move: { name: moveName }, version_group_details: detailsByPokemon[i] }];
+            const r = toLearnResult({ id: data.id, apiName: data.name }, data);
+            if (r) results.push(r);
+        });
+    } else {
+        // scheduleFetch() caps concurrency; results keep list order regardless of arrival order.
+        let done = 0;
+        if (progressEl) progressEl.textContent = `Loading learnsets… (0/${list.length})`;
+        const allResults = await Promise.all(list.map(async item => {
             try {
                 const cached = pokemonDetailsCache[item.id];
-                const data = cached || await fetch(`${API}/pokemon/${item.id}`).then(r => r.json());
+                const data = cached || await fetchJson(`${API}/pokemon/${item.id}`);
                 if (!cached) pokemonDetailsCache[item.id] = data;
-
-                // Exclude Mega forms from learned-by lists.
-                // (PokeAPI uses names like "heracross-mega", "charizard-mega-x", etc.)
-                const apiName = String(item.apiName || data?.name || '').toLowerCase();
-                if (apiName.includes('-mega')) return null;
-
-                const learn = extractLearnForMove(data, moveName, preferredVersionGroup);
-
-                const speciesName = data?.species?.name || item.apiName || data?.name || '';
-                const speciesId = getSpeciesIdFromUrl(data?.species?.url) || data?.id || item.id;
-                const spriteUrl = pickPokemonSpriteForAbilityCard(data);
-
-                const formApiName = item.apiName || data?.name || '';
-                const displayName = buildPokemonDisplayName(speciesName, formApiName);
-                const isDefaultForm = !!speciesName && String(data?.name || '').toLowerCase() === String(speciesName).toLowerCase();
-                return {
-                    id: item.id,
-                    name: displayName,
-                    speciesName,
-                    speciesId,
-                    spriteUrl,
-                    egg: learn.egg,
-                    level: learn.level,
-                    isDefaultForm
-                };
+                return toLearnResult(item, data);
             } catch (e) {
                 console.error('Error fetching pokemon learnset', item, e);
                 return null;
+            } finally {
+                done++;
+                if (progressEl && (done % 20 === 0 || done === list.length)) {
+                    progressEl.textContent = `Loading learnsets… (${done}/${list.length})`;
+                }
             }
         }));
 
-        results.push(...batchResults.filter(Boolean));
+        results.push(...allResults.filter(Boolean));
     }
 
     if (progressEl) progressEl.textContent = '';
@@ -1910,6 +1881,307 @@ function renderLearnedCardNoLevel(p) {
     `;
 }
 
+// ========== Shared Helpers ==========
+// Used by the Pokédex grid and detail pages as well as the pages above.
+function renderTypes(card, types) {
+    const typeContainer = card.querySelector('.card-types');
+    if (!typeContainer) return;
+    
+    const typesHtml = types.map(t => 
+        `<span class="type-tag" style="background: ${TYPE_COLORS[t.type.name]}">${t.type.name}</span>`
+    ).join('');
+    typeContainer.innerHTML = typesHtml;
+}
+
+// Simple HTML escaper for detail rendering.
+function escapeHtml(s) {
+    return String(s || '')
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;')
+        .replace(/'/g, '&#39;');
+}
+
+function getSpeciesIdFromUrl(url) {
+    const m = String(url || '').match(/\/(\d+)\/?$/);
+    return m ? parseInt(m[1], 10) : null;
+}
+
+// Windowed rendering for long lists and grids (Pokédex grid, items, moves table).
+// Only the rows in view plus `overscan` rows on each side are in the DOM; the height of the
+// rest is reserved by a spacer element above and below them. Columns follow the container's
+// resolved grid-template-columns, so responsive grids keep working. Row heights are measured
+// as rows render, and rows not rendered yet are assumed to be the average height so far.
+// Elements scrolled out are reused for the items scrolled in, and refresh() / refreshKey()
+// calls are applied together in the next animation frame.
+// Lists with fewer than `minCount` items are rendered in full, with the same batched refreshes.
+// Writing something else into the container (a loading message) detaches the list until the
+// next setItems().
+//   renderItem(item, index) -> HTML for one element
+//   keyOf(item) -> key for refreshKey()
+//   onRender(el, item, index) -> called each time an item's element is (re)rendered
+const virtualLists = new WeakMap(); // container -> list
+
+function createVirtualList(container, options = {}) {
+    if (virtualLists.has(container)) {
+        const existing = virtualLists.get(container);
+        existing.configure(options);
+        return existing;
+    }
+
+    const opts = { renderItem: () => '', keyOf: null, onRender: null, overscan: 4, minCount: 120, estimateHeight: 200 };
+    const isTable = container.tagName === 'TBODY';
+    const template = document.createElement('template');
+    const rendered = new Map(); // index -> element
+    const pool = [];
+    const dirty = new Set();
+    let items = [];
+    let keyIndex = null;
+    let cols = 1;
+    let rowGap = 0;
+    let heights = []; // measured row heights, gap included
+    let avgHeight = opts.estimateHeight;
+    let first = 0;
+    let last = 0;
+    let frame = 0;
+    let fullRender = false;
+
+    const topSpacer = createSpacer();
+    const bottomSpacer = createSpacer();
+
+    function createSpacer() {
+        const spacer = document.createElement(isTable ? 'tr' : 'div');
+        spacer.setAttribute('aria-hidden', 'true');
+        if (isTable) spacer.innerHTML = '<td colspan="99" style="padding:0;border:0"></td>';
+        else spacer.style.gridColumn = '1 / -1';
+        spacer.style.display = 'none';
+        return spacer;
+    }
+
+    function parse(html) {
+        template.innerHTML = String(html).trim();
+        return template.content.firstElementChild;
+    }
+
+    // Render item i into el when it can be recycled, or into a new element.
+    function materialize(i, el) {
+        el = patch(el, opts.renderItem(items[i], i));
+        if (opts.onRender) opts.onRender(el, items[i], i);
+        return el;
+    }
+
+    function patch(el, html) {
+        if (el && el.__virtualHtml === html) return el;
+        const next = parse(html);
+        if (!next) return el || document.createElement('div');
+        if (el && el.tagName === next.tagName) {
+            for (const attr of [...el.attributes]) {
+                if (!next.hasAttribute(attr.name)) el.removeAttribute(attr.name);
+            }
+            for (const attr of next.attributes) {
+                if (el.getAttribute(attr.name) !== attr.value) el.setAttribute(attr.name, attr.value);
+            }
+            el.replaceChildren(...next.childNodes);
+        } else {
+            el = next;
+        }
+        el.__virtualHtml = html;
+        return el;
+    }
+
+    function measureColumns() {
+        if (isTable) return 1;
+        const style = getComputedStyle(container);
+        rowGap = parseFloat(style.rowGap) || 0;
+        if (style.display !== 'grid' && style.display !== 'inline-grid') return 1;
+        const tracks = String(style.gridTemplateColumns || '').trim();
+        if (!tracks || tracks.includes('repeat(')) return cols;
+        return Math.max(1, tracks.split(/\s+/).length);
+    }
+
+    function rowHeight(r) {
+        return heights[r] || avgHeight;
+    }
+
+    function offsetOfRow(r) {
+        let y = 0;
+        for (let i = 0; i < r; i++) y += rowHeight(i);
+        return y;
+    }
+
+    function measure() {
+        let changed = false;
+        let total = 0;
+        let count = 0;
+        for (let r = first; r < last; r++) {
+            const a = rendered.get(r * cols);
+            if (!a) continue;
+            const b = rendered.get((r + 1) * cols);
+            let h;
+            if (b && r + 1 < last) {
+                h = b.offsetTop - a.offsetTop;
+            } else {
+                h = 0;
+                for (let i = r * cols; i < Math.min(items.length, (r + 1) * cols); i++) {
+                    h = Math.max(h, rendered.get(i)?.offsetHeight || 0);
+                }
+                h += rowGap;
+            }
+            if (!(h > 0)) continue;
+            if (Math.abs((heights[r] || 0) - h) > 0.5) changed = true;
+            heights[r] = h;
+            total += h;
+            count++;
+        }
+        if (count) avgHeight = total / count;
+        return changed;
+    }
+
+    // A spacer is a grid row of its own, so it brings one row gap with it.
+    function setSpacers(top, bottom) {
+        for (const [spacer, height] of [[topSpacer, top - rowGap], [bottomSpacer, bottom - rowGap]]) {
+            spacer.style.display = height > 0 ? '' : 'none';
+            (isTable ? spacer.firstChild : spacer).style.height = `${Math.max(0, height)}px`;
+        }
+    }
+
+    function visibleRows(rows) {
+        if (fullRender) return [0, rows];
+        const rect = container.getBoundingClientRect();
+        const viewTop = -rect.top;
+        const viewBottom = viewTop + (window.innerHeight || document.documentElement.clientHeight || 0);
+        let r = 0;
+        let y = 0;
+        while (r < rows && y + rowHeight(r) <= viewTop) y += rowHeight(r++);
+        const start = r;
+        while (r < rows && y < viewBottom) y += rowHeight(r++);
+        return [Math.max(0, start - opts.overscan), Math.min(rows, Math.max(r, start + 1) + opts.overscan)];
+    }
+
+    function update() {
+        frame = 0;
+        if (!container.isConnected) {
+            destroy();
+            return;
+        }
+        if (topSpacer.parentNode !== container) return; // replaced; wait for setItems()
+        if (!isTable && container.offsetParent === null) return; // hidden
+
+        const nextCols = measureColumns();
+        if (nextCols !== cols) {
+            cols = nextCols;
+            heights = [];
+        }
+        fullRender = items.length < opts.minCount;
+        const rows = Math.ceil(items.length / cols);
+        const [nextFirst, nextLast] = visibleRows(rows);
+        const start = nextFirst * cols;
+        const end = Math.min(items.length, nextLast * cols);
+
+        for (const [i, el] of rendered) {
+            if (i < start || i >= end || el.parentNode !== container) {
+                rendered.delete(i);
+                el.remove();
+                pool.push(el);
+            }
+        }
+        let cursor = topSpacer.nextSibling;
+        for (let i = start; i < end; i++) {
+            const prev = rendered.get(i);
+            let el = prev;
+            if (!el || dirty.has(i)) {
+                el = materialize(i, el || pool.pop());
+                rendered.set(i, el);
+                if (prev && prev !== el) {
+                    if (cursor === prev) cursor = prev.nextSibling;
+                    prev.remove();
+                }
+            }
+            if (el === cursor) cursor = cursor.nextSibling;
+            else container.insertBefore(el, cursor);
+        }
+        dirty.clear();
+        first = nextFirst;
+        last = nextLast;
+
+        if (fullRender) {
+            setSpacers(0, 0);
+            return;
+        }
+        const changed = measure();
+        setSpacers(offsetOfRow(first), offsetOfRow(rows) - offsetOfRow(last));
+        if (changed) schedule();
+    }
+
+    function schedule() {
+        if (!frame) frame = requestAnimationFrame(update);
+    }
+
+    function onResize() {
+        heights = [];
+        schedule();
+    }
+
+    function configure(next) {
+        for (const [k, v] of Object.entries(next || {})) {
+            if (v !== undefined) opts[k] = v;
+        }
+        avgHeight = heights.length ? avgHeight : opts.estimateHeight;
+    }
+
+    // Replace the items and render the window at once. Anything else in the container
+    // (a loading message, the previous list's rows) is cleared.
+    function setItems(nextItems, nextOptions) {
+        if (nextOptions) configure(nextOptions);
+        items = Array.isArray(nextItems) ? nextItems : [];
+        keyIndex = null;
+        heights = [];
+        for (const el of rendered.values()) pool.push(el);
+        rendered.clear();
+        dirty.clear();
+        container.replaceChildren(topSpacer, bottomSpacer);
+        if (frame) {
+            cancelAnimationFrame(frame);
+            frame = 0;
+        }
+        update();
+    }
+
+    function refresh(index) {
+        if (!rendered.has(index)) return;
+        dirty.add(index);
+        schedule();
+    }
+
+    function refreshKey(key) {
+        if (!opts.keyOf) return;
+        if (!keyIndex) {
+            keyIndex = new Map();
+            items.forEach((item, i) => keyIndex.set(opts.keyOf(item), i));
+        }
+        const i = keyIndex.get(key);
+        if (i !== undefined) refresh(i);
+    }
+
+    function destroy() {
+        document.removeEventListener('scroll', schedule, true);
+        window.removeEventListener('resize', onResize);
+        if (frame) cancelAnimationFrame(frame);
+        frame = 0;
+        virtualLists.delete(container);
+    }
+
+    // Captured on the document so scrolling inside a scrollable ancestor counts too.
+    document.addEventListener('scroll', schedule, { capture: true, passive: true });
+    window.addEventListener('resize', onResize);
+
+    const list = { setItems, refresh, refreshKey, configure, destroy, get items() { return items; } };
+    configure(options);
+    virtualLists.set(container, list);
+    return list;
+}
+
 // Image fallback handler for Pokémon forms
 function handleImageError(imgElement, pokemonId, pokemonName) {
     // List of fallback image sources to try
@@ -1961,3 +2233,222 @@ function navigateToPokedex(dexId, dexName, event) {
 }
 
 
+
+// ========== Global Search ==========
+// As-you-type search over Pokémon, moves, abilities, items and locations, from the
+// prebuilt index written by tools/build_search_index.py (loaded on first focus).
+const SEARCH_INDEX_URL = `${ROOT_PREFIX}data/search-index.json`;
+const SEARCH_INDEX_FORMAT = 'pokedb-search/1';
+const SEARCH_FIELD_WEIGHTS = [10, 6, 2, 1]; // name, altName, effect, flavor
+const SEARCH_KIND_LABELS = { pokemon: 'Pokémon', move: 'Move', ability: 'Ability', item: 'Item', location: 'Location' };
+const SEARCH_MAX_PREFIX_TERMS = 300;
+const SEARCH_MAX_FUZZY_TERMS = 20;
+const SEARCH_MIN_FUZZY_SIMILARITY = 0.4;
+
+let searchIndexPromise = null;
+const searchStats = { queries: 0, lastQueryMs: 0, maxQueryMs: 0 };
+
+// Must match tokenize() in tools/build_search_index.py.
+function searchTokenize(text) {
+    return String(text || '')
+        .normalize('NFKD')
+        .replace(/[\u0300-\u036f]/g, '')
+        .toLowerCase()
+        .split(/[^\p{L}\p{N}\p{M}]+/u)
+        .filter(Boolean);
+}
+
+function searchTrigrams(term) {
+    const padded = ` ${term} `;
+    const out = new Set();
+    for (let i = 0; i + 3 <= padded.length; i++) out.add(padded.slice(i, i + 3));
+    return out;
+}
+
+function loadSearchIndex() {
+    if (!searchIndexPromise) {
+        searchIndexPromise = scheduleFetch(SEARCH_INDEX_URL, { priority: 'high' })
+            .then(r => (r.ok ? r.json() : null))
+            .then(raw => (raw?.format === SEARCH_INDEX_FORMAT && Array.isArray(raw.terms) && Array.isArray(raw.textPostings) ? raw : null))
+            .catch(() => null);
+    }
+    return searchIndexPromise;
+}
+
+// First index in the sorted term list that is >= term.
+function searchLowerBound(terms, term) {
+    let lo = 0;
+    let hi = terms.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (terms[mid] < term) lo = mid + 1;
+        else hi = mid;
+    }
+    return lo;
+}
+
+// doc -> best score for one query token. Names match by prefix; effect/flavor words
+// match exactly, or by prefix once the token has 4+ characters. When nothing matches,
+// English names are tried again by trigram similarity (typos).
+function scoreSearchToken(index, token) {
+    const scores = new Map();
+    const addPostings = (postings, matchWeight) => {
+        for (const p of postings) {
+            const doc = p >> 2;
+            const s = SEARCH_FIELD_WEIGHTS[p & 3] * matchWeight;
+            if (!(scores.get(doc) >= s)) scores.set(doc, s);
+        }
+    };
+
+    const { terms } = index;
+    const textPrefix = token.length >= 4;
+    const start = searchLowerBound(terms, token);
+    for (let i = start; i < terms.length && i - start < SEARCH_MAX_PREFIX_TERMS && terms[i].startsWith(token); i++) {
+        const exact = terms[i] === token;
+        // Exact > prefix; among prefixes, the closer the term's length the better.
+        const matchWeight = exact ? 1 : 0.5 + 0.3 * (token.length / terms[i].length);
+        addPostings(index.postings[i], matchWeight);
+        if ((exact && token.length > 1) || textPrefix) addPostings(index.textPostings[i], matchWeight);
+    }
+
+    if (!scores.size && token.length >= 3 && index.trigrams) {
+        const grams = searchTrigrams(token);
+        const shared = new Map();
+        for (const g of grams) {
+            for (const termIdx of index.trigrams[g] || []) shared.set(termIdx, (shared.get(termIdx) || 0) + 1);
+        }
+        const fuzzy = [];
+        for (const [termIdx, n] of shared) {
+            // Jaccard similarity; a term of length L has L padded trigrams.
+            const similarity = n / (grams.size + terms[termIdx].length - n);
+            if (similarity >= SEARCH_MIN_FUZZY_SIMILARITY) fuzzy.push([termIdx, similarity]);
+        }
+        fuzzy.sort((a, b) => b[1] - a[1]);
+        for (const [termIdx, similarity] of fuzzy.slice(0, SEARCH_MAX_FUZZY_TERMS)) addPostings(index.postings[termIdx], 0.5 * similarity);
+    }
+    return scores;
+}
+
+// Ranked results for a query: every token must match (the last one as a prefix while typing).
+function querySearchIndex(index, query, limit = 20) {
+    const started = performance.now();
+    const tokens = Array.from(new Set(searchTokenize(query)));
+    let combined = null;
+    for (const token of tokens) {
+        const scores = scoreSearchToken(index, token);
+        if (!combined) {
+            combined = scores;
+            continue;
+        }
+        const next = new Map();
+        for (const [doc, s] of scores) {
+            if (combined.has(doc)) next.set(doc, combined.get(doc) + s);
+        }
+        combined = next;
+        if (!combined.size) break;
+    }
+
+    const results = Array.from(combined || [], ([doc, score]) => {
+        const [kindIdx, id, slug, name] = index.docs[doc];
+        return { kind: index.kinds[kindIdx], kindIdx, id, slug, name, score, doc };
+    });
+    results.sort((a, b) => (b.score - a.score) || (a.kindIdx - b.kindIdx) || (a.name.length - b.name.length) || (a.doc - b.doc));
+
+    const ms = performance.now() - started;
+    searchStats.queries++;
+    searchStats.lastQueryMs = ms;
+    searchStats.maxQueryMs = Math.max(searchStats.maxQueryMs, ms);
+    return results.slice(0, limit);
+}
+
+function getSearchResultHref(result) {
+    const slug = encodeURIComponent(result.slug);
+    switch (result.kind) {
+        case 'pokemon': return `${PAGES_PREFIX}pokemon-detail.html?id=${result.id}`;
+        case 'move': return `${PAGES_PREFIX}move-detail.html?move=${result.id}`;
+        case 'ability': return `${PAGES_PREFIX}ability-detail.html?ability=${slug}`;
+        case 'item': return `${PAGES_PREFIX}item-detail.html?item=${slug}`;
+        default: return `${PAGES_PREFIX}location-detail.html?location=${slug}`;
+    }
+}
+
+function renderSearchResults(panel, results, activeIdx) {
+    panel.innerHTML = results.map((r, i) => `
+        <a class="global-search-result${i === activeIdx ? ' active' : ''}" href="${getSearchResultHref(r)}" role="option">
+            <span class="global-search-kind global-search-kind-${r.kind}">${SEARCH_KIND_LABELS[r.kind] || r.kind}</span>
+            <span class="global-search-name">${escapeHtml(r.name)}</span>
+            ${r.kind === 'pokemon' ? `<span class="global-search-num">#${String(r.id).padStart(3, '0')}</span>` : ''}
+        </a>
+    `).join('');
+}
+
+function setupGlobalSearch() {
+    const header = document.querySelector('.sidebar .sidebar-header');
+    if (!header || document.querySelector('.global-search')) return;
+
+    const box = document.createElement('div');
+    box.className = 'global-search';
+    box.innerHTML = `
+        <input type="search" class="global-search-input" placeholder="Search Pokémon, moves, items…" autocomplete="off" spellcheck="false" aria-label="Search Pokémon, moves, abilities, items and locations">
+        <div class="global-search-results" role="listbox" hidden></div>
+    `;
+    header.insertAdjacentElement('afterend', box);
+
+    const input = box.querySelector('.global-search-input');
+    const panel = box.querySelector('.global-search-results');
+    let results = [];
+    let activeIdx = -1;
+
+    const update = async () => {
+        const query = input.value;
+        if (!searchTokenize(query).length) {
+            panel.hidden = true;
+            return;
+        }
+        const index = await loadSearchIndex();
+        if (input.value !== query) return; // a newer keystroke is already being handled
+        if (!index) {
+            panel.innerHTML = '<div class="global-search-empty">Search is unavailable.</div>';
+        } else {
+            results = querySearchIndex(index, query);
+            activeIdx = results.length ? 0 : -1;
+            if (results.length) renderSearchResults(panel, results, activeIdx);
+            else panel.innerHTML = '<div class="global-search-empty">No matches.</div>';
+        }
+        panel.hidden = false;
+    };
+
+    input.addEventListener('focus', () => {
+        loadSearchIndex();
+        if (input.value) update();
+    });
+    input.addEventListener('input', update);
+    input.addEventListener('keydown', (e) => {
+        if (e.key === 'Escape') {
+            panel.hidden = true;
+            return;
+        }
+        if (panel.hidden || !results.length) return;
+        if (e.key === 'ArrowDown' || e.key === 'ArrowUp') {
+            e.preventDefault();
+            activeIdx = (activeIdx + (e.key === 'ArrowDown' ? 1 : results.length - 1)) % results.length;
+            renderSearchResults(panel, results, activeIdx);
+        } else if (e.key === 'Enter' && activeIdx >= 0) {
+            e.preventDefault();
+            window.location.href = getSearchResultHref(results[activeIdx]);
+        }
+    });
+    document.addEventListener('click', (e) => {
+        if (!box.contains(e.target)) panel.hidden = true;
+    });
+}
+
+document.addEventListener('DOMContentLoaded', setupGlobalSearch);
+
+window.__POKEDB_SEARCH__ = {
+    stats: searchStats,
+    async query(q, limit) {
+        const index = await loadSearchIndex();
+        return index ? querySearchIndex(index, q, limit) : [];
+    }
+};
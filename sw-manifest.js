@@ -0,0 +1,1470 @@
+// Generated by tools/build_sw_manifest.py. Do not edit by hand.
+self.__SW_MANIFEST__ = {
+  "version":"da9f248eb8",
+  "generatedAt":"2026-10-18T13:03:36Z",
+  "shell":{"version":"22c9ae1c87","assets":[
+    ["css/abilities.css","c27a6bc937"],
+    ["css/ability-detail.css","f4a0fc7c69"],
+    ["css/detail.css","5a4ed2ed07"],
+    ["css/egg-group.css","db234edc76"],
+    ["css/item-detail.css","810a7bdc29"],
+    ["css/items.css","41dce13e02"],
+    ["css/locations-guide.css","9e701fc5fe"],
+    ["css/locations.css","6bef56c05d"],
+    ["css/move-detail.css","b497583f3f"],
+    ["css/moves-full.css","2b353c012b"],
+    ["css/moves.css","c9a63aa9ec"],
+    ["css/style.css","ea5fe50cda"],
+    ["css/typechart.css","6856506253"],
+    ["index.html","d6a6f2c89a"],
+    ["js/pokedb-worker.js","5a44669fc8"],
+    ["js/script.js","45932a1278"],
+    ["js/script.part1.js","7084bbdff6"],
+    ["js/script.part2.js","348962d846"],
+    ["js/script.part3.js","c9eb8cafb9"],
+    ["js/script.part4.js","b0b2f40324"],
+    ["offline.html","d6288b118b"],
+    ["pages/abilities.html","3654fd1494"],
+    ["pages/ability-detail.html","c0727642d7"],
+    ["pages/egg-group.html","459899c131"],
+    ["pages/item-detail.html","5f198bd772"],
+    ["pages/items.html","1226eab505"],
+    ["pages/location-detail.html","7857977cd0"],
+    ["pages/locations.html","30ed51b43c"],
+    ["pages/move-detail.html","d7447f4623"],
+    ["pages/pokemon-detail.html","f7a49dea79"],
+    ["pages/team-builder.html","9f8a0393f9"]
+  ]},
+  "data":{"version":"c55950dfb1","assets":[
+    ["data/pokedb-encounters-g8g9.compact.json","33b8954450"],
+    ["data/pokedb-encounters-g8g9/locations/acuity-lakefront.json","ffad44eb4d"],
+    ["data/pokedb-encounters-g8g9/locations/aipom-hill.json","b5e20bb2fc"],
+    ["data/pokedb-encounters-g8g9/locations/alfornada-cavern.json","6bca73a6eb"],
+    ["data/pokedb-encounters-g8g9/locations/ancient-quarry.json","63b8e8ac7a"],
+    ["data/pokedb-encounters-g8g9/locations/area-zero-underdepths.json","1636adfde3"],
+    ["data/pokedb-encounters-g8g9/locations/area-zero.json","8a04ea199f"],
+    ["data/pokedb-encounters-g8g9/locations/arenas-approach.json","af805f4e68"],
+    ["data/pokedb-encounters-g8g9/locations/asado-desert.json","0a1da83bd4"],
+    ["data/pokedb-encounters-g8g9/locations/aspiration-hill.json","9861f537c2"],
+    ["data/pokedb-encounters-g8g9/locations/avalanche-slopes.json","cbf9be28d6"],
+    ["data/pokedb-encounters-g8g9/locations/avaluggs-lagacy.json","08dc36db61"],
+    ["data/pokedb-encounters-g8g9/locations/axews-eye.json","e286f0c4e4"],
+    ["data/pokedb-encounters-g8g9/locations/ballimere-lake.json","70ca6dccd7"],
+    ["data/pokedb-encounters-g8g9/locations/bathers-lagoon.json","528d411742"],
+    ["data/pokedb-encounters-g8g9/locations/battle-tower-galar.json","d5805a7b04"],
+    ["data/pokedb-encounters-g8g9/locations/big-bluff-cavern.json","8b72022ba8"],
+    ["data/pokedb-encounters-g8g9/locations/bogsunk-cavern.json","fedbd93448"],
+    ["data/pokedb-encounters-g8g9/locations/bolderoll-ravine.json","f8e87caeff"],
+    ["data/pokedb-encounters-g8g9/locations/bolderoll-slope.json","ad4db9bbfd"],
+    ["data/pokedb-encounters-g8g9/locations/bonechill-wastes.json","51102b3e2b"],
+    ["data/pokedb-encounters-g8g9/locations/brava-arena.json","8aa965aa3f"],
+    ["data/pokedb-encounters-g8g9/locations/brawlers-cave.json","7abe54128c"],
+    ["data/pokedb-encounters-g8g9/locations/bridge-field.json","9da945ad40"],
+    ["data/pokedb-encounters-g8g9/locations/cabo-poco.json","54aa4c1c0b"],
+    ["data/pokedb-encounters-g8g9/locations/canalave-city.json","2d9d4e59fb"],
+    ["data/pokedb-encounters-g8g9/locations/cascarrafa.json","4d56a30b9f"],
+    ["data/pokedb-encounters-g8g9/locations/casseroya-lake.json","8d0279be0f"],
+    ["data/pokedb-encounters-g8g9/locations/castaway-shore.json","15825774d2"],
+    ["data/pokedb-encounters-g8g9/locations/celadon-city.json","b84cd5468a"],
+    ["data/pokedb-encounters-g8g9/locations/celestic-town.json","c50ba24d4d"],
+    ["data/pokedb-encounters-g8g9/locations/celestica-ruins.json","7752615cc0"],
+    ["data/pokedb-encounters-g8g9/locations/celestica-trail.json","d10a8bddd1"],
+    ["data/pokedb-encounters-g8g9/locations/cerulean-cave.json","456df8e12d"],
+    ["data/pokedb-encounters-g8g9/locations/cerulean-city.json","cc2a652ff5"],
+    ["data/pokedb-encounters-g8g9/locations/challenge-beach.json","59fe65abf9"],
+    ["data/pokedb-encounters-g8g9/locations/challenge-road.json","14ce9a1412"],
+    ["data/pokedb-encounters-g8g9/locations/cinnabar-island.json","687c51900b"],
+    ["data/pokedb-encounters-g8g9/locations/cinnabar-lab.json","943f696cec"],
+    ["data/pokedb-encounters-g8g9/locations/circhester.json","7ea8d5af4b"],
+    ["data/pokedb-encounters-g8g9/locations/clamberclaw-cliffs.json","3420baf7c3"],
+    ["data/pokedb-encounters-g8g9/locations/cloudcap-pass.json","e660cf9e20"],
+    ["data/pokedb-encounters-g8g9/locations/cloudpool-ridge.json","f693f6392e"],
+    ["data/pokedb-encounters-g8g9/locations/colonnade-hollow.json","c1a92abe19"],
+    ["data/pokedb-encounters-g8g9/locations/cortondo.json","ebd87cf568"],
+    ["data/pokedb-encounters-g8g9/locations/cottonsedge-prairie.json","92f1843cb7"],
+    ["data/pokedb-encounters-g8g9/locations/courageous-cavern.json","cc447055eb"],
+    ["data/pokedb-encounters-g8g9/locations/crevasse-passage.json","edf2f1bbab"],
+    ["data/pokedb-encounters-g8g9/locations/crossing-slope.json","8b9cc34f52"],
+    ["data/pokedb-encounters-g8g9/locations/crown-shrine.json","fc1d148b94"],
+    ["data/pokedb-encounters-g8g9/locations/dalizapa-passage.json","7569fd0e0a"],
+    ["data/pokedb-encounters-g8g9/locations/dappled-grove.json","ce28c7f310"],
+    ["data/pokedb-encounters-g8g9/locations/dazzling-cave.json","2b7c2f4161"],
+    ["data/pokedb-encounters-g8g9/locations/deadwood-haunt.json","c616785ba9"],
+    ["data/pokedb-encounters-g8g9/locations/deertrack-heights.json","c6c5f36d2c"],
+    ["data/pokedb-encounters-g8g9/locations/deertrack-path.json","d6a41a918f"],
+    ["data/pokedb-encounters-g8g9/locations/diamond-heath.json","65b20f55ed"],
+    ["data/pokedb-encounters-g8g9/locations/diamond-settlement.json","bd76e47699"],
+    ["data/pokedb-encounters-g8g9/locations/digletts-cave.json","588c40e4a9"],
+    ["data/pokedb-encounters-g8g9/locations/droning-meadow.json","7883d25750"],
+    ["data/pokedb-encounters-g8g9/locations/dusty-bowl.json","064c79b7f9"],
+    ["data/pokedb-encounters-g8g9/locations/dyna-tree-hill.json","2869e047f7"],
+    ["data/pokedb-encounters-g8g9/locations/east-lake-axewell.json","764343f88b"],
+    ["data/pokedb-encounters-g8g9/locations/east-paldean-sea.json","b207b232ba"],
+    ["data/pokedb-encounters-g8g9/locations/east-province-area-one.json","2317b98123"],
+    ["data/pokedb-encounters-g8g9/locations/east-province-area-three.json","2ead06014f"],
+    ["data/pokedb-encounters-g8g9/locations/east-province-area-two.json","443e1842bf"],
+    ["data/pokedb-encounters-g8g9/locations/eterna-city.json","098e71a439"],
+    ["data/pokedb-encounters-g8g9/locations/eterna-condominiums.json","8d8b0c7d6a"],
+    ["data/pokedb-encounters-g8g9/locations/eterna-forest.json","3ce21196d8"],
+    ["data/pokedb-encounters-g8g9/locations/fabled-spring.json","df72d5452d"],
+    ["data/pokedb-encounters-g8g9/locations/fields-of-honor.json","9b802f6ce4"],
+    ["data/pokedb-encounters-g8g9/locations/fighting-dojo.json","5901d3ea56"],
+    ["data/pokedb-encounters-g8g9/locations/firescourge-shrine.json","e9861cf2ea"],
+    ["data/pokedb-encounters-g8g9/locations/firespit-island.json","0cf9fa9358"],
+    ["data/pokedb-encounters-g8g9/locations/floaro-gardens.json","5a47fe3636"],
+    ["data/pokedb-encounters-g8g9/locations/floaroma-town.json","970f1c2b1d"],
+    ["data/pokedb-encounters-g8g9/locations/flower-paradise.json","fd0912ba64"],
+    ["data/pokedb-encounters-g8g9/locations/forest-of-focus.json","2cb1a256c8"],
+    ["data/pokedb-encounters-g8g9/locations/fountainspring-cave.json","cec5a07215"],
+    ["data/pokedb-encounters-g8g9/locations/freezington.json","4417371e73"],
+    ["data/pokedb-encounters-g8g9/locations/frigid-sea.json","60d0c3d199"],
+    ["data/pokedb-encounters-g8g9/locations/frostpoint-field.json","09f088fca7"],
+    ["data/pokedb-encounters-g8g9/locations/fuchsia-city.json","7e2cfd27fc"],
+    ["data/pokedb-encounters-g8g9/locations/fuego-ironworks.json","ebde56d691"],
+    ["data/pokedb-encounters-g8g9/locations/galar-mine-no-2.json","f7bf38a88a"],
+    ["data/pokedb-encounters-g8g9/locations/galar-mine.json","55f6bfee11"],
+    ["data/pokedb-encounters-g8g9/locations/galar-route-01.json","659d01b46c"],
+    ["data/pokedb-encounters-g8g9/locations/galar-route-02.json","7a6b51da20"],
+    ["data/pokedb-encounters-g8g9/locations/galar-route-03.json","59c0802d06"],
+    ["data/pokedb-encounters-g8g9/locations/galar-route-04.json","c212ae876a"],
+    ["data/pokedb-encounters-g8g9/locations/galar-route-05.json","7bab425297"],
+    ["data/pokedb-encounters-g8g9/locations/galar-route-06.json","80306f28d9"],
+    ["data/pokedb-encounters-g8g9/locations/galar-route-07.json","0665797aeb"],
+    ["data/pokedb-encounters-g8g9/locations/galar-route-08.json","0c54195541"],
+    ["data/pokedb-encounters-g8g9/locations/galar-route-09.json","9ea5a1721a"],
+    ["data/pokedb-encounters-g8g9/locations/galar-route-10.json","c0017cbbf0"],
+    ["data/pokedb-encounters-g8g9/locations/gapejaw-bog.json","5a27ca4ed8"],
+    ["data/pokedb-encounters-g8g9/locations/giants-bed.json","e6115fa8bd"],
+    ["data/pokedb-encounters-g8g9/locations/giants-cap.json","7f0f72fc0c"],
+    ["data/pokedb-encounters-g8g9/locations/giants-foot.json","338d08b7ee"],
+    ["data/pokedb-encounters-g8g9/locations/giants-mirror.json","0aa633ff2b"],
+    ["data/pokedb-encounters-g8g9/locations/giants-seat.json","ee84411113"],
+    ["data/pokedb-encounters-g8g9/locations/ginkgo-landing.json","89b2e5499e"],
+    ["data/pokedb-encounters-g8g9/locations/glacial-cavern.json","b8ed2806a4"],
+    ["data/pokedb-encounters-g8g9/locations/glacier-terrace.json","12fe67460c"],
+    ["data/pokedb-encounters-g8g9/locations/glaseado-mountain.json","04d8d6d0f3"],
+    ["data/pokedb-encounters-g8g9/locations/glimwood-tangle.json","86a2edb472"],
+    ["data/pokedb-encounters-g8g9/locations/golden-lowlands.json","3e847d692c"],
+    ["data/pokedb-encounters-g8g9/locations/grandtree-arena.json","8068e0df12"],
+    ["data/pokedb-encounters-g8g9/locations/grassland-cave.json","d7c1169460"],
+    ["data/pokedb-encounters-g8g9/locations/grasswither-shrine.json","9067b6a873"],
+    ["data/pokedb-encounters-g8g9/locations/great-crater-of-paldea.json","a85f755dfc"],
+    ["data/pokedb-encounters-g8g9/locations/great-marsh.json","10f2efe55c"],
+    ["data/pokedb-encounters-g8g9/locations/groundblight-shrine.json","a1a54deb8b"],
+    ["data/pokedb-encounters-g8g9/locations/grueling-grove.json","f39e546ea0"],
+    ["data/pokedb-encounters-g8g9/locations/hall-of-origin.json","14e8bd715f"],
+    ["data/pokedb-encounters-g8g9/locations/hammerlocke-hills.json","8102bc4e65"],
+    ["data/pokedb-encounters-g8g9/locations/hammerlocke.json","0155847c29"],
+    ["data/pokedb-encounters-g8g9/locations/hearthome-city.json","8094359b9a"],
+    ["data/pokedb-encounters-g8g9/locations/hearts-crag.json","63d5b93f81"],
+    ["data/pokedb-encounters-g8g9/locations/heavenward-lookout.json","fe92a4b192"],
+    ["data/pokedb-encounters-g8g9/locations/hideaway-bay.json","2bd7c1379b"],
+    ["data/pokedb-encounters-g8g9/locations/holm-of-trials.json","1c25786abe"],
+    ["data/pokedb-encounters-g8g9/locations/honeycalm-island.json","e7c503a8a5"],
+    ["data/pokedb-encounters-g8g9/locations/honeycalm-sea.json","de1d2aa2ca"],
+    ["data/pokedb-encounters-g8g9/locations/horseshoe-plains.json","7605933d79"],
+    ["data/pokedb-encounters-g8g9/locations/hulbury.json","b6572bdb0d"],
+    ["data/pokedb-encounters-g8g9/locations/ice-column-chamber.json","db5480c01a"],
+    ["data/pokedb-encounters-g8g9/locations/iceberg-ruins-galar.json","708308f1f0"],
+    ["data/pokedb-encounters-g8g9/locations/icebound-falls.json","b04bc73ba5"],
+    ["data/pokedb-encounters-g8g9/locations/icepeak-cavern.json","870c429559"],
+    ["data/pokedb-encounters-g8g9/locations/icerend-shrine.json","ee422b39d2"],
+    ["data/pokedb-encounters-g8g9/locations/icy-cave.json","d06b01f882"],
+    ["data/pokedb-encounters-g8g9/locations/indigo-plateau.json","6e32799f6c"],
+    ["data/pokedb-encounters-g8g9/locations/inlet-grotto.json","49b1deea45"],
+    ["data/pokedb-encounters-g8g9/locations/insular-sea.json","956699dc3e"],
+    ["data/pokedb-encounters-g8g9/locations/iron-island.json","f20b9d8d4d"],
+    ["data/pokedb-encounters-g8g9/locations/iron-ruins-galar.json","88e4d0c0d5"],
+    ["data/pokedb-encounters-g8g9/locations/islespy-shore.json","36b5c0e6cc"],
+    ["data/pokedb-encounters-g8g9/locations/jubilife-village.json","9cd3770ba4"],
+    ["data/pokedb-encounters-g8g9/locations/lake-acuity-hisui.json","d6ad3367b0"],
+    ["data/pokedb-encounters-g8g9/locations/lake-acuity-sinnoh.json","4f38db8462"],
+    ["data/pokedb-encounters-g8g9/locations/lake-of-outrage.json","f5cda942c4"],
+    ["data/pokedb-encounters-g8g9/locations/lake-valor-hisui.json","5b3fa1069d"],
+    ["data/pokedb-encounters-g8g9/locations/lake-valor-sinnoh.json","47f48df949"],
+    ["data/pokedb-encounters-g8g9/locations/lake-verity-hisui.json","a24bf2e4c3"],
+    ["data/pokedb-encounters-g8g9/locations/lake-verity-sinnoh.json","20257cc55a"],
+    ["data/pokedb-encounters-g8g9/locations/lakeside-cave.json","dec7e1a49d"],
+    ["data/pokedb-encounters-g8g9/locations/lava-dome-sanctum.json","81565332d3"],
+    ["data/pokedb-encounters-g8g9/locations/lavender-town.json","0b44ae5be1"],
+    ["data/pokedb-encounters-g8g9/locations/levincia.json","5659f74573"],
+    ["data/pokedb-encounters-g8g9/locations/lonely-spring.json","f282ef9eda"],
+    ["data/pokedb-encounters-g8g9/locations/loop-lagoon.json","eb5186c56e"],
+    ["data/pokedb-encounters-g8g9/locations/lost-tower.json","56401d3808"],
+    ["data/pokedb-encounters-g8g9/locations/lunkers-lair.json","fd27da10b1"],
+    ["data/pokedb-encounters-g8g9/locations/maniac-tunnel.json","6d914a8a89"],
+    ["data/pokedb-encounters-g8g9/locations/master-dojo.json","78c1a57258"],
+    ["data/pokedb-encounters-g8g9/locations/max-lair.json","096b03165b"],
+    ["data/pokedb-encounters-g8g9/locations/meetup-spot.json","f873b0f755"],
+    ["data/pokedb-encounters-g8g9/locations/moonview-arena.json","435ecf03f1"],
+    ["data/pokedb-encounters-g8g9/locations/motostoke-outskirts.json","a285fea3e7"],
+    ["data/pokedb-encounters-g8g9/locations/motostoke-riverbank.json","bd68455342"],
+    ["data/pokedb-encounters-g8g9/locations/motostoke.json","069aa62c5b"],
+    ["data/pokedb-encounters-g8g9/locations/mount-coronet.json","ef21cf55f8"],
+    ["data/pokedb-encounters-g8g9/locations/mt-moon.json","054dfe4f1e"],
+    ["data/pokedb-encounters-g8g9/locations/naranja-academy.json","d319c9bdcb"],
+    ["data/pokedb-encounters-g8g9/locations/natures-pantry.json","e2e8835cf6"],
+    ["data/pokedb-encounters-g8g9/locations/newmoon-island.json","5341f13624"],
+    ["data/pokedb-encounters-g8g9/locations/north-lake-miloch.json","6e00a1b9f0"],
+    ["data/pokedb-encounters-g8g9/locations/north-paldean-sea.json","c5e6c4cc4e"],
+    ["data/pokedb-encounters-g8g9/locations/north-province-area-one.json","5e47eddaed"],
+    ["data/pokedb-encounters-g8g9/locations/north-province-area-three.json","c2ccc1e325"],
+    ["data/pokedb-encounters-g8g9/locations/north-province-area-two.json","f999b4e427"],
+    ["data/pokedb-encounters-g8g9/locations/obsidian-falls.json","8561087bb7"],
+    ["data/pokedb-encounters-g8g9/locations/old-cemetery.json","38f2a22f2b"],
+    ["data/pokedb-encounters-g8g9/locations/old-chateau.json","5efaeb1200"],
+    ["data/pokedb-encounters-g8g9/locations/oreburgh-city.json","247b4b7e95"],
+    ["data/pokedb-encounters-g8g9/locations/oreburgh-gate.json","97f353cb20"],
+    ["data/pokedb-encounters-g8g9/locations/oreburgh-mine.json","1108b3c27f"],
+    ["data/pokedb-encounters-g8g9/locations/oreburgh-mining-museum.json","9721d547c7"],
+    ["data/pokedb-encounters-g8g9/locations/oreburrow-tunnel.json","0d017e64fd"],
+    ["data/pokedb-encounters-g8g9/locations/pastoria-city.json","ac494adfa9"],
+    ["data/pokedb-encounters-g8g9/locations/path-to-the-peak.json","ec5953056f"],
+    ["data/pokedb-encounters-g8g9/locations/pearl-settlement.json","b00ba43469"],
+    ["data/pokedb-encounters-g8g9/locations/poco-path.json","ef33ea14ac"],
+    ["data/pokedb-encounters-g8g9/locations/pokemon-league-paldea.json","56ddff9257"],
+    ["data/pokedb-encounters-g8g9/locations/pokemon-league-sinnoh.json","1a8638ddbe"],
+    ["data/pokedb-encounters-g8g9/locations/pokemon-mansion-kanto.json","43b3c299a9"],
+    ["data/pokedb-encounters-g8g9/locations/pokemon-tower.json","cd273024ee"],
+    ["data/pokedb-encounters-g8g9/locations/postwick.json","259daad42a"],
+    ["data/pokedb-encounters-g8g9/locations/potbottom-desert.json","2ae35d6f8d"],
+    ["data/pokedb-encounters-g8g9/locations/power-plant.json","1146a8b0b7"],
+    ["data/pokedb-encounters-g8g9/locations/primeval-grotto.json","0474f8b67d"],
+    ["data/pokedb-encounters-g8g9/locations/professor-oaks-laboratory.json","98e1a9e237"],
+    ["data/pokedb-encounters-g8g9/locations/ramanas-island.json","401f56fa13"],
+    ["data/pokedb-encounters-g8g9/locations/ramanas-park.json","7bfc563075"],
+    ["data/pokedb-encounters-g8g9/locations/random-around-paldea.json","60baf8da4d"],
+    ["data/pokedb-encounters-g8g9/locations/ravaged-path.json","c6be099721"],
+    ["data/pokedb-encounters-g8g9/locations/resort-area.json","cbf14a751c"],
+    ["data/pokedb-encounters-g8g9/locations/riverbank-cave.json","e2c457cf04"],
+    ["data/pokedb-encounters-g8g9/locations/roaring-sea-caves.json","5275537321"],
+    ["data/pokedb-encounters-g8g9/locations/rock-peak-ruins-galar.json","e5e7fd7d12"],
+    ["data/pokedb-encounters-g8g9/locations/rock-tunnel.json","c82daf7355"],
+    ["data/pokedb-encounters-g8g9/locations/rocky-cave.json","802781e4d4"],
+    ["data/pokedb-encounters-g8g9/locations/rolling-fields.json","831bdac681"],
+    ["data/pokedb-encounters-g8g9/locations/route-01-kanto.json","174221bb34"],
+    ["data/pokedb-encounters-g8g9/locations/route-02-kanto.json","55d7e41cb9"],
+    ["data/pokedb-encounters-g8g9/locations/route-03-kanto.json","3d9e4b9a83"],
+    ["data/pokedb-encounters-g8g9/locations/route-04-kanto.json","95b9317895"],
+    ["data/pokedb-encounters-g8g9/locations/route-05-kanto.json","6e1871857e"],
+    ["data/pokedb-encounters-g8g9/locations/route-06-kanto.json","601eca4c4c"],
+    ["data/pokedb-encounters-g8g9/locations/route-07-kanto.json","8afcd2f256"],
+    ["data/pokedb-encounters-g8g9/locations/route-08-kanto.json","56cf217f9a"],
+    ["data/pokedb-encounters-g8g9/locations/route-09-kanto.json","32ab60e65e"],
+    ["data/pokedb-encounters-g8g9/locations/route-10-kanto.json","1eecc0fd0f"],
+    ["data/pokedb-encounters-g8g9/locations/route-11-kanto.json","3258fedaab"],
+    ["data/pokedb-encounters-g8g9/locations/route-12-kanto.json","231684f30b"],
+    ["data/pokedb-encounters-g8g9/locations/route-13-kanto.json","690d72c054"],
+    ["data/pokedb-encounters-g8g9/locations/route-14-kanto.json","1066960ac9"],
+    ["data/pokedb-encounters-g8g9/locations/route-15-kanto.json","f1bb94461d"],
+    ["data/pokedb-encounters-g8g9/locations/route-16-kanto.json","b125be0396"],
+    ["data/pokedb-encounters-g8g9/locations/route-17-kanto.json","37d29d3c95"],
+    ["data/pokedb-encounters-g8g9/locations/route-18-kanto.json","990a0fa0ac"],
+    ["data/pokedb-encounters-g8g9/locations/route-19-kanto.json","5b6c293886"],
+    ["data/pokedb-encounters-g8g9/locations/route-20-kanto.json","7a165202aa"],
+    ["data/pokedb-encounters-g8g9/locations/route-201-sinnoh.json","b807f8b761"],
+    ["data/pokedb-encounters-g8g9/locations/route-202-sinnoh.json","3d4359eb1f"],
+    ["data/pokedb-encounters-g8g9/locations/route-203-sinnoh.json","58ebbaee24"],
+    ["data/pokedb-encounters-g8g9/locations/route-204-sinnoh.json","bc34cf27f9"],
+    ["data/pokedb-encounters-g8g9/locations/route-205-sinnoh.json","46d111238e"],
+    ["data/pokedb-encounters-g8g9/locations/route-206-sinnoh.json","e0b2cb8440"],
+    ["data/pokedb-encounters-g8g9/locations/route-207-sinnoh.json","116a9bcc12"],
+    ["data/pokedb-encounters-g8g9/locations/route-208-sinnoh.json","8b8d7a5045"],
+    ["data/pokedb-encounters-g8g9/locations/route-209-sinnoh.json","b1987917d5"],
+    ["data/pokedb-encounters-g8g9/locations/route-21-kanto.json","78d8e63861"],
+    ["data/pokedb-encounters-g8g9/locations/route-210-sinnoh.json","a146700eca"],
+    ["data/pokedb-encounters-g8g9/locations/route-211-sinnoh.json","b28a1d19c7"],
+    ["data/pokedb-encounters-g8g9/locations/route-212-sinnoh.json","1e7028a2b0"],
+    ["data/pokedb-encounters-g8g9/locations/route-213-sinnoh.json","a585fb5a0e"],
+    ["data/pokedb-encounters-g8g9/locations/route-214-sinnoh.json","6d46d3ad93"],
+    ["data/pokedb-encounters-g8g9/locations/route-215-sinnoh.json","f99959cefd"],
+    ["data/pokedb-encounters-g8g9/locations/route-216-sinnoh.json","008af74a3d"],
+    ["data/pokedb-encounters-g8g9/locations/route-217-sinnoh.json","7a8111efa7"],
+    ["data/pokedb-encounters-g8g9/locations/route-218-sinnoh.json","b1d1c8daa0"],
+    ["data/pokedb-encounters-g8g9/locations/route-219-sinnoh.json","7e2f7a17b1"],
+    ["data/pokedb-encounters-g8g9/locations/route-22-kanto.json","2030ca3b80"],
+    ["data/pokedb-encounters-g8g9/locations/route-220-sinnoh.json","6a3ae36f6e"],
+    ["data/pokedb-encounters-g8g9/locations/route-221-sinnoh.json","ceedd10458"],
+    ["data/pokedb-encounters-g8g9/locations/route-222-sinnoh.json","ab762b7bf8"],
+    ["data/pokedb-encounters-g8g9/locations/route-223-sinnoh.json","4235087f73"],
+    ["data/pokedb-encounters-g8g9/locations/route-224-sinnoh.json","fe78b0d71b"],
+    ["data/pokedb-encounters-g8g9/locations/route-225-sinnoh.json","09cc072960"],
+    ["data/pokedb-encounters-g8g9/locations/route-226-sinnoh.json","357d11ceb4"],
+    ["data/pokedb-encounters-g8g9/locations/route-227-sinnoh.json","32070e89c8"],
+    ["data/pokedb-encounters-g8g9/locations/route-228-sinnoh.json","649e92179d"],
+    ["data/pokedb-encounters-g8g9/locations/route-229-sinnoh.json","4e15995d97"],
+    ["data/pokedb-encounters-g8g9/locations/route-23-kanto.json","d6d8cf0d8a"],
+    ["data/pokedb-encounters-g8g9/locations/route-230-sinnoh.json","554acc9cef"],
+    ["data/pokedb-encounters-g8g9/locations/route-24-kanto.json","7cb15966c3"],
+    ["data/pokedb-encounters-g8g9/locations/route-25-kanto.json","22a87ea6a2"],
+    ["data/pokedb-encounters-g8g9/locations/sacred-plaza.json","454127d16d"],
+    ["data/pokedb-encounters-g8g9/locations/saffron-city.json","9781b77dd5"],
+    ["data/pokedb-encounters-g8g9/locations/sandgem-flats.json","159a2d4764"],
+    ["data/pokedb-encounters-g8g9/locations/sands-reach.json","3b920a5aeb"],
+    ["data/pokedb-encounters-g8g9/locations/sandsear-cave.json","5a29a0576a"],
+    ["data/pokedb-encounters-g8g9/locations/scarlet-bog.json","59a2bd36f0"],
+    ["data/pokedb-encounters-g8g9/locations/seafoam-islands.json","2e207af28a"],
+    ["data/pokedb-encounters-g8g9/locations/seagrass-haven.json","6b39b764f6"],
+    ["data/pokedb-encounters-g8g9/locations/seaside-hollow.json","4f64f5b80a"],
+    ["data/pokedb-encounters-g8g9/locations/secret-hollow.json","9fafd147fc"],
+    ["data/pokedb-encounters-g8g9/locations/sendoff-spring.json","f9af2fe917"],
+    ["data/pokedb-encounters-g8g9/locations/shrouded-ruins.json","ee8da9632a"],
+    ["data/pokedb-encounters-g8g9/locations/silph-co.json","5f2958d99e"],
+    ["data/pokedb-encounters-g8g9/locations/slippery-slope.json","12e29d9a54"],
+    ["data/pokedb-encounters-g8g9/locations/sludge-mound.json","ad75b5309c"],
+    ["data/pokedb-encounters-g8g9/locations/slumbering-weald.json","26254d80ac"],
+    ["data/pokedb-encounters-g8g9/locations/snowfall-hot-spring.json","1d4ee1b957"],
+    ["data/pokedb-encounters-g8g9/locations/snowpoint-city.json","8b5f36c7e1"],
+    ["data/pokedb-encounters-g8g9/locations/snowpoint-temple.json","f973e66763"],
+    ["data/pokedb-encounters-g8g9/locations/snowslide-slope.json","18f4a4a914"],
+    ["data/pokedb-encounters-g8g9/locations/socarrat-trail.json","4004089935"],
+    ["data/pokedb-encounters-g8g9/locations/solaceon-ruins-hisui.json","204dec67fb"],
+    ["data/pokedb-encounters-g8g9/locations/solaceon-ruins-sinnoh.json","9730d8ab39"],
+    ["data/pokedb-encounters-g8g9/locations/sonorous-path.json","d8af92144d"],
+    ["data/pokedb-encounters-g8g9/locations/soothing-wetlands.json","fb2d730533"],
+    ["data/pokedb-encounters-g8g9/locations/south-lake-miloch.json","1191926f8f"],
+    ["data/pokedb-encounters-g8g9/locations/south-paldean-sea.json","af9c82ee12"],
+    ["data/pokedb-encounters-g8g9/locations/south-province-area-five.json","2b407e8efb"],
+    ["data/pokedb-encounters-g8g9/locations/south-province-area-four.json","933275bb40"],
+    ["data/pokedb-encounters-g8g9/locations/south-province-area-one.json","31ad553443"],
+    ["data/pokedb-encounters-g8g9/locations/south-province-area-six.json","d450e93d02"],
+    ["data/pokedb-encounters-g8g9/locations/south-province-area-three.json","9780a88afd"],
+    ["data/pokedb-encounters-g8g9/locations/south-province-area-two.json","b3f74b7deb"],
+    ["data/pokedb-encounters-g8g9/locations/spacious-cave.json","b008227d14"],
+    ["data/pokedb-encounters-g8g9/locations/spear-pillar.json","91ec9ca0d2"],
+    ["data/pokedb-encounters-g8g9/locations/spikemuth.json","6c735cc024"],
+    ["data/pokedb-encounters-g8g9/locations/split-decision-ruins.json","18675060a7"],
+    ["data/pokedb-encounters-g8g9/locations/spring-path-hisui.json","9bbb2ecc5b"],
+    ["data/pokedb-encounters-g8g9/locations/stargleam-cavern.json","801bd4579a"],
+    ["data/pokedb-encounters-g8g9/locations/stark-mountain.json","61508d8158"],
+    ["data/pokedb-encounters-g8g9/locations/stepping-stone-sea.json","a25dbaebc8"],
+    ["data/pokedb-encounters-g8g9/locations/still-water-cavern.json","d7f40bc01e"],
+    ["data/pokedb-encounters-g8g9/locations/stonetooth-rows.json","a6dc63d916"],
+    ["data/pokedb-encounters-g8g9/locations/stony-wilderness.json","815295ef42"],
+    ["data/pokedb-encounters-g8g9/locations/stow-on-side.json","54d180cce0"],
+    ["data/pokedb-encounters-g8g9/locations/sunlit-cavern.json","90f4c6dd0e"],
+    ["data/pokedb-encounters-g8g9/locations/sunyshore-city.json","533ddc00b9"],
+    ["data/pokedb-encounters-g8g9/locations/swampy-cave.json","b7158ab0f3"],
+    ["data/pokedb-encounters-g8g9/locations/tagtree-thicket.json","acac60a741"],
+    ["data/pokedb-encounters-g8g9/locations/temple-of-sinnoh.json","f77d64e141"],
+    ["data/pokedb-encounters-g8g9/locations/the-heartwood.json","5a91599433"],
+    ["data/pokedb-encounters-g8g9/locations/three-point-pass.json","ad6f19cf05"],
+    ["data/pokedb-encounters-g8g9/locations/tidewater-dam.json","94e91e2428"],
+    ["data/pokedb-encounters-g8g9/locations/tombolo-walk.json","0f749b4bac"],
+    ["data/pokedb-encounters-g8g9/locations/tower-summit.json","1449537a3f"],
+    ["data/pokedb-encounters-g8g9/locations/training-lowlands.json","43cea8d6b8"],
+    ["data/pokedb-encounters-g8g9/locations/tranquility-cove.json","61c60b0bb5"],
+    ["data/pokedb-encounters-g8g9/locations/trophy-garden.json","09663fc384"],
+    ["data/pokedb-encounters-g8g9/locations/tunnel-to-the-top.json","b5d1f5e31f"],
+    ["data/pokedb-encounters-g8g9/locations/turffield.json","2675cd69ea"],
+    ["data/pokedb-encounters-g8g9/locations/turnback-cave.json","6ed23c18bb"],
+    ["data/pokedb-encounters-g8g9/locations/twinleaf-town.json","444f106e0b"],
+    ["data/pokedb-encounters-g8g9/locations/typhlo-cavern.json","0480bd7843"],
+    ["data/pokedb-encounters-g8g9/locations/ursas-ring.json","1f8431bbb1"],
+    ["data/pokedb-encounters-g8g9/locations/uva-academy.json","4d795bdf06"],
+    ["data/pokedb-encounters-g8g9/locations/valley-windworks.json","889bb81e5c"],
+    ["data/pokedb-encounters-g8g9/locations/valor-lakefront.json","be45d15afb"],
+    ["data/pokedb-encounters-g8g9/locations/veilstone-cape.json","17ed78b109"],
+    ["data/pokedb-encounters-g8g9/locations/vermilion-city.json","5c2dd7199b"],
+    ["data/pokedb-encounters-g8g9/locations/victory-road-kanto.json","839b7ef10f"],
+    ["data/pokedb-encounters-g8g9/locations/victory-road-sinnoh.json","570a73d5a8"],
+    ["data/pokedb-encounters-g8g9/locations/viridian-forest.json","18326fd459"],
+    ["data/pokedb-encounters-g8g9/locations/volcanic-cave.json","0aa0e5e8e9"],
+    ["data/pokedb-encounters-g8g9/locations/warm-up-tunnel.json","c746766524"],
+    ["data/pokedb-encounters-g8g9/locations/watchtower-ruins.json","da4feb3d97"],
+    ["data/pokedb-encounters-g8g9/locations/wayward-cave.json","5720ea7c6a"],
+    ["data/pokedb-encounters-g8g9/locations/wayward-wood.json","58d254e95a"],
+    ["data/pokedb-encounters-g8g9/locations/wedgehurst.json","39ae772652"],
+    ["data/pokedb-encounters-g8g9/locations/west-lake-axewell.json","1bead997e3"],
+    ["data/pokedb-encounters-g8g9/locations/west-paldean-sea.json","91af866079"],
+    ["data/pokedb-encounters-g8g9/locations/west-province-area-one.json","2de3040c5a"],
+    ["data/pokedb-encounters-g8g9/locations/west-province-area-three.json","aec90c7bf7"],
+    ["data/pokedb-encounters-g8g9/locations/west-province-area-two.json","301dd80d07"],
+    ["data/pokedb-encounters-g8g9/locations/whiteout-cave.json","4f127ee865"],
+    ["data/pokedb-encounters-g8g9/locations/whiteout-valley.json","b7f1ec6761"],
+    ["data/pokedb-encounters-g8g9/locations/windbreak-stand.json","9f1099424b"],
+    ["data/pokedb-encounters-g8g9/locations/windswept-run.json","b675d11af1"],
+    ["data/pokedb-encounters-g8g9/locations/workout-sea.json","2b8ac32585"],
+    ["data/pokedb-encounters-g8g9/locations/worn-bridge.json","8d84a2fa1b"],
+    ["data/pokedb-encounters-g8g9/locations/wyndon.json","83bfde247d"],
+    ["data/pokedb-encounters-g8g9/locations/zero-lab.json","3d03feeb1d"],
+    ["data/pokedb-encounters-g8g9/manifest.json","c81428ab8b"],
+    ["data/pokedb-encounters-g8g9/pokemon/abomasnow.json","58a106e9ab"],
+    ["data/pokedb-encounters-g8g9/pokemon/abra.json","1f99a042ee"],
+    ["data/pokedb-encounters-g8g9/pokemon/absol.json","5273c92aec"],
+    ["data/pokedb-encounters-g8g9/pokemon/accelgor.json","b18420d10f"],
+    ["data/pokedb-encounters-g8g9/pokemon/aegislash-blade.json","7ccd8fc628"],
+    ["data/pokedb-encounters-g8g9/pokemon/aerodactyl.json","a545293dab"],
+    ["data/pokedb-encounters-g8g9/pokemon/aggron.json","75e19217be"],
+    ["data/pokedb-encounters-g8g9/pokemon/aipom.json","2462c0f80d"],
+    ["data/pokedb-encounters-g8g9/pokemon/alakazam.json","5a471adce0"],
+    ["data/pokedb-encounters-g8g9/pokemon/alcremie-gigantamax.json","1bb94e172c"],
+    ["data/pokedb-encounters-g8g9/pokemon/alcremie.json","6f93a6174a"],
+    ["data/pokedb-encounters-g8g9/pokemon/alomomola.json","947ace3789"],
+    ["data/pokedb-encounters-g8g9/pokemon/altaria.json","6c5cd4fa21"],
+    ["data/pokedb-encounters-g8g9/pokemon/amaura.json","9f810cba4c"],
+    ["data/pokedb-encounters-g8g9/pokemon/ambipom.json","40b95d63c2"],
+    ["data/pokedb-encounters-g8g9/pokemon/amoonguss.json","df48fea3cc"],
+    ["data/pokedb-encounters-g8g9/pokemon/ampharos.json","edb63b07f4"],
+    ["data/pokedb-encounters-g8g9/pokemon/annihilape.json","3ec727b12f"],
+    ["data/pokedb-encounters-g8g9/pokemon/anorith.json","bdf318ff40"],
+    ["data/pokedb-encounters-g8g9/pokemon/appletun-gigantamax.json","549d8c9f5e"],
+    ["data/pokedb-encounters-g8g9/pokemon/appletun.json","a6a7013d30"],
+    ["data/pokedb-encounters-g8g9/pokemon/applin.json","1d26cc4d7d"],
+    ["data/pokedb-encounters-g8g9/pokemon/araquanid.json","7c10516d57"],
+    ["data/pokedb-encounters-g8g9/pokemon/arboliva.json","ca11b04a4d"],
+    ["data/pokedb-encounters-g8g9/pokemon/arcanine.json","2203aa0b77"],
+    ["data/pokedb-encounters-g8g9/pokemon/arceus.json","7bd20df413"],
+    ["data/pokedb-encounters-g8g9/pokemon/archen.json","887728b9c8"],
+    ["data/pokedb-encounters-g8g9/pokemon/arctibax.json","bf8080d19c"],
+    ["data/pokedb-encounters-g8g9/pokemon/arctovish.json","a11e5e66b5"],
+    ["data/pokedb-encounters-g8g9/pokemon/arctozolt.json","a2ef24dec2"],
+    ["data/pokedb-encounters-g8g9/pokemon/ariados.json","c426f6f917"],
+    ["data/pokedb-encounters-g8g9/pokemon/armaldo.json","82e3617567"],
+    ["data/pokedb-encounters-g8g9/pokemon/armarouge.json","880f75d73f"],
+    ["data/pokedb-encounters-g8g9/pokemon/aromatisse.json","01a699743d"],
+    ["data/pokedb-encounters-g8g9/pokemon/aron.json","c0d7d5618e"],
+    ["data/pokedb-encounters-g8g9/pokemon/arrokuda.json","023dd71fe4"],
+    ["data/pokedb-encounters-g8g9/pokemon/articuno.json","14101247ec"],
+    ["data/pokedb-encounters-g8g9/pokemon/audino.json","77e6038858"],
+    ["data/pokedb-encounters-g8g9/pokemon/aurorus.json","34fea49463"],
+    ["data/pokedb-encounters-g8g9/pokemon/avalugg-hisuian.json","ad1d2c797b"],
+    ["data/pokedb-encounters-g8g9/pokemon/avalugg.json","229317e856"],
+    ["data/pokedb-encounters-g8g9/pokemon/axew.json","4210f4727d"],
+    ["data/pokedb-encounters-g8g9/pokemon/azelf.json","0b2d741d64"],
+    ["data/pokedb-encounters-g8g9/pokemon/azumarill.json","5305f13fe7"],
+    ["data/pokedb-encounters-g8g9/pokemon/azurill.json","240310d7ca"],
+    ["data/pokedb-encounters-g8g9/pokemon/bagon.json","f2614f38ea"],
+    ["data/pokedb-encounters-g8g9/pokemon/baltoy.json","a17c1307d5"],
+    ["data/pokedb-encounters-g8g9/pokemon/banette.json","25a6b46d22"],
+    ["data/pokedb-encounters-g8g9/pokemon/barbaracle.json","487979366a"],
+    ["data/pokedb-encounters-g8g9/pokemon/barboach.json","0d04a3664d"],
+    ["data/pokedb-encounters-g8g9/pokemon/barraskewda.json","a415617d87"],
+    ["data/pokedb-encounters-g8g9/pokemon/basculin-blue-stripe.json","0df9cd7f9f"],
+    ["data/pokedb-encounters-g8g9/pokemon/basculin-red-stripe.json","c21c87a0c0"],
+    ["data/pokedb-encounters-g8g9/pokemon/basculin-white-stripe.json","d1b46a2373"],
+    ["data/pokedb-encounters-g8g9/pokemon/bastiodon.json","19f08e9e40"],
+    ["data/pokedb-encounters-g8g9/pokemon/baxcalibur.json","33b51d82d4"],
+    ["data/pokedb-encounters-g8g9/pokemon/beartic.json","af7fe7b00d"],
+    ["data/pokedb-encounters-g8g9/pokemon/beautifly.json","089c12e21e"],
+    ["data/pokedb-encounters-g8g9/pokemon/beedrill.json","ddc301e8ed"],
+    ["data/pokedb-encounters-g8g9/pokemon/beheeyem.json","9fdd925773"],
+    ["data/pokedb-encounters-g8g9/pokemon/beldum.json","e76210ea3c"],
+    ["data/pokedb-encounters-g8g9/pokemon/bellibolt.json","ceb54743b7"],
+    ["data/pokedb-encounters-g8g9/pokemon/bellossom.json","b8d300769f"],
+    ["data/pokedb-encounters-g8g9/pokemon/bellsprout.json","831c402d9f"],
+    ["data/pokedb-encounters-g8g9/pokemon/bergmite.json","df710298c1"],
+    ["data/pokedb-encounters-g8g9/pokemon/bewear.json","c5570abfc5"],
+    ["data/pokedb-encounters-g8g9/pokemon/bibarel.json","8ac11b1691"],
+    ["data/pokedb-encounters-g8g9/pokemon/bidoof.json","2a2dbe070c"],
+    ["data/pokedb-encounters-g8g9/pokemon/binacle.json","0e53d4d36d"],
+    ["data/pokedb-encounters-g8g9/pokemon/bisharp.json","58de6bc6ae"],
+    ["data/pokedb-encounters-g8g9/pokemon/blacephalon.json","92cbc9e886"],
+    ["data/pokedb-encounters-g8g9/pokemon/blastoise-gigantamax.json","ef7973b14d"],
+    ["data/pokedb-encounters-g8g9/pokemon/blastoise.json","3ea2578cd6"],
+    ["data/pokedb-encounters-g8g9/pokemon/blaziken.json","4801ab20ee"],
+    ["data/pokedb-encounters-g8g9/pokemon/blipbug.json","0fd2745453"],
+    ["data/pokedb-encounters-g8g9/pokemon/blissey.json","d3b5ab475d"],
+    ["data/pokedb-encounters-g8g9/pokemon/boldore.json","74764fac6e"],
+    ["data/pokedb-encounters-g8g9/pokemon/boltund.json","c2057c7733"],
+    ["data/pokedb-encounters-g8g9/pokemon/bombirdier.json","e8ee3b1946"],
+    ["data/pokedb-encounters-g8g9/pokemon/bonsly.json","60775eb2ff"],
+    ["data/pokedb-encounters-g8g9/pokemon/bouffalant.json","e236f3cb2f"],
+    ["data/pokedb-encounters-g8g9/pokemon/bounsweet.json","afd5b4b127"],
+    ["data/pokedb-encounters-g8g9/pokemon/brambleghast.json","b8e66d8be4"],
+    ["data/pokedb-encounters-g8g9/pokemon/bramblin.json","7547e0f273"],
+    ["data/pokedb-encounters-g8g9/pokemon/braviary-hisuian.json","ff6988396b"],
+    ["data/pokedb-encounters-g8g9/pokemon/braviary.json","e9beff61f0"],
+    ["data/pokedb-encounters-g8g9/pokemon/breloom.json","515fabfa67"],
+    ["data/pokedb-encounters-g8g9/pokemon/bronzong.json","9b6f4f94bc"],
+    ["data/pokedb-encounters-g8g9/pokemon/bronzor.json","f9d41dcfbc"],
+    ["data/pokedb-encounters-g8g9/pokemon/brute-bonnet.json","1973a88e63"],
+    ["data/pokedb-encounters-g8g9/pokemon/bruxish.json","da3e6a2d6e"],
+    ["data/pokedb-encounters-g8g9/pokemon/budew.json","63aff0eb6d"],
+    ["data/pokedb-encounters-g8g9/pokemon/buizel.json","b79499481e"],
+    ["data/pokedb-encounters-g8g9/pokemon/bulbasaur.json","d93b240e97"],
+    ["data/pokedb-encounters-g8g9/pokemon/buneary.json","ea8be62b3b"],
+    ["data/pokedb-encounters-g8g9/pokemon/bunnelby.json","bdb5aa9c3f"],
+    ["data/pokedb-encounters-g8g9/pokemon/burmy-plant-cloak.json","5788c03bef"],
+    ["data/pokedb-encounters-g8g9/pokemon/burmy-sandy-cloak.json","9aa105b538"],
+    ["data/pokedb-encounters-g8g9/pokemon/burmy-trash-cloak.json","4349f70163"],
+    ["data/pokedb-encounters-g8g9/pokemon/butterfree-gigantamax.json","ce4d75c212"],
+    ["data/pokedb-encounters-g8g9/pokemon/butterfree.json","66545021db"],
+    ["data/pokedb-encounters-g8g9/pokemon/buzzwole.json","6cdce28c42"],
+    ["data/pokedb-encounters-g8g9/pokemon/cacnea.json","5e32960570"],
+    ["data/pokedb-encounters-g8g9/pokemon/cacturne.json","c43d98c0b0"],
+    ["data/pokedb-encounters-g8g9/pokemon/calyrex-ice-rider.json","b386b8ea58"],
+    ["data/pokedb-encounters-g8g9/pokemon/calyrex-shadow-rider.json","a356fba433"],
+    ["data/pokedb-encounters-g8g9/pokemon/calyrex.json","b8d55af766"],
+    ["data/pokedb-encounters-g8g9/pokemon/camerupt.json","e510a5dfee"],
+    ["data/pokedb-encounters-g8g9/pokemon/capsakid.json","75a8e87f1e"],
+    ["data/pokedb-encounters-g8g9/pokemon/carbink.json","79146387fd"],
+    ["data/pokedb-encounters-g8g9/pokemon/carkol.json","adf915d671"],
+    ["data/pokedb-encounters-g8g9/pokemon/carnivine.json","0a5fb2b320"],
+    ["data/pokedb-encounters-g8g9/pokemon/carracosta.json","566adfe202"],
+    ["data/pokedb-encounters-g8g9/pokemon/carvanha.json","a872e3a207"],
+    ["data/pokedb-encounters-g8g9/pokemon/cascoon.json","0ac79ed368"],
+    ["data/pokedb-encounters-g8g9/pokemon/castform.json","38b4912e93"],
+    ["data/pokedb-encounters-g8g9/pokemon/caterpie.json","ba392807ac"],
+    ["data/pokedb-encounters-g8g9/pokemon/celesteela.json","da25fe2abd"],
+    ["data/pokedb-encounters-g8g9/pokemon/centiskorch-gigantamax.json","63a3934907"],
+    ["data/pokedb-encounters-g8g9/pokemon/centiskorch.json","8881c132ae"],
+    ["data/pokedb-encounters-g8g9/pokemon/ceruledge.json","f5f37afb6b"],
+    ["data/pokedb-encounters-g8g9/pokemon/cetitan.json","c2ce16952a"],
+    ["data/pokedb-encounters-g8g9/pokemon/cetoddle.json","3c9fe2936e"],
+    ["data/pokedb-encounters-g8g9/pokemon/chandelure.json","b3960a09d7"],
+    ["data/pokedb-encounters-g8g9/pokemon/chansey.json","a4f737cc10"],
+    ["data/pokedb-encounters-g8g9/pokemon/charcadet.json","795ba79808"],
+    ["data/pokedb-encounters-g8g9/pokemon/charizard-gigantamax.json","63447e16d5"],
+    ["data/pokedb-encounters-g8g9/pokemon/charizard.json","61f884db5d"],
+    ["data/pokedb-encounters-g8g9/pokemon/charjabug.json","d6f2369c63"],
+    ["data/pokedb-encounters-g8g9/pokemon/charmander.json","2f91bd4edf"],
+    ["data/pokedb-encounters-g8g9/pokemon/charmeleon.json","57b7274fb4"],
+    ["data/pokedb-encounters-g8g9/pokemon/chatot.json","a0b0fe4763"],
+    ["data/pokedb-encounters-g8g9/pokemon/cherrim-overcast.json","c98ac80571"],
+    ["data/pokedb-encounters-g8g9/pokemon/cherubi.json","991fd051bf"],
+    ["data/pokedb-encounters-g8g9/pokemon/chewtle.json","58700d00f3"],
+    ["data/pokedb-encounters-g8g9/pokemon/chi-yu.json","d0d1be0678"],
+    ["data/pokedb-encounters-g8g9/pokemon/chien-pao.json","207db8bdd3"],
+    ["data/pokedb-encounters-g8g9/pokemon/chikorita.json","2427226ce2"],
+    ["data/pokedb-encounters-g8g9/pokemon/chimchar.json","56bb727828"],
+    ["data/pokedb-encounters-g8g9/pokemon/chimecho.json","0df4b5e4d8"],
+    ["data/pokedb-encounters-g8g9/pokemon/chinchou.json","577354627d"],
+    ["data/pokedb-encounters-g8g9/pokemon/chingling.json","dac28d8144"],
+    ["data/pokedb-encounters-g8g9/pokemon/cinccino.json","6fd0c07700"],
+    ["data/pokedb-encounters-g8g9/pokemon/clamperl.json","84bc339361"],
+    ["data/pokedb-encounters-g8g9/pokemon/clauncher.json","8b259094cf"],
+    ["data/pokedb-encounters-g8g9/pokemon/clawitzer.json","7864e62171"],
+    ["data/pokedb-encounters-g8g9/pokemon/claydol.json","7ef993dae0"],
+    ["data/pokedb-encounters-g8g9/pokemon/clefable.json","ddf998f42e"],
+    ["data/pokedb-encounters-g8g9/pokemon/clefairy.json","cc1a55cabb"],
+    ["data/pokedb-encounters-g8g9/pokemon/cleffa.json","119c735dc6"],
+    ["data/pokedb-encounters-g8g9/pokemon/clobbopus.json","757fae5459"],
+    ["data/pokedb-encounters-g8g9/pokemon/clodsire.json","02e90c3602"],
+    ["data/pokedb-encounters-g8g9/pokemon/cloyster.json","34cba137f1"],
+    ["data/pokedb-encounters-g8g9/pokemon/coalossal-gigantamax.json","1ccad11e6c"],
+    ["data/pokedb-encounters-g8g9/pokemon/coalossal.json","00470581d1"],
+    ["data/pokedb-encounters-g8g9/pokemon/cobalion.json","55b4b34dc8"],
+    ["data/pokedb-encounters-g8g9/pokemon/cofagrigus.json","e6db69e20d"],
+    ["data/pokedb-encounters-g8g9/pokemon/combee.json","b77862d664"],
+    ["data/pokedb-encounters-g8g9/pokemon/combusken.json","3abbfb071c"],
+    ["data/pokedb-encounters-g8g9/pokemon/comfey.json","d08e5cabf0"],
+    ["data/pokedb-encounters-g8g9/pokemon/conkeldurr.json","6b0905e7e0"],
+    ["data/pokedb-encounters-g8g9/pokemon/copperajah-gigantamax.json","82affd7613"],
+    ["data/pokedb-encounters-g8g9/pokemon/copperajah.json","f220e42c9b"],
+    ["data/pokedb-encounters-g8g9/pokemon/corphish.json","d0cbbdf7d5"],
+    ["data/pokedb-encounters-g8g9/pokemon/corsola-galarian.json","1c9fd9a237"],
+    ["data/pokedb-encounters-g8g9/pokemon/corsola.json","9b5da61b7c"],
+    ["data/pokedb-encounters-g8g9/pokemon/corviknight-gigantamax.json","454025fd21"],
+    ["data/pokedb-encounters-g8g9/pokemon/corviknight.json","7916b7854a"],
+    ["data/pokedb-encounters-g8g9/pokemon/corvisquire.json","31fd5ed02e"],
+    ["data/pokedb-encounters-g8g9/pokemon/cosmog.json","64f51697de"],
+    ["data/pokedb-encounters-g8g9/pokemon/cottonee.json","38ecb6d35d"],
+    ["data/pokedb-encounters-g8g9/pokemon/crabominable.json","39db6e55dc"],
+    ["data/pokedb-encounters-g8g9/pokemon/crabrawler.json","6259d74452"],
+    ["data/pokedb-encounters-g8g9/pokemon/cradily.json","16d6c9b1bf"],
+    ["data/pokedb-encounters-g8g9/pokemon/cramorant.json","c5ca19b1b8"],
+    ["data/pokedb-encounters-g8g9/pokemon/cranidos.json","cff21a7636"],
+    ["data/pokedb-encounters-g8g9/pokemon/crawdaunt.json","53c8db9c06"],
+    ["data/pokedb-encounters-g8g9/pokemon/cresselia.json","37dfdbf6cb"],
+    ["data/pokedb-encounters-g8g9/pokemon/croagunk.json","8c22b80ac9"],
+    ["data/pokedb-encounters-g8g9/pokemon/crobat.json","26fcd6b56d"],
+    ["data/pokedb-encounters-g8g9/pokemon/crustle.json","291f666b46"],
+    ["data/pokedb-encounters-g8g9/pokemon/cryogonal.json","ed395a0f67"],
+    ["data/pokedb-encounters-g8g9/pokemon/cubchoo.json","b23604c4f3"],
+    ["data/pokedb-encounters-g8g9/pokemon/cubone.json","6317a03e2b"],
+    ["data/pokedb-encounters-g8g9/pokemon/cufant.json","0b9583c9cb"],
+    ["data/pokedb-encounters-g8g9/pokemon/cursola.json","422e1a4021"],
+    ["data/pokedb-encounters-g8g9/pokemon/cutiefly.json","c97d09e74f"],
+    ["data/pokedb-encounters-g8g9/pokemon/cyclizar.json","ffeb2bd103"],
+    ["data/pokedb-encounters-g8g9/pokemon/cyndaquil.json","e090b47e56"],
+    ["data/pokedb-encounters-g8g9/pokemon/dachsbun.json","a3ac20acf6"],
+    ["data/pokedb-encounters-g8g9/pokemon/darkrai.json","e5e41816aa"],
+    ["data/pokedb-encounters-g8g9/pokemon/darmanitan-galarian.json","1edbe6c4a9"],
+    ["data/pokedb-encounters-g8g9/pokemon/dartrix.json","0b64b9ffe1"],
+    ["data/pokedb-encounters-g8g9/pokemon/darumaka-galarian.json","7f50d8cdec"],
+    ["data/pokedb-encounters-g8g9/pokemon/darumaka.json","c47870c34e"],
+    ["data/pokedb-encounters-g8g9/pokemon/decidueye-hisuian.json","920283212a"],
+    ["data/pokedb-encounters-g8g9/pokemon/dedenne.json","be166bd476"],
+    ["data/pokedb-encounters-g8g9/pokemon/deerling-autumn.json","7035d61269"],
+    ["data/pokedb-encounters-g8g9/pokemon/deerling-spring.json","e7b3be9346"],
+    ["data/pokedb-encounters-g8g9/pokemon/deerling-summer.json","0ef6765c12"],
+    ["data/pokedb-encounters-g8g9/pokemon/deerling-winter.json","37c881f260"],
+    ["data/pokedb-encounters-g8g9/pokemon/deino.json","54c7a0d4a2"],
+    ["data/pokedb-encounters-g8g9/pokemon/delibird.json","30ad68e717"],
+    ["data/pokedb-encounters-g8g9/pokemon/dewgong.json","441d342a4c"],
+    ["data/pokedb-encounters-g8g9/pokemon/dewott.json","7db30e7645"],
+    ["data/pokedb-encounters-g8g9/pokemon/dewpider.json","a1ae8eb9f9"],
+    ["data/pokedb-encounters-g8g9/pokemon/dhelmise.json","c9a2a036d1"],
+    ["data/pokedb-encounters-g8g9/pokemon/dialga-origin.json","c7e4308f29"],
+    ["data/pokedb-encounters-g8g9/pokemon/dialga.json","ff8a1e8b88"],
+    ["data/pokedb-encounters-g8g9/pokemon/diggersby.json","a5fffce49f"],
+    ["data/pokedb-encounters-g8g9/pokemon/diglett-alolan.json","9aaf17f77b"],
+    ["data/pokedb-encounters-g8g9/pokemon/diglett.json","6b27ecdeae"],
+    ["data/pokedb-encounters-g8g9/pokemon/ditto.json","8191fd9a23"],
+    ["data/pokedb-encounters-g8g9/pokemon/dodrio.json","6c8d310ad5"],
+    ["data/pokedb-encounters-g8g9/pokemon/doduo.json","8d9dc6e753"],
+    ["data/pokedb-encounters-g8g9/pokemon/dolliv.json","ef88eced24"],
+    ["data/pokedb-encounters-g8g9/pokemon/dondozo.json","82ed8a32fd"],
+    ["data/pokedb-encounters-g8g9/pokemon/donphan.json","8d64edf974"],
+    ["data/pokedb-encounters-g8g9/pokemon/dottler.json","fa7205152b"],
+    ["data/pokedb-encounters-g8g9/pokemon/doublade.json","fdda6da1f1"],
+    ["data/pokedb-encounters-g8g9/pokemon/dracovish.json","76e30b0049"],
+    ["data/pokedb-encounters-g8g9/pokemon/dracozolt.json","0cdf94d81d"],
+    ["data/pokedb-encounters-g8g9/pokemon/dragalge.json","1867cb50b0"],
+    ["data/pokedb-encounters-g8g9/pokemon/dragapult.json","89bc4cb8e7"],
+    ["data/pokedb-encounters-g8g9/pokemon/dragonair.json","e4af17bc51"],
+    ["data/pokedb-encounters-g8g9/pokemon/dragonite.json","ca2420258b"],
+    ["data/pokedb-encounters-g8g9/pokemon/drakloak.json","bc17f0ada5"],
+    ["data/pokedb-encounters-g8g9/pokemon/drampa.json","53072e651e"],
+    ["data/pokedb-encounters-g8g9/pokemon/drapion.json","2bd4efb409"],
+    ["data/pokedb-encounters-g8g9/pokemon/dratini.json","6e2ea41988"],
+    ["data/pokedb-encounters-g8g9/pokemon/drednaw-gigantamax.json","d10ddbb285"],
+    ["data/pokedb-encounters-g8g9/pokemon/drednaw.json","b67e5f6d64"],
+    ["data/pokedb-encounters-g8g9/pokemon/dreepy.json","3aa48160d5"],
+    ["data/pokedb-encounters-g8g9/pokemon/drifblim.json","eb8d7382e6"],
+    ["data/pokedb-encounters-g8g9/pokemon/drifloon.json","fd92f2af9f"],
+    ["data/pokedb-encounters-g8g9/pokemon/drilbur.json","90397c0979"],
+    ["data/pokedb-encounters-g8g9/pokemon/drowzee.json","3ba829d693"],
+    ["data/pokedb-encounters-g8g9/pokemon/druddigon.json","4642b79353"],
+    ["data/pokedb-encounters-g8g9/pokemon/dubwool.json","9615e49549"],
+    ["data/pokedb-encounters-g8g9/pokemon/dudunsparce-two.json","cffde6b47a"],
+    ["data/pokedb-encounters-g8g9/pokemon/dugtrio-alolan.json","0006fbd236"],
+    ["data/pokedb-encounters-g8g9/pokemon/dugtrio.json","619647298a"],
+    ["data/pokedb-encounters-g8g9/pokemon/dunsparce.json","885e7b6d5c"],
+    ["data/pokedb-encounters-g8g9/pokemon/duosion.json","a61e1a06aa"],
+    ["data/pokedb-encounters-g8g9/pokemon/duraludon-gigantamax.json","e26f8ac8bc"],
+    ["data/pokedb-encounters-g8g9/pokemon/duraludon.json","d72208e0de"],
+    ["data/pokedb-encounters-g8g9/pokemon/durant.json","0b600af092"],
+    ["data/pokedb-encounters-g8g9/pokemon/dusclops.json","e8dca033c0"],
+    ["data/pokedb-encounters-g8g9/pokemon/dusknoir.json","e4dd834b68"],
+    ["data/pokedb-encounters-g8g9/pokemon/duskull.json","79dbc792be"],
+    ["data/pokedb-encounters-g8g9/pokemon/dustox.json","b7b224f074"],
+    ["data/pokedb-encounters-g8g9/pokemon/dwebble.json","8129898c02"],
+    ["data/pokedb-encounters-g8g9/pokemon/eelektrik.json","fbaa4d060b"],
+    ["data/pokedb-encounters-g8g9/pokemon/eelektross.json","8ea60af673"],
+    ["data/pokedb-encounters-g8g9/pokemon/eevee-gigantamax.json","b9f5458b3e"],
+    ["data/pokedb-encounters-g8g9/pokemon/eevee-partner.json","d3f85c3de3"],
+    ["data/pokedb-encounters-g8g9/pokemon/eevee.json","a228ed08e1"],
+    ["data/pokedb-encounters-g8g9/pokemon/eiscue-ice-face.json","77933d860f"],
+    ["data/pokedb-encounters-g8g9/pokemon/ekans.json","52f443350d"],
+    ["data/pokedb-encounters-g8g9/pokemon/eldegoss.json","f1c8605c90"],
+    ["data/pokedb-encounters-g8g9/pokemon/electabuzz.json","ede09880d3"],
+    ["data/pokedb-encounters-g8g9/pokemon/electivire.json","e1483cb6bb"],
+    ["data/pokedb-encounters-g8g9/pokemon/electrike.json","8fc3af18bc"],
+    ["data/pokedb-encounters-g8g9/pokemon/electrode.json","c3ca7344f5"],
+    ["data/pokedb-encounters-g8g9/pokemon/elekid.json","b6eb525957"],
+    ["data/pokedb-encounters-g8g9/pokemon/elgyem.json","cfeb0f0d8b"],
+    ["data/pokedb-encounters-g8g9/pokemon/emolga.json","ed08a74921"],
+    ["data/pokedb-encounters-g8g9/pokemon/empoleon.json","ad771ad2bb"],
+    ["data/pokedb-encounters-g8g9/pokemon/enamorus-incarnate.json","240348e86e"],
+    ["data/pokedb-encounters-g8g9/pokemon/entei.json","4394c7804a"],
+    ["data/pokedb-encounters-g8g9/pokemon/escavalier.json","1ea5203a77"],
+    ["data/pokedb-encounters-g8g9/pokemon/espathra.json","f9fa28b32d"],
+    ["data/pokedb-encounters-g8g9/pokemon/espeon.json","91212fa55c"],
+    ["data/pokedb-encounters-g8g9/pokemon/espurr.json","6b7e51b3aa"],
+    ["data/pokedb-encounters-g8g9/pokemon/eternatus-eternamax.json","32dc4e7432"],
+    ["data/pokedb-encounters-g8g9/pokemon/eternatus.json","1befa083ab"],
+    ["data/pokedb-encounters-g8g9/pokemon/excadrill.json","de096b6394"],
+    ["data/pokedb-encounters-g8g9/pokemon/exeggcute.json","8c0c961791"],
+    ["data/pokedb-encounters-g8g9/pokemon/exeggutor-alolan.json","1ca671b320"],
+    ["data/pokedb-encounters-g8g9/pokemon/exeggutor.json","129755e410"],
+    ["data/pokedb-encounters-g8g9/pokemon/exploud.json","0c29b57bff"],
+    ["data/pokedb-encounters-g8g9/pokemon/falinks.json","8aa4e9e787"],
+    ["data/pokedb-encounters-g8g9/pokemon/farfetchd-galarian.json","629397118e"],
+    ["data/pokedb-encounters-g8g9/pokemon/farfetchd.json","c522ccd778"],
+    ["data/pokedb-encounters-g8g9/pokemon/farigiraf.json","4175a07457"],
+    ["data/pokedb-encounters-g8g9/pokemon/fearow.json","dc61b1e133"],
+    ["data/pokedb-encounters-g8g9/pokemon/feebas.json","219302cb5a"],
+    ["data/pokedb-encounters-g8g9/pokemon/ferroseed.json","9444bc5a8a"],
+    ["data/pokedb-encounters-g8g9/pokemon/ferrothorn.json","a348bea32e"],
+    ["data/pokedb-encounters-g8g9/pokemon/fidough.json","1cea2bb382"],
+    ["data/pokedb-encounters-g8g9/pokemon/finizen.json","0fdc19747a"],
+    ["data/pokedb-encounters-g8g9/pokemon/finneon.json","a37162452b"],
+    ["data/pokedb-encounters-g8g9/pokemon/flaaffy.json","6078116880"],
+    ["data/pokedb-encounters-g8g9/pokemon/flabebe-blue.json","f31bf4e002"],
+    ["data/pokedb-encounters-g8g9/pokemon/flabebe-orange.json","e91e1be6d1"],
+    ["data/pokedb-encounters-g8g9/pokemon/flabebe-red.json","684335d96f"],
+    ["data/pokedb-encounters-g8g9/pokemon/flabebe-white.json","cf2f30f087"],
+    ["data/pokedb-encounters-g8g9/pokemon/flabebe-yellow.json","0e002c3d93"],
+    ["data/pokedb-encounters-g8g9/pokemon/flamigo.json","ad8b878d96"],
+    ["data/pokedb-encounters-g8g9/pokemon/flapple-gigantamax.json","b015c7e51b"],
+    ["data/pokedb-encounters-g8g9/pokemon/flapple.json","eb83e6f017"],
+    ["data/pokedb-encounters-g8g9/pokemon/flareon.json","f70b71c45f"],
+    ["data/pokedb-encounters-g8g9/pokemon/fletchinder.json","27e8d92967"],
+    ["data/pokedb-encounters-g8g9/pokemon/fletchling.json","a53ad0bbb8"],
+    ["data/pokedb-encounters-g8g9/pokemon/flittle.json","a3cb6464bf"],
+    ["data/pokedb-encounters-g8g9/pokemon/floatzel.json","0dbecc8cb6"],
+    ["data/pokedb-encounters-g8g9/pokemon/floette-blue.json","9c97062e34"],
+    ["data/pokedb-encounters-g8g9/pokemon/floette-orange.json","e78e48ab96"],
+    ["data/pokedb-encounters-g8g9/pokemon/floette-red.json","8e5e26d470"],
+    ["data/pokedb-encounters-g8g9/pokemon/floette-white.json","f9c6b1f0b2"],
+    ["data/pokedb-encounters-g8g9/pokemon/floette-yellow.json","15584f56eb"],
+    ["data/pokedb-encounters-g8g9/pokemon/florges-blue.json","0829584360"],
+    ["data/pokedb-encounters-g8g9/pokemon/florges-orange.json","7a9a301cee"],
+    ["data/pokedb-encounters-g8g9/pokemon/florges-red.json","d9b813d23f"],
+    ["data/pokedb-encounters-g8g9/pokemon/florges-white.json","e1c3e67b17"],
+    ["data/pokedb-encounters-g8g9/pokemon/florges-yellow.json","8f6eb42674"],
+    ["data/pokedb-encounters-g8g9/pokemon/flutter-mane.json","25c7aaa68c"],
+    ["data/pokedb-encounters-g8g9/pokemon/flygon.json","c2ecfae58f"],
+    ["data/pokedb-encounters-g8g9/pokemon/fomantis.json","551406c3cc"],
+    ["data/pokedb-encounters-g8g9/pokemon/foongus.json","1e9d16fc77"],
+    ["data/pokedb-encounters-g8g9/pokemon/forretress.json","fc14a83f66"],
+    ["data/pokedb-encounters-g8g9/pokemon/fraxure.json","f8167a8112"],
+    ["data/pokedb-encounters-g8g9/pokemon/frigibax.json","d512de41e1"],
+    ["data/pokedb-encounters-g8g9/pokemon/frillish-male.json","183c5b60d0"],
+    ["data/pokedb-encounters-g8g9/pokemon/froslass.json","1fe03eb6d8"],
+    ["data/pokedb-encounters-g8g9/pokemon/frosmoth.json","8a35fe048b"],
+    ["data/pokedb-encounters-g8g9/pokemon/fuecoco.json","2d40dc273b"],
+    ["data/pokedb-encounters-g8g9/pokemon/furret.json","84f53d3e37"],
+    ["data/pokedb-encounters-g8g9/pokemon/gabite.json","294769feaf"],
+    ["data/pokedb-encounters-g8g9/pokemon/gallade.json","f5213540de"],
+    ["data/pokedb-encounters-g8g9/pokemon/galvantula.json","5bc8a073d2"],
+    ["data/pokedb-encounters-g8g9/pokemon/garbodor-gigantamax.json","dcfd497a76"],
+    ["data/pokedb-encounters-g8g9/pokemon/garbodor.json","cf482cb22d"],
+    ["data/pokedb-encounters-g8g9/pokemon/garchomp.json","c65dc1316b"],
+    ["data/pokedb-encounters-g8g9/pokemon/gardevoir.json","a623d8d0cf"],
+    ["data/pokedb-encounters-g8g9/pokemon/garganacl.json","87dfb3250b"],
+    ["data/pokedb-encounters-g8g9/pokemon/gastly.json","513ccf8c0d"],
+    ["data/pokedb-encounters-g8g9/pokemon/gastrodon-east-sea.json","6dddc7c9df"],
+    ["data/pokedb-encounters-g8g9/pokemon/gastrodon-west-sea.json","a0f1176e0a"],
+    ["data/pokedb-encounters-g8g9/pokemon/gengar-gigantamax.json","ba083c88de"],
+    ["data/pokedb-encounters-g8g9/pokemon/gengar.json","5a1e2abf56"],
+    ["data/pokedb-encounters-g8g9/pokemon/geodude-alolan.json","ef3b3cce20"],
+    ["data/pokedb-encounters-g8g9/pokemon/geodude.json","01ab3306a9"],
+    ["data/pokedb-encounters-g8g9/pokemon/gible.json","2498786136"],
+    ["data/pokedb-encounters-g8g9/pokemon/gigalith.json","f6855e8b76"],
+    ["data/pokedb-encounters-g8g9/pokemon/gimmighoul-chest.json","a58989f903"],
+    ["data/pokedb-encounters-g8g9/pokemon/girafarig.json","dd049867ef"],
+    ["data/pokedb-encounters-g8g9/pokemon/giratina-altered.json","65ce5e0370"],
+    ["data/pokedb-encounters-g8g9/pokemon/giratina-origin.json","8664c4dbea"],
+    ["data/pokedb-encounters-g8g9/pokemon/glaceon.json","ba41479056"],
+    ["data/pokedb-encounters-g8g9/pokemon/glalie.json","36dd362fbb"],
+    ["data/pokedb-encounters-g8g9/pokemon/glameow.json","e87873ebb4"],
+    ["data/pokedb-encounters-g8g9/pokemon/glastrier.json","3e35082d26"],
+    ["data/pokedb-encounters-g8g9/pokemon/gligar.json","a2b5e2abd5"],
+    ["data/pokedb-encounters-g8g9/pokemon/glimmet.json","af84d8b651"],
+    ["data/pokedb-encounters-g8g9/pokemon/glimmora.json","595bd08b1a"],
+    ["data/pokedb-encounters-g8g9/pokemon/gliscor.json","751c2f1d54"],
+    ["data/pokedb-encounters-g8g9/pokemon/gloom.json","52d178c085"],
+    ["data/pokedb-encounters-g8g9/pokemon/gogoat.json","fc201deffb"],
+    ["data/pokedb-encounters-g8g9/pokemon/golbat.json","ff209abdc9"],
+    ["data/pokedb-encounters-g8g9/pokemon/goldeen.json","c382882adb"],
+    ["data/pokedb-encounters-g8g9/pokemon/golduck.json","5b148cc2eb"],
+    ["data/pokedb-encounters-g8g9/pokemon/golem.json","c2fcbd647a"],
+    ["data/pokedb-encounters-g8g9/pokemon/golett.json","05a482201f"],
+    ["data/pokedb-encounters-g8g9/pokemon/golisopod.json","5681bd806b"],
+    ["data/pokedb-encounters-g8g9/pokemon/golurk.json","044d22d2a3"],
+    ["data/pokedb-encounters-g8g9/pokemon/goodra-hisuian.json","a37509489e"],
+    ["data/pokedb-encounters-g8g9/pokemon/goodra.json","e86efdf308"],
+    ["data/pokedb-encounters-g8g9/pokemon/goomy.json","e8acb4e41a"],
+    ["data/pokedb-encounters-g8g9/pokemon/gossifleur.json","f5e3bb2269"],
+    ["data/pokedb-encounters-g8g9/pokemon/gothita.json","83c9896726"],
+    ["data/pokedb-encounters-g8g9/pokemon/gothitelle.json","cad9f4c776"],
+    ["data/pokedb-encounters-g8g9/pokemon/gothorita.json","3457c2ff1b"],
+    ["data/pokedb-encounters-g8g9/pokemon/gourgeist-average.json","37ba32c19e"],
+    ["data/pokedb-encounters-g8g9/pokemon/gourgeist-large.json","8e9ddc7555"],
+    ["data/pokedb-encounters-g8g9/pokemon/gourgeist-small.json","06df82dbc8"],
+    ["data/pokedb-encounters-g8g9/pokemon/gourgeist-super.json","abd9d1c5b0"],
+    ["data/pokedb-encounters-g8g9/pokemon/grafaiai.json","897b1ec647"],
+    ["data/pokedb-encounters-g8g9/pokemon/grapploct.json","7c91c8a392"],
+    ["data/pokedb-encounters-g8g9/pokemon/graveler.json","21cb54888d"],
+    ["data/pokedb-encounters-g8g9/pokemon/great-tusk.json","63f414b7ba"],
+    ["data/pokedb-encounters-g8g9/pokemon/greavard.json","fe3d19b735"],
+    ["data/pokedb-encounters-g8g9/pokemon/greedent.json","4bfd6fc44e"],
+    ["data/pokedb-encounters-g8g9/pokemon/grimer-alolan.json","9490fc1e89"],
+    ["data/pokedb-encounters-g8g9/pokemon/grimer.json","65b9c4bd19"],
+    ["data/pokedb-encounters-g8g9/pokemon/grimmsnarl-gigantamax.json","13710bc032"],
+    ["data/pokedb-encounters-g8g9/pokemon/grimmsnarl.json","2bc2308fff"],
+    ["data/pokedb-encounters-g8g9/pokemon/grookey.json","48e4e0b930"],
+    ["data/pokedb-encounters-g8g9/pokemon/grotle.json","a448e3e646"],
+    ["data/pokedb-encounters-g8g9/pokemon/groudon.json","d227bfd1d5"],
+    ["data/pokedb-encounters-g8g9/pokemon/grovyle.json","b241a6076a"],
+    ["data/pokedb-encounters-g8g9/pokemon/growlithe-hisuian.json","a1d9f33007"],
+    ["data/pokedb-encounters-g8g9/pokemon/growlithe.json","58e78266c0"],
+    ["data/pokedb-encounters-g8g9/pokemon/grubbin.json","1ecabf9969"],
+    ["data/pokedb-encounters-g8g9/pokemon/grumpig.json","10667a8be4"],
+    ["data/pokedb-encounters-g8g9/pokemon/gulpin.json","60e964d565"],
+    ["data/pokedb-encounters-g8g9/pokemon/gumshoos.json","54a8ce9aef"],
+    ["data/pokedb-encounters-g8g9/pokemon/gurdurr.json","a8c428b2c8"],
+    ["data/pokedb-encounters-g8g9/pokemon/guzzlord.json","07deb7b7b3"],
+    ["data/pokedb-encounters-g8g9/pokemon/gyarados.json","5cc9c4859d"],
+    ["data/pokedb-encounters-g8g9/pokemon/hakamo-o.json","8b04309d7c"],
+    ["data/pokedb-encounters-g8g9/pokemon/happiny.json","de582080c4"],
+    ["data/pokedb-encounters-g8g9/pokemon/hariyama.json","0be853efd0"],
+    ["data/pokedb-encounters-g8g9/pokemon/hatenna.json","21d5e52fe9"],
+    ["data/pokedb-encounters-g8g9/pokemon/hatterene-gigantamax.json","3bd4a1e6e8"],
+    ["data/pokedb-encounters-g8g9/pokemon/hatterene.json","be9720568d"],
+    ["data/pokedb-encounters-g8g9/pokemon/hattrem.json","c547b65bf5"],
+    ["data/pokedb-encounters-g8g9/pokemon/haunter.json","cef31b2ab1"],
+    ["data/pokedb-encounters-g8g9/pokemon/hawlucha.json","c5665b2bb8"],
+    ["data/pokedb-encounters-g8g9/pokemon/haxorus.json","1c8a97d2e4"],
+    ["data/pokedb-encounters-g8g9/pokemon/heatmor.json","3805ef5b79"],
+    ["data/pokedb-encounters-g8g9/pokemon/heatran.json","0c380f3b48"],
+    ["data/pokedb-encounters-g8g9/pokemon/heliolisk.json","3de63b8914"],
+    ["data/pokedb-encounters-g8g9/pokemon/helioptile.json","351f61626f"],
+    ["data/pokedb-encounters-g8g9/pokemon/heracross.json","f5cc252a77"],
+    ["data/pokedb-encounters-g8g9/pokemon/herdier.json","735a1239be"],
+    ["data/pokedb-encounters-g8g9/pokemon/hippopotas.json","de7d126424"],
+    ["data/pokedb-encounters-g8g9/pokemon/hippowdon.json","5fcbcf312f"],
+    ["data/pokedb-encounters-g8g9/pokemon/hitmonchan.json","4c30d46b03"],
+    ["data/pokedb-encounters-g8g9/pokemon/hitmonlee.json","ad8ff9bb1d"],
+    ["data/pokedb-encounters-g8g9/pokemon/hitmontop.json","f42a805037"],
+    ["data/pokedb-encounters-g8g9/pokemon/ho-oh.json","8eee8163c0"],
+    ["data/pokedb-encounters-g8g9/pokemon/honchkrow.json","e28ada7f50"],
+    ["data/pokedb-encounters-g8g9/pokemon/honedge.json","cb7b14441d"],
+    ["data/pokedb-encounters-g8g9/pokemon/hoothoot.json","3265fdc5b8"],
+    ["data/pokedb-encounters-g8g9/pokemon/hoppip.json","749b48cfcb"],
+    ["data/pokedb-encounters-g8g9/pokemon/horsea.json","89b19cb546"],
+    ["data/pokedb-encounters-g8g9/pokemon/houndoom.json","d1bc923f23"],
+    ["data/pokedb-encounters-g8g9/pokemon/houndour.json","5f7f64165f"],
+    ["data/pokedb-encounters-g8g9/pokemon/houndstone.json","775cb7f5ac"],
+    ["data/pokedb-encounters-g8g9/pokemon/hydreigon.json","91f97a5614"],
+    ["data/pokedb-encounters-g8g9/pokemon/hypno.json","fb2d039660"],
+    ["data/pokedb-encounters-g8g9/pokemon/igglybuff.json","1a8040d282"],
+    ["data/pokedb-encounters-g8g9/pokemon/illumise.json","7dfd1e8e08"],
+    ["data/pokedb-encounters-g8g9/pokemon/impidimp.json","4601c49b6b"],
+    ["data/pokedb-encounters-g8g9/pokemon/indeedee-female.json","ca27caa8f3"],
+    ["data/pokedb-encounters-g8g9/pokemon/indeedee-male.json","f17aed8722"],
+    ["data/pokedb-encounters-g8g9/pokemon/infernape.json","043bed107f"],
+    ["data/pokedb-encounters-g8g9/pokemon/inkay.json","f8c48ded1f"],
+    ["data/pokedb-encounters-g8g9/pokemon/iron-bundle.json","1f58bc71e1"],
+    ["data/pokedb-encounters-g8g9/pokemon/iron-hands.json","3e14f24617"],
+    ["data/pokedb-encounters-g8g9/pokemon/iron-jugulis.json","ac0d43da1d"],
+    ["data/pokedb-encounters-g8g9/pokemon/iron-moth.json","674ac2cc42"],
+    ["data/pokedb-encounters-g8g9/pokemon/iron-thorns.json","c3b6cd6849"],
+    ["data/pokedb-encounters-g8g9/pokemon/iron-treads.json","de9d9cc4f7"],
+    ["data/pokedb-encounters-g8g9/pokemon/iron-valiant.json","12861267b0"],
+    ["data/pokedb-encounters-g8g9/pokemon/ivysaur.json","972d450367"],
+    ["data/pokedb-encounters-g8g9/pokemon/jangmo-o.json","a8e0136126"],
+    ["data/pokedb-encounters-g8g9/pokemon/jellicent-male.json","7d1c917329"],
+    ["data/pokedb-encounters-g8g9/pokemon/jigglypuff.json","cc52edf9b3"],
+    ["data/pokedb-encounters-g8g9/pokemon/jirachi.json","2bb2161e5e"],
+    ["data/pokedb-encounters-g8g9/pokemon/jolteon.json","dd6e1f2825"],
+    ["data/pokedb-encounters-g8g9/pokemon/joltik.json","8ba1e22d85"],
+    ["data/pokedb-encounters-g8g9/pokemon/jumpluff.json","7069765a9a"],
+    ["data/pokedb-encounters-g8g9/pokemon/jynx.json","d81490de6a"],
+    ["data/pokedb-encounters-g8g9/pokemon/kabuto.json","14dc84b906"],
+    ["data/pokedb-encounters-g8g9/pokemon/kabutops.json","e1ffe58682"],
+    ["data/pokedb-encounters-g8g9/pokemon/kadabra.json","dafa85bac0"],
+    ["data/pokedb-encounters-g8g9/pokemon/kakuna.json","46c5fbec74"],
+    ["data/pokedb-encounters-g8g9/pokemon/kangaskhan.json","3e903c86ff"],
+    ["data/pokedb-encounters-g8g9/pokemon/karrablast.json","7bc4cc245f"],
+    ["data/pokedb-encounters-g8g9/pokemon/kartana.json","2aec29c19d"],
+    ["data/pokedb-encounters-g8g9/pokemon/kecleon.json","bf4c89b637"],
+    ["data/pokedb-encounters-g8g9/pokemon/keldeo-resolute.json","499b6cd29e"],
+    ["data/pokedb-encounters-g8g9/pokemon/kilowattrel.json","33052cf0fc"],
+    ["data/pokedb-encounters-g8g9/pokemon/kingambit.json","d56c329199"],
+    ["data/pokedb-encounters-g8g9/pokemon/kingdra.json","4797eec7d8"],
+    ["data/pokedb-encounters-g8g9/pokemon/kingler-gigantamax.json","9df85f4e9b"],
+    ["data/pokedb-encounters-g8g9/pokemon/kingler.json","53e13a6eca"],
+    ["data/pokedb-encounters-g8g9/pokemon/kirlia.json","5bc12de34d"],
+    ["data/pokedb-encounters-g8g9/pokemon/klang.json","73d262532a"],
+    ["data/pokedb-encounters-g8g9/pokemon/klawf.json","8c5d91944d"],
+    ["data/pokedb-encounters-g8g9/pokemon/klefki.json","3588423217"],
+    ["data/pokedb-encounters-g8g9/pokemon/klink.json","b2f359b419"],
+    ["data/pokedb-encounters-g8g9/pokemon/klinklang.json","c3ff2948a8"],
+    ["data/pokedb-encounters-g8g9/pokemon/koffing.json","6c71036719"],
+    ["data/pokedb-encounters-g8g9/pokemon/komala.json","a05e5b3077"],
+    ["data/pokedb-encounters-g8g9/pokemon/kommo-o.json","da2a03a121"],
+    ["data/pokedb-encounters-g8g9/pokemon/koraidon-apex.json","6bed866c81"],
+    ["data/pokedb-encounters-g8g9/pokemon/krabby.json","7291ea7abe"],
+    ["data/pokedb-encounters-g8g9/pokemon/kricketot.json","729deeb4af"],
+    ["data/pokedb-encounters-g8g9/pokemon/kricketune.json","af86a8fe71"],
+    ["data/pokedb-encounters-g8g9/pokemon/krokorok.json","51394ba4d1"],
+    ["data/pokedb-encounters-g8g9/pokemon/krookodile.json","d5b541cba1"],
+    ["data/pokedb-encounters-g8g9/pokemon/kubfu.json","d047677634"],
+    ["data/pokedb-encounters-g8g9/pokemon/kyogre.json","64b9cecedb"],
+    ["data/pokedb-encounters-g8g9/pokemon/kyurem.json","5e9847195b"],
+    ["data/pokedb-encounters-g8g9/pokemon/lairon.json","a2c89f2216"],
+    ["data/pokedb-encounters-g8g9/pokemon/lampent.json","d5059b0cd4"],
+    ["data/pokedb-encounters-g8g9/pokemon/landorus-incarnate.json","a1d5a304d8"],
+    ["data/pokedb-encounters-g8g9/pokemon/lanturn.json","df707b22bc"],
+    ["data/pokedb-encounters-g8g9/pokemon/lapras-gigantamax.json","caba820cfc"],
+    ["data/pokedb-encounters-g8g9/pokemon/lapras.json","fda6032e05"],
+    ["data/pokedb-encounters-g8g9/pokemon/larvesta.json","ac68cfdb35"],
+    ["data/pokedb-encounters-g8g9/pokemon/larvitar.json","f8f6f11ba3"],
+    ["data/pokedb-encounters-g8g9/pokemon/latias.json","80f84be1d6"],
+    ["data/pokedb-encounters-g8g9/pokemon/latios.json","2cdd36c459"],
+    ["data/pokedb-encounters-g8g9/pokemon/leafeon.json","332ad22783"],
+    ["data/pokedb-encounters-g8g9/pokemon/lechonk.json","b7e787da08"],
+    ["data/pokedb-encounters-g8g9/pokemon/ledian.json","80cf136b1f"],
+    ["data/pokedb-encounters-g8g9/pokemon/lickilicky.json","2db75bcf67"],
+    ["data/pokedb-encounters-g8g9/pokemon/lickitung.json","92cfb478d3"],
+    ["data/pokedb-encounters-g8g9/pokemon/liepard.json","40e9fae42a"],
+    ["data/pokedb-encounters-g8g9/pokemon/lileep.json","a3b1551194"],
+    ["data/pokedb-encounters-g8g9/pokemon/lilligant.json","ced3566ec0"],
+    ["data/pokedb-encounters-g8g9/pokemon/lillipup.json","442d59de36"],
+    ["data/pokedb-encounters-g8g9/pokemon/linoone-galarian.json","d81e06cd07"],
+    ["data/pokedb-encounters-g8g9/pokemon/linoone.json","351f2905ab"],
+    ["data/pokedb-encounters-g8g9/pokemon/litleo.json","a1ed88ce08"],
+    ["data/pokedb-encounters-g8g9/pokemon/litwick.json","1c172d9e13"],
+    ["data/pokedb-encounters-g8g9/pokemon/lokix.json","560d54fd1a"],
+    ["data/pokedb-encounters-g8g9/pokemon/lombre.json","9e907199f6"],
+    ["data/pokedb-encounters-g8g9/pokemon/lopunny.json","51e6c9548e"],
+    ["data/pokedb-encounters-g8g9/pokemon/lotad.json","a56c767ee9"],
+    ["data/pokedb-encounters-g8g9/pokemon/loudred.json","f13be7d8ee"],
+    ["data/pokedb-encounters-g8g9/pokemon/lucario.json","571357ac8b"],
+    ["data/pokedb-encounters-g8g9/pokemon/ludicolo.json","0052c0ed5f"],
+    ["data/pokedb-encounters-g8g9/pokemon/lugia.json","84555dd5e3"],
+    ["data/pokedb-encounters-g8g9/pokemon/lumineon.json","4124e42ac0"],
+    ["data/pokedb-encounters-g8g9/pokemon/lunala.json","3057a9b310"],
+    ["data/pokedb-encounters-g8g9/pokemon/lunatone.json","7203a27f20"],
+    ["data/pokedb-encounters-g8g9/pokemon/lurantis.json","2071949c97"],
+    ["data/pokedb-encounters-g8g9/pokemon/luvdisc.json","081653452e"],
+    ["data/pokedb-encounters-g8g9/pokemon/luxio.json","f9cd6e12c4"],
+    ["data/pokedb-encounters-g8g9/pokemon/luxray.json","7559243e31"],
+    ["data/pokedb-encounters-g8g9/pokemon/lycanroc-dusk.json","065446ce91"],
+    ["data/pokedb-encounters-g8g9/pokemon/lycanroc-midday.json","591f801112"],
+    ["data/pokedb-encounters-g8g9/pokemon/lycanroc-midnight.json","28083d0407"],
+    ["data/pokedb-encounters-g8g9/pokemon/mabosstiff.json","4f02b422a5"],
+    ["data/pokedb-encounters-g8g9/pokemon/machamp-gigantamax.json","bd3e420e00"],
+    ["data/pokedb-encounters-g8g9/pokemon/machamp.json","fbb69b139d"],
+    ["data/pokedb-encounters-g8g9/pokemon/machoke.json","4401c70349"],
+    ["data/pokedb-encounters-g8g9/pokemon/machop.json","57dbbdcc40"],
+    ["data/pokedb-encounters-g8g9/pokemon/magby.json","55b6818640"],
+    ["data/pokedb-encounters-g8g9/pokemon/magcargo.json","208bcdac67"],
+    ["data/pokedb-encounters-g8g9/pokemon/magikarp.json","ce5fd93dda"],
+    ["data/pokedb-encounters-g8g9/pokemon/magmar.json","a81bfdde52"],
+    ["data/pokedb-encounters-g8g9/pokemon/magmortar.json","07d580380f"],
+    ["data/pokedb-encounters-g8g9/pokemon/magnemite.json","87eab4f014"],
+    ["data/pokedb-encounters-g8g9/pokemon/magneton.json","b73483a244"],
+    ["data/pokedb-encounters-g8g9/pokemon/magnezone.json","51a51c7d3b"],
+    ["data/pokedb-encounters-g8g9/pokemon/makuhita.json","2f78fc258f"],
+    ["data/pokedb-encounters-g8g9/pokemon/malamar.json","b2f3d39a0a"],
+    ["data/pokedb-encounters-g8g9/pokemon/mamoswine.json","4b5a762ac6"],
+    ["data/pokedb-encounters-g8g9/pokemon/manaphy.json","91e6d2c906"],
+    ["data/pokedb-encounters-g8g9/pokemon/mandibuzz.json","77b993f8e8"],
+    ["data/pokedb-encounters-g8g9/pokemon/manectric.json","52f48af0ec"],
+    ["data/pokedb-encounters-g8g9/pokemon/mankey.json","6cb22e9019"],
+    ["data/pokedb-encounters-g8g9/pokemon/mantine.json","2f87612425"],
+    ["data/pokedb-encounters-g8g9/pokemon/mantyke.json","6355a3231b"],
+    ["data/pokedb-encounters-g8g9/pokemon/maractus.json","c2fbeb06f3"],
+    ["data/pokedb-encounters-g8g9/pokemon/mareanie.json","29521caa26"],
+    ["data/pokedb-encounters-g8g9/pokemon/mareep.json","6d939a7c95"],
+    ["data/pokedb-encounters-g8g9/pokemon/marill.json","b843734341"],
+    ["data/pokedb-encounters-g8g9/pokemon/marowak-alolan.json","966c694a86"],
+    ["data/pokedb-encounters-g8g9/pokemon/marowak.json","965a9cbe4b"],
+    ["data/pokedb-encounters-g8g9/pokemon/marshtomp.json","410c1e6875"],
+    ["data/pokedb-encounters-g8g9/pokemon/maschiff.json","4bcbffff19"],
+    ["data/pokedb-encounters-g8g9/pokemon/masquerain.json","385c3c7001"],
+    ["data/pokedb-encounters-g8g9/pokemon/maushold-family-of-four.json","b43aa47699"],
+    ["data/pokedb-encounters-g8g9/pokemon/maushold-family-of-three.json","5bc8cc71af"],
+    ["data/pokedb-encounters-g8g9/pokemon/mawile.json","df0861b176"],
+    ["data/pokedb-encounters-g8g9/pokemon/medicham.json","84a8a0c7bf"],
+    ["data/pokedb-encounters-g8g9/pokemon/meditite.json","ca0f8efccc"],
+    ["data/pokedb-encounters-g8g9/pokemon/meowstic-female.json","8402adf068"],
+    ["data/pokedb-encounters-g8g9/pokemon/meowstic-male.json","dd478a40e4"],
+    ["data/pokedb-encounters-g8g9/pokemon/meowth-alolan.json","1f2d0bc30b"],
+    ["data/pokedb-encounters-g8g9/pokemon/meowth-galarian.json","2fabcbc0b8"],
+    ["data/pokedb-encounters-g8g9/pokemon/meowth.json","05be164d25"],
+    ["data/pokedb-encounters-g8g9/pokemon/mesprit.json","a177c24cd1"],
+    ["data/pokedb-encounters-g8g9/pokemon/metagross.json","92f855e5d2"],
+    ["data/pokedb-encounters-g8g9/pokemon/metang.json","db90ab6629"],
+    ["data/pokedb-encounters-g8g9/pokemon/metapod.json","6753abb0ad"],
+    ["data/pokedb-encounters-g8g9/pokemon/mew.json","5e24569cea"],
+    ["data/pokedb-encounters-g8g9/pokemon/mewtwo.json","175279abd1"],
+    ["data/pokedb-encounters-g8g9/pokemon/mienfoo.json","18b6ea9a8e"],
+    ["data/pokedb-encounters-g8g9/pokemon/mienshao.json","1af1a6002d"],
+    ["data/pokedb-encounters-g8g9/pokemon/mightyena.json","396e2ccc25"],
+    ["data/pokedb-encounters-g8g9/pokemon/milcery.json","876fe5b80a"],
+    ["data/pokedb-encounters-g8g9/pokemon/milotic.json","ce5552bb76"],
+    ["data/pokedb-encounters-g8g9/pokemon/miltank.json","d14569271b"],
+    ["data/pokedb-encounters-g8g9/pokemon/mime-jr.json","e257751714"],
+    ["data/pokedb-encounters-g8g9/pokemon/mimikyu-busted.json","db66f32437"],
+    ["data/pokedb-encounters-g8g9/pokemon/minccino.json","a773da5202"],
+    ["data/pokedb-encounters-g8g9/pokemon/minun.json","a64b0e1c46"],
+    ["data/pokedb-encounters-g8g9/pokemon/miraidon-ultimate.json","db63b67a68"],
+    ["data/pokedb-encounters-g8g9/pokemon/misdreavus.json","8b48c2e00c"],
+    ["data/pokedb-encounters-g8g9/pokemon/mismagius.json","26aea36f3f"],
+    ["data/pokedb-encounters-g8g9/pokemon/moltres.json","14f18df2e0"],
+    ["data/pokedb-encounters-g8g9/pokemon/monferno.json","e61fbf8102"],
+    ["data/pokedb-encounters-g8g9/pokemon/morelull.json","c00ed075c6"],
+    ["data/pokedb-encounters-g8g9/pokemon/morgrem.json","b93d80ca01"],
+    ["data/pokedb-encounters-g8g9/pokemon/morpeko-full-belly.json","88292f902b"],
+    ["data/pokedb-encounters-g8g9/pokemon/morpeko-hangry.json","fb53809751"],
+    ["data/pokedb-encounters-g8g9/pokemon/mothim.json","0169115e41"],
+    ["data/pokedb-encounters-g8g9/pokemon/mr-mime-galarian.json","7a0ff123d4"],
+    ["data/pokedb-encounters-g8g9/pokemon/mr-mime.json","59be6e2b56"],
+    ["data/pokedb-encounters-g8g9/pokemon/mr-rime.json","5db9a64acd"],
+    ["data/pokedb-encounters-g8g9/pokemon/mudbray.json","5c36760cdf"],
+    ["data/pokedb-encounters-g8g9/pokemon/mudkip.json","8993e60818"],
+    ["data/pokedb-encounters-g8g9/pokemon/mudsdale.json","9b08b04aa0"],
+    ["data/pokedb-encounters-g8g9/pokemon/muk.json","f81429ebd7"],
+    ["data/pokedb-encounters-g8g9/pokemon/munchlax.json","d3e74b4637"],
+    ["data/pokedb-encounters-g8g9/pokemon/munna.json","2c8881925d"],
+    ["data/pokedb-encounters-g8g9/pokemon/murkrow.json","06b7ce72cf"],
+    ["data/pokedb-encounters-g8g9/pokemon/musharna.json","8cfcbf6669"],
+    ["data/pokedb-encounters-g8g9/pokemon/nacli.json","ae0b48ada3"],
+    ["data/pokedb-encounters-g8g9/pokemon/naclstack.json","5974dd54f1"],
+    ["data/pokedb-encounters-g8g9/pokemon/natu.json","456286075c"],
+    ["data/pokedb-encounters-g8g9/pokemon/necrozma.json","5e4d7389b0"],
+    ["data/pokedb-encounters-g8g9/pokemon/nickit.json","3ea105b039"],
+    ["data/pokedb-encounters-g8g9/pokemon/nidoking.json","e1d8d6b514"],
+    ["data/pokedb-encounters-g8g9/pokemon/nidoqueen.json","13506c47ca"],
+    ["data/pokedb-encounters-g8g9/pokemon/nidoran-f.json","4074453abb"],
+    ["data/pokedb-encounters-g8g9/pokemon/nidoran-m.json","d2a4523041"],
+    ["data/pokedb-encounters-g8g9/pokemon/nidorina.json","b0718c2d77"],
+    ["data/pokedb-encounters-g8g9/pokemon/nidorino.json","a08f667224"],
+    ["data/pokedb-encounters-g8g9/pokemon/nihilego.json","84e01c5ecc"],
+    ["data/pokedb-encounters-g8g9/pokemon/nincada.json","afcc96849d"],
+    ["data/pokedb-encounters-g8g9/pokemon/ninetales.json","b2d4e947f5"],
+    ["data/pokedb-encounters-g8g9/pokemon/ninjask.json","ab812fa101"],
+    ["data/pokedb-encounters-g8g9/pokemon/noctowl.json","7c74108c9a"],
+    ["data/pokedb-encounters-g8g9/pokemon/noibat.json","e21dbbe74c"],
+    ["data/pokedb-encounters-g8g9/pokemon/noivern.json","ea500be294"],
+    ["data/pokedb-encounters-g8g9/pokemon/nosepass.json","1827bae278"],
+    ["data/pokedb-encounters-g8g9/pokemon/numel.json","501308cbde"],
+    ["data/pokedb-encounters-g8g9/pokemon/nuzleaf.json","2a306b5339"],
+    ["data/pokedb-encounters-g8g9/pokemon/nymble.json","a42aabc55d"],
+    ["data/pokedb-encounters-g8g9/pokemon/obstagoon.json","01120881e1"],
+    ["data/pokedb-encounters-g8g9/pokemon/octillery.json","4a456563aa"],
+    ["data/pokedb-encounters-g8g9/pokemon/oddish.json","9e8058548d"],
+    ["data/pokedb-encounters-g8g9/pokemon/oinkologne-female.json","64f369e727"],
+    ["data/pokedb-encounters-g8g9/pokemon/oinkologne-male.json","9ad8a3d3b8"],
+    ["data/pokedb-encounters-g8g9/pokemon/omanyte.json","0e9e610335"],
+    ["data/pokedb-encounters-g8g9/pokemon/omastar.json","48af0f237c"],
+    ["data/pokedb-encounters-g8g9/pokemon/onix.json","f078280a09"],
+    ["data/pokedb-encounters-g8g9/pokemon/oranguru.json","17e6bfce88"],
+    ["data/pokedb-encounters-g8g9/pokemon/orbeetle-gigantamax.json","d51ab73cea"],
+    ["data/pokedb-encounters-g8g9/pokemon/orbeetle.json","121dfbaf44"],
+    ["data/pokedb-encounters-g8g9/pokemon/oricorio-baile.json","a53d6efcc6"],
+    ["data/pokedb-encounters-g8g9/pokemon/oricorio-pompom.json","297547b48a"],
+    ["data/pokedb-encounters-g8g9/pokemon/orthworm.json","e3c3bda9ea"],
+    ["data/pokedb-encounters-g8g9/pokemon/oshawott.json","90bf0bd496"],
+    ["data/pokedb-encounters-g8g9/pokemon/overqwil.json","ff6865ddde"],
+    ["data/pokedb-encounters-g8g9/pokemon/pachirisu.json","4c088bd867"],
+    ["data/pokedb-encounters-g8g9/pokemon/palafin-zero.json","4df230e92f"],
+    ["data/pokedb-encounters-g8g9/pokemon/palkia-origin.json","56eabaa143"],
+    ["data/pokedb-encounters-g8g9/pokemon/palkia.json","cf10df174d"],
+    ["data/pokedb-encounters-g8g9/pokemon/palossand.json","e682edda5e"],
+    ["data/pokedb-encounters-g8g9/pokemon/palpitoad.json","8f933c3218"],
+    ["data/pokedb-encounters-g8g9/pokemon/pancham.json","c4c73be9d6"],
+    ["data/pokedb-encounters-g8g9/pokemon/pangoro.json","fa65c12492"],
+    ["data/pokedb-encounters-g8g9/pokemon/paras.json","1b7d6ee284"],
+    ["data/pokedb-encounters-g8g9/pokemon/parasect.json","c2b4063cf2"],
+    ["data/pokedb-encounters-g8g9/pokemon/passimian.json","a1bef4821c"],
+    ["data/pokedb-encounters-g8g9/pokemon/pawmi.json","c3c98ae389"],
+    ["data/pokedb-encounters-g8g9/pokemon/pawmo.json","c355b2d662"],
+    ["data/pokedb-encounters-g8g9/pokemon/pawmot.json","3688423a52"],
+    ["data/pokedb-encounters-g8g9/pokemon/pawniard.json","065d9b8d5f"],
+    ["data/pokedb-encounters-g8g9/pokemon/pelipper.json","cc46600194"],
+    ["data/pokedb-encounters-g8g9/pokemon/perrserker.json","2e613662a9"],
+    ["data/pokedb-encounters-g8g9/pokemon/persian-alolan.json","6ca5b18f80"],
+    ["data/pokedb-encounters-g8g9/pokemon/persian.json","7d43998baa"],
+    ["data/pokedb-encounters-g8g9/pokemon/petilil.json","db4fd3af16"],
+    ["data/pokedb-encounters-g8g9/pokemon/phanpy.json","23307e559d"],
+    ["data/pokedb-encounters-g8g9/pokemon/phantump.json","8814080deb"],
+    ["data/pokedb-encounters-g8g9/pokemon/pheromosa.json","78affe302c"],
+    ["data/pokedb-encounters-g8g9/pokemon/phione.json","725e5c1948"],
+    ["data/pokedb-encounters-g8g9/pokemon/pichu.json","17467e92fa"],
+    ["data/pokedb-encounters-g8g9/pokemon/pidgeot.json","3142a4a5a4"],
+    ["data/pokedb-encounters-g8g9/pokemon/pidgeotto.json","8c96ab9dd1"],
+    ["data/pokedb-encounters-g8g9/pokemon/pidgey.json","bd0fe9b283"],
+    ["data/pokedb-encounters-g8g9/pokemon/pidove.json","895b36c3c8"],
+    ["data/pokedb-encounters-g8g9/pokemon/pikachu-gigantamax.json","6a7dfaaf3a"],
+    ["data/pokedb-encounters-g8g9/pokemon/pikachu-partner.json","3d7e1f0825"],
+    ["data/pokedb-encounters-g8g9/pokemon/pikachu.json","236409815d"],
+    ["data/pokedb-encounters-g8g9/pokemon/piloswine.json","5cda7d25cb"],
+    ["data/pokedb-encounters-g8g9/pokemon/pincurchin.json","71f230f403"],
+    ["data/pokedb-encounters-g8g9/pokemon/pineco.json","1d4dc14173"],
+    ["data/pokedb-encounters-g8g9/pokemon/pinsir.json","332cdb356f"],
+    ["data/pokedb-encounters-g8g9/pokemon/piplup.json","7b687f8bfd"],
+    ["data/pokedb-encounters-g8g9/pokemon/plusle.json","317632cb49"],
+    ["data/pokedb-encounters-g8g9/pokemon/poipole.json","9ba8d55182"],
+    ["data/pokedb-encounters-g8g9/pokemon/politoed.json","adfa73e43d"],
+    ["data/pokedb-encounters-g8g9/pokemon/poliwag.json","a63256094b"],
+    ["data/pokedb-encounters-g8g9/pokemon/poliwhirl.json","e5cf7097dc"],
+    ["data/pokedb-encounters-g8g9/pokemon/poliwrath.json","3819e35acb"],
+    ["data/pokedb-encounters-g8g9/pokemon/polteageist-antique.json","e1e1fe9316"],
+    ["data/pokedb-encounters-g8g9/pokemon/polteageist-phony.json","6b82321845"],
+    ["data/pokedb-encounters-g8g9/pokemon/ponyta-galarian.json","dd333f5514"],
+    ["data/pokedb-encounters-g8g9/pokemon/ponyta.json","bf5d55b0f7"],
+    ["data/pokedb-encounters-g8g9/pokemon/poochyena.json","be05bf6bbd"],
+    ["data/pokedb-encounters-g8g9/pokemon/porygon-z.json","55e0b2cca4"],
+    ["data/pokedb-encounters-g8g9/pokemon/porygon.json","20a8632ee1"],
+    ["data/pokedb-encounters-g8g9/pokemon/porygon2.json","a32e7ef15d"],
+    ["data/pokedb-encounters-g8g9/pokemon/primeape.json","d8c955a5c3"],
+    ["data/pokedb-encounters-g8g9/pokemon/prinplup.json","f383aff74e"],
+    ["data/pokedb-encounters-g8g9/pokemon/probopass.json","8018bc12f0"],
+    ["data/pokedb-encounters-g8g9/pokemon/psyduck.json","6ddd667b53"],
+    ["data/pokedb-encounters-g8g9/pokemon/pumpkaboo-average.json","98be28285c"],
+    ["data/pokedb-encounters-g8g9/pokemon/pumpkaboo-large.json","2be1e17829"],
+    ["data/pokedb-encounters-g8g9/pokemon/pumpkaboo-small.json","636de75894"],
+    ["data/pokedb-encounters-g8g9/pokemon/pumpkaboo-super.json","8a87f1b9e8"],
+    ["data/pokedb-encounters-g8g9/pokemon/pupitar.json","58820f57b2"],
+    ["data/pokedb-encounters-g8g9/pokemon/purrloin.json","71cec93b6c"],
+    ["data/pokedb-encounters-g8g9/pokemon/purugly.json","3a6a2562fe"],
+    ["data/pokedb-encounters-g8g9/pokemon/pyroar-female.json","65aec5adb4"],
+    ["data/pokedb-encounters-g8g9/pokemon/pyroar-male.json","e737a45bf7"],
+    ["data/pokedb-encounters-g8g9/pokemon/pyukumuku.json","a939134170"],
+    ["data/pokedb-encounters-g8g9/pokemon/quagsire.json","557737da27"],
+    ["data/pokedb-encounters-g8g9/pokemon/quaxly.json","66ec32baa7"],
+    ["data/pokedb-encounters-g8g9/pokemon/quilava.json","d67139fb24"],
+    ["data/pokedb-encounters-g8g9/pokemon/qwilfish-hisuian.json","7ace3a39cd"],
+    ["data/pokedb-encounters-g8g9/pokemon/qwilfish.json","c2c75d35b9"],
+    ["data/pokedb-encounters-g8g9/pokemon/rabsca.json","22066b9988"],
+    ["data/pokedb-encounters-g8g9/pokemon/raichu-alolan.json","a0a727c4a7"],
+    ["data/pokedb-encounters-g8g9/pokemon/raichu.json","0671e8b4a1"],
+    ["data/pokedb-encounters-g8g9/pokemon/raikou.json","ece55217ca"],
+    ["data/pokedb-encounters-g8g9/pokemon/ralts.json","b6529161dc"],
+    ["data/pokedb-encounters-g8g9/pokemon/rampardos.json","2ba6b46fea"],
+    ["data/pokedb-encounters-g8g9/pokemon/rapidash-galarian.json","d493e6510d"],
+    ["data/pokedb-encounters-g8g9/pokemon/rapidash.json","c196f1b1e6"],
+    ["data/pokedb-encounters-g8g9/pokemon/raticate.json","08db5dccd6"],
+    ["data/pokedb-encounters-g8g9/pokemon/rattata-alolan.json","9ec3c70d6f"],
+    ["data/pokedb-encounters-g8g9/pokemon/rattata.json","b2e4611a3b"],
+    ["data/pokedb-encounters-g8g9/pokemon/rayquaza.json","2a05fe19a7"],
+    ["data/pokedb-encounters-g8g9/pokemon/regice.json","4711a8fcd9"],
+    ["data/pokedb-encounters-g8g9/pokemon/regidrago.json","e43fbacac5"],
+    ["data/pokedb-encounters-g8g9/pokemon/regieleki.json","d1b39936ee"],
+    ["data/pokedb-encounters-g8g9/pokemon/regigigas.json","9289795e7d"],
+    ["data/pokedb-encounters-g8g9/pokemon/regirock.json","49e6dc340f"],
+    ["data/pokedb-encounters-g8g9/pokemon/registeel.json","95b18cebc3"],
+    ["data/pokedb-encounters-g8g9/pokemon/relicanth.json","ab6047e9f6"],
+    ["data/pokedb-encounters-g8g9/pokemon/rellor.json","a3c6e8fad7"],
+    ["data/pokedb-encounters-g8g9/pokemon/remoraid.json","9deb10e0f2"],
+    ["data/pokedb-encounters-g8g9/pokemon/reshiram.json","25c55e8161"],
+    ["data/pokedb-encounters-g8g9/pokemon/reuniclus.json","6f5096be03"],
+    ["data/pokedb-encounters-g8g9/pokemon/revavroom.json","5287b09287"],
+    ["data/pokedb-encounters-g8g9/pokemon/rhydon.json","a583e6d8e8"],
+    ["data/pokedb-encounters-g8g9/pokemon/rhyhorn.json","500f090f53"],
+    ["data/pokedb-encounters-g8g9/pokemon/rhyperior.json","c219ba3d4e"],
+    ["data/pokedb-encounters-g8g9/pokemon/ribombee.json","d8a3d6a26e"],
+    ["data/pokedb-encounters-g8g9/pokemon/riolu.json","dbe694f5f5"],
+    ["data/pokedb-encounters-g8g9/pokemon/roaring-moon.json","a7c673505c"],
+    ["data/pokedb-encounters-g8g9/pokemon/rockruff-owntempo.json","dd3416ab18"],
+    ["data/pokedb-encounters-g8g9/pokemon/rockruff.json","f3e54b31f0"],
+    ["data/pokedb-encounters-g8g9/pokemon/roggenrola.json","1e945ed9bc"],
+    ["data/pokedb-encounters-g8g9/pokemon/rolycoly.json","6967ce4dd6"],
+    ["data/pokedb-encounters-g8g9/pokemon/rookidee.json","2b5bda65b0"],
+    ["data/pokedb-encounters-g8g9/pokemon/roselia.json","ac1ab419e1"],
+    ["data/pokedb-encounters-g8g9/pokemon/roserade.json","e825f020fc"],
+    ["data/pokedb-encounters-g8g9/pokemon/rotom-fan.json","03084681a4"],
+    ["data/pokedb-encounters-g8g9/pokemon/rotom-frost.json","fd5013bec1"],
+    ["data/pokedb-encounters-g8g9/pokemon/rotom-heat.json","5915c87a7e"],
+    ["data/pokedb-encounters-g8g9/pokemon/rotom-mow.json","e76bd10270"],
+    ["data/pokedb-encounters-g8g9/pokemon/rotom-wash.json","a9616a701d"],
+    ["data/pokedb-encounters-g8g9/pokemon/rotom.json","ab7fc5a162"],
+    ["data/pokedb-encounters-g8g9/pokemon/rowlet.json","3aec8872a4"],
+    ["data/pokedb-encounters-g8g9/pokemon/rufflet.json","45dc80389c"],
+    ["data/pokedb-encounters-g8g9/pokemon/runerigus.json","a61d6c7804"],
+    ["data/pokedb-encounters-g8g9/pokemon/sableye.json","ba27a27557"],
+    ["data/pokedb-encounters-g8g9/pokemon/salamence.json","ccb6687338"],
+    ["data/pokedb-encounters-g8g9/pokemon/salandit.json","a46c7b6d66"],
+    ["data/pokedb-encounters-g8g9/pokemon/salazzle-totem.json","afeafaafe6"],
+    ["data/pokedb-encounters-g8g9/pokemon/salazzle.json","792d1cdf4f"],
+    ["data/pokedb-encounters-g8g9/pokemon/samurott-hisuian.json","7887f317e0"],
+    ["data/pokedb-encounters-g8g9/pokemon/sandaconda-gigantamax.json","a1cf88a47c"],
+    ["data/pokedb-encounters-g8g9/pokemon/sandaconda.json","da697be233"],
+    ["data/pokedb-encounters-g8g9/pokemon/sandile.json","98d54bef89"],
+    ["data/pokedb-encounters-g8g9/pokemon/sandshrew-alolan.json","63184a28b2"],
+    ["data/pokedb-encounters-g8g9/pokemon/sandshrew.json","82fa165ce9"],
+    ["data/pokedb-encounters-g8g9/pokemon/sandslash-alolan.json","07072c21f2"],
+    ["data/pokedb-encounters-g8g9/pokemon/sandslash.json","004ad500c5"],
+    ["data/pokedb-encounters-g8g9/pokemon/sandy-shocks.json","5985bba611"],
+    ["data/pokedb-encounters-g8g9/pokemon/sandygast.json","bb9eba3669"],
+    ["data/pokedb-encounters-g8g9/pokemon/sawk.json","a23c3273ac"],
+    ["data/pokedb-encounters-g8g9/pokemon/sawsbuck-autumn.json","c8bb490120"],
+    ["data/pokedb-encounters-g8g9/pokemon/sawsbuck-spring.json","dc300efccb"],
+    ["data/pokedb-encounters-g8g9/pokemon/sawsbuck-winter.json","7a2aa33a38"],
+    ["data/pokedb-encounters-g8g9/pokemon/scatterbug.json","5b70358412"],
+    ["data/pokedb-encounters-g8g9/pokemon/sceptile.json","4dffd82ea0"],
+    ["data/pokedb-encounters-g8g9/pokemon/scizor.json","9fd2f22f7a"],
+    ["data/pokedb-encounters-g8g9/pokemon/scolipede.json","585c0c1ead"],
+    ["data/pokedb-encounters-g8g9/pokemon/scorbunny.json","febdc86dff"],
+    ["data/pokedb-encounters-g8g9/pokemon/scovillain.json","710021de1b"],
+    ["data/pokedb-encounters-g8g9/pokemon/scrafty.json","534a45562e"],
+    ["data/pokedb-encounters-g8g9/pokemon/scraggy.json","da9d6edbfe"],
+    ["data/pokedb-encounters-g8g9/pokemon/scream-tail.json","7e6098cabb"],
+    ["data/pokedb-encounters-g8g9/pokemon/scyther.json","b714cef6fc"],
+    ["data/pokedb-encounters-g8g9/pokemon/seadra.json","5eb40e7a8a"],
+    ["data/pokedb-encounters-g8g9/pokemon/seaking.json","b5133bed09"],
+    ["data/pokedb-encounters-g8g9/pokemon/sealeo.json","247ff9707c"],
+    ["data/pokedb-encounters-g8g9/pokemon/seedot.json","feff315e3a"],
+    ["data/pokedb-encounters-g8g9/pokemon/seel.json","dad8fecc7f"],
+    ["data/pokedb-encounters-g8g9/pokemon/seismitoad.json","12022b1ff6"],
+    ["data/pokedb-encounters-g8g9/pokemon/sentret.json","1ccd29656b"],
+    ["data/pokedb-encounters-g8g9/pokemon/seviper.json","4a45d5b712"],
+    ["data/pokedb-encounters-g8g9/pokemon/sharpedo.json","62b16fda3a"],
+    ["data/pokedb-encounters-g8g9/pokemon/shaymin-land.json","65439d7893"],
+    ["data/pokedb-encounters-g8g9/pokemon/shedinja.json","b8584bfd0e"],
+    ["data/pokedb-encounters-g8g9/pokemon/shelgon.json","e9babbaeb6"],
+    ["data/pokedb-encounters-g8g9/pokemon/shellder.json","e06ac3aadf"],
+    ["data/pokedb-encounters-g8g9/pokemon/shellos-east-sea.json","692e5e9c03"],
+    ["data/pokedb-encounters-g8g9/pokemon/shellos-west-sea.json","265473816f"],
+    ["data/pokedb-encounters-g8g9/pokemon/shelmet.json","b3ed546fcf"],
+    ["data/pokedb-encounters-g8g9/pokemon/shieldon.json","7c93955a12"],
+    ["data/pokedb-encounters-g8g9/pokemon/shiftry.json","98dc331684"],
+    ["data/pokedb-encounters-g8g9/pokemon/shiinotic.json","871e2cf179"],
+    ["data/pokedb-encounters-g8g9/pokemon/shinx.json","57519b8aea"],
+    ["data/pokedb-encounters-g8g9/pokemon/shroodle.json","ad874a7285"],
+    ["data/pokedb-encounters-g8g9/pokemon/shroomish.json","1923a1c328"],
+    ["data/pokedb-encounters-g8g9/pokemon/shuckle.json","51d6ae2606"],
+    ["data/pokedb-encounters-g8g9/pokemon/shuppet.json","42caf78f21"],
+    ["data/pokedb-encounters-g8g9/pokemon/sigilyph.json","f1eca69717"],
+    ["data/pokedb-encounters-g8g9/pokemon/silcoon.json","cf0f06bd31"],
+    ["data/pokedb-encounters-g8g9/pokemon/silicobra.json","5b6ece9b82"],
+    ["data/pokedb-encounters-g8g9/pokemon/sinistea-antique.json","0b0bee7f4e"],
+    ["data/pokedb-encounters-g8g9/pokemon/sinistea-phony.json","c500f295d9"],
+    ["data/pokedb-encounters-g8g9/pokemon/sirfetchd.json","54b35c4c29"],
+    ["data/pokedb-encounters-g8g9/pokemon/sizzlipede.json","f577b9feef"],
+    ["data/pokedb-encounters-g8g9/pokemon/skarmory.json","eccf8cdfaa"],
+    ["data/pokedb-encounters-g8g9/pokemon/skiddo.json","28b5b3b148"],
+    ["data/pokedb-encounters-g8g9/pokemon/skiploom.json","b79e40a523"],
+    ["data/pokedb-encounters-g8g9/pokemon/skitty.json","bac66f30d2"],
+    ["data/pokedb-encounters-g8g9/pokemon/skorupi.json","0e512bc71d"],
+    ["data/pokedb-encounters-g8g9/pokemon/skrelp.json","da2c7c6c36"],
+    ["data/pokedb-encounters-g8g9/pokemon/skuntank.json","b405796beb"],
+    ["data/pokedb-encounters-g8g9/pokemon/skwovet.json","1e2ada0f4d"],
+    ["data/pokedb-encounters-g8g9/pokemon/slaking.json","a430ce97fc"],
+    ["data/pokedb-encounters-g8g9/pokemon/slakoth.json","2115576377"],
+    ["data/pokedb-encounters-g8g9/pokemon/sliggoo-hisuian.json","3ae4a0a5d8"],
+    ["data/pokedb-encounters-g8g9/pokemon/sliggoo.json","a8a95cda4f"],
+    ["data/pokedb-encounters-g8g9/pokemon/slither-wing.json","ed63b65133"],
+    ["data/pokedb-encounters-g8g9/pokemon/slowbro.json","18ef40ee52"],
+    ["data/pokedb-encounters-g8g9/pokemon/slowking.json","896ed7cc45"],
+    ["data/pokedb-encounters-g8g9/pokemon/slowpoke-galarian.json","9e54124de0"],
+    ["data/pokedb-encounters-g8g9/pokemon/slowpoke.json","b9828ac022"],
+    ["data/pokedb-encounters-g8g9/pokemon/slugma.json","b58366727a"],
+    ["data/pokedb-encounters-g8g9/pokemon/slurpuff.json","927a0c2cae"],
+    ["data/pokedb-encounters-g8g9/pokemon/smeargle.json","5aadc4ce85"],
+    ["data/pokedb-encounters-g8g9/pokemon/smoliv.json","8489da5d82"],
+    ["data/pokedb-encounters-g8g9/pokemon/smoochum.json","c987c86201"],
+    ["data/pokedb-encounters-g8g9/pokemon/sneasel-hisuian.json","65c5afad83"],
+    ["data/pokedb-encounters-g8g9/pokemon/sneasel.json","b23d701b3f"],
+    ["data/pokedb-encounters-g8g9/pokemon/snom.json","0e14bb0523"],
+    ["data/pokedb-encounters-g8g9/pokemon/snorlax-gigantamax.json","437ff93dab"],
+    ["data/pokedb-encounters-g8g9/pokemon/snorlax.json","3ebf98f26a"],
+    ["data/pokedb-encounters-g8g9/pokemon/snorunt.json","d8c7f510ab"],
+    ["data/pokedb-encounters-g8g9/pokemon/snover.json","2de5c57f99"],
+    ["data/pokedb-encounters-g8g9/pokemon/snubbull.json","29d07d2bb3"],
+    ["data/pokedb-encounters-g8g9/pokemon/sobble.json","d07309e418"],
+    ["data/pokedb-encounters-g8g9/pokemon/solgaleo.json","97ef6329b2"],
+    ["data/pokedb-encounters-g8g9/pokemon/solosis.json","7b3da56874"],
+    ["data/pokedb-encounters-g8g9/pokemon/solrock.json","983ca2f4d7"],
+    ["data/pokedb-encounters-g8g9/pokemon/spearow.json","209c00b297"],
+    ["data/pokedb-encounters-g8g9/pokemon/spectrier.json","1ef56c88eb"],
+    ["data/pokedb-encounters-g8g9/pokemon/spewpa.json","22109a93b7"],
+    ["data/pokedb-encounters-g8g9/pokemon/spheal.json","ca1003fe46"],
+    ["data/pokedb-encounters-g8g9/pokemon/spidops.json","cf68405eb6"],
+    ["data/pokedb-encounters-g8g9/pokemon/spinda.json","a279c4f9a6"],
+    ["data/pokedb-encounters-g8g9/pokemon/spiritomb.json","08213de5bc"],
+    ["data/pokedb-encounters-g8g9/pokemon/spoink.json","086138d8de"],
+    ["data/pokedb-encounters-g8g9/pokemon/sprigatito.json","ba7b2f81a9"],
+    ["data/pokedb-encounters-g8g9/pokemon/spritzee.json","13f2cff51f"],
+    ["data/pokedb-encounters-g8g9/pokemon/squawkabilly-blue.json","cf92dc1416"],
+    ["data/pokedb-encounters-g8g9/pokemon/squawkabilly-green.json","cfc2349223"],
+    ["data/pokedb-encounters-g8g9/pokemon/squawkabilly-white.json","1b9d531a09"],
+    ["data/pokedb-encounters-g8g9/pokemon/squawkabilly-yellow.json","b1aaea208b"],
+    ["data/pokedb-encounters-g8g9/pokemon/squirtle.json","8eaeebdd78"],
+    ["data/pokedb-encounters-g8g9/pokemon/stakataka.json","3e0a0f837a"],
+    ["data/pokedb-encounters-g8g9/pokemon/stantler.json","752148c633"],
+    ["data/pokedb-encounters-g8g9/pokemon/staraptor.json","de129de4af"],
+    ["data/pokedb-encounters-g8g9/pokemon/staravia.json","139008b200"],
+    ["data/pokedb-encounters-g8g9/pokemon/starly.json","44874556b3"],
+    ["data/pokedb-encounters-g8g9/pokemon/starmie.json","e2822ccfb8"],
+    ["data/pokedb-encounters-g8g9/pokemon/staryu.json","3dd2e114d8"],
+    ["data/pokedb-encounters-g8g9/pokemon/steelix.json","bb901b7d26"],
+    ["data/pokedb-encounters-g8g9/pokemon/steenee.json","c2cad81ae2"],
+    ["data/pokedb-encounters-g8g9/pokemon/stonjourner.json","51cc548ec9"],
+    ["data/pokedb-encounters-g8g9/pokemon/stoutland.json","62338b79d2"],
+    ["data/pokedb-encounters-g8g9/pokemon/stufful.json","6e50a4683a"],
+    ["data/pokedb-encounters-g8g9/pokemon/stunfisk-galarian.json","31fbb948c5"],
+    ["data/pokedb-encounters-g8g9/pokemon/stunfisk.json","8b70aa1366"],
+    ["data/pokedb-encounters-g8g9/pokemon/stunky.json","eb36499555"],
+    ["data/pokedb-encounters-g8g9/pokemon/sudowoodo.json","9953016913"],
+    ["data/pokedb-encounters-g8g9/pokemon/suicune.json","012d495132"],
+    ["data/pokedb-encounters-g8g9/pokemon/sunflora.json","b6d588be7b"],
+    ["data/pokedb-encounters-g8g9/pokemon/sunkern.json","85ba9e99d3"],
+    ["data/pokedb-encounters-g8g9/pokemon/surskit.json","fd922d62d8"],
+    ["data/pokedb-encounters-g8g9/pokemon/swablu.json","8bda607dbf"],
+    ["data/pokedb-encounters-g8g9/pokemon/swalot.json","d2d1c0e28f"],
+    ["data/pokedb-encounters-g8g9/pokemon/swampert.json","19ec0d9a6f"],
+    ["data/pokedb-encounters-g8g9/pokemon/swellow.json","ec145d4ad7"],
+    ["data/pokedb-encounters-g8g9/pokemon/swinub.json","1ff69aacbe"],
+    ["data/pokedb-encounters-g8g9/pokemon/swirlix.json","225cf4c78c"],
+    ["data/pokedb-encounters-g8g9/pokemon/swoobat.json","0c0f224754"],
+    ["data/pokedb-encounters-g8g9/pokemon/sylveon.json","5a74d74d9f"],
+    ["data/pokedb-encounters-g8g9/pokemon/tadbulb.json","973f9f3a60"],
+    ["data/pokedb-encounters-g8g9/pokemon/talonflame.json","a74128626a"],
+    ["data/pokedb-encounters-g8g9/pokemon/tandemaus.json","ce645395e7"],
+    ["data/pokedb-encounters-g8g9/pokemon/tangela.json","3b26701e35"],
+    ["data/pokedb-encounters-g8g9/pokemon/tangrowth.json","eeff2d3742"],
+    ["data/pokedb-encounters-g8g9/pokemon/tapu-bulu.json","f0cad69eab"],
+    ["data/pokedb-encounters-g8g9/pokemon/tapu-fini.json","73761fe9e8"],
+    ["data/pokedb-encounters-g8g9/pokemon/tapu-koko.json","1301fcd233"],
+    ["data/pokedb-encounters-g8g9/pokemon/tapu-lele.json","34c62fd5d9"],
+    ["data/pokedb-encounters-g8g9/pokemon/tarountula.json","5f0e6ec22c"],
+    ["data/pokedb-encounters-g8g9/pokemon/tatsugiri-curly.json","b553426e75"],
+    ["data/pokedb-encounters-g8g9/pokemon/tatsugiri-droopy.json","0a697e9c82"],
+    ["data/pokedb-encounters-g8g9/pokemon/tatsugiri-stretchy.json","f767fa97cf"],
+    ["data/pokedb-encounters-g8g9/pokemon/tauros-paldean-aqua-breed.json","7327afbfb6"],
+    ["data/pokedb-encounters-g8g9/pokemon/tauros-paldean-blaze-breed.json","88514f6b35"],
+    ["data/pokedb-encounters-g8g9/pokemon/tauros-paldean-combat-breed.json","f5d00a05c5"],
+    ["data/pokedb-encounters-g8g9/pokemon/tauros.json","769a35f8b9"],
+    ["data/pokedb-encounters-g8g9/pokemon/teddiursa.json","d6a313e28f"],
+    ["data/pokedb-encounters-g8g9/pokemon/tentacool.json","88f18c5dbc"],
+    ["data/pokedb-encounters-g8g9/pokemon/tentacruel.json","9fffb38688"],
+    ["data/pokedb-encounters-g8g9/pokemon/terapagos.json","3447d4da96"],
+    ["data/pokedb-encounters-g8g9/pokemon/terrakion.json","6f42b88264"],
+    ["data/pokedb-encounters-g8g9/pokemon/thievul.json","35c5a03992"],
+    ["data/pokedb-encounters-g8g9/pokemon/throh.json","b79e76b063"],
+    ["data/pokedb-encounters-g8g9/pokemon/thundurus-incarnate.json","672e4081fb"],
+    ["data/pokedb-encounters-g8g9/pokemon/timburr.json","29a3a46007"],
+    ["data/pokedb-encounters-g8g9/pokemon/ting-lu.json","a410a4e233"],
+    ["data/pokedb-encounters-g8g9/pokemon/tinkatink.json","e1d594b271"],
+    ["data/pokedb-encounters-g8g9/pokemon/tinkaton.json","d3dbe880a0"],
+    ["data/pokedb-encounters-g8g9/pokemon/tinkatuff.json","14b748b2f2"],
+    ["data/pokedb-encounters-g8g9/pokemon/tirtouga.json","6230249783"],
+    ["data/pokedb-encounters-g8g9/pokemon/toedscool.json","02b7b780d2"],
+    ["data/pokedb-encounters-g8g9/pokemon/toedscruel.json","1964f0ef16"],
+    ["data/pokedb-encounters-g8g9/pokemon/togedemaru.json","2ce70716de"],
+    ["data/pokedb-encounters-g8g9/pokemon/togekiss.json","07971906df"],
+    ["data/pokedb-encounters-g8g9/pokemon/togepi.json","9af36f2a1c"],
+    ["data/pokedb-encounters-g8g9/pokemon/togetic.json","15ece0b2a6"],
+    ["data/pokedb-encounters-g8g9/pokemon/torchic.json","465186e57f"],
+    ["data/pokedb-encounters-g8g9/pokemon/torkoal.json","7f08751c28"],
+    ["data/pokedb-encounters-g8g9/pokemon/tornadus-incarnate.json","dc5f9fdb50"],
+    ["data/pokedb-encounters-g8g9/pokemon/torterra.json","4c737cc0c9"],
+    ["data/pokedb-encounters-g8g9/pokemon/totodile.json","cb5dce2c99"],
+    ["data/pokedb-encounters-g8g9/pokemon/toxapex.json","5e1d40a994"],
+    ["data/pokedb-encounters-g8g9/pokemon/toxel.json","7631152fbb"],
+    ["data/pokedb-encounters-g8g9/pokemon/toxicroak.json","82ffc25a15"],
+    ["data/pokedb-encounters-g8g9/pokemon/toxtricity-amped.json","a6fdb5dd0f"],
+    ["data/pokedb-encounters-g8g9/pokemon/toxtricity-gigantamax.json","8f62e3b553"],
+    ["data/pokedb-encounters-g8g9/pokemon/toxtricity-low-key.json","f25aced58b"],
+    ["data/pokedb-encounters-g8g9/pokemon/tranquill.json","ab5915cc71"],
+    ["data/pokedb-encounters-g8g9/pokemon/trapinch.json","7aedf695ff"],
+    ["data/pokedb-encounters-g8g9/pokemon/treecko.json","8d086588e0"],
+    ["data/pokedb-encounters-g8g9/pokemon/trevenant.json","250e2cde95"],
+    ["data/pokedb-encounters-g8g9/pokemon/tropius.json","4a25c5af94"],
+    ["data/pokedb-encounters-g8g9/pokemon/trubbish.json","89e7d0baec"],
+    ["data/pokedb-encounters-g8g9/pokemon/tsareena.json","5a34705296"],
+    ["data/pokedb-encounters-g8g9/pokemon/turtonator.json","e19943fd35"],
+    ["data/pokedb-encounters-g8g9/pokemon/turtwig.json","a7b9f84393"],
+    ["data/pokedb-encounters-g8g9/pokemon/tympole.json","30ee7b8688"],
+    ["data/pokedb-encounters-g8g9/pokemon/tynamo.json","5da8c50564"],
+    ["data/pokedb-encounters-g8g9/pokemon/type-null.json","4577cf2508"],
+    ["data/pokedb-encounters-g8g9/pokemon/typhlosion-hisuian.json","34bce0f5ee"],
+    ["data/pokedb-encounters-g8g9/pokemon/tyranitar.json","9afd16b833"],
+    ["data/pokedb-encounters-g8g9/pokemon/tyrantrum.json","361e039375"],
+    ["data/pokedb-encounters-g8g9/pokemon/tyrogue.json","b79c4ef6e4"],
+    ["data/pokedb-encounters-g8g9/pokemon/tyrunt.json","d450aa6b90"],
+    ["data/pokedb-encounters-g8g9/pokemon/umbreon.json","5770d6abcb"],
+    ["data/pokedb-encounters-g8g9/pokemon/unfezant-male.json","65a2b14168"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-a.json","e34afe8412"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-b.json","4eecc39455"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-c.json","f5465ecd24"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-d.json","305ef10b40"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-e.json","3babb82d38"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-exclamation-mark.json","9a82d35ae7"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-f.json","e0b577bf19"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-g.json","62d06f89d5"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-h.json","3dab362995"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-i.json","e108a50dc1"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-j.json","ed181dcb17"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-k.json","720fbc6735"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-l.json","7e40350eec"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-m.json","e62dc03420"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-n.json","0052b95b4c"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-o.json","d3601e22be"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-p.json","27b00f55a9"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-q.json","a56120d5e4"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-question-mark.json","c778870ec3"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-r.json","5f5edcc729"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-s.json","478e0a8243"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-t.json","37421d5239"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-u.json","fe61b140e9"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-v.json","74ed0cb95f"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-w.json","3aba133f39"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-x.json","2c3875c01e"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-y.json","0c34572666"],
+    ["data/pokedb-encounters-g8g9/pokemon/unown-z.json","69717989c4"],
+    ["data/pokedb-encounters-g8g9/pokemon/ursaluna.json","0c857532be"],
+    ["data/pokedb-encounters-g8g9/pokemon/ursaring.json","f511bccc52"],
+    ["data/pokedb-encounters-g8g9/pokemon/uxie.json","e32734179f"],
+    ["data/pokedb-encounters-g8g9/pokemon/vanillish.json","f5b80be26c"],
+    ["data/pokedb-encounters-g8g9/pokemon/vanillite.json","f8e3c8c912"],
+    ["data/pokedb-encounters-g8g9/pokemon/vanilluxe.json","c797040edc"],
+    ["data/pokedb-encounters-g8g9/pokemon/vaporeon.json","c90b5e6efc"],
+    ["data/pokedb-encounters-g8g9/pokemon/varoom.json","6efa1b6ee0"],
+    ["data/pokedb-encounters-g8g9/pokemon/veluza.json","9f3aa44cdc"],
+    ["data/pokedb-encounters-g8g9/pokemon/venipede.json","28a33c0093"],
+    ["data/pokedb-encounters-g8g9/pokemon/venomoth.json","0e7b101f84"],
+    ["data/pokedb-encounters-g8g9/pokemon/venonat.json","097fa8ccd8"],
+    ["data/pokedb-encounters-g8g9/pokemon/venusaur-gigantamax.json","790e5db82d"],
+    ["data/pokedb-encounters-g8g9/pokemon/venusaur.json","28b71a43a1"],
+    ["data/pokedb-encounters-g8g9/pokemon/vespiquen.json","1a992a1cc1"],
+    ["data/pokedb-encounters-g8g9/pokemon/vibrava.json","6b0360589b"],
+    ["data/pokedb-encounters-g8g9/pokemon/victreebel.json","e516e1e174"],
+    ["data/pokedb-encounters-g8g9/pokemon/vigoroth.json","49f6b8c990"],
+    ["data/pokedb-encounters-g8g9/pokemon/vikavolt.json","05fcf8f809"],
+    ["data/pokedb-encounters-g8g9/pokemon/vileplume.json","2437f3c0ce"],
+    ["data/pokedb-encounters-g8g9/pokemon/virizion.json","f370e9f188"],
+    ["data/pokedb-encounters-g8g9/pokemon/vivillon-fancy.json","46d5ecab8e"],
+    ["data/pokedb-encounters-g8g9/pokemon/volbeat.json","04863ad22b"],
+    ["data/pokedb-encounters-g8g9/pokemon/volcarona.json","7a8faf4bad"],
+    ["data/pokedb-encounters-g8g9/pokemon/voltorb-hisuian.json","ad03304484"],
+    ["data/pokedb-encounters-g8g9/pokemon/voltorb.json","eeb23e65a7"],
+    ["data/pokedb-encounters-g8g9/pokemon/vullaby.json","163a3e5e04"],
+    ["data/pokedb-encounters-g8g9/pokemon/vulpix-alolan.json","9388ccd173"],
+    ["data/pokedb-encounters-g8g9/pokemon/vulpix.json","cf287a59ee"],
+    ["data/pokedb-encounters-g8g9/pokemon/wailmer.json","ab8bd9762c"],
+    ["data/pokedb-encounters-g8g9/pokemon/wailord.json","44c9f04345"],
+    ["data/pokedb-encounters-g8g9/pokemon/walrein.json","e36f48e327"],
+    ["data/pokedb-encounters-g8g9/pokemon/wartortle.json","cb2e46c426"],
+    ["data/pokedb-encounters-g8g9/pokemon/wattrel.json","13e84b066e"],
+    ["data/pokedb-encounters-g8g9/pokemon/weavile.json","4e6e432075"],
+    ["data/pokedb-encounters-g8g9/pokemon/weedle.json","7544b4eafc"],
+    ["data/pokedb-encounters-g8g9/pokemon/weepinbell.json","5f8a2624b6"],
+    ["data/pokedb-encounters-g8g9/pokemon/weezing-galarian.json","03f290995e"],
+    ["data/pokedb-encounters-g8g9/pokemon/weezing.json","a5f0ce5328"],
+    ["data/pokedb-encounters-g8g9/pokemon/whimsicott.json","aeaca91adb"],
+    ["data/pokedb-encounters-g8g9/pokemon/whirlipede.json","1cb188f150"],
+    ["data/pokedb-encounters-g8g9/pokemon/whiscash.json","9a2b151e69"],
+    ["data/pokedb-encounters-g8g9/pokemon/whismur.json","d2a76a1531"],
+    ["data/pokedb-encounters-g8g9/pokemon/wigglytuff.json","05652d172c"],
+    ["data/pokedb-encounters-g8g9/pokemon/wiglett.json","1794113812"],
+    ["data/pokedb-encounters-g8g9/pokemon/wimpod.json","a25cd44218"],
+    ["data/pokedb-encounters-g8g9/pokemon/wingull.json","9457088e5d"],
+    ["data/pokedb-encounters-g8g9/pokemon/wishiwashi-solo.json","4eda4f8024"],
+    ["data/pokedb-encounters-g8g9/pokemon/wo-chien.json","423492010d"],
+    ["data/pokedb-encounters-g8g9/pokemon/wobbuffet.json","5add1a8391"],
+    ["data/pokedb-encounters-g8g9/pokemon/woobat.json","40974c37e4"],
+    ["data/pokedb-encounters-g8g9/pokemon/wooloo.json","aaa6b3af7a"],
+    ["data/pokedb-encounters-g8g9/pokemon/wooper-paldean.json","a0ac9e3a90"],
+    ["data/pokedb-encounters-g8g9/pokemon/wooper.json","1676617b0b"],
+    ["data/pokedb-encounters-g8g9/pokemon/wormadam-plant-cloak.json","b6faa46373"],
+    ["data/pokedb-encounters-g8g9/pokemon/wormadam-sandy-cloak.json","2c57a3d318"],
+    ["data/pokedb-encounters-g8g9/pokemon/wormadam-trash-cloak.json","af9667c3be"],
+    ["data/pokedb-encounters-g8g9/pokemon/wugtrio.json","c7e3db78de"],
+    ["data/pokedb-encounters-g8g9/pokemon/wurmple.json","9e81182a8d"],
+    ["data/pokedb-encounters-g8g9/pokemon/wynaut.json","092cfc20ba"],
+    ["data/pokedb-encounters-g8g9/pokemon/xatu.json","d83181eced"],
+    ["data/pokedb-encounters-g8g9/pokemon/xerneas-neutral.json","393077a71c"],
+    ["data/pokedb-encounters-g8g9/pokemon/xurkitree.json","619dcc657d"],
+    ["data/pokedb-encounters-g8g9/pokemon/yamask-galarian.json","5ff8596c03"],
+    ["data/pokedb-encounters-g8g9/pokemon/yamper.json","814e07aa47"],
+    ["data/pokedb-encounters-g8g9/pokemon/yanma.json","25088ed6c1"],
+    ["data/pokedb-encounters-g8g9/pokemon/yanmega.json","c1c0767498"],
+    ["data/pokedb-encounters-g8g9/pokemon/yungoos.json","fcfd2aefa7"],
+    ["data/pokedb-encounters-g8g9/pokemon/yveltal.json","17189e5036"],
+    ["data/pokedb-encounters-g8g9/pokemon/zacian-hero.json","11a6964b12"],
+    ["data/pokedb-encounters-g8g9/pokemon/zacian-sword.json","8dcfb69831"],
+    ["data/pokedb-encounters-g8g9/pokemon/zamazenta-hero.json","4edbf21674"],
+    ["data/pokedb-encounters-g8g9/pokemon/zamazenta-shield.json","e87ca46105"],
+    ["data/pokedb-encounters-g8g9/pokemon/zangoose.json","9da3994dfa"],
+    ["data/pokedb-encounters-g8g9/pokemon/zapdos.json","db8b48ced6"],
+    ["data/pokedb-encounters-g8g9/pokemon/zekrom.json","cd0441ef81"],
+    ["data/pokedb-encounters-g8g9/pokemon/zigzagoon-galarian.json","fb9cf4f09e"],
+    ["data/pokedb-encounters-g8g9/pokemon/zigzagoon.json","496708cc0a"],
+    ["data/pokedb-encounters-g8g9/pokemon/zoroark-hisuian.json","7cdba88c11"],
+    ["data/pokedb-encounters-g8g9/pokemon/zoroark.json","30f6fcf6b1"],
+    ["data/pokedb-encounters-g8g9/pokemon/zorua-hisuian.json","2999fce003"],
+    ["data/pokedb-encounters-g8g9/pokemon/zorua.json","66c8bbc789"],
+    ["data/pokedb-encounters-g8g9/pokemon/zubat.json","7ae46fee17"],
+    ["data/pokedb-encounters-g8g9/pokemon/zweilous.json","a30268e85c"],
+    ["data/pokedb-encounters-g8g9/pokemon/zygarde-50p.json","a7f5d3618b"]
+  ]}
+};
@@ -0,0 +1,194 @@
+// Service worker (registered from js/script.part1.js over http/https only).
+// - App shell and static data: precached from sw-manifest.js (tools/build_sw_manifest.py),
+//   served cache-first. Cache names carry the manifest versions, and files whose hash did
+//   not change are copied from the previous cache instead of being downloaded again.
+// - Sprites: cache-first with a background refresh, in a bounded runtime cache.
+// - PokéAPI responses pass through untouched: cachedJson in the page already keeps them in
+//   Cache Storage (serving them offline too), and a second, cache-first copy here would
+//   answer its background revalidations with the same stale data.
+// - Anything else that is neither cached nor reachable: offline.html for page loads,
+//   a 503 for subresources.
+importScripts('sw-manifest.js');
+
+const SW_MANIFEST = self.__SW_MANIFEST__;
+const SW_CACHE_PREFIX = 'pokedb-sw-';
+const SHELL_CACHE = `${SW_CACHE_PREFIX}shell-${SW_MANIFEST.shell.version}`;
+const DATA_CACHE = `${SW_CACHE_PREFIX}data-${SW_MANIFEST.data.version}`;
+// v2: PokéAPI responses are no longer kept here; activate drops the v1 cache that held them.
+const RUNTIME_CACHE = `${SW_CACHE_PREFIX}runtime-v2`;
+const RUNTIME_MAX_ENTRIES = 3000;
+const RUNTIME_TRIM_EVERY = 50;
+const PRECACHE_CONCURRENCY = 8;
+const ASSET_HASH_HEADER = 'X-PokeDB-Asset-Hash';
+
+const SCOPE_URL = new URL(self.registration.scope);
+const OFFLINE_URL = new URL('offline.html', SCOPE_URL).href;
+const SPRITE_HOSTS = new Set(['raw.githubusercontent.com']);
+
+let runtimePutsSinceTrim = 0;
+
+async function runPool(items, limit, worker) {
+    let next = 0;
+    const runners = Array.from({ length: Math.min(limit, items.length) }, async () => {
+        while (next < items.length) {
+            const i = next++;
+            await worker(items[i], i);
+        }
+    });
+    await Promise.all(runners);
+}
+
+function withAssetHash(response, hash) {
+    const headers = new Headers(response.headers);
+    headers.set(ASSET_HASH_HEADER, hash);
+    return response.blob().then(body => new Response(body, {
+        status: response.status,
+        statusText: response.statusText,
+        headers
+    }));
+}
+
+// Fill `cacheName` with every asset of a manifest group. Entries already present with the
+// same hash (in this cache or in the previous version's) are reused; the rest is fetched.
+async function precacheGroup(cacheName, group, { required }) {
+    const cache = await caches.open(cacheName);
+    let fetched = 0;
+    let reused = 0;
+    const failed = [];
+
+    await runPool(group.assets, PRECACHE_CONCURRENCY, async ([path, hash]) => {
+        const url = new URL(path, SCOPE_URL).href;
+        const existing = await caches.match(url);
+        if (existing && existing.headers.get(ASSET_HASH_HEADER) === hash) {
+            if (!(await cache.match(url))) await cache.put(url, existing);
+            reused++;
+            return;
+        }
+        try {
+            const res = await fetch(url, { cache: 'no-cache' });
+            if (!res.ok) throw new Error(`HTTP ${res.status}`);
+            await cache.put(url, await withAssetHash(res, hash));
+            fetched++;
+        } catch (err) {
+            failed.push(path);
+        }
+    });
+
+    if (failed.length && required) {
+        // Leave the half-filled cache for the next attempt to reuse, but don't activate on it.
+        throw new Error(`Precache failed for ${failed.length} file(s): ${failed.slice(0, 5).join(', ')}`);
+    }
+    return { fetched, reused, failed: failed.length };
+}
+
+self.addEventListener('install', (event) => {
+    event.waitUntil((async () => {
+        // The shell (offline page included) must be complete; missing data files are
+        // tolerated and fetched on demand instead.
+        await precacheGroup(SHELL_CACHE, SW_MANIFEST.shell, { required: true });
+        await precacheGroup(DATA_CACHE, SW_MANIFEST.data, { required: false });
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil((async () => {
+        const keep = new Set([SHELL_CACHE, DATA_CACHE, RUNTIME_CACHE]);
+        const names = await caches.keys();
+        await Promise.all(
+            names
+                .filter(name => name.startsWith(SW_CACHE_PREFIX) && !keep.has(name))
+                .map(name => caches.delete(name))
+        );
+        await self.clients.claim();
+    })());
+});
+
+async function trimRuntimeCache() {
+    const cache = await caches.open(RUNTIME_CACHE);
+    const keys = await cache.keys();
+    // cache.put() re-appends an entry, so key order is oldest-written first.
+    const excess = keys.length - RUNTIME_MAX_ENTRIES;
+    for (let i = 0; i < excess; i++) await cache.delete(keys[i]);
+}
+
+async function putRuntime(request, response) {
+    const cache = await caches.open(RUNTIME_CACHE);
+    await cache.put(request, response);
+    if (++runtimePutsSinceTrim >= RUNTIME_TRIM_EVERY) {
+        runtimePutsSinceTrim = 0;
+        await trimRuntimeCache();
+    }
+}
+
+function offlineResponse(request) {
+    if (request.mode === 'navigate' || request.destination === 'document') {
+        return caches.match(OFFLINE_URL).then(res => res || new Response('Offline', { status: 503, statusText: 'Offline' }));
+    }
+    return new Response('', { status: 503, statusText: 'Offline' });
+}
+
+function isSpriteRequest(url) {
+    return SPRITE_HOSTS.has(url.hostname);
+}
+
+// Same-origin files: precache first, then network (data files outside the manifest are
+// kept in the runtime cache), then whatever runtime copy we have, then the offline page.
+async function handleSameOrigin(event, url) {
+    const request = event.request;
+    const isDirectory = url.pathname.endsWith('/');
+    const key = isDirectory ? new URL('index.html', url).href : request;
+
+    const precached = await caches.match(key, { ignoreSearch: true, cacheName: SHELL_CACHE })
+        || await caches.match(key, { ignoreSearch: true, cacheName: DATA_CACHE });
+    if (precached) return precached;
+
+    try {
+        const res = await fetch(request);
+        if (res.ok && url.pathname.includes('/data/')) event.waitUntil(putRuntime(request, res.clone()));
+        return res;
+    } catch {
+        const stale = await caches.match(request, { cacheName: RUNTIME_CACHE });
+        return stale || offlineResponse(request);
+    }
+}
+
+// Sprites: cache-first with background refresh. They are refetched in CORS mode (the sprite
+// host allows it) so they are stored as real responses instead of size-padded opaque ones.
+async function handleRuntime(event) {
+    const request = event.request;
+    const fetchRequest = new Request(request.url, { mode: 'cors', credentials: 'omit' });
+    const cached = await caches.match(request.url, { cacheName: RUNTIME_CACHE });
+
+    const refresh = fetch(fetchRequest).then(async (res) => {
+        if (res.ok) await putRuntime(request.url, res.clone());
+        return res;
+    });
+
+    if (cached) {
+        event.waitUntil(refresh.catch(() => {}));
+        return cached;
+    }
+    try {
+        return await refresh;
+    } catch {
+        return offlineResponse(request);
+    }
+}
+
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    // POSTs (GraphQL) can't go in Cache Storage; cachedJson in the page handles those.
+    if (request.method !== 'GET') return;
+
+    const url = new URL(request.url);
+    // PokéAPI JSON (pokeapi.co or a 'pokeapiBase' mirror, same-origin included) is cachedJson's.
+    if (url.pathname.includes('/api/v2/')) return;
+    if (url.origin === SCOPE_URL.origin && url.pathname.startsWith(SCOPE_URL.pathname)) {
+        event.respondWith(handleSameOrigin(event, url));
+        return;
+    }
+    if (isSpriteRequest(url)) {
+        event.respondWith(handleRuntime(event));
+    }
+});
@@ -11,11 +11,23 @@ one of the form tokens (heuristic).
 Usage:
   python tools/audit_form_dex_entries.py
   python tools/audit_form_dex_entries.py --start 931 --end 931
-  python tools/audit_form_dex_entries.py --out tools/form_dex_audit.json
+  python tools/audit_form_dex_entries.py --out tools/form_dex_audit.jsonl
+  python tools/audit_form_dex_entries.py --out tools/form_dex_audit.jsonl --resume
+  python tools/audit_form_dex_entries.py --concurrency 8 --rate 20
 
 Output
 - Prints a summary to stdout.
-- Optionally writes JSON output with full details.
+- Optionally writes full details as JSONL: one compact record per species, appended
+  and flushed as each species completes, so an interrupted run keeps its progress.
+  --resume skips species already in the file (a half-written last line is dropped;
+  an old JSON-array report is converted to JSONL first). Species that errored are
+  not written, so a resumed run retries them. tools/summarize_form_dex_audit.py
+  queries the file.
+- With --concurrency N, species are fetched by N worker threads that share a
+  token-bucket rate limit (--rate requests/sec) and retry 429/5xx responses with
+  exponential backoff. Results are still reported in species order.
+- Responses go through the shared on-disk cache in http_cache.py, so repeat
+  audits are served locally (--offline never touches the network).
 
 Notes
 - This is a heuristic report; it cannot prove PokemonDB has distinct per-form text.
@@ -26,11 +38,17 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import sys
 import time
-import urllib.request
-from typing import Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Iterator
+
+import http_cache
+from json_stream import iter_json_array
 
 API = "https://pokeapi.co/api/v2"
 
@@ -51,10 +69,7 @@ STOP_TOKENS = {
 
 
 def fetch_json(url: str) -> Any:
-    req = urllib.request.Request(url, headers={"User-Agent": "PokemonDB-tools/1.0"})
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        data = resp.read().decode("utf-8")
-    return json.loads(data)
+    return http_cache.fetch_json(url)
 
 
 def normalize_text(text: str) -> str:
@@ -181,51 +196,155 @@ def analyze_species(species_id: int) -> dict:
     return record
 
 
+def iter_records(path: str) -> Iterator[dict]:
+    """Yield the records of a JSONL report, or of an old JSON-array report, one at a time."""
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(64).lstrip("\ufeff \t\r\n")
+    if head.startswith("["):
+        yield from iter_json_array(path)
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # The last line of an interrupted run may be cut short.
+                print(f"Skipping unreadable line in {path}: {line[:60]}", file=sys.stderr)
+
+
+def prepare_resume(path: str) -> set[int]:
+    """Species ids already in the report; leaves the file as JSONL ready to be appended to."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return set()
+    with open(path, "r", encoding="utf-8") as f:
+        is_array = f.read(64).lstrip("\ufeff \t\r\n").startswith("[")
+    if is_array:
+        tmp_path = path + ".part"
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            for rec in iter_json_array(path):
+                f.write(json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n")
+        os.replace(tmp_path, path)
+        print(f"Converted {path} from a JSON array to JSONL")
+    else:
+        # Drop a half-written last line so new records start on a line of their own.
+        with open(path, "rb+") as f:
+            data = f.read()
+            if not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+    return {int(rec["species_id"]) for rec in iter_records(path) if "species_id" in rec}
+
+
 def main(argv: list[str]) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--start", type=int, default=1)
     ap.add_argument("--end", type=int, default=1025)
-    ap.add_argument("--out", type=str, default="")
+    ap.add_argument("--out", type=str, default="", help="JSONL report, written as species complete")
+    ap.add_argument("--resume", action="store_true", help="Skip species already in --out and append the rest")
     ap.add_argument("--sleep", type=float, default=0.0, help="Optional delay between requests")
+    ap.add_argument("--concurrency", type=int, default=1, help="Number of species fetched in parallel")
+    ap.add_argument(
+        "--rate",
+        type=float,
+        default=10.0,
+        help="Max requests/sec shared by all workers when --concurrency > 1 (0 = unlimited)",
+    )
+    http_cache.add_cli_args(ap)
     args = ap.parse_args(argv[1:])
+    if args.resume and not args.out:
+        ap.error("--resume needs --out")
+
+    cache = http_cache.configure_from_args(args)
 
     start = max(1, int(args.start))
     end = max(start, int(args.end))
+    concurrency = max(1, int(args.concurrency))
+    if concurrency > 1:
+        http_cache.configure(rate=args.rate, burst=concurrency)
 
-    results: list[dict] = []
+    done = prepare_resume(args.out) if args.resume else set()
+    pending = [sid for sid in range(start, end + 1) if sid not in done]
+    out_file = open(args.out, "a" if args.resume else "w", encoding="utf-8", newline="\n") if args.out else None
+
+    scanned = 0
     multi = 0
     suspicious = 0
-
-    for sid in range(start, end + 1):
+    started = time.perf_counter()
+
+    def outcomes():
+        # Yields (species_id, record or exception) in species order.
+        if concurrency == 1:
+            for sid in pending:
+                try:
+                    yield sid, analyze_species(sid)
+                except Exception as e:
+                    yield sid, e
+                if args.sleep and args.sleep > 0:
+                    time.sleep(float(args.sleep))
+            return
+
+        # Only a bounded window of species is submitted ahead, so on Ctrl-C the pool drops
+        # what is queued and the run stops after the few fetches already in flight.
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        todo = iter(pending)
+        window = deque((sid, pool.submit(analyze_species, sid)) for sid in islice(todo, concurrency * 2))
         try:
-            rec = analyze_species(sid)
-        except Exception as e:
-            print(f"ERROR species {sid}: {e}")
-            continue
-
-        results.append(rec)
-        if rec["variety_count"] > 1:
-            multi += 1
-        if rec.get("heuristic", {}).get("suspicious"):
-            suspicious += 1
-            ex = rec["heuristic"].get("example") or {}
-            print(
-                f"FLAG {rec['species_id']} {rec['species_name']}: tokens={rec['tokens']} "
-                f"example={ex.get('version')}({ex.get('token')})"
-            )
+            while window:
+                sid, fut = window.popleft()
+                try:
+                    rec = fut.result()
+                except Exception as e:
+                    rec = e
+                for next_sid in islice(todo, 1):
+                    window.append((next_sid, pool.submit(analyze_species, next_sid)))
+                yield sid, rec
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    results = outcomes()
+    try:
+        for sid, rec in results:
+            if isinstance(rec, Exception):
+                print(f"ERROR species {sid}: {rec}")
+                continue
 
-        if args.sleep and args.sleep > 0:
-            time.sleep(float(args.sleep))
+            if out_file:
+                out_file.write(json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n")
+                out_file.flush()
+            scanned += 1
+            if rec["variety_count"] > 1:
+                multi += 1
+            if rec.get("heuristic", {}).get("suspicious"):
+                suspicious += 1
+                ex = rec["heuristic"].get("example") or {}
+                print(
+                    f"FLAG {rec['species_id']} {rec['species_name']}: tokens={rec['tokens']} "
+                    f"example={ex.get('version')}({ex.get('token')})"
+                )
+    finally:
+        results.close()
+        if out_file:
+            out_file.close()
+
+    elapsed = time.perf_counter() - started
 
     print("\nSummary")
     print(f"- Range: {start}..{end}")
-    print(f"- Species scanned: {len(results)}")
+    skipped = end - start + 1 - len(pending)
+    print(f"- Species scanned: {scanned}" + (f" (skipped {skipped} already in {args.out})" if skipped else ""))
     print(f"- Species with >1 variety: {multi}")
     print(f"- Heuristic flagged: {suspicious}")
+    print(f"- Elapsed: {elapsed:.1f}s (concurrency {concurrency})")
+    stats = cache.stats
+    print(
+        f"- Requests: {len(stats.latencies)} "
+        f"(p50 {stats.percentile(50) * 1000:.0f} ms, p95 {stats.percentile(95) * 1000:.0f} ms, "
+        f"retries {stats.retries})"
+    )
 
     if args.out:
-        with open(args.out, "w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
         print(f"\nWrote: {args.out}")
 
     return 0
@@ -0,0 +1,539 @@
+"""Bundle js/script.part1.js … part4.js into minified, content-hashed files per page.
+
+js/script.js loads the four parts with document.write, one after another, on every
+page. This script replaces that with at most two plain <script> tags per page:
+
+- js/dist/common.<hash>.js: the code every page needs
+- js/dist/<page>.<hash>.js: code only that page needs (e.g. the items list on items.html)
+
+The parts are cut into sections at their "// ========== Title ==========" markers.
+The sections listed in PAGE_SECTIONS are page-specific. Every other section goes
+into the common bundle, together with any page-specific section that common code
+(or the page's own HTML) references by name. A `typeof name === 'function'` guard
+does not count as a reference; that is how the page router in script.part3.js
+probes for optional loaders.
+
+Minification is conservative: comments and redundant whitespace are dropped, and
+a newline is kept wherever removing it could change automatic semicolon
+insertion. Names, strings, template literals and regexes are copied as-is. The
+output is re-tokenized and compared with the input before anything is written.
+
+The HTML pages are rewritten in place between <!-- bundle:start --> /
+<!-- bundle:end --> markers, and sw-manifest.js is rebuilt. --restore puts the
+js/script.js loader back and deletes js/dist/. The repo keeps the unbundled
+layout; run this as a deploy step.
+
+Usage:
+  python tools/build_bundle.py             # build, rewrite HTML, print sizes
+  python tools/build_bundle.py --report    # sizes only; writes nothing
+  python tools/build_bundle.py --restore
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import os
+import re
+import shutil
+import sys
+
+import build_sw_manifest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JS_DIR = os.path.join(ROOT_DIR, "js")
+PARTS = ("script.part1.js", "script.part2.js", "script.part3.js", "script.part4.js")
+PAGES = ("index.html",) + tuple(
+    f"pages/{name}"
+    for name in (
+        "abilities.html",
+        "ability-detail.html",
+        "egg-group.html",
+        "item-detail.html",
+        "items.html",
+        "location-detail.html",
+        "locations.html",
+        "move-detail.html",
+        "pokemon-detail.html",
+    )
+)
+
+# Section id -> pages that load it even if nothing references it (it starts the page).
+PAGE_SECTIONS = {
+    "egg-group-page": ("pages/egg-group.html",),
+    "items-page": ("pages/items.html",),
+    "item-detail-page": ("pages/item-detail.html", "pages/items.html"),
+    "abilities-page": ("pages/abilities.html",),
+    "ability-detail-page": ("pages/ability-detail.html",),
+    "move-detail-page": ("pages/move-detail.html",),
+}
+
+LOADER_TAG_RE = re.compile(r'<script src="((?:\.\./)?)js/script\.js"></script>')
+BUNDLE_BLOCK_RE = re.compile(r"<!-- bundle:start -->.*?<!-- bundle:end -->", re.S)
+SECTION_MARKER_RE = re.compile(r"^// =+ (.+?) =+\s*$")
+HASH_LEN = 10
+
+
+# ---------------------------------------------------------------------------
+# Tokenizer
+# ---------------------------------------------------------------------------
+
+_WS_CHARS = frozenset(" \t\r\n\v\f\u00a0\ufeff\u2028\u2029")
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$")
+_PUNCTUATORS = sorted(
+    (
+        ">>>=", "...", "===", "!==", "**=", "<<=", ">>=", ">>>", "&&=", "||=", "??=",
+        "=>", "==", "!=", "<=", ">=", "&&", "||", "??", "?.", "++", "--", "+=", "-=", "*=",
+        "/=", "%=", "&=", "|=", "^=", "<<", ">>", "**",
+    ),
+    key=len,
+    reverse=True,
+)
+# After these keywords a "/" starts a regex literal, not a division.
+_REGEX_AFTER_WORDS = frozenset(
+    ("return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw", "case", "do", "else", "yield", "await")
+)
+_NUMBER_RE = re.compile(r"(?:0[xXoObB][\da-fA-F_]+n?|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?)")
+
+
+def tokenize(src: str) -> list[tuple[str, str]]:
+    """Split JavaScript source into (kind, text) tokens.
+
+    Kinds: ws, comment, str, tmpl (template literal pieces, including the
+    "${" / "}" delimiters), regex, word, num, punct. Joining all texts gives
+    back the source exactly.
+    """
+    tokens: list[tuple[str, str]] = []
+    brace_stack: list[str] = []  # "{" for blocks, "${" for template substitutions
+    i, n = 0, len(src)
+    last = None  # last significant token
+
+    def regex_allowed() -> bool:
+        if last is None:
+            return True
+        kind, text = last
+        if kind in ("num", "str", "regex", "tmpl"):
+            return kind == "tmpl" and text.endswith("${")
+        if kind == "word":
+            return text in _REGEX_AFTER_WORDS
+        return text not in (")", "]", "}")
+
+    def read_template(start: int) -> int:
+        # From just after "`" or "}", read template text up to the closing "`" or next "${".
+        j = start
+        while j < n:
+            c = src[j]
+            if c == "\\":
+                j += 2
+            elif c == "`":
+                return j + 1
+            elif c == "$" and src.startswith("${", j):
+                brace_stack.append("${")
+                return j + 2
+            else:
+                j += 1
+        raise ValueError("unterminated template literal")
+
+    while i < n:
+        c = src[i]
+        if c in _WS_CHARS:
+            j = i + 1
+            while j < n and src[j] in _WS_CHARS:
+                j += 1
+            tokens.append(("ws", src[i:j]))
+            i = j
+            continue
+        if src.startswith("//", i):
+            j = src.find("\n", i)
+            j = n if j < 0 else j
+            tokens.append(("comment", src[i:j]))
+            i = j
+            continue
+        if src.startswith("/*", i):
+            j = src.find("*/", i + 2)
+            if j < 0:
+                raise ValueError("unterminated comment")
+            tokens.append(("comment", src[i : j + 2]))
+            i = j + 2
+            continue
+        if c in "'\"":
+            j = i + 1
+            while j < n and src[j] != c:
+                if src[j] == "\\":
+                    j += 1
+                elif src[j] == "\n":
+                    raise ValueError(f"unterminated string at offset {i}")
+                j += 1
+            tok = ("str", src[i : j + 1])
+            i = j + 1
+        elif c == "`":
+            j = read_template(i + 1)
+            tok = ("tmpl", src[i:j])
+            i = j
+        elif c == "}" and brace_stack and brace_stack[-1] == "${":
+            brace_stack.pop()
+            j = read_template(i + 1)
+            tok = ("tmpl", src[i:j])
+            i = j
+        elif c in _WORD_CHARS and not c.isdigit():
+            j = i + 1
+            while j < n and (src[j] in _WORD_CHARS or ord(src[j]) > 127):
+                j += 1
+            tok = ("word", src[i:j])
+            i = j
+        elif c.isdigit() or (c == "." and i + 1 < n and src[i + 1].isdigit()):
+            m = _NUMBER_RE.match(src, i)
+            tok = ("num", m.group(0))
+            i = m.end()
+        elif c == "/" and regex_allowed():
+            j = i + 1
+            in_class = False
+            while j < n:
+                d = src[j]
+                if d == "\\":
+                    j += 2
+                    continue
+                if d == "\n":
+                    raise ValueError(f"unterminated regex at offset {i}")
+                if d == "[":
+                    in_class = True
+                elif d == "]":
+                    in_class = False
+                elif d == "/" and not in_class:
+                    break
+                j += 1
+            j += 1
+            while j < n and src[j] in _WORD_CHARS:
+                j += 1
+            tok = ("regex", src[i:j])
+            i = j
+        else:
+            text = next((p for p in _PUNCTUATORS if src.startswith(p, i)), c)
+            if text == "{":
+                brace_stack.append("{")
+            elif text == "}" and brace_stack:
+                brace_stack.pop()
+            tok = ("punct", text)
+            i += len(text)
+        tokens.append(tok)
+        last = tok
+    return tokens
+
+
+# ---------------------------------------------------------------------------
+# Minifier
+# ---------------------------------------------------------------------------
+
+# A newline after these tokens (or before the ones in _JOIN_BEFORE) can never end a
+# statement, so dropping it cannot change automatic semicolon insertion.
+_JOIN_AFTER = frozenset("{ ( [ , ; : = ? + - * / % & | ^ ! ~ < > => == === != !== <= >= && || ?? += -= *= /= %= &= |= ^= ...".split())
+_JOIN_BEFORE = frozenset(") ] } , ; .".split())
+_RESTRICTED_WORDS = frozenset(("return", "break", "continue", "throw", "yield", "async"))
+
+
+def _needs_space(prev: tuple[str, str], nxt: tuple[str, str]) -> bool:
+    a, b = prev[1][-1], nxt[1][0]
+    if (a in _WORD_CHARS or ord(a) > 127) and (b in _WORD_CHARS or ord(b) > 127):
+        return True
+    if prev[0] == "num" and b == ".":
+        return True
+    return (a, b) in (("+", "+"), ("-", "-"), ("/", "/"), ("/", "*"), ("<", "!"))
+
+
+def minify(src: str) -> str:
+    out: list[str] = []
+    prev = None
+    gap = ""
+    for kind, text in tokenize(src):
+        if kind in ("ws", "comment"):
+            gap += text
+            continue
+        tok = (kind, text)
+        if prev is not None and gap:
+            newline = "\n" in gap
+            keep_newline = newline and not (
+                (prev[0] == "punct" and prev[1] in _JOIN_AFTER)
+                or (kind == "punct" and text in _JOIN_BEFORE)
+            )
+            if prev[0] == "word" and prev[1] in _RESTRICTED_WORDS and newline:
+                keep_newline = True
+            if kind == "punct" and text in ("++", "--") and newline:
+                keep_newline = True
+            if keep_newline:
+                out.append("\n")
+            elif _needs_space(prev, tok):
+                out.append(" ")
+        elif prev is not None and _needs_space(prev, tok):
+            out.append(" ")
+        out.append(text)
+        prev = tok
+        gap = ""
+    return "".join(out) + "\n"
+
+
+def significant_tokens(src: str) -> list[tuple[str, str]]:
+    return [t for t in tokenize(src) if t[0] not in ("ws", "comment")]
+
+
+# ---------------------------------------------------------------------------
+# Sections and dependencies
+# ---------------------------------------------------------------------------
+
+_DECL_RE = re.compile(r"^(?:async\s+)?function\s*\*?\s*([A-Za-z_$][\w$]*)|^(?:const|let|var|class)\s+([A-Za-z_$][\w$]*)", re.M)
+_LOCAL_DECL_RE = re.compile(r"^[ \t]+(?:async\s+)?function\s*\*?\s*([A-Za-z_$][\w$]*)|^[ \t]+(?:const|let|var)\s+([A-Za-z_$][\w$]*)", re.M)
+_IDENT_RE = re.compile(r"[A-Za-z_$][\w$]*")
+
+
+class Section:
+    __slots__ = ("id", "part", "source", "declares", "references")
+
+    def __init__(self, section_id: str, part: str, source: str) -> None:
+        self.id = section_id
+        self.part = part
+        self.source = source
+        self.declares = {a or b for a, b in _DECL_RE.findall(source)}
+        self.references = _references(source)
+
+
+def _slug(title: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+
+
+def _references(source: str) -> set[str]:
+    """Identifiers used by code, strings and templates (HTML snippets may call globals).
+
+    `.name` property accesses are skipped, and so are names the section declares
+    inside a function (they shadow any global of the same name). A use right after
+    `typeof name` (as in `typeof name === 'function' && name()`) counts as guarded.
+    """
+    refs: set[str] = set()
+    guard: dict[str, int] = {}  # name -> tokens left in which a use is still guarded
+    prev = None
+    for kind, text in significant_tokens(source):
+        if kind == "word":
+            if prev == ("word", "typeof"):
+                guard[text] = 8
+            elif prev in (("punct", "."), ("punct", "?.")):
+                pass
+            elif guard.get(text, 0) > 0:
+                guard.pop(text)
+            else:
+                refs.add(text)
+        elif kind in ("str", "tmpl"):
+            refs.update(_IDENT_RE.findall(text))
+        for name in list(guard):
+            guard[name] -= 1
+            if guard[name] <= 0:
+                del guard[name]
+        prev = (kind, text)
+    return refs - {a or b for a, b in _LOCAL_DECL_RE.findall(source)}
+
+
+def load_sections(js_dir: str = JS_DIR) -> list[Section]:
+    sections: list[Section] = []
+    for part in PARTS:
+        with open(os.path.join(js_dir, part), "r", encoding="utf-8-sig") as f:
+            lines = f.read().splitlines(keepends=True)
+        title = part.replace("script.", "").replace(".js", "")
+        chunk: list[str] = []
+        for line in lines:
+            m = SECTION_MARKER_RE.match(line)
+            if m:
+                if chunk:
+                    sections.append(Section(_slug(title), part, "".join(chunk)))
+                title, chunk = m.group(1), []
+            chunk.append(line)
+        if chunk:
+            sections.append(Section(_slug(title), part, "".join(chunk)))
+    return sections
+
+
+def _closure(selected: set[str], sections: list[Section], extra_refs: set[str]) -> set[str]:
+    by_name = {name: s.id for s in sections if s.id in PAGE_SECTIONS for name in s.declares}
+    selected = set(selected)
+    pending = [s for s in sections if s.id in selected]
+    refs = set(extra_refs)
+    while True:
+        for s in pending:
+            refs |= s.references
+        pending = [s for s in sections if s.id not in selected and s.id in {by_name[r] for r in refs if r in by_name}]
+        if not pending:
+            return selected
+        selected |= {s.id for s in pending}
+
+
+def plan_bundles(sections: list[Section], root: str = ROOT_DIR) -> tuple[list[str], dict[str, list[str]]]:
+    """Return (common section ids, {page: page-only section ids}) in source order."""
+    ids = [s.id for s in sections]
+    unknown = set(PAGE_SECTIONS) - set(ids)
+    if unknown:
+        raise SystemExit(f"PAGE_SECTIONS lists sections that no longer exist: {sorted(unknown)}")
+
+    common = _closure({i for i in ids if i not in PAGE_SECTIONS}, sections, set())
+    pages: dict[str, list[str]] = {}
+    for page in PAGES:
+        with open(os.path.join(root, page), "r", encoding="utf-8-sig") as f:
+            html_refs = set(_IDENT_RE.findall(LOADER_TAG_RE.sub("", BUNDLE_BLOCK_RE.sub("", f.read()))))
+        entries = {sid for sid, owners in PAGE_SECTIONS.items() if page in owners}
+        wanted = _closure(common | entries, sections, html_refs)
+        pages[page] = [i for i in ids if i in wanted and i not in common]
+    return [i for i in ids if i in common], pages
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+
+def _hashed_name(stem: str, text: str) -> str:
+    return f"{stem}.{hashlib.sha256(text.encode('utf-8')).hexdigest()[:HASH_LEN]}.js"
+
+
+def _bundle_source(section_ids: list[str], by_id: dict[str, Section]) -> str:
+    return "".join(by_id[i].source if by_id[i].source.endswith("\n") else by_id[i].source + "\n" for i in section_ids)
+
+
+def _checked_minify(source: str, label: str) -> str:
+    out = minify(source)
+    if significant_tokens(out) != significant_tokens(source):
+        raise SystemExit(f"Minifier changed the token stream of {label}; refusing to write it")
+    return out
+
+
+def build(root: str = ROOT_DIR) -> dict:
+    sections = load_sections(os.path.join(root, "js"))
+    by_id = {s.id: s for s in sections}
+    common_ids, page_ids = plan_bundles(sections, root)
+
+    files: dict[str, str] = {}
+    common_src = _bundle_source(common_ids, by_id)
+    common_min = _checked_minify(common_src, "common")
+    common_name = _hashed_name("common", common_min)
+    files[common_name] = common_min
+
+    pages = {}
+    by_text: dict[str, str] = {}
+    for page, ids in page_ids.items():
+        names = [common_name]
+        if ids:
+            src = _bundle_source(ids, by_id)
+            stem = os.path.splitext(os.path.basename(page))[0]
+            text = _checked_minify(src, page)
+            # Pages that need the same sections share one file (and one cache entry).
+            name = by_text.get(text) or _hashed_name(stem, text)
+            by_text[text] = name
+            files[name] = text
+            names.append(name)
+        pages[page] = {"files": names, "sections": ids}
+
+    return {"files": files, "pages": pages, "common": common_ids, "sections": sections}
+
+
+def _gzip_size(text: str) -> int:
+    return len(gzip.compress(text.encode("utf-8"), compresslevel=9, mtime=0))
+
+
+def print_report(result: dict, root: str = ROOT_DIR) -> None:
+    original = ""
+    for part in PARTS:
+        with open(os.path.join(root, "js", part), "r", encoding="utf-8-sig") as f:
+            original += f.read()
+    files = result["files"]
+    print(f"Unbundled (script.js + 4 parts, 5 sequential requests): {len(original.encode('utf-8')):>9,} bytes, "
+          f"{_gzip_size(original):>7,} gzip")
+    print(f"{'page':<28} {'requests':>8} {'bytes':>9} {'gzip':>7}  page-only sections")
+    for page, info in result["pages"].items():
+        texts = [files[name] for name in info["files"]]
+        raw = sum(len(t.encode("utf-8")) for t in texts)
+        gz = sum(_gzip_size(t) for t in texts)
+        print(f"{page:<28} {len(texts):>8} {raw:>9,} {gz:>7,}  {', '.join(info['sections']) or '-'}")
+    moved = [sid for sid in result["common"] if sid in PAGE_SECTIONS]
+    if moved:
+        print(f"Page sections pulled into common (referenced by shared code): {', '.join(moved)}")
+
+
+def rewrite_pages(result: dict, root: str = ROOT_DIR) -> int:
+    changed = 0
+    for page, info in result["pages"].items():
+        path = os.path.join(root, page)
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        prefix = "../" if page.startswith("pages/") else ""
+        tags = "\n".join(f'  <script src="{prefix}js/dist/{name}"></script>' for name in info["files"])
+        block = f"<!-- bundle:start -->\n{tags}\n  <!-- bundle:end -->"
+        if BUNDLE_BLOCK_RE.search(html):
+            new_html = BUNDLE_BLOCK_RE.sub(lambda _: block, html, count=1)
+        elif LOADER_TAG_RE.search(html):
+            new_html = LOADER_TAG_RE.sub(lambda _: block, html, count=1)
+        else:
+            print(f"  skipped {page}: no js/script.js tag")
+            continue
+        if new_html != html:
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(new_html)
+            changed += 1
+    return changed
+
+
+def restore_pages(root: str = ROOT_DIR) -> int:
+    changed = 0
+    for page in PAGES:
+        path = os.path.join(root, page)
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        prefix = "../" if page.startswith("pages/") else ""
+        new_html = BUNDLE_BLOCK_RE.sub(lambda _: f'<script src="{prefix}js/script.js"></script>', html, count=1)
+        if new_html != html:
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(new_html)
+            changed += 1
+    return changed
+
+
+def write_dist(files: dict[str, str], dist_dir: str) -> tuple[int, int]:
+    os.makedirs(dist_dir, exist_ok=True)
+    written = 0
+    for name, text in files.items():
+        path = os.path.join(dist_dir, name)
+        if not os.path.exists(path):
+            with open(path, "w", encoding="utf-8", newline="\n") as f:
+                f.write(text)
+            written += 1
+    removed = 0
+    for name in os.listdir(dist_dir):
+        if name.endswith(".js") and name not in files:
+            os.remove(os.path.join(dist_dir, name))
+            removed += 1
+    return written, removed
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--root", type=str, default=ROOT_DIR)
+    ap.add_argument("--report", action="store_true", help="Print bundle sizes per page without writing anything")
+    ap.add_argument("--restore", action="store_true", help="Put the js/script.js loader back and delete js/dist/")
+    ap.add_argument("--no-sw-manifest", action="store_true", help="Skip rebuilding sw-manifest.js")
+    args = ap.parse_args(argv[1:])
+
+    if args.restore:
+        changed = restore_pages(args.root)
+        shutil.rmtree(os.path.join(args.root, "js", "dist"), ignore_errors=True)
+        print(f"Restored the js/script.js loader in {changed} page(s)")
+    else:
+        result = build(args.root)
+        print_report(result, args.root)
+        if args.report:
+            return 0
+        written, removed = write_dist(result["files"], os.path.join(args.root, "js", "dist"))
+        changed = rewrite_pages(result, args.root)
+        print(f"Wrote js/dist/ ({len(result['files'])} bundles, new={written}, removed={removed}); "
+              f"rewrote {changed} page(s)")
+
+    if not args.no_sw_manifest and os.path.exists(os.path.join(args.root, "sw-manifest.js")):
+        return build_sw_manifest.main(["build_sw_manifest.py", "--root", args.root])
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
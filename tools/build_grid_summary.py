@@ -0,0 +1,147 @@
+"""Build the compact Pokédex grid summary from the local PokéAPI snapshot.
+
+Grid cards only need a name, a number, types and a sprite, but without this file
+each card that scrolls into view fetches the full /pokemon/{id} payload (hundreds
+of KB) to get them. data/grid-summary.json holds those fields for every Pokémon in
+the snapshot (species and their forms), so the grid renders from one request.
+
+Output (data/grid-summary.json):
+  {"format": "pokedb-grid-summary/1", "generatedAt", "spriteBase",
+   "types": [type, ...],
+   "fields": ["id", "slug", "name", "types", "spriteKey", "species", "speciesId"],
+   "rows": [[id, slug, name, [typeIndex, ...], spriteKey, species, speciesId], ...]}
+
+- name: English species name (the grid shows the base species, PokemonDB-style)
+- spriteKey: path under spriteBase; null when it is the default "<id>.png"
+- species: base-species slug; null when equal to slug
+
+Usage:
+  python tools/pokeapi_snapshot.py build
+  python tools/build_grid_summary.py
+  python tools/build_grid_summary.py --db path/to/snapshot.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+
+from pokeapi_snapshot import DEFAULT_DB, SnapshotStore, parse_resource_url
+from type_chart import TYPE_ORDER
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+OUT_PATH = os.path.join(ROOT, "data", "grid-summary.json")
+FORMAT = "pokedb-grid-summary/1"
+FIELDS = ["id", "slug", "name", "types", "spriteKey", "species", "speciesId"]
+
+SPRITE_BASE = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/"
+
+
+def grid_sprite_key(pokemon: dict) -> str | None:
+    """Front sprite first (what the grid shows), then HOME, then official artwork."""
+    sprites = pokemon.get("sprites") or {}
+    other = sprites.get("other") or {}
+    for url in (
+        sprites.get("front_default"),
+        (other.get("home") or {}).get("front_default"),
+        (other.get("official-artwork") or {}).get("front_default"),
+    ):
+        if url:
+            key = url[len(SPRITE_BASE):] if url.startswith(SPRITE_BASE) else url
+            return None if key == f"{pokemon['id']}.png" else key
+    return None
+
+
+def english_name(species: dict | None) -> str | None:
+    for entry in (species or {}).get("names") or []:
+        if (entry.get("language") or {}).get("name") == "en" and entry.get("name"):
+            return entry["name"]
+    return None
+
+
+def title_from_slug(slug: str) -> str:
+    return " ".join(w.capitalize() for w in slug.split("-") if w)
+
+
+def build_rows(store: SnapshotStore) -> tuple[list[str], list[list]]:
+    types = list(TYPE_ORDER)
+    type_index = {t: i for i, t in enumerate(types)}
+    species_names: dict[int, str | None] = {}
+    rows = []
+
+    for pokemon in sorted(store.iter_kind("pokemon"), key=lambda p: p["id"]):
+        slug = pokemon.get("name") or str(pokemon["id"])
+        species_ref = pokemon.get("species") or {}
+        species_slug = species_ref.get("name") or slug
+        parsed = parse_resource_url(species_ref.get("url"))
+        species_id = parsed[1] if parsed else pokemon["id"]
+
+        if species_id not in species_names:
+            species_names[species_id] = english_name(store.get("pokemon-species", species_id))
+        name = species_names[species_id] or title_from_slug(species_slug)
+
+        type_ids = []
+        for t in sorted(pokemon.get("types") or [], key=lambda t: t.get("slot") or 0):
+            type_name = t["type"]["name"]
+            if type_name not in type_index:
+                type_index[type_name] = len(types)
+                types.append(type_name)
+            type_ids.append(type_index[type_name])
+
+        rows.append([
+            pokemon["id"],
+            slug,
+            name,
+            type_ids,
+            grid_sprite_key(pokemon),
+            None if species_slug == slug else species_slug,
+            species_id,
+        ])
+    return types, rows
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db", type=str, default=DEFAULT_DB, help="Snapshot built by tools/pokeapi_snapshot.py")
+    ap.add_argument("--out", type=str, default=OUT_PATH)
+    args = ap.parse_args(argv[1:])
+
+    if not os.path.exists(args.db):
+        print(f"Snapshot not found: {args.db} (run tools/pokeapi_snapshot.py build first)")
+        return 2
+
+    started = time.perf_counter()
+    with SnapshotStore(args.db) as store:
+        types, rows = build_rows(store)
+
+    payload = {
+        "format": FORMAT,
+        "generatedAt": datetime.datetime.now(datetime.timezone.utc)
+        .replace(microsecond=0)
+        .isoformat()
+        .replace("+00:00", "Z"),
+        "spriteBase": SPRITE_BASE,
+        "types": types,
+        "fields": FIELDS,
+        "rows": rows,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8", newline="\n") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
+
+    defaults = sum(1 for r in rows if r[0] == r[6])
+    print(
+        f"Wrote {args.out}: {len(rows)} Pokémon ({defaults} species, {len(rows) - defaults} forms), "
+        f"{os.path.getsize(args.out):,} bytes in {time.perf_counter() - started:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
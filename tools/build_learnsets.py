@@ -0,0 +1,320 @@
+"""Build per-Pokémon learnset shards from the local PokéAPI snapshot.
+
+The learnset section of a detail page lists moves from the /pokemon payload, then
+fetches /move/{id} for every row (type, category, power, accuracy) and
+/machine/{id} for every TM row, once per version group shown. A Pokémon with a
+big learnset costs 100+ requests. These shards join the moves with their details
+and machine numbers so the section fills in from one file.
+
+Outputs (compact JSON under data/learnsets/):
+- pokemon/<pokemon>.json
+    {"pokemon", "id",
+     "moves": [[name, id, type, damageClass, power, accuracy, pp], ...],
+     "methods": [method, ...],
+     "versionGroups": {versionGroup: [[moveIndex, methodIndex, level, machine], ...]}}
+  machine is the TM/TR/HM item name ("tm05") for machine rows, otherwise null.
+- manifest.json
+
+Subcommands
+  build  Write the shards (needs a snapshot with move and machine resources).
+  bench  Compare the requests and modelled time-to-render of the learnset section
+         with and without the shards, replaying the requests the page makes for
+         the default game tab against the snapshot's payload sizes.
+
+Usage:
+  python tools/pokeapi_snapshot.py build
+  python tools/build_learnsets.py build
+  python tools/build_learnsets.py bench --pokemon charizard,mew,smeargle
+  python tools/build_learnsets.py bench --sample 50 --rtt-ms 120
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import heapq
+import json
+import os
+import random
+import sys
+import time
+
+from build_pokedb_encounters import DATA_DIR, write_json_files
+from pokeapi_snapshot import DEFAULT_DB, SnapshotStore, parse_resource_url
+
+OUT_DIR = os.path.join(DATA_DIR, "learnsets")
+
+# Browsers open at most this many connections per origin (HTTP/1.1), and the page's
+# request scheduler (scheduleFetch in js/script.part1.js) uses the same cap.
+MAX_CONNECTIONS = 6
+
+
+def _body_size(body) -> int:
+    return len(json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+class LearnsetBuilder:
+    """Resolves moves and machines once and reuses them across every Pokémon."""
+
+    def __init__(self, store: SnapshotStore) -> None:
+        self.store = store
+        self.moves: dict[int, list | None] = {}
+        self.machines: dict[int, str | None] = {}
+        self.missing_moves: set[int] = set()
+        self.missing_machines: set[int] = set()
+
+    def move_record(self, move_id: int, name: str) -> list:
+        if move_id not in self.moves:
+            move = self.store.get("move", move_id)
+            if move is None:
+                self.missing_moves.add(move_id)
+                self.moves[move_id] = None
+            else:
+                self.moves[move_id] = [
+                    move.get("name") or name,
+                    move_id,
+                    (move.get("type") or {}).get("name"),
+                    (move.get("damage_class") or {}).get("name"),
+                    move.get("power"),
+                    move.get("accuracy"),
+                    move.get("pp"),
+                ]
+        return self.moves[move_id] or [name, move_id, None, None, None, None, None]
+
+    def machine_item(self, move_id: int, version_group: str) -> str | None:
+        move = self.store.get("move", move_id) or {}
+        for entry in move.get("machines") or []:
+            if (entry.get("version_group") or {}).get("name") != version_group:
+                continue
+            ref = parse_resource_url((entry.get("machine") or {}).get("url"))
+            if not ref:
+                return None
+            machine_id = ref[1]
+            if machine_id not in self.machines:
+                machine = self.store.get("machine", machine_id)
+                if machine is None:
+                    self.missing_machines.add(machine_id)
+                self.machines[machine_id] = ((machine or {}).get("item") or {}).get("name")
+            return self.machines[machine_id]
+        return None
+
+    def shard(self, pokemon: dict) -> dict:
+        moves: list[list] = []
+        methods: list[str] = []
+        method_index: dict[str, int] = {}
+        version_groups: dict[str, list] = {}
+
+        for entry in pokemon.get("moves") or []:
+            ref = entry.get("move") or {}
+            parsed = parse_resource_url(ref.get("url"))
+            if not parsed:
+                continue
+            move_id = parsed[1]
+            move_idx = len(moves)
+            moves.append(self.move_record(move_id, ref.get("name")))
+
+            for d in entry.get("version_group_details") or []:
+                vg = (d.get("version_group") or {}).get("name")
+                method = (d.get("move_learn_method") or {}).get("name")
+                if not vg or not method:
+                    continue
+                if method not in method_index:
+                    method_index[method] = len(methods)
+                    methods.append(method)
+                machine = self.machine_item(move_id, vg) if method == "machine" else None
+                version_groups.setdefault(vg, []).append(
+                    [move_idx, method_index[method], d.get("level_learned_at") or 0, machine]
+                )
+
+        return {
+            "pokemon": pokemon.get("name"),
+            "id": pokemon["id"],
+            "moves": moves,
+            "methods": methods,
+            "versionGroups": version_groups,
+        }
+
+
+def cmd_build(args) -> int:
+    if not os.path.exists(args.db):
+        print(f"Snapshot not found: {args.db} (run tools/pokeapi_snapshot.py build first)")
+        return 2
+
+    started = time.perf_counter()
+    files = {}
+    with SnapshotStore(args.db) as store:
+        builder = LearnsetBuilder(store)
+        for pokemon in store.iter_kind("pokemon"):
+            if pokemon.get("name"):
+                files[f"pokemon/{pokemon['name']}.json"] = builder.shard(pokemon)
+
+    if builder.missing_moves or builder.missing_machines:
+        print(
+            f"Warning: {len(builder.missing_moves)} move(s) and {len(builder.missing_machines)} machine(s) "
+            "are not in the snapshot; their rows are written without details / TM numbers "
+            "(rebuild the snapshot with --kinds including move,machine)."
+        )
+
+    shard_count = len(files)
+    files["manifest.json"] = {
+        "generatedAt": datetime.datetime.now(datetime.timezone.utc)
+        .replace(microsecond=0)
+        .isoformat()
+        .replace("+00:00", "Z"),
+        "counts": {"pokemon": shard_count},
+        "paths": {"pokemon": "pokemon/{pokemon}.json"},
+    }
+
+    written, removed = write_json_files(files, args.out, prune_dirs=("pokemon",))
+    total_bytes = sum(os.path.getsize(os.path.join(args.out, *rel.split("/"))) for rel in files)
+    print(
+        f"Wrote {args.out}: pokemon={shard_count} (updated={written}, removed={removed}, "
+        f"{total_bytes:,} bytes) in {time.perf_counter() - started:.1f}s"
+    )
+    return 0
+
+
+def default_version_group(pokemon: dict) -> str | None:
+    """The game tab the section opens on: the newest version group the Pokémon has moves in.
+
+    Version-group ids follow release order, which is what VERSION_GROUP_TO_GEN in
+    js/script.part2.js encodes; ties within a generation are close enough here.
+    """
+    vg_ids: dict[str, int] = {}
+    for entry in pokemon.get("moves") or []:
+        for d in entry.get("version_group_details") or []:
+            ref = d.get("version_group") or {}
+            parsed = parse_resource_url(ref.get("url"))
+            if ref.get("name"):
+                vg_ids[ref["name"]] = parsed[1] if parsed else 0
+    if not vg_ids:
+        return None
+    return max(vg_ids, key=lambda vg: (vg_ids[vg], vg))
+
+
+def legacy_requests(store: SnapshotStore, pokemon: dict, vg: str) -> list[tuple[int, list[int]]]:
+    """Requests the section makes without shards, as (bytes, [dependency indexes])."""
+    requests: list[tuple[int, list[int]]] = []
+    for entry in pokemon.get("moves") or []:
+        parsed = parse_resource_url((entry.get("move") or {}).get("url"))
+        details = [d for d in entry.get("version_group_details") or [] if (d.get("version_group") or {}).get("name") == vg]
+        if not parsed or not details:
+            continue
+        move = store.get("move", parsed[1]) or {}
+        move_req = len(requests)
+        requests.append((_body_size(move), []))
+        if any((d.get("move_learn_method") or {}).get("name") == "machine" for d in details):
+            for m in move.get("machines") or []:
+                if (m.get("version_group") or {}).get("name") == vg:
+                    ref = parse_resource_url((m.get("machine") or {}).get("url"))
+                    machine = store.get("machine", ref[1]) if ref else None
+                    requests.append((_body_size(machine or {}), [move_req]))
+                    break
+    return requests
+
+
+def simulate(requests: list[tuple[int, list[int]]], rtt_ms: float, kbps: float) -> float:
+    """Finish time (ms) of a request DAG over MAX_CONNECTIONS connections."""
+    if not requests:
+        return 0.0
+    bytes_per_ms = kbps * 1024 / 8 / 1000
+    done = [None] * len(requests)
+    waiting = list(range(len(requests)))
+    free = [0.0] * MAX_CONNECTIONS
+    heapq.heapify(free)
+    finish = 0.0
+    while waiting:
+        ready = [i for i in waiting if all(done[d] is not None for d in requests[i][1])]
+        ready.sort(key=lambda i: max([done[d] for d in requests[i][1]] or [0.0]))
+        for i in ready:
+            start = max(heapq.heappop(free), max([done[d] for d in requests[i][1]] or [0.0]))
+            done[i] = start + rtt_ms + requests[i][0] / bytes_per_ms
+            heapq.heappush(free, done[i])
+            finish = max(finish, done[i])
+            waiting.remove(i)
+    return finish
+
+
+def cmd_bench(args) -> int:
+    if not os.path.exists(args.db):
+        print(f"Snapshot not found: {args.db} (run tools/pokeapi_snapshot.py build first)")
+        return 2
+
+    with SnapshotStore(args.db) as store:
+        names = store.name_to_id("pokemon")
+        if args.pokemon:
+            chosen = [n.strip().lower() for n in args.pokemon.split(",") if n.strip()]
+            unknown = [n for n in chosen if n not in names]
+            if unknown:
+                print(f"Not in the snapshot: {', '.join(unknown)}")
+                return 2
+        else:
+            chosen = sorted(names)
+            random.Random(args.seed).shuffle(chosen)
+            chosen = chosen[: args.sample]
+
+        builder = LearnsetBuilder(store)
+        rows = []
+        for name in chosen:
+            pokemon = store.get("pokemon", names[name])
+            vg = default_version_group(pokemon)
+            if vg is None:
+                continue
+            before = legacy_requests(store, pokemon, vg)
+            shard_bytes = _body_size(builder.shard(pokemon))
+            after = [(shard_bytes, [])]
+            rows.append((
+                name,
+                vg,
+                len(before),
+                sum(b for b, _ in before),
+                simulate(before, args.rtt_ms, args.kbps),
+                shard_bytes,
+                simulate(after, args.rtt_ms, args.kbps),
+            ))
+
+    if not rows:
+        print("No Pokémon with a learnset in the selection.")
+        return 1
+
+    print(f"Model: {MAX_CONNECTIONS} connections, RTT {args.rtt_ms:g} ms, {args.kbps:g} kbit/s; "
+          "the /pokemon request both paths share is excluded.")
+    print(f"{'pokemon':<24}{'game':<34}{'requests':>9}{'bytes':>11}{'ms':>8}  ->  {'requests':>8}{'bytes':>9}{'ms':>7}")
+    for name, vg, n, size, ms, shard_size, shard_ms in rows:
+        print(f"{name:<24}{vg:<34}{n:>9}{size:>11,}{ms:>8.0f}  ->  {1:>8}{shard_size:>9,}{shard_ms:>7.0f}")
+
+    total_before = sum(r[2] for r in rows)
+    ms_before = sum(r[4] for r in rows) / len(rows)
+    ms_after = sum(r[6] for r in rows) / len(rows)
+    print(
+        f"\n{len(rows)} Pokémon: {total_before / len(rows):.1f} -> 1 request(s) on average, "
+        f"modelled time-to-render {ms_before:.0f} ms -> {ms_after:.0f} ms "
+        f"({ms_before / ms_after if ms_after else 0:.1f}x)"
+    )
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    b = sub.add_parser("build", help="Write data/learnsets/ from the snapshot")
+    b.add_argument("--db", type=str, default=DEFAULT_DB, help="Snapshot built by tools/pokeapi_snapshot.py")
+    b.add_argument("--out", type=str, default=OUT_DIR)
+    b.set_defaults(func=cmd_build)
+
+    bench = sub.add_parser("bench", help="Requests and modelled time-to-render, before vs after")
+    bench.add_argument("--db", type=str, default=DEFAULT_DB)
+    bench.add_argument("--pokemon", type=str, default=None, help="Comma-separated Pokémon (default: a random sample)")
+    bench.add_argument("--sample", type=int, default=20)
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--rtt-ms", type=float, default=80.0)
+    bench.add_argument("--kbps", type=float, default=10000.0, help="Downlink bandwidth in kbit/s")
+    bench.set_defaults(func=cmd_bench)
+
+    args = ap.parse_args(argv[1:])
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -1,10 +1,21 @@
+import argparse
 import datetime
+import hashlib
 import json
 import os
 import re
 import shutil
 import sys
+import tempfile
+import time
+import tracemalloc
 import urllib.request
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+from encounter_model import COMPACT_FORMAT, ROW_FIELDS, EncounterTable, LocationIndex
+from json_stream import iter_json_array
+from pokemon_ids import OUT_PATH as POKEMON_IDS_FILE, PokemonIdResolver
 
 POKEDB_EXPORT_BASE = "https://cdn.pokedb.org"
 URL_LOCATION_AREAS = f"{POKEDB_EXPORT_BASE}/data_export_location_areas_json"
@@ -43,15 +54,47 @@ CACHE_DIR = os.path.join(DATA_DIR, ".cache")
 
 OUT_FILE = os.path.join(DATA_DIR, "pokedb-encounters-g8g9.json")
 OUT_JS_FILE = os.path.join(DATA_DIR, "pokedb-encounters-g8g9.js")
+OUT_JS_GLOBAL = "__POKEDB_ENCOUNTERS_G8G9__"
+
+# Columnar, dictionary-encoded variant of the same index (see encode_compact).
+COMPACT_OUT_FILE = os.path.join(DATA_DIR, "pokedb-encounters-g8g9.compact.json")
+COMPACT_OUT_JS_FILE = os.path.join(DATA_DIR, "pokedb-encounters-g8g9.compact.js")
+COMPACT_OUT_JS_GLOBAL = "__POKEDB_ENCOUNTERS_G8G9_COMPACT__"
+
+# Sharded layout: one file per location, one per Pokémon, plus a small manifest.
+SHARD_DIR = os.path.join(DATA_DIR, "pokedb-encounters-g8g9")
+
+# Partitioned layout (--config): one index per partition (generation) plus a manifest
+# saying which partitions hold each location, Pokémon and version.
+PARTITIONS_CONFIG = os.path.join(HERE, "encounter_partitions.json")
+PARTITION_DIR = os.path.join(DATA_DIR, "pokedb-encounters")
+PARTITIONS_FORMAT = "pokedb-encounters-partitions/1"
+
+# Incremental mode: content hashes of the export tables and of each output location.
+MANIFEST_FILE = os.path.join(CACHE_DIR, "pokedb_encounters_manifest.json")
+
+# Modules whose code shapes the output; a change to any of them invalidates like a table.
+BUILDER_FILES = (
+    os.path.abspath(__file__),
+    os.path.join(HERE, "encounter_model.py"),
+    os.path.join(HERE, "json_stream.py"),
+    os.path.join(HERE, "pokemon_ids.py"),
+)
+
+# Ignored when deciding whether an output file changed, so an unchanged rebuild keeps the
+# files (and their hashes in sw-manifest.js) as they are.
+_GENERATED_AT_RE = re.compile(r'"generatedAt":"[^"]*"')
 
 
-def download(url: str, dest_path: str) -> None:
+def download(url: str, dest_path: str, force: bool = False) -> None:
     os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    if os.path.exists(dest_path) and os.path.getsize(dest_path) > 0:
+    if not force and os.path.exists(dest_path) and os.path.getsize(dest_path) > 0:
         return
     print(f"Downloading {url} -> {dest_path}")
-    with urllib.request.urlopen(url) as resp, open(dest_path, "wb") as f:
+    tmp_path = dest_path + ".part"
+    with urllib.request.urlopen(url) as resp, open(tmp_path, "wb") as f:
         shutil.copyfileobj(resp, f)
+    os.replace(tmp_path, dest_path)
 
 
 _num_re = re.compile(r"\d+")
@@ -85,130 +128,137 @@ def parse_percentish(value):
         return None
 
 
-def main() -> int:
-    os.makedirs(DATA_DIR, exist_ok=True)
-    os.makedirs(CACHE_DIR, exist_ok=True)
-
-    loc_areas_path = os.path.join(CACHE_DIR, "pokedb_location_areas.json")
-    encounters_path = os.path.join(CACHE_DIR, "pokedb_encounters.json")
-    locations_path = os.path.join(CACHE_DIR, "pokedb_locations.json")
-
-    download(URL_LOCATION_AREAS, loc_areas_path)
-    download(URL_ENCOUNTERS, encounters_path)
-    download(URL_LOCATIONS, locations_path)
-
-    print("Loading locations...")
-    with open(locations_path, "r", encoding="utf-8") as f:
-        locations = json.load(f)
-
-    target_locations = set()
-    location_to_region_area = {}
+def iter_table(path: str, stream: bool):
+    if stream:
+        return iter_json_array(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Boolean export columns rendered as condition chips, in display order.
+TIME_CONDITIONS = [
+    ("during_morning", "Time Morning"),
+    ("during_day", "Time Day"),
+    ("during_evening", "Time Evening"),
+    ("during_night", "Time Night"),
+]
+
+# Weather checks (PLA) – show as detail chips.
+WEATHER_CONDITIONS = [
+    ("while_clear", "Weather Clear"),
+    ("while_cloudy", "Weather Cloudy"),
+    ("while_harsh_sunlight", "Weather Harsh Sunlight"),
+    ("while_blizzard", "Weather Blizzard"),
+]
+
+# Terrain (SV)
+TERRAIN_CONDITIONS = [
+    ("on_terrain_land", "Terrain Land"),
+    ("on_terrain_watersurface", "Terrain Water Surface"),
+    ("on_terrain_underwater", "Terrain Underwater"),
+    ("on_terrain_overland", "Terrain Overland"),
+    ("on_terrain_sky", "Terrain Sky"),
+]
+
+CONDITION_COLUMNS = TIME_CONDITIONS + WEATHER_CONDITIONS + TERRAIN_CONDITIONS
+
+
+def load_target_locations(locations, regions: Iterable[str] | None = TARGET_REGIONS) -> LocationIndex:
+    """Index the locations in regions (every location when None) with their region."""
+    index = LocationIndex()
     for row in locations:
         loc_id = row.get("identifier")
         region = row.get("region_area_identifier")
         if not loc_id or not region:
             continue
         region_norm = str(region).lower()
-        if region_norm in TARGET_REGIONS:
-            target_locations.add(loc_id)
-            location_to_region_area[loc_id] = region_norm
+        if regions is None or region_norm in regions:
+            index.add_location(loc_id, region_norm)
+    return index
 
-    print("Loading location areas...")
-    with open(loc_areas_path, "r", encoding="utf-8") as f:
-        location_areas = json.load(f)
 
-    # Build mapping: location_area_identifier -> location_identifier
-    area_to_location = {}
-    target_area_ids = set()
+def load_target_areas(location_areas, index: LocationIndex) -> LocationIndex:
+    """Add the areas of the indexed locations (area -> location) and return the index."""
     for row in location_areas:
         area_id = row.get("identifier")
         loc_id = row.get("location_identifier")
         if not area_id or not loc_id:
             continue
-        area_to_location[area_id] = loc_id
-        if loc_id in target_locations:
-            target_area_ids.add(area_id)
+        if loc_id in index:
+            index.add_area(area_id, loc_id)
+    return index
 
-    print(f"Target location areas: {len(target_area_ids)}")
 
-    print("Loading encounters...")
-    with open(encounters_path, "r", encoding="utf-8") as f:
-        encounters = json.load(f)
+def parse_encounter(e: dict, location_of, target_versions: Iterable[str] = TARGET_VERSIONS):
+    """Parse one export encounter into EncounterTable.append arguments, or None if filtered out.
 
-    out_locations = {}
+    location_of maps a location_area_identifier to its target location (or None).
+    """
+    area_id = e.get("location_area_identifier")
+    loc_id = location_of(area_id)
+    if not loc_id:
+        return None
 
-    for e in encounters:
-        area_id = e.get("location_area_identifier")
-        if area_id not in target_area_ids:
-            continue
+    versions = e.get("version_identifiers") or []
+    versions = [v for v in versions if v in target_versions]
+    if not versions:
+        return None
 
-        versions = e.get("version_identifiers") or []
-        versions = [v for v in versions if v in TARGET_VERSIONS]
-        if not versions:
-            continue
+    pokemon_form = e.get("pokemon_form_identifier") or ""
+    pokemon = str(pokemon_form)
+    if pokemon.endswith("-default"):
+        pokemon = pokemon[: -len("-default")]
 
-        loc_id = area_to_location.get(area_id)
-        if not loc_id:
-            continue
+    min_lvl, max_lvl = parse_level_range(e.get("levels"))
 
-        pokemon_form = e.get("pokemon_form_identifier") or ""
-        pokemon = str(pokemon_form)
-        if pokemon.endswith("-default"):
-            pokemon = pokemon[: -len("-default")]
-
-        min_lvl, max_lvl = parse_level_range(e.get("levels"))
-
-        # Prefer explicit rate_overall; else probability_overall.
-        chance = parse_percentish(e.get("rate_overall"))
-        if chance is None:
-            chance = parse_percentish(e.get("probability_overall"))
-
-        conditions = []
-        if e.get("during_morning"):
-            conditions.append("Time Morning")
-        if e.get("during_day"):
-            conditions.append("Time Day")
-        if e.get("during_evening"):
-            conditions.append("Time Evening")
-        if e.get("during_night"):
-            conditions.append("Time Night")
-
-        # Weather checks (PLA) – show as detail chips.
-        for key, label in [
-            ("while_clear", "Weather Clear"),
-            ("while_cloudy", "Weather Cloudy"),
-            ("while_harsh_sunlight", "Weather Harsh Sunlight"),
-            ("while_blizzard", "Weather Blizzard"),
-        ]:
-            if e.get(key):
-                conditions.append(label)
-
-        # Terrain (SV)
-        for key, label in [
-            ("on_terrain_land", "Terrain Land"),
-            ("on_terrain_watersurface", "Terrain Water Surface"),
-            ("on_terrain_underwater", "Terrain Underwater"),
-            ("on_terrain_overland", "Terrain Overland"),
-            ("on_terrain_sky", "Terrain Sky"),
-        ]:
-            if e.get(key):
-                conditions.append(label)
-
-        method = e.get("encounter_method_identifier") or "special"
-
-        out_locations.setdefault(loc_id, []).append(
-            {
-                "pokemon": pokemon,
-                "versions": versions,
-                "method": method,
-                "chance": chance,
-                "minLevel": min_lvl,
-                "maxLevel": max_lvl,
-                "conditions": conditions,
-                "area": area_id,
-            }
-        )
+    # Prefer explicit rate_overall; else probability_overall.
+    chance = parse_percentish(e.get("rate_overall"))
+    if chance is None:
+        chance = parse_percentish(e.get("probability_overall"))
+
+    conditions = [label for key, label in CONDITION_COLUMNS if e.get(key)]
+
+    method = e.get("encounter_method_identifier") or "special"
+
+    return loc_id, pokemon, versions, method, chance, min_lvl, max_lvl, conditions, area_id
 
+
+def encounter_to_row(e: dict, location_of, target_versions: Iterable[str] = TARGET_VERSIONS):
+    """Convert one export encounter to (location_identifier, row dict), or None if filtered out."""
+    parsed = parse_encounter(e, location_of, target_versions)
+    if parsed is None:
+        return None
+    loc_id, *values = parsed
+    return loc_id, dict(zip(ROW_FIELDS, values))
+
+
+def scan_encounters(
+    encounters, index: LocationIndex, target_versions: Iterable[str] = TARGET_VERSIONS
+) -> tuple[EncounterTable, int]:
+    """Collect the target encounters into an EncounterTable -> (table, rows scanned)."""
+    table = EncounterTable(index, [label for _, label in CONDITION_COLUMNS])
+    scanned = 0
+    for e in encounters:
+        scanned += 1
+        parsed = parse_encounter(e, index.location_of, target_versions)
+        if parsed is not None:
+            table.append(*parsed)
+    return table, scanned
+
+
+def build_payload(
+    out_locations: Mapping,
+    index: LocationIndex,
+    pokemon_ids: dict | None = None,
+    regions: Iterable[str] | None = TARGET_REGIONS,
+    versions: Iterable[str] = TARGET_VERSIONS,
+) -> dict:
+    """pokemon_ids ({name: [pokemonId, speciesId]}, see tools/pokemon_ids.py) is embedded when given.
+
+    regions=None records the regions of the locations in the payload.
+    """
+    if regions is None:
+        regions = {index.region_of(k) for k in out_locations.keys()}
     meta = {
         "source": "PokeDB Data Export",
         "sourceUrl": "https://pokedb.org/data-export",
@@ -216,8 +266,8 @@ def main() -> int:
         .replace(microsecond=0)
         .isoformat()
         .replace("+00:00", "Z"),
-        "regions": sorted(TARGET_REGIONS),
-        "versions": sorted(TARGET_VERSIONS),
+        "regions": sorted(regions),
+        "versions": sorted(versions),
         "tables": {
             "encounters": URL_ENCOUNTERS,
             "location_areas": URL_LOCATION_AREAS,
@@ -231,23 +281,717 @@ def main() -> int:
         "locations": out_locations,
         # Allows the frontend to split SwSh base game vs DLC rows (and similar future grouping)
         # without hardcoding location slug lists.
-        "locationRegions": {k: location_to_region_area.get(k) for k in out_locations.keys()},
+        "locationRegions": {k: index.region_of(k) for k in out_locations.keys()},
+    }
+    if pokemon_ids is not None:
+        # Lets location pages link and draw every row without a /pokemon/{name} lookup each.
+        payload["pokemonIds"] = pokemon_ids
+    return payload
+
+
+def iterencode_payload(encoder: json.JSONEncoder, payload: dict):
+    """encoder.iterencode(payload), except that mappings which are not dicts (the
+    EncounterTable) are encoded one item at a time, so their rows never all exist as dicts."""
+    if isinstance(payload, dict):
+        items = payload.items()
+    elif isinstance(payload, Mapping):
+        items = ((k, payload[k]) for k in payload)
+    else:
+        yield from encoder.iterencode(payload)
+        return
+    yield "{"
+    for i, (key, value) in enumerate(items):
+        yield ("," if i else "") + encoder.encode(key) + ":"
+        if isinstance(value, Mapping) and not isinstance(value, dict):
+            yield from iterencode_payload(encoder, value)
+        else:
+            yield from encoder.iterencode(value)
+    yield "}"
+
+
+def write_outputs(
+    payload: dict,
+    json_path: str = OUT_FILE,
+    js_path: str = OUT_JS_FILE,
+    js_global: str = OUT_JS_GLOBAL,
+) -> None:
+    """Serialize the payload once, streaming each chunk into both the .json and the .js wrapper.
+
+    Both go to temporary files first; an existing file that differs only in generatedAt is kept.
+    """
+    # Also write a JS wrapper for file:// browsing (fetching local JSON is often blocked).
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    with open(json_path + ".tmp", "w", encoding="utf-8") as fj, open(js_path + ".tmp", "w", encoding="utf-8") as fs:
+        fs.write(f"window.{js_global} = ")
+        for chunk in iterencode_payload(encoder, payload):
+            fj.write(chunk)
+            fs.write(chunk)
+        fs.write(";\n")
+    for path in (json_path, js_path):
+        if replace_if_changed(path + ".tmp", path):
+            print(f"Writing {path}")
+        else:
+            print(f"Unchanged: {path}")
+
+
+def same_ignoring_generated_at(a: str, b: str) -> bool:
+    return _GENERATED_AT_RE.sub("", a) == _GENERATED_AT_RE.sub("", b)
+
+
+def replace_if_changed(tmp_path: str, path: str) -> bool:
+    """Move tmp_path over path unless path holds the same content apart from generatedAt."""
+    try:
+        with open(tmp_path, "r", encoding="utf-8") as f_new, open(path, "r", encoding="utf-8") as f_old:
+            unchanged = same_ignoring_generated_at(f_new.read(), f_old.read())
+    except OSError:
+        unchanged = False
+    if unchanged:
+        os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, path)
+    return True
+
+
+def encode_compact(payload: dict) -> dict:
+    """Dictionary-encode the payload into columns of small integers.
+
+    Strings (Pokémon, versions, methods, conditions, areas, regions) live once in
+    `strings`; every row is one position across the `rows` columns, and location i
+    owns rows offsets[i]..offsets[i + 1]. Versions and conditions are bitmasks over
+    their string tables, so those tables must stay within 31 entries (JS bitwise ops).
+    """
+    strings: dict[str, list] = {k: [] for k in ("pokemon", "versions", "methods", "conditions", "areas", "regions")}
+    lookup: dict[str, dict] = {k: {} for k in strings}
+
+    def intern(table: str, value) -> int:
+        idx = lookup[table].get(value)
+        if idx is None:
+            idx = lookup[table][value] = len(strings[table])
+            strings[table].append(value)
+        return idx
+
+    def mask(table: str, values) -> int:
+        m = 0
+        for v in values:
+            m |= 1 << intern(table, v)
+        return m
+
+    # Seed conditions in display order so decoding bits in order reproduces chip order.
+    for _, label in CONDITION_COLUMNS:
+        intern("conditions", label)
+
+    rows: dict[str, list] = {
+        k: [] for k in ("pokemon", "versions", "method", "chance", "minLevel", "maxLevel", "conditions", "area")
+    }
+    regions = payload.get("locationRegions") or {}
+    location_ids = []
+    location_regions = []
+    offsets = [0]
+    for loc_id, loc_rows in payload["locations"].items():
+        location_ids.append(loc_id)
+        location_regions.append(intern("regions", regions.get(loc_id)))
+        for row in loc_rows:
+            rows["pokemon"].append(intern("pokemon", row["pokemon"]))
+            rows["versions"].append(mask("versions", row["versions"]))
+            rows["method"].append(intern("methods", row["method"]))
+            rows["chance"].append(row["chance"])
+            rows["minLevel"].append(row["minLevel"])
+            rows["maxLevel"].append(row["maxLevel"])
+            rows["conditions"].append(mask("conditions", row["conditions"]))
+            rows["area"].append(intern("areas", row["area"]))
+        offsets.append(len(rows["pokemon"]))
+
+    for table in ("versions", "conditions"):
+        if len(strings[table]) > 31:
+            raise ValueError(f"Too many {table} for a 31-bit mask: {len(strings[table])}")
+
+    compact = {
+        "_meta": payload["_meta"],
+        "format": COMPACT_FORMAT,
+        "strings": strings,
+        "locations": location_ids,
+        "locationRegions": location_regions,
+        "offsets": offsets,
+        "rows": rows,
+    }
+    if "pokemonIds" in payload:
+        # Parallel to strings.pokemon: [pokemonId, speciesId], or null when unresolved.
+        compact["pokemonIds"] = [payload["pokemonIds"].get(name) for name in strings["pokemon"]]
+    return compact
+
+
+def decode_compact(compact: dict) -> dict:
+    """Inverse of encode_compact (mirrors decodeCompactPokeDbIndex in js/script.part1.js)."""
+    if compact.get("format") != COMPACT_FORMAT:
+        raise ValueError(f"Unsupported compact format: {compact.get('format')!r}")
+    strings = compact["strings"]
+    rows = compact["rows"]
+    offsets = compact["offsets"]
+
+    def unmask(table: str, m: int) -> list:
+        names = strings[table]
+        return [names[i] for i in range(len(names)) if m >> i & 1]
+
+    locations = {}
+    location_regions = {}
+    for i, loc_id in enumerate(compact["locations"]):
+        location_regions[loc_id] = strings["regions"][compact["locationRegions"][i]]
+        locations[loc_id] = [
+            {
+                "pokemon": strings["pokemon"][rows["pokemon"][j]],
+                "versions": unmask("versions", rows["versions"][j]),
+                "method": strings["methods"][rows["method"][j]],
+                "chance": rows["chance"][j],
+                "minLevel": rows["minLevel"][j],
+                "maxLevel": rows["maxLevel"][j],
+                "conditions": unmask("conditions", rows["conditions"][j]),
+                "area": strings["areas"][rows["area"][j]],
+            }
+            for j in range(offsets[i], offsets[i + 1])
+        ]
+
+    decoded = {"_meta": compact["_meta"], "locations": locations, "locationRegions": location_regions}
+    if "pokemonIds" in compact:
+        decoded["pokemonIds"] = dict(sorted(
+            (name, ids) for name, ids in zip(strings["pokemon"], compact["pokemonIds"]) if ids
+        ))
+    return decoded
+
+
+def payloads_equal(a: dict, b: dict) -> bool:
+    """a == b for payloads whose "locations" may be an EncounterTable, compared location by location."""
+    if a.keys() != b.keys() or any(a[k] != b[k] for k in a if k != "locations"):
+        return False
+    locs_a, locs_b = a["locations"], b["locations"]
+    return list(locs_a) == list(locs_b) and all(locs_a[k] == locs_b[k] for k in locs_a)
+
+
+def write_compact(
+    payload: dict,
+    json_path: str = COMPACT_OUT_FILE,
+    js_path: str = COMPACT_OUT_JS_FILE,
+    js_global: str = COMPACT_OUT_JS_GLOBAL,
+) -> None:
+    compact = encode_compact(payload)
+    if not payloads_equal(decode_compact(compact), payload):
+        raise ValueError("Compact encoding does not round-trip; not writing it")
+    write_outputs(compact, json_path, js_path, js_global)
+
+
+def verify_compact(json_path: str = OUT_FILE, compact_path: str = COMPACT_OUT_FILE) -> int:
+    """Check that the compact file on disk decodes to exactly the full JSON index."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        full = json.load(f)
+    with open(compact_path, "r", encoding="utf-8") as f:
+        decoded = decode_compact(json.load(f))
+
+    full_size = os.path.getsize(json_path)
+    compact_size = os.path.getsize(compact_path)
+    print(f"Full:    {json_path} ({full_size:,} bytes)")
+    print(f"Compact: {compact_path} ({compact_size:,} bytes, {full_size / compact_size:.1f}x smaller)")
+
+    if decoded == full:
+        print("OK: compact index decodes to the full index.")
+        return 0
+
+    for loc_id in sorted(set(full.get("locations", {})) | set(decoded.get("locations", {}))):
+        if full["locations"].get(loc_id) != decoded["locations"].get(loc_id):
+            print(f"MISMATCH: location {loc_id}")
+    for key in ("_meta", "locationRegions", "pokemonIds"):
+        if full.get(key) != decoded.get(key):
+            print(f"MISMATCH: {key}")
+    return 1
+
+
+def build_shards(payload: dict) -> dict:
+    """Split the payload into {relative_path: json_object} shards.
+
+    - locations/<location>.json: the location's rows (what location pages render), plus the
+      ids of its Pokémon when the payload has them
+    - pokemon/<slug>.json: version -> locations for one Pokémon (what "Where to find" needs)
+    - manifest.json: metadata and counts
+    """
+    out_locations = payload["locations"]
+    regions = payload["locationRegions"]
+
+    by_pokemon: dict[str, dict[str, set]] = {}
+    for loc_id, rows in out_locations.items():
+        for row in rows:
+            versions = by_pokemon.setdefault(row["pokemon"].lower(), {})
+            for v in row["versions"]:
+                versions.setdefault(v, set()).add(loc_id)
+
+    pokemon_ids = payload.get("pokemonIds")
+    shards = {}
+    for loc_id, rows in out_locations.items():
+        shard = {"location": loc_id, "region": regions.get(loc_id), "rows": rows}
+        if pokemon_ids is not None:
+            names = sorted({row["pokemon"] for row in rows})
+            shard["pokemonIds"] = {name: pokemon_ids[name] for name in names if name in pokemon_ids}
+        shards[f"locations/{loc_id}.json"] = shard
+
+    for slug, versions in by_pokemon.items():
+        locs = sorted(set().union(*versions.values()))
+        shards[f"pokemon/{slug}.json"] = {
+            "pokemon": slug,
+            "versions": {v: sorted(versions[v]) for v in sorted(versions)},
+            "locationRegions": {loc: regions.get(loc) for loc in locs},
+        }
+
+    shards["manifest.json"] = {
+        "_meta": payload["_meta"],
+        "locationCount": len(out_locations),
+        "pokemonCount": len(by_pokemon),
+        "paths": {"location": "locations/{location}.json", "pokemon": "pokemon/{pokemon}.json"},
     }
+    return shards
+
+
+def write_json_files(files: dict, out_dir: str, prune_dirs=()) -> tuple[int, int]:
+    """Write {relative_path: json_object} under out_dir as compact JSON.
+
+    Files whose content is unchanged (apart from generatedAt) are left untouched, so
+    their mtime and any HTTP validators stay stable, and *.json files in prune_dirs
+    that are no longer produced are deleted. Returns (updated, removed).
+    """
+    written = 0
+    for rel_path, obj in files.items():
+        path = os.path.join(out_dir, *rel_path.split("/"))
+        encoded = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                if same_ignoring_generated_at(f.read(), encoded):
+                    continue
+        except OSError:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(encoded)
+        written += 1
+
+    removed = 0
+    for sub in prune_dirs:
+        sub_dir = os.path.join(out_dir, sub)
+        if not os.path.isdir(sub_dir):
+            continue
+        for name in os.listdir(sub_dir):
+            if name.endswith(".json") and f"{sub}/{name}" not in files:
+                os.remove(os.path.join(sub_dir, name))
+                removed += 1
 
-    print(f"Writing {OUT_FILE} (locations={len(out_locations)})")
-    with open(OUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+    return written, removed
 
-    # Also write a JS wrapper for file:// browsing (fetching local JSON is often blocked).
-    print(f"Writing {OUT_JS_FILE}")
-    with open(OUT_JS_FILE, "w", encoding="utf-8") as f:
-        f.write("window.__POKEDB_ENCOUNTERS_G8G9__ = ")
-        f.write(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
-        f.write(";\n")
+
+def write_shards(payload: dict, shard_dir: str = SHARD_DIR) -> None:
+    """Write the sharded layout, touching only files whose content changed and removing stale shards."""
+    shards = build_shards(payload)
+    written, removed = write_json_files(shards, shard_dir, prune_dirs=("locations", "pokemon"))
+    print(f"Wrote shards to {shard_dir} (files={len(shards)}, updated={written}, removed={removed})")
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def builder_digest() -> str:
+    h = hashlib.sha256()
+    for path in BUILDER_FILES:
+        h.update(file_digest(path).encode("ascii"))
+    return h.hexdigest()
+
+
+def missing_outputs() -> list[str]:
+    """Outputs of a single-index build that are not on disk (any of them forces a rewrite)."""
+    paths = [OUT_FILE, OUT_JS_FILE, COMPACT_OUT_FILE, COMPACT_OUT_JS_FILE, os.path.join(SHARD_DIR, "manifest.json")]
+    missing = [p for p in paths if not os.path.isfile(p)]
+    missing += [p for p in (os.path.join(SHARD_DIR, "locations"), os.path.join(SHARD_DIR, "pokemon")) if not os.path.isdir(p)]
+    return missing
+
+
+def location_digest(rows: list) -> str:
+    encoded = json.dumps(rows, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def load_manifest() -> dict:
+    try:
+        with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: dict) -> None:
+    with open(MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def diff_locations(old: dict, new: dict) -> tuple[list[str], list[str], list[str]]:
+    """Compare two {location_identifier: digest} maps -> (added, removed, changed)."""
+    added = sorted(k for k in new if k not in old)
+    removed = sorted(k for k in old if k not in new)
+    changed = sorted(k for k in new if k in old and old[k] != new[k])
+    return added, removed, changed
+
+
+def print_location_diff(added: list[str], removed: list[str], changed: list[str], limit: int = 20) -> None:
+    print("\nLocation changes")
+    for label, names in (("Added", added), ("Removed", removed), ("Changed", changed)):
+        shown = ", ".join(names[:limit])
+        more = f" (+{len(names) - limit} more)" if len(names) > limit else ""
+        print(f"- {label}: {len(names)}{': ' + shown if names else ''}{more}")
+
+
+def peak_memory_mb():
+    """Peak RSS of this process in MB, or the traced Python heap peak where RSS is unavailable."""
+    try:
+        import resource
+    except ImportError:
+        if not tracemalloc.is_tracing():
+            return None
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def load_partition_config(path: str) -> list[dict]:
+    """Read the partitions ({id, label, versions, regions?}) of a partitioned build.
+
+    A version may belong to one partition only; regions, when given, further limit a
+    partition's locations. At most 31 partitions, as the manifest stores them as bitmasks.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        partitions = json.load(f)["partitions"]
+    ids = set()
+    owner = {}
+    for part in partitions:
+        if not part.get("id") or part["id"] in ids:
+            raise ValueError(f"{path}: missing or duplicate partition id {part.get('id')!r}")
+        ids.add(part["id"])
+        for v in part.get("versions") or []:
+            if v in owner:
+                raise ValueError(f"{path}: version {v!r} is in both {owner[v]!r} and {part['id']!r}")
+            owner[v] = part["id"]
+    if len(partitions) > 31:
+        raise ValueError(f"{path}: too many partitions for a 31-bit mask: {len(partitions)}")
+    return partitions
+
+
+def route_encounters(encounters, version_partition: dict[str, int], paths: list[str]) -> tuple[list[int], int]:
+    """Split the export by partition in one pass, appending each encounter as a JSONL line
+    to its partition's file -> (encounters per partition, rows scanned).
+
+    An encounter listing versions of several partitions goes to each of them; each
+    partition's scan keeps only its own versions.
+    """
+    counts = [0] * len(paths)
+    scanned = 0
+    files = [open(path, "w", encoding="utf-8") for path in paths]
+    try:
+        for e in encounters:
+            scanned += 1
+            parts = {version_partition[v] for v in e.get("version_identifiers") or [] if v in version_partition}
+            if not parts:
+                continue
+            line = json.dumps(e, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for p in parts:
+                files[p].write(line)
+                counts[p] += 1
+    finally:
+        for f in files:
+            f.close()
+    return counts, scanned
+
+
+def iter_jsonl(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def build_partition(
+    partition: dict, locations_path: str, loc_areas_path: str, encounters_path: str, pokemon_ids_path: str, out_dir: str
+) -> dict:
+    """Build and write one partition's compact index and shards (runs in a worker process).
+
+    Only paths cross the process boundary: the worker streams its own routed encounters
+    (JSONL) and reads the small location tables and the id table itself.
+    """
+    started = time.perf_counter()
+    regions = partition.get("regions")
+    versions = set(partition["versions"])
+    index = load_target_locations(iter_json_array(locations_path), regions)
+    load_target_areas(iter_json_array(loc_areas_path), index)
+    table, _ = scan_encounters(iter_jsonl(encounters_path), index, versions)
+
+    pokemon_ids = None
+    unresolved: list[str] = []
+    resolver = PokemonIdResolver.load(pokemon_ids_path)
+    if resolver is not None:
+        pokemon_ids, unresolved = resolver.resolve_all(table.pokemon_names.values)
+    payload = build_payload(table, index, pokemon_ids, regions, versions)
+
+    pid = partition["id"]
+    js_global = f"__POKEDB_ENCOUNTERS_{re.sub(r'[^A-Z0-9]', '_', pid.upper())}_COMPACT__"
+    write_compact(payload, os.path.join(out_dir, f"{pid}.compact.json"), os.path.join(out_dir, f"{pid}.compact.js"), js_global)
+    write_shards(payload, os.path.join(out_dir, pid))
+    return {
+        "id": pid,
+        "locations": list(table),
+        "pokemon": sorted({name.lower() for name in table.pokemon_names.values}),
+        "versions": list(table.version_names.values),
+        "rowCount": table.row_count,
+        "idsEmbedded": resolver is not None,
+        "unresolved": unresolved,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def build_partitioned(args, locations_path: str, loc_areas_path: str, encounters_path: str) -> int:
+    """--config: one index per partition, built in worker processes, plus the partition manifest."""
+    partitions = load_partition_config(args.config)
+    version_partition = {v: i for i, part in enumerate(partitions) for v in part["versions"]}
+
+    with tempfile.TemporaryDirectory(prefix="partitions-", dir=CACHE_DIR) as tmp_dir:
+        print(f"Routing encounters to {len(partitions)} partitions...")
+        route_started = time.perf_counter()
+        routed_paths = [os.path.join(tmp_dir, f"{i}.jsonl") for i in range(len(partitions))]
+        counts, scanned = route_encounters(iter_table(encounters_path, args.stream), version_partition, routed_paths)
+        route_seconds = time.perf_counter() - route_started
+
+        built = [i for i in range(len(partitions)) if counts[i]]
+        jobs = [partitions[i] for i in built]
+        skipped = [part["id"] for i, part in enumerate(partitions) if not counts[i]]
+        if skipped:
+            print(f"No encounters for: {', '.join(skipped)}")
+        os.makedirs(PARTITION_DIR, exist_ok=True)
+
+        build_started = time.perf_counter()
+        job_args = (
+            jobs,
+            [locations_path] * len(jobs),
+            [loc_areas_path] * len(jobs),
+            [routed_paths[i] for i in built],
+            [args.pokemon_ids] * len(jobs),
+            [PARTITION_DIR] * len(jobs),
+        )
+        workers = max(1, min(args.workers, len(jobs)))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                results = list(ex.map(build_partition, *job_args))
+        else:
+            results = list(map(build_partition, *job_args))
+        build_seconds = time.perf_counter() - build_started
+
+    if not all(result["idsEmbedded"] for result in results):
+        print(f"No Pokémon id table at {args.pokemon_ids}; location pages will look ids up at runtime")
+
+    location_masks: dict[str, int] = {}
+    pokemon_masks: dict[str, int] = {}
+    version_index: dict[str, int] = {}
+    for i, result in enumerate(results):
+        for loc in result["locations"]:
+            location_masks[loc] = location_masks.get(loc, 0) | 1 << i
+        for slug in result["pokemon"]:
+            pokemon_masks[slug] = pokemon_masks.get(slug, 0) | 1 << i
+        for v in result["versions"]:
+            version_index[v] = i
+
+    manifest = {
+        "format": PARTITIONS_FORMAT,
+        "generatedAt": datetime.datetime.now(datetime.timezone.utc)
+        .replace(microsecond=0)
+        .isoformat()
+        .replace("+00:00", "Z"),
+        "partitions": [
+            {
+                "id": part["id"],
+                "label": part.get("label") or part["id"],
+                "versions": part["versions"],
+                "locationCount": len(result["locations"]),
+                "pokemonCount": len(result["pokemon"]),
+                "rowCount": result["rowCount"],
+            }
+            for part, result in zip(jobs, results)
+        ],
+        # Version -> i, where partitions[i] holds it (an index, not a bitmask).
+        "versions": dict(sorted(version_index.items())),
+        # Bit i set = partitions[i] has rows for it; loaders fetch only those partitions.
+        "locations": dict(sorted(location_masks.items())),
+        "pokemon": dict(sorted(pokemon_masks.items())),
+        "paths": {
+            "compact": "{partition}.compact.json",
+            "location": "{partition}/locations/{location}.json",
+            "pokemon": "{partition}/pokemon/{pokemon}.json",
+        },
+    }
+    write_json_files({"manifest.json": manifest}, PARTITION_DIR)
+
+    print("\nPartitions")
+    for result in results:
+        print(f"- {result['id']}: {len(result['locations'])} locations, {result['rowCount']} rows, "
+              f"{len(result['pokemon'])} Pokémon in {result['seconds']:.2f}s")
+        if result["unresolved"]:
+            more = f" (+{len(result['unresolved']) - 20} more)" if len(result["unresolved"]) > 20 else ""
+            print(f"  unresolved ids: {', '.join(result['unresolved'][:20])}{more}")
+    print(f"Routed {scanned} encounters in {route_seconds:.2f}s; built {len(results)} partitions in "
+          f"{build_seconds:.2f}s with {workers} worker(s) (sum of partition times "
+          f"{sum(r['seconds'] for r in results):.2f}s)")
+    print(f"Wrote {os.path.join(PARTITION_DIR, 'manifest.json')}")
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--stream",
+        action="store_true",
+        help="Walk the export tables incrementally instead of json.load-ing them whole",
+    )
+    ap.add_argument("--benchmark", action="store_true", help="Report peak memory and rows/sec")
+    ap.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip the rebuild when the export is unchanged and only rewrite outputs when locations changed",
+    )
+    ap.add_argument("--refresh", action="store_true", help="Re-download the export tables even if cached")
+    ap.add_argument(
+        "--pokemon-ids",
+        type=str,
+        default=POKEMON_IDS_FILE,
+        help="Name -> id table from tools/pokemon_ids.py; its ids are embedded in the index",
+    )
+    ap.add_argument(
+        "--verify-compact",
+        action="store_true",
+        help="Only check that the compact index on disk decodes to the full JSON index",
+    )
+    ap.add_argument(
+        "--config",
+        type=str,
+        nargs="?",
+        const=PARTITIONS_CONFIG,
+        default=None,
+        help="Build one index per partition from this config (default: tools/encounter_partitions.json) "
+        "into data/pokedb-encounters/ instead of the single g8g9 index",
+    )
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processes for --config")
+    args = ap.parse_args(argv[1:])
+    if args.config and args.incremental:
+        ap.error("--incremental is not supported with --config")
+
+    if args.verify_compact:
+        return verify_compact()
+
+    if args.benchmark:
+        try:
+            import resource  # noqa: F401
+        except ImportError:
+            tracemalloc.start()
+    started = time.perf_counter()
+
+    os.makedirs(DATA_DIR, exist_ok=True)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    loc_areas_path = os.path.join(CACHE_DIR, "pokedb_location_areas.json")
+    encounters_path = os.path.join(CACHE_DIR, "pokedb_encounters.json")
+    locations_path = os.path.join(CACHE_DIR, "pokedb_locations.json")
+
+    download(URL_LOCATION_AREAS, loc_areas_path, force=args.refresh)
+    download(URL_ENCOUNTERS, encounters_path, force=args.refresh)
+    download(URL_LOCATIONS, locations_path, force=args.refresh)
+
+    if args.config:
+        return build_partitioned(args, locations_path, loc_areas_path, encounters_path)
+
+    manifest = load_manifest() if args.incremental else {}
+    table_digests = {}
+    if args.incremental:
+        table_digests = {
+            "encounters": file_digest(encounters_path),
+            "location_areas": file_digest(loc_areas_path),
+            "locations": file_digest(locations_path),
+            # Changes to the build code can change every row, so they invalidate like a table.
+            "builder": builder_digest(),
+            "pokemon_ids": file_digest(args.pokemon_ids) if os.path.exists(args.pokemon_ids) else None,
+        }
+        missing = missing_outputs()
+        if not missing and manifest.get("tables") == table_digests:
+            print("Export tables unchanged; encounters index is up to date.")
+            return 0
+        changed_tables = sorted(k for k, v in table_digests.items() if (manifest.get("tables") or {}).get(k) != v)
+        print(f"Changed tables: {', '.join(changed_tables) or '(none)'}")
+        if missing:
+            print(f"Missing outputs: {', '.join(os.path.relpath(p, ROOT) for p in missing)}")
+
+    print("Loading locations...")
+    index = load_target_locations(iter_table(locations_path, args.stream))
+
+    print("Loading location areas...")
+    load_target_areas(iter_table(loc_areas_path, args.stream), index)
+
+    print(f"Target location areas: {len(index.areas)}")
+
+    print("Loading encounters...")
+    scan_started = time.perf_counter()
+    out_locations, scanned = scan_encounters(iter_table(encounters_path, args.stream), index)
+    kept = out_locations.row_count
+    scan_seconds = time.perf_counter() - scan_started
+
+    resolver = PokemonIdResolver.load(args.pokemon_ids)
+    pokemon_ids = None
+    if resolver is None:
+        print(f"No Pokémon id table at {args.pokemon_ids}; location pages will look ids up at runtime "
+              "(run tools/pokemon_ids.py build to embed them)")
+    else:
+        pokemon_ids, unresolved = resolver.resolve_all(out_locations.pokemon_names.values)
+        print(f"Pokémon ids: {len(pokemon_ids)} resolved, {len(unresolved)} unresolved")
+        if unresolved:
+            more = f" (+{len(unresolved) - 20} more)" if len(unresolved) > 20 else ""
+            print(f"- Unresolved (skipped on location pages): {', '.join(unresolved[:20])}{more}")
+
+    payload = build_payload(out_locations, index, pokemon_ids)
+
+    print(f"Locations={len(out_locations)} rows={kept}")
+    if args.incremental:
+        location_digests = {k: location_digest(v) for k, v in out_locations.items()}
+        added, removed, changed = diff_locations(manifest.get("locations") or {}, location_digests)
+        print_location_diff(added, removed, changed)
+        old_tables = manifest.get("tables") or {}
+        # Ids and build code reach beyond the per-location rows that the digests cover.
+        ids_changed = old_tables.get("pokemon_ids") != table_digests["pokemon_ids"]
+        builder_changed = old_tables.get("builder") != table_digests["builder"]
+        if ids_changed or builder_changed or added or removed or changed or missing:
+            write_outputs(payload)
+            write_compact(payload)
+            write_shards(payload)
+        else:
+            print("No location changed; keeping existing output files.")
+        save_manifest({"tables": table_digests, "locations": location_digests})
+    else:
+        write_outputs(payload)
+        write_compact(payload)
+        write_shards(payload)
+
+    if args.benchmark:
+        total_seconds = time.perf_counter() - started
+        peak = peak_memory_mb()
+        print("\nBenchmark")
+        print(f"- Mode: {'stream' if args.stream else 'json.load'}")
+        print(f"- Encounter rows scanned: {scanned} (kept {kept})")
+        print(f"- Scan: {scan_seconds:.2f}s ({scanned / scan_seconds if scan_seconds else 0:,.0f} rows/sec)")
+        print(f"- Total: {total_seconds:.2f}s")
+        print(f"- Peak memory: {f'{peak:.1f} MB' if peak is not None else 'n/a'}")
+        print(f"- Row columns: {out_locations.nbytes():,} bytes ({out_locations.nbytes() / max(1, kept):.0f} bytes/row)")
 
     print("Done.")
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(main(sys.argv))
@@ -0,0 +1,238 @@
+"""Build precomputed reverse indexes from the local PokéAPI snapshot.
+
+The move, ability and "Where to find" pages otherwise reconstruct these at
+runtime by fetching every learner / holder / location area one by one.
+
+Outputs (compact JSON shards under data/reverse/):
+- moves/<move>.json
+    {"move", "pokemon": [[id, name, speciesName, speciesId, spriteKey, types], ...],
+     "versionGroups": [...], "methods": [...],
+     "learns": [[pokemonIndex, versionGroupIndex, methodIndex, level], ...]}
+- abilities/<ability>.json
+    {"ability", "pokemon": [[id, name, speciesName, speciesId, spriteKey, types, hidden], ...]}
+- pokemon-locations/<pokemon>.json
+    {"pokemon", "versions": {version: [location, ...]}, "locationRegions": {location: region}}
+  PokéAPI encounters (location areas resolved to locations) merged with the PokeDB
+  encounter shards written by build_pokedb_encounters.py. PokeDB spells forms its own
+  way (sneasel-hisuian, unown-f), so its shards are matched by Pokémon id, resolved
+  with PokemonIdResolver (tools/pokemon_ids.py).
+- manifest.json
+
+spriteKey is a path relative to SPRITE_BASE (POKEMON_SPRITE_BASE in js/script.part1.js).
+
+Usage:
+  python tools/pokeapi_snapshot.py build
+  python tools/build_reverse_indexes.py
+  python tools/build_reverse_indexes.py --db path/to/snapshot.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+
+from build_pokedb_encounters import DATA_DIR, SHARD_DIR, write_json_files
+from pokeapi_snapshot import DEFAULT_DB, SnapshotStore, parse_resource_url
+from pokemon_ids import PokemonIdResolver, build_table as build_pokemon_id_table
+
+OUT_DIR = os.path.join(DATA_DIR, "reverse")
+
+SPRITE_BASE = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/"
+
+
+def sprite_key(pokemon: dict) -> str:
+    """Same preference order as pickPokemonSpriteForAbilityCard (HOME, artwork, front)."""
+    sprites = pokemon.get("sprites") or {}
+    other = sprites.get("other") or {}
+    for url in (
+        (other.get("home") or {}).get("front_default"),
+        (other.get("official-artwork") or {}).get("front_default"),
+        sprites.get("front_default"),
+    ):
+        if url:
+            return url[len(SPRITE_BASE):] if url.startswith(SPRITE_BASE) else url
+    return f"other/home/{pokemon.get('id')}.png"
+
+
+def pokemon_record(pokemon: dict) -> list:
+    species = pokemon.get("species") or {}
+    species_ref = parse_resource_url(species.get("url"))
+    types = [t["type"]["name"] for t in sorted(pokemon.get("types") or [], key=lambda t: t.get("slot") or 0)]
+    return [
+        pokemon["id"],
+        pokemon.get("name"),
+        species.get("name") or pokemon.get("name"),
+        species_ref[1] if species_ref else pokemon["id"],
+        sprite_key(pokemon),
+        types,
+    ]
+
+
+class _Interner:
+    def __init__(self) -> None:
+        self.values: list = []
+        self.index: dict = {}
+
+    def __call__(self, value) -> int:
+        idx = self.index.get(value)
+        if idx is None:
+            idx = self.index[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+
+def build_move_and_ability_indexes(store: SnapshotStore) -> tuple[dict, dict]:
+    moves: dict[str, dict] = {}
+    abilities: dict[str, list] = {}
+
+    for pokemon in store.iter_kind("pokemon"):
+        record = pokemon_record(pokemon)
+
+        for entry in pokemon.get("abilities") or []:
+            name = (entry.get("ability") or {}).get("name")
+            if name:
+                abilities.setdefault(name, []).append(record + [bool(entry.get("is_hidden"))])
+
+        for entry in pokemon.get("moves") or []:
+            move_name = (entry.get("move") or {}).get("name")
+            if not move_name:
+                continue
+            m = moves.setdefault(
+                move_name,
+                {"pokemon": _Interner(), "records": [], "versionGroups": _Interner(), "methods": _Interner(), "learns": []},
+            )
+            p_idx = m["pokemon"](pokemon["id"])
+            if p_idx == len(m["records"]):
+                m["records"].append(record)
+            for d in entry.get("version_group_details") or []:
+                vg = (d.get("version_group") or {}).get("name")
+                method = (d.get("move_learn_method") or {}).get("name")
+                if not vg or not method:
+                    continue
+                m["learns"].append([p_idx, m["versionGroups"](vg), m["methods"](method), d.get("level_learned_at") or 0])
+
+    move_files = {
+        f"moves/{name}.json": {
+            "move": name,
+            "pokemon": m["records"],
+            "versionGroups": m["versionGroups"].values,
+            "methods": m["methods"].values,
+            "learns": m["learns"],
+        }
+        for name, m in moves.items()
+    }
+    ability_files = {
+        f"abilities/{name}.json": {"ability": name, "pokemon": holders} for name, holders in abilities.items()
+    }
+    return move_files, ability_files
+
+
+def pokedb_shards_by_pokemon_id(store: SnapshotStore, encounter_shard_dir: str) -> dict[int, list[str]]:
+    """PokeDB pokemon/<name>.json shard paths grouped by the PokéAPI Pokémon id of <name>."""
+    shard_dir = os.path.join(encounter_shard_dir, "pokemon")
+    if not os.path.isdir(shard_dir):
+        return {}
+    resolver = PokemonIdResolver(build_pokemon_id_table(store))
+    by_id: dict[int, list[str]] = {}
+    unresolved = []
+    for file_name in sorted(os.listdir(shard_dir)):
+        if not file_name.endswith(".json"):
+            continue
+        ids = resolver.resolve(file_name[: -len(".json")])
+        if ids:
+            by_id.setdefault(ids[0], []).append(os.path.join(shard_dir, file_name))
+        else:
+            unresolved.append(file_name[: -len(".json")])
+    if unresolved:
+        more = f" (+{len(unresolved) - 20} more)" if len(unresolved) > 20 else ""
+        print(f"PokeDB shards with no PokéAPI Pokémon (skipped): {', '.join(unresolved[:20])}{more}")
+    return by_id
+
+
+def build_location_index(store: SnapshotStore, encounter_shard_dir: str) -> dict:
+    area_to_location: dict[int, str] = {}
+    for area in store.iter_kind("location-area"):
+        loc = (area.get("location") or {}).get("name")
+        if loc:
+            area_to_location[area["id"]] = loc
+
+    pokedb_shards = pokedb_shards_by_pokemon_id(store, encounter_shard_dir)
+    files = {}
+    for name, pokemon_id in sorted(store.name_to_id("pokemon").items(), key=lambda kv: kv[1]):
+        versions: dict[str, set] = {}
+        regions: dict[str, str] = {}
+
+        for enc in store.get_extra(f"pokemon/{pokemon_id}/encounters") or []:
+            area_ref = parse_resource_url((enc.get("location_area") or {}).get("url"))
+            loc = area_to_location.get(area_ref[1]) if area_ref else None
+            if not loc:
+                continue
+            for vd in enc.get("version_details") or []:
+                v = (vd.get("version") or {}).get("name")
+                if v:
+                    versions.setdefault(v, set()).add(loc)
+
+        for shard_path in pokedb_shards.get(pokemon_id, []):
+            with open(shard_path, "r", encoding="utf-8") as f:
+                shard = json.load(f)
+            for v, locs in (shard.get("versions") or {}).items():
+                versions.setdefault(v, set()).update(locs)
+            regions.update({k: r for k, r in (shard.get("locationRegions") or {}).items() if r})
+
+        if not versions:
+            continue
+        files[f"pokemon-locations/{name}.json"] = {
+            "pokemon": name,
+            "versions": {v: sorted(versions[v]) for v in sorted(versions)},
+            "locationRegions": regions,
+        }
+    return files
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db", type=str, default=DEFAULT_DB, help="Snapshot built by tools/pokeapi_snapshot.py")
+    ap.add_argument("--out", type=str, default=OUT_DIR)
+    ap.add_argument("--encounter-shards", type=str, default=SHARD_DIR)
+    args = ap.parse_args(argv[1:])
+
+    if not os.path.exists(args.db):
+        print(f"Snapshot not found: {args.db} (run tools/pokeapi_snapshot.py build first)")
+        return 2
+
+    started = time.perf_counter()
+    with SnapshotStore(args.db) as store:
+        move_files, ability_files = build_move_and_ability_indexes(store)
+        location_files = build_location_index(store, args.encounter_shards)
+
+    files = {**move_files, **ability_files, **location_files}
+    files["manifest.json"] = {
+        "generatedAt": datetime.datetime.now(datetime.timezone.utc)
+        .replace(microsecond=0)
+        .isoformat()
+        .replace("+00:00", "Z"),
+        "spriteBase": SPRITE_BASE,
+        "counts": {"moves": len(move_files), "abilities": len(ability_files), "pokemonLocations": len(location_files)},
+        "paths": {
+            "move": "moves/{move}.json",
+            "ability": "abilities/{ability}.json",
+            "pokemonLocations": "pokemon-locations/{pokemon}.json",
+        },
+    }
+
+    written, removed = write_json_files(files, args.out, prune_dirs=("moves", "abilities", "pokemon-locations"))
+    total_bytes = sum(os.path.getsize(os.path.join(args.out, *rel.split("/"))) for rel in files)
+    print(
+        f"Wrote {args.out}: moves={len(move_files)} abilities={len(ability_files)} "
+        f"pokemon-locations={len(location_files)} (updated={written}, removed={removed}, "
+        f"{total_bytes:,} bytes) in {time.perf_counter() - started:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -0,0 +1,213 @@
+"""Build the global search index from the local PokéAPI snapshot.
+
+Searching the site otherwise means loading whole datasets first (/item?limit=5000,
+every ability's details, ...) and filtering them linearly. This writes one
+inverted index over Pokémon, moves, abilities, items and locations that the
+sidebar search box (Global Search in js/script.part4.js) queries as you type.
+
+Indexed text, by field (lower field number ranks higher):
+  0 name     English name, slug, and for Pokémon the National Dex number
+  1 altName  names in every other language
+  2 effect   English short effect (moves, abilities, items) or genus (Pokémon)
+  3 flavor   latest English flavor text
+
+Output (data/search-index.json):
+  {"format": "pokedb-search/1", "generatedAt",
+   "kinds": [kind, ...], "fields": [field, ...],
+   "docs": [[kindIndex, id, slug, name], ...],
+   "terms": [term, ...],                      sorted in JavaScript (UTF-16) order
+   "postings": [[doc * 4 + field, ...], ...], name/altName hits, parallel to terms
+   "textPostings": [[doc * 4 + field, ...], ...], effect/flavor hits, parallel to terms
+   "trigrams": {trigram: [termIndex, ...]}}   English name terms only
+
+Terms are prefix-searched by binary search over the sorted term list; the trigram
+postings give typo-tolerant matches for English names. Name and text hits are
+kept apart so short prefixes only walk the (much shorter) name lists. Tokenization must match
+searchTokenize() in the frontend: NFKD, drop U+0300-U+036F, lowercase, split on
+anything that is not a letter, number or mark.
+
+Usage:
+  python tools/pokeapi_snapshot.py build
+  python tools/build_search_index.py
+  python tools/build_search_index.py --db path/to/snapshot.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+
+from pokeapi_snapshot import DEFAULT_DB, SnapshotStore
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+OUT_PATH = os.path.join(ROOT, "data", "search-index.json")
+FORMAT = "pokedb-search/1"
+
+# Snapshot kind -> search kind, in the order results are listed on equal scores.
+KINDS = (
+    ("pokemon-species", "pokemon"),
+    ("move", "move"),
+    ("ability", "ability"),
+    ("item", "item"),
+    ("location", "location"),
+)
+FIELDS = ("name", "altName", "effect", "flavor")
+NAME, ALT_NAME, EFFECT, FLAVOR = range(len(FIELDS))
+
+# Too common in effect/flavor text to be worth a posting list.
+STOPWORDS = frozenset(
+    "a an and are as at be by can for from has have if in into is it its of on or "
+    "so that the their them then there these this to was when which while will with".split()
+)
+
+_COMBINING_RE = re.compile("[\u0300-\u036f]")
+
+
+def normalize(text: str) -> str:
+    return _COMBINING_RE.sub("", unicodedata.normalize("NFKD", text)).lower()
+
+
+def tokenize(text: str | None) -> list[str]:
+    tokens = []
+    current = []
+    for ch in normalize(text or ""):
+        if unicodedata.category(ch)[0] in "LNM":
+            current.append(ch)
+        elif current:
+            tokens.append("".join(current))
+            current = []
+    if current:
+        tokens.append("".join(current))
+    return tokens
+
+
+def trigrams(term: str) -> set[str]:
+    padded = f" {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _english(entries, key: str) -> str | None:
+    for entry in entries or []:
+        if (entry.get("language") or {}).get("name") == "en" and entry.get(key):
+            return entry[key]
+    return None
+
+
+def _latest_english_flavor(entries) -> str | None:
+    # Entries are listed oldest game first; the last English one is the newest text.
+    text = None
+    for entry in entries or []:
+        if (entry.get("language") or {}).get("name") == "en":
+            text = entry.get("flavor_text") or entry.get("text") or text
+    return text
+
+
+def title_from_slug(slug: str) -> str:
+    return " ".join(w.capitalize() for w in slug.split("-") if w)
+
+
+def document_fields(kind: str, body: dict) -> tuple[str, dict[int, list[str]]]:
+    """English display name, plus the text of each field."""
+    slug = body.get("name") or str(body["id"])
+    names = body.get("names") or []
+    name = _english(names, "name") or title_from_slug(slug)
+
+    fields: dict[int, list[str]] = {NAME: [name, slug.replace("-", " "), slug.replace("-", "")]}
+    if kind == "pokemon":
+        fields[NAME].append(str(body["id"]))
+    fields[ALT_NAME] = [
+        n["name"] for n in names if n.get("name") and (n.get("language") or {}).get("name") != "en"
+    ]
+    if kind == "pokemon":
+        fields[EFFECT] = [_english(body.get("genera"), "genus") or ""]
+    else:
+        fields[EFFECT] = [_english(body.get("effect_entries"), "short_effect") or ""]
+    fields[FLAVOR] = [_latest_english_flavor(body.get("flavor_text_entries")) or ""]
+    return name, fields
+
+
+def build_index(store: SnapshotStore) -> dict:
+    docs: list[list] = []
+    postings: dict[str, dict[int, int]] = {}  # term -> {doc: best field}
+
+    for kind_idx, (snapshot_kind, kind) in enumerate(KINDS):
+        for body in sorted(store.iter_kind(snapshot_kind), key=lambda b: b["id"]):
+            name, fields = document_fields(kind, body)
+            doc = len(docs)
+            docs.append([kind_idx, body["id"], body.get("name") or str(body["id"]), name])
+            for field, texts in fields.items():
+                for text in texts:
+                    for term in tokenize(text):
+                        if field >= EFFECT and (term in STOPWORDS or len(term) < 2):
+                            continue
+                        by_doc = postings.setdefault(term, {})
+                        if field < by_doc.get(doc, len(FIELDS)):
+                            by_doc[doc] = field
+
+    # JavaScript compares strings by UTF-16 code unit; sort the same way so the
+    # frontend's binary search agrees with this order outside the BMP too.
+    terms = sorted(postings, key=lambda t: t.encode("utf-16-be"))
+    tri: dict[str, list[int]] = {}
+    for i, term in enumerate(terms):
+        if min(postings[term].values()) == NAME:
+            for g in trigrams(term):
+                tri.setdefault(g, []).append(i)
+
+    return {
+        "format": FORMAT,
+        "generatedAt": datetime.datetime.now(datetime.timezone.utc)
+        .replace(microsecond=0)
+        .isoformat()
+        .replace("+00:00", "Z"),
+        "kinds": [kind for _, kind in KINDS],
+        "fields": list(FIELDS),
+        "docs": docs,
+        "terms": terms,
+        "postings": [[d * 4 + f for d, f in sorted(postings[t].items()) if f <= ALT_NAME] for t in terms],
+        "textPostings": [[d * 4 + f for d, f in sorted(postings[t].items()) if f > ALT_NAME] for t in terms],
+        "trigrams": {g: tri[g] for g in sorted(tri)},
+    }
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db", type=str, default=DEFAULT_DB, help="Snapshot built by tools/pokeapi_snapshot.py")
+    ap.add_argument("--out", type=str, default=OUT_PATH)
+    args = ap.parse_args(argv[1:])
+
+    if not os.path.exists(args.db):
+        print(f"Snapshot not found: {args.db} (run tools/pokeapi_snapshot.py build first)")
+        return 2
+
+    started = time.perf_counter()
+    with SnapshotStore(args.db) as store:
+        index = build_index(store)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8", newline="\n") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
+
+    counts = {}
+    for kind_idx, *_ in index["docs"]:
+        kind = index["kinds"][kind_idx]
+        counts[kind] = counts.get(kind, 0) + 1
+    print(
+        f"Wrote {args.out}: {len(index['docs'])} docs "
+        f"({', '.join(f'{k}={n}' for k, n in counts.items())}), {len(index['terms'])} terms, "
+        f"{sum(len(p) for p in index['postings']) + sum(len(p) for p in index['textPostings'])} postings, "
+        f"{len(index['trigrams'])} trigrams, "
+        f"{os.path.getsize(args.out):,} bytes in {time.perf_counter() - started:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
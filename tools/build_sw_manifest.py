@@ -0,0 +1,164 @@
+"""Build the precache manifest for the service worker (sw.js).
+
+Hashes the app shell (HTML, CSS, JS, offline page) and the static data files and
+writes sw-manifest.js at the repo root:
+
+  self.__SW_MANIFEST__ = {"version", "generatedAt",
+                          "shell": {"version", "assets": [[path, hash], ...]},
+                          "data": {"version", "assets": [[path, hash], ...]}}
+
+Paths are relative to the site root. Each group's version is derived from the
+hashes of its files, so the service worker only opens a new cache (and only
+downloads the files that actually changed) when something in that group changed.
+
+Rerun after editing anything under css/, js/, pages/ or data/; until then
+returning visitors keep getting the previously precached copies.
+
+Usage:
+  python tools/build_sw_manifest.py
+  python tools/build_sw_manifest.py --check        # exit 1 if sw-manifest.js is stale
+  python tools/build_sw_manifest.py --full-index   # also precache the 3.6 MB uncompressed index
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SHELL_PATTERNS = (
+    "index.html",
+    "offline.html",
+    "pages/*.html",
+    "css/*.css",
+    "js/*.js",
+)
+
+# Over http(s) the site reads the encounter shards and the compact index. The
+# *.js script variants only exist for file://, where service workers never run.
+DATA_PATTERNS = (
+    "data/pokedb-encounters-g8g9.compact.json",
+    "data/pokedb-encounters-g8g9/**/*.json",
+    # Partitioned build: only the manifest; partition shards are cached as pages open them.
+    "data/pokedb-encounters/manifest.json",
+    "data/reverse/**/*.json",
+    "data/grid-summary.json",
+    "data/search-index.json",
+    "data/evolution-graph.json",
+    "data/graphql-fallbacks/**/*.json",
+    "data/type-profiles.json",
+    "data/team-suggestions.json",
+)
+FULL_INDEX_PATTERNS = ("data/pokedb-encounters-g8g9.json",)
+
+HASH_LEN = 10
+_GENERATED_AT_RE = re.compile(r'"generatedAt":"[^"]*"')
+
+
+def _match(rel: str, pattern: str) -> bool:
+    if "**/" in pattern:
+        head, tail = pattern.split("**/", 1)
+        return rel.startswith(head) and fnmatch.fnmatchcase(os.path.basename(rel), tail)
+    return rel.count("/") == pattern.count("/") and fnmatch.fnmatchcase(rel, pattern)
+
+
+def collect_assets(root: str, patterns: tuple[str, ...]) -> list[str]:
+    out = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for name in filenames:
+            rel = os.path.relpath(os.path.join(dirpath, name), root).replace(os.sep, "/")
+            if any(_match(rel, p) for p in patterns):
+                out.append(rel)
+    return sorted(out)
+
+
+def file_hash(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:HASH_LEN]
+
+
+def build_group(root: str, patterns: tuple[str, ...]) -> dict:
+    assets = [[rel, file_hash(os.path.join(root, *rel.split("/")))] for rel in collect_assets(root, patterns)]
+    version = hashlib.sha256(json.dumps(assets).encode("utf-8")).hexdigest()[:HASH_LEN]
+    return {"version": version, "assets": assets}
+
+
+def render_manifest(shell: dict, data: dict) -> str:
+    version = hashlib.sha256(f"{shell['version']}:{data['version']}".encode("ascii")).hexdigest()[:HASH_LEN]
+    generated_at = (
+        datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    )
+    # Valid JSON inside a script, one asset per line so diffs of the committed file stay readable.
+    lines = [
+        "// Generated by tools/build_sw_manifest.py. Do not edit by hand.",
+        "self.__SW_MANIFEST__ = {",
+        f'  "version":{json.dumps(version)},',
+        f'  "generatedAt":{json.dumps(generated_at)},',
+    ]
+    for key, group in (("shell", shell), ("data", data)):
+        lines.append(f'  "{key}":{{"version":{json.dumps(group["version"])},"assets":[')
+        assets = [json.dumps(a, ensure_ascii=False, separators=(",", ":")) for a in group["assets"]]
+        lines.append(",\n".join(f"    {a}" for a in assets))
+        lines.append("  ]}," if key == "shell" else "  ]}")
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--root", type=str, default=ROOT_DIR)
+    ap.add_argument("--out", type=str, default=None, help="Defaults to <root>/sw-manifest.js")
+    ap.add_argument("--full-index", action="store_true", help="Also precache the uncompressed encounter index")
+    ap.add_argument("--check", action="store_true", help="Do not write; exit 1 if the manifest on disk is stale")
+    args = ap.parse_args(argv[1:])
+
+    out_path = args.out or os.path.join(args.root, "sw-manifest.js")
+    data_patterns = DATA_PATTERNS + (FULL_INDEX_PATTERNS if args.full_index else ())
+    shell_patterns = SHELL_PATTERNS
+    if os.path.isdir(os.path.join(args.root, "js", "dist")):
+        # After tools/build_bundle.py the pages load js/dist/ instead of the loader and its parts;
+        # the encounter-index worker is never bundled and is still started from js/.
+        shell_patterns = tuple("js/dist/*.js" if p == "js/*.js" else p for p in SHELL_PATTERNS)
+        shell_patterns += ("js/pokedb-worker.js",)
+    shell = build_group(args.root, shell_patterns)
+    data = build_group(args.root, data_patterns)
+    text = render_manifest(shell, data)
+
+    existing = None
+    if os.path.exists(out_path):
+        with open(out_path, "r", encoding="utf-8") as f:
+            existing = f.read()
+    unchanged = existing is not None and _GENERATED_AT_RE.sub("", existing) == _GENERATED_AT_RE.sub("", text)
+
+    data_bytes = sum(os.path.getsize(os.path.join(args.root, *rel.split("/"))) for rel, _ in data["assets"])
+    shell_bytes = sum(os.path.getsize(os.path.join(args.root, *rel.split("/"))) for rel, _ in shell["assets"])
+    summary = (
+        f"shell={len(shell['assets'])} files/{shell_bytes:,} bytes (v{shell['version']}) "
+        f"data={len(data['assets'])} files/{data_bytes:,} bytes (v{data['version']})"
+    )
+
+    if args.check:
+        print(f"{'Up to date' if unchanged else 'Stale'}: {out_path} {summary}")
+        return 0 if unchanged else 1
+    if unchanged:
+        print(f"Unchanged: {out_path} {summary}")
+        return 0
+    with open(out_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+    print(f"Wrote {out_path}: {summary}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
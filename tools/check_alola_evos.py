@@ -1,5 +1,7 @@
-import json
-import urllib.request
+import argparse
+
+import http_cache
+from evolution_graph import OUT_PATH as GRAPH_PATH, EvolutionGraph
 
 API = "https://pokeapi.co/api/v2"
 FAMILIES = [
@@ -17,8 +19,7 @@ FAMILIES = [
 
 
 def get_json(url: str):
-    with urllib.request.urlopen(url) as resp:
-        return json.load(resp)
+    return http_cache.fetch_json(url)
 
 
 def extract_evo_edges(chain_node, out):
@@ -30,11 +31,16 @@ def extract_evo_edges(chain_node, out):
         extract_evo_edges(child, out)
 
 
+def _name(value):
+    # Raw chain details hold {"name", "url"} resources; evolution-graph conditions hold the name.
+    return value.get("name") if isinstance(value, dict) else value
+
+
 def summarize_detail(detail: dict) -> str:
-    trigger = (detail.get("trigger") or {}).get("name")
+    trigger = _name(detail.get("trigger"))
     parts = [trigger] if trigger else []
     if detail.get("item"):
-        parts.append(f"item={detail['item']['name']}")
+        parts.append(f"item={_name(detail['item'])}")
     if detail.get("min_level"):
         parts.append(f"min_level={detail['min_level']}")
     if detail.get("min_happiness"):
@@ -42,21 +48,31 @@ def summarize_detail(detail: dict) -> str:
     if detail.get("time_of_day"):
         parts.append(f"time_of_day={detail['time_of_day']}")
     if detail.get("location"):
-        parts.append(f"location={detail['location']['name']}")
+        parts.append(f"location={_name(detail['location'])}")
     return ", ".join(parts) or "(no fields)"
 
 
 def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--graph", type=str, default=GRAPH_PATH, help="Evolution graph from tools/evolution_graph.py")
+    http_cache.add_cli_args(ap)
+    args = ap.parse_args()
+    http_cache.configure_from_args(args)
+    graph = EvolutionGraph.load(args.graph)
+
     for base in FAMILIES:
-        species = get_json(f"{API}/pokemon-species/{base}")
-        evo_chain_url = (species.get("evolution_chain") or {}).get("url")
-        if not evo_chain_url:
-            print(f"{base}: no evolution chain")
-            continue
-
-        chain = get_json(evo_chain_url)["chain"]
-        edges = []
-        extract_evo_edges(chain, edges)
+        if graph is not None and base in graph:
+            edges = graph.evolutions(base)
+        else:
+            species = get_json(f"{API}/pokemon-species/{base}")
+            evo_chain_url = (species.get("evolution_chain") or {}).get("url")
+            if not evo_chain_url:
+                print(f"{base}: no evolution chain")
+                continue
+
+            chain = get_json(evo_chain_url)["chain"]
+            edges = []
+            extract_evo_edges(chain, edges)
 
         print(f"\n== {base} ==")
         for src, dst, details in edges:
@@ -4,32 +4,37 @@ This script uses PokeAPI only. For a given Pokémon (name or id), it prints:
 - whether the PokeAPI encounters endpoint has any entries per version
 - the evolution ancestors used for the "Evolve ..." fallback
 
+Ancestors come from data/evolution-graph.json (tools/evolution_graph.py) when it
+is present; otherwise they are read from the species' evolution chain.
+
 Usage:
   python tools/check_where_to_find.py venusaur
   python tools/check_where_to_find.py 3
+  python tools/check_where_to_find.py 3 --offline
 """
 
 from __future__ import annotations
 
-import json
+import argparse
 import sys
-import urllib.request
+
+import http_cache
+from evolution_graph import OUT_PATH as GRAPH_PATH, EvolutionGraph
 
 API = "https://pokeapi.co/api/v2"
 
 
 def fetch_json(url: str):
-    req = urllib.request.Request(url, headers={"User-Agent": "PokemonDB-tools/1.0"})
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        data = resp.read().decode("utf-8")
-    return json.loads(data)
+    return http_cache.fetch_json(url)
 
 
-def get_species_chain(pokemon_identifier: str):
-    p = fetch_json(f"{API}/pokemon/{pokemon_identifier}")
+def get_ancestors(p: dict, graph: EvolutionGraph | None) -> list[str]:
+    species_name = p["species"]["name"]
+    if graph is not None and species_name in graph:
+        return graph.ancestors(species_name)
     s = fetch_json(p["species"]["url"])
     evo = fetch_json(s["evolution_chain"]["url"])
-    return p, s, evo
+    return find_ancestors(evo.get("chain", {}), s.get("name", ""))
 
 
 def find_ancestors(chain_node: dict, target: str):
@@ -66,19 +71,21 @@ def get_encounter_versions(pokemon_id: int):
 
 
 def main(argv: list[str]) -> int:
-    if len(argv) < 2:
-        print("Usage: python tools/check_where_to_find.py <pokemon-name-or-id>")
-        return 2
-
-    ident = argv[1]
-    p, s, evo = get_species_chain(ident)
+    ap = argparse.ArgumentParser(usage="python tools/check_where_to_find.py <pokemon-name-or-id>")
+    ap.add_argument("pokemon")
+    ap.add_argument("--graph", type=str, default=GRAPH_PATH, help="Evolution graph from tools/evolution_graph.py")
+    http_cache.add_cli_args(ap)
+    args = ap.parse_args(argv[1:])
+    http_cache.configure_from_args(args)
 
-    ancestors = find_ancestors(evo.get("chain", {}), s.get("name", ""))
+    ident = args.pokemon
+    p = fetch_json(f"{API}/pokemon/{ident}")
+    ancestors = get_ancestors(p, EvolutionGraph.load(args.graph))
 
     encounters, versions = get_encounter_versions(int(p["id"]))
 
     print(f"Pokemon: {p['name']} (id {p['id']})")
-    print(f"Species: {s['name']}")
+    print(f"Species: {p['species']['name']}")
     print(f"Ancestors for evolve fallback: {', '.join(ancestors) if ancestors else '(none)'}")
     print(f"Encounter records: {len(encounters)}")
     print(f"Versions with any encounter data: {len(versions)}")
@@ -0,0 +1,467 @@
+"""Compact in-memory model of the PokeDB encounter rows.
+
+The encounter build used to keep every row as its own dict, with its own
+versions and conditions lists, and the same method, version, condition and area
+strings were repeated thousands of times. EncounterTable stores the rows as
+parallel typed arrays (one machine int or double per field) over interned string
+tables, with versions and conditions as bitmasks. This is the same layout as the
+compact JSON index. Row dicts are only built when a row is read.
+
+build_pokedb_encounters.py scans the export into an EncounterTable and writes its
+outputs straight from it. Other tools can load the compact index to query it:
+
+    from encounter_model import EncounterTable
+    table = EncounterTable.load()
+    table["wild-area-south"]            # row dicts, as in the full JSON index
+    table.locations_for("eevee", "sword")
+
+Usage:
+  python tools/encounter_model.py query eevee
+  python tools/encounter_model.py query eevee --version scarlet
+  python tools/encounter_model.py bench                # needs the export cache (run the build first)
+  python tools/encounter_model.py bench --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+
+COMPACT_FORMAT = "pokedb-encounters-columnar/1"
+
+ROW_FIELDS = ("pokemon", "versions", "method", "chance", "minLevel", "maxLevel", "conditions", "area")
+
+# Column value for "no entry" in the index's lookup arrays.
+NONE = 0xFFFFFFFF
+
+# Versions and conditions are bitmasks in 32-bit columns (31 bits for the frontend's bitwise ops).
+MAX_MASK_BITS = 31
+
+
+class StringTable:
+    """Interned strings, addressed by their index."""
+
+    __slots__ = ("values", "_index")
+
+    def __init__(self, values: Iterable = ()) -> None:
+        self.values: list = []
+        self._index: dict = {}
+        for value in values:
+            self.intern(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, idx: int):
+        return self.values[idx]
+
+    def get(self, value) -> int | None:
+        return self._index.get(value)
+
+    def intern(self, value) -> int:
+        idx = self._index.get(value)
+        if idx is None:
+            idx = self._index[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+    def mask(self, values: Iterable) -> int:
+        m = 0
+        for value in values:
+            m |= 1 << self.intern(value)
+        if len(self.values) > MAX_MASK_BITS:
+            raise ValueError(f"Too many values for a {MAX_MASK_BITS}-bit mask: {len(self.values)}")
+        return m
+
+    def unmask(self, m: int) -> list:
+        return [self.values[i] for i in range(len(self.values)) if m >> i & 1]
+
+
+def _put(column: array, idx: int, value: int) -> None:
+    if idx >= len(column):
+        column.extend([NONE] * (idx + 1 - len(column)))
+    column[idx] = value
+
+
+class LocationIndex:
+    """Target locations (with their region) and the location each target area belongs to."""
+
+    __slots__ = ("locations", "regions", "location_region", "areas", "area_location")
+
+    def __init__(self) -> None:
+        self.locations = StringTable()
+        self.regions = StringTable()
+        self.location_region = array("I")
+        self.areas = StringTable()
+        self.area_location = array("I")
+
+    def __contains__(self, location: str) -> bool:
+        return self.locations.get(location) is not None
+
+    def add_location(self, location: str, region) -> int:
+        idx = self.locations.intern(location)
+        _put(self.location_region, idx, self.regions.intern(region))
+        return idx
+
+    def add_area(self, area: str, location: str) -> None:
+        _put(self.area_location, self.areas.intern(area), self.locations.intern(location))
+
+    def location_of(self, area: str) -> str | None:
+        idx = self.areas.get(area)
+        if idx is None or idx >= len(self.area_location) or self.area_location[idx] == NONE:
+            return None
+        return self.locations[self.area_location[idx]]
+
+    def region_of(self, location: str):
+        idx = self.locations.get(location)
+        if idx is None or idx >= len(self.location_region) or self.location_region[idx] == NONE:
+            return None
+        return self.regions[self.location_region[idx]]
+
+
+class EncounterTable(Mapping):
+    """Encounter rows as typed columns; reads like {location: [row dict, ...]}.
+
+    Locations are listed in the order they first got a row. chance is NaN and
+    levels are -1 when the export has no value.
+    """
+
+    __slots__ = (
+        "index", "pokemon_names", "version_names", "method_names", "condition_names",
+        "pokemon", "versions", "method", "chance", "min_level", "max_level", "conditions", "area", "location",
+        "_location_rows", "_pokemon_rows",
+    )
+
+    def __init__(self, index: LocationIndex | None = None, conditions: Iterable[str] = ()) -> None:
+        self.index = index or LocationIndex()
+        self.pokemon_names = StringTable()
+        self.version_names = StringTable()
+        self.method_names = StringTable()
+        # Seeded in display order, so decoding a mask yields the chips in order.
+        self.condition_names = StringTable(conditions)
+
+        self.pokemon = array("I")
+        self.versions = array("I")
+        self.method = array("I")
+        self.chance = array("d")
+        self.min_level = array("i")
+        self.max_level = array("i")
+        self.conditions = array("I")
+        self.area = array("I")
+        self.location = array("I")
+        self._location_rows: dict[int, array] = {}  # location index -> row indexes
+        self._pokemon_rows: dict[int, array] | None = None  # pokemon index -> row indexes, built on first query
+
+    def append(
+        self,
+        location: str,
+        pokemon: str,
+        versions: Iterable[str],
+        method: str,
+        chance: float | None,
+        min_level: int | None,
+        max_level: int | None,
+        conditions: Iterable[str],
+        area: str,
+    ) -> None:
+        loc = self.index.locations.intern(location)
+        rows = self._location_rows.get(loc)
+        if rows is None:
+            rows = self._location_rows[loc] = array("I")
+        rows.append(len(self.pokemon))
+        self._pokemon_rows = None
+
+        self.pokemon.append(self.pokemon_names.intern(pokemon))
+        self.versions.append(self.version_names.mask(versions))
+        self.method.append(self.method_names.intern(method))
+        self.chance.append(math.nan if chance is None else chance)
+        self.min_level.append(-1 if min_level is None else min_level)
+        self.max_level.append(-1 if max_level is None else max_level)
+        self.conditions.append(self.condition_names.mask(conditions))
+        self.area.append(self.index.areas.intern(area))
+        self.location.append(loc)
+
+    @property
+    def row_count(self) -> int:
+        return len(self.pokemon)
+
+    def row(self, i: int) -> dict:
+        """One row as the dict the full JSON index stores."""
+        chance = self.chance[i]
+        min_level = self.min_level[i]
+        max_level = self.max_level[i]
+        return {
+            "pokemon": self.pokemon_names[self.pokemon[i]],
+            "versions": self.version_names.unmask(self.versions[i]),
+            "method": self.method_names[self.method[i]],
+            "chance": None if chance != chance else chance,
+            "minLevel": None if min_level < 0 else min_level,
+            "maxLevel": None if max_level < 0 else max_level,
+            "conditions": self.condition_names.unmask(self.conditions[i]),
+            "area": self.index.areas[self.area[i]],
+        }
+
+    # Mapping: location -> row dicts, built on access.
+    def __getitem__(self, location: str) -> list[dict]:
+        loc = self.index.locations.get(location)
+        if loc is None or loc not in self._location_rows:
+            raise KeyError(location)
+        return [self.row(i) for i in self._location_rows[loc]]
+
+    def __iter__(self) -> Iterator[str]:
+        names = self.index.locations
+        return (names[loc] for loc in self._location_rows)
+
+    def __len__(self) -> int:
+        return len(self._location_rows)
+
+    def region_of(self, location: str):
+        return self.index.region_of(location)
+
+    def _rows_of(self, pokemon: str) -> array:
+        if self._pokemon_rows is None:
+            by_pokemon: dict[int, array] = {}
+            # Location order, so a Pokémon's rows come out in the same order as the index's.
+            for rows in self._location_rows.values():
+                for i in rows:
+                    p = self.pokemon[i]
+                    if p not in by_pokemon:
+                        by_pokemon[p] = array("I")
+                    by_pokemon[p].append(i)
+            self._pokemon_rows = by_pokemon
+        idx = self.pokemon_names.get(pokemon)
+        return self._pokemon_rows.get(idx, array("I")) if idx is not None else array("I")
+
+    def rows_for(self, pokemon: str) -> list[tuple[str, dict]]:
+        """(location, row) for every row of one Pokémon, in location order."""
+        names = self.index.locations
+        return [(names[self.location[i]], self.row(i)) for i in self._rows_of(pokemon)]
+
+    def locations_for(self, pokemon: str, version: str | None = None) -> list[str]:
+        """Sorted locations where a Pokémon appears (in one version, if given)."""
+        bit = ~0
+        if version is not None:
+            v = self.version_names.get(version)
+            if v is None:
+                return []
+            bit = 1 << v
+        versions = self.versions
+        location = self.location
+        names = self.index.locations
+        return sorted({names[location[i]] for i in self._rows_of(pokemon) if versions[i] & bit})
+
+    def nbytes(self) -> int:
+        """Bytes held by the row columns (string tables excluded)."""
+        columns = (
+            self.pokemon, self.versions, self.method, self.chance,
+            self.min_level, self.max_level, self.conditions, self.area, self.location,
+        )
+        return sum(c.itemsize * len(c) for c in columns) + sum(
+            rows.itemsize * len(rows) for rows in self._location_rows.values()
+        )
+
+    @classmethod
+    def from_compact(cls, compact: dict) -> "EncounterTable":
+        """Load the compact index written by build_pokedb_encounters.py (encode_compact)."""
+        if compact.get("format") != COMPACT_FORMAT:
+            raise ValueError(f"Unsupported compact format: {compact.get('format')!r}")
+        strings = compact["strings"]
+        columns = compact["rows"]
+        offsets = compact["offsets"]
+
+        index = LocationIndex()
+        for loc_id, region in zip(compact["locations"], compact["locationRegions"]):
+            index.add_location(loc_id, strings["regions"][region])
+        table = cls(index, strings["conditions"])
+        table.pokemon_names = StringTable(strings["pokemon"])
+        table.version_names = StringTable(strings["versions"])
+        table.method_names = StringTable(strings["methods"])
+        for area in strings["areas"]:
+            index.areas.intern(area)
+
+        table.pokemon = array("I", columns["pokemon"])
+        table.versions = array("I", columns["versions"])
+        table.method = array("I", columns["method"])
+        table.chance = array("d", (math.nan if c is None else c for c in columns["chance"]))
+        table.min_level = array("i", (-1 if v is None else v for v in columns["minLevel"]))
+        table.max_level = array("i", (-1 if v is None else v for v in columns["maxLevel"]))
+        table.conditions = array("I", columns["conditions"])
+        table.area = array("I", columns["area"])
+        table.location = array("I")
+        for loc in range(len(compact["locations"])):
+            count = offsets[loc + 1] - offsets[loc]
+            table.location.extend([loc] * count)
+            if count:
+                table._location_rows[loc] = array("I", range(offsets[loc], offsets[loc + 1]))
+        return table
+
+    @classmethod
+    def load(cls, path: str | None = None) -> "EncounterTable":
+        if path is None:
+            from build_pokedb_encounters import COMPACT_OUT_FILE as path
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_compact(json.load(f))
+
+
+def cmd_query(args) -> int:
+    try:
+        table = EncounterTable.load(args.index)
+    except OSError as e:
+        print(f"Compact index not found ({e}); run tools/build_pokedb_encounters.py first")
+        return 2
+    pokemon = args.pokemon.lower()
+    rows = table.rows_for(pokemon)
+    if args.version:
+        rows = [(loc, row) for loc, row in rows if args.version in row["versions"]]
+    if not rows:
+        print(f"{pokemon}: no encounters{' in ' + args.version if args.version else ''}")
+        return 1
+    for loc, row in rows:
+        levels = f"Lv {row['minLevel']}-{row['maxLevel']}" if row["minLevel"] is not None else "Lv ?"
+        chance = f"{row['chance']:g}%" if row["chance"] is not None else "?"
+        extra = f" [{', '.join(row['conditions'])}]" if row["conditions"] else ""
+        print(f"{loc} ({table.region_of(loc)}) {row['area']}: {row['method']} {levels} {chance} "
+              f"{'/'.join(row['versions'])}{extra}")
+    print(f"{len(rows)} rows in {len(table.locations_for(pokemon, args.version))} locations")
+    return 0
+
+
+def _build_dict_model(build, encounters: list, locations: list, location_areas: list) -> dict:
+    """The previous model: plain dicts for the location maps and a fresh dict per row."""
+    location_to_region_area = {}
+    for row in locations:
+        loc_id = row.get("identifier")
+        region = row.get("region_area_identifier")
+        if loc_id and region and str(region).lower() in build.TARGET_REGIONS:
+            location_to_region_area[loc_id] = str(region).lower()
+    area_to_location = {}
+    for row in location_areas:
+        area_id = row.get("identifier")
+        loc_id = row.get("location_identifier")
+        if area_id and loc_id and loc_id in location_to_region_area:
+            area_to_location[area_id] = loc_id
+
+    out_locations: dict[str, list] = {}
+    for e in encounters:
+        converted = build.encounter_to_row(e, area_to_location.get)
+        if converted is not None:
+            out_locations.setdefault(converted[0], []).append(converted[1])
+    return {"locations": out_locations, "regions": location_to_region_area, "areas": area_to_location}
+
+
+def _build_table_model(build, encounters: list, locations: list, location_areas: list) -> EncounterTable:
+    index = build.load_target_areas(location_areas, build.load_target_locations(locations))
+    return build.scan_encounters(encounters, index)[0]
+
+
+def cmd_bench(args) -> int:
+    import build_pokedb_encounters as build
+
+    paths = {
+        name: os.path.join(build.CACHE_DIR, f"pokedb_{name}.json")
+        for name in ("encounters", "locations", "location_areas")
+    }
+    missing = [p for p in paths.values() if not os.path.exists(p)]
+    if missing:
+        print(f"Export cache not found: {', '.join(missing)} (run tools/build_pokedb_encounters.py first)")
+        return 2
+    tables = {}
+    for name, path in paths.items():
+        with open(path, "r", encoding="utf-8") as f:
+            tables[name] = json.load(f)
+    inputs = (tables["encounters"], tables["locations"], tables["location_areas"])
+    print(f"Export: {len(tables['encounters']):,} encounters, {len(tables['location_areas']):,} areas, "
+          f"{len(tables['locations']):,} locations")
+
+    models = (
+        ("dict-of-lists", lambda: _build_dict_model(build, *inputs)),
+        ("EncounterTable", lambda: _build_table_model(build, *inputs)),
+    )
+    built = {}
+    for name, make in models:
+        gc.collect()
+        tracemalloc.start()
+        built[name] = make()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        best = math.inf
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            make()
+            best = min(best, time.perf_counter() - started)
+        print(f"{name:>16}: retained {retained / 1024 / 1024:6.2f} MB, peak {peak / 1024 / 1024:6.2f} MB, "
+              f"build {best * 1000:7.1f} ms ({len(inputs[0]) / best:,.0f} encounters/sec)")
+
+    old = built["dict-of-lists"]["locations"]
+    table = built["EncounterTable"]
+    if list(old) != list(table) or any(old[k] != rows for k, rows in table.items()):
+        print("MISMATCH: the two models disagree")
+        return 1
+
+    rng = random.Random(args.seed)
+    species = rng.sample(sorted(table.pokemon_names.values), min(args.queries, len(table.pokemon_names)))
+    versions = table.version_names.values
+
+    def old_locations_for(pokemon: str, version: str) -> list[str]:
+        return sorted(k for k, rows in old.items() if any(r["pokemon"] == pokemon and version in r["versions"] for r in rows))
+
+    queries = (
+        ("locations_for", lambda: [old_locations_for(p, v) for p in species for v in versions],
+         lambda: [table.locations_for(p, v) for p in species for v in versions]),
+        ("rows with chance", lambda: sum(r["chance"] is not None for rows in old.values() for r in rows),
+         lambda: sum(c == c for c in table.chance)),
+        ("materialize all", lambda: [rows for rows in old.values()],
+         lambda: [rows for rows in table.values()]),
+    )
+    for label, run_old, run_new in queries:
+        if run_old() != run_new():
+            print(f"MISMATCH: {label}")
+            return 1
+        timings = []
+        for run in (run_old, run_new):
+            best = math.inf
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                run()
+                best = min(best, time.perf_counter() - started)
+            timings.append(best)
+        print(f"{label:>16}: dict-of-lists {timings[0] * 1000:7.1f} ms, EncounterTable {timings[1] * 1000:7.1f} ms")
+
+    print(f"Rows: {table.row_count:,} in {len(table)} locations; columns {table.nbytes():,} bytes "
+          f"({table.nbytes() / max(1, table.row_count):.0f} bytes/row)")
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    q = sub.add_parser("query", help="Encounter rows of one Pokémon from the compact index")
+    q.add_argument("pokemon")
+    q.add_argument("--version", type=str, default=None)
+    q.add_argument("--index", type=str, default=None, help="Compact index (default: data/pokedb-encounters-g8g9.compact.json)")
+    q.set_defaults(func=cmd_query)
+
+    b = sub.add_parser("bench", help="Compare memory and throughput with the dict-of-lists model")
+    b.add_argument("--repeat", type=int, default=3)
+    b.add_argument("--queries", type=int, default=100, help="Pokémon sampled for the query timings")
+    b.add_argument("--seed", type=int, default=1)
+    b.set_defaults(func=cmd_bench)
+
+    args = ap.parse_args(argv[1:])
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -0,0 +1,248 @@
+"""Evolution graph: every species as a node, every evolution as an edge.
+
+PokéAPI only exposes evolutions as per-family chain trees, reached through
+pokemon -> species -> evolution-chain. This tool fetches every chain once (in
+parallel, through the shared cache in http_cache.py, or from the local snapshot)
+and writes one graph with ancestors, descendants and family precomputed for
+every species, so "what does X evolve from?" is a dictionary lookup.
+
+Output (data/evolution-graph.json):
+  {"format": "pokedb-evolution-graph/1", "generatedAt",
+   "species": [[name, id, family, parent], ...],    parent: node index or -1
+   "edges": [[from, to, [conditions, ...]], ...],   node indexes
+   "ancestors": [[node, ...], ...],                 root first
+   "descendants": [[node, ...], ...],               depth-first, excluding the node
+   "resourceFields": {field: kind}}                 e.g. "item": "item", "trigger": "evolution-trigger"
+family is the evolution-chain id. Nodes are listed family by family, depth-first.
+conditions are PokéAPI evolution_details with empty fields dropped and named
+resources reduced to their name ({"trigger": "level-up", "min_level": 16});
+resourceFields says which fields were resources, so {name, url} can be rebuilt.
+
+The frontend (loadEvolutionGraph in js/script.part1.js) uses the file for the
+"Where to find" evolve-from fallback and rebuilds the evolution panel's chain
+from it instead of fetching /evolution-chain; check_where_to_find.py and
+check_alola_evos.py read it through EvolutionGraph.
+
+Usage:
+  python tools/evolution_graph.py build                  # PokéAPI, 8 workers
+  python tools/evolution_graph.py build --concurrency 16 --rate 40
+  python tools/evolution_graph.py build --db data/.cache/pokeapi-snapshot.sqlite
+  python tools/evolution_graph.py query eevee
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+import http_cache
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+API = "https://pokeapi.co/api/v2"
+OUT_PATH = os.path.join(ROOT, "data", "evolution-graph.json")
+FORMAT = "pokedb-evolution-graph/1"
+
+
+def _id_from_url(url: str | None) -> int | None:
+    tail = (url or "").rstrip("/").rsplit("/", 1)[-1]
+    return int(tail) if tail.isdigit() else None
+
+
+def compact_condition(detail: dict, resource_fields: dict[str, str]) -> dict:
+    """Drop empty fields and reduce named resources to their name (recording their kind)."""
+    out = {}
+    for key, value in detail.items():
+        if isinstance(value, dict):
+            parts = (value.get("url") or "").rstrip("/").split("/")
+            if len(parts) >= 2:
+                resource_fields.setdefault(key, parts[-2])
+            value = value.get("name")
+        if value is None or value is False or value == "":
+            continue
+        out[key] = value
+    return out
+
+
+class EvolutionGraph:
+    def __init__(self, data: dict) -> None:
+        self.data = data
+        self.species = data["species"]
+        self.index = {row[0]: i for i, row in enumerate(self.species)}
+        self._edges_from: dict[int, list] = {}
+        for src, dst, conditions in data["edges"]:
+            self._edges_from.setdefault(src, []).append((dst, conditions))
+
+    @classmethod
+    def from_chains(cls, chains: Iterable[dict]) -> "EvolutionGraph":
+        species: list[list] = []
+        edges: list[list] = []
+        ancestors: list[list[int]] = []
+        descendants: list[list[int]] = []
+        resource_fields: dict[str, str] = {}
+
+        def walk(node: dict, family: int, parent: int, path: list[int]) -> list[int]:
+            ref = node.get("species") or {}
+            idx = len(species)
+            species.append([ref.get("name"), _id_from_url(ref.get("url")), family, parent])
+            ancestors.append(list(path))
+            descendants.append([])
+            if parent >= 0:
+                edges.append([parent, idx, [compact_condition(d, resource_fields) for d in node.get("evolution_details") or []]])
+            below: list[int] = []
+            for child in node.get("evolves_to") or []:
+                child_idx = len(species)
+                below.append(child_idx)
+                below.extend(walk(child, family, idx, path + [idx]))
+            descendants[idx] = below
+            return below
+
+        for chain in sorted(chains, key=lambda c: c["id"]):
+            if chain.get("chain"):
+                walk(chain["chain"], chain["id"], -1, [])
+
+        return cls({
+            "format": FORMAT,
+            "generatedAt": datetime.datetime.now(datetime.timezone.utc)
+            .replace(microsecond=0)
+            .isoformat()
+            .replace("+00:00", "Z"),
+            "species": species,
+            "edges": edges,
+            "ancestors": ancestors,
+            "descendants": descendants,
+            "resourceFields": dict(sorted(resource_fields.items())),
+        })
+
+    @classmethod
+    def load(cls, path: str = OUT_PATH) -> "EvolutionGraph | None":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except OSError:
+            return None
+        return cls(data) if data.get("format") == FORMAT else None
+
+    def save(self, path: str = OUT_PATH) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            json.dump(self.data, f, ensure_ascii=False, separators=(",", ":"))
+            f.write("\n")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def _names(self, idxs: Iterable[int]) -> list[str]:
+        return [self.species[i][0] for i in idxs]
+
+    def ancestors(self, name: str) -> list[str]:
+        """Species it evolves from, base first (empty for a base form or unknown name)."""
+        i = self.index.get(name)
+        return self._names(self.data["ancestors"][i]) if i is not None else []
+
+    def descendants(self, name: str) -> list[str]:
+        i = self.index.get(name)
+        return self._names(self.data["descendants"][i]) if i is not None else []
+
+    def family(self, name: str) -> int | None:
+        i = self.index.get(name)
+        return self.species[i][2] if i is not None else None
+
+    def family_members(self, name: str) -> list[str]:
+        family = self.family(name)
+        return [row[0] for row in self.species if row[2] == family] if family is not None else []
+
+    def evolutions(self, name: str) -> list[tuple[str, str, list[dict]]]:
+        """(from, to, conditions) for every evolution in the species' family."""
+        members = {self.index[n] for n in self.family_members(name)}
+        return [
+            (self.species[src][0], self.species[dst][0], conditions)
+            for src in sorted(members)
+            for dst, conditions in self._edges_from.get(src, [])
+        ]
+
+
+def fetch_chains_from_api(concurrency: int) -> list[dict]:
+    listing = http_cache.fetch_json(f"{API}/evolution-chain?limit=100000")
+    urls = [r["url"] for r in listing.get("results") or []]
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        return list(pool.map(http_cache.fetch_json, urls))
+
+
+def fetch_chains_from_snapshot(db: str) -> list[dict]:
+    from pokeapi_snapshot import SnapshotStore
+
+    with SnapshotStore(db) as store:
+        return list(store.iter_kind("evolution-chain"))
+
+
+def cmd_build(args) -> int:
+    started = time.perf_counter()
+    if args.db:
+        if not os.path.exists(args.db):
+            print(f"Snapshot not found: {args.db} (run tools/pokeapi_snapshot.py build first)")
+            return 2
+        chains = fetch_chains_from_snapshot(args.db)
+    else:
+        http_cache.configure_from_args(args)
+        if args.concurrency > 1:
+            http_cache.configure(rate=args.rate, burst=args.concurrency)
+        chains = fetch_chains_from_api(args.concurrency)
+
+    graph = EvolutionGraph.from_chains(chains)
+    graph.save(args.out)
+    print(
+        f"Wrote {args.out}: {len(chains)} families, {len(graph.species)} species, "
+        f"{len(graph.data['edges'])} evolutions, {os.path.getsize(args.out):,} bytes "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return 0
+
+
+def cmd_query(args) -> int:
+    graph = EvolutionGraph.load(args.graph)
+    if graph is None:
+        print(f"Graph not found: {args.graph} (run tools/evolution_graph.py build first)")
+        return 2
+    name = args.species.lower()
+    if name not in graph:
+        print(f"{name}: not in the graph")
+        return 1
+
+    print(f"Species: {name} (family {graph.family(name)})")
+    print(f"Evolves from: {' -> '.join(graph.ancestors(name)) or '(none)'}")
+    print(f"Evolves into: {', '.join(graph.descendants(name)) or '(none)'}")
+    for src, dst, conditions in graph.evolutions(name):
+        print(f"  {src} -> {dst}: {json.dumps(conditions, ensure_ascii=False) if conditions else '(no details)'}")
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    b = sub.add_parser("build", help="Fetch every evolution chain and write the graph")
+    b.add_argument("--db", type=str, default=None, help="Read chains from this snapshot instead of PokéAPI")
+    b.add_argument("--out", type=str, default=OUT_PATH)
+    b.add_argument("--concurrency", type=int, default=8, help="Chains fetched in parallel")
+    b.add_argument("--rate", type=float, default=20.0, help="Max requests/sec shared by all workers (0 = unlimited)")
+    http_cache.add_cli_args(b)
+    b.set_defaults(func=cmd_build)
+
+    q = sub.add_parser("query", help="Ancestors, descendants and evolutions of one species")
+    q.add_argument("species")
+    q.add_argument("--graph", type=str, default=OUT_PATH)
+    q.set_defaults(func=cmd_query)
+
+    args = ap.parse_args(argv[1:])
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
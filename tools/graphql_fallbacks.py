@@ -0,0 +1,331 @@
+"""Bake GraphQL-Pokemon fallback results into static files, and serve a stand-in endpoint.
+
+The site asks GraphQL-Pokemon (favware/graphql-pokemon) for what PokéAPI lacks: Gen 7-9
+dex entries (getPokemonByDexNumber) and move descriptions (getFuzzyMove). The page batches
+those lookups into aliased documents; this tool does the same ahead of time for every
+item the snapshot says will need it, so pages read a static file instead.
+
+Subcommands
+  build   Work out the fallback items from the snapshot (species with no English
+          Gen 7, 8 or 9 flavor text, moves with no English effect), or take them from
+          --dex / --moves, query them --batch fields per POST and write:
+            data/graphql-fallbacks/dex/<dexNumber>.json   getPokemonByDexNumber result
+            data/graphql-fallbacks/moves/<move>.json      getFuzzyMove result
+            data/graphql-fallbacks/manifest.json
+              {"format": "graphql-fallbacks/1", "generatedAt", "endpoint",
+               "dex": [dexNumber, ...], "moves": [move, ...]}
+          Results already on disk are kept, and the manifest lists every file present.
+  serve   A local stand-in for the GraphQL endpoint. It answers aliased
+          getPokemonByDexNumber / getFuzzyMove fields from a directory in the layout
+          above (selection sets are not applied) and logs how many fields each POST held.
+
+Usage:
+  python tools/graphql_fallbacks.py build
+  python tools/graphql_fallbacks.py build --dex 906-1025 --moves tera-blast
+  python tools/graphql_fallbacks.py serve --data data/graphql-fallbacks --port 8002
+  python tools/graphql_fallbacks.py build --endpoint http://127.0.0.1:8002/ --dex 1-3 --out /tmp/gql
+
+To point the site at the stand-in, run in the browser console:
+  localStorage.setItem('graphqlPokemonBase', 'http://127.0.0.1:8002/')
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import re
+import sys
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import http_cache
+from pokeapi_snapshot import DEFAULT_DB, SnapshotStore
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+OUT_DIR = os.path.join(ROOT, "data", "graphql-fallbacks")
+FORMAT = "graphql-fallbacks/1"
+ENDPOINT = "https://graphqlpokemon.favware.tech/v8"
+
+# Same fields, arguments and selections as GQL_FALLBACK_FIELDS in js/script.part1.js.
+FIELDS = {
+    "dex": {
+        "field": "getPokemonByDexNumber",
+        "type": "Int!",
+        "args": "number: {v}, takeFlavorTexts: 50, reverseFlavorTexts: false",
+        "selection": "num species flavorTexts { game flavor }",
+    },
+    "moves": {
+        "field": "getFuzzyMove",
+        "type": "String!",
+        "args": "move: {v}, take: 1",
+        "selection": "name shortDesc desc accuracy pp priority basePower type category",
+    },
+}
+
+# Mainline versions per generation, as in MAINLINE_VERSION_META (js/script.part1.js): a species with
+# no English flavor text in one of these generations gets the GraphQL fallback on its page.
+FALLBACK_GENERATIONS = {
+    7: {"sun", "moon", "ultra-sun", "ultra-moon", "lets-go-pikachu", "lets-go-eevee"},
+    8: {"sword", "shield", "brilliant-diamond", "shining-pearl", "legends-arceus"},
+    9: {"scarlet", "violet", "legends-z-a"},
+}
+
+
+def build_document(items: list[tuple[str, Any]]) -> tuple[str, dict]:
+    """One aliased query (f0, f1, ...) for a list of (kind, value) items."""
+    defs = []
+    fields = []
+    variables = {}
+    for i, (kind, value) in enumerate(items):
+        spec = FIELDS[kind]
+        defs.append(f"$v{i}: {spec['type']}")
+        fields.append(f"f{i}: {spec['field']}({spec['args'].format(v=f'$v{i}')}) {{ {spec['selection']} }}")
+        variables[f"v{i}"] = value
+    return f"query({', '.join(defs)}) {{ {' '.join(fields)} }}", variables
+
+
+def post_graphql(endpoint: str, query: str, variables: dict) -> dict:
+    body = json.dumps({"query": query, "variables": variables}).encode("utf-8")
+    req = urllib.request.Request(
+        endpoint,
+        data=body,
+        headers={"Content-Type": "application/json", "User-Agent": http_cache.USER_AGENT},
+    )
+    with urllib.request.urlopen(req, timeout=60) as resp:
+        return json.loads(resp.read().decode("utf-8"))
+
+
+def split_response(items: list, json_body: dict) -> list[tuple[Any, str | None]]:
+    """-> [(data, error message)] per item, from the aliased response."""
+    data = json_body.get("data") or {}
+    errors = json_body.get("errors") or []
+    out = []
+    for i in range(len(items)):
+        alias = f"f{i}"
+        err = next((e for e in errors if (e.get("path") or [None])[0] == alias), None)
+        if err is None and not data and errors:
+            err = errors[0]
+        out.append((None, err.get("message") or "GraphQL error") if err else (data.get(alias), None))
+    return out
+
+
+def fallback_targets(store: SnapshotStore) -> tuple[list[int], list[str]]:
+    dex = []
+    for species in store.iter_kind("pokemon-species"):
+        versions = {
+            (e.get("version") or {}).get("name")
+            for e in species.get("flavor_text_entries") or []
+            if (e.get("language") or {}).get("name") == "en" and (e.get("flavor_text") or "").strip()
+        }
+        if any(not (versions & gen) for gen in FALLBACK_GENERATIONS.values()):
+            dex.append(int(species["id"]))
+
+    moves = []
+    for move in store.iter_kind("move"):
+        english = [e for e in move.get("effect_entries") or [] if (e.get("language") or {}).get("name") == "en"]
+        if not any(e.get("effect") or e.get("short_effect") for e in english):
+            moves.append(move["name"])
+    return sorted(dex), sorted(moves)
+
+
+def parse_dex_arg(text: str) -> list[int]:
+    """'1-3,25' -> [1, 2, 3, 25]"""
+    out: list[int] = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        lo, _, hi = part.partition("-")
+        out.extend(range(int(lo), int(hi or lo) + 1))
+    return out
+
+
+def _shard_path(out_dir: str, kind: str, key: Any) -> str:
+    return os.path.join(out_dir, kind, f"{key}.json")
+
+
+def write_manifest(out_dir: str, endpoint: str) -> dict:
+    listed = {}
+    for kind in FIELDS:
+        kind_dir = os.path.join(out_dir, kind)
+        names = [n[: -len(".json")] for n in os.listdir(kind_dir) if n.endswith(".json")] if os.path.isdir(kind_dir) else []
+        listed[kind] = sorted(int(n) for n in names) if kind == "dex" else sorted(names)
+    manifest = {
+        "format": FORMAT,
+        "generatedAt": datetime.datetime.now(datetime.timezone.utc)
+        .replace(microsecond=0)
+        .isoformat()
+        .replace("+00:00", "Z"),
+        "endpoint": endpoint,
+        **listed,
+    }
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8", newline="\n") as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
+    return manifest
+
+
+def cmd_build(args) -> int:
+    if args.dex is None and args.moves is None:
+        if not os.path.exists(args.db):
+            print(f"Snapshot not found: {args.db} (run tools/pokeapi_snapshot.py build, or pass --dex/--moves)")
+            return 2
+        with SnapshotStore(args.db) as store:
+            dex, moves = fallback_targets(store)
+    else:
+        dex = parse_dex_arg(args.dex or "")
+        moves = [m.strip().lower() for m in args.moves or [] if m.strip()]
+
+    args.batch = max(1, args.batch)
+    items = [("dex", n) for n in dex] + [("moves", m) for m in moves]
+    if not args.refresh:
+        items = [(kind, key) for kind, key in items if not os.path.exists(_shard_path(args.out, kind, key))]
+    print(f"Fallback items to fetch: {len(items)} ({sum(k == 'dex' for k, _ in items)} dex, "
+          f"{sum(k == 'moves' for k, _ in items)} moves), {args.batch} per request")
+
+    for kind in FIELDS:
+        os.makedirs(os.path.join(args.out, kind), exist_ok=True)
+    limiter = http_cache.TokenBucket(args.rate) if args.rate > 0 else None
+    written = 0
+    failed = []
+    requests = 0
+    for start in range(0, len(items), args.batch):
+        chunk = items[start:start + args.batch]
+        query, variables = build_document(chunk)
+        if limiter:
+            limiter.acquire()
+        try:
+            response = post_graphql(args.endpoint, query, variables)
+        except Exception as e:
+            print(f"ERROR batch {start // args.batch}: {e}")
+            failed.extend(f"{kind}/{key}" for kind, key in chunk)
+            continue
+        requests += 1
+        for (kind, key), (data, err) in zip(chunk, split_response(chunk, response)):
+            if err or not data:
+                failed.append(f"{kind}/{key}" + (f" ({err})" if err else ""))
+                continue
+            with open(_shard_path(args.out, kind, key), "w", encoding="utf-8", newline="\n") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                f.write("\n")
+            written += 1
+
+    manifest = write_manifest(args.out, args.endpoint)
+    print(f"Requests: {requests}, written: {written}, failed: {len(failed)}")
+    for name in failed[:20]:
+        print(f"- {name}")
+    if len(failed) > 20:
+        print(f"- ... +{len(failed) - 20} more")
+    print(f"Wrote {args.out}: {len(manifest['dex'])} dex, {len(manifest['moves'])} moves")
+    return 0
+
+
+_FIELD_RE = re.compile(r"(?:(\w+)\s*:\s*)?\b(getPokemonByDexNumber|getFuzzyMove)\s*\(([^)]*)\)")
+_ARG_RE = re.compile(r'(\w+)\s*:\s*(\$\w+|"(?:[^"\\]|\\.)*"|-?\d+|true|false)')
+
+
+def _arg_value(raw: str, variables: dict) -> Any:
+    if raw.startswith("$"):
+        return variables.get(raw[1:])
+    return json.loads(raw)
+
+
+def answer_document(query: str, variables: dict, data_dir: str) -> tuple[dict, int]:
+    """-> (GraphQL response, number of fields) for an aliased query against a baked directory."""
+    data: dict[str, Any] = {}
+    errors = []
+    fields = 0
+    for m in _FIELD_RE.finditer(query):
+        fields += 1
+        field = m.group(2)
+        alias = m.group(1) or field
+        args = {name: _arg_value(raw, variables or {}) for name, raw in _ARG_RE.findall(m.group(3))}
+        if field == "getPokemonByDexNumber":
+            kind, key = "dex", int(args.get("number") or 0)
+        else:
+            kind, key = "moves", re.sub(r"[\s_]+", "-", str(args.get("move") or "").strip().lower())
+        path = _shard_path(data_dir, kind, key)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data[alias] = json.load(f)
+        elif kind == "moves":
+            data[alias] = []
+        else:
+            data[alias] = None
+            errors.append({"message": f"No Pokémon found for {key}", "path": [alias]})
+    body: dict[str, Any] = {"data": data}
+    if errors:
+        body["errors"] = errors
+    return body, fields
+
+
+def cmd_serve(args) -> int:
+    data_dir = os.path.abspath(args.data)
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body: bytes = b"") -> None:
+            self.send_response(status)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Allow-Headers", "Content-Type")
+            self.send_header("Access-Control-Allow-Methods", "POST, OPTIONS")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_OPTIONS(self) -> None:
+            self._send(204)
+
+        def do_POST(self) -> None:
+            try:
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+                response, fields = answer_document(payload.get("query") or "", payload.get("variables") or {}, data_dir)
+            except (ValueError, AttributeError) as e:
+                self._send(400, json.dumps({"errors": [{"message": str(e)}]}).encode("utf-8"))
+                return
+            print(f"POST {fields} field(s), {len(response.get('errors') or [])} error(s)", flush=True)
+            self._send(200, json.dumps(response, ensure_ascii=False).encode("utf-8"))
+
+        def log_message(self, format, *a) -> None:
+            pass
+
+    srv = ThreadingHTTPServer((args.host, args.port), Handler)
+    print(f"Serving GraphQL stand-in for {data_dir} at http://{args.host}:{args.port}/")
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    b = sub.add_parser("build", help="Query the fallback items and write the static files")
+    b.add_argument("--db", type=str, default=DEFAULT_DB, help="Snapshot built by tools/pokeapi_snapshot.py")
+    b.add_argument("--dex", type=str, default=None, help="Dex numbers instead of the snapshot's, e.g. 906-1025,25")
+    b.add_argument("--moves", nargs="*", default=None, help="Move names instead of the snapshot's")
+    b.add_argument("--endpoint", type=str, default=ENDPOINT)
+    b.add_argument("--batch", type=int, default=20, help="Aliased fields per POST")
+    b.add_argument("--rate", type=float, default=2.0, help="Max requests/sec (0 = unlimited)")
+    b.add_argument("--refresh", action="store_true", help="Refetch items already on disk")
+    b.add_argument("--out", type=str, default=OUT_DIR)
+    b.set_defaults(func=cmd_build)
+
+    s = sub.add_parser("serve", help="Serve a stand-in GraphQL endpoint from baked results")
+    s.add_argument("--data", type=str, default=OUT_DIR)
+    s.add_argument("--host", type=str, default="127.0.0.1")
+    s.add_argument("--port", type=int, default=8002)
+    s.set_defaults(func=cmd_serve)
+
+    args = ap.parse_args(argv[1:])
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
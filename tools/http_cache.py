@@ -0,0 +1,384 @@
+"""Shared HTTP fetch layer for the tools/ scripts, with an on-disk response cache.
+
+Responses are stored content-addressed by URL (sha256 of the URL) under
+data/.cache/http/ by default:
+- <key>.body: the raw response body
+- <key>.meta.json: url, ETag, Last-Modified, fetch time and size
+
+Behaviour
+- Fresh entries (younger than the TTL) are served from disk without a request.
+- Stale entries are revalidated with If-None-Match / If-Modified-Since; a 304
+  refreshes the entry and serves the cached body.
+- The cache is bounded in bytes; the least recently used entries are evicted
+  (a hit bumps the body file's mtime).
+- Offline mode serves only from the cache (stale entries included) and raises
+  OfflineMiss for anything else.
+- Requests share an optional token-bucket rate limit and retry 429/5xx and
+  network errors with exponential backoff.
+
+Hit/miss/bytes-saved counters are printed at exit once the cache has been used.
+
+Usage from a script:
+  import http_cache
+  http_cache.add_cli_args(ap)
+  args = ap.parse_args(...)
+  http_cache.configure_from_args(args)
+  data = http_cache.fetch_json(url)
+"""
+
+from __future__ import annotations
+
+import atexit
+import email.utils
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Any
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+DEFAULT_CACHE_DIR = os.environ.get("POKEDB_HTTP_CACHE") or os.path.join(ROOT, "data", ".cache", "http")
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+USER_AGENT = "PokemonDB-tools/1.0"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class OfflineMiss(LookupError):
+    """Raised in offline mode when a URL is not in the cache."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket: at most `rate` requests/sec on average, bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class FetchStats:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.latencies: list[float] = []
+        self.retries = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.bytes_fetched = 0
+
+    def record(self, seconds: float, retries: int) -> None:
+        with self.lock:
+            self.latencies.append(seconds)
+            self.retries += retries
+
+    def count(self, **deltas: int) -> None:
+        with self.lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def percentile(self, pct: float) -> float:
+        with self.lock:
+            values = sorted(self.latencies)
+        if not values:
+            return 0.0
+        idx = min(len(values) - 1, max(0, round(pct / 100 * len(values)) - 1))
+        return values[idx]
+
+    def summary(self) -> str:
+        return (
+            f"HTTP cache: {self.hits} hits ({self.revalidated} revalidated), {self.misses} misses, "
+            f"{self.bytes_saved:,} bytes saved, {self.bytes_fetched:,} bytes fetched"
+        )
+
+
+class HttpCache:
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        offline: bool = False,
+        enabled: bool = True,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.enabled = enabled
+        self.limiter: TokenBucket | None = None
+        self.stats = FetchStats()
+        self._stores = 0
+        self._evict_lock = threading.Lock()
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + ".body", base + ".meta.json"
+
+    def _read(self, url: str) -> tuple[dict, bytes] | None:
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return meta, body
+
+    def _touch(self, url: str) -> None:
+        try:
+            os.utime(self._paths(url)[0])
+        except OSError:
+            pass
+
+    def _write(self, url: str, body: bytes, headers) -> None:
+        body_path, meta_path = self._paths(url)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag") if headers else None,
+            "last_modified": headers.get("Last-Modified") if headers else None,
+            "fetched_at": time.time(),
+            "size": len(body),
+        }
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(body_path + suffix, "wb") as f:
+            f.write(body)
+        os.replace(body_path + suffix, body_path)
+        with open(meta_path + suffix, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + suffix, meta_path)
+
+        self._stores += 1
+        if self._stores % 200 == 0:
+            self.evict()
+
+    def _refresh_meta(self, url: str, meta: dict, headers) -> None:
+        meta["fetched_at"] = time.time()
+        for field, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+            if headers and headers.get(header):
+                meta[field] = headers.get(header)
+        meta_path = self._paths(url)[1]
+        tmp = meta_path + f".{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp, meta_path)
+        except OSError:
+            pass
+        self._touch(url)
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits in max_bytes. Returns entries removed."""
+        if not self.max_bytes or not os.path.isdir(self.cache_dir):
+            return 0
+        with self._evict_lock:
+            entries = []
+            total = 0
+            for dirpath, _, files in os.walk(self.cache_dir):
+                for name in files:
+                    if not name.endswith(".body"):
+                        continue
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, path))
+                    total += st.st_size
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                for p in (path, path[: -len(".body")] + ".meta.json"):
+                    try:
+                        os.remove(p)
+                    except OSError:
+                        pass
+                total -= size
+                removed += 1
+            return removed
+
+    def _request(self, url: str, headers: dict, max_retries: int):
+        """GET with rate limiting and retries. Returns (status, body, headers); 304 has an empty body."""
+        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT, **headers})
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire()
+            try:
+                with urllib.request.urlopen(req, timeout=30) as resp:
+                    result = resp.status, resp.read(), resp.headers
+                break
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    result = 304, b"", e.headers
+                    break
+                if e.code not in RETRY_STATUSES or attempt >= max_retries:
+                    raise
+                time.sleep(_retry_delay(attempt, e))
+            except (urllib.error.URLError, TimeoutError) as e:
+                if attempt >= max_retries:
+                    raise
+                time.sleep(_retry_delay(attempt, e))
+            attempt += 1
+        self.stats.record(time.perf_counter() - started, attempt)
+        return result
+
+    def get(self, url: str, max_retries: int = 4) -> bytes:
+        cached = self._read(url) if self.enabled else None
+        if cached is not None:
+            meta, body = cached
+            if self.offline or time.time() - float(meta.get("fetched_at") or 0) < self.ttl:
+                self.stats.count(hits=1, bytes_saved=len(body))
+                self._touch(url)
+                return body
+        if self.offline:
+            raise OfflineMiss(f"Not in HTTP cache (offline): {url}")
+
+        conditional = {}
+        if cached is not None:
+            meta, _ = cached
+            if meta.get("etag"):
+                conditional["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                conditional["If-Modified-Since"] = meta["last_modified"]
+            elif meta.get("fetched_at"):
+                conditional["If-Modified-Since"] = email.utils.formatdate(meta["fetched_at"], usegmt=True)
+
+        status, body, headers = self._request(url, conditional, max_retries)
+        if status == 304 and cached is not None:
+            meta, body = cached
+            self._refresh_meta(url, meta, headers)
+            self.stats.count(hits=1, revalidated=1, bytes_saved=len(body))
+            return body
+
+        self.stats.count(misses=1, bytes_fetched=len(body))
+        if self.enabled:
+            try:
+                self._write(url, body, headers)
+            except OSError as e:
+                print(f"WARN: could not cache {url}: {e}", file=sys.stderr)
+        return body
+
+    def get_json(self, url: str, max_retries: int = 4) -> Any:
+        return json.loads(self.get(url, max_retries=max_retries).decode("utf-8"))
+
+
+def _retry_delay(attempt: int, err: Exception) -> float:
+    retry_after = getattr(err, "headers", None) and err.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return min(30.0, 0.5 * (2 ** attempt))
+
+
+_default = HttpCache()
+_report_registered = False
+
+
+def default_cache() -> HttpCache:
+    return _default
+
+
+def _report() -> None:
+    s = _default.stats
+    if s.hits or s.misses:
+        _default.evict()
+        print(s.summary(), file=sys.stderr)
+
+
+def configure(
+    cache_dir: str | None = None,
+    ttl: float | None = None,
+    max_bytes: int | None = None,
+    offline: bool | None = None,
+    enabled: bool | None = None,
+    rate: float | None = None,
+    burst: int = 1,
+) -> HttpCache:
+    """Adjust the shared cache used by fetch_json. Unset arguments keep their current value."""
+    global _report_registered
+    if cache_dir is not None:
+        _default.cache_dir = cache_dir
+    if ttl is not None:
+        _default.ttl = ttl
+    if max_bytes is not None:
+        _default.max_bytes = max_bytes
+    if offline is not None:
+        _default.offline = offline
+    if enabled is not None:
+        _default.enabled = enabled
+    if rate is not None:
+        _default.limiter = TokenBucket(rate, burst=burst) if rate > 0 else None
+    if not _report_registered:
+        atexit.register(_report)
+        _report_registered = True
+    return _default
+
+
+def add_cli_args(ap) -> None:
+    g = ap.add_argument_group("HTTP cache")
+    g.add_argument("--offline", action="store_true", help="Serve responses only from the on-disk cache")
+    g.add_argument("--no-cache", action="store_true", help="Bypass the on-disk HTTP cache")
+    g.add_argument("--cache-dir", type=str, default=None, help=f"Cache directory (default {DEFAULT_CACHE_DIR})")
+    g.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=None,
+        help=f"Seconds before a cached response is revalidated (default {DEFAULT_TTL})",
+    )
+    g.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=None,
+        help=f"LRU size bound for the cache in MB (default {DEFAULT_MAX_BYTES // (1024 * 1024)})",
+    )
+
+
+def configure_from_args(args) -> HttpCache:
+    max_mb = getattr(args, "cache_max_mb", None)
+    return configure(
+        cache_dir=getattr(args, "cache_dir", None),
+        ttl=getattr(args, "cache_ttl", None),
+        max_bytes=int(max_mb * 1024 * 1024) if max_mb is not None else None,
+        offline=bool(getattr(args, "offline", False)),
+        enabled=not getattr(args, "no_cache", False),
+    )
+
+
+def fetch_json(url: str, max_retries: int = 4) -> Any:
+    """GET a JSON resource through the shared cache."""
+    if not _report_registered:
+        configure()
+    return _default.get_json(url, max_retries=max_retries)
@@ -0,0 +1,108 @@
+"""Streaming reader for large top-level JSON arrays (the PokeDB export tables, old audit reports).
+
+Kept separate so tools that only need to read such files don't import the encounter build.
+
+Usage:
+  python tools/json_stream.py    # self-check: streamed reads match json.loads at every chunk size
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import tempfile
+
+_json_decoder = json.JSONDecoder()
+_array_sep_re = re.compile(r"[\s,]*")
+# Inside an array a complete number is always followed by one of these.
+_NUMBER_END = frozenset(",] \t\r\n")
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def iter_json_array(path: str, chunk_size: int = 1 << 16):
+    """Yield the elements of a top-level JSON array one at a time.
+
+    Only a small window of the file is kept in memory, so peak usage depends on the
+    largest single element instead of on the size of the whole export.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        buf = f.read(chunk_size).lstrip("﻿")
+        eof = not buf
+        pos = 0
+        started = False
+        while True:
+            pos = _array_sep_re.match(buf, pos).end()
+            err = None
+            if pos < len(buf):
+                if not started:
+                    if buf[pos] != "[":
+                        raise ValueError(f"{path}: expected a JSON array")
+                    started = True
+                    pos += 1
+                    continue
+                if buf[pos] == "]":
+                    return
+                try:
+                    value, end = _json_decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    err = e
+                else:
+                    # A number cut by the window edge still decodes, just short ("1" from "1.|5",
+                    # "2" from "2|e10"); accept one only once the character after it is in view.
+                    complete = end < len(buf) and (not _is_number(value) or buf[end] in _NUMBER_END)
+                    if complete or eof:
+                        yield value
+                        pos = end
+                        continue
+            if eof:
+                if err is not None:
+                    raise err
+                raise ValueError(f"{path}: truncated JSON array")
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buf = buf[pos:] + chunk
+            pos = 0
+
+
+def self_check(max_chunk: int = 24) -> int:
+    """Read sample arrays back at chunk sizes 1..max_chunk (and the default) and compare."""
+    samples = [
+        [i + 0.5 for i in range(3000)],
+        [1.5, 2e10, -3.25e-7, 0, -0.0, 1e+300, 12345678901234567890],
+        ["a", "", "comma, ] bracket", "esc \"quoted\" \\ é \u2603", "x" * 40],
+        [{"a": [1, 2.5, {"b": None}]}, {}, [], [[]], {"k": "v", "n": 1e3}],
+        [True, False, None, 7, "s", 8.0],
+        [],
+    ]
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sample.json")
+        for i, sample in enumerate(samples):
+            for indent in (None, 1):
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(sample, f, indent=indent, ensure_ascii=False)
+                with open(path, "r", encoding="utf-8") as f:
+                    expected = json.loads(f.read())
+                sizes = list(range(1, max_chunk + 1)) + [1 << 16]
+                # The large float array is only worth the full sweep at a few sizes.
+                if len(sample) > 100:
+                    sizes = [1, 2, 3, 7, 4096, 1 << 16]
+                for size in sizes:
+                    try:
+                        got = list(iter_json_array(path, chunk_size=size))
+                    except ValueError as e:
+                        got = e
+                    if got != expected:
+                        failed += 1
+                        print(f"FAIL sample {i} indent={indent} chunk_size={size}: {str(got)[:80]}")
+    print("OK: streamed reads match json.loads." if not failed else f"{failed} mismatch(es).")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(self_check())
@@ -0,0 +1,387 @@
+"""Local PokéAPI snapshot: mirror the resources the site uses into SQLite.
+
+Subcommands
+  build   Crawl PokéAPI (through http_cache, rate limited, N workers) into a SQLite file.
+  export  Write the snapshot as a static JSON tree in PokéAPI's URL shape:
+            <out>/api/v2/<kind>/index.json            (list endpoint, all results)
+            <out>/api/v2/<kind>/<id>/index.json       (also <kind>/<name>/index.json)
+            <out>/api/v2/pokemon/<id>/encounters/index.json
+          Absolute PokéAPI URLs inside the bodies are rewritten to --base-url.
+  serve   Serve an exported tree (directories resolve to index.json).
+  get     Print one resource from the snapshot, e.g. `get pokemon pikachu`.
+
+Usage:
+  python tools/pokeapi_snapshot.py build
+  python tools/pokeapi_snapshot.py build --kinds pokemon-species,evolution-chain --concurrency 8
+  python tools/pokeapi_snapshot.py export --out offline --base-url http://localhost:8001/api/v2
+  python tools/pokeapi_snapshot.py serve --root offline --port 8001
+
+To point the site at the local mirror, run in the browser console:
+  localStorage.setItem('pokeapiBase', 'http://localhost:8001/api/v2')
+
+Schema
+- resources(kind, id, name, body): one row per resource; indexed on (kind, name).
+- links(src_kind, src_id, rel, dst_kind, dst_id): every {"url": ".../api/v2/<kind>/<id>/"}
+  reference found in a body (the foreign keys), indexed both ways.
+- lists(kind, body): the list endpoint payload per kind.
+- extras(path, body): sub-resources such as pokemon/<id>/encounters.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import http_cache
+
+API = "https://pokeapi.co/api/v2"
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+DEFAULT_DB = os.path.join(ROOT, "data", ".cache", "pokeapi-snapshot.sqlite")
+
+# Resources fetched by the site's pages and the tools/ scripts.
+DEFAULT_KINDS = [
+    "pokemon",
+    "pokemon-species",
+    "evolution-chain",
+    "move",
+    "ability",
+    "item",
+    "type",
+    "egg-group",
+    "pokedex",
+    "location-area",
+    # Also requested directly by the pages:
+    "machine",
+    "pokemon-form",
+    "item-category",
+    "move-damage-class",
+    "version",
+    "version-group",
+    "generation",
+    "region",
+    "location",
+]
+
+_resource_url_re = re.compile(r"/api/v2/([a-z0-9-]+)/(\d+)/?$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    kind TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT,
+    body TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS resources_by_name ON resources (kind, name);
+CREATE TABLE IF NOT EXISTS links (
+    src_kind TEXT NOT NULL,
+    src_id INTEGER NOT NULL,
+    rel TEXT NOT NULL,
+    dst_kind TEXT NOT NULL,
+    dst_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS links_by_src ON links (src_kind, src_id);
+CREATE INDEX IF NOT EXISTS links_by_dst ON links (dst_kind, dst_id, rel);
+CREATE TABLE IF NOT EXISTS lists (
+    kind TEXT PRIMARY KEY,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS extras (
+    path TEXT PRIMARY KEY,
+    body TEXT NOT NULL
+);
+"""
+
+
+def parse_resource_url(url: str) -> tuple[str, int] | None:
+    m = _resource_url_re.search(str(url or ""))
+    if not m:
+        return None
+    return m.group(1), int(m.group(2))
+
+
+def iter_links(body: Any, rel: str = "") -> Iterator[tuple[str, str, int]]:
+    """Yield (rel, kind, id) for every resource reference inside a body.
+
+    `rel` is the dotted key path without list indexes, e.g. "moves.move" or
+    "varieties.pokemon".
+    """
+    if isinstance(body, dict):
+        url = body.get("url")
+        if isinstance(url, str):
+            ref = parse_resource_url(url)
+            if ref:
+                yield rel, ref[0], ref[1]
+        for key, value in body.items():
+            if isinstance(value, (dict, list)):
+                yield from iter_links(value, f"{rel}.{key}" if rel else key)
+    elif isinstance(body, list):
+        for value in body:
+            yield from iter_links(value, rel)
+
+
+class SnapshotStore:
+    """Read/write access to the snapshot database."""
+
+    def __init__(self, path: str = DEFAULT_DB) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self) -> "SnapshotStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def put(self, kind: str, body: dict) -> None:
+        rid = int(body["id"])
+        self.conn.execute(
+            "INSERT OR REPLACE INTO resources (kind, id, name, body, fetched_at) VALUES (?, ?, ?, ?, ?)",
+            (kind, rid, body.get("name"), json.dumps(body, ensure_ascii=False, separators=(",", ":")), time.time()),
+        )
+        self.conn.execute("DELETE FROM links WHERE src_kind = ? AND src_id = ?", (kind, rid))
+        self.conn.executemany(
+            "INSERT INTO links (src_kind, src_id, rel, dst_kind, dst_id) VALUES (?, ?, ?, ?, ?)",
+            [(kind, rid, rel, dst_kind, dst_id) for rel, dst_kind, dst_id in iter_links(body)],
+        )
+
+    def put_list(self, kind: str, body: dict) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO lists (kind, body) VALUES (?, ?)",
+            (kind, json.dumps(body, ensure_ascii=False, separators=(",", ":"))),
+        )
+
+    def put_extra(self, path: str, body: Any) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO extras (path, body) VALUES (?, ?)",
+            (path, json.dumps(body, ensure_ascii=False, separators=(",", ":"))),
+        )
+
+    def get(self, kind: str, ident: int | str) -> dict | None:
+        """Look up a resource by numeric id or by name."""
+        s = str(ident).strip().lower()
+        if s.isdigit():
+            row = self.conn.execute("SELECT body FROM resources WHERE kind = ? AND id = ?", (kind, int(s))).fetchone()
+        else:
+            row = self.conn.execute("SELECT body FROM resources WHERE kind = ? AND name = ?", (kind, s)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_list(self, kind: str) -> dict | None:
+        row = self.conn.execute("SELECT body FROM lists WHERE kind = ?", (kind,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_extra(self, path: str) -> Any:
+        row = self.conn.execute("SELECT body FROM extras WHERE path = ?", (path,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def ids(self, kind: str) -> set[int]:
+        return {r[0] for r in self.conn.execute("SELECT id FROM resources WHERE kind = ?", (kind,))}
+
+    def iter_kind(self, kind: str) -> Iterator[dict]:
+        for (body,) in self.conn.execute("SELECT body FROM resources WHERE kind = ? ORDER BY id", (kind,)):
+            yield json.loads(body)
+
+    def referencing(self, dst_kind: str, dst_id: int, src_kind: str | None = None, rel: str | None = None):
+        """(src_kind, src_id, rel) rows that reference dst_kind/dst_id, e.g. every pokemon with an ability."""
+        sql = "SELECT src_kind, src_id, rel FROM links WHERE dst_kind = ? AND dst_id = ?"
+        params: list[Any] = [dst_kind, dst_id]
+        if src_kind:
+            sql += " AND src_kind = ?"
+            params.append(src_kind)
+        if rel:
+            sql += " AND rel = ?"
+            params.append(rel)
+        return self.conn.execute(sql, params).fetchall()
+
+    def name_to_id(self, kind: str) -> dict[str, int]:
+        return {name: rid for rid, name in self.conn.execute("SELECT id, name FROM resources WHERE kind = ?", (kind,))}
+
+
+def cmd_build(args) -> int:
+    http_cache.configure_from_args(args)
+    http_cache.configure(rate=args.rate, burst=args.concurrency)
+    kinds = [k.strip() for k in args.kinds.split(",") if k.strip()]
+
+    with SnapshotStore(args.db) as store:
+        for kind in kinds:
+            listing = http_cache.fetch_json(f"{API}/{kind}?limit=100000&offset=0")
+            store.put_list(kind, listing)
+            refs = [parse_resource_url(r.get("url")) for r in listing.get("results") or []]
+            wanted = [rid for ref in refs if ref for rid in [ref[1]]]
+            have = set() if args.refresh else store.ids(kind)
+            todo = [rid for rid in wanted if rid not in have]
+            print(f"{kind}: {len(wanted)} listed, {len(todo)} to fetch")
+
+            started = time.perf_counter()
+            errors = 0
+            with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+                futures = [(rid, pool.submit(http_cache.fetch_json, f"{API}/{kind}/{rid}")) for rid in todo]
+                for n, (rid, fut) in enumerate(futures, 1):
+                    try:
+                        store.put(kind, fut.result())
+                    except Exception as e:
+                        errors += 1
+                        print(f"ERROR {kind}/{rid}: {e}")
+                    if n % 200 == 0:
+                        store.conn.commit()
+                        print(f"  {kind}: {n}/{len(todo)}")
+            store.conn.commit()
+
+            if kind == "pokemon" and not args.no_encounters:
+                ids = sorted(store.ids("pokemon"))
+                with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+                    futures = [
+                        (rid, pool.submit(http_cache.fetch_json, f"{API}/pokemon/{rid}/encounters"))
+                        for rid in ids
+                        if args.refresh or store.get_extra(f"pokemon/{rid}/encounters") is None
+                    ]
+                    for rid, fut in futures:
+                        try:
+                            store.put_extra(f"pokemon/{rid}/encounters", fut.result())
+                        except Exception as e:
+                            errors += 1
+                            print(f"ERROR pokemon/{rid}/encounters: {e}")
+                store.conn.commit()
+
+            print(f"  {kind}: done in {time.perf_counter() - started:.1f}s ({errors} errors)")
+
+    print(f"Snapshot: {args.db}")
+    return 0
+
+
+def _write_json(path: str, text: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def cmd_export(args) -> int:
+    out_root = os.path.join(args.out, "api", "v2")
+    base = args.base_url.rstrip("/")
+
+    def rewrite(text: str) -> str:
+        return text.replace(f"{API}/", f"{base}/")
+
+    written = 0
+    with SnapshotStore(args.db) as store:
+        for (kind,) in store.conn.execute("SELECT DISTINCT kind FROM resources ORDER BY kind").fetchall():
+            listing = store.get_list(kind)
+            if listing is not None:
+                listing = {**listing, "next": None, "previous": None}
+                _write_json(os.path.join(out_root, kind, "index.json"), rewrite(json.dumps(listing, ensure_ascii=False)))
+                written += 1
+            for rid, name, body in store.conn.execute("SELECT id, name, body FROM resources WHERE kind = ?", (kind,)):
+                text = rewrite(body)
+                _write_json(os.path.join(out_root, kind, str(rid), "index.json"), text)
+                written += 1
+                if name and str(name) != str(rid):
+                    _write_json(os.path.join(out_root, kind, str(name), "index.json"), text)
+                    written += 1
+        for path, body in store.conn.execute("SELECT path, body FROM extras"):
+            _write_json(os.path.join(out_root, *path.split("/"), "index.json"), rewrite(body))
+            written += 1
+
+    print(f"Exported {written} files to {out_root}")
+    print(f"Serve with: python tools/pokeapi_snapshot.py serve --root {args.out}")
+    return 0
+
+
+class _IndexJsonHandler(SimpleHTTPRequestHandler):
+    """Static handler that resolves /api/v2/pokemon/1 to /api/v2/pokemon/1/index.json."""
+
+    def translate_path(self, path: str) -> str:
+        fs_path = super().translate_path(path)
+        if os.path.isdir(fs_path):
+            index = os.path.join(fs_path, "index.json")
+            if os.path.exists(index):
+                return index
+        return fs_path
+
+    def end_headers(self) -> None:
+        self.send_header("Access-Control-Allow-Origin", "*")
+        super().end_headers()
+
+    def guess_type(self, path):
+        if str(path).endswith(".json"):
+            return "application/json"
+        return super().guess_type(path)
+
+
+def cmd_serve(args) -> int:
+    root = os.path.abspath(args.root)
+
+    def handler(*a, **kw):
+        return _IndexJsonHandler(*a, directory=root, **kw)
+
+    srv = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"Serving {root} at http://{args.host}:{args.port}/api/v2")
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_get(args) -> int:
+    with SnapshotStore(args.db) as store:
+        body = store.get(args.kind, args.ident)
+    if body is None:
+        print(f"Not in snapshot: {args.kind}/{args.ident}")
+        return 1
+    print(json.dumps(body, ensure_ascii=False, indent=2))
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db", type=str, default=DEFAULT_DB, help=f"SQLite snapshot path (default {DEFAULT_DB})")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    b = sub.add_parser("build", help="Crawl PokéAPI into the snapshot")
+    b.add_argument("--kinds", type=str, default=",".join(DEFAULT_KINDS))
+    b.add_argument("--concurrency", type=int, default=8)
+    b.add_argument("--rate", type=float, default=20.0, help="Max requests/sec (0 = unlimited)")
+    b.add_argument("--refresh", action="store_true", help="Refetch resources already in the snapshot")
+    b.add_argument("--no-encounters", action="store_true", help="Skip pokemon/<id>/encounters")
+    http_cache.add_cli_args(b)
+    b.set_defaults(func=cmd_build)
+
+    e = sub.add_parser("export", help="Write a static JSON tree in PokéAPI's URL shape")
+    e.add_argument("--out", type=str, default="offline")
+    e.add_argument("--base-url", type=str, default="http://localhost:8001/api/v2")
+    e.set_defaults(func=cmd_export)
+
+    s = sub.add_parser("serve", help="Serve an exported tree")
+    s.add_argument("--root", type=str, default="offline")
+    s.add_argument("--host", type=str, default="127.0.0.1")
+    s.add_argument("--port", type=int, default=8001)
+    s.set_defaults(func=cmd_serve)
+
+    g = sub.add_parser("get", help="Print one resource from the snapshot")
+    g.add_argument("kind")
+    g.add_argument("ident")
+    g.set_defaults(func=cmd_get)
+
+    args = ap.parse_args(argv[1:])
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
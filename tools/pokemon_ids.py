@@ -0,0 +1,173 @@
+"""PokéAPI ids for the Pokémon names used by the PokeDB encounter export.
+
+Location pages used to turn every Pokémon slug in a PokeDB location into an id
+with one GET /pokemon/{name} each (about 100 KB apiece, dozens per big area),
+and names PokéAPI doesn't know as a Pokémon (unown-f, shellos-west-sea,
+sneasel-hisuian, ...) were silently dropped. build_pokedb_encounters.py now
+embeds the ids in the index. It resolves the names through this table, which is
+generated from the local snapshot.
+
+Output (tools/pokemon_ids.json):
+  {"format": "pokedb-pokemon-ids/1", "generatedAt",
+   "pokemon": {name: [id, speciesId], ...},   every Pokémon in the snapshot
+   "forms": {formName: pokemonName, ...}}     forms whose name is not a Pokémon's
+
+A PokeDB name resolves to the first of these that the table knows, as a Pokémon
+or a form: the name itself, the name with ALIASES / WORD_ALIASES applied,
+then that name with trailing words dropped one at a time
+(wormadam-trash-cloak -> wormadam-trash, unown-f -> unown).
+
+Usage:
+  python tools/pokeapi_snapshot.py build
+  python tools/pokemon_ids.py build
+  python tools/pokemon_ids.py resolve sneasel-hisuian unown-f pikachu-partner
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import sys
+
+from pokeapi_snapshot import DEFAULT_DB, SnapshotStore, parse_resource_url
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OUT_PATH = os.path.join(HERE, "pokemon_ids.json")
+FORMAT = "pokedb-pokemon-ids/1"
+
+# PokeDB form identifiers whose PokéAPI Pokémon isn't found by the generic rules.
+ALIASES = {
+    "pikachu-partner": "pikachu-starter",
+    "eevee-partner": "eevee-starter",
+}
+
+# Words PokeDB spells differently from PokéAPI: regional adjectives vs region names, and "gmax".
+WORD_ALIASES = {
+    "alolan": "alola",
+    "galarian": "galar",
+    "hisuian": "hisui",
+    "paldean": "paldea",
+    "gigantamax": "gmax",
+}
+
+
+def build_table(store: SnapshotStore) -> dict:
+    pokemon: dict[str, list] = {}
+    for body in sorted(store.iter_kind("pokemon"), key=lambda p: p["id"]):
+        species = parse_resource_url((body.get("species") or {}).get("url"))
+        pokemon[body["name"]] = [body["id"], species[1] if species else None]
+
+    forms: dict[str, str] = {}
+    for body in sorted(store.iter_kind("pokemon-form"), key=lambda f: f["id"]):
+        owner = (body.get("pokemon") or {}).get("name")
+        if body.get("name") and owner in pokemon and body["name"] not in pokemon:
+            forms[body["name"]] = owner
+
+    return {
+        "format": FORMAT,
+        "generatedAt": datetime.datetime.now(datetime.timezone.utc)
+        .replace(microsecond=0)
+        .isoformat()
+        .replace("+00:00", "Z"),
+        "pokemon": pokemon,
+        "forms": dict(sorted(forms.items())),
+    }
+
+
+class PokemonIdResolver:
+    def __init__(self, table: dict) -> None:
+        self.pokemon: dict[str, list] = table["pokemon"]
+        self.forms: dict[str, str] = table.get("forms") or {}
+
+    @classmethod
+    def load(cls, path: str = OUT_PATH) -> "PokemonIdResolver | None":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                table = json.load(f)
+        except OSError:
+            return None
+        return cls(table) if table.get("format") == FORMAT else None
+
+    def _lookup(self, name: str) -> list | None:
+        if name in self.pokemon:
+            return self.pokemon[name]
+        owner = self.forms.get(name)
+        return self.pokemon.get(owner) if owner else None
+
+    def resolve(self, name: str) -> list | None:
+        """[pokemonId, speciesId] for a PokeDB Pokémon name, or None."""
+        name = str(name or "").strip().lower()
+        if not name:
+            return None
+        found = self._lookup(name)
+        if found:
+            return found
+        parts = [WORD_ALIASES.get(p, p) for p in ALIASES.get(name, name).split("-")]
+        for n in range(len(parts), 0, -1):
+            found = self._lookup("-".join(parts[:n]))
+            if found:
+                return found
+        return None
+
+    def resolve_all(self, names) -> tuple[dict[str, list], list[str]]:
+        """-> ({name: [pokemonId, speciesId]} sorted by name, sorted unresolved names)."""
+        resolved = {}
+        unresolved = []
+        for name in sorted(set(names)):
+            ids = self.resolve(name)
+            if ids:
+                resolved[name] = ids
+            else:
+                unresolved.append(name)
+        return resolved, unresolved
+
+
+def cmd_build(args) -> int:
+    if not os.path.exists(args.db):
+        print(f"Snapshot not found: {args.db} (run tools/pokeapi_snapshot.py build first)")
+        return 2
+    with SnapshotStore(args.db) as store:
+        table = build_table(store)
+    with open(args.out, "w", encoding="utf-8", newline="\n") as f:
+        json.dump(table, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
+    print(f"Wrote {args.out}: {len(table['pokemon'])} Pokémon, {len(table['forms'])} forms, "
+          f"{os.path.getsize(args.out):,} bytes")
+    return 0
+
+
+def cmd_resolve(args) -> int:
+    resolver = PokemonIdResolver.load(args.table)
+    if resolver is None:
+        print(f"Id table not found: {args.table} (run tools/pokemon_ids.py build first)")
+        return 2
+    missing = 0
+    for name in args.names:
+        ids = resolver.resolve(name)
+        print(f"{name}: {f'pokemon {ids[0]}, species {ids[1]}' if ids else 'unresolved'}")
+        missing += ids is None
+    return 1 if missing else 0
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    b = sub.add_parser("build", help="Write the name -> id table from the snapshot")
+    b.add_argument("--db", type=str, default=DEFAULT_DB, help="Snapshot built by tools/pokeapi_snapshot.py")
+    b.add_argument("--out", type=str, default=OUT_PATH)
+    b.set_defaults(func=cmd_build)
+
+    r = sub.add_parser("resolve", help="Resolve PokeDB Pokémon names to ids")
+    r.add_argument("names", nargs="+")
+    r.add_argument("--table", type=str, default=OUT_PATH)
+    r.set_defaults(func=cmd_resolve)
+
+    args = ap.parse_args(argv[1:])
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -1,31 +1,98 @@
-"""Summarize the JSON output from tools/audit_form_dex_entries.py.
+"""Summarize the output from tools/audit_form_dex_entries.py.
+
+Reads the JSONL report one record at a time (an old JSON-array report is streamed
+too), so memory stays bounded by the filters and counters, not by the report size.
 
 Usage:
-  python tools/summarize_form_dex_audit.py tools/form_dex_audit.json
+  python tools/summarize_form_dex_audit.py tools/form_dex_audit.jsonl
+  python tools/summarize_form_dex_audit.py --token alola --min-varieties 2
+  python tools/summarize_form_dex_audit.py --flagged --by token
+  python tools/summarize_form_dex_audit.py --by varieties --show 0
+  python tools/summarize_form_dex_audit.py --min-varieties 10 --emit > many_forms.jsonl
 """
 
 from __future__ import annotations
 
+import argparse
 import json
 import sys
+from collections import Counter
 from typing import Any
 
+from audit_form_dex_entries import iter_records
+
+
+def matches(r: dict[str, Any], args) -> bool:
+    varieties = r.get("variety_count") or 0
+    if args.flagged and not (r.get("heuristic") or {}).get("suspicious"):
+        return False
+    if args.token and not set(args.token) & set(r.get("tokens") or []):
+        return False
+    if args.min_varieties is not None and varieties < args.min_varieties:
+        return False
+    if args.max_varieties is not None and varieties > args.max_varieties:
+        return False
+    return True
+
 
 def main(argv: list[str]) -> int:
-    path = argv[1] if len(argv) > 1 else "tools/form_dex_audit.json"
-    with open(path, "r", encoding="utf-8") as f:
-        data: list[dict[str, Any]] = json.load(f)
+    ap = argparse.ArgumentParser()
+    ap.add_argument("path", nargs="?", default="tools/form_dex_audit.jsonl")
+    ap.add_argument("--flagged", action="store_true", help="Only species the heuristic flagged")
+    ap.add_argument("--token", action="append", default=[], help="Only species with this form token (repeatable)")
+    ap.add_argument("--min-varieties", type=int, default=None)
+    ap.add_argument("--max-varieties", type=int, default=None)
+    ap.add_argument("--by", choices=["token", "varieties"], default=None, help="Count matching species per group")
+    ap.add_argument("--show", type=int, default=40, help="How many matching species to list")
+    ap.add_argument("--emit", action="store_true", help="Print matching records as JSONL instead of a summary")
+    args = ap.parse_args(argv[1:])
+
+    filtered = bool(args.flagged or args.token or args.min_varieties is not None or args.max_varieties is not None)
+
+    scanned = 0
+    multi = 0
+    flagged = 0
+    matched = 0
+    groups: Counter = Counter()
+    shown: list[dict[str, Any]] = []
+
+    for r in iter_records(args.path):
+        scanned += 1
+        multi += (r.get("variety_count") or 0) > 1
+        flagged += bool((r.get("heuristic") or {}).get("suspicious"))
+        # Without filters the listing keeps its old meaning: the flagged species.
+        if not matches(r, args) or not (filtered or (r.get("heuristic") or {}).get("suspicious")):
+            continue
+        matched += 1
+        if args.emit:
+            print(json.dumps(r, ensure_ascii=False, separators=(",", ":")))
+            continue
+        if args.by == "token":
+            groups.update(set(r.get("tokens") or []) or ["(none)"])
+        elif args.by == "varieties":
+            groups[r.get("variety_count") or 0] += 1
+        if len(shown) < args.show:
+            shown.append(r)
+
+    if args.emit:
+        return 0
 
-    flagged = [r for r in data if (r.get("heuristic") or {}).get("suspicious")]
-    multi = [r for r in data if (r.get("variety_count") or 0) > 1]
+    print(f"Report: {args.path}")
+    print(f"- Species scanned: {scanned}")
+    print(f"- Species with >1 variety: {multi}")
+    print(f"- Heuristic flagged: {flagged}")
+    if filtered:
+        print(f"- Matching filters: {matched}")
 
-    print(f"Report: {path}")
-    print(f"- Species scanned: {len(data)}")
-    print(f"- Species with >1 variety: {len(multi)}")
-    print(f"- Heuristic flagged: {len(flagged)}")
+    if args.by:
+        print(f"\nBy {args.by}:")
+        keys = groups.most_common() if args.by == "token" else sorted(groups.items())
+        for key, count in keys:
+            print(f"- {key}: {count}")
 
-    print("\nFirst 40 flagged:")
-    for r in flagged[:40]:
+    if shown:
+        print(f"\nFirst {len(shown)} {'matching' if filtered else 'flagged'}:")
+    for r in shown:
         ex = (r.get("heuristic") or {}).get("example") or {}
         ex_version = ex.get("version")
         ex_token = ex.get("token")
@@ -0,0 +1,750 @@
+"""Search for the best-coverage 6-member teams.
+
+Candidates come from the PokéAPI snapshot (tools/pokeapi_snapshot.py): the
+species of a regional Pokédex (or every Pokédex of a game version), each mapped
+to its default form (or all forms with --forms). Teams are scored with
+type_chart.score_teams, the same packed weak/resist/offense masks the team
+builder's precomputed profiles come from.
+
+Search
+1. Filter: banned types, species already taken by a locked member.
+2. Dominance pruning: a candidate is dropped when at least top_k + 5 candidates
+   of other species are at least as good on every mask (weaknesses a subset,
+   resistances and offense a superset). Swapping such a candidate for any one of
+   those dominators never lowers a team's score, so at least top_k other teams
+   score as well as any team it appears in; the top-K scores are unchanged.
+3. Beam search (width --beam), then single-member swap hill climbing, gives a
+   strong initial top-K quickly.
+4. Branch-and-bound over the remaining candidates, seeded with the beam
+   result's K-th score, proves or improves it. The bound assumes the remaining
+   slots add every offense/resist bit still reachable and no new weaknesses.
+   With --workers N the first-member subtrees are split across a process pool.
+   --time-limit (default 0.8s, counted from the start) stops the exact phase and
+   returns the best teams found so far, marked "exact": false. When the best
+   score is shared by many teams the proof can take much longer than finding
+   them; --time-limit 0 runs it to completion.
+
+Subcommands
+  search  Top-K teams for one dex/version with optional constraints.
+  build   Precompute top-K teams for every Pokédex in the snapshot into
+          data/team-suggestions.json (used by pages/team-builder.html).
+  bench   Same search over a random synthetic dex (no snapshot needed).
+
+Usage:
+  python tools/team_optimizer.py search --dex paldea --top 5
+  python tools/team_optimizer.py search --version scarlet --lock skeledirge --ban-types ice,bug
+  python tools/team_optimizer.py search --dex paldea --workers 4 --json out.json
+  python tools/team_optimizer.py build
+  python tools/team_optimizer.py bench --species 400 --ban-types water,steel,fairy
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import heapq
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+
+import type_chart
+from type_chart import (
+    TYPE_ORDER,
+    W_EXPOSED,
+    W_OFFENSE,
+    W_RESIST,
+    W_STACKED,
+    ProfileTable,
+    type_indices,
+)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+OUT_FILE = os.path.join(ROOT, "data", "team-suggestions.json")
+
+TEAM_SIZE = 6
+
+_popcount = type_chart._popcount
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class Candidates:
+    """Column store of candidate team members (parallel lists indexed by candidate)."""
+
+    def __init__(self, pokemon: list[dict], use_abilities: bool = False) -> None:
+        table = ProfileTable()
+        self.ids: list[int] = []
+        self.names: list[str] = []
+        self.species: list[str] = []
+        self.abilities: list[str | None] = []
+        self.type_masks: list[int] = []
+        for p in pokemon:
+            types = type_indices(p["types"])
+            variants = [a for a, _hidden in p.get("abilities") or []] if use_abilities else []
+            for ability in variants or [None]:
+                table.add(types, ability)
+                self.ids.append(p["id"])
+                self.names.append(p["name"])
+                self.species.append(p.get("species") or p["name"])
+                self.abilities.append(ability)
+                self.type_masks.append(sum(1 << t for t in types))
+        self.weak = table.weak
+        self.resist = table.resist
+        self.offense = table.offense
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def index_of(self, name: str) -> int:
+        name = name.strip().lower()
+        for i, n in enumerate(self.names):
+            if n == name:
+                return i
+        for i, s in enumerate(self.species):
+            if s == name:
+                return i
+        raise KeyError(name)
+
+
+def _dominates(weak, resist, offense, a: int, b: int) -> bool:
+    return (
+        weak[a] & ~weak[b] == 0
+        and resist[b] & ~resist[a] == 0
+        and offense[b] & ~offense[a] == 0
+    )
+
+
+def prune_dominated(cands: Candidates, pool: list[int], top_k: int) -> list[int]:
+    """Drop pool members dominated by >= top_k + TEAM_SIZE - 1 candidates of other species.
+
+    Identical masks count as domination only from earlier pool entries, so a
+    class of equivalent candidates keeps its first members.
+    """
+    need = top_k + TEAM_SIZE - 1
+    weak, resist, offense, species = cands.weak, cands.resist, cands.offense, cands.species
+    keep = []
+    for pos, b in enumerate(pool):
+        dominators: set[str] = set()
+        for qpos, a in enumerate(pool):
+            if a == b or species[a] == species[b] or species[a] in dominators:
+                continue
+            if not _dominates(weak, resist, offense, a, b):
+                continue
+            if _dominates(weak, resist, offense, b, a) and qpos > pos:
+                continue
+            dominators.add(species[a])
+            if len(dominators) >= need:
+                break
+        if len(dominators) < need:
+            keep.append(b)
+    return keep
+
+
+def _team_score(team: Sequence[int], cands: Candidates) -> int:
+    return type_chart.score_teams([team], cands.weak, cands.resist, cands.offense)[0]
+
+
+def beam_search(cands: Candidates, locked: list[int], pool: list[int], top_k: int, width: int) -> list[tuple[int, tuple]]:
+    """Grow teams one member at a time, keeping the `width` best partial teams per level.
+
+    Partial teams carry their packed masks, so each expansion is scored incrementally.
+    """
+    weak, resist, offense, species = cands.weak, cands.resist, cands.offense, cands.species
+    popcount = _popcount
+    o = r = a1 = a2 = a3 = 0
+    for e in locked:
+        w = weak[e]
+        o |= offense[e]
+        r |= resist[e]
+        a3 |= a2 & w
+        a2 |= a1 & w
+        a1 |= w
+    beam = [(0, tuple(sorted(locked)), o, r, a1, a2, a3)]
+    for _ in range(TEAM_SIZE - len(locked)):
+        seen: set[tuple] = set()
+        expanded = []
+        for _score, team, o, r, a1, a2, a3 in beam:
+            used = {species[e] for e in team}
+            for i in pool:
+                if species[i] in used:
+                    continue
+                key = tuple(sorted(team + (i,)))
+                if key in seen:
+                    continue
+                seen.add(key)
+                w = weak[i]
+                o2 = o | offense[i]
+                r2 = r | resist[i]
+                b3 = a3 | (a2 & w)
+                b2 = a2 | (a1 & w)
+                b1 = a1 | w
+                score = (
+                    W_OFFENSE * popcount(o2)
+                    + W_RESIST * popcount(r2)
+                    - W_EXPOSED * popcount(b1 & ~r2)
+                    - W_STACKED * (popcount(b2) + popcount(b3))
+                )
+                expanded.append((score, key, o2, r2, b1, b2, b3))
+        if not expanded:
+            break
+        beam = heapq.nlargest(max(width, top_k), expanded, key=lambda st: st[0])
+    teams = [st[1] for st in beam[:top_k] if len(st[1]) == TEAM_SIZE]
+    return list(zip(type_chart.score_teams(teams, weak, resist, offense), teams))
+
+
+def improve_by_swaps(cands: Candidates, locked: list[int], pool: list[int], teams: list[tuple[int, tuple]], top_k: int) -> list[tuple[int, tuple]]:
+    """Hill-climb each team by single-member swaps; returns the best distinct teams seen."""
+    found: dict[tuple, int] = {team: score for score, team in teams}
+    fixed = set(locked)
+    for score, team in teams:
+        improved = True
+        while improved:
+            improved = False
+            for slot, member in enumerate(team):
+                if member in fixed:
+                    continue
+                rest = team[:slot] + team[slot + 1:]
+                used = {cands.species[e] for e in rest}
+                options = [tuple(sorted(rest + (i,))) for i in pool if cands.species[i] not in used]
+                scores = type_chart.score_teams(options, cands.weak, cands.resist, cands.offense)
+                for option, option_score in zip(options, scores):
+                    if option_score >= score:
+                        found.setdefault(option, option_score)
+                best = max(range(len(options)), key=scores.__getitem__, default=None)
+                if best is not None and scores[best] > score:
+                    score, team = scores[best], options[best]
+                    improved = True
+                    break
+    return sorted(((s, t) for t, s in found.items()), key=lambda st: (-st[0], st[1]))[:top_k]
+
+
+def _penalty_rates(left: int) -> tuple[float, float, float]:
+    """Per-member charges for a new weakness, valid for up to `left` members sharing it.
+
+    For a type the team is already weak to once, m more weak members add one stacked
+    penalty (and a second one at m >= 2); at twice, one penalty; for a type nobody is
+    weak to yet and nobody left can resist, exposure plus stacking from m >= 2. The
+    charge is the smallest per-member share of those totals over m = 1..left.
+    """
+    if left <= 0:
+        return 0.0, 0.0, 0.0
+    ms = range(1, left + 1)
+    one = min(W_STACKED * (1 + (m >= 2)) / m for m in ms)
+    two = min(W_STACKED / m for m in ms)
+    new = min((W_EXPOSED + W_STACKED * ((m >= 2) + (m >= 3))) / m for m in ms)
+    return one, two, new
+
+
+def branch_and_bound(
+    cands: Candidates,
+    locked: list[int],
+    pool: list[int],
+    top_k: int,
+    seed: list[tuple[int, tuple]],
+    roots: Sequence[int] | None = None,
+    deadline: float | None = None,
+) -> tuple[list[tuple[int, tuple]], int, bool]:
+    """Exact top-K over combinations of `pool` (in order) completing `locked`.
+
+    Returns (results, nodes visited, finished). `roots` restricts the first chosen
+    pool position (used to split the search across processes).
+    """
+    weak = [cands.weak[i] for i in pool]
+    res = [cands.resist[i] for i in pool]
+    off = [cands.offense[i] for i in pool]
+    species = [cands.species[i] for i in pool]
+    n = len(pool)
+
+    # Suffix unions and per-member maxima of what positions >= i can still add.
+    suf_off = [0] * (n + 1)
+    suf_res = [0] * (n + 1)
+    suf_max_off = [0] * (n + 1)
+    suf_max_res = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        suf_off[i] = suf_off[i + 1] | off[i]
+        suf_res[i] = suf_res[i + 1] | res[i]
+        suf_max_off[i] = max(suf_max_off[i + 1], _popcount(off[i]))
+        suf_max_res[i] = max(suf_max_res[i + 1], _popcount(res[i]))
+
+    heap: list[tuple[int, tuple]] = []
+    seen: set[tuple] = set()
+    for score, team in seed:
+        if team not in seen:
+            seen.add(team)
+            heapq.heappush(heap, (score, team))
+    while len(heap) > top_k:
+        heapq.heappop(heap)
+
+    o0 = r0 = w1 = w2 = w3 = 0
+    for e in locked:
+        w = cands.weak[e]
+        o0 |= cands.offense[e]
+        r0 |= cands.resist[e]
+        w3 |= w2 & w
+        w2 |= w1 & w
+        w1 |= w
+    locked_species = {cands.species[e] for e in locked}
+    slots = TEAM_SIZE - len(locked)
+    popcount = _popcount
+    penalty_rates = [_penalty_rates(left) for left in range(TEAM_SIZE + 1)]
+    nodes = 0
+    chosen: list[int] = []
+
+    def rec(start: int, left: int, o: int, r: int, a1: int, a2: int, a3: int, used: set) -> None:
+        nonlocal nodes
+        nodes += 1
+        if deadline is not None and not nodes & 0x3F and time.perf_counter() > deadline:
+            raise SearchTimeout
+        limit = n - left + 1
+        full = len(heap) >= top_k
+        if full and left > 1:
+            # Node bound: current score plus the `left` best optimistic marginal gains among
+            # the remaining candidates. Coverage gains are submodular, so the sum over-counts;
+            # new weaknesses are charged per member at a rate that m members sharing one type
+            # never exceed what the team actually pays for it (see _penalty_rates).
+            cur = (
+                W_OFFENSE * popcount(o)
+                + W_RESIST * popcount(r)
+                - W_EXPOSED * popcount(a1 & ~r)
+                - W_STACKED * (popcount(a2) + popcount(a3))
+            )
+            exposed = a1 & ~r
+            nores = ~(r | suf_res[start])
+            p_one, p_two, p_new = penalty_rates[left]
+            single = a1 & ~a2
+            double = a2 & ~a3
+            fresh = ~a1 & nores
+            gains = [
+                W_OFFENSE * popcount(off[j] & ~o)
+                + W_RESIST * popcount(res[j] & ~r)
+                + W_EXPOSED * popcount(exposed & res[j])
+                - p_one * popcount(weak[j] & single)
+                - p_two * popcount(weak[j] & double)
+                - p_new * popcount(weak[j] & fresh)
+                for j in range(start, n)
+            ]
+            best = heapq.nlargest(left, range(len(gains)), key=gains.__getitem__)
+            # The gains can't exceed what the remaining candidates can still cover at all.
+            reach_res = suf_res[start]
+            cap = (
+                W_OFFENSE * popcount(suf_off[start] & ~o)
+                + W_RESIST * popcount(reach_res & ~r)
+                + W_EXPOSED * popcount(exposed & reach_res)
+            )
+            if cur + min(cap, sum(gains[k] for k in best)) <= heap[0][0]:
+                return
+            top = set(best[: left - 1])
+            best_rest = sum(gains[k] for k in top)
+            spare = gains[best[left - 1]]
+        else:
+            gains = None
+        for i in range(start, limit):
+            if species[i] in used:
+                continue
+            if gains is not None:
+                g = gains[i - start]
+                # Best (left - 1) gains among the other remaining candidates.
+                others = best_rest - g + spare if i - start in top else best_rest
+                if cur + g + others <= heap[0][0]:
+                    continue
+            w = weak[i]
+            o2 = o | off[i]
+            r2 = r | res[i]
+            b3 = a3 | (a2 & w)
+            b2 = a2 | (a1 & w)
+            b1 = a1 | w
+            rest = left - 1
+            if rest:
+                uo = o2 | suf_off[i + 1]
+                ur = r2 | suf_res[i + 1]
+                ob = min(popcount(uo), popcount(o2) + rest * suf_max_off[i + 1])
+                rb = min(popcount(ur), popcount(r2) + rest * suf_max_res[i + 1])
+                bound = (
+                    W_OFFENSE * ob
+                    + W_RESIST * rb
+                    - W_EXPOSED * popcount(b1 & ~ur)
+                    - W_STACKED * (popcount(b2) + popcount(b3))
+                )
+            else:
+                bound = (
+                    W_OFFENSE * popcount(o2)
+                    + W_RESIST * popcount(r2)
+                    - W_EXPOSED * popcount(b1 & ~r2)
+                    - W_STACKED * (popcount(b2) + popcount(b3))
+                )
+            if len(heap) >= top_k and bound <= heap[0][0]:
+                continue
+            chosen.append(i)
+            if rest:
+                used.add(species[i])
+                rec(i + 1, rest, o2, r2, b1, b2, b3, used)
+                used.discard(species[i])
+            else:
+                team = tuple(sorted(locked + [pool[j] for j in chosen]))
+                if team not in seen:
+                    seen.add(team)
+                    if len(heap) < top_k:
+                        heapq.heappush(heap, (bound, team))
+                    else:
+                        heapq.heapreplace(heap, (bound, team))
+            chosen.pop()
+
+    finished = True
+    try:
+        if slots <= 0:
+            pass
+        elif roots is None:
+            rec(0, slots, o0, r0, w1, w2, w3, set(locked_species))
+        else:
+            for root in roots:
+                if species[root] in locked_species:
+                    continue
+                # Choose `root` as the first pool member, then recurse over later positions.
+                w = weak[root]
+                chosen.append(root)
+                if slots == 1:
+                    team = tuple(sorted(locked + [pool[root]]))
+                    score = _team_score(team, cands)
+                    if team not in seen and (len(heap) < top_k or score > heap[0][0]):
+                        seen.add(team)
+                        heapq.heappush(heap, (score, team))
+                        if len(heap) > top_k:
+                            heapq.heappop(heap)
+                else:
+                    rec(
+                        root + 1, slots - 1, o0 | off[root], r0 | res[root],
+                        w1 | w, w2 | (w1 & w), w3 | (w2 & w), locked_species | {species[root]},
+                    )
+                chosen.pop()
+    except SearchTimeout:
+        finished = False
+
+    return sorted(heap, key=lambda st: (-st[0], st[1])), nodes, finished
+
+
+_worker_state: dict = {}
+
+
+def _worker_init(cands: Candidates, locked: list[int], pool: list[int], top_k: int) -> None:
+    _worker_state.update(cands=cands, locked=locked, pool=pool, top_k=top_k)
+
+
+def _worker_run(roots: list[int], seed: list[tuple[int, tuple]], deadline_in: float | None):
+    s = _worker_state
+    deadline = time.perf_counter() + deadline_in if deadline_in is not None else None
+    return branch_and_bound(s["cands"], s["locked"], s["pool"], s["top_k"], seed, roots=roots, deadline=deadline)
+
+
+def optimize(
+    cands: Candidates,
+    locked_names: Sequence[str] = (),
+    banned_types: Sequence[str] = (),
+    top_k: int = 5,
+    beam_width: int = 64,
+    workers: int = 1,
+    time_limit: float | None = None,
+) -> dict:
+    started = time.perf_counter()
+    locked = [cands.index_of(n) for n in locked_names]
+    if len(locked) > TEAM_SIZE:
+        raise ValueError(f"at most {TEAM_SIZE} locked members")
+    locked_species = {cands.species[i] for i in locked}
+    banned_mask = sum(1 << t for t in set(type_indices(banned_types)))
+
+    pool = [
+        i
+        for i in range(len(cands))
+        if cands.species[i] not in locked_species and not cands.type_masks[i] & banned_mask
+    ]
+    filtered = len(pool)
+    pool = prune_dominated(cands, pool, top_k)
+    # Strong members first so good teams (and a tight threshold) show up early.
+    single = type_chart.score_teams([[i] for i in pool], cands.weak, cands.resist, cands.offense)
+    pool = [i for _s, i in sorted(zip(single, pool), key=lambda si: (-si[0], si[1]))]
+
+    seed = beam_search(cands, locked, pool, top_k, beam_width)
+    seed = improve_by_swaps(cands, locked, pool, seed, top_k)
+    seed_secs = time.perf_counter() - started
+
+    deadline = started + time_limit if time_limit else None
+    if workers > 1 and len(pool) > workers:
+        chunks = [list(range(w, len(pool), workers)) for w in range(workers)]
+        remaining = (deadline - time.perf_counter()) if deadline else None
+        merged: dict[tuple, int] = {team: score for score, team in seed}
+        nodes = 0
+        finished = True
+        with ProcessPoolExecutor(max_workers=workers, initializer=_worker_init, initargs=(cands, locked, pool, top_k)) as ex:
+            for results, n, done in ex.map(_worker_run, chunks, [seed] * workers, [remaining] * workers):
+                nodes += n
+                finished = finished and done
+                for score, team in results:
+                    merged[team] = score
+        results = sorted(((s, t) for t, s in merged.items()), key=lambda st: (-st[0], st[1]))[:top_k]
+    else:
+        results, nodes, finished = branch_and_bound(cands, locked, pool, top_k, seed, deadline=deadline)
+
+    return {
+        "teams": [_describe_team(cands, team, score) for score, team in results],
+        "stats": {
+            "candidates": len(cands),
+            "afterFilters": filtered,
+            "afterPruning": len(pool),
+            "seedMs": round(seed_secs * 1000, 1),
+            "totalMs": round((time.perf_counter() - started) * 1000, 1),
+            "nodes": nodes,
+            "exact": finished,
+            "workers": workers,
+        },
+    }
+
+
+def _describe_team(cands: Candidates, team: Sequence[int], score: int) -> dict:
+    off = res = any_weak = 0
+    for e in team:
+        off |= cands.offense[e]
+        res |= cands.resist[e]
+        any_weak |= cands.weak[e]
+    return {
+        "score": score,
+        "members": [
+            {"id": cands.ids[e], "name": cands.names[e], **({"ability": cands.abilities[e]} if cands.abilities[e] else {})}
+            for e in team
+        ],
+        "unresisted": [t for i, t in enumerate(TYPE_ORDER) if not res & (1 << i)],
+        "exposed": [t for i, t in enumerate(TYPE_ORDER) if any_weak & ~res & (1 << i)],
+        "uncoveredOffense": [t for i, t in enumerate(TYPE_ORDER) if not off & (1 << i)],
+    }
+
+
+def _pokemon_entry(p: dict, species_name: str) -> dict:
+    return {
+        "id": p["id"],
+        "name": p["name"],
+        "species": species_name,
+        "types": [t["type"]["name"] for t in sorted(p.get("types") or [], key=lambda t: t.get("slot") or 0)],
+        "abilities": [
+            ((a.get("ability") or {}).get("name"), bool(a.get("is_hidden")))
+            for a in p.get("abilities") or []
+            if (a.get("ability") or {}).get("name")
+        ],
+    }
+
+
+def load_dex_pokemon(store, dexes: Sequence[str], include_forms: bool = False) -> list[dict]:
+    """Pokémon (types + abilities) for the species of the given Pokédexes, in dex order."""
+    species_names: list[str] = []
+    seen: set[str] = set()
+    for dex_name in dexes:
+        dex = store.get("pokedex", dex_name)
+        if not dex:
+            raise KeyError(f"pokedex not in snapshot: {dex_name}")
+        for entry in sorted(dex.get("pokemon_entries") or [], key=lambda e: e.get("entry_number") or 0):
+            name = (entry.get("pokemon_species") or {}).get("name")
+            if name and name not in seen:
+                seen.add(name)
+                species_names.append(name)
+
+    out = []
+    for species_name in species_names:
+        species = store.get("pokemon-species", species_name)
+        varieties = (species or {}).get("varieties") or [{"is_default": True, "pokemon": {"name": species_name}}]
+        for v in varieties:
+            if not include_forms and not v.get("is_default"):
+                continue
+            p = store.get("pokemon", (v.get("pokemon") or {}).get("name") or "")
+            if not p:
+                continue
+            out.append(_pokemon_entry(p, species_name))
+    return out
+
+
+def load_dex_pokemon_by_name(store, name: str) -> list[dict]:
+    p = store.get("pokemon", name)
+    if not p:
+        species = store.get("pokemon-species", name)
+        default = next((v for v in (species or {}).get("varieties") or [] if v.get("is_default")), None)
+        p = store.get("pokemon", (default or {}).get("pokemon", {}).get("name") or "") if default else None
+    if not p:
+        raise KeyError(f"pokemon not in snapshot: {name}")
+    return [_pokemon_entry(p, (p.get("species") or {}).get("name") or p["name"])]
+
+
+def dexes_for_version(store, version: str) -> list[str]:
+    v = store.get("version", version)
+    if not v:
+        raise KeyError(f"version not in snapshot: {version}")
+    vg = store.get("version-group", (v.get("version_group") or {}).get("name") or "")
+    return [d["name"] for d in (vg or {}).get("pokedexes") or []]
+
+
+def synthetic_dex(species: int, seed: int) -> list[dict]:
+    """Random single/dual typings shaped like load_dex_pokemon output."""
+    rng = random.Random(seed)
+    out = []
+    for i in range(species):
+        types = rng.sample(TYPE_ORDER, rng.choice((1, 2, 2)))
+        out.append({"id": i + 1, "name": f"mon-{i + 1}", "species": f"mon-{i + 1}", "types": types, "abilities": []})
+    return out
+
+
+def _print_result(result: dict) -> None:
+    st = result["stats"]
+    print(
+        f"Candidates: {st['candidates']} -> {st['afterFilters']} after filters -> {st['afterPruning']} after pruning; "
+        f"{st['nodes']:,} nodes, {'exact' if st['exact'] else 'time limit hit (best found)'}, "
+        f"seed {st['seedMs']} ms, total {st['totalMs']} ms"
+    )
+    for rank, team in enumerate(result["teams"], 1):
+        members = ", ".join(m["name"] + (f" ({m['ability']})" if m.get("ability") else "") for m in team["members"])
+        print(f"{rank:>2}. score {team['score']:>3}  {members}")
+        if team["exposed"] or team["uncoveredOffense"]:
+            print(f"      exposed: {', '.join(team['exposed']) or '-'}; uncovered offense: {', '.join(team['uncoveredOffense']) or '-'}")
+
+
+def _split(value: str | None) -> list[str]:
+    return [x.strip().lower() for x in (value or "").split(",") if x.strip()]
+
+
+def _search_args(ap: argparse.ArgumentParser) -> None:
+    ap.add_argument("--top", type=int, default=5)
+    ap.add_argument("--beam", type=int, default=64, help="Beam width for the initial solution")
+    ap.add_argument("--workers", type=int, default=1, help="Processes for the exact phase")
+    ap.add_argument(
+        "--time-limit", type=float, default=0.8,
+        help="Seconds before returning the best teams found (0 = run the exact phase to completion)",
+    )
+    ap.add_argument("--abilities", action="store_true", help="Also consider each ability's defensive profile")
+
+
+def cmd_search(args) -> int:
+    from pokeapi_snapshot import SnapshotStore
+
+    if not os.path.exists(args.db):
+        print(f"Snapshot not found: {args.db} (run tools/pokeapi_snapshot.py build first)")
+        return 2
+    with SnapshotStore(args.db) as store:
+        dexes = _split(args.dex) or (dexes_for_version(store, args.version) if args.version else [])
+        if not dexes:
+            print("Pass --dex or --version")
+            return 2
+        pokemon = load_dex_pokemon(store, dexes, include_forms=args.forms)
+        # Locked members may come from outside the dex (e.g. a traded-in favourite).
+        for name in _split(args.lock):
+            if not any(p["name"] == name or p["species"] == name for p in pokemon):
+                pokemon.extend(load_dex_pokemon_by_name(store, name))
+
+    cands = Candidates(pokemon, use_abilities=args.abilities)
+    result = optimize(
+        cands,
+        locked_names=_split(args.lock),
+        banned_types=_split(args.ban_types),
+        top_k=args.top,
+        beam_width=args.beam,
+        workers=args.workers,
+        time_limit=args.time_limit,
+    )
+    result["dexes"] = dexes
+    _print_result(result)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+    return 0
+
+
+def cmd_build(args) -> int:
+    from pokeapi_snapshot import SnapshotStore
+
+    if not os.path.exists(args.db):
+        print(f"Snapshot not found: {args.db} (run tools/pokeapi_snapshot.py build first)")
+        return 2
+    started = time.perf_counter()
+    out: dict = {}
+    with SnapshotStore(args.db) as store:
+        dex_names = _split(args.dexes) or sorted(store.name_to_id("pokedex"))
+        for dex in dex_names:
+            pokemon = load_dex_pokemon(store, [dex])
+            if len(pokemon) < TEAM_SIZE:
+                continue
+            result = optimize(Candidates(pokemon), top_k=args.top, beam_width=args.beam, time_limit=args.time_limit)
+            out[dex] = {"candidates": len(pokemon), "exact": result["stats"]["exact"], "teams": result["teams"]}
+            print(f"{dex}: {len(pokemon)} species, best score {result['teams'][0]['score'] if result['teams'] else '-'} "
+                  f"({result['stats']['totalMs']} ms)")
+
+    payload = {
+        "_meta": {
+            "generatedAt": datetime.datetime.now(datetime.timezone.utc)
+            .replace(microsecond=0)
+            .isoformat()
+            .replace("+00:00", "Z"),
+            "source": "tools/team_optimizer.py",
+            "weights": {"offense": W_OFFENSE, "resist": W_RESIST, "exposed": W_EXPOSED, "stacked": W_STACKED},
+        },
+        "dexes": out,
+    }
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
+    print(f"Wrote {args.out}: {len(out)} dexes ({os.path.getsize(args.out):,} bytes) in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+def cmd_bench(args) -> int:
+    cands = Candidates(synthetic_dex(args.species, args.seed))
+    result = optimize(
+        cands,
+        banned_types=_split(args.ban_types),
+        top_k=args.top,
+        beam_width=args.beam,
+        workers=args.workers,
+        time_limit=args.time_limit,
+    )
+    _print_result(result)
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    from pokeapi_snapshot import DEFAULT_DB
+
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    s = sub.add_parser("search", help="Top-K teams for a dex or game version")
+    s.add_argument("--db", type=str, default=DEFAULT_DB)
+    s.add_argument("--dex", type=str, default=None, help="Comma-separated Pokédex names (e.g. paldea)")
+    s.add_argument("--version", type=str, default=None, help="Game version; uses its version group's Pokédexes")
+    s.add_argument("--forms", action="store_true", help="Include non-default forms of each species")
+    s.add_argument("--lock", type=str, default=None, help="Comma-separated members every team must contain")
+    s.add_argument("--ban-types", type=str, default=None, help="Comma-separated types no member may have")
+    s.add_argument("--json", type=str, default=None, help="Also write the result to this file")
+    _search_args(s)
+    s.set_defaults(func=cmd_search)
+
+    b = sub.add_parser("build", help="Precompute suggestions for every Pokédex in the snapshot")
+    b.add_argument("--db", type=str, default=DEFAULT_DB)
+    b.add_argument("--dexes", type=str, default=None, help="Comma-separated subset of Pokédexes")
+    b.add_argument("--out", type=str, default=OUT_FILE)
+    _search_args(b)
+    b.set_defaults(func=cmd_build, top=20, time_limit=5.0)
+
+    bench = sub.add_parser("bench", help="Search a random synthetic dex")
+    bench.add_argument("--species", type=int, default=400)
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--ban-types", type=str, default=None)
+    _search_args(bench)
+    bench.set_defaults(func=cmd_bench)
+
+    args = ap.parse_args(argv[1:])
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
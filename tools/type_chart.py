@@ -0,0 +1,439 @@
+"""Batched type-effectiveness and team-coverage engine.
+
+The frontend computes matchups one Pokémon and one type at a time
+(calculateTypeDefenses / applyAbilityToTypeDefenses in js/script.part3.js,
+getDamageMultiplier in pages/team-builder.html). This module holds the same
+18x18 chart as a dense matrix and works on whole tables instead:
+
+- defensive profiles for every type combination x ability are computed once and
+  deduplicated (a few hundred distinct rows cover every Pokémon/form);
+- each profile is also packed into 18-bit masks (weak / resist / immune), and a
+  member's STAB offense into one more mask, so scoring a 6-member team is a
+  handful of integer ORs/ANDs plus a bit-sliced counter for stacked weaknesses.
+
+Subcommands
+  build   Read Pokémon types/abilities from the PokéAPI snapshot and write
+          data/type-profiles.json (loaded by pages/team-builder.html).
+  bench   Score random 6-member teams and report teams/second. Uses the
+          snapshot when present, otherwise every type combination.
+
+Usage:
+  python tools/type_chart.py build
+  python tools/type_chart.py bench --teams 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import random
+import sys
+import time
+from typing import Iterable, Sequence
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+OUT_FILE = os.path.join(ROOT, "data", "type-profiles.json")
+
+# Same order and values as TYPE_ORDER / TYPE_CHART_DATA in js/script.part1.js.
+# Rows: attacker, cols: defender.
+TYPE_ORDER = [
+    "normal", "fire", "water", "electric", "grass", "ice", "fighting", "poison", "ground",
+    "flying", "psychic", "bug", "rock", "ghost", "dragon", "dark", "steel", "fairy",
+]
+TYPE_INDEX = {t: i for i, t in enumerate(TYPE_ORDER)}
+N_TYPES = len(TYPE_ORDER)
+ALL_TYPES_MASK = (1 << N_TYPES) - 1
+
+TYPE_CHART = [
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0.5, 0, 1, 1, 0.5, 1],  # Normal
+    [1, 0.5, 0.5, 1, 2, 2, 1, 1, 1, 1, 1, 2, 0.5, 1, 0.5, 1, 2, 1],  # Fire
+    [1, 2, 0.5, 1, 0.5, 1, 1, 1, 2, 1, 1, 1, 2, 1, 0.5, 1, 1, 1],  # Water
+    [1, 1, 2, 0.5, 0.5, 1, 1, 1, 0, 2, 1, 1, 1, 1, 0.5, 1, 1, 1],  # Electric
+    [1, 0.5, 2, 1, 0.5, 1, 1, 0.5, 2, 0.5, 1, 0.5, 2, 1, 0.5, 1, 0.5, 1],  # Grass
+    [1, 0.5, 0.5, 1, 2, 0.5, 1, 1, 2, 2, 1, 1, 1, 1, 2, 1, 0.5, 1],  # Ice
+    [2, 1, 1, 1, 1, 2, 1, 0.5, 1, 0.5, 0.5, 0.5, 2, 0, 1, 2, 2, 0.5],  # Fighting
+    [1, 1, 1, 1, 2, 1, 1, 0.5, 0.5, 1, 1, 1, 0.5, 0.5, 1, 1, 0, 2],  # Poison
+    [1, 2, 1, 2, 0.5, 1, 1, 2, 1, 0, 1, 0.5, 2, 1, 1, 1, 2, 1],  # Ground
+    [1, 1, 1, 0.5, 2, 1, 2, 1, 1, 1, 1, 2, 0.5, 1, 1, 1, 0.5, 1],  # Flying
+    [1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 0.5, 1, 1, 1, 1, 0, 0.5, 1],  # Psychic
+    [1, 0.5, 1, 1, 2, 1, 0.5, 0.5, 1, 0.5, 2, 1, 1, 0.5, 1, 2, 0.5, 0.5],  # Bug
+    [1, 2, 1, 1, 1, 2, 0.5, 1, 0.5, 2, 1, 2, 1, 1, 1, 1, 0.5, 1],  # Rock
+    [0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 2, 1, 0.5, 1, 1],  # Ghost
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 0.5, 0],  # Dragon
+    [1, 1, 1, 1, 1, 1, 0.5, 1, 1, 1, 2, 1, 1, 2, 1, 0.5, 1, 0.5],  # Dark
+    [1, 0.5, 0.5, 0.5, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 0.5, 2],  # Steel
+    [1, 0.5, 1, 1, 1, 1, 2, 0.5, 1, 1, 1, 1, 1, 1, 2, 2, 0.5, 1],  # Fairy
+]
+
+# Column view: DEFENDER_COLUMNS[d][a] = multiplier of attacking type a against defender type d.
+DEFENDER_COLUMNS = [tuple(TYPE_CHART[a][d] for a in range(N_TYPES)) for d in range(N_TYPES)]
+
+# SUPER_EFFECTIVE_MASKS[a]: defending types that attacking type a hits for 2x.
+SUPER_EFFECTIVE_MASKS = [
+    sum(1 << d for d in range(N_TYPES) if TYPE_CHART[a][d] > 1) for a in range(N_TYPES)
+]
+
+# Team score weights (per attacking/defending type; see score_teams).
+W_OFFENSE = 3  # some member's STAB hits the type super-effectively
+W_RESIST = 2  # some member resists or is immune to the type
+W_EXPOSED = 3  # some member is weak to the type and nobody resists it
+W_STACKED = 2  # two or more members weak to the type (charged again at three)
+
+
+def type_indices(types: Iterable[str]) -> tuple[int, ...]:
+    return tuple(TYPE_INDEX[t] for t in types if t in TYPE_INDEX)
+
+
+def defenses_for_types(types: Sequence[int]) -> tuple[float, ...]:
+    """calculateTypeDefenses: product of the defender columns."""
+    out = [1.0] * N_TYPES
+    for d in types:
+        col = DEFENDER_COLUMNS[d]
+        out = [m * c for m, c in zip(out, col)]
+    return tuple(out)
+
+
+def apply_ability(base: Sequence[float], ability: str | None, types: Sequence[int]) -> tuple[float, ...]:
+    """applyAbilityToTypeDefenses, rule for rule."""
+    m = list(base)
+    a = str(ability or "").lower()
+    if not a:
+        return tuple(m)
+
+    def set_immune(t: str) -> None:
+        m[TYPE_INDEX[t]] = 0
+
+    def scale(t: str, factor: float) -> None:
+        m[TYPE_INDEX[t]] *= factor
+
+    def remove_weakness(t: str) -> None:
+        i = TYPE_INDEX[t]
+        if m[i] > 1:
+            m[i] = 1
+
+    if a == "thick-fat":
+        scale("fire", 0.5)
+        scale("ice", 0.5)
+    if a == "heatproof":
+        scale("fire", 0.5)
+    if a == "water-bubble":
+        scale("fire", 0.5)
+    if a == "fluffy":
+        scale("fire", 2)
+    if a == "dry-skin":
+        set_immune("water")
+        scale("fire", 1.25)
+    if a == "purifying-salt":
+        scale("ghost", 0.5)
+
+    if a == "primordial-sea":
+        set_immune("fire")
+    if a == "desolate-land":
+        set_immune("water")
+
+    if a in ("flash-fire", "well-baked-body"):
+        set_immune("fire")
+    if a in ("levitate", "earth-eater"):
+        set_immune("ground")
+    if a in ("lightning-rod", "motor-drive", "volt-absorb"):
+        set_immune("electric")
+    if a in ("water-absorb", "storm-drain"):
+        set_immune("water")
+    if a == "sap-sipper":
+        set_immune("grass")
+
+    if a == "delta-stream" and TYPE_INDEX["flying"] in types:
+        remove_weakness("electric")
+        remove_weakness("ice")
+        remove_weakness("rock")
+
+    if a in ("filter", "solid-rock", "prism-armor"):
+        m = [x * 0.75 if x > 1 else x for x in m]
+
+    if a == "wonder-guard":
+        m = [0 if x <= 1 else x for x in m]
+
+    return tuple(m)
+
+
+def profile_masks(profile: Sequence[float]) -> tuple[int, int, int]:
+    """(weak, resist, immune) bitmasks; resist excludes immunities."""
+    weak = resist = immune = 0
+    for i, x in enumerate(profile):
+        bit = 1 << i
+        if x == 0:
+            immune |= bit
+        elif x > 1:
+            weak |= bit
+        elif x < 1:
+            resist |= bit
+    return weak, resist, immune
+
+
+def offense_mask(types: Sequence[int]) -> int:
+    """Defending types hit super-effectively by at least one STAB type."""
+    mask = 0
+    for t in types:
+        mask |= SUPER_EFFECTIVE_MASKS[t]
+    return mask
+
+
+class ProfileTable:
+    """Deduplicated defensive profiles for a list of (types, ability) entries.
+
+    entry_profile[i] -> profile index; weak/resist/offense are parallel mask lists
+    indexed by entry (resist includes immunities), ready for score_teams.
+    """
+
+    def __init__(self) -> None:
+        self.profiles: list[tuple[float, ...]] = []
+        self._profile_index: dict[tuple[float, ...], int] = {}
+        self._base_cache: dict[tuple[int, ...], tuple[float, ...]] = {}
+        self.entry_profile: list[int] = []
+        self.weak: list[int] = []
+        self.resist: list[int] = []
+        self.offense: list[int] = []
+
+    def add(self, types: Sequence[int], ability: str | None = None) -> int:
+        key = tuple(sorted(types))
+        base = self._base_cache.get(key)
+        if base is None:
+            base = self._base_cache[key] = defenses_for_types(key)
+        profile = apply_ability(base, ability, key) if ability else base
+        p_idx = self._profile_index.get(profile)
+        if p_idx is None:
+            p_idx = self._profile_index[profile] = len(self.profiles)
+            self.profiles.append(profile)
+        weak, resist, immune = profile_masks(profile)
+        self.entry_profile.append(p_idx)
+        self.weak.append(weak)
+        # Immunities count as resistances for coverage purposes.
+        self.resist.append(resist | immune)
+        self.offense.append(offense_mask(key))
+        return len(self.entry_profile) - 1
+
+
+def _popcount(x: int) -> int:
+    return bin(x).count("1")
+
+
+if hasattr(int, "bit_count"):  # Python 3.10+
+    _popcount = int.bit_count  # noqa: F811
+
+
+def score_teams(
+    teams: Iterable[Sequence[int]],
+    weak: Sequence[int],
+    resist: Sequence[int],
+    offense: Sequence[int],
+) -> list[int]:
+    """Score many teams (sequences of entry indexes) against the packed columns.
+
+    score = W_OFFENSE * |types hit super-effectively|
+          + W_RESIST  * |attacking types resisted by someone|
+          - W_EXPOSED * |attacking types someone is weak to and nobody resists|
+          - W_STACKED * (|types with >=2 weak members| + |types with >=3 weak members|)
+
+    Weak members per type are counted with a bit-sliced 2-bit saturating counter,
+    so all 18 types are tallied at once per member.
+    """
+    popcount = _popcount
+    out = []
+    append = out.append
+    for team in teams:
+        off = res = any_weak = two = three = 0
+        for e in team:
+            w = weak[e]
+            off |= offense[e]
+            res |= resist[e]
+            three |= two & w
+            two |= any_weak & w
+            any_weak |= w
+        append(
+            W_OFFENSE * popcount(off)
+            + W_RESIST * popcount(res)
+            - W_EXPOSED * popcount(any_weak & ~res)
+            - W_STACKED * (popcount(two) + popcount(three))
+        )
+    return out
+
+
+def team_report(team: Sequence[int], table: ProfileTable) -> dict:
+    """Per-type breakdown for one team, in the shape the team builder renders."""
+    weak_counts = [0] * N_TYPES
+    resist_counts = [0] * N_TYPES
+    off = res = 0
+    for e in team:
+        off |= table.offense[e]
+        res |= table.resist[e]
+        for i in range(N_TYPES):
+            bit = 1 << i
+            if table.weak[e] & bit:
+                weak_counts[i] += 1
+            if table.resist[e] & bit:
+                resist_counts[i] += 1
+    return {
+        "score": score_teams([team], table.weak, table.resist, table.offense)[0],
+        "weak": dict(zip(TYPE_ORDER, weak_counts)),
+        "resist": dict(zip(TYPE_ORDER, resist_counts)),
+        "unresisted": [t for i, t in enumerate(TYPE_ORDER) if not res & (1 << i)],
+        "uncoveredOffense": [t for i, t in enumerate(TYPE_ORDER) if not off & (1 << i)],
+    }
+
+
+def load_pokemon_from_snapshot(db_path: str) -> list[dict]:
+    """[{id, name, types: [...], abilities: [(name, hidden), ...]}] ordered by id."""
+    from pokeapi_snapshot import SnapshotStore
+
+    out = []
+    with SnapshotStore(db_path) as store:
+        for p in store.iter_kind("pokemon"):
+            types = [t["type"]["name"] for t in sorted(p.get("types") or [], key=lambda t: t.get("slot") or 0)]
+            abilities = [
+                ((a.get("ability") or {}).get("name"), bool(a.get("is_hidden")))
+                for a in sorted(p.get("abilities") or [], key=lambda a: a.get("slot") or 0)
+            ]
+            out.append({
+                "id": p["id"],
+                "name": p.get("name"),
+                "types": types,
+                "abilities": [(n, h) for n, h in abilities if n],
+            })
+    return out
+
+
+def all_type_combinations() -> list[dict]:
+    """Every single and dual typing, standing in for real Pokémon in benchmarks."""
+    out = []
+    for a in range(N_TYPES):
+        for b in range(a, N_TYPES):
+            types = [TYPE_ORDER[a]] if a == b else [TYPE_ORDER[a], TYPE_ORDER[b]]
+            out.append({"id": len(out) + 1, "name": "-".join(types), "types": types, "abilities": []})
+    return out
+
+
+def build_profile_payload(pokemon: list[dict]) -> dict:
+    """Compact table for the frontend.
+
+    profiles: strings of 18 characters (attacker order = types), each character an index
+    into multipliers. pokemon: [id, name, [typeIndex...], baseProfile,
+    [[abilityIndex, profileIndex, hidden], ...]].
+    """
+    table = ProfileTable()
+    abilities: list[str] = []
+    ability_index: dict[str, int] = {}
+    rows = []
+    for p in pokemon:
+        types = type_indices(p["types"])
+        base = table.entry_profile[table.add(types)]
+        by_ability = []
+        for name, hidden in p["abilities"]:
+            a_idx = ability_index.get(name)
+            if a_idx is None:
+                a_idx = ability_index[name] = len(abilities)
+                abilities.append(name)
+            by_ability.append([a_idx, table.entry_profile[table.add(types, name)], 1 if hidden else 0])
+        rows.append([p["id"], p["name"], list(types), base, by_ability])
+
+    multipliers = sorted({x for profile in table.profiles for x in profile})
+    if len(multipliers) > 36:
+        raise ValueError(f"too many distinct multipliers for one-character codes: {len(multipliers)}")
+    digit = {x: "0123456789abcdefghijklmnopqrstuvwxyz"[i] for i, x in enumerate(multipliers)}
+    return {
+        "_meta": {
+            "generatedAt": datetime.datetime.now(datetime.timezone.utc)
+            .replace(microsecond=0)
+            .isoformat()
+            .replace("+00:00", "Z"),
+            "source": "tools/type_chart.py",
+        },
+        "types": TYPE_ORDER,
+        "chart": TYPE_CHART,
+        "multipliers": [int(x) if float(x).is_integer() else x for x in multipliers],
+        "profiles": ["".join(digit[x] for x in profile) for profile in table.profiles],
+        "abilities": abilities,
+        "pokemon": rows,
+    }
+
+
+def cmd_build(args) -> int:
+    if not os.path.exists(args.db):
+        print(f"Snapshot not found: {args.db} (run tools/pokeapi_snapshot.py build first)")
+        return 2
+    started = time.perf_counter()
+    pokemon = load_pokemon_from_snapshot(args.db)
+    payload = build_profile_payload(pokemon)
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
+    print(
+        f"Wrote {args.out}: pokemon={len(payload['pokemon'])} profiles={len(payload['profiles'])} "
+        f"abilities={len(payload['abilities'])} ({os.path.getsize(args.out):,} bytes) "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+    return 0
+
+
+def cmd_bench(args) -> int:
+    if os.path.exists(args.db):
+        pokemon = load_pokemon_from_snapshot(args.db)
+        source = args.db
+    else:
+        pokemon = all_type_combinations()
+        source = "all type combinations"
+
+    started = time.perf_counter()
+    table = ProfileTable()
+    for p in pokemon:
+        types = type_indices(p["types"])
+        table.add(types)
+        for name, _hidden in p["abilities"]:
+            table.add(types, name)
+    profile_secs = time.perf_counter() - started
+
+    rng = random.Random(args.seed)
+    n = len(table.entry_profile)
+    teams = [rng.sample(range(n), 6) for _ in range(args.teams)]
+
+    started = time.perf_counter()
+    scores = score_teams(teams, table.weak, table.resist, table.offense)
+    score_secs = time.perf_counter() - started
+
+    best = max(range(len(scores)), key=scores.__getitem__)
+    print(f"Source: {source} ({len(pokemon)} Pokémon, {n} type/ability entries, {len(table.profiles)} distinct profiles)")
+    print(f"Profiles: {profile_secs * 1000:.1f} ms")
+    print(f"Scored {len(teams):,} teams in {score_secs:.2f}s ({len(teams) / max(score_secs, 1e-9):,.0f} teams/s)")
+    print(f"Best random team score: {scores[best]}")
+    report = team_report(teams[best], table)
+    print(f"  unresisted: {', '.join(report['unresisted']) or '-'}")
+    print(f"  uncovered offense: {', '.join(report['uncoveredOffense']) or '-'}")
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    from pokeapi_snapshot import DEFAULT_DB
+
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    b = sub.add_parser("build", help="Write data/type-profiles.json from the PokéAPI snapshot")
+    b.add_argument("--db", type=str, default=DEFAULT_DB)
+    b.add_argument("--out", type=str, default=OUT_FILE)
+    b.set_defaults(func=cmd_build)
+
+    bench = sub.add_parser("bench", help="Score random teams and report throughput")
+    bench.add_argument("--db", type=str, default=DEFAULT_DB)
+    bench.add_argument("--teams", type=int, default=200_000)
+    bench.add_argument("--seed", type=int, default=0)
+    bench.set_defaults(func=cmd_bench)
+
+    args = ap.parse_args(argv[1:])
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))